@@ -3,8 +3,10 @@
 Story 0.75.4: MongoDB Change Stream cache pattern extracted to fp-common.
 """
 
+from fp_common.cache.keyed_change_stream_cache import KeyedMongoChangeStreamCache
 from fp_common.cache.mongo_change_stream_cache import MongoChangeStreamCache
 
 __all__ = [
+    "KeyedMongoChangeStreamCache",
     "MongoChangeStreamCache",
 ]
@@ -0,0 +1,300 @@
+"""Per-key MongoDB Change Stream cache.
+
+Variant of MongoChangeStreamCache for large or hot reference collections
+where loading the whole collection is not an option: entries are loaded
+on demand by key, bounded by an LRU entry limit, and invalidated one
+document at a time from the change stream.
+
+Features:
+- Per-key lookups (find_one on miss), including cached "not found" results
+- get_all() scans the collection and warms the LRU (base class contract)
+- Partial invalidation: a change drops only the entries loaded from that document
+- LRU bound on the number of entries
+- Single-flight loading for concurrent misses on the same key
+- TTL fallback per entry (same safety net as the base class)
+- OpenTelemetry hit/miss/invalidation/eviction metrics
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from abc import abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import structlog
+from opentelemetry import metrics
+from pydantic import BaseModel
+
+from fp_common.cache.mongo_change_stream_cache import MongoChangeStreamCache
+
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorDatabase
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class KeyedMongoChangeStreamCache(MongoChangeStreamCache[T]):
+    """LRU-bounded per-key cache with Change Stream partial invalidation.
+
+    Each entry remembers the _id of the document it was loaded from, so an
+    update, replace or delete of that document drops exactly the entries
+    built from it. Misses are cached too (as None) and dropped on any
+    insert, since a new document may be the one that was missing.
+
+    Subclasses must implement:
+    - `_get_cache_key(item: T) -> str`: Cache key of a loaded item
+    - `_parse_document(doc: dict) -> T`: Parse MongoDB document to model
+    - `_get_key_filter(key: str) -> dict`: MongoDB filter selecting one key
+
+    Example:
+        class FarmerCache(KeyedMongoChangeStreamCache[Farmer]):
+            def _get_cache_key(self, item: Farmer) -> str:
+                return item.id
+
+            def _parse_document(self, doc: dict) -> Farmer:
+                doc.pop("_id", None)
+                return Farmer.model_validate(doc)
+
+            def _get_key_filter(self, key: str) -> dict:
+                return {"_id": key}
+    """
+
+    DEFAULT_MAX_ENTRIES: int = 10_000
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        collection_name: str,
+        cache_name: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            db: MongoDB database instance.
+            collection_name: Name of the MongoDB collection to cache.
+            cache_name: Cache identifier (used for metrics labels).
+            max_entries: Maximum number of cached keys (LRU eviction beyond).
+        """
+        super().__init__(db=db, collection_name=collection_name, cache_name=cache_name)
+        self.max_entries = max_entries
+
+        # key -> (loaded_at monotonic, source document _id or None, item or None)
+        self._entries: OrderedDict[str, tuple[float, str | None, T | None]] = OrderedDict()
+        self._keys_by_doc_id: dict[str, set[str]] = {}
+        self._in_flight: dict[str, asyncio.Task[T | None]] = {}
+        # Bumped on every invalidation so loads that raced one are not stored
+        self._generation = 0
+
+        self._cache_evictions = metrics.get_meter(cache_name).create_counter(
+            name=f"{cache_name}_cache_evictions_total",
+            description=f"Total number of {cache_name} cache entries evicted by the size bound",
+            unit="1",
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -------------------------------------------------------------------------
+    # Abstract Methods (must be implemented by subclasses)
+    # -------------------------------------------------------------------------
+
+    @abstractmethod
+    def _get_key_filter(self, key: str) -> dict:
+        """Get the MongoDB filter that loads a single key.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            MongoDB filter dict (e.g., {"_id": key}).
+        """
+        ...
+
+    def _get_filter(self) -> dict:
+        """Get the MongoDB filter for get_all() (default: every document).
+
+        Returns:
+            MongoDB filter dict.
+        """
+        return {}
+
+    # -------------------------------------------------------------------------
+    # Cache Access
+    # -------------------------------------------------------------------------
+
+    async def get(self, key: str) -> T | None:
+        """Get an item by key, loading it from MongoDB on a miss.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Pydantic model instance or None if no document matches.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            loaded_at, _, item = entry
+            if time.monotonic() - loaded_at < self.CACHE_TTL_MINUTES * 60:
+                self._entries.move_to_end(key)
+                self._cache_hits.add(1)
+                return item
+            self._remove(key)
+
+        self._cache_misses.add(1)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _t: self._in_flight.pop(key, None))
+        # Shield so one cancelled caller does not cancel the load for the others
+        return await asyncio.shield(task)
+
+    async def get_all(self) -> dict[str, T]:
+        """Get every item matching _get_filter(), read from MongoDB.
+
+        A keyed cache never knows whether it holds the whole collection, so
+        this always scans it. Scanned items are stored as entries (subject to
+        the LRU bound), which warms the cache for subsequent get() calls.
+
+        Returns:
+            Dict mapping cache keys to Pydantic model instances.
+        """
+        generation = self._generation
+        items: dict[str, T] = {}
+        doc_ids: dict[str, str | None] = {}
+        async for doc in self._collection.find(self._get_filter()):
+            try:
+                item = self._parse_document(dict(doc))
+            except Exception as e:
+                logger.warning(
+                    "Failed to parse document, skipping",
+                    cache_name=self._cache_name,
+                    doc_id=str(doc.get("_id", "unknown")),
+                    error=str(e),
+                )
+                continue
+            key = self._get_cache_key(item)
+            items[key] = item
+            doc_ids[key] = str(doc["_id"]) if "_id" in doc else None
+
+        if generation == self._generation:
+            for key, item in items.items():
+                self._store(key, doc_ids[key], item)
+        logger.debug("Cache scanned from database", cache_name=self._cache_name, item_count=len(items))
+        return items
+
+    async def _load(self, key: str) -> T | None:
+        """Load one key and store it unless an invalidation happened meanwhile."""
+        generation = self._generation
+        doc = await self._collection.find_one(self._get_key_filter(key))
+        doc_id = str(doc["_id"]) if doc is not None and "_id" in doc else None
+        item = self._parse_document(doc) if doc is not None else None
+        if generation == self._generation:
+            self._store(key, doc_id, item)
+        return item
+
+    def put(self, item: T, doc_id: str | None = None) -> None:
+        """Store an item the caller already holds (e.g., returned by a write).
+
+        Args:
+            item: Item to cache under its cache key.
+            doc_id: _id of its MongoDB document (defaults to the cache key).
+        """
+        key = self._get_cache_key(item)
+        self._store(key, doc_id or key, item)
+
+    def _store(self, key: str, doc_id: str | None, item: T | None) -> None:
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic(), doc_id, item)
+        if doc_id is not None:
+            self._keys_by_doc_id.setdefault(doc_id, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self._cache_evictions.add(1)
+        self._cache_size.set(len(self._entries))
+
+    def _remove(self, key: str) -> None:
+        _, doc_id, _ = self._entries.pop(key)
+        if doc_id is not None:
+            keys = self._keys_by_doc_id.get(doc_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_doc_id[doc_id]
+
+    # -------------------------------------------------------------------------
+    # Invalidation
+    # -------------------------------------------------------------------------
+
+    def _on_change(self, operation: str, item_id: str) -> None:
+        """Drop only the entries affected by one change stream event.
+
+        Args:
+            operation: Change stream operationType (insert, update, ...).
+            item_id: String form of the changed document's _id.
+        """
+        self._generation += 1
+        keys = set(self._keys_by_doc_id.get(item_id, ()))
+        if operation == "insert":
+            # A new document may satisfy a key that was cached as missing
+            keys.update(key for key, (_, _, item) in self._entries.items() if item is None)
+        for key in keys:
+            self._remove(key)
+
+        self._cache_invalidations.add(1, {"reason": f"change_stream:{operation}"})
+        self._cache_size.set(len(self._entries))
+        logger.debug(
+            "Cache entries invalidated by change stream",
+            cache_name=self._cache_name,
+            operation=operation,
+            item_id=item_id,
+            removed=len(keys),
+        )
+
+    def invalidate(self, key: str) -> None:
+        """Drop one key (e.g., after a local write the caller did not put back)."""
+        self._generation += 1
+        if key in self._entries:
+            self._remove(key)
+            self._cache_size.set(len(self._entries))
+
+    def _invalidate_cache(self, reason: str, item_id: str = "all") -> None:
+        """Drop every entry and record metrics.
+
+        Args:
+            reason: Reason for invalidation (for metrics label).
+            item_id: ID of the item that triggered invalidation.
+        """
+        self._generation += 1
+        self._entries.clear()
+        self._keys_by_doc_id.clear()
+        self._cache_invalidations.add(1, {"reason": reason})
+        self._cache_size.set(0)
+        logger.debug(
+            "Cache invalidated",
+            cache_name=self._cache_name,
+            reason=reason,
+            item_id=item_id,
+        )
+
+    # -------------------------------------------------------------------------
+    # Health Status
+    # -------------------------------------------------------------------------
+
+    def get_health_status(self) -> dict[str, Any]:
+        """Get cache health status for health endpoint.
+
+        Returns:
+            Dict with cache_size, max_entries and change_stream_active.
+        """
+        return {
+            "cache_size": len(self._entries),
+            "max_entries": self.max_entries,
+            "change_stream_active": (self._change_stream_task is not None and not self._change_stream_task.done()),
+        }
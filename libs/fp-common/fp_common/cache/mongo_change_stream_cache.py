@@ -233,16 +233,7 @@ class MongoChangeStreamCache(ABC, Generic[T]):
                         doc_key = change.get("documentKey", {})
                         item_id = str(doc_key.get("_id", "unknown"))
 
-                        self._invalidate_cache(
-                            reason=f"change_stream:{operation}",
-                            item_id=item_id,
-                        )
-                        logger.info(
-                            "Cache invalidated by change stream",
-                            cache_name=self._cache_name,
-                            operation=operation,
-                            item_id=item_id,
-                        )
+                        self._on_change(operation, item_id)
 
             except asyncio.CancelledError:
                 logger.debug(
@@ -261,6 +252,27 @@ class MongoChangeStreamCache(ABC, Generic[T]):
                 )
                 await asyncio.sleep(1)  # Brief pause before reconnect
 
+    def _on_change(self, operation: str, item_id: str) -> None:
+        """Handle one change stream event.
+
+        The default drops the whole cache; subclasses that cache per key can
+        override this to invalidate only the affected entries.
+
+        Args:
+            operation: Change stream operationType (insert, update, ...).
+            item_id: String form of the changed document's _id.
+        """
+        self._invalidate_cache(
+            reason=f"change_stream:{operation}",
+            item_id=item_id,
+        )
+        logger.info(
+            "Cache invalidated by change stream",
+            cache_name=self._cache_name,
+            operation=operation,
+            item_id=item_id,
+        )
+
     # -------------------------------------------------------------------------
     # Cache Invalidation (AC7, AC8)
     # -------------------------------------------------------------------------
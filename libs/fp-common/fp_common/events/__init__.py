@@ -6,6 +6,7 @@ Provides shared components for DAPR event subscriptions including:
 - DLQ subscription startup utilities
 - AI Model event models (shared across services)
 - Unified Cost Event Model (ADR-016)
+- Micro-batching and non-blocking receive loop for batched subscriptions
 
 Story 0.6.8: Dead Letter Queue Handler (ADR-006)
 Story 0.75.16b: AI Model event models moved to fp-common
@@ -40,6 +41,8 @@ from fp_common.events.dlq_handler import (
     start_dlq_subscription,
 )
 from fp_common.events.dlq_repository import DLQRecord, DLQRepository
+from fp_common.events.micro_batcher import MicroBatcher
+from fp_common.events.streaming import stream_subscription
 
 __all__ = [
     "AgentCompletedEvent",
@@ -57,9 +60,11 @@ __all__ = [
     "ExplorerAgentResult",
     "ExtractorAgentResult",
     "GeneratorAgentResult",
+    "MicroBatcher",
     "TieredVisionAgentResult",
     "handle_dead_letter",
     "set_dlq_event_loop",
     "set_dlq_repository",
     "start_dlq_subscription",
+    "stream_subscription",
 ]
@@ -0,0 +1,120 @@
+"""Micro-batching of awaited work items.
+
+Events arriving within a few milliseconds (or until the batch is full) are
+handed to one _process_batch() call, so a burst becomes a few bulk round
+trips instead of one per event. Each caller still awaits the outcome of
+its own item, which keeps per-message success/retry (and so DLQ)
+semantics when the items are subscription messages.
+
+Subclasses implement _process_batch(), returning one result per item; an
+exception instance in the results fails only that item's caller.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Generic, TypeVar
+
+import structlog
+
+logger = structlog.get_logger("fp_common.events.micro_batcher")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(ABC, Generic[T, R]):
+    """Collects submitted items into micro-batches.
+
+    Attributes:
+        max_batch_size: Items per batch before it is flushed immediately.
+        max_wait_seconds: Longest an item waits for its batch to fill.
+        max_pending: Upper bound on items submitted but not yet answered
+            (enforced by the subscriber, which blocks on it).
+    """
+
+    def __init__(self, max_batch_size: int, max_wait_ms: int, max_pending: int) -> None:
+        """Initialize the batcher.
+
+        Args:
+            max_batch_size: Flush as soon as this many items are pending.
+            max_wait_ms: Flush a partial batch after this many milliseconds.
+            max_pending: Maximum items in flight across all batches.
+        """
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_ms / 1000
+        self.max_pending = max_pending
+
+        self._pending: list[tuple[T, asyncio.Future[R]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._batches: set[asyncio.Task[None]] = set()
+
+    @abstractmethod
+    async def _process_batch(self, items: list[T]) -> Sequence[R | BaseException]:
+        """Process one batch.
+
+        Args:
+            items: The submitted items, in submission order.
+
+        Returns:
+            One result per item, in the same order. An exception instance
+            fails that item only; raising fails the whole batch.
+        """
+
+    async def submit(self, item: T) -> R:
+        """Queue one item and wait for the result of its batch.
+
+        Args:
+            item: The work item.
+
+        Returns:
+            The result _process_batch() produced for this item.
+
+        Raises:
+            Exception: The error _process_batch() produced for this item,
+                or raised for its whole batch.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[R] = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_seconds, self._dispatch)
+
+        return await future
+
+    def _dispatch(self) -> None:
+        """Hand the pending items to a new batch task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._run_batch(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, batch: list[tuple[T, asyncio.Future[R]]]) -> None:
+        try:
+            results: Sequence[R | BaseException] = await self._process_batch([item for item, _ in batch])
+        except Exception as e:
+            logger.exception("Micro-batch failed", batcher=type(self).__name__, batch_size=len(batch))
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results, strict=True):
+            if future.done():
+                # Caller gave up (timeout/cancellation)
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Flush pending items and wait for running batches to finish."""
+        self._dispatch()
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
@@ -0,0 +1,48 @@
+"""Non-blocking receive loop for DAPR streaming subscriptions.
+
+subscribe_with_handler() answers each message before receiving the next,
+so a micro-batcher behind it never sees more than one event at a time.
+stream_subscription() receives from a subscribe() stream and hands every
+message to a dispatch function that answers it later, keeping up to
+max_pending messages unanswered at once.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+from dapr.common.pubsub.subscription import StreamCancelledError, StreamInactiveError
+
+# dispatch(subscription, message, on_done): answers message, then calls on_done
+Dispatch = Callable[[Any, Any, Callable[[], None]], None]
+
+
+def stream_subscription(subscription: Any, dispatch: Dispatch, max_pending: int) -> None:
+    """Receive messages and dispatch them without waiting for their answers.
+
+    Mirrors the SDK's subscribe_with_handler loop (including reconnects), but
+    keeps up to max_pending messages unanswered at a time. Runs until the
+    subscription is closed; call it from a daemon thread.
+
+    Args:
+        subscription: DAPR streaming subscription from DaprClient.subscribe().
+        dispatch: Starts handling one message; must call on_done exactly
+            once after the message has been answered.
+        max_pending: Maximum messages received but not yet answered.
+    """
+    slots = threading.BoundedSemaphore(max_pending)
+    while True:
+        try:
+            for message in subscription:
+                if message:
+                    slots.acquire()
+                    dispatch(subscription, message, slots.release)
+        except (StreamInactiveError, StreamCancelledError):
+            break
+        except Exception:
+            # Stream died - reconnect (waits for the sidecar to be healthy)
+            try:
+                subscription.reconnect_stream()
+            except Exception:
+                time.sleep(5)
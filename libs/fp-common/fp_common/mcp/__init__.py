@@ -2,21 +2,33 @@
 
 Provides:
 - GrpcMcpClient: Raw gRPC calls to MCP servers via DAPR service invocation
+- AioMcpClient: grpc.aio client on pooled per-app_id channels (drop-in for GrpcMcpClient)
+- McpChannelPool: Persistent grpc.aio channels to the DAPR sidecar
 - GrpcMcpTool: LangChain BaseTool wrapper for MCP tools
 - McpToolRegistry: Tool discovery and registration
+- McpResultCache: TTL + LRU result cache for idempotent tools (single-flight)
+- CachingMcpClient: Client wrapper that reads tool results through McpResultCache
+- McpClient: Type of any client above (plain or cache-wrapped)
 - McpToolError: Exception class for tool execution failures
 - ErrorCode: Error code enum matching proto definition
 """
 
+from fp_common.mcp.aio_client import AioMcpClient, McpChannelPool
 from fp_common.mcp.client import GrpcMcpClient
 from fp_common.mcp.errors import ErrorCode, McpToolError
 from fp_common.mcp.registry import McpToolRegistry
+from fp_common.mcp.result_cache import CachingMcpClient, McpClient, McpResultCache
 from fp_common.mcp.tool import GrpcMcpTool
 
 __all__ = [
+    "AioMcpClient",
+    "CachingMcpClient",
     "ErrorCode",
     "GrpcMcpClient",
     "GrpcMcpTool",
+    "McpChannelPool",
+    "McpClient",
+    "McpResultCache",
     "McpToolError",
     "McpToolRegistry",
 ]
@@ -0,0 +1,331 @@
+"""Natively async MCP client over pooled grpc.aio channels.
+
+Provides AioMcpClient, a drop-in replacement for GrpcMcpClient that talks to
+MCP servers through DAPR gRPC proxying (dapr-app-id metadata) on a persistent
+channel per app_id, instead of building a DaprClient per call in a worker
+thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import TYPE_CHECKING, Any
+
+import grpc
+from dapr.conf import settings as dapr_settings
+from fp_proto.mcp.v1 import mcp_tool_pb2, mcp_tool_pb2_grpc
+from opentelemetry import trace
+
+from fp_common.mcp.client import GrpcMcpClient
+from fp_common.mcp.errors import ErrorCode, McpToolError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+# Default per-call deadline (seconds) when the caller does not pass one
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+# Transport failures surfaced as SERVICE_UNAVAILABLE McpToolErrors
+UNAVAILABLE_STATUS_CODES = frozenset(
+    {
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+    }
+)
+
+
+class McpChannelPool:
+    """Persistent grpc.aio channels to the DAPR sidecar, one per MCP app_id.
+
+    grpc.aio channels are bound to the event loop that created them, so a
+    channel is recreated if it is requested from a different loop (e.g. a
+    new loop per test or per worker thread).
+
+    Attributes:
+        target: gRPC target of the DAPR sidecar (host:port)
+    """
+
+    def __init__(self, target: str | None = None) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            target: Optional gRPC target. Defaults to the DAPR sidecar
+                (DAPR_RUNTIME_HOST:DAPR_GRPC_PORT).
+        """
+        self.target = target or f"{dapr_settings.DAPR_RUNTIME_HOST}:{dapr_settings.DAPR_GRPC_PORT}"
+        self._channels: dict[str, tuple[asyncio.AbstractEventLoop, grpc.aio.Channel]] = {}
+
+    def get_channel(self, app_id: str) -> grpc.aio.Channel:
+        """Get the shared channel for an app_id, creating it on first use.
+
+        Args:
+            app_id: DAPR app ID of the MCP server
+
+        Returns:
+            grpc.aio channel bound to the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._channels.get(app_id)
+        if entry is not None and entry[0] is loop:
+            return entry[1]
+
+        channel = grpc.aio.insecure_channel(self.target)
+        self._channels[app_id] = (loop, channel)
+        logger.debug("Opened MCP channel for %s via %s", app_id, self.target)
+        return channel
+
+    async def close(self) -> None:
+        """Close all channels owned by the running event loop and forget the rest."""
+        loop = asyncio.get_running_loop()
+        channels, self._channels = self._channels, {}
+        for owner, channel in channels.values():
+            if owner is loop:
+                await channel.close()
+
+
+# Process-wide pool shared by clients that are not given one explicitly
+default_channel_pool = McpChannelPool()
+
+
+class AioMcpClient(GrpcMcpClient):
+    """grpc.aio client for invoking MCP tools via DAPR service invocation.
+
+    Keeps the GrpcMcpClient contract (call_tool/list_tools, McpToolError on
+    failure responses) so it can be handed to McpToolRegistry, GrpcMcpTool
+    and the workflows unchanged.
+
+    Attributes:
+        app_id: DAPR app ID of the target MCP server
+        timeout: Default per-call deadline in seconds
+    """
+
+    def __init__(
+        self,
+        app_id: str,
+        pool: McpChannelPool | None = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    ) -> None:
+        """Initialize client for a specific MCP server.
+
+        Args:
+            app_id: DAPR app ID of the MCP server (e.g., "plantation-mcp")
+            pool: Channel pool to use (defaults to the process-wide pool)
+            timeout: Default per-call deadline in seconds
+        """
+        super().__init__(app_id)
+        self.timeout = timeout
+        self._pool = pool or default_channel_pool
+
+    def _get_stub(self) -> mcp_tool_pb2_grpc.McpToolServiceStub:
+        """Build a stub on the pooled channel (stubs are cheap, channels are not)."""
+        return mcp_tool_pb2_grpc.McpToolServiceStub(self._pool.get_channel(self.app_id))
+
+    def _get_metadata(self) -> list[tuple[str, str]]:
+        """Get gRPC call metadata for DAPR service invocation."""
+        return [("dapr-app-id", self.app_id)]
+
+    async def call_tool(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        caller_agent_id: str | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """Invoke an MCP tool and return the result.
+
+        Args:
+            tool_name: Name of the tool to invoke
+            arguments: Tool arguments as a dictionary
+            caller_agent_id: Optional agent ID for audit logging
+            timeout: Per-call deadline in seconds (defaults to self.timeout)
+
+        Returns:
+            Tool result as a dictionary
+
+        Raises:
+            McpToolError: If tool execution fails, or the server is
+                unreachable / the deadline expires (SERVICE_UNAVAILABLE)
+        """
+        result = await self._call_tool(tool_name, arguments, caller_agent_id, timeout=timeout)
+        result_dict: dict[str, Any] = json.loads(result.result_json)
+        return result_dict
+
+    async def call_tool_binary(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        caller_agent_id: str | None = None,
+        timeout: float | None = None,
+    ) -> tuple[dict[str, Any], bytes]:
+        """Invoke an MCP tool that returns a binary payload (e.g. image bytes).
+
+        See GrpcMcpClient.call_tool_binary.
+
+        Args:
+            tool_name: Name of the tool to invoke
+            arguments: Tool arguments as a dictionary
+            caller_agent_id: Optional agent ID for audit logging
+            timeout: Per-call deadline in seconds (defaults to self.timeout)
+
+        Returns:
+            Tuple of (result metadata dictionary, payload bytes)
+
+        Raises:
+            McpToolError: If tool execution fails, or the server is
+                unreachable / the deadline expires (SERVICE_UNAVAILABLE)
+        """
+        result = await self._call_tool(tool_name, arguments, caller_agent_id, accept_binary=True, timeout=timeout)
+        result_dict: dict[str, Any] = json.loads(result.result_json)
+        return result_dict, result.result_binary
+
+    async def _call_tool(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        caller_agent_id: str | None = None,
+        accept_binary: bool = False,
+        timeout: float | None = None,
+    ) -> mcp_tool_pb2.ToolCallResponse:
+        """Invoke an MCP tool on the pooled channel and return the successful response.
+
+        Raises:
+            McpToolError: If tool execution fails, or the server is
+                unreachable / the deadline expires (SERVICE_UNAVAILABLE)
+        """
+        with tracer.start_as_current_span(f"mcp.call_tool.{tool_name}") as span:
+            span.set_attribute("mcp.app_id", self.app_id)
+            span.set_attribute("mcp.tool_name", tool_name)
+
+            # Get trace ID for correlation (defensive check for None span_context)
+            span_context = span.get_span_context()
+            trace_id = ""
+            if span_context is not None and span_context.is_valid:
+                trace_id = format(span_context.trace_id, "032x")
+
+            request = mcp_tool_pb2.ToolCallRequest(
+                tool_name=tool_name,
+                arguments_json=json.dumps(arguments),
+                trace_id=trace_id,
+                caller_agent_id=caller_agent_id or "",
+                accept_binary=accept_binary,
+            )
+
+            try:
+                result = await self._get_stub().CallTool(
+                    request,
+                    metadata=self._get_metadata(),
+                    timeout=timeout if timeout is not None else self.timeout,
+                )
+            except grpc.aio.AioRpcError as e:
+                span.record_exception(e)
+                span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
+                if e.code() in UNAVAILABLE_STATUS_CODES:
+                    logger.warning(
+                        "MCP server unavailable",
+                        extra={
+                            "app_id": self.app_id,
+                            "tool_name": tool_name,
+                            "status_code": e.code().name,
+                            "trace_id": trace_id,
+                        },
+                    )
+                    raise McpToolError(
+                        error_code=ErrorCode.SERVICE_UNAVAILABLE,
+                        message=f"{e.code().name}: {e.details()}",
+                        trace_id=trace_id,
+                        app_id=self.app_id,
+                        tool_name=tool_name,
+                    ) from e
+                logger.exception(
+                    "MCP tool call exception",
+                    extra={
+                        "app_id": self.app_id,
+                        "tool_name": tool_name,
+                        "trace_id": trace_id,
+                    },
+                )
+                raise
+
+            if not result.success:
+                error = McpToolError(
+                    error_code=ErrorCode(result.error_code),
+                    message=result.error_message,
+                    trace_id=trace_id,
+                    app_id=self.app_id,
+                    tool_name=tool_name,
+                )
+                logger.error(
+                    "MCP tool call failed",
+                    extra={
+                        "app_id": self.app_id,
+                        "tool_name": tool_name,
+                        "error_code": result.error_code,
+                        "error_message": result.error_message,
+                        "trace_id": trace_id,
+                    },
+                )
+                span.record_exception(error)
+                span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
+                raise error
+
+            return result
+
+    async def call_tools(
+        self,
+        calls: Sequence[tuple[str, dict[str, Any]]],
+        caller_agent_id: str | None = None,
+        timeout: float | None = None,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Invoke independent tools concurrently on the shared channel.
+
+        Args:
+            calls: (tool_name, arguments) pairs
+            caller_agent_id: Optional agent ID for audit logging
+            timeout: Per-call deadline in seconds (defaults to self.timeout)
+            return_exceptions: If True, failed calls yield their exception in
+                place of a result instead of raising
+
+        Returns:
+            Results in the same order as calls
+        """
+        return await asyncio.gather(
+            *(
+                self.call_tool(tool_name, arguments, caller_agent_id=caller_agent_id, timeout=timeout)
+                for tool_name, arguments in calls
+            ),
+            return_exceptions=return_exceptions,
+        )
+
+    async def list_tools(self, category: str | None = None) -> list[dict[str, Any]]:
+        """List available tools from the MCP server.
+
+        Args:
+            category: Optional category filter
+
+        Returns:
+            List of tool definitions
+        """
+        request = mcp_tool_pb2.ListToolsRequest(category=category or "")
+
+        result = await self._get_stub().ListTools(
+            request,
+            metadata=self._get_metadata(),
+            timeout=self.timeout,
+        )
+
+        return [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "input_schema": json.loads(tool.input_schema_json) if tool.input_schema_json else {},
+                "category": tool.category,
+            }
+            for tool in result.tools
+        ]
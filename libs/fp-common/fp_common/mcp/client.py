@@ -73,6 +73,50 @@ class GrpcMcpClient:
         Returns:
             Tool result as a dictionary
 
+        Raises:
+            McpToolError: If tool execution fails
+        """
+        result = await self._call_tool(tool_name, arguments, caller_agent_id)
+        result_dict: dict[str, Any] = json.loads(result.result_json)
+        return result_dict
+
+    async def call_tool_binary(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        caller_agent_id: str | None = None,
+    ) -> tuple[dict[str, Any], bytes]:
+        """Invoke an MCP tool that returns a binary payload (e.g. image bytes).
+
+        The payload travels as raw bytes in ToolCallResponse.result_binary
+        instead of base64 inside the JSON result. Servers that predate binary
+        transport return an empty payload and keep the base64 field in the
+        result, so callers should fall back to it.
+
+        Args:
+            tool_name: Name of the tool to invoke
+            arguments: Tool arguments as a dictionary
+            caller_agent_id: Optional agent ID for audit logging
+
+        Returns:
+            Tuple of (result metadata dictionary, payload bytes)
+
+        Raises:
+            McpToolError: If tool execution fails
+        """
+        result = await self._call_tool(tool_name, arguments, caller_agent_id, accept_binary=True)
+        result_dict: dict[str, Any] = json.loads(result.result_json)
+        return result_dict, result.result_binary
+
+    async def _call_tool(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        caller_agent_id: str | None = None,
+        accept_binary: bool = False,
+    ) -> mcp_tool_pb2.ToolCallResponse:
+        """Invoke an MCP tool and return the successful response.
+
         Raises:
             McpToolError: If tool execution fails
         """
@@ -91,6 +135,7 @@ class GrpcMcpClient:
                 arguments_json=json.dumps(arguments),
                 trace_id=trace_id,
                 caller_agent_id=caller_agent_id or "",
+                accept_binary=accept_binary,
             )
 
             try:
@@ -126,8 +171,7 @@ class GrpcMcpClient:
                     span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
                     raise error
 
-                result_dict: dict[str, Any] = json.loads(result.result_json)
-                return result_dict
+                return result
 
             except McpToolError:
                 raise
@@ -7,11 +7,17 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from fp_common.mcp.client import GrpcMcpClient
+from fp_common.mcp.result_cache import CachingMcpClient, McpClient
 from fp_common.mcp.tool import GrpcMcpTool
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from fp_common.mcp.result_cache import McpResultCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,14 +29,29 @@ class McpToolRegistry:
     Attributes:
         _servers: Set of registered MCP server app_ids
         _tools_cache: Cached tool definitions by server app_id
-        _clients: GrpcMcpClient instances by server app_id
+        _clients: Client (possibly cache-wrapped) by server app_id
+        _client_factory: Builds the client for a newly registered app_id
+        _result_cache: Optional read-through cache for idempotent tool results
     """
 
-    def __init__(self) -> None:
-        """Initialize empty registry."""
+    def __init__(
+        self,
+        client_factory: Callable[[str], GrpcMcpClient] | None = None,
+        result_cache: McpResultCache | None = None,
+    ) -> None:
+        """Initialize empty registry.
+
+        Args:
+            client_factory: Optional callable taking an app_id and returning a
+                client (e.g. AioMcpClient). Defaults to GrpcMcpClient.
+            result_cache: Optional result cache. When set, clients are wrapped
+                in CachingMcpClient and discovered tool metadata drives TTLs.
+        """
         self._servers: set[str] = set()
         self._tools_cache: dict[str, list[dict[str, Any]]] = {}
-        self._clients: dict[str, GrpcMcpClient] = {}
+        self._clients: dict[str, McpClient] = {}
+        self._client_factory = client_factory
+        self._result_cache = result_cache
 
     def register_server(self, app_id: str) -> None:
         """Register an MCP server for tool discovery.
@@ -40,7 +61,11 @@ class McpToolRegistry:
         """
         self._servers.add(app_id)
         if app_id not in self._clients:
-            self._clients[app_id] = GrpcMcpClient(app_id=app_id)
+            factory = self._client_factory or GrpcMcpClient
+            client: McpClient = factory(app_id)
+            if self._result_cache is not None:
+                client = CachingMcpClient(client, self._result_cache)
+            self._clients[app_id] = client
         logger.debug("Registered MCP server: %s", app_id)
 
     async def discover_tools(
@@ -105,6 +130,22 @@ class McpToolRegistry:
         logger.debug("Discovered tools from %d servers", len(all_tools))
         return all_tools
 
+    def get_client(self, app_id: str) -> McpClient:
+        """Get the client for a registered MCP server.
+
+        Args:
+            app_id: DAPR app ID of the MCP server
+
+        Returns:
+            The server's client (cache-wrapped if a result cache is configured)
+
+        Raises:
+            ValueError: If app_id is not registered
+        """
+        if app_id not in self._servers:
+            raise ValueError(f"MCP server '{app_id}' is not registered")
+        return self._clients[app_id]
+
     def get_tool(self, app_id: str, tool_name: str) -> GrpcMcpTool:
         """Get a GrpcMcpTool instance for a specific tool.
 
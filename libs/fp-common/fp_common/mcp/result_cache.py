@@ -0,0 +1,373 @@
+"""Read-through result cache for idempotent MCP tools.
+
+Provides McpResultCache (TTL + size-bounded LRU with single-flight) and
+CachingMcpClient, a wrapper around a GrpcMcpClient/AioMcpClient that serves
+repeated calls to read-only tools from the cache. McpClient is the type to
+annotate with wherever either kind of client is accepted.
+
+Cache keys are (app_id, tool_name, canonical JSON arguments). Which tools are
+cached, and for how long, is driven by tool metadata: the category reported by
+list_tools (via McpToolRegistry discovery, or fetched lazily by the client)
+maps to a TTL, and explicit per-tool TTLs override it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from opentelemetry import metrics
+
+from fp_common.mcp.client import GrpcMcpClient
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Mapping, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Default TTL (seconds) per tool category. All current MCP tools are reads;
+# categories not listed here (e.g. future "command" tools) are never cached.
+DEFAULT_CATEGORY_TTLS: dict[str, float] = {
+    "query": 60.0,
+    "search": 30.0,
+    "media": 300.0,
+}
+
+CacheKey = tuple[str, str, str]
+
+
+def canonicalize_arguments(arguments: dict[str, Any]) -> str:
+    """Serialize tool arguments so equal argument dicts produce equal keys."""
+    return json.dumps(arguments, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class McpResultCache:
+    """TTL + LRU cache of MCP tool results with single-flight loading.
+
+    Results are stored as their JSON serialization, which bounds memory by
+    bytes as well as entry count and hands every caller a fresh copy.
+
+    Attributes:
+        max_entries: Maximum number of cached results
+        max_bytes: Maximum total size of cached results (serialized)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        category_ttls: Mapping[str, float] | None = None,
+        tool_ttls: Mapping[tuple[str, str], float] | None = None,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            max_bytes: Maximum total serialized size of cached results
+            category_ttls: TTL per tool category (defaults to DEFAULT_CATEGORY_TTLS)
+            tool_ttls: Explicit TTL per (app_id, tool_name); 0 disables caching
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._category_ttls = dict(DEFAULT_CATEGORY_TTLS if category_ttls is None else category_ttls)
+        self._tool_ttls = dict(tool_ttls or {})
+        self._metadata_ttls: dict[tuple[str, str], float] = {}
+        self._known_apps: set[str] = set()
+
+        self._entries: OrderedDict[CacheKey, tuple[float, str]] = OrderedDict()
+        self._size_bytes = 0
+        self._in_flight: dict[CacheKey, asyncio.Task[str]] = {}
+
+        meter = metrics.get_meter("mcp_result_cache")
+        self._hits = meter.create_counter(
+            name="mcp_result_cache_hits_total",
+            description="Total number of MCP tool results served from cache",
+            unit="1",
+        )
+        self._misses = meter.create_counter(
+            name="mcp_result_cache_misses_total",
+            description="Total number of MCP tool calls that reached the server",
+            unit="1",
+        )
+        self._coalesced = meter.create_counter(
+            name="mcp_result_cache_coalesced_total",
+            description="Total number of MCP tool calls joined to an identical in-flight call",
+            unit="1",
+        )
+        self._evictions = meter.create_counter(
+            name="mcp_result_cache_evictions_total",
+            description="Total number of MCP tool results evicted from cache",
+            unit="1",
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def knows_app(self, app_id: str) -> bool:
+        """Whether tool metadata has been registered for an app_id."""
+        return app_id in self._known_apps
+
+    def register_tools(self, app_id: str, tools: list[dict[str, Any]]) -> None:
+        """Derive per-tool TTLs from tool definitions returned by list_tools.
+
+        Args:
+            app_id: DAPR app ID of the MCP server
+            tools: Tool definitions (name, category, ...)
+        """
+        for tool in tools:
+            self._metadata_ttls[(app_id, tool["name"])] = self._category_ttls.get(tool.get("category", ""), 0.0)
+        self._known_apps.add(app_id)
+
+    def ttl_for(self, app_id: str, tool_name: str) -> float:
+        """TTL in seconds for a tool (0 means the tool is not cached)."""
+        key = (app_id, tool_name)
+        if key in self._tool_ttls:
+            return self._tool_ttls[key]
+        return self._metadata_ttls.get(key, 0.0)
+
+    async def get_or_call(
+        self,
+        app_id: str,
+        tool_name: str,
+        arguments: dict[str, Any],
+        call: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        """Return a cached result, or run call() once for all concurrent callers.
+
+        Args:
+            app_id: DAPR app ID of the MCP server
+            tool_name: Name of the tool
+            arguments: Tool arguments (canonicalized for the key)
+            call: Performs the actual tool call on a miss
+
+        Returns:
+            Tool result as a dictionary
+        """
+        ttl = self.ttl_for(app_id, tool_name)
+        if ttl <= 0:
+            return await call()
+
+        attributes = {"app_id": app_id, "tool": tool_name}
+        key = (app_id, tool_name, canonicalize_arguments(arguments))
+
+        cached = self._get(key)
+        if cached is not None:
+            self._hits.add(1, attributes)
+            return json.loads(cached)
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._coalesced.add(1, attributes)
+        else:
+            self._misses.add(1, attributes)
+            task = asyncio.ensure_future(self._load(key, ttl, call))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _t: self._in_flight.pop(key, None))
+
+        # Shield so one cancelled caller does not cancel the call for the others
+        return json.loads(await asyncio.shield(task))
+
+    async def _load(
+        self,
+        key: CacheKey,
+        ttl: float,
+        call: Callable[[], Awaitable[dict[str, Any]]],
+    ) -> str:
+        """Run the tool call and store its serialized result (errors are not cached)."""
+        serialized = json.dumps(await call())
+        self._put(key, serialized, ttl)
+        return serialized
+
+    def _get(self, key: CacheKey) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, serialized = entry
+        if time.monotonic() >= expires_at:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return serialized
+
+    def _put(self, key: CacheKey, serialized: str, ttl: float) -> None:
+        if len(serialized) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, serialized)
+        self._size_bytes += len(serialized)
+        while len(self._entries) > self.max_entries or self._size_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self._evictions.add(1, {"app_id": oldest[0], "tool": oldest[1]})
+
+    def _remove(self, key: CacheKey) -> None:
+        _, serialized = self._entries.pop(key)
+        self._size_bytes -= len(serialized)
+
+    def invalidate(self, app_id: str | None = None, tool_name: str | None = None) -> int:
+        """Drop cached results, optionally only for one app_id and/or tool.
+
+        Returns:
+            Number of entries removed
+        """
+        keys = [
+            key
+            for key in self._entries
+            if (app_id is None or key[0] == app_id) and (tool_name is None or key[1] == tool_name)
+        ]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+
+class CachingMcpClient:
+    """Wrapper around an MCP client that serves idempotent tool calls from McpResultCache.
+
+    Delegates to the wrapped client (GrpcMcpClient or AioMcpClient) rather
+    than subclassing it, so every call goes through that client's transport.
+    Accepted wherever an McpClient is expected (GrpcMcpTool, McpToolRegistry,
+    workflows). If no tool metadata is known for the app_id yet, it is
+    fetched once via list_tools on first use.
+
+    Only call_tool results are cached; binary payloads are always fetched.
+    """
+
+    def __init__(self, client: GrpcMcpClient, cache: McpResultCache) -> None:
+        """Wrap a client with a result cache.
+
+        Args:
+            client: Underlying MCP client that performs real calls
+            cache: Shared result cache
+        """
+        self._client = client
+        self._cache = cache
+        self._metadata_task: asyncio.Task[None] | None = None
+
+    @property
+    def app_id(self) -> str:
+        """DAPR app ID of the target MCP server."""
+        return self._client.app_id
+
+    def __getattr__(self, name: str) -> Any:
+        """Expose the wrapped client's other public attributes (e.g. timeout)."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._client, name)
+
+    async def _ensure_metadata(self) -> None:
+        """Load tool metadata once so the cache knows which tools to cache."""
+        if self._cache.knows_app(self.app_id):
+            return
+        # A finished task with the app still unknown means the last attempt failed
+        if self._metadata_task is None or self._metadata_task.done():
+            self._metadata_task = asyncio.ensure_future(self._load_metadata())
+        try:
+            await asyncio.shield(self._metadata_task)
+        except Exception:
+            logger.warning("MCP tool metadata unavailable, calling %s uncached", self.app_id, exc_info=True)
+
+    async def _load_metadata(self) -> None:
+        self._cache.register_tools(self.app_id, await self._client.list_tools())
+
+    async def call_tool(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        caller_agent_id: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Invoke an MCP tool, reading through the result cache.
+
+        Args:
+            tool_name: Name of the tool to invoke
+            arguments: Tool arguments as a dictionary
+            caller_agent_id: Optional agent ID for audit logging
+            **kwargs: Passed through to the underlying client (e.g. timeout)
+
+        Returns:
+            Tool result as a dictionary
+
+        Raises:
+            McpToolError: If tool execution fails (failures are never cached)
+        """
+        await self._ensure_metadata()
+        return await self._cache.get_or_call(
+            self.app_id,
+            tool_name,
+            arguments,
+            lambda: self._client.call_tool(tool_name, arguments, caller_agent_id=caller_agent_id, **kwargs),
+        )
+
+    async def call_tool_binary(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+        caller_agent_id: str | None = None,
+        **kwargs: Any,
+    ) -> tuple[dict[str, Any], bytes]:
+        """Invoke an MCP tool that returns a binary payload (never cached).
+
+        Args:
+            tool_name: Name of the tool to invoke
+            arguments: Tool arguments as a dictionary
+            caller_agent_id: Optional agent ID for audit logging
+            **kwargs: Passed through to the underlying client (e.g. timeout)
+
+        Returns:
+            Tuple of (result metadata dictionary, payload bytes)
+
+        Raises:
+            McpToolError: If tool execution fails
+        """
+        return await self._client.call_tool_binary(tool_name, arguments, caller_agent_id=caller_agent_id, **kwargs)
+
+    async def call_tools(
+        self,
+        calls: Sequence[tuple[str, dict[str, Any]]],
+        caller_agent_id: str | None = None,
+        timeout: float | None = None,
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Invoke independent tools concurrently, each reading through the cache.
+
+        Args:
+            calls: (tool_name, arguments) pairs
+            caller_agent_id: Optional agent ID for audit logging
+            timeout: Per-call deadline in seconds (underlying client default if None)
+            return_exceptions: If True, failed calls yield their exception in
+                place of a result instead of raising
+
+        Returns:
+            Results in the same order as calls
+        """
+        kwargs = {} if timeout is None else {"timeout": timeout}
+        return await asyncio.gather(
+            *(
+                self.call_tool(tool_name, arguments, caller_agent_id=caller_agent_id, **kwargs)
+                for tool_name, arguments in calls
+            ),
+            return_exceptions=return_exceptions,
+        )
+
+    async def list_tools(self, category: str | None = None) -> list[dict[str, Any]]:
+        """List available tools from the MCP server (never cached here).
+
+        Args:
+            category: Optional category filter
+
+        Returns:
+            List of tool definitions
+        """
+        tools = await self._client.list_tools(category=category)
+        if category is None:
+            self._cache.register_tools(self.app_id, tools)
+        return tools
+
+
+# Any client accepted by GrpcMcpTool, McpToolRegistry and the workflows
+McpClient = GrpcMcpClient | CachingMcpClient
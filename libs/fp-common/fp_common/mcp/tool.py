@@ -11,20 +11,20 @@ from typing import Any
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, ConfigDict, Field
 
-from fp_common.mcp.client import GrpcMcpClient  # noqa: TC001
 from fp_common.mcp.errors import McpToolError
+from fp_common.mcp.result_cache import McpClient  # noqa: TC001
 
 
 class GrpcMcpTool(BaseTool):
     """LangChain tool wrapper for gRPC MCP tools.
 
-    Wraps a GrpcMcpClient to provide a standard LangChain tool interface
+    Wraps an MCP client to provide a standard LangChain tool interface
     for AI agents to invoke MCP server tools.
 
     Attributes:
         name: Tool name (passed to MCP server)
         description: Tool description for LLM
-        mcp_client: GrpcMcpClient instance for invoking tools
+        mcp_client: GrpcMcpClient/AioMcpClient (or CachingMcpClient) for invoking tools
         args_schema: Optional Pydantic model for argument validation
         raise_on_error: If True, raise McpToolError instead of returning error JSON
     """
@@ -33,7 +33,7 @@ class GrpcMcpTool(BaseTool):
 
     name: str = Field(description="Tool name")
     description: str = Field(description="Tool description for LLM")
-    mcp_client: GrpcMcpClient = Field(exclude=True)
+    mcp_client: McpClient = Field(exclude=True)
     args_schema: type[BaseModel] | None = None
     raise_on_error: bool = Field(
         default=False,
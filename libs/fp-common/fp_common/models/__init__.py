@@ -70,6 +70,7 @@ from fp_common.models.farmer import (
 
 # Farmer performance models
 from fp_common.models.farmer_performance import (
+    DailyDeliveryMetrics,
     FarmerPerformance,
     HistoricalMetrics,
     TodayMetrics,
@@ -146,6 +147,7 @@ from fp_common.models.value_objects import (
     PaymentPolicyType,
     PolygonRing,
     QualityThresholds,
+    QualityTier,
     RegionBoundary,
     WeatherConfig,
 )
@@ -180,6 +182,7 @@ __all__ = [
     "CurrentDayCost",
     "DailyCostEntry",
     "DailyCostTrend",
+    "DailyDeliveryMetrics",
     "DecimalStr",
     # Document
     "Document",
@@ -235,6 +238,7 @@ __all__ = [
     "PromptDetail",
     "PromptSummary",
     "QualityThresholds",
+    "QualityTier",
     "RawDocumentRef",
     # Region
     "Region",
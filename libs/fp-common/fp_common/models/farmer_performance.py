@@ -17,6 +17,7 @@ from enum import Enum
 from pydantic import BaseModel, Field
 
 from fp_common.models.farmer import FarmScale
+from fp_common.models.value_objects import QualityTier
 
 
 class TrendDirection(str, Enum):
@@ -132,6 +133,10 @@ class HistoricalMetrics(BaseModel):
         default=None,
         description="When these metrics were last computed",
     )
+    metrics_through: dt.date | None = Field(
+        default=None,
+        description="Last day included in the rolling windows (None until first computed)",
+    )
 
 
 class TodayMetrics(BaseModel):
@@ -175,6 +180,36 @@ class TodayMetrics(BaseModel):
     )
 
 
+class DailyDeliveryMetrics(BaseModel):
+    """One farmer's delivery totals for one closed day.
+
+    Written from the TodayMetrics snapshot when the day rolls over; the
+    rolling windows in HistoricalMetrics are sums of these buckets.
+    """
+
+    farmer_id: str = Field(description="Reference to farmer")
+    metrics_date: dt.date = Field(description="Day these totals are for")
+    deliveries: int = Field(default=0, ge=0, description="Number of deliveries that day")
+    total_kg: float = Field(default=0.0, ge=0.0, description="Total kg delivered that day")
+    grade_counts: dict[str, int] = Field(default_factory=dict, description="Grade counts for that day")
+    attribute_counts: dict[str, dict[str, int]] = Field(
+        default_factory=dict,
+        description="Attribute class counts for that day",
+    )
+
+    @classmethod
+    def from_today(cls, farmer_id: str, today: TodayMetrics) -> "DailyDeliveryMetrics":
+        """Close a TodayMetrics snapshot into its daily bucket."""
+        return cls(
+            farmer_id=farmer_id,
+            metrics_date=today.metrics_date,
+            deliveries=today.deliveries,
+            total_kg=today.total_kg,
+            grade_counts=dict(today.grade_counts),
+            attribute_counts={name: dict(counts) for name, counts in today.attribute_counts.items()},
+        )
+
+
 class FarmerPerformance(BaseModel):
     """Complete farmer performance tracking with attribute-level detail.
 
@@ -208,6 +243,13 @@ class FarmerPerformance(BaseModel):
     historical: HistoricalMetrics = Field(default_factory=HistoricalMetrics)
     today: TodayMetrics = Field(default_factory=TodayMetrics)
 
+    # Precomputed from historical.primary_percentage_30d and the factory's
+    # QualityThresholds; maintained by the repository for tier filtering
+    tier: QualityTier | None = Field(
+        default=None,
+        description="Quality tier (None until first computed)",
+    )
+
     # Timestamps
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(dt.UTC),
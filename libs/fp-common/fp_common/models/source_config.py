@@ -99,6 +99,11 @@ class IngestionConfig(BaseModel):
         None,
         description="ContentProcessor type for ProcessorRegistry lookup (e.g., 'json-extraction')",
     )
+    max_concurrent_jobs: int | None = Field(
+        None,
+        ge=1,
+        description="Maximum jobs of this source processed concurrently per worker (None = worker limit)",
+    )
 
     # scheduled_pull fields
     provider: str | None = Field(None, description="External data provider name")
@@ -174,6 +179,19 @@ class StorageConfig(BaseModel):
     file_container: str | None = Field(None, description="Container for extracted files (ZIP)")
     file_path_pattern: str | None = Field(None, description="Pattern for file blob paths")
     ttl_days: int | None = Field(None, description="Days to retain data")
+    search_fields: dict[str, int] = Field(
+        default_factory=dict,
+        description="Extracted fields indexed for full-text search, mapped to relevance weight (higher ranks first)",
+    )
+
+    @field_validator("search_fields")
+    @classmethod
+    def validate_search_weights(cls, v: dict[str, int]) -> dict[str, int]:
+        """Validate search field weights (MongoDB text index weights are 1-99999)."""
+        for field, weight in v.items():
+            if not 1 <= weight <= 99_999:
+                raise ValueError(f"Search weight for '{field}' must be between 1 and 99999, got {weight}")
+        return v
 
 
 class EventConfig(BaseModel):
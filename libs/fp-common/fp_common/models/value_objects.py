@@ -5,7 +5,7 @@ locations, contact information, payment policies, and region configuration.
 """
 
 import re
-from enum import Enum
+from enum import Enum, StrEnum
 from typing import ClassVar, Literal
 
 from pydantic import BaseModel, Field, field_validator, model_validator
@@ -67,6 +67,18 @@ class CollectionPointCapacity(BaseModel):
     has_qc_device: bool = Field(default=False, description="Has quality control device")
 
 
+class QualityTier(StrEnum):
+    """Quality tier derived from primary_percentage_30d and QualityThresholds.
+
+    Precomputed on FarmerPerformance so farmer listings can filter by tier.
+    """
+
+    TIER_1 = "tier_1"
+    TIER_2 = "tier_2"
+    TIER_3 = "tier_3"
+    BELOW_TIER_3 = "below_tier_3"
+
+
 class QualityThresholds(BaseModel):
     """Factory-configurable quality thresholds for farmer categorization.
 
@@ -118,6 +130,16 @@ class QualityThresholds(BaseModel):
             raise ValueError(f"tier_3 ({v}) must be less than tier_2 ({tier_2})")
         return v
 
+    def classify(self, primary_percentage: float) -> QualityTier:
+        """Map a Primary % to its quality tier under these thresholds."""
+        if primary_percentage >= self.tier_1:
+            return QualityTier.TIER_1
+        if primary_percentage >= self.tier_2:
+            return QualityTier.TIER_2
+        if primary_percentage >= self.tier_3:
+            return QualityTier.TIER_3
+        return QualityTier.BELOW_TIER_3
+
 
 # ============================================================================
 # Payment Policy Value Objects (Story 1.9)
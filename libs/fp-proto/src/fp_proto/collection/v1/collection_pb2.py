@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1e\x63ollection/v1/collection.proto\x12\x1a\x66\x61rmer_power.collection.v1\x1a\x1fgoogle/protobuf/timestamp.proto\"o\n\x18ListSourceConfigsRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x14\n\x0c\x65nabled_only\x18\x03 \x01(\x08\x12\x16\n\x0eingestion_mode\x18\x04 \x01(\t\"\x8b\x01\n\x19ListSourceConfigsResponse\x12@\n\x07\x63onfigs\x18\x01 \x03(\x0b\x32/.farmer_power.collection.v1.SourceConfigSummary\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"+\n\x16GetSourceConfigRequest\x12\x11\n\tsource_id\x18\x01 \x01(\t\"\xc1\x01\n\x13SourceConfigSummary\x12\x11\n\tsource_id\x18\x01 \x01(\t\x12\x14\n\x0c\x64isplay_name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0f\n\x07\x65nabled\x18\x04 \x01(\x08\x12\x16\n\x0eingestion_mode\x18\x05 \x01(\t\x12\x13\n\x0b\x61i_agent_id\x18\x06 \x01(\t\x12.\n\nupdated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xda\x01\n\x14SourceConfigResponse\x12\x11\n\tsource_id\x18\x01 \x01(\t\x12\x14\n\x0c\x64isplay_name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0f\n\x07\x65nabled\x18\x04 \x01(\x08\x12\x13\n\x0b\x63onfig_json\x18\x05 \x01(\t\x12.\n\ncreated_at\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x94\x01\n\x0eRawDocumentRef\x12\x16\n\x0e\x62lob_container\x18\x01 \x01(\t\x12\x11\n\tblob_path\x18\x02 \x01(\t\x12\x14\n\x0c\x63ontent_hash\x18\x03 \x01(\t\x12\x12\n\nsize_bytes\x18\x04 \x01(\x03\x12-\n\tstored_at\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xaf\x01\n\x12\x45xtractionMetadata\x12\x13\n\x0b\x61i_agent_id\x18\x01 \x01(\t\x12\x38\n\x14\x65xtraction_timestamp\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x12\n\nconfidence\x18\x03 \x01(\x01\x12\x19\n\x11validation_passed\x18\x04 \x01(\x08\x12\x1b\n\x13validation_warnings\x18\x05 \x03(\t\"\x9f\x01\n\x11IngestionMetadata\x12\x14\n\x0cingestion_id\x18\x01 \x01(\t\x12\x11\n\tsource_id\x18\x02 \x01(\t\x12/\n\x0breceived_at\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x30\n\x0cprocessed_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xab\x04\n\x08\x44ocument\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12@\n\x0craw_document\x18\x02 \x01(\x0b\x32*.farmer_power.collection.v1.RawDocumentRef\x12\x42\n\nextraction\x18\x03 \x01(\x0b\x32..farmer_power.collection.v1.ExtractionMetadata\x12@\n\tingestion\x18\x04 \x01(\x0b\x32-.farmer_power.collection.v1.IngestionMetadata\x12S\n\x10\x65xtracted_fields\x18\x05 \x03(\x0b\x32\x39.farmer_power.collection.v1.Document.ExtractedFieldsEntry\x12O\n\x0elinkage_fields\x18\x06 \x03(\x0b\x32\x37.farmer_power.collection.v1.Document.LinkageFieldsEntry\x12.\n\ncreated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a\x36\n\x14\x45xtractedFieldsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x34\n\x12LinkageFieldsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"B\n\x12GetDocumentRequest\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\x17\n\x0f\x63ollection_name\x18\x02 \x01(\t\"i\n\x14ListDocumentsRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x11\n\tfarmer_id\x18\x03 \x01(\t\x12\x17\n\x0f\x63ollection_name\x18\x04 \x01(\t\"~\n\x15ListDocumentsResponse\x12\x37\n\tdocuments\x18\x01 \x03(\x0b\x32$.farmer_power.collection.v1.Document\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"X\n\x1bGetDocumentsByFarmerRequest\x12\x11\n\tfarmer_id\x18\x01 \x01(\t\x12\x17\n\x0f\x63ollection_name\x18\x02 \x01(\t\x12\r\n\x05limit\x18\x03 \x01(\x05\"l\n\x1cGetDocumentsByFarmerResponse\x12\x37\n\tdocuments\x18\x01 \x03(\x0b\x32$.farmer_power.collection.v1.Document\x12\x13\n\x0btotal_count\x18\x02 \x01(\x05\"\xe1\x02\n\x16SearchDocumentsRequest\x12\x17\n\x0f\x63ollection_name\x18\x01 \x01(\t\x12\x11\n\tsource_id\x18\x02 \x01(\t\x12.\n\nstart_date\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_date\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12_\n\x0flinkage_filters\x18\x05 \x03(\x0b\x32\x46.farmer_power.collection.v1.SearchDocumentsRequest.LinkageFiltersEntry\x12\x11\n\tpage_size\x18\x06 \x01(\x05\x12\x12\n\npage_token\x18\x07 \x01(\t\x1a\x35\n\x13LinkageFiltersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x80\x01\n\x17SearchDocumentsResponse\x12\x37\n\tdocuments\x18\x01 \x03(\x0b\x32$.farmer_power.collection.v1.Document\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"\xeb\x01\n\x13\x44ocumentStoredEvent\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\x13\n\x0bsource_type\x18\x02 \x01(\t\x12\x11\n\tfarmer_id\x18\x03 \x01(\t\x12\x11\n\tblob_path\x18\x04 \x01(\t\x12\x11\n\tblob_etag\x18\x05 \x01(\t\x12\x14\n\x0c\x63ontent_hash\x18\x06 \x01(\t\x12\x14\n\x0c\x63ontent_type\x18\x07 \x01(\t\x12\x16\n\x0e\x63ontent_length\x18\x08 \x01(\x03\x12-\n\ttimestamp\x18\t \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xdc\x02\n\x18PoorQualityDetectedEvent\x12\x10\n\x08\x65vent_id\x18\x01 \x01(\t\x12\x11\n\tfarmer_id\x18\x02 \x01(\t\x12\x1a\n\x12primary_percentage\x18\x03 \x01(\x01\x12\x11\n\tthreshold\x18\x04 \x01(\x01\x12n\n\x16leaf_type_distribution\x18\x05 \x03(\x0b\x32N.farmer_power.collection.v1.PoorQualityDetectedEvent.LeafTypeDistributionEntry\x12\x10\n\x08priority\x18\x06 \x01(\t\x12-\n\ttimestamp\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a;\n\x19LeafTypeDistributionEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\"\xcf\x01\n\x13WeatherUpdatedEvent\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12\x14\n\x0cweather_date\x18\x02 \x01(\t\x12\x18\n\x10temperature_high\x18\x03 \x01(\x01\x12\x17\n\x0ftemperature_low\x18\x04 \x01(\x01\x12\x13\n\x0brainfall_mm\x18\x05 \x01(\x01\x12\x18\n\x10humidity_percent\x18\x06 \x01(\x01\x12-\n\ttimestamp\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xa8\x01\n\x18MarketPricesUpdatedEvent\x12\x11\n\tcommodity\x18\x01 \x01(\t\x12\x0e\n\x06region\x18\x02 \x01(\t\x12\x14\n\x0cprice_per_kg\x18\x03 \x01(\x01\x12\x10\n\x08\x63urrency\x18\x04 \x01(\t\x12\x12\n\nprice_date\x18\x05 \x01(\t\x12-\n\ttimestamp\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x90\x01\n\rEventMetadata\x12\x10\n\x08\x65vent_id\x18\x01 \x01(\t\x12\x11\n\tfarmer_id\x18\x02 \x01(\t\x12\x1b\n\x13\x63ollection_point_id\x18\x03 \x01(\t\x12-\n\ttimestamp\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0e\n\x06source\x18\x05 \x01(\t\"\xae\x02\n\x0b\x45ndBagEvent\x12;\n\x08metadata\x18\x01 \x01(\x0b\x32).farmer_power.collection.v1.EventMetadata\x12\x11\n\tweight_kg\x18\x02 \x01(\x01\x12?\n\rquality_grade\x18\x03 \x01(\x0e\x32(.farmer_power.collection.v1.QualityGrade\x12K\n\nattributes\x18\x04 \x03(\x0b\x32\x37.farmer_power.collection.v1.EndBagEvent.AttributesEntry\x12\x0e\n\x06\x62\x61g_id\x18\x05 \x01(\t\x1a\x31\n\x0f\x41ttributesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xb1\x01\n\x17GetQualityEventsRequest\x12\x11\n\tfarmer_id\x18\x01 \x01(\t\x12.\n\nstart_date\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_date\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x11\n\tpage_size\x18\x04 \x01(\x05\x12\x12\n\npage_token\x18\x05 \x01(\t\"\x81\x01\n\x18GetQualityEventsResponse\x12\x37\n\x06\x65vents\x18\x01 \x03(\x0b\x32\'.farmer_power.collection.v1.EndBagEvent\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05*\xb3\x01\n\tEventType\x12\x1a\n\x16\x45VENT_TYPE_UNSPECIFIED\x10\x00\x12\x1e\n\x1a\x45VENT_TYPE_DOCUMENT_STORED\x10\x01\x12$\n EVENT_TYPE_POOR_QUALITY_DETECTED\x10\x02\x12\x1e\n\x1a\x45VENT_TYPE_WEATHER_UPDATED\x10\x03\x12$\n EVENT_TYPE_MARKET_PRICES_UPDATED\x10\x04*e\n\x0cQualityGrade\x12\x1d\n\x19QUALITY_GRADE_UNSPECIFIED\x10\x00\x12\x19\n\x15QUALITY_GRADE_PRIMARY\x10\x01\x12\x1b\n\x17QUALITY_GRADE_SECONDARY\x10\x02\x32\xf6\x03\n\x11\x43ollectionService\x12\x63\n\x0bGetDocument\x12..farmer_power.collection.v1.GetDocumentRequest\x1a$.farmer_power.collection.v1.Document\x12t\n\rListDocuments\x12\x30.farmer_power.collection.v1.ListDocumentsRequest\x1a\x31.farmer_power.collection.v1.ListDocumentsResponse\x12\x89\x01\n\x14GetDocumentsByFarmer\x12\x37.farmer_power.collection.v1.GetDocumentsByFarmerRequest\x1a\x38.farmer_power.collection.v1.GetDocumentsByFarmerResponse\x12z\n\x0fSearchDocuments\x12\x32.farmer_power.collection.v1.SearchDocumentsRequest\x1a\x33.farmer_power.collection.v1.SearchDocumentsResponse2\x91\x02\n\x13SourceConfigService\x12\x80\x01\n\x11ListSourceConfigs\x12\x34.farmer_power.collection.v1.ListSourceConfigsRequest\x1a\x35.farmer_power.collection.v1.ListSourceConfigsResponse\x12w\n\x0fGetSourceConfig\x12\x32.farmer_power.collection.v1.GetSourceConfigRequest\x1a\x30.farmer_power.collection.v1.SourceConfigResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1e\x63ollection/v1/collection.proto\x12\x1a\x66\x61rmer_power.collection.v1\x1a\x1fgoogle/protobuf/timestamp.proto\"o\n\x18ListSourceConfigsRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x14\n\x0c\x65nabled_only\x18\x03 \x01(\x08\x12\x16\n\x0eingestion_mode\x18\x04 \x01(\t\"\x8b\x01\n\x19ListSourceConfigsResponse\x12@\n\x07\x63onfigs\x18\x01 \x03(\x0b\x32/.farmer_power.collection.v1.SourceConfigSummary\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"+\n\x16GetSourceConfigRequest\x12\x11\n\tsource_id\x18\x01 \x01(\t\"\xc1\x01\n\x13SourceConfigSummary\x12\x11\n\tsource_id\x18\x01 \x01(\t\x12\x14\n\x0c\x64isplay_name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0f\n\x07\x65nabled\x18\x04 \x01(\x08\x12\x16\n\x0eingestion_mode\x18\x05 \x01(\t\x12\x13\n\x0b\x61i_agent_id\x18\x06 \x01(\t\x12.\n\nupdated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xda\x01\n\x14SourceConfigResponse\x12\x11\n\tsource_id\x18\x01 \x01(\t\x12\x14\n\x0c\x64isplay_name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0f\n\x07\x65nabled\x18\x04 \x01(\x08\x12\x13\n\x0b\x63onfig_json\x18\x05 \x01(\t\x12.\n\ncreated_at\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x94\x01\n\x0eRawDocumentRef\x12\x16\n\x0e\x62lob_container\x18\x01 \x01(\t\x12\x11\n\tblob_path\x18\x02 \x01(\t\x12\x14\n\x0c\x63ontent_hash\x18\x03 \x01(\t\x12\x12\n\nsize_bytes\x18\x04 \x01(\x03\x12-\n\tstored_at\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xaf\x01\n\x12\x45xtractionMetadata\x12\x13\n\x0b\x61i_agent_id\x18\x01 \x01(\t\x12\x38\n\x14\x65xtraction_timestamp\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x12\n\nconfidence\x18\x03 \x01(\x01\x12\x19\n\x11validation_passed\x18\x04 \x01(\x08\x12\x1b\n\x13validation_warnings\x18\x05 \x03(\t\"\x9f\x01\n\x11IngestionMetadata\x12\x14\n\x0cingestion_id\x18\x01 \x01(\t\x12\x11\n\tsource_id\x18\x02 \x01(\t\x12/\n\x0breceived_at\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x30\n\x0cprocessed_at\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xab\x04\n\x08\x44ocument\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12@\n\x0craw_document\x18\x02 \x01(\x0b\x32*.farmer_power.collection.v1.RawDocumentRef\x12\x42\n\nextraction\x18\x03 \x01(\x0b\x32..farmer_power.collection.v1.ExtractionMetadata\x12@\n\tingestion\x18\x04 \x01(\x0b\x32-.farmer_power.collection.v1.IngestionMetadata\x12S\n\x10\x65xtracted_fields\x18\x05 \x03(\x0b\x32\x39.farmer_power.collection.v1.Document.ExtractedFieldsEntry\x12O\n\x0elinkage_fields\x18\x06 \x03(\x0b\x32\x37.farmer_power.collection.v1.Document.LinkageFieldsEntry\x12.\n\ncreated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a\x36\n\x14\x45xtractedFieldsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x34\n\x12LinkageFieldsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"B\n\x12GetDocumentRequest\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\x17\n\x0f\x63ollection_name\x18\x02 \x01(\t\"\x83\x01\n\x14ListDocumentsRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x11\n\tfarmer_id\x18\x03 \x01(\t\x12\x17\n\x0f\x63ollection_name\x18\x04 \x01(\t\x12\x18\n\x10skip_total_count\x18\x05 \x01(\x08\"\x9d\x01\n\x15ListDocumentsResponse\x12\x37\n\tdocuments\x18\x01 \x03(\x0b\x32$.farmer_power.collection.v1.Document\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\x12\x1d\n\x15total_count_estimated\x18\x04 \x01(\x08\"X\n\x1bGetDocumentsByFarmerRequest\x12\x11\n\tfarmer_id\x18\x01 \x01(\t\x12\x17\n\x0f\x63ollection_name\x18\x02 \x01(\t\x12\r\n\x05limit\x18\x03 \x01(\x05\"l\n\x1cGetDocumentsByFarmerResponse\x12\x37\n\tdocuments\x18\x01 \x03(\x0b\x32$.farmer_power.collection.v1.Document\x12\x13\n\x0btotal_count\x18\x02 \x01(\x05\"\xfb\x02\n\x16SearchDocumentsRequest\x12\x17\n\x0f\x63ollection_name\x18\x01 \x01(\t\x12\x11\n\tsource_id\x18\x02 \x01(\t\x12.\n\nstart_date\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_date\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12_\n\x0flinkage_filters\x18\x05 \x03(\x0b\x32\x46.farmer_power.collection.v1.SearchDocumentsRequest.LinkageFiltersEntry\x12\x11\n\tpage_size\x18\x06 \x01(\x05\x12\x12\n\npage_token\x18\x07 \x01(\t\x12\x18\n\x10skip_total_count\x18\x08 \x01(\x08\x1a\x35\n\x13LinkageFiltersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x9f\x01\n\x17SearchDocumentsResponse\x12\x37\n\tdocuments\x18\x01 \x03(\x0b\x32$.farmer_power.collection.v1.Document\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\x12\x1d\n\x15total_count_estimated\x18\x04 \x01(\x08\"\xeb\x01\n\x13\x44ocumentStoredEvent\x12\x13\n\x0b\x64ocument_id\x18\x01 \x01(\t\x12\x13\n\x0bsource_type\x18\x02 \x01(\t\x12\x11\n\tfarmer_id\x18\x03 \x01(\t\x12\x11\n\tblob_path\x18\x04 \x01(\t\x12\x11\n\tblob_etag\x18\x05 \x01(\t\x12\x14\n\x0c\x63ontent_hash\x18\x06 \x01(\t\x12\x14\n\x0c\x63ontent_type\x18\x07 \x01(\t\x12\x16\n\x0e\x63ontent_length\x18\x08 \x01(\x03\x12-\n\ttimestamp\x18\t \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xdc\x02\n\x18PoorQualityDetectedEvent\x12\x10\n\x08\x65vent_id\x18\x01 \x01(\t\x12\x11\n\tfarmer_id\x18\x02 \x01(\t\x12\x1a\n\x12primary_percentage\x18\x03 \x01(\x01\x12\x11\n\tthreshold\x18\x04 \x01(\x01\x12n\n\x16leaf_type_distribution\x18\x05 \x03(\x0b\x32N.farmer_power.collection.v1.PoorQualityDetectedEvent.LeafTypeDistributionEntry\x12\x10\n\x08priority\x18\x06 \x01(\t\x12-\n\ttimestamp\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a;\n\x19LeafTypeDistributionEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x01:\x02\x38\x01\"\xcf\x01\n\x13WeatherUpdatedEvent\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12\x14\n\x0cweather_date\x18\x02 \x01(\t\x12\x18\n\x10temperature_high\x18\x03 \x01(\x01\x12\x17\n\x0ftemperature_low\x18\x04 \x01(\x01\x12\x13\n\x0brainfall_mm\x18\x05 \x01(\x01\x12\x18\n\x10humidity_percent\x18\x06 \x01(\x01\x12-\n\ttimestamp\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xa8\x01\n\x18MarketPricesUpdatedEvent\x12\x11\n\tcommodity\x18\x01 \x01(\t\x12\x0e\n\x06region\x18\x02 \x01(\t\x12\x14\n\x0cprice_per_kg\x18\x03 \x01(\x01\x12\x10\n\x08\x63urrency\x18\x04 \x01(\t\x12\x12\n\nprice_date\x18\x05 \x01(\t\x12-\n\ttimestamp\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x90\x01\n\rEventMetadata\x12\x10\n\x08\x65vent_id\x18\x01 \x01(\t\x12\x11\n\tfarmer_id\x18\x02 \x01(\t\x12\x1b\n\x13\x63ollection_point_id\x18\x03 \x01(\t\x12-\n\ttimestamp\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0e\n\x06source\x18\x05 \x01(\t\"\xae\x02\n\x0b\x45ndBagEvent\x12;\n\x08metadata\x18\x01 \x01(\x0b\x32).farmer_power.collection.v1.EventMetadata\x12\x11\n\tweight_kg\x18\x02 \x01(\x01\x12?\n\rquality_grade\x18\x03 \x01(\x0e\x32(.farmer_power.collection.v1.QualityGrade\x12K\n\nattributes\x18\x04 \x03(\x0b\x32\x37.farmer_power.collection.v1.EndBagEvent.AttributesEntry\x12\x0e\n\x06\x62\x61g_id\x18\x05 \x01(\t\x1a\x31\n\x0f\x41ttributesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xb1\x01\n\x17GetQualityEventsRequest\x12\x11\n\tfarmer_id\x18\x01 \x01(\t\x12.\n\nstart_date\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_date\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x11\n\tpage_size\x18\x04 \x01(\x05\x12\x12\n\npage_token\x18\x05 \x01(\t\"\x81\x01\n\x18GetQualityEventsResponse\x12\x37\n\x06\x65vents\x18\x01 \x03(\x0b\x32\'.farmer_power.collection.v1.EndBagEvent\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05*\xb3\x01\n\tEventType\x12\x1a\n\x16\x45VENT_TYPE_UNSPECIFIED\x10\x00\x12\x1e\n\x1a\x45VENT_TYPE_DOCUMENT_STORED\x10\x01\x12$\n EVENT_TYPE_POOR_QUALITY_DETECTED\x10\x02\x12\x1e\n\x1a\x45VENT_TYPE_WEATHER_UPDATED\x10\x03\x12$\n EVENT_TYPE_MARKET_PRICES_UPDATED\x10\x04*e\n\x0cQualityGrade\x12\x1d\n\x19QUALITY_GRADE_UNSPECIFIED\x10\x00\x12\x19\n\x15QUALITY_GRADE_PRIMARY\x10\x01\x12\x1b\n\x17QUALITY_GRADE_SECONDARY\x10\x02\x32\xf6\x03\n\x11\x43ollectionService\x12\x63\n\x0bGetDocument\x12..farmer_power.collection.v1.GetDocumentRequest\x1a$.farmer_power.collection.v1.Document\x12t\n\rListDocuments\x12\x30.farmer_power.collection.v1.ListDocumentsRequest\x1a\x31.farmer_power.collection.v1.ListDocumentsResponse\x12\x89\x01\n\x14GetDocumentsByFarmer\x12\x37.farmer_power.collection.v1.GetDocumentsByFarmerRequest\x1a\x38.farmer_power.collection.v1.GetDocumentsByFarmerResponse\x12z\n\x0fSearchDocuments\x12\x32.farmer_power.collection.v1.SearchDocumentsRequest\x1a\x33.farmer_power.collection.v1.SearchDocumentsResponse2\x91\x02\n\x13SourceConfigService\x12\x80\x01\n\x11ListSourceConfigs\x12\x34.farmer_power.collection.v1.ListSourceConfigsRequest\x1a\x35.farmer_power.collection.v1.ListSourceConfigsResponse\x12w\n\x0fGetSourceConfig\x12\x32.farmer_power.collection.v1.GetSourceConfigRequest\x1a\x30.farmer_power.collection.v1.SourceConfigResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -42,10 +42,10 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_POORQUALITYDETECTEDEVENT_LEAFTYPEDISTRIBUTIONENTRY']._serialized_options = b'8\001'
   _globals['_ENDBAGEVENT_ATTRIBUTESENTRY']._loaded_options = None
   _globals['_ENDBAGEVENT_ATTRIBUTESENTRY']._serialized_options = b'8\001'
-  _globals['_EVENTTYPE']._serialized_start=4586
-  _globals['_EVENTTYPE']._serialized_end=4765
-  _globals['_QUALITYGRADE']._serialized_start=4767
-  _globals['_QUALITYGRADE']._serialized_end=4868
+  _globals['_EVENTTYPE']._serialized_start=4702
+  _globals['_EVENTTYPE']._serialized_end=4881
+  _globals['_QUALITYGRADE']._serialized_start=4883
+  _globals['_QUALITYGRADE']._serialized_end=4984
   _globals['_LISTSOURCECONFIGSREQUEST']._serialized_start=95
   _globals['_LISTSOURCECONFIGSREQUEST']._serialized_end=206
   _globals['_LISTSOURCECONFIGSRESPONSE']._serialized_start=209
@@ -70,42 +70,42 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_DOCUMENT_LINKAGEFIELDSENTRY']._serialized_end=1859
   _globals['_GETDOCUMENTREQUEST']._serialized_start=1861
   _globals['_GETDOCUMENTREQUEST']._serialized_end=1927
-  _globals['_LISTDOCUMENTSREQUEST']._serialized_start=1929
-  _globals['_LISTDOCUMENTSREQUEST']._serialized_end=2034
-  _globals['_LISTDOCUMENTSRESPONSE']._serialized_start=2036
-  _globals['_LISTDOCUMENTSRESPONSE']._serialized_end=2162
-  _globals['_GETDOCUMENTSBYFARMERREQUEST']._serialized_start=2164
-  _globals['_GETDOCUMENTSBYFARMERREQUEST']._serialized_end=2252
-  _globals['_GETDOCUMENTSBYFARMERRESPONSE']._serialized_start=2254
-  _globals['_GETDOCUMENTSBYFARMERRESPONSE']._serialized_end=2362
-  _globals['_SEARCHDOCUMENTSREQUEST']._serialized_start=2365
-  _globals['_SEARCHDOCUMENTSREQUEST']._serialized_end=2718
-  _globals['_SEARCHDOCUMENTSREQUEST_LINKAGEFILTERSENTRY']._serialized_start=2665
-  _globals['_SEARCHDOCUMENTSREQUEST_LINKAGEFILTERSENTRY']._serialized_end=2718
-  _globals['_SEARCHDOCUMENTSRESPONSE']._serialized_start=2721
-  _globals['_SEARCHDOCUMENTSRESPONSE']._serialized_end=2849
-  _globals['_DOCUMENTSTOREDEVENT']._serialized_start=2852
-  _globals['_DOCUMENTSTOREDEVENT']._serialized_end=3087
-  _globals['_POORQUALITYDETECTEDEVENT']._serialized_start=3090
-  _globals['_POORQUALITYDETECTEDEVENT']._serialized_end=3438
-  _globals['_POORQUALITYDETECTEDEVENT_LEAFTYPEDISTRIBUTIONENTRY']._serialized_start=3379
-  _globals['_POORQUALITYDETECTEDEVENT_LEAFTYPEDISTRIBUTIONENTRY']._serialized_end=3438
-  _globals['_WEATHERUPDATEDEVENT']._serialized_start=3441
-  _globals['_WEATHERUPDATEDEVENT']._serialized_end=3648
-  _globals['_MARKETPRICESUPDATEDEVENT']._serialized_start=3651
-  _globals['_MARKETPRICESUPDATEDEVENT']._serialized_end=3819
-  _globals['_EVENTMETADATA']._serialized_start=3822
-  _globals['_EVENTMETADATA']._serialized_end=3966
-  _globals['_ENDBAGEVENT']._serialized_start=3969
-  _globals['_ENDBAGEVENT']._serialized_end=4271
-  _globals['_ENDBAGEVENT_ATTRIBUTESENTRY']._serialized_start=4222
-  _globals['_ENDBAGEVENT_ATTRIBUTESENTRY']._serialized_end=4271
-  _globals['_GETQUALITYEVENTSREQUEST']._serialized_start=4274
-  _globals['_GETQUALITYEVENTSREQUEST']._serialized_end=4451
-  _globals['_GETQUALITYEVENTSRESPONSE']._serialized_start=4454
-  _globals['_GETQUALITYEVENTSRESPONSE']._serialized_end=4583
-  _globals['_COLLECTIONSERVICE']._serialized_start=4871
-  _globals['_COLLECTIONSERVICE']._serialized_end=5373
-  _globals['_SOURCECONFIGSERVICE']._serialized_start=5376
-  _globals['_SOURCECONFIGSERVICE']._serialized_end=5649
+  _globals['_LISTDOCUMENTSREQUEST']._serialized_start=1930
+  _globals['_LISTDOCUMENTSREQUEST']._serialized_end=2061
+  _globals['_LISTDOCUMENTSRESPONSE']._serialized_start=2064
+  _globals['_LISTDOCUMENTSRESPONSE']._serialized_end=2221
+  _globals['_GETDOCUMENTSBYFARMERREQUEST']._serialized_start=2223
+  _globals['_GETDOCUMENTSBYFARMERREQUEST']._serialized_end=2311
+  _globals['_GETDOCUMENTSBYFARMERRESPONSE']._serialized_start=2313
+  _globals['_GETDOCUMENTSBYFARMERRESPONSE']._serialized_end=2421
+  _globals['_SEARCHDOCUMENTSREQUEST']._serialized_start=2424
+  _globals['_SEARCHDOCUMENTSREQUEST']._serialized_end=2803
+  _globals['_SEARCHDOCUMENTSREQUEST_LINKAGEFILTERSENTRY']._serialized_start=2750
+  _globals['_SEARCHDOCUMENTSREQUEST_LINKAGEFILTERSENTRY']._serialized_end=2803
+  _globals['_SEARCHDOCUMENTSRESPONSE']._serialized_start=2806
+  _globals['_SEARCHDOCUMENTSRESPONSE']._serialized_end=2965
+  _globals['_DOCUMENTSTOREDEVENT']._serialized_start=2968
+  _globals['_DOCUMENTSTOREDEVENT']._serialized_end=3203
+  _globals['_POORQUALITYDETECTEDEVENT']._serialized_start=3206
+  _globals['_POORQUALITYDETECTEDEVENT']._serialized_end=3554
+  _globals['_POORQUALITYDETECTEDEVENT_LEAFTYPEDISTRIBUTIONENTRY']._serialized_start=3495
+  _globals['_POORQUALITYDETECTEDEVENT_LEAFTYPEDISTRIBUTIONENTRY']._serialized_end=3554
+  _globals['_WEATHERUPDATEDEVENT']._serialized_start=3557
+  _globals['_WEATHERUPDATEDEVENT']._serialized_end=3764
+  _globals['_MARKETPRICESUPDATEDEVENT']._serialized_start=3767
+  _globals['_MARKETPRICESUPDATEDEVENT']._serialized_end=3935
+  _globals['_EVENTMETADATA']._serialized_start=3938
+  _globals['_EVENTMETADATA']._serialized_end=4082
+  _globals['_ENDBAGEVENT']._serialized_start=4085
+  _globals['_ENDBAGEVENT']._serialized_end=4387
+  _globals['_ENDBAGEVENT_ATTRIBUTESENTRY']._serialized_start=4338
+  _globals['_ENDBAGEVENT_ATTRIBUTESENTRY']._serialized_end=4387
+  _globals['_GETQUALITYEVENTSREQUEST']._serialized_start=4390
+  _globals['_GETQUALITYEVENTSREQUEST']._serialized_end=4567
+  _globals['_GETQUALITYEVENTSRESPONSE']._serialized_start=4570
+  _globals['_GETQUALITYEVENTSRESPONSE']._serialized_end=4699
+  _globals['_COLLECTIONSERVICE']._serialized_start=4987
+  _globals['_COLLECTIONSERVICE']._serialized_end=5489
+  _globals['_SOURCECONFIGSERVICE']._serialized_start=5492
+  _globals['_SOURCECONFIGSERVICE']._serialized_end=5765
 # @@protoc_insertion_point(module_scope)
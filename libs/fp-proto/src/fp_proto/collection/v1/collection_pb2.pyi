@@ -177,26 +177,30 @@ class GetDocumentRequest(_message.Message):
     def __init__(self, document_id: _Optional[str] = ..., collection_name: _Optional[str] = ...) -> None: ...
 
 class ListDocumentsRequest(_message.Message):
-    __slots__ = ("page_size", "page_token", "farmer_id", "collection_name")
+    __slots__ = ("page_size", "page_token", "farmer_id", "collection_name", "skip_total_count")
     PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
     PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     FARMER_ID_FIELD_NUMBER: _ClassVar[int]
     COLLECTION_NAME_FIELD_NUMBER: _ClassVar[int]
+    SKIP_TOTAL_COUNT_FIELD_NUMBER: _ClassVar[int]
     page_size: int
     page_token: str
     farmer_id: str
     collection_name: str
-    def __init__(self, page_size: _Optional[int] = ..., page_token: _Optional[str] = ..., farmer_id: _Optional[str] = ..., collection_name: _Optional[str] = ...) -> None: ...
+    skip_total_count: bool
+    def __init__(self, page_size: _Optional[int] = ..., page_token: _Optional[str] = ..., farmer_id: _Optional[str] = ..., collection_name: _Optional[str] = ..., skip_total_count: bool = ...) -> None: ...
 
 class ListDocumentsResponse(_message.Message):
-    __slots__ = ("documents", "next_page_token", "total_count")
+    __slots__ = ("documents", "next_page_token", "total_count", "total_count_estimated")
     DOCUMENTS_FIELD_NUMBER: _ClassVar[int]
     NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     TOTAL_COUNT_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_COUNT_ESTIMATED_FIELD_NUMBER: _ClassVar[int]
     documents: _containers.RepeatedCompositeFieldContainer[Document]
     next_page_token: str
     total_count: int
-    def __init__(self, documents: _Optional[_Iterable[_Union[Document, _Mapping]]] = ..., next_page_token: _Optional[str] = ..., total_count: _Optional[int] = ...) -> None: ...
+    total_count_estimated: bool
+    def __init__(self, documents: _Optional[_Iterable[_Union[Document, _Mapping]]] = ..., next_page_token: _Optional[str] = ..., total_count: _Optional[int] = ..., total_count_estimated: bool = ...) -> None: ...
 
 class GetDocumentsByFarmerRequest(_message.Message):
     __slots__ = ("farmer_id", "collection_name", "limit")
@@ -217,7 +221,7 @@ class GetDocumentsByFarmerResponse(_message.Message):
     def __init__(self, documents: _Optional[_Iterable[_Union[Document, _Mapping]]] = ..., total_count: _Optional[int] = ...) -> None: ...
 
 class SearchDocumentsRequest(_message.Message):
-    __slots__ = ("collection_name", "source_id", "start_date", "end_date", "linkage_filters", "page_size", "page_token")
+    __slots__ = ("collection_name", "source_id", "start_date", "end_date", "linkage_filters", "page_size", "page_token", "skip_total_count")
     class LinkageFiltersEntry(_message.Message):
         __slots__ = ("key", "value")
         KEY_FIELD_NUMBER: _ClassVar[int]
@@ -232,6 +236,7 @@ class SearchDocumentsRequest(_message.Message):
     LINKAGE_FILTERS_FIELD_NUMBER: _ClassVar[int]
     PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
     PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    SKIP_TOTAL_COUNT_FIELD_NUMBER: _ClassVar[int]
     collection_name: str
     source_id: str
     start_date: _timestamp_pb2.Timestamp
@@ -239,17 +244,20 @@ class SearchDocumentsRequest(_message.Message):
     linkage_filters: _containers.ScalarMap[str, str]
     page_size: int
     page_token: str
-    def __init__(self, collection_name: _Optional[str] = ..., source_id: _Optional[str] = ..., start_date: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., end_date: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., linkage_filters: _Optional[_Mapping[str, str]] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ...) -> None: ...
+    skip_total_count: bool
+    def __init__(self, collection_name: _Optional[str] = ..., source_id: _Optional[str] = ..., start_date: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., end_date: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., linkage_filters: _Optional[_Mapping[str, str]] = ..., page_size: _Optional[int] = ..., page_token: _Optional[str] = ..., skip_total_count: bool = ...) -> None: ...
 
 class SearchDocumentsResponse(_message.Message):
-    __slots__ = ("documents", "next_page_token", "total_count")
+    __slots__ = ("documents", "next_page_token", "total_count", "total_count_estimated")
     DOCUMENTS_FIELD_NUMBER: _ClassVar[int]
     NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     TOTAL_COUNT_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_COUNT_ESTIMATED_FIELD_NUMBER: _ClassVar[int]
     documents: _containers.RepeatedCompositeFieldContainer[Document]
     next_page_token: str
     total_count: int
-    def __init__(self, documents: _Optional[_Iterable[_Union[Document, _Mapping]]] = ..., next_page_token: _Optional[str] = ..., total_count: _Optional[int] = ...) -> None: ...
+    total_count_estimated: bool
+    def __init__(self, documents: _Optional[_Iterable[_Union[Document, _Mapping]]] = ..., next_page_token: _Optional[str] = ..., total_count: _Optional[int] = ..., total_count_estimated: bool = ...) -> None: ...
 
 class DocumentStoredEvent(_message.Message):
     __slots__ = ("document_id", "source_type", "farmer_id", "blob_path", "blob_etag", "content_hash", "content_type", "content_length", "timestamp")
@@ -45,25 +45,29 @@ class ToolDefinition(_message.Message):
     def __init__(self, name: _Optional[str] = ..., description: _Optional[str] = ..., input_schema_json: _Optional[str] = ..., category: _Optional[str] = ...) -> None: ...
 
 class ToolCallRequest(_message.Message):
-    __slots__ = ("tool_name", "arguments_json", "trace_id", "caller_agent_id")
+    __slots__ = ("tool_name", "arguments_json", "trace_id", "caller_agent_id", "accept_binary")
     TOOL_NAME_FIELD_NUMBER: _ClassVar[int]
     ARGUMENTS_JSON_FIELD_NUMBER: _ClassVar[int]
     TRACE_ID_FIELD_NUMBER: _ClassVar[int]
     CALLER_AGENT_ID_FIELD_NUMBER: _ClassVar[int]
+    ACCEPT_BINARY_FIELD_NUMBER: _ClassVar[int]
     tool_name: str
     arguments_json: str
     trace_id: str
     caller_agent_id: str
-    def __init__(self, tool_name: _Optional[str] = ..., arguments_json: _Optional[str] = ..., trace_id: _Optional[str] = ..., caller_agent_id: _Optional[str] = ...) -> None: ...
+    accept_binary: bool
+    def __init__(self, tool_name: _Optional[str] = ..., arguments_json: _Optional[str] = ..., trace_id: _Optional[str] = ..., caller_agent_id: _Optional[str] = ..., accept_binary: bool = ...) -> None: ...
 
 class ToolCallResponse(_message.Message):
-    __slots__ = ("success", "result_json", "error_code", "error_message")
+    __slots__ = ("success", "result_json", "error_code", "error_message", "result_binary")
     SUCCESS_FIELD_NUMBER: _ClassVar[int]
     RESULT_JSON_FIELD_NUMBER: _ClassVar[int]
     ERROR_CODE_FIELD_NUMBER: _ClassVar[int]
     ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    RESULT_BINARY_FIELD_NUMBER: _ClassVar[int]
     success: bool
     result_json: str
     error_code: ErrorCode
     error_message: str
-    def __init__(self, success: bool = ..., result_json: _Optional[str] = ..., error_code: _Optional[_Union[ErrorCode, str]] = ..., error_message: _Optional[str] = ...) -> None: ...
+    result_binary: bytes
+    def __init__(self, success: bool = ..., result_json: _Optional[str] = ..., error_code: _Optional[_Union[ErrorCode, str]] = ..., error_message: _Optional[str] = ..., result_binary: _Optional[bytes] = ...) -> None: ...
@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1eplantation/v1/plantation.proto\x12\x1a\x66\x61rmer_power.plantation.v1\x1a\x1fgoogle/protobuf/timestamp.proto\"K\n\x0bGeoLocation\x12\x10\n\x08latitude\x18\x01 \x01(\x01\x12\x11\n\tlongitude\x18\x02 \x01(\x01\x12\x17\n\x0f\x61ltitude_meters\x18\x03 \x01(\x01\"<\n\x0b\x43ontactInfo\x12\r\n\x05phone\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x03 \x01(\t\"C\n\x11QualityThresholds\x12\x0e\n\x06tier_1\x18\x01 \x01(\x01\x12\x0e\n\x06tier_2\x18\x02 \x01(\x01\x12\x0e\n\x06tier_3\x18\x03 \x01(\x01\"\xc5\x01\n\rPaymentPolicy\x12\x42\n\x0bpolicy_type\x18\x01 \x01(\x0e\x32-.farmer_power.plantation.v1.PaymentPolicyType\x12\x19\n\x11tier_1_adjustment\x18\x02 \x01(\x01\x12\x19\n\x11tier_2_adjustment\x18\x03 \x01(\x01\x12\x19\n\x11tier_3_adjustment\x18\x04 \x01(\x01\x12\x1f\n\x17\x62\x65low_tier_3_adjustment\x18\x05 \x01(\x01\"\x1f\n\x03GPS\x12\x0b\n\x03lat\x18\x01 \x01(\x01\x12\x0b\n\x03lng\x18\x02 \x01(\x01\"1\n\nCoordinate\x12\x11\n\tlongitude\x18\x01 \x01(\x01\x12\x10\n\x08latitude\x18\x02 \x01(\x01\"E\n\x0bPolygonRing\x12\x36\n\x06points\x18\x01 \x03(\x0b\x32&.farmer_power.plantation.v1.Coordinate\"V\n\x0eRegionBoundary\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x36\n\x05rings\x18\x02 \x03(\x0b\x32\'.farmer_power.plantation.v1.PolygonRing\"t\n\x0c\x41ltitudeBand\x12\x12\n\nmin_meters\x18\x01 \x01(\x05\x12\x12\n\nmax_meters\x18\x02 \x01(\x05\x12<\n\x05label\x18\x03 \x01(\x0e\x32-.farmer_power.plantation.v1.AltitudeBandLabel\"\xb4\x02\n\tGeography\x12\x33\n\ncenter_gps\x18\x01 \x01(\x0b\x32\x1f.farmer_power.plantation.v1.GPS\x12\x11\n\tradius_km\x18\x02 \x01(\x01\x12?\n\raltitude_band\x18\x03 \x01(\x0b\x32(.farmer_power.plantation.v1.AltitudeBand\x12\x41\n\x08\x62oundary\x18\x04 \x01(\x0b\x32*.farmer_power.plantation.v1.RegionBoundaryH\x00\x88\x01\x01\x12\x15\n\x08\x61rea_km2\x18\x05 \x01(\x01H\x01\x88\x01\x01\x12\x19\n\x0cperimeter_km\x18\x06 \x01(\x01H\x02\x88\x01\x01\x42\x0b\n\t_boundaryB\x0b\n\t_area_km2B\x0f\n\r_perimeter_km\"B\n\x0b\x46lushPeriod\x12\r\n\x05start\x18\x01 \x01(\t\x12\x0b\n\x03\x65nd\x18\x02 \x01(\t\x12\x17\n\x0f\x63haracteristics\x18\x03 \x01(\t\"\x86\x02\n\rFlushCalendar\x12<\n\x0b\x66irst_flush\x18\x01 \x01(\x0b\x32\'.farmer_power.plantation.v1.FlushPeriod\x12>\n\rmonsoon_flush\x18\x02 \x01(\x0b\x32\'.farmer_power.plantation.v1.FlushPeriod\x12=\n\x0c\x61utumn_flush\x18\x03 \x01(\x0b\x32\'.farmer_power.plantation.v1.FlushPeriod\x12\x38\n\x07\x64ormant\x18\x04 \x01(\x0b\x32\'.farmer_power.plantation.v1.FlushPeriod\"y\n\rWeatherConfig\x12\x35\n\x0c\x61pi_location\x18\x01 \x01(\x0b\x32\x1f.farmer_power.plantation.v1.GPS\x12\x18\n\x10\x61ltitude_for_api\x18\x02 \x01(\x05\x12\x17\n\x0f\x63ollection_time\x18\x03 \x01(\t\"h\n\tAgronomic\x12\x11\n\tsoil_type\x18\x01 \x01(\t\x12\x18\n\x10typical_diseases\x18\x02 \x03(\t\x12\x1a\n\x12harvest_peak_hours\x18\x03 \x01(\t\x12\x12\n\nfrost_risk\x18\x04 \x01(\x08\"\xb7\x03\n\x06Region\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0e\n\x06\x63ounty\x18\x03 \x01(\t\x12\x0f\n\x07\x63ountry\x18\x04 \x01(\t\x12\x38\n\tgeography\x18\x05 \x01(\x0b\x32%.farmer_power.plantation.v1.Geography\x12\x41\n\x0e\x66lush_calendar\x18\x06 \x01(\x0b\x32).farmer_power.plantation.v1.FlushCalendar\x12\x38\n\tagronomic\x18\x07 \x01(\x0b\x32%.farmer_power.plantation.v1.Agronomic\x12\x41\n\x0eweather_config\x18\x08 \x01(\x0b\x32).farmer_power.plantation.v1.WeatherConfig\x12\x11\n\tis_active\x18\t \x01(\x08\x12.\n\ncreated_at\x18\n \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x0b \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"%\n\x10GetRegionRequest\x12\x11\n\tregion_id\x18\x01 \x01(\t\"w\n\x12ListRegionsRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x0e\n\x06\x63ounty\x18\x03 \x01(\t\x12\x15\n\raltitude_band\x18\x04 \x01(\t\x12\x13\n\x0b\x61\x63tive_only\x18\x05 \x01(\x08\"x\n\x13ListRegionsResponse\x12\x33\n\x07regions\x18\x01 \x03(\x0b\x32\".farmer_power.plantation.v1.Region\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"\xbe\x02\n\x13\x43reateRegionRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06\x63ounty\x18\x02 \x01(\t\x12\x0f\n\x07\x63ountry\x18\x03 \x01(\t\x12\x38\n\tgeography\x18\x04 \x01(\x0b\x32%.farmer_power.plantation.v1.Geography\x12\x41\n\x0e\x66lush_calendar\x18\x05 \x01(\x0b\x32).farmer_power.plantation.v1.FlushCalendar\x12\x38\n\tagronomic\x18\x06 \x01(\x0b\x32%.farmer_power.plantation.v1.Agronomic\x12\x41\n\x0eweather_config\x18\x07 \x01(\x0b\x32).farmer_power.plantation.v1.WeatherConfig\"\xba\x03\n\x13UpdateRegionRequest\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12=\n\tgeography\x18\x03 \x01(\x0b\x32%.farmer_power.plantation.v1.GeographyH\x01\x88\x01\x01\x12\x46\n\x0e\x66lush_calendar\x18\x04 \x01(\x0b\x32).farmer_power.plantation.v1.FlushCalendarH\x02\x88\x01\x01\x12=\n\tagronomic\x18\x05 \x01(\x0b\x32%.farmer_power.plantation.v1.AgronomicH\x03\x88\x01\x01\x12\x46\n\x0eweather_config\x18\x06 \x01(\x0b\x32).farmer_power.plantation.v1.WeatherConfigH\x04\x88\x01\x01\x12\x16\n\tis_active\x18\x07 \x01(\x08H\x05\x88\x01\x01\x42\x07\n\x05_nameB\x0c\n\n_geographyB\x11\n\x0f_flush_calendarB\x0c\n\n_agronomicB\x11\n\x0f_weather_configB\x0c\n\n_is_active\"h\n\x12WeatherObservation\x12\x10\n\x08temp_min\x18\x01 \x01(\x01\x12\x10\n\x08temp_max\x18\x02 \x01(\x01\x12\x18\n\x10precipitation_mm\x18\x03 \x01(\x01\x12\x14\n\x0chumidity_avg\x18\x04 \x01(\x01\"\xc6\x01\n\x0fRegionalWeather\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\x12\x10\n\x08temp_min\x18\x03 \x01(\x01\x12\x10\n\x08temp_max\x18\x04 \x01(\x01\x12\x18\n\x10precipitation_mm\x18\x05 \x01(\x01\x12\x14\n\x0chumidity_avg\x18\x06 \x01(\x01\x12\x0e\n\x06source\x18\x07 \x01(\t\x12.\n\ncreated_at\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\":\n\x17GetRegionWeatherRequest\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ys\x18\x02 \x01(\x05\"p\n\x18GetRegionWeatherResponse\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12\x41\n\x0cobservations\x18\x02 \x03(\x0b\x32+.farmer_power.plantation.v1.RegionalWeather\"y\n\x0c\x43urrentFlush\x12\x12\n\nflush_name\x18\x01 \x01(\t\x12\x12\n\nstart_date\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x03 \x01(\t\x12\x17\n\x0f\x63haracteristics\x18\x04 \x01(\t\x12\x16\n\x0e\x64\x61ys_remaining\x18\x05 \x01(\x05\"+\n\x16GetCurrentFlushRequest\x12\x11\n\tregion_id\x18\x01 \x01(\t\"m\n\x17GetCurrentFlushResponse\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12?\n\rcurrent_flush\x18\x02 \x01(\x0b\x32(.farmer_power.plantation.v1.CurrentFlush\"\xda\x03\n\x07\x46\x61\x63tory\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04\x63ode\x18\x03 \x01(\t\x12\x11\n\tregion_id\x18\x04 \x01(\t\x12\x39\n\x08location\x18\x05 \x01(\x0b\x32\'.farmer_power.plantation.v1.GeoLocation\x12\x38\n\x07\x63ontact\x18\x06 \x01(\x0b\x32\'.farmer_power.plantation.v1.ContactInfo\x12\x1e\n\x16processing_capacity_kg\x18\x07 \x01(\x05\x12I\n\x12quality_thresholds\x18\x08 \x01(\x0b\x32-.farmer_power.plantation.v1.QualityThresholds\x12\x41\n\x0epayment_policy\x18\t \x01(\x0b\x32).farmer_power.plantation.v1.PaymentPolicy\x12\x11\n\tis_active\x18\n \x01(\x08\x12.\n\ncreated_at\x18\x0b \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x0c \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x1f\n\x11GetFactoryRequest\x12\n\n\x02id\x18\x01 \x01(\t\"e\n\x14ListFactoriesRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x11\n\tregion_id\x18\x03 \x01(\t\x12\x13\n\x0b\x61\x63tive_only\x18\x04 \x01(\x08\"}\n\x15ListFactoriesResponse\x12\x36\n\tfactories\x18\x01 \x03(\x0b\x32#.farmer_power.plantation.v1.Factory\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"\xe8\x02\n\x14\x43reateFactoryRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x11\n\tregion_id\x18\x03 \x01(\t\x12\x39\n\x08location\x18\x04 \x01(\x0b\x32\'.farmer_power.plantation.v1.GeoLocation\x12\x38\n\x07\x63ontact\x18\x05 \x01(\x0b\x32\'.farmer_power.plantation.v1.ContactInfo\x12\x1e\n\x16processing_capacity_kg\x18\x06 \x01(\x05\x12I\n\x12quality_thresholds\x18\x07 \x01(\x0b\x32-.farmer_power.plantation.v1.QualityThresholds\x12\x41\n\x0epayment_policy\x18\x08 \x01(\x0b\x32).farmer_power.plantation.v1.PaymentPolicy\"\x9a\x04\n\x14UpdateFactoryRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x11\n\x04\x63ode\x18\x03 \x01(\tH\x01\x88\x01\x01\x12>\n\x08location\x18\x04 \x01(\x0b\x32\'.farmer_power.plantation.v1.GeoLocationH\x02\x88\x01\x01\x12=\n\x07\x63ontact\x18\x05 \x01(\x0b\x32\'.farmer_power.plantation.v1.ContactInfoH\x03\x88\x01\x01\x12#\n\x16processing_capacity_kg\x18\x06 \x01(\x05H\x04\x88\x01\x01\x12N\n\x12quality_thresholds\x18\x07 \x01(\x0b\x32-.farmer_power.plantation.v1.QualityThresholdsH\x05\x88\x01\x01\x12\x46\n\x0epayment_policy\x18\x08 \x01(\x0b\x32).farmer_power.plantation.v1.PaymentPolicyH\x06\x88\x01\x01\x12\x16\n\tis_active\x18\t \x01(\x08H\x07\x88\x01\x01\x42\x07\n\x05_nameB\x07\n\x05_codeB\x0b\n\t_locationB\n\n\x08_contactB\x19\n\x17_processing_capacity_kgB\x15\n\x13_quality_thresholdsB\x11\n\x0f_payment_policyB\x0c\n\n_is_active\"\"\n\x14\x44\x65leteFactoryRequest\x12\n\n\x02id\x18\x01 \x01(\t\"(\n\x15\x44\x65leteFactoryResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"4\n\x0eOperatingHours\x12\x10\n\x08weekdays\x18\x01 \x01(\t\x12\x10\n\x08weekends\x18\x02 \x01(\t\"x\n\x17\x43ollectionPointCapacity\x12\x14\n\x0cmax_daily_kg\x18\x01 \x01(\x05\x12\x14\n\x0cstorage_type\x18\x02 \x01(\t\x12\x1a\n\x12has_weighing_scale\x18\x03 \x01(\x08\x12\x15\n\rhas_qc_device\x18\x04 \x01(\x08\"\xdd\x03\n\x0f\x43ollectionPoint\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\nfactory_id\x18\x03 \x01(\t\x12\x39\n\x08location\x18\x04 \x01(\x0b\x32\'.farmer_power.plantation.v1.GeoLocation\x12\x11\n\tregion_id\x18\x05 \x01(\t\x12\x10\n\x08\x63lerk_id\x18\x06 \x01(\t\x12\x13\n\x0b\x63lerk_phone\x18\x07 \x01(\t\x12\x43\n\x0foperating_hours\x18\x08 \x01(\x0b\x32*.farmer_power.plantation.v1.OperatingHours\x12\x17\n\x0f\x63ollection_days\x18\t \x03(\t\x12\x45\n\x08\x63\x61pacity\x18\n \x01(\x0b\x32\x33.farmer_power.plantation.v1.CollectionPointCapacity\x12\x0e\n\x06status\x18\x0b \x01(\t\x12.\n\ncreated_at\x18\x0c \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\r \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x12\n\nfarmer_ids\x18\x0e \x03(\t\"\'\n\x19GetCollectionPointRequest\x12\n\n\x02id\x18\x01 \x01(\t\"\x90\x01\n\x1bListCollectionPointsRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x12\n\nfactory_id\x18\x03 \x01(\t\x12\x11\n\tregion_id\x18\x04 \x01(\t\x12\x0e\n\x06status\x18\x05 \x01(\t\x12\x13\n\x0b\x61\x63tive_only\x18\x06 \x01(\x08\"\x94\x01\n\x1cListCollectionPointsResponse\x12\x46\n\x11\x63ollection_points\x18\x01 \x03(\x0b\x32+.farmer_power.plantation.v1.CollectionPoint\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"\xea\x02\n\x1c\x43reateCollectionPointRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x12\n\nfactory_id\x18\x02 \x01(\t\x12\x39\n\x08location\x18\x03 \x01(\x0b\x32\'.farmer_power.plantation.v1.GeoLocation\x12\x11\n\tregion_id\x18\x04 \x01(\t\x12\x10\n\x08\x63lerk_id\x18\x05 \x01(\t\x12\x13\n\x0b\x63lerk_phone\x18\x06 \x01(\t\x12\x43\n\x0foperating_hours\x18\x07 \x01(\x0b\x32*.farmer_power.plantation.v1.OperatingHours\x12\x17\n\x0f\x63ollection_days\x18\x08 \x03(\t\x12\x45\n\x08\x63\x61pacity\x18\t \x01(\x0b\x32\x33.farmer_power.plantation.v1.CollectionPointCapacity\x12\x0e\n\x06status\x18\n \x01(\t\"\x84\x03\n\x1cUpdateCollectionPointRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x15\n\x08\x63lerk_id\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x18\n\x0b\x63lerk_phone\x18\x04 \x01(\tH\x02\x88\x01\x01\x12H\n\x0foperating_hours\x18\x05 \x01(\x0b\x32*.farmer_power.plantation.v1.OperatingHoursH\x03\x88\x01\x01\x12\x17\n\x0f\x63ollection_days\x18\x06 \x03(\t\x12J\n\x08\x63\x61pacity\x18\x07 \x01(\x0b\x32\x33.farmer_power.plantation.v1.CollectionPointCapacityH\x04\x88\x01\x01\x12\x13\n\x06status\x18\x08 \x01(\tH\x05\x88\x01\x01\x42\x07\n\x05_nameB\x0b\n\t_clerk_idB\x0e\n\x0c_clerk_phoneB\x12\n\x10_operating_hoursB\x0b\n\t_capacityB\t\n\x07_status\"*\n\x1c\x44\x65leteCollectionPointRequest\x12\n\n\x02id\x18\x01 \x01(\t\"0\n\x1d\x44\x65leteCollectionPointResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\xd3\x05\n\x06\x46\x61rmer\x12\n\n\x02id\x18\x01 \x01(\t\x12\x15\n\rgrower_number\x18\x02 \x01(\t\x12\x12\n\nfirst_name\x18\x03 \x01(\t\x12\x11\n\tlast_name\x18\x04 \x01(\t\x12\x11\n\tregion_id\x18\x05 \x01(\t\x12>\n\rfarm_location\x18\x07 \x01(\x0b\x32\'.farmer_power.plantation.v1.GeoLocation\x12\x38\n\x07\x63ontact\x18\x08 \x01(\x0b\x32\'.farmer_power.plantation.v1.ContactInfo\x12\x1a\n\x12\x66\x61rm_size_hectares\x18\t \x01(\x01\x12\x39\n\nfarm_scale\x18\n \x01(\x0e\x32%.farmer_power.plantation.v1.FarmScale\x12\x13\n\x0bnational_id\x18\x0b \x01(\t\x12\x35\n\x11registration_date\x18\x0c \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x11\n\tis_active\x18\r \x01(\x08\x12.\n\ncreated_at\x18\x0e \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x0f \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12M\n\x14notification_channel\x18\x10 \x01(\x0e\x32/.farmer_power.plantation.v1.NotificationChannel\x12K\n\x10interaction_pref\x18\x11 \x01(\x0e\x32\x31.farmer_power.plantation.v1.InteractionPreference\x12@\n\tpref_lang\x18\x12 \x01(\x0e\x32-.farmer_power.plantation.v1.PreferredLanguage\"\x1e\n\x10GetFarmerRequest\x12\n\n\x02id\x18\x01 \x01(\t\"(\n\x17GetFarmerByPhoneRequest\x12\r\n\x05phone\x18\x01 \x01(\t\"c\n\x12ListFarmersRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x11\n\tregion_id\x18\x03 \x01(\t\x12\x13\n\x0b\x61\x63tive_only\x18\x05 \x01(\x08\"x\n\x13ListFarmersResponse\x12\x33\n\x07\x66\x61rmers\x18\x01 \x03(\x0b\x32\".farmer_power.plantation.v1.Farmer\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"\xfe\x01\n\x13\x43reateFarmerRequest\x12\x12\n\nfirst_name\x18\x01 \x01(\t\x12\x11\n\tlast_name\x18\x02 \x01(\t\x12>\n\rfarm_location\x18\x04 \x01(\x0b\x32\'.farmer_power.plantation.v1.GeoLocation\x12\x38\n\x07\x63ontact\x18\x05 \x01(\x0b\x32\'.farmer_power.plantation.v1.ContactInfo\x12\x1a\n\x12\x66\x61rm_size_hectares\x18\x06 \x01(\x01\x12\x13\n\x0bnational_id\x18\x07 \x01(\t\x12\x15\n\rgrower_number\x18\x08 \x01(\t\"\xef\x02\n\x13UpdateFarmerRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x17\n\nfirst_name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x16\n\tlast_name\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x43\n\rfarm_location\x18\x04 \x01(\x0b\x32\'.farmer_power.plantation.v1.GeoLocationH\x02\x88\x01\x01\x12=\n\x07\x63ontact\x18\x05 \x01(\x0b\x32\'.farmer_power.plantation.v1.ContactInfoH\x03\x88\x01\x01\x12\x1f\n\x12\x66\x61rm_size_hectares\x18\x06 \x01(\x01H\x04\x88\x01\x01\x12\x16\n\tis_active\x18\x07 \x01(\x08H\x05\x88\x01\x01\x42\r\n\x0b_first_nameB\x0c\n\n_last_nameB\x10\n\x0e_farm_locationB\n\n\x08_contactB\x15\n\x13_farm_size_hectaresB\x0c\n\n_is_active\"\x8b\x03\n\x12PerformanceSummary\x12\n\n\x02id\x18\x01 \x01(\t\x12\x13\n\x0b\x65ntity_type\x18\x02 \x01(\t\x12\x11\n\tentity_id\x18\x03 \x01(\t\x12\x0e\n\x06period\x18\x04 \x01(\t\x12\x30\n\x0cperiod_start\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nperiod_end\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x1b\n\x13total_green_leaf_kg\x18\x07 \x01(\x01\x12\x19\n\x11total_made_tea_kg\x18\x08 \x01(\x01\x12\x18\n\x10\x63ollection_count\x18\t \x01(\x05\x12\x1d\n\x15\x61verage_quality_score\x18\n \x01(\x01\x12.\n\ncreated_at\x18\x0b \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x0c \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x88\x01\n\x1cGetPerformanceSummaryRequest\x12\x13\n\x0b\x65ntity_type\x18\x01 \x01(\t\x12\x11\n\tentity_id\x18\x02 \x01(\t\x12\x0e\n\x06period\x18\x03 \x01(\t\x12\x30\n\x0cperiod_start\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"8\n\x10GradingAttribute\x12\x13\n\x0bnum_classes\x18\x01 \x01(\x05\x12\x0f\n\x07\x63lasses\x18\x02 \x03(\t\"j\n\x11\x43onditionalReject\x12\x14\n\x0cif_attribute\x18\x01 \x01(\t\x12\x10\n\x08if_value\x18\x02 \x01(\t\x12\x16\n\x0ethen_attribute\x18\x03 \x01(\t\x12\x15\n\rreject_values\x18\x04 \x03(\t\"\x91\x02\n\nGradeRules\x12W\n\x11reject_conditions\x18\x01 \x03(\x0b\x32<.farmer_power.plantation.v1.GradeRules.RejectConditionsEntry\x12I\n\x12\x63onditional_reject\x18\x02 \x03(\x0b\x32-.farmer_power.plantation.v1.ConditionalReject\x1a_\n\x15RejectConditionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x35\n\x05value\x18\x02 \x01(\x0b\x32&.farmer_power.plantation.v1.StringList:\x02\x38\x01\"\x1c\n\nStringList\x12\x0e\n\x06values\x18\x01 \x03(\t\"\xa9\x05\n\x0cGradingModel\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x15\n\rmodel_version\x18\x02 \x01(\t\x12\x1c\n\x14regulatory_authority\x18\x03 \x01(\t\x12\x12\n\ncrops_name\x18\x04 \x01(\t\x12\x13\n\x0bmarket_name\x18\x05 \x01(\t\x12=\n\x0cgrading_type\x18\x06 \x01(\x0e\x32\'.farmer_power.plantation.v1.GradingType\x12L\n\nattributes\x18\x07 \x03(\x0b\x32\x38.farmer_power.plantation.v1.GradingModel.AttributesEntry\x12;\n\x0bgrade_rules\x18\x08 \x01(\x0b\x32&.farmer_power.plantation.v1.GradeRules\x12O\n\x0cgrade_labels\x18\t \x03(\x0b\x32\x39.farmer_power.plantation.v1.GradingModel.GradeLabelsEntry\x12\x19\n\x11\x61\x63tive_at_factory\x18\n \x03(\t\x12.\n\ncreated_at\x18\x0b \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x0c \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a_\n\x0f\x41ttributesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.farmer_power.plantation.v1.GradingAttribute:\x02\x38\x01\x1a\x32\n\x10GradeLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"*\n\x16GetGradingModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\"3\n\x1dGetFactoryGradingModelRequest\x12\x12\n\nfactory_id\x18\x01 \x01(\t\"\xf0\x04\n\x19\x43reateGradingModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x15\n\rmodel_version\x18\x02 \x01(\t\x12\x1c\n\x14regulatory_authority\x18\x03 \x01(\t\x12\x12\n\ncrops_name\x18\x04 \x01(\t\x12\x13\n\x0bmarket_name\x18\x05 \x01(\t\x12=\n\x0cgrading_type\x18\x06 \x01(\x0e\x32\'.farmer_power.plantation.v1.GradingType\x12Y\n\nattributes\x18\x07 \x03(\x0b\x32\x45.farmer_power.plantation.v1.CreateGradingModelRequest.AttributesEntry\x12;\n\x0bgrade_rules\x18\x08 \x01(\x0b\x32&.farmer_power.plantation.v1.GradeRules\x12\\\n\x0cgrade_labels\x18\t \x03(\x0b\x32\x46.farmer_power.plantation.v1.CreateGradingModelRequest.GradeLabelsEntry\x12\x19\n\x11\x61\x63tive_at_factory\x18\n \x03(\t\x1a_\n\x0f\x41ttributesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.farmer_power.plantation.v1.GradingAttribute:\x02\x38\x01\x1a\x32\n\x10GradeLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"J\n\"AssignGradingModelToFactoryRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x12\n\nfactory_id\x18\x02 \x01(\t\"\xa9\x01\n\x18ListGradingModelsRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x13\n\x0bmarket_name\x18\x03 \x01(\t\x12=\n\x0cgrading_type\x18\x04 \x01(\x0e\x32\'.farmer_power.plantation.v1.GradingType\x12\x12\n\ncrops_name\x18\x05 \x01(\t\"\x8b\x01\n\x19ListGradingModelsResponse\x12@\n\x0egrading_models\x18\x01 \x03(\x0b\x32(.farmer_power.plantation.v1.GradingModel\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"\x8f\x01\n\x12\x44istributionCounts\x12J\n\x06\x63ounts\x18\x01 \x03(\x0b\x32:.farmer_power.plantation.v1.DistributionCounts.CountsEntry\x1a-\n\x0b\x43ountsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\"\xbd\x0c\n\x11HistoricalMetrics\x12g\n\x16grade_distribution_30d\x18\x01 \x03(\x0b\x32G.farmer_power.plantation.v1.HistoricalMetrics.GradeDistribution30dEntry\x12g\n\x16grade_distribution_90d\x18\x02 \x03(\x0b\x32G.farmer_power.plantation.v1.HistoricalMetrics.GradeDistribution90dEntry\x12i\n\x17grade_distribution_year\x18\x03 \x03(\x0b\x32H.farmer_power.plantation.v1.HistoricalMetrics.GradeDistributionYearEntry\x12q\n\x1b\x61ttribute_distributions_30d\x18\x04 \x03(\x0b\x32L.farmer_power.plantation.v1.HistoricalMetrics.AttributeDistributions30dEntry\x12q\n\x1b\x61ttribute_distributions_90d\x18\x05 \x03(\x0b\x32L.farmer_power.plantation.v1.HistoricalMetrics.AttributeDistributions90dEntry\x12s\n\x1c\x61ttribute_distributions_year\x18\x06 \x03(\x0b\x32M.farmer_power.plantation.v1.HistoricalMetrics.AttributeDistributionsYearEntry\x12\x1e\n\x16primary_percentage_30d\x18\x07 \x01(\x01\x12\x1e\n\x16primary_percentage_90d\x18\x08 \x01(\x01\x12\x1f\n\x17primary_percentage_year\x18\t \x01(\x01\x12\x14\n\x0ctotal_kg_30d\x18\n \x01(\x01\x12\x14\n\x0ctotal_kg_90d\x18\x0b \x01(\x01\x12\x15\n\rtotal_kg_year\x18\x0c \x01(\x01\x12 \n\x18yield_kg_per_hectare_30d\x18\r \x01(\x01\x12 \n\x18yield_kg_per_hectare_90d\x18\x0e \x01(\x01\x12!\n\x19yield_kg_per_hectare_year\x18\x0f \x01(\x01\x12\x45\n\x11improvement_trend\x18\x10 \x01(\x0e\x32*.farmer_power.plantation.v1.TrendDirection\x12/\n\x0b\x63omputed_at\x18\x11 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a;\n\x19GradeDistribution30dEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a;\n\x19GradeDistribution90dEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a<\n\x1aGradeDistributionYearEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1ap\n\x1e\x41ttributeDistributions30dEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..farmer_power.plantation.v1.DistributionCounts:\x02\x38\x01\x1ap\n\x1e\x41ttributeDistributions90dEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..farmer_power.plantation.v1.DistributionCounts:\x02\x38\x01\x1aq\n\x1f\x41ttributeDistributionsYearEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..farmer_power.plantation.v1.DistributionCounts:\x02\x38\x01\"\xc3\x03\n\x0cTodayMetrics\x12\x12\n\ndeliveries\x18\x01 \x01(\x05\x12\x10\n\x08total_kg\x18\x02 \x01(\x01\x12O\n\x0cgrade_counts\x18\x03 \x03(\x0b\x32\x39.farmer_power.plantation.v1.TodayMetrics.GradeCountsEntry\x12W\n\x10\x61ttribute_counts\x18\x04 \x03(\x0b\x32=.farmer_power.plantation.v1.TodayMetrics.AttributeCountsEntry\x12\x31\n\rlast_delivery\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x14\n\x0cmetrics_date\x18\x06 \x01(\t\x1a\x32\n\x10GradeCountsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x66\n\x14\x41ttributeCountsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..farmer_power.plantation.v1.DistributionCounts:\x02\x38\x01\"\xe7\x05\n\rFarmerSummary\x12\x11\n\tfarmer_id\x18\x01 \x01(\t\x12\x12\n\nfirst_name\x18\x02 \x01(\t\x12\x11\n\tlast_name\x18\x03 \x01(\t\x12\r\n\x05phone\x18\x04 \x01(\t\x12\x1a\n\x12\x66\x61rm_size_hectares\x18\x06 \x01(\x01\x12\x39\n\nfarm_scale\x18\x07 \x01(\x0e\x32%.farmer_power.plantation.v1.FarmScale\x12\x18\n\x10grading_model_id\x18\x08 \x01(\t\x12\x1d\n\x15grading_model_version\x18\t \x01(\t\x12\x41\n\nhistorical\x18\n \x01(\x0b\x32-.farmer_power.plantation.v1.HistoricalMetrics\x12\x37\n\x05today\x18\x0b \x01(\x0b\x32(.farmer_power.plantation.v1.TodayMetrics\x12\x43\n\x0ftrend_direction\x18\x0c \x01(\x0e\x32*.farmer_power.plantation.v1.TrendDirection\x12.\n\ncreated_at\x18\r \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x0e \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12M\n\x14notification_channel\x18\x0f \x01(\x0e\x32/.farmer_power.plantation.v1.NotificationChannel\x12K\n\x10interaction_pref\x18\x10 \x01(\x0e\x32\x31.farmer_power.plantation.v1.InteractionPreference\x12@\n\tpref_lang\x18\x11 \x01(\x0e\x32-.farmer_power.plantation.v1.PreferredLanguage\",\n\x17GetFarmerSummaryRequest\x12\x11\n\tfarmer_id\x18\x01 \x01(\t\"\x98\x02\n%UpdateCommunicationPreferencesRequest\x12\x11\n\tfarmer_id\x18\x01 \x01(\t\x12M\n\x14notification_channel\x18\x02 \x01(\x0e\x32/.farmer_power.plantation.v1.NotificationChannel\x12K\n\x10interaction_pref\x18\x03 \x01(\x0e\x32\x31.farmer_power.plantation.v1.InteractionPreference\x12@\n\tpref_lang\x18\x04 \x01(\x0e\x32-.farmer_power.plantation.v1.PreferredLanguage\"\\\n&UpdateCommunicationPreferencesResponse\x12\x32\n\x06\x66\x61rmer\x18\x01 \x01(\x0b\x32\".farmer_power.plantation.v1.Farmer\"E\n\x13\x41ssignFarmerRequest\x12\x1b\n\x13\x63ollection_point_id\x18\x01 \x01(\t\x12\x11\n\tfarmer_id\x18\x02 \x01(\t\"G\n\x15UnassignFarmerRequest\x12\x1b\n\x13\x63ollection_point_id\x18\x01 \x01(\t\x12\x11\n\tfarmer_id\x18\x02 \x01(\t\"8\n#GetCollectionPointsForFarmerRequest\x12\x11\n\tfarmer_id\x18\x01 \x01(\t*\xd5\x01\n\x11PaymentPolicyType\x12#\n\x1fPAYMENT_POLICY_TYPE_UNSPECIFIED\x10\x00\x12%\n!PAYMENT_POLICY_TYPE_SPLIT_PAYMENT\x10\x01\x12$\n PAYMENT_POLICY_TYPE_WEEKLY_BONUS\x10\x02\x12\'\n#PAYMENT_POLICY_TYPE_DELAYED_PAYMENT\x10\x03\x12%\n!PAYMENT_POLICY_TYPE_FEEDBACK_ONLY\x10\x04*\x84\x01\n\x11\x41ltitudeBandLabel\x12\x1d\n\x19\x41LTITUDE_BAND_UNSPECIFIED\x10\x00\x12\x1a\n\x16\x41LTITUDE_BAND_HIGHLAND\x10\x01\x12\x19\n\x15\x41LTITUDE_BAND_MIDLAND\x10\x02\x12\x19\n\x15\x41LTITUDE_BAND_LOWLAND\x10\x03*q\n\tFarmScale\x12\x1a\n\x16\x46\x41RM_SCALE_UNSPECIFIED\x10\x00\x12\x1a\n\x16\x46\x41RM_SCALE_SMALLHOLDER\x10\x01\x12\x15\n\x11\x46\x41RM_SCALE_MEDIUM\x10\x02\x12\x15\n\x11\x46\x41RM_SCALE_ESTATE\x10\x03*|\n\x13NotificationChannel\x12$\n NOTIFICATION_CHANNEL_UNSPECIFIED\x10\x00\x12\x1c\n\x18NOTIFICATION_CHANNEL_SMS\x10\x01\x12!\n\x1dNOTIFICATION_CHANNEL_WHATSAPP\x10\x02*\x82\x01\n\x15InteractionPreference\x12&\n\"INTERACTION_PREFERENCE_UNSPECIFIED\x10\x00\x12\x1f\n\x1bINTERACTION_PREFERENCE_TEXT\x10\x01\x12 \n\x1cINTERACTION_PREFERENCE_VOICE\x10\x02*\xa4\x01\n\x11PreferredLanguage\x12\"\n\x1ePREFERRED_LANGUAGE_UNSPECIFIED\x10\x00\x12\x19\n\x15PREFERRED_LANGUAGE_SW\x10\x01\x12\x19\n\x15PREFERRED_LANGUAGE_KI\x10\x02\x12\x1a\n\x16PREFERRED_LANGUAGE_LUO\x10\x03\x12\x19\n\x15PREFERRED_LANGUAGE_EN\x10\x04*|\n\x0bGradingType\x12\x1c\n\x18GRADING_TYPE_UNSPECIFIED\x10\x00\x12\x17\n\x13GRADING_TYPE_BINARY\x10\x01\x12\x18\n\x14GRADING_TYPE_TERNARY\x10\x02\x12\x1c\n\x18GRADING_TYPE_MULTI_LEVEL\x10\x03*\x8b\x01\n\x0eTrendDirection\x12\x1f\n\x1bTREND_DIRECTION_UNSPECIFIED\x10\x00\x12\x1d\n\x19TREND_DIRECTION_IMPROVING\x10\x01\x12\x1a\n\x16TREND_DIRECTION_STABLE\x10\x02\x12\x1d\n\x19TREND_DIRECTION_DECLINING\x10\x03\x32\x97\x1e\n\x11PlantationService\x12]\n\tGetRegion\x12,.farmer_power.plantation.v1.GetRegionRequest\x1a\".farmer_power.plantation.v1.Region\x12n\n\x0bListRegions\x12..farmer_power.plantation.v1.ListRegionsRequest\x1a/.farmer_power.plantation.v1.ListRegionsResponse\x12\x63\n\x0c\x43reateRegion\x12/.farmer_power.plantation.v1.CreateRegionRequest\x1a\".farmer_power.plantation.v1.Region\x12\x63\n\x0cUpdateRegion\x12/.farmer_power.plantation.v1.UpdateRegionRequest\x1a\".farmer_power.plantation.v1.Region\x12}\n\x10GetRegionWeather\x12\x33.farmer_power.plantation.v1.GetRegionWeatherRequest\x1a\x34.farmer_power.plantation.v1.GetRegionWeatherResponse\x12z\n\x0fGetCurrentFlush\x12\x32.farmer_power.plantation.v1.GetCurrentFlushRequest\x1a\x33.farmer_power.plantation.v1.GetCurrentFlushResponse\x12`\n\nGetFactory\x12-.farmer_power.plantation.v1.GetFactoryRequest\x1a#.farmer_power.plantation.v1.Factory\x12t\n\rListFactories\x12\x30.farmer_power.plantation.v1.ListFactoriesRequest\x1a\x31.farmer_power.plantation.v1.ListFactoriesResponse\x12\x66\n\rCreateFactory\x12\x30.farmer_power.plantation.v1.CreateFactoryRequest\x1a#.farmer_power.plantation.v1.Factory\x12\x66\n\rUpdateFactory\x12\x30.farmer_power.plantation.v1.UpdateFactoryRequest\x1a#.farmer_power.plantation.v1.Factory\x12t\n\rDeleteFactory\x12\x30.farmer_power.plantation.v1.DeleteFactoryRequest\x1a\x31.farmer_power.plantation.v1.DeleteFactoryResponse\x12]\n\tGetFarmer\x12,.farmer_power.plantation.v1.GetFarmerRequest\x1a\".farmer_power.plantation.v1.Farmer\x12k\n\x10GetFarmerByPhone\x12\x33.farmer_power.plantation.v1.GetFarmerByPhoneRequest\x1a\".farmer_power.plantation.v1.Farmer\x12n\n\x0bListFarmers\x12..farmer_power.plantation.v1.ListFarmersRequest\x1a/.farmer_power.plantation.v1.ListFarmersResponse\x12\x63\n\x0c\x43reateFarmer\x12/.farmer_power.plantation.v1.CreateFarmerRequest\x1a\".farmer_power.plantation.v1.Farmer\x12\x63\n\x0cUpdateFarmer\x12/.farmer_power.plantation.v1.UpdateFarmerRequest\x1a\".farmer_power.plantation.v1.Farmer\x12x\n\x12GetCollectionPoint\x12\x35.farmer_power.plantation.v1.GetCollectionPointRequest\x1a+.farmer_power.plantation.v1.CollectionPoint\x12\x89\x01\n\x14ListCollectionPoints\x12\x37.farmer_power.plantation.v1.ListCollectionPointsRequest\x1a\x38.farmer_power.plantation.v1.ListCollectionPointsResponse\x12~\n\x15\x43reateCollectionPoint\x12\x38.farmer_power.plantation.v1.CreateCollectionPointRequest\x1a+.farmer_power.plantation.v1.CollectionPoint\x12~\n\x15UpdateCollectionPoint\x12\x38.farmer_power.plantation.v1.UpdateCollectionPointRequest\x1a+.farmer_power.plantation.v1.CollectionPoint\x12\x8c\x01\n\x15\x44\x65leteCollectionPoint\x12\x38.farmer_power.plantation.v1.DeleteCollectionPointRequest\x1a\x39.farmer_power.plantation.v1.DeleteCollectionPointResponse\x12\x81\x01\n\x15GetPerformanceSummary\x12\x38.farmer_power.plantation.v1.GetPerformanceSummaryRequest\x1a..farmer_power.plantation.v1.PerformanceSummary\x12u\n\x12\x43reateGradingModel\x12\x35.farmer_power.plantation.v1.CreateGradingModelRequest\x1a(.farmer_power.plantation.v1.GradingModel\x12o\n\x0fGetGradingModel\x12\x32.farmer_power.plantation.v1.GetGradingModelRequest\x1a(.farmer_power.plantation.v1.GradingModel\x12}\n\x16GetFactoryGradingModel\x12\x39.farmer_power.plantation.v1.GetFactoryGradingModelRequest\x1a(.farmer_power.plantation.v1.GradingModel\x12\x80\x01\n\x11ListGradingModels\x12\x34.farmer_power.plantation.v1.ListGradingModelsRequest\x1a\x35.farmer_power.plantation.v1.ListGradingModelsResponse\x12\x87\x01\n\x1b\x41ssignGradingModelToFactory\x12>.farmer_power.plantation.v1.AssignGradingModelToFactoryRequest\x1a(.farmer_power.plantation.v1.GradingModel\x12r\n\x10GetFarmerSummary\x12\x33.farmer_power.plantation.v1.GetFarmerSummaryRequest\x1a).farmer_power.plantation.v1.FarmerSummary\x12\xa7\x01\n\x1eUpdateCommunicationPreferences\x12\x41.farmer_power.plantation.v1.UpdateCommunicationPreferencesRequest\x1a\x42.farmer_power.plantation.v1.UpdateCommunicationPreferencesResponse\x12}\n\x1d\x41ssignFarmerToCollectionPoint\x12/.farmer_power.plantation.v1.AssignFarmerRequest\x1a+.farmer_power.plantation.v1.CollectionPoint\x12\x83\x01\n!UnassignFarmerFromCollectionPoint\x12\x31.farmer_power.plantation.v1.UnassignFarmerRequest\x1a+.farmer_power.plantation.v1.CollectionPoint\x12\x99\x01\n\x1cGetCollectionPointsForFarmer\x12?.farmer_power.plantation.v1.GetCollectionPointsForFarmerRequest\x1a\x38.farmer_power.plantation.v1.ListCollectionPointsResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x1eplantation/v1/plantation.proto\x12\x1a\x66\x61rmer_power.plantation.v1\x1a\x1fgoogle/protobuf/timestamp.proto\"K\n\x0bGeoLocation\x12\x10\n\x08latitude\x18\x01 \x01(\x01\x12\x11\n\tlongitude\x18\x02 \x01(\x01\x12\x17\n\x0f\x61ltitude_meters\x18\x03 \x01(\x01\"<\n\x0b\x43ontactInfo\x12\r\n\x05phone\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x0f\n\x07\x61\x64\x64ress\x18\x03 \x01(\t\"C\n\x11QualityThresholds\x12\x0e\n\x06tier_1\x18\x01 \x01(\x01\x12\x0e\n\x06tier_2\x18\x02 \x01(\x01\x12\x0e\n\x06tier_3\x18\x03 \x01(\x01\"\xc5\x01\n\rPaymentPolicy\x12\x42\n\x0bpolicy_type\x18\x01 \x01(\x0e\x32-.farmer_power.plantation.v1.PaymentPolicyType\x12\x19\n\x11tier_1_adjustment\x18\x02 \x01(\x01\x12\x19\n\x11tier_2_adjustment\x18\x03 \x01(\x01\x12\x19\n\x11tier_3_adjustment\x18\x04 \x01(\x01\x12\x1f\n\x17\x62\x65low_tier_3_adjustment\x18\x05 \x01(\x01\"\x1f\n\x03GPS\x12\x0b\n\x03lat\x18\x01 \x01(\x01\x12\x0b\n\x03lng\x18\x02 \x01(\x01\"1\n\nCoordinate\x12\x11\n\tlongitude\x18\x01 \x01(\x01\x12\x10\n\x08latitude\x18\x02 \x01(\x01\"E\n\x0bPolygonRing\x12\x36\n\x06points\x18\x01 \x03(\x0b\x32&.farmer_power.plantation.v1.Coordinate\"V\n\x0eRegionBoundary\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x36\n\x05rings\x18\x02 \x03(\x0b\x32\'.farmer_power.plantation.v1.PolygonRing\"t\n\x0c\x41ltitudeBand\x12\x12\n\nmin_meters\x18\x01 \x01(\x05\x12\x12\n\nmax_meters\x18\x02 \x01(\x05\x12<\n\x05label\x18\x03 \x01(\x0e\x32-.farmer_power.plantation.v1.AltitudeBandLabel\"\xb4\x02\n\tGeography\x12\x33\n\ncenter_gps\x18\x01 \x01(\x0b\x32\x1f.farmer_power.plantation.v1.GPS\x12\x11\n\tradius_km\x18\x02 \x01(\x01\x12?\n\raltitude_band\x18\x03 \x01(\x0b\x32(.farmer_power.plantation.v1.AltitudeBand\x12\x41\n\x08\x62oundary\x18\x04 \x01(\x0b\x32*.farmer_power.plantation.v1.RegionBoundaryH\x00\x88\x01\x01\x12\x15\n\x08\x61rea_km2\x18\x05 \x01(\x01H\x01\x88\x01\x01\x12\x19\n\x0cperimeter_km\x18\x06 \x01(\x01H\x02\x88\x01\x01\x42\x0b\n\t_boundaryB\x0b\n\t_area_km2B\x0f\n\r_perimeter_km\"B\n\x0b\x46lushPeriod\x12\r\n\x05start\x18\x01 \x01(\t\x12\x0b\n\x03\x65nd\x18\x02 \x01(\t\x12\x17\n\x0f\x63haracteristics\x18\x03 \x01(\t\"\x86\x02\n\rFlushCalendar\x12<\n\x0b\x66irst_flush\x18\x01 \x01(\x0b\x32\'.farmer_power.plantation.v1.FlushPeriod\x12>\n\rmonsoon_flush\x18\x02 \x01(\x0b\x32\'.farmer_power.plantation.v1.FlushPeriod\x12=\n\x0c\x61utumn_flush\x18\x03 \x01(\x0b\x32\'.farmer_power.plantation.v1.FlushPeriod\x12\x38\n\x07\x64ormant\x18\x04 \x01(\x0b\x32\'.farmer_power.plantation.v1.FlushPeriod\"y\n\rWeatherConfig\x12\x35\n\x0c\x61pi_location\x18\x01 \x01(\x0b\x32\x1f.farmer_power.plantation.v1.GPS\x12\x18\n\x10\x61ltitude_for_api\x18\x02 \x01(\x05\x12\x17\n\x0f\x63ollection_time\x18\x03 \x01(\t\"h\n\tAgronomic\x12\x11\n\tsoil_type\x18\x01 \x01(\t\x12\x18\n\x10typical_diseases\x18\x02 \x03(\t\x12\x1a\n\x12harvest_peak_hours\x18\x03 \x01(\t\x12\x12\n\nfrost_risk\x18\x04 \x01(\x08\"\xb7\x03\n\x06Region\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0e\n\x06\x63ounty\x18\x03 \x01(\t\x12\x0f\n\x07\x63ountry\x18\x04 \x01(\t\x12\x38\n\tgeography\x18\x05 \x01(\x0b\x32%.farmer_power.plantation.v1.Geography\x12\x41\n\x0e\x66lush_calendar\x18\x06 \x01(\x0b\x32).farmer_power.plantation.v1.FlushCalendar\x12\x38\n\tagronomic\x18\x07 \x01(\x0b\x32%.farmer_power.plantation.v1.Agronomic\x12\x41\n\x0eweather_config\x18\x08 \x01(\x0b\x32).farmer_power.plantation.v1.WeatherConfig\x12\x11\n\tis_active\x18\t \x01(\x08\x12.\n\ncreated_at\x18\n \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x0b \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"%\n\x10GetRegionRequest\x12\x11\n\tregion_id\x18\x01 \x01(\t\"w\n\x12ListRegionsRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x0e\n\x06\x63ounty\x18\x03 \x01(\t\x12\x15\n\raltitude_band\x18\x04 \x01(\t\x12\x13\n\x0b\x61\x63tive_only\x18\x05 \x01(\x08\"x\n\x13ListRegionsResponse\x12\x33\n\x07regions\x18\x01 \x03(\x0b\x32\".farmer_power.plantation.v1.Region\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"\xbe\x02\n\x13\x43reateRegionRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0e\n\x06\x63ounty\x18\x02 \x01(\t\x12\x0f\n\x07\x63ountry\x18\x03 \x01(\t\x12\x38\n\tgeography\x18\x04 \x01(\x0b\x32%.farmer_power.plantation.v1.Geography\x12\x41\n\x0e\x66lush_calendar\x18\x05 \x01(\x0b\x32).farmer_power.plantation.v1.FlushCalendar\x12\x38\n\tagronomic\x18\x06 \x01(\x0b\x32%.farmer_power.plantation.v1.Agronomic\x12\x41\n\x0eweather_config\x18\x07 \x01(\x0b\x32).farmer_power.plantation.v1.WeatherConfig\"\xba\x03\n\x13UpdateRegionRequest\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12=\n\tgeography\x18\x03 \x01(\x0b\x32%.farmer_power.plantation.v1.GeographyH\x01\x88\x01\x01\x12\x46\n\x0e\x66lush_calendar\x18\x04 \x01(\x0b\x32).farmer_power.plantation.v1.FlushCalendarH\x02\x88\x01\x01\x12=\n\tagronomic\x18\x05 \x01(\x0b\x32%.farmer_power.plantation.v1.AgronomicH\x03\x88\x01\x01\x12\x46\n\x0eweather_config\x18\x06 \x01(\x0b\x32).farmer_power.plantation.v1.WeatherConfigH\x04\x88\x01\x01\x12\x16\n\tis_active\x18\x07 \x01(\x08H\x05\x88\x01\x01\x42\x07\n\x05_nameB\x0c\n\n_geographyB\x11\n\x0f_flush_calendarB\x0c\n\n_agronomicB\x11\n\x0f_weather_configB\x0c\n\n_is_active\"h\n\x12WeatherObservation\x12\x10\n\x08temp_min\x18\x01 \x01(\x01\x12\x10\n\x08temp_max\x18\x02 \x01(\x01\x12\x18\n\x10precipitation_mm\x18\x03 \x01(\x01\x12\x14\n\x0chumidity_avg\x18\x04 \x01(\x01\"\xc6\x01\n\x0fRegionalWeather\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\t\x12\x10\n\x08temp_min\x18\x03 \x01(\x01\x12\x10\n\x08temp_max\x18\x04 \x01(\x01\x12\x18\n\x10precipitation_mm\x18\x05 \x01(\x01\x12\x14\n\x0chumidity_avg\x18\x06 \x01(\x01\x12\x0e\n\x06source\x18\x07 \x01(\t\x12.\n\ncreated_at\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\":\n\x17GetRegionWeatherRequest\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ys\x18\x02 \x01(\x05\"p\n\x18GetRegionWeatherResponse\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12\x41\n\x0cobservations\x18\x02 \x03(\x0b\x32+.farmer_power.plantation.v1.RegionalWeather\"y\n\x0c\x43urrentFlush\x12\x12\n\nflush_name\x18\x01 \x01(\t\x12\x12\n\nstart_date\x18\x02 \x01(\t\x12\x10\n\x08\x65nd_date\x18\x03 \x01(\t\x12\x17\n\x0f\x63haracteristics\x18\x04 \x01(\t\x12\x16\n\x0e\x64\x61ys_remaining\x18\x05 \x01(\x05\"+\n\x16GetCurrentFlushRequest\x12\x11\n\tregion_id\x18\x01 \x01(\t\"m\n\x17GetCurrentFlushResponse\x12\x11\n\tregion_id\x18\x01 \x01(\t\x12?\n\rcurrent_flush\x18\x02 \x01(\x0b\x32(.farmer_power.plantation.v1.CurrentFlush\"\xda\x03\n\x07\x46\x61\x63tory\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04\x63ode\x18\x03 \x01(\t\x12\x11\n\tregion_id\x18\x04 \x01(\t\x12\x39\n\x08location\x18\x05 \x01(\x0b\x32\'.farmer_power.plantation.v1.GeoLocation\x12\x38\n\x07\x63ontact\x18\x06 \x01(\x0b\x32\'.farmer_power.plantation.v1.ContactInfo\x12\x1e\n\x16processing_capacity_kg\x18\x07 \x01(\x05\x12I\n\x12quality_thresholds\x18\x08 \x01(\x0b\x32-.farmer_power.plantation.v1.QualityThresholds\x12\x41\n\x0epayment_policy\x18\t \x01(\x0b\x32).farmer_power.plantation.v1.PaymentPolicy\x12\x11\n\tis_active\x18\n \x01(\x08\x12.\n\ncreated_at\x18\x0b \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x0c \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x1f\n\x11GetFactoryRequest\x12\n\n\x02id\x18\x01 \x01(\t\"e\n\x14ListFactoriesRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x11\n\tregion_id\x18\x03 \x01(\t\x12\x13\n\x0b\x61\x63tive_only\x18\x04 \x01(\x08\"}\n\x15ListFactoriesResponse\x12\x36\n\tfactories\x18\x01 \x03(\x0b\x32#.farmer_power.plantation.v1.Factory\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"\xe8\x02\n\x14\x43reateFactoryRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\x12\x11\n\tregion_id\x18\x03 \x01(\t\x12\x39\n\x08location\x18\x04 \x01(\x0b\x32\'.farmer_power.plantation.v1.GeoLocation\x12\x38\n\x07\x63ontact\x18\x05 \x01(\x0b\x32\'.farmer_power.plantation.v1.ContactInfo\x12\x1e\n\x16processing_capacity_kg\x18\x06 \x01(\x05\x12I\n\x12quality_thresholds\x18\x07 \x01(\x0b\x32-.farmer_power.plantation.v1.QualityThresholds\x12\x41\n\x0epayment_policy\x18\x08 \x01(\x0b\x32).farmer_power.plantation.v1.PaymentPolicy\"\x9a\x04\n\x14UpdateFactoryRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x11\n\x04\x63ode\x18\x03 \x01(\tH\x01\x88\x01\x01\x12>\n\x08location\x18\x04 \x01(\x0b\x32\'.farmer_power.plantation.v1.GeoLocationH\x02\x88\x01\x01\x12=\n\x07\x63ontact\x18\x05 \x01(\x0b\x32\'.farmer_power.plantation.v1.ContactInfoH\x03\x88\x01\x01\x12#\n\x16processing_capacity_kg\x18\x06 \x01(\x05H\x04\x88\x01\x01\x12N\n\x12quality_thresholds\x18\x07 \x01(\x0b\x32-.farmer_power.plantation.v1.QualityThresholdsH\x05\x88\x01\x01\x12\x46\n\x0epayment_policy\x18\x08 \x01(\x0b\x32).farmer_power.plantation.v1.PaymentPolicyH\x06\x88\x01\x01\x12\x16\n\tis_active\x18\t \x01(\x08H\x07\x88\x01\x01\x42\x07\n\x05_nameB\x07\n\x05_codeB\x0b\n\t_locationB\n\n\x08_contactB\x19\n\x17_processing_capacity_kgB\x15\n\x13_quality_thresholdsB\x11\n\x0f_payment_policyB\x0c\n\n_is_active\"\"\n\x14\x44\x65leteFactoryRequest\x12\n\n\x02id\x18\x01 \x01(\t\"(\n\x15\x44\x65leteFactoryResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"4\n\x0eOperatingHours\x12\x10\n\x08weekdays\x18\x01 \x01(\t\x12\x10\n\x08weekends\x18\x02 \x01(\t\"x\n\x17\x43ollectionPointCapacity\x12\x14\n\x0cmax_daily_kg\x18\x01 \x01(\x05\x12\x14\n\x0cstorage_type\x18\x02 \x01(\t\x12\x1a\n\x12has_weighing_scale\x18\x03 \x01(\x08\x12\x15\n\rhas_qc_device\x18\x04 \x01(\x08\"\xdd\x03\n\x0f\x43ollectionPoint\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\nfactory_id\x18\x03 \x01(\t\x12\x39\n\x08location\x18\x04 \x01(\x0b\x32\'.farmer_power.plantation.v1.GeoLocation\x12\x11\n\tregion_id\x18\x05 \x01(\t\x12\x10\n\x08\x63lerk_id\x18\x06 \x01(\t\x12\x13\n\x0b\x63lerk_phone\x18\x07 \x01(\t\x12\x43\n\x0foperating_hours\x18\x08 \x01(\x0b\x32*.farmer_power.plantation.v1.OperatingHours\x12\x17\n\x0f\x63ollection_days\x18\t \x03(\t\x12\x45\n\x08\x63\x61pacity\x18\n \x01(\x0b\x32\x33.farmer_power.plantation.v1.CollectionPointCapacity\x12\x0e\n\x06status\x18\x0b \x01(\t\x12.\n\ncreated_at\x18\x0c \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\r \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x12\n\nfarmer_ids\x18\x0e \x03(\t\"\'\n\x19GetCollectionPointRequest\x12\n\n\x02id\x18\x01 \x01(\t\"\x90\x01\n\x1bListCollectionPointsRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x12\n\nfactory_id\x18\x03 \x01(\t\x12\x11\n\tregion_id\x18\x04 \x01(\t\x12\x0e\n\x06status\x18\x05 \x01(\t\x12\x13\n\x0b\x61\x63tive_only\x18\x06 \x01(\x08\"\x94\x01\n\x1cListCollectionPointsResponse\x12\x46\n\x11\x63ollection_points\x18\x01 \x03(\x0b\x32+.farmer_power.plantation.v1.CollectionPoint\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"\xea\x02\n\x1c\x43reateCollectionPointRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x12\n\nfactory_id\x18\x02 \x01(\t\x12\x39\n\x08location\x18\x03 \x01(\x0b\x32\'.farmer_power.plantation.v1.GeoLocation\x12\x11\n\tregion_id\x18\x04 \x01(\t\x12\x10\n\x08\x63lerk_id\x18\x05 \x01(\t\x12\x13\n\x0b\x63lerk_phone\x18\x06 \x01(\t\x12\x43\n\x0foperating_hours\x18\x07 \x01(\x0b\x32*.farmer_power.plantation.v1.OperatingHours\x12\x17\n\x0f\x63ollection_days\x18\x08 \x03(\t\x12\x45\n\x08\x63\x61pacity\x18\t \x01(\x0b\x32\x33.farmer_power.plantation.v1.CollectionPointCapacity\x12\x0e\n\x06status\x18\n \x01(\t\"\x84\x03\n\x1cUpdateCollectionPointRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x15\n\x08\x63lerk_id\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x18\n\x0b\x63lerk_phone\x18\x04 \x01(\tH\x02\x88\x01\x01\x12H\n\x0foperating_hours\x18\x05 \x01(\x0b\x32*.farmer_power.plantation.v1.OperatingHoursH\x03\x88\x01\x01\x12\x17\n\x0f\x63ollection_days\x18\x06 \x03(\t\x12J\n\x08\x63\x61pacity\x18\x07 \x01(\x0b\x32\x33.farmer_power.plantation.v1.CollectionPointCapacityH\x04\x88\x01\x01\x12\x13\n\x06status\x18\x08 \x01(\tH\x05\x88\x01\x01\x42\x07\n\x05_nameB\x0b\n\t_clerk_idB\x0e\n\x0c_clerk_phoneB\x12\n\x10_operating_hoursB\x0b\n\t_capacityB\t\n\x07_status\"*\n\x1c\x44\x65leteCollectionPointRequest\x12\n\n\x02id\x18\x01 \x01(\t\"0\n\x1d\x44\x65leteCollectionPointResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\"\xd3\x05\n\x06\x46\x61rmer\x12\n\n\x02id\x18\x01 \x01(\t\x12\x15\n\rgrower_number\x18\x02 \x01(\t\x12\x12\n\nfirst_name\x18\x03 \x01(\t\x12\x11\n\tlast_name\x18\x04 \x01(\t\x12\x11\n\tregion_id\x18\x05 \x01(\t\x12>\n\rfarm_location\x18\x07 \x01(\x0b\x32\'.farmer_power.plantation.v1.GeoLocation\x12\x38\n\x07\x63ontact\x18\x08 \x01(\x0b\x32\'.farmer_power.plantation.v1.ContactInfo\x12\x1a\n\x12\x66\x61rm_size_hectares\x18\t \x01(\x01\x12\x39\n\nfarm_scale\x18\n \x01(\x0e\x32%.farmer_power.plantation.v1.FarmScale\x12\x13\n\x0bnational_id\x18\x0b \x01(\t\x12\x35\n\x11registration_date\x18\x0c \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x11\n\tis_active\x18\r \x01(\x08\x12.\n\ncreated_at\x18\x0e \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x0f \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12M\n\x14notification_channel\x18\x10 \x01(\x0e\x32/.farmer_power.plantation.v1.NotificationChannel\x12K\n\x10interaction_pref\x18\x11 \x01(\x0e\x32\x31.farmer_power.plantation.v1.InteractionPreference\x12@\n\tpref_lang\x18\x12 \x01(\x0e\x32-.farmer_power.plantation.v1.PreferredLanguage\"\x1e\n\x10GetFarmerRequest\x12\n\n\x02id\x18\x01 \x01(\t\"(\n\x17GetFarmerByPhoneRequest\x12\r\n\x05phone\x18\x01 \x01(\t\"\xe5\x01\n\x12ListFarmersRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x11\n\tregion_id\x18\x03 \x01(\t\x12\x13\n\x0b\x61\x63tive_only\x18\x05 \x01(\x08\x12\x39\n\nfarm_scale\x18\x06 \x01(\x0e\x32%.farmer_power.plantation.v1.FarmScale\x12\x0e\n\x06search\x18\x07 \x01(\t\x12\x35\n\x04tier\x18\x08 \x01(\x0e\x32\'.farmer_power.plantation.v1.QualityTier\"x\n\x13ListFarmersResponse\x12\x33\n\x07\x66\x61rmers\x18\x01 \x03(\x0b\x32\".farmer_power.plantation.v1.Farmer\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"\xfe\x01\n\x13\x43reateFarmerRequest\x12\x12\n\nfirst_name\x18\x01 \x01(\t\x12\x11\n\tlast_name\x18\x02 \x01(\t\x12>\n\rfarm_location\x18\x04 \x01(\x0b\x32\'.farmer_power.plantation.v1.GeoLocation\x12\x38\n\x07\x63ontact\x18\x05 \x01(\x0b\x32\'.farmer_power.plantation.v1.ContactInfo\x12\x1a\n\x12\x66\x61rm_size_hectares\x18\x06 \x01(\x01\x12\x13\n\x0bnational_id\x18\x07 \x01(\t\x12\x15\n\rgrower_number\x18\x08 \x01(\t\"\xef\x02\n\x13UpdateFarmerRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x17\n\nfirst_name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x16\n\tlast_name\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x43\n\rfarm_location\x18\x04 \x01(\x0b\x32\'.farmer_power.plantation.v1.GeoLocationH\x02\x88\x01\x01\x12=\n\x07\x63ontact\x18\x05 \x01(\x0b\x32\'.farmer_power.plantation.v1.ContactInfoH\x03\x88\x01\x01\x12\x1f\n\x12\x66\x61rm_size_hectares\x18\x06 \x01(\x01H\x04\x88\x01\x01\x12\x16\n\tis_active\x18\x07 \x01(\x08H\x05\x88\x01\x01\x42\r\n\x0b_first_nameB\x0c\n\n_last_nameB\x10\n\x0e_farm_locationB\n\n\x08_contactB\x15\n\x13_farm_size_hectaresB\x0c\n\n_is_active\"f\n\x0fImportFarmerRow\x12\x12\n\nrow_number\x18\x01 \x01(\x05\x12?\n\x06\x66\x61rmer\x18\x02 \x01(\x0b\x32/.farmer_power.plantation.v1.CreateFarmerRequest\"Q\n\x14ImportFarmersRequest\x12\x39\n\x04rows\x18\x01 \x03(\x0b\x32+.farmer_power.plantation.v1.ImportFarmerRow\"M\n\x15ImportFarmerRowResult\x12\x12\n\nrow_number\x18\x01 \x01(\x05\x12\x11\n\tfarmer_id\x18\x02 \x01(\t\x12\r\n\x05\x65rror\x18\x03 \x01(\t\"[\n\x15ImportFarmersResponse\x12\x42\n\x07results\x18\x01 \x03(\x0b\x32\x31.farmer_power.plantation.v1.ImportFarmerRowResult\"\x8b\x03\n\x12PerformanceSummary\x12\n\n\x02id\x18\x01 \x01(\t\x12\x13\n\x0b\x65ntity_type\x18\x02 \x01(\t\x12\x11\n\tentity_id\x18\x03 \x01(\t\x12\x0e\n\x06period\x18\x04 \x01(\t\x12\x30\n\x0cperiod_start\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nperiod_end\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x1b\n\x13total_green_leaf_kg\x18\x07 \x01(\x01\x12\x19\n\x11total_made_tea_kg\x18\x08 \x01(\x01\x12\x18\n\x10\x63ollection_count\x18\t \x01(\x05\x12\x1d\n\x15\x61verage_quality_score\x18\n \x01(\x01\x12.\n\ncreated_at\x18\x0b \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x0c \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x88\x01\n\x1cGetPerformanceSummaryRequest\x12\x13\n\x0b\x65ntity_type\x18\x01 \x01(\t\x12\x11\n\tentity_id\x18\x02 \x01(\t\x12\x0e\n\x06period\x18\x03 \x01(\t\x12\x30\n\x0cperiod_start\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"8\n\x10GradingAttribute\x12\x13\n\x0bnum_classes\x18\x01 \x01(\x05\x12\x0f\n\x07\x63lasses\x18\x02 \x03(\t\"j\n\x11\x43onditionalReject\x12\x14\n\x0cif_attribute\x18\x01 \x01(\t\x12\x10\n\x08if_value\x18\x02 \x01(\t\x12\x16\n\x0ethen_attribute\x18\x03 \x01(\t\x12\x15\n\rreject_values\x18\x04 \x03(\t\"\x91\x02\n\nGradeRules\x12W\n\x11reject_conditions\x18\x01 \x03(\x0b\x32<.farmer_power.plantation.v1.GradeRules.RejectConditionsEntry\x12I\n\x12\x63onditional_reject\x18\x02 \x03(\x0b\x32-.farmer_power.plantation.v1.ConditionalReject\x1a_\n\x15RejectConditionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x35\n\x05value\x18\x02 \x01(\x0b\x32&.farmer_power.plantation.v1.StringList:\x02\x38\x01\"\x1c\n\nStringList\x12\x0e\n\x06values\x18\x01 \x03(\t\"\xa9\x05\n\x0cGradingModel\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x15\n\rmodel_version\x18\x02 \x01(\t\x12\x1c\n\x14regulatory_authority\x18\x03 \x01(\t\x12\x12\n\ncrops_name\x18\x04 \x01(\t\x12\x13\n\x0bmarket_name\x18\x05 \x01(\t\x12=\n\x0cgrading_type\x18\x06 \x01(\x0e\x32\'.farmer_power.plantation.v1.GradingType\x12L\n\nattributes\x18\x07 \x03(\x0b\x32\x38.farmer_power.plantation.v1.GradingModel.AttributesEntry\x12;\n\x0bgrade_rules\x18\x08 \x01(\x0b\x32&.farmer_power.plantation.v1.GradeRules\x12O\n\x0cgrade_labels\x18\t \x03(\x0b\x32\x39.farmer_power.plantation.v1.GradingModel.GradeLabelsEntry\x12\x19\n\x11\x61\x63tive_at_factory\x18\n \x03(\t\x12.\n\ncreated_at\x18\x0b \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x0c \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a_\n\x0f\x41ttributesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.farmer_power.plantation.v1.GradingAttribute:\x02\x38\x01\x1a\x32\n\x10GradeLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"*\n\x16GetGradingModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\"3\n\x1dGetFactoryGradingModelRequest\x12\x12\n\nfactory_id\x18\x01 \x01(\t\"\xf0\x04\n\x19\x43reateGradingModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x15\n\rmodel_version\x18\x02 \x01(\t\x12\x1c\n\x14regulatory_authority\x18\x03 \x01(\t\x12\x12\n\ncrops_name\x18\x04 \x01(\t\x12\x13\n\x0bmarket_name\x18\x05 \x01(\t\x12=\n\x0cgrading_type\x18\x06 \x01(\x0e\x32\'.farmer_power.plantation.v1.GradingType\x12Y\n\nattributes\x18\x07 \x03(\x0b\x32\x45.farmer_power.plantation.v1.CreateGradingModelRequest.AttributesEntry\x12;\n\x0bgrade_rules\x18\x08 \x01(\x0b\x32&.farmer_power.plantation.v1.GradeRules\x12\\\n\x0cgrade_labels\x18\t \x03(\x0b\x32\x46.farmer_power.plantation.v1.CreateGradingModelRequest.GradeLabelsEntry\x12\x19\n\x11\x61\x63tive_at_factory\x18\n \x03(\t\x1a_\n\x0f\x41ttributesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.farmer_power.plantation.v1.GradingAttribute:\x02\x38\x01\x1a\x32\n\x10GradeLabelsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"J\n\"AssignGradingModelToFactoryRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x12\n\nfactory_id\x18\x02 \x01(\t\"\xa9\x01\n\x18ListGradingModelsRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x13\n\x0bmarket_name\x18\x03 \x01(\t\x12=\n\x0cgrading_type\x18\x04 \x01(\x0e\x32\'.farmer_power.plantation.v1.GradingType\x12\x12\n\ncrops_name\x18\x05 \x01(\t\"\x8b\x01\n\x19ListGradingModelsResponse\x12@\n\x0egrading_models\x18\x01 \x03(\x0b\x32(.farmer_power.plantation.v1.GradingModel\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t\x12\x13\n\x0btotal_count\x18\x03 \x01(\x05\"\x8f\x01\n\x12\x44istributionCounts\x12J\n\x06\x63ounts\x18\x01 \x03(\x0b\x32:.farmer_power.plantation.v1.DistributionCounts.CountsEntry\x1a-\n\x0b\x43ountsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\"\xbd\x0c\n\x11HistoricalMetrics\x12g\n\x16grade_distribution_30d\x18\x01 \x03(\x0b\x32G.farmer_power.plantation.v1.HistoricalMetrics.GradeDistribution30dEntry\x12g\n\x16grade_distribution_90d\x18\x02 \x03(\x0b\x32G.farmer_power.plantation.v1.HistoricalMetrics.GradeDistribution90dEntry\x12i\n\x17grade_distribution_year\x18\x03 \x03(\x0b\x32H.farmer_power.plantation.v1.HistoricalMetrics.GradeDistributionYearEntry\x12q\n\x1b\x61ttribute_distributions_30d\x18\x04 \x03(\x0b\x32L.farmer_power.plantation.v1.HistoricalMetrics.AttributeDistributions30dEntry\x12q\n\x1b\x61ttribute_distributions_90d\x18\x05 \x03(\x0b\x32L.farmer_power.plantation.v1.HistoricalMetrics.AttributeDistributions90dEntry\x12s\n\x1c\x61ttribute_distributions_year\x18\x06 \x03(\x0b\x32M.farmer_power.plantation.v1.HistoricalMetrics.AttributeDistributionsYearEntry\x12\x1e\n\x16primary_percentage_30d\x18\x07 \x01(\x01\x12\x1e\n\x16primary_percentage_90d\x18\x08 \x01(\x01\x12\x1f\n\x17primary_percentage_year\x18\t \x01(\x01\x12\x14\n\x0ctotal_kg_30d\x18\n \x01(\x01\x12\x14\n\x0ctotal_kg_90d\x18\x0b \x01(\x01\x12\x15\n\rtotal_kg_year\x18\x0c \x01(\x01\x12 \n\x18yield_kg_per_hectare_30d\x18\r \x01(\x01\x12 \n\x18yield_kg_per_hectare_90d\x18\x0e \x01(\x01\x12!\n\x19yield_kg_per_hectare_year\x18\x0f \x01(\x01\x12\x45\n\x11improvement_trend\x18\x10 \x01(\x0e\x32*.farmer_power.plantation.v1.TrendDirection\x12/\n\x0b\x63omputed_at\x18\x11 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x1a;\n\x19GradeDistribution30dEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a;\n\x19GradeDistribution90dEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a<\n\x1aGradeDistributionYearEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1ap\n\x1e\x41ttributeDistributions30dEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..farmer_power.plantation.v1.DistributionCounts:\x02\x38\x01\x1ap\n\x1e\x41ttributeDistributions90dEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..farmer_power.plantation.v1.DistributionCounts:\x02\x38\x01\x1aq\n\x1f\x41ttributeDistributionsYearEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..farmer_power.plantation.v1.DistributionCounts:\x02\x38\x01\"\xc3\x03\n\x0cTodayMetrics\x12\x12\n\ndeliveries\x18\x01 \x01(\x05\x12\x10\n\x08total_kg\x18\x02 \x01(\x01\x12O\n\x0cgrade_counts\x18\x03 \x03(\x0b\x32\x39.farmer_power.plantation.v1.TodayMetrics.GradeCountsEntry\x12W\n\x10\x61ttribute_counts\x18\x04 \x03(\x0b\x32=.farmer_power.plantation.v1.TodayMetrics.AttributeCountsEntry\x12\x31\n\rlast_delivery\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x14\n\x0cmetrics_date\x18\x06 \x01(\t\x1a\x32\n\x10GradeCountsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\x1a\x66\n\x14\x41ttributeCountsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..farmer_power.plantation.v1.DistributionCounts:\x02\x38\x01\"\x9e\x06\n\rFarmerSummary\x12\x11\n\tfarmer_id\x18\x01 \x01(\t\x12\x12\n\nfirst_name\x18\x02 \x01(\t\x12\x11\n\tlast_name\x18\x03 \x01(\t\x12\r\n\x05phone\x18\x04 \x01(\t\x12\x1a\n\x12\x66\x61rm_size_hectares\x18\x06 \x01(\x01\x12\x39\n\nfarm_scale\x18\x07 \x01(\x0e\x32%.farmer_power.plantation.v1.FarmScale\x12\x18\n\x10grading_model_id\x18\x08 \x01(\t\x12\x1d\n\x15grading_model_version\x18\t \x01(\t\x12\x41\n\nhistorical\x18\n \x01(\x0b\x32-.farmer_power.plantation.v1.HistoricalMetrics\x12\x37\n\x05today\x18\x0b \x01(\x0b\x32(.farmer_power.plantation.v1.TodayMetrics\x12\x43\n\x0ftrend_direction\x18\x0c \x01(\x0e\x32*.farmer_power.plantation.v1.TrendDirection\x12.\n\ncreated_at\x18\r \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x0e \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12M\n\x14notification_channel\x18\x0f \x01(\x0e\x32/.farmer_power.plantation.v1.NotificationChannel\x12K\n\x10interaction_pref\x18\x10 \x01(\x0e\x32\x31.farmer_power.plantation.v1.InteractionPreference\x12@\n\tpref_lang\x18\x11 \x01(\x0e\x32-.farmer_power.plantation.v1.PreferredLanguage\x12\x35\n\x04tier\x18\x12 \x01(\x0e\x32\'.farmer_power.plantation.v1.QualityTier\",\n\x17GetFarmerSummaryRequest\x12\x11\n\tfarmer_id\x18\x01 \x01(\t\"/\n\x19GetFarmerSummariesRequest\x12\x12\n\nfarmer_ids\x18\x01 \x03(\t\"x\n\x1aGetFarmerSummariesResponse\x12<\n\tsummaries\x18\x01 \x03(\x0b\x32).farmer_power.plantation.v1.FarmerSummary\x12\x1c\n\x14not_found_farmer_ids\x18\x02 \x03(\t\"\x98\x02\n%UpdateCommunicationPreferencesRequest\x12\x11\n\tfarmer_id\x18\x01 \x01(\t\x12M\n\x14notification_channel\x18\x02 \x01(\x0e\x32/.farmer_power.plantation.v1.NotificationChannel\x12K\n\x10interaction_pref\x18\x03 \x01(\x0e\x32\x31.farmer_power.plantation.v1.InteractionPreference\x12@\n\tpref_lang\x18\x04 \x01(\x0e\x32-.farmer_power.plantation.v1.PreferredLanguage\"\\\n&UpdateCommunicationPreferencesResponse\x12\x32\n\x06\x66\x61rmer\x18\x01 \x01(\x0b\x32\".farmer_power.plantation.v1.Farmer\"E\n\x13\x41ssignFarmerRequest\x12\x1b\n\x13\x63ollection_point_id\x18\x01 \x01(\t\x12\x11\n\tfarmer_id\x18\x02 \x01(\t\"G\n\x15UnassignFarmerRequest\x12\x1b\n\x13\x63ollection_point_id\x18\x01 \x01(\t\x12\x11\n\tfarmer_id\x18\x02 \x01(\t\"8\n#GetCollectionPointsForFarmerRequest\x12\x11\n\tfarmer_id\x18\x01 \x01(\t\":\n$GetCollectionPointsForFarmersRequest\x12\x12\n\nfarmer_ids\x18\x01 \x03(\t\"K\n\x18\x46\x61rmerCollectionPointIds\x12\x11\n\tfarmer_id\x18\x01 \x01(\t\x12\x1c\n\x14\x63ollection_point_ids\x18\x02 \x03(\t\"\xba\x01\n%GetCollectionPointsForFarmersResponse\x12\x46\n\x11\x63ollection_points\x18\x01 \x03(\x0b\x32+.farmer_power.plantation.v1.CollectionPoint\x12I\n\x0bmemberships\x18\x02 \x03(\x0b\x32\x34.farmer_power.plantation.v1.FarmerCollectionPointIds*\xd5\x01\n\x11PaymentPolicyType\x12#\n\x1fPAYMENT_POLICY_TYPE_UNSPECIFIED\x10\x00\x12%\n!PAYMENT_POLICY_TYPE_SPLIT_PAYMENT\x10\x01\x12$\n PAYMENT_POLICY_TYPE_WEEKLY_BONUS\x10\x02\x12\'\n#PAYMENT_POLICY_TYPE_DELAYED_PAYMENT\x10\x03\x12%\n!PAYMENT_POLICY_TYPE_FEEDBACK_ONLY\x10\x04*\x84\x01\n\x11\x41ltitudeBandLabel\x12\x1d\n\x19\x41LTITUDE_BAND_UNSPECIFIED\x10\x00\x12\x1a\n\x16\x41LTITUDE_BAND_HIGHLAND\x10\x01\x12\x19\n\x15\x41LTITUDE_BAND_MIDLAND\x10\x02\x12\x19\n\x15\x41LTITUDE_BAND_LOWLAND\x10\x03*q\n\tFarmScale\x12\x1a\n\x16\x46\x41RM_SCALE_UNSPECIFIED\x10\x00\x12\x1a\n\x16\x46\x41RM_SCALE_SMALLHOLDER\x10\x01\x12\x15\n\x11\x46\x41RM_SCALE_MEDIUM\x10\x02\x12\x15\n\x11\x46\x41RM_SCALE_ESTATE\x10\x03*|\n\x13NotificationChannel\x12$\n NOTIFICATION_CHANNEL_UNSPECIFIED\x10\x00\x12\x1c\n\x18NOTIFICATION_CHANNEL_SMS\x10\x01\x12!\n\x1dNOTIFICATION_CHANNEL_WHATSAPP\x10\x02*\x82\x01\n\x15InteractionPreference\x12&\n\"INTERACTION_PREFERENCE_UNSPECIFIED\x10\x00\x12\x1f\n\x1bINTERACTION_PREFERENCE_TEXT\x10\x01\x12 \n\x1cINTERACTION_PREFERENCE_VOICE\x10\x02*\xa4\x01\n\x11PreferredLanguage\x12\"\n\x1ePREFERRED_LANGUAGE_UNSPECIFIED\x10\x00\x12\x19\n\x15PREFERRED_LANGUAGE_SW\x10\x01\x12\x19\n\x15PREFERRED_LANGUAGE_KI\x10\x02\x12\x1a\n\x16PREFERRED_LANGUAGE_LUO\x10\x03\x12\x19\n\x15PREFERRED_LANGUAGE_EN\x10\x04*|\n\x0bGradingType\x12\x1c\n\x18GRADING_TYPE_UNSPECIFIED\x10\x00\x12\x17\n\x13GRADING_TYPE_BINARY\x10\x01\x12\x18\n\x14GRADING_TYPE_TERNARY\x10\x02\x12\x1c\n\x18GRADING_TYPE_MULTI_LEVEL\x10\x03*\x8b\x01\n\x0eTrendDirection\x12\x1f\n\x1bTREND_DIRECTION_UNSPECIFIED\x10\x00\x12\x1d\n\x19TREND_DIRECTION_IMPROVING\x10\x01\x12\x1a\n\x16TREND_DIRECTION_STABLE\x10\x02\x12\x1d\n\x19TREND_DIRECTION_DECLINING\x10\x03*\x95\x01\n\x0bQualityTier\x12\x1c\n\x18QUALITY_TIER_UNSPECIFIED\x10\x00\x12\x17\n\x13QUALITY_TIER_TIER_1\x10\x01\x12\x17\n\x13QUALITY_TIER_TIER_2\x10\x02\x12\x17\n\x13QUALITY_TIER_TIER_3\x10\x03\x12\x1d\n\x19QUALITY_TIER_BELOW_TIER_3\x10\x04\x32\xbe!\n\x11PlantationService\x12]\n\tGetRegion\x12,.farmer_power.plantation.v1.GetRegionRequest\x1a\".farmer_power.plantation.v1.Region\x12n\n\x0bListRegions\x12..farmer_power.plantation.v1.ListRegionsRequest\x1a/.farmer_power.plantation.v1.ListRegionsResponse\x12\x63\n\x0c\x43reateRegion\x12/.farmer_power.plantation.v1.CreateRegionRequest\x1a\".farmer_power.plantation.v1.Region\x12\x63\n\x0cUpdateRegion\x12/.farmer_power.plantation.v1.UpdateRegionRequest\x1a\".farmer_power.plantation.v1.Region\x12}\n\x10GetRegionWeather\x12\x33.farmer_power.plantation.v1.GetRegionWeatherRequest\x1a\x34.farmer_power.plantation.v1.GetRegionWeatherResponse\x12z\n\x0fGetCurrentFlush\x12\x32.farmer_power.plantation.v1.GetCurrentFlushRequest\x1a\x33.farmer_power.plantation.v1.GetCurrentFlushResponse\x12`\n\nGetFactory\x12-.farmer_power.plantation.v1.GetFactoryRequest\x1a#.farmer_power.plantation.v1.Factory\x12t\n\rListFactories\x12\x30.farmer_power.plantation.v1.ListFactoriesRequest\x1a\x31.farmer_power.plantation.v1.ListFactoriesResponse\x12\x66\n\rCreateFactory\x12\x30.farmer_power.plantation.v1.CreateFactoryRequest\x1a#.farmer_power.plantation.v1.Factory\x12\x66\n\rUpdateFactory\x12\x30.farmer_power.plantation.v1.UpdateFactoryRequest\x1a#.farmer_power.plantation.v1.Factory\x12t\n\rDeleteFactory\x12\x30.farmer_power.plantation.v1.DeleteFactoryRequest\x1a\x31.farmer_power.plantation.v1.DeleteFactoryResponse\x12]\n\tGetFarmer\x12,.farmer_power.plantation.v1.GetFarmerRequest\x1a\".farmer_power.plantation.v1.Farmer\x12k\n\x10GetFarmerByPhone\x12\x33.farmer_power.plantation.v1.GetFarmerByPhoneRequest\x1a\".farmer_power.plantation.v1.Farmer\x12n\n\x0bListFarmers\x12..farmer_power.plantation.v1.ListFarmersRequest\x1a/.farmer_power.plantation.v1.ListFarmersResponse\x12\x63\n\x0c\x43reateFarmer\x12/.farmer_power.plantation.v1.CreateFarmerRequest\x1a\".farmer_power.plantation.v1.Farmer\x12\x63\n\x0cUpdateFarmer\x12/.farmer_power.plantation.v1.UpdateFarmerRequest\x1a\".farmer_power.plantation.v1.Farmer\x12x\n\rImportFarmers\x12\x30.farmer_power.plantation.v1.ImportFarmersRequest\x1a\x31.farmer_power.plantation.v1.ImportFarmersResponse(\x01\x30\x01\x12x\n\x12GetCollectionPoint\x12\x35.farmer_power.plantation.v1.GetCollectionPointRequest\x1a+.farmer_power.plantation.v1.CollectionPoint\x12\x89\x01\n\x14ListCollectionPoints\x12\x37.farmer_power.plantation.v1.ListCollectionPointsRequest\x1a\x38.farmer_power.plantation.v1.ListCollectionPointsResponse\x12~\n\x15\x43reateCollectionPoint\x12\x38.farmer_power.plantation.v1.CreateCollectionPointRequest\x1a+.farmer_power.plantation.v1.CollectionPoint\x12~\n\x15UpdateCollectionPoint\x12\x38.farmer_power.plantation.v1.UpdateCollectionPointRequest\x1a+.farmer_power.plantation.v1.CollectionPoint\x12\x8c\x01\n\x15\x44\x65leteCollectionPoint\x12\x38.farmer_power.plantation.v1.DeleteCollectionPointRequest\x1a\x39.farmer_power.plantation.v1.DeleteCollectionPointResponse\x12\x81\x01\n\x15GetPerformanceSummary\x12\x38.farmer_power.plantation.v1.GetPerformanceSummaryRequest\x1a..farmer_power.plantation.v1.PerformanceSummary\x12u\n\x12\x43reateGradingModel\x12\x35.farmer_power.plantation.v1.CreateGradingModelRequest\x1a(.farmer_power.plantation.v1.GradingModel\x12o\n\x0fGetGradingModel\x12\x32.farmer_power.plantation.v1.GetGradingModelRequest\x1a(.farmer_power.plantation.v1.GradingModel\x12}\n\x16GetFactoryGradingModel\x12\x39.farmer_power.plantation.v1.GetFactoryGradingModelRequest\x1a(.farmer_power.plantation.v1.GradingModel\x12\x80\x01\n\x11ListGradingModels\x12\x34.farmer_power.plantation.v1.ListGradingModelsRequest\x1a\x35.farmer_power.plantation.v1.ListGradingModelsResponse\x12\x87\x01\n\x1b\x41ssignGradingModelToFactory\x12>.farmer_power.plantation.v1.AssignGradingModelToFactoryRequest\x1a(.farmer_power.plantation.v1.GradingModel\x12r\n\x10GetFarmerSummary\x12\x33.farmer_power.plantation.v1.GetFarmerSummaryRequest\x1a).farmer_power.plantation.v1.FarmerSummary\x12\x83\x01\n\x12GetFarmerSummaries\x12\x35.farmer_power.plantation.v1.GetFarmerSummariesRequest\x1a\x36.farmer_power.plantation.v1.GetFarmerSummariesResponse\x12\xa7\x01\n\x1eUpdateCommunicationPreferences\x12\x41.farmer_power.plantation.v1.UpdateCommunicationPreferencesRequest\x1a\x42.farmer_power.plantation.v1.UpdateCommunicationPreferencesResponse\x12}\n\x1d\x41ssignFarmerToCollectionPoint\x12/.farmer_power.plantation.v1.AssignFarmerRequest\x1a+.farmer_power.plantation.v1.CollectionPoint\x12\x83\x01\n!UnassignFarmerFromCollectionPoint\x12\x31.farmer_power.plantation.v1.UnassignFarmerRequest\x1a+.farmer_power.plantation.v1.CollectionPoint\x12\x99\x01\n\x1cGetCollectionPointsForFarmer\x12?.farmer_power.plantation.v1.GetCollectionPointsForFarmerRequest\x1a\x38.farmer_power.plantation.v1.ListCollectionPointsResponse\x12\xa4\x01\n\x1dGetCollectionPointsForFarmers\x12@.farmer_power.plantation.v1.GetCollectionPointsForFarmersRequest\x1a\x41.farmer_power.plantation.v1.GetCollectionPointsForFarmersResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -60,22 +60,24 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_TODAYMETRICS_GRADECOUNTSENTRY']._serialized_options = b'8\001'
   _globals['_TODAYMETRICS_ATTRIBUTECOUNTSENTRY']._loaded_options = None
   _globals['_TODAYMETRICS_ATTRIBUTECOUNTSENTRY']._serialized_options = b'8\001'
-  _globals['_PAYMENTPOLICYTYPE']._serialized_start=15583
-  _globals['_PAYMENTPOLICYTYPE']._serialized_end=15796
-  _globals['_ALTITUDEBANDLABEL']._serialized_start=15799
-  _globals['_ALTITUDEBANDLABEL']._serialized_end=15931
-  _globals['_FARMSCALE']._serialized_start=15933
-  _globals['_FARMSCALE']._serialized_end=16046
-  _globals['_NOTIFICATIONCHANNEL']._serialized_start=16048
-  _globals['_NOTIFICATIONCHANNEL']._serialized_end=16172
-  _globals['_INTERACTIONPREFERENCE']._serialized_start=16175
-  _globals['_INTERACTIONPREFERENCE']._serialized_end=16305
-  _globals['_PREFERREDLANGUAGE']._serialized_start=16308
-  _globals['_PREFERREDLANGUAGE']._serialized_end=16472
-  _globals['_GRADINGTYPE']._serialized_start=16474
-  _globals['_GRADINGTYPE']._serialized_end=16598
-  _globals['_TRENDDIRECTION']._serialized_start=16601
-  _globals['_TRENDDIRECTION']._serialized_end=16740
+  _globals['_PAYMENTPOLICYTYPE']._serialized_start=16625
+  _globals['_PAYMENTPOLICYTYPE']._serialized_end=16838
+  _globals['_ALTITUDEBANDLABEL']._serialized_start=16841
+  _globals['_ALTITUDEBANDLABEL']._serialized_end=16973
+  _globals['_FARMSCALE']._serialized_start=16975
+  _globals['_FARMSCALE']._serialized_end=17088
+  _globals['_NOTIFICATIONCHANNEL']._serialized_start=17090
+  _globals['_NOTIFICATIONCHANNEL']._serialized_end=17214
+  _globals['_INTERACTIONPREFERENCE']._serialized_start=17217
+  _globals['_INTERACTIONPREFERENCE']._serialized_end=17347
+  _globals['_PREFERREDLANGUAGE']._serialized_start=17350
+  _globals['_PREFERREDLANGUAGE']._serialized_end=17514
+  _globals['_GRADINGTYPE']._serialized_start=17516
+  _globals['_GRADINGTYPE']._serialized_end=17640
+  _globals['_TRENDDIRECTION']._serialized_start=17643
+  _globals['_TRENDDIRECTION']._serialized_end=17782
+  _globals['_QUALITYTIER']._serialized_start=17785
+  _globals['_QUALITYTIER']._serialized_end=17934
   _globals['_GEOLOCATION']._serialized_start=95
   _globals['_GEOLOCATION']._serialized_end=170
   _globals['_CONTACTINFO']._serialized_start=172
@@ -172,88 +174,106 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_GETFARMERREQUEST']._serialized_end=8310
   _globals['_GETFARMERBYPHONEREQUEST']._serialized_start=8312
   _globals['_GETFARMERBYPHONEREQUEST']._serialized_end=8352
-  _globals['_LISTFARMERSREQUEST']._serialized_start=8354
-  _globals['_LISTFARMERSREQUEST']._serialized_end=8453
-  _globals['_LISTFARMERSRESPONSE']._serialized_start=8455
-  _globals['_LISTFARMERSRESPONSE']._serialized_end=8575
-  _globals['_CREATEFARMERREQUEST']._serialized_start=8578
-  _globals['_CREATEFARMERREQUEST']._serialized_end=8832
-  _globals['_UPDATEFARMERREQUEST']._serialized_start=8835
-  _globals['_UPDATEFARMERREQUEST']._serialized_end=9202
-  _globals['_PERFORMANCESUMMARY']._serialized_start=9205
-  _globals['_PERFORMANCESUMMARY']._serialized_end=9600
-  _globals['_GETPERFORMANCESUMMARYREQUEST']._serialized_start=9603
-  _globals['_GETPERFORMANCESUMMARYREQUEST']._serialized_end=9739
-  _globals['_GRADINGATTRIBUTE']._serialized_start=9741
-  _globals['_GRADINGATTRIBUTE']._serialized_end=9797
-  _globals['_CONDITIONALREJECT']._serialized_start=9799
-  _globals['_CONDITIONALREJECT']._serialized_end=9905
-  _globals['_GRADERULES']._serialized_start=9908
-  _globals['_GRADERULES']._serialized_end=10181
-  _globals['_GRADERULES_REJECTCONDITIONSENTRY']._serialized_start=10086
-  _globals['_GRADERULES_REJECTCONDITIONSENTRY']._serialized_end=10181
-  _globals['_STRINGLIST']._serialized_start=10183
-  _globals['_STRINGLIST']._serialized_end=10211
-  _globals['_GRADINGMODEL']._serialized_start=10214
-  _globals['_GRADINGMODEL']._serialized_end=10895
-  _globals['_GRADINGMODEL_ATTRIBUTESENTRY']._serialized_start=10748
-  _globals['_GRADINGMODEL_ATTRIBUTESENTRY']._serialized_end=10843
-  _globals['_GRADINGMODEL_GRADELABELSENTRY']._serialized_start=10845
-  _globals['_GRADINGMODEL_GRADELABELSENTRY']._serialized_end=10895
-  _globals['_GETGRADINGMODELREQUEST']._serialized_start=10897
-  _globals['_GETGRADINGMODELREQUEST']._serialized_end=10939
-  _globals['_GETFACTORYGRADINGMODELREQUEST']._serialized_start=10941
-  _globals['_GETFACTORYGRADINGMODELREQUEST']._serialized_end=10992
-  _globals['_CREATEGRADINGMODELREQUEST']._serialized_start=10995
-  _globals['_CREATEGRADINGMODELREQUEST']._serialized_end=11619
-  _globals['_CREATEGRADINGMODELREQUEST_ATTRIBUTESENTRY']._serialized_start=10748
-  _globals['_CREATEGRADINGMODELREQUEST_ATTRIBUTESENTRY']._serialized_end=10843
-  _globals['_CREATEGRADINGMODELREQUEST_GRADELABELSENTRY']._serialized_start=10845
-  _globals['_CREATEGRADINGMODELREQUEST_GRADELABELSENTRY']._serialized_end=10895
-  _globals['_ASSIGNGRADINGMODELTOFACTORYREQUEST']._serialized_start=11621
-  _globals['_ASSIGNGRADINGMODELTOFACTORYREQUEST']._serialized_end=11695
-  _globals['_LISTGRADINGMODELSREQUEST']._serialized_start=11698
-  _globals['_LISTGRADINGMODELSREQUEST']._serialized_end=11867
-  _globals['_LISTGRADINGMODELSRESPONSE']._serialized_start=11870
-  _globals['_LISTGRADINGMODELSRESPONSE']._serialized_end=12009
-  _globals['_DISTRIBUTIONCOUNTS']._serialized_start=12012
-  _globals['_DISTRIBUTIONCOUNTS']._serialized_end=12155
-  _globals['_DISTRIBUTIONCOUNTS_COUNTSENTRY']._serialized_start=12110
-  _globals['_DISTRIBUTIONCOUNTS_COUNTSENTRY']._serialized_end=12155
-  _globals['_HISTORICALMETRICS']._serialized_start=12158
-  _globals['_HISTORICALMETRICS']._serialized_end=13755
-  _globals['_HISTORICALMETRICS_GRADEDISTRIBUTION30DENTRY']._serialized_start=13230
-  _globals['_HISTORICALMETRICS_GRADEDISTRIBUTION30DENTRY']._serialized_end=13289
-  _globals['_HISTORICALMETRICS_GRADEDISTRIBUTION90DENTRY']._serialized_start=13291
-  _globals['_HISTORICALMETRICS_GRADEDISTRIBUTION90DENTRY']._serialized_end=13350
-  _globals['_HISTORICALMETRICS_GRADEDISTRIBUTIONYEARENTRY']._serialized_start=13352
-  _globals['_HISTORICALMETRICS_GRADEDISTRIBUTIONYEARENTRY']._serialized_end=13412
-  _globals['_HISTORICALMETRICS_ATTRIBUTEDISTRIBUTIONS30DENTRY']._serialized_start=13414
-  _globals['_HISTORICALMETRICS_ATTRIBUTEDISTRIBUTIONS30DENTRY']._serialized_end=13526
-  _globals['_HISTORICALMETRICS_ATTRIBUTEDISTRIBUTIONS90DENTRY']._serialized_start=13528
-  _globals['_HISTORICALMETRICS_ATTRIBUTEDISTRIBUTIONS90DENTRY']._serialized_end=13640
-  _globals['_HISTORICALMETRICS_ATTRIBUTEDISTRIBUTIONSYEARENTRY']._serialized_start=13642
-  _globals['_HISTORICALMETRICS_ATTRIBUTEDISTRIBUTIONSYEARENTRY']._serialized_end=13755
-  _globals['_TODAYMETRICS']._serialized_start=13758
-  _globals['_TODAYMETRICS']._serialized_end=14209
-  _globals['_TODAYMETRICS_GRADECOUNTSENTRY']._serialized_start=14055
-  _globals['_TODAYMETRICS_GRADECOUNTSENTRY']._serialized_end=14105
-  _globals['_TODAYMETRICS_ATTRIBUTECOUNTSENTRY']._serialized_start=14107
-  _globals['_TODAYMETRICS_ATTRIBUTECOUNTSENTRY']._serialized_end=14209
-  _globals['_FARMERSUMMARY']._serialized_start=14212
-  _globals['_FARMERSUMMARY']._serialized_end=14955
-  _globals['_GETFARMERSUMMARYREQUEST']._serialized_start=14957
-  _globals['_GETFARMERSUMMARYREQUEST']._serialized_end=15001
-  _globals['_UPDATECOMMUNICATIONPREFERENCESREQUEST']._serialized_start=15004
-  _globals['_UPDATECOMMUNICATIONPREFERENCESREQUEST']._serialized_end=15284
-  _globals['_UPDATECOMMUNICATIONPREFERENCESRESPONSE']._serialized_start=15286
-  _globals['_UPDATECOMMUNICATIONPREFERENCESRESPONSE']._serialized_end=15378
-  _globals['_ASSIGNFARMERREQUEST']._serialized_start=15380
-  _globals['_ASSIGNFARMERREQUEST']._serialized_end=15449
-  _globals['_UNASSIGNFARMERREQUEST']._serialized_start=15451
-  _globals['_UNASSIGNFARMERREQUEST']._serialized_end=15522
-  _globals['_GETCOLLECTIONPOINTSFORFARMERREQUEST']._serialized_start=15524
-  _globals['_GETCOLLECTIONPOINTSFORFARMERREQUEST']._serialized_end=15580
-  _globals['_PLANTATIONSERVICE']._serialized_start=16743
-  _globals['_PLANTATIONSERVICE']._serialized_end=20606
+  _globals['_LISTFARMERSREQUEST']._serialized_start=8355
+  _globals['_LISTFARMERSREQUEST']._serialized_end=8584
+  _globals['_LISTFARMERSRESPONSE']._serialized_start=8586
+  _globals['_LISTFARMERSRESPONSE']._serialized_end=8706
+  _globals['_CREATEFARMERREQUEST']._serialized_start=8709
+  _globals['_CREATEFARMERREQUEST']._serialized_end=8963
+  _globals['_UPDATEFARMERREQUEST']._serialized_start=8966
+  _globals['_UPDATEFARMERREQUEST']._serialized_end=9333
+  _globals['_IMPORTFARMERROW']._serialized_start=9335
+  _globals['_IMPORTFARMERROW']._serialized_end=9437
+  _globals['_IMPORTFARMERSREQUEST']._serialized_start=9439
+  _globals['_IMPORTFARMERSREQUEST']._serialized_end=9520
+  _globals['_IMPORTFARMERROWRESULT']._serialized_start=9522
+  _globals['_IMPORTFARMERROWRESULT']._serialized_end=9599
+  _globals['_IMPORTFARMERSRESPONSE']._serialized_start=9601
+  _globals['_IMPORTFARMERSRESPONSE']._serialized_end=9692
+  _globals['_PERFORMANCESUMMARY']._serialized_start=9695
+  _globals['_PERFORMANCESUMMARY']._serialized_end=10090
+  _globals['_GETPERFORMANCESUMMARYREQUEST']._serialized_start=10093
+  _globals['_GETPERFORMANCESUMMARYREQUEST']._serialized_end=10229
+  _globals['_GRADINGATTRIBUTE']._serialized_start=10231
+  _globals['_GRADINGATTRIBUTE']._serialized_end=10287
+  _globals['_CONDITIONALREJECT']._serialized_start=10289
+  _globals['_CONDITIONALREJECT']._serialized_end=10395
+  _globals['_GRADERULES']._serialized_start=10398
+  _globals['_GRADERULES']._serialized_end=10671
+  _globals['_GRADERULES_REJECTCONDITIONSENTRY']._serialized_start=10576
+  _globals['_GRADERULES_REJECTCONDITIONSENTRY']._serialized_end=10671
+  _globals['_STRINGLIST']._serialized_start=10673
+  _globals['_STRINGLIST']._serialized_end=10701
+  _globals['_GRADINGMODEL']._serialized_start=10704
+  _globals['_GRADINGMODEL']._serialized_end=11385
+  _globals['_GRADINGMODEL_ATTRIBUTESENTRY']._serialized_start=11238
+  _globals['_GRADINGMODEL_ATTRIBUTESENTRY']._serialized_end=11333
+  _globals['_GRADINGMODEL_GRADELABELSENTRY']._serialized_start=11335
+  _globals['_GRADINGMODEL_GRADELABELSENTRY']._serialized_end=11385
+  _globals['_GETGRADINGMODELREQUEST']._serialized_start=11387
+  _globals['_GETGRADINGMODELREQUEST']._serialized_end=11429
+  _globals['_GETFACTORYGRADINGMODELREQUEST']._serialized_start=11431
+  _globals['_GETFACTORYGRADINGMODELREQUEST']._serialized_end=11482
+  _globals['_CREATEGRADINGMODELREQUEST']._serialized_start=11485
+  _globals['_CREATEGRADINGMODELREQUEST']._serialized_end=12109
+  _globals['_CREATEGRADINGMODELREQUEST_ATTRIBUTESENTRY']._serialized_start=11238
+  _globals['_CREATEGRADINGMODELREQUEST_ATTRIBUTESENTRY']._serialized_end=11333
+  _globals['_CREATEGRADINGMODELREQUEST_GRADELABELSENTRY']._serialized_start=11335
+  _globals['_CREATEGRADINGMODELREQUEST_GRADELABELSENTRY']._serialized_end=11385
+  _globals['_ASSIGNGRADINGMODELTOFACTORYREQUEST']._serialized_start=12111
+  _globals['_ASSIGNGRADINGMODELTOFACTORYREQUEST']._serialized_end=12185
+  _globals['_LISTGRADINGMODELSREQUEST']._serialized_start=12188
+  _globals['_LISTGRADINGMODELSREQUEST']._serialized_end=12357
+  _globals['_LISTGRADINGMODELSRESPONSE']._serialized_start=12360
+  _globals['_LISTGRADINGMODELSRESPONSE']._serialized_end=12499
+  _globals['_DISTRIBUTIONCOUNTS']._serialized_start=12502
+  _globals['_DISTRIBUTIONCOUNTS']._serialized_end=12645
+  _globals['_DISTRIBUTIONCOUNTS_COUNTSENTRY']._serialized_start=12600
+  _globals['_DISTRIBUTIONCOUNTS_COUNTSENTRY']._serialized_end=12645
+  _globals['_HISTORICALMETRICS']._serialized_start=12648
+  _globals['_HISTORICALMETRICS']._serialized_end=14245
+  _globals['_HISTORICALMETRICS_GRADEDISTRIBUTION30DENTRY']._serialized_start=13720
+  _globals['_HISTORICALMETRICS_GRADEDISTRIBUTION30DENTRY']._serialized_end=13779
+  _globals['_HISTORICALMETRICS_GRADEDISTRIBUTION90DENTRY']._serialized_start=13781
+  _globals['_HISTORICALMETRICS_GRADEDISTRIBUTION90DENTRY']._serialized_end=13840
+  _globals['_HISTORICALMETRICS_GRADEDISTRIBUTIONYEARENTRY']._serialized_start=13842
+  _globals['_HISTORICALMETRICS_GRADEDISTRIBUTIONYEARENTRY']._serialized_end=13902
+  _globals['_HISTORICALMETRICS_ATTRIBUTEDISTRIBUTIONS30DENTRY']._serialized_start=13904
+  _globals['_HISTORICALMETRICS_ATTRIBUTEDISTRIBUTIONS30DENTRY']._serialized_end=14016
+  _globals['_HISTORICALMETRICS_ATTRIBUTEDISTRIBUTIONS90DENTRY']._serialized_start=14018
+  _globals['_HISTORICALMETRICS_ATTRIBUTEDISTRIBUTIONS90DENTRY']._serialized_end=14130
+  _globals['_HISTORICALMETRICS_ATTRIBUTEDISTRIBUTIONSYEARENTRY']._serialized_start=14132
+  _globals['_HISTORICALMETRICS_ATTRIBUTEDISTRIBUTIONSYEARENTRY']._serialized_end=14245
+  _globals['_TODAYMETRICS']._serialized_start=14248
+  _globals['_TODAYMETRICS']._serialized_end=14699
+  _globals['_TODAYMETRICS_GRADECOUNTSENTRY']._serialized_start=14545
+  _globals['_TODAYMETRICS_GRADECOUNTSENTRY']._serialized_end=14595
+  _globals['_TODAYMETRICS_ATTRIBUTECOUNTSENTRY']._serialized_start=14597
+  _globals['_TODAYMETRICS_ATTRIBUTECOUNTSENTRY']._serialized_end=14699
+  _globals['_FARMERSUMMARY']._serialized_start=14702
+  _globals['_FARMERSUMMARY']._serialized_end=15500
+  _globals['_GETFARMERSUMMARYREQUEST']._serialized_start=15502
+  _globals['_GETFARMERSUMMARYREQUEST']._serialized_end=15546
+  _globals['_GETFARMERSUMMARIESREQUEST']._serialized_start=15548
+  _globals['_GETFARMERSUMMARIESREQUEST']._serialized_end=15595
+  _globals['_GETFARMERSUMMARIESRESPONSE']._serialized_start=15597
+  _globals['_GETFARMERSUMMARIESRESPONSE']._serialized_end=15717
+  _globals['_UPDATECOMMUNICATIONPREFERENCESREQUEST']._serialized_start=15720
+  _globals['_UPDATECOMMUNICATIONPREFERENCESREQUEST']._serialized_end=16000
+  _globals['_UPDATECOMMUNICATIONPREFERENCESRESPONSE']._serialized_start=16002
+  _globals['_UPDATECOMMUNICATIONPREFERENCESRESPONSE']._serialized_end=16094
+  _globals['_ASSIGNFARMERREQUEST']._serialized_start=16096
+  _globals['_ASSIGNFARMERREQUEST']._serialized_end=16165
+  _globals['_UNASSIGNFARMERREQUEST']._serialized_start=16167
+  _globals['_UNASSIGNFARMERREQUEST']._serialized_end=16238
+  _globals['_GETCOLLECTIONPOINTSFORFARMERREQUEST']._serialized_start=16240
+  _globals['_GETCOLLECTIONPOINTSFORFARMERREQUEST']._serialized_end=16296
+  _globals['_GETCOLLECTIONPOINTSFORFARMERSREQUEST']._serialized_start=16298
+  _globals['_GETCOLLECTIONPOINTSFORFARMERSREQUEST']._serialized_end=16356
+  _globals['_FARMERCOLLECTIONPOINTIDS']._serialized_start=16358
+  _globals['_FARMERCOLLECTIONPOINTIDS']._serialized_end=16433
+  _globals['_GETCOLLECTIONPOINTSFORFARMERSRESPONSE']._serialized_start=16436
+  _globals['_GETCOLLECTIONPOINTSFORFARMERSRESPONSE']._serialized_end=16622
+  _globals['_PLANTATIONSERVICE']._serialized_start=17937
+  _globals['_PLANTATIONSERVICE']._serialized_end=22223
 # @@protoc_insertion_point(module_scope)
@@ -65,6 +65,14 @@ class TrendDirection(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
     TREND_DIRECTION_IMPROVING: _ClassVar[TrendDirection]
     TREND_DIRECTION_STABLE: _ClassVar[TrendDirection]
     TREND_DIRECTION_DECLINING: _ClassVar[TrendDirection]
+
+class QualityTier(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    QUALITY_TIER_UNSPECIFIED: _ClassVar[QualityTier]
+    QUALITY_TIER_TIER_1: _ClassVar[QualityTier]
+    QUALITY_TIER_TIER_2: _ClassVar[QualityTier]
+    QUALITY_TIER_TIER_3: _ClassVar[QualityTier]
+    QUALITY_TIER_BELOW_TIER_3: _ClassVar[QualityTier]
 PAYMENT_POLICY_TYPE_UNSPECIFIED: PaymentPolicyType
 PAYMENT_POLICY_TYPE_SPLIT_PAYMENT: PaymentPolicyType
 PAYMENT_POLICY_TYPE_WEEKLY_BONUS: PaymentPolicyType
@@ -97,6 +105,11 @@ TREND_DIRECTION_UNSPECIFIED: TrendDirection
 TREND_DIRECTION_IMPROVING: TrendDirection
 TREND_DIRECTION_STABLE: TrendDirection
 TREND_DIRECTION_DECLINING: TrendDirection
+QUALITY_TIER_UNSPECIFIED: QualityTier
+QUALITY_TIER_TIER_1: QualityTier
+QUALITY_TIER_TIER_2: QualityTier
+QUALITY_TIER_TIER_3: QualityTier
+QUALITY_TIER_BELOW_TIER_3: QualityTier
 
 class GeoLocation(_message.Message):
     __slots__ = ("latitude", "longitude", "altitude_meters")
@@ -711,16 +724,22 @@ class GetFarmerByPhoneRequest(_message.Message):
     def __init__(self, phone: _Optional[str] = ...) -> None: ...
 
 class ListFarmersRequest(_message.Message):
-    __slots__ = ("page_size", "page_token", "region_id", "active_only")
+    __slots__ = ("page_size", "page_token", "region_id", "active_only", "farm_scale", "search", "tier")
     PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
     PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     REGION_ID_FIELD_NUMBER: _ClassVar[int]
     ACTIVE_ONLY_FIELD_NUMBER: _ClassVar[int]
+    FARM_SCALE_FIELD_NUMBER: _ClassVar[int]
+    SEARCH_FIELD_NUMBER: _ClassVar[int]
+    TIER_FIELD_NUMBER: _ClassVar[int]
     page_size: int
     page_token: str
     region_id: str
     active_only: bool
-    def __init__(self, page_size: _Optional[int] = ..., page_token: _Optional[str] = ..., region_id: _Optional[str] = ..., active_only: bool = ...) -> None: ...
+    farm_scale: FarmScale
+    search: str
+    tier: QualityTier
+    def __init__(self, page_size: _Optional[int] = ..., page_token: _Optional[str] = ..., region_id: _Optional[str] = ..., active_only: bool = ..., farm_scale: _Optional[_Union[FarmScale, str]] = ..., search: _Optional[str] = ..., tier: _Optional[_Union[QualityTier, str]] = ...) -> None: ...
 
 class ListFarmersResponse(_message.Message):
     __slots__ = ("farmers", "next_page_token", "total_count")
@@ -768,6 +787,36 @@ class UpdateFarmerRequest(_message.Message):
     is_active: bool
     def __init__(self, id: _Optional[str] = ..., first_name: _Optional[str] = ..., last_name: _Optional[str] = ..., farm_location: _Optional[_Union[GeoLocation, _Mapping]] = ..., contact: _Optional[_Union[ContactInfo, _Mapping]] = ..., farm_size_hectares: _Optional[float] = ..., is_active: bool = ...) -> None: ...
 
+class ImportFarmerRow(_message.Message):
+    __slots__ = ("row_number", "farmer")
+    ROW_NUMBER_FIELD_NUMBER: _ClassVar[int]
+    FARMER_FIELD_NUMBER: _ClassVar[int]
+    row_number: int
+    farmer: CreateFarmerRequest
+    def __init__(self, row_number: _Optional[int] = ..., farmer: _Optional[_Union[CreateFarmerRequest, _Mapping]] = ...) -> None: ...
+
+class ImportFarmersRequest(_message.Message):
+    __slots__ = ("rows",)
+    ROWS_FIELD_NUMBER: _ClassVar[int]
+    rows: _containers.RepeatedCompositeFieldContainer[ImportFarmerRow]
+    def __init__(self, rows: _Optional[_Iterable[_Union[ImportFarmerRow, _Mapping]]] = ...) -> None: ...
+
+class ImportFarmerRowResult(_message.Message):
+    __slots__ = ("row_number", "farmer_id", "error")
+    ROW_NUMBER_FIELD_NUMBER: _ClassVar[int]
+    FARMER_ID_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    row_number: int
+    farmer_id: str
+    error: str
+    def __init__(self, row_number: _Optional[int] = ..., farmer_id: _Optional[str] = ..., error: _Optional[str] = ...) -> None: ...
+
+class ImportFarmersResponse(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[ImportFarmerRowResult]
+    def __init__(self, results: _Optional[_Iterable[_Union[ImportFarmerRowResult, _Mapping]]] = ...) -> None: ...
+
 class PerformanceSummary(_message.Message):
     __slots__ = ("id", "entity_type", "entity_id", "period", "period_start", "period_end", "total_green_leaf_kg", "total_made_tea_kg", "collection_count", "average_quality_score", "created_at", "updated_at")
     ID_FIELD_NUMBER: _ClassVar[int]
@@ -1097,7 +1146,7 @@ class TodayMetrics(_message.Message):
     def __init__(self, deliveries: _Optional[int] = ..., total_kg: _Optional[float] = ..., grade_counts: _Optional[_Mapping[str, int]] = ..., attribute_counts: _Optional[_Mapping[str, DistributionCounts]] = ..., last_delivery: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., metrics_date: _Optional[str] = ...) -> None: ...
 
 class FarmerSummary(_message.Message):
-    __slots__ = ("farmer_id", "first_name", "last_name", "phone", "farm_size_hectares", "farm_scale", "grading_model_id", "grading_model_version", "historical", "today", "trend_direction", "created_at", "updated_at", "notification_channel", "interaction_pref", "pref_lang")
+    __slots__ = ("farmer_id", "first_name", "last_name", "phone", "farm_size_hectares", "farm_scale", "grading_model_id", "grading_model_version", "historical", "today", "trend_direction", "created_at", "updated_at", "notification_channel", "interaction_pref", "pref_lang", "tier")
     FARMER_ID_FIELD_NUMBER: _ClassVar[int]
     FIRST_NAME_FIELD_NUMBER: _ClassVar[int]
     LAST_NAME_FIELD_NUMBER: _ClassVar[int]
@@ -1114,6 +1163,7 @@ class FarmerSummary(_message.Message):
     NOTIFICATION_CHANNEL_FIELD_NUMBER: _ClassVar[int]
     INTERACTION_PREF_FIELD_NUMBER: _ClassVar[int]
     PREF_LANG_FIELD_NUMBER: _ClassVar[int]
+    TIER_FIELD_NUMBER: _ClassVar[int]
     farmer_id: str
     first_name: str
     last_name: str
@@ -1130,7 +1180,8 @@ class FarmerSummary(_message.Message):
     notification_channel: NotificationChannel
     interaction_pref: InteractionPreference
     pref_lang: PreferredLanguage
-    def __init__(self, farmer_id: _Optional[str] = ..., first_name: _Optional[str] = ..., last_name: _Optional[str] = ..., phone: _Optional[str] = ..., farm_size_hectares: _Optional[float] = ..., farm_scale: _Optional[_Union[FarmScale, str]] = ..., grading_model_id: _Optional[str] = ..., grading_model_version: _Optional[str] = ..., historical: _Optional[_Union[HistoricalMetrics, _Mapping]] = ..., today: _Optional[_Union[TodayMetrics, _Mapping]] = ..., trend_direction: _Optional[_Union[TrendDirection, str]] = ..., created_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., updated_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., notification_channel: _Optional[_Union[NotificationChannel, str]] = ..., interaction_pref: _Optional[_Union[InteractionPreference, str]] = ..., pref_lang: _Optional[_Union[PreferredLanguage, str]] = ...) -> None: ...
+    tier: QualityTier
+    def __init__(self, farmer_id: _Optional[str] = ..., first_name: _Optional[str] = ..., last_name: _Optional[str] = ..., phone: _Optional[str] = ..., farm_size_hectares: _Optional[float] = ..., farm_scale: _Optional[_Union[FarmScale, str]] = ..., grading_model_id: _Optional[str] = ..., grading_model_version: _Optional[str] = ..., historical: _Optional[_Union[HistoricalMetrics, _Mapping]] = ..., today: _Optional[_Union[TodayMetrics, _Mapping]] = ..., trend_direction: _Optional[_Union[TrendDirection, str]] = ..., created_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., updated_at: _Optional[_Union[datetime.datetime, _timestamp_pb2.Timestamp, _Mapping]] = ..., notification_channel: _Optional[_Union[NotificationChannel, str]] = ..., interaction_pref: _Optional[_Union[InteractionPreference, str]] = ..., pref_lang: _Optional[_Union[PreferredLanguage, str]] = ..., tier: _Optional[_Union[QualityTier, str]] = ...) -> None: ...
 
 class GetFarmerSummaryRequest(_message.Message):
     __slots__ = ("farmer_id",)
@@ -1138,6 +1189,20 @@ class GetFarmerSummaryRequest(_message.Message):
     farmer_id: str
     def __init__(self, farmer_id: _Optional[str] = ...) -> None: ...
 
+class GetFarmerSummariesRequest(_message.Message):
+    __slots__ = ("farmer_ids",)
+    FARMER_IDS_FIELD_NUMBER: _ClassVar[int]
+    farmer_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, farmer_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class GetFarmerSummariesResponse(_message.Message):
+    __slots__ = ("summaries", "not_found_farmer_ids")
+    SUMMARIES_FIELD_NUMBER: _ClassVar[int]
+    NOT_FOUND_FARMER_IDS_FIELD_NUMBER: _ClassVar[int]
+    summaries: _containers.RepeatedCompositeFieldContainer[FarmerSummary]
+    not_found_farmer_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, summaries: _Optional[_Iterable[_Union[FarmerSummary, _Mapping]]] = ..., not_found_farmer_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
 class UpdateCommunicationPreferencesRequest(_message.Message):
     __slots__ = ("farmer_id", "notification_channel", "interaction_pref", "pref_lang")
     FARMER_ID_FIELD_NUMBER: _ClassVar[int]
@@ -1177,3 +1242,25 @@ class GetCollectionPointsForFarmerRequest(_message.Message):
     FARMER_ID_FIELD_NUMBER: _ClassVar[int]
     farmer_id: str
     def __init__(self, farmer_id: _Optional[str] = ...) -> None: ...
+
+class GetCollectionPointsForFarmersRequest(_message.Message):
+    __slots__ = ("farmer_ids",)
+    FARMER_IDS_FIELD_NUMBER: _ClassVar[int]
+    farmer_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, farmer_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class FarmerCollectionPointIds(_message.Message):
+    __slots__ = ("farmer_id", "collection_point_ids")
+    FARMER_ID_FIELD_NUMBER: _ClassVar[int]
+    COLLECTION_POINT_IDS_FIELD_NUMBER: _ClassVar[int]
+    farmer_id: str
+    collection_point_ids: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, farmer_id: _Optional[str] = ..., collection_point_ids: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class GetCollectionPointsForFarmersResponse(_message.Message):
+    __slots__ = ("collection_points", "memberships")
+    COLLECTION_POINTS_FIELD_NUMBER: _ClassVar[int]
+    MEMBERSHIPS_FIELD_NUMBER: _ClassVar[int]
+    collection_points: _containers.RepeatedCompositeFieldContainer[CollectionPoint]
+    memberships: _containers.RepeatedCompositeFieldContainer[FarmerCollectionPointIds]
+    def __init__(self, collection_points: _Optional[_Iterable[_Union[CollectionPoint, _Mapping]]] = ..., memberships: _Optional[_Iterable[_Union[FarmerCollectionPointIds, _Mapping]]] = ...) -> None: ...
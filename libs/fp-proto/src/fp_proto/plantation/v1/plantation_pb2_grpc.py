@@ -121,6 +121,11 @@ class PlantationServiceStub(object):
                 request_serializer=plantation_dot_v1_dot_plantation__pb2.UpdateFarmerRequest.SerializeToString,
                 response_deserializer=plantation_dot_v1_dot_plantation__pb2.Farmer.FromString,
                 _registered_method=True)
+        self.ImportFarmers = channel.stream_stream(
+                '/farmer_power.plantation.v1.PlantationService/ImportFarmers',
+                request_serializer=plantation_dot_v1_dot_plantation__pb2.ImportFarmersRequest.SerializeToString,
+                response_deserializer=plantation_dot_v1_dot_plantation__pb2.ImportFarmersResponse.FromString,
+                _registered_method=True)
         self.GetCollectionPoint = channel.unary_unary(
                 '/farmer_power.plantation.v1.PlantationService/GetCollectionPoint',
                 request_serializer=plantation_dot_v1_dot_plantation__pb2.GetCollectionPointRequest.SerializeToString,
@@ -181,6 +186,11 @@ class PlantationServiceStub(object):
                 request_serializer=plantation_dot_v1_dot_plantation__pb2.GetFarmerSummaryRequest.SerializeToString,
                 response_deserializer=plantation_dot_v1_dot_plantation__pb2.FarmerSummary.FromString,
                 _registered_method=True)
+        self.GetFarmerSummaries = channel.unary_unary(
+                '/farmer_power.plantation.v1.PlantationService/GetFarmerSummaries',
+                request_serializer=plantation_dot_v1_dot_plantation__pb2.GetFarmerSummariesRequest.SerializeToString,
+                response_deserializer=plantation_dot_v1_dot_plantation__pb2.GetFarmerSummariesResponse.FromString,
+                _registered_method=True)
         self.UpdateCommunicationPreferences = channel.unary_unary(
                 '/farmer_power.plantation.v1.PlantationService/UpdateCommunicationPreferences',
                 request_serializer=plantation_dot_v1_dot_plantation__pb2.UpdateCommunicationPreferencesRequest.SerializeToString,
@@ -201,6 +211,11 @@ class PlantationServiceStub(object):
                 request_serializer=plantation_dot_v1_dot_plantation__pb2.GetCollectionPointsForFarmerRequest.SerializeToString,
                 response_deserializer=plantation_dot_v1_dot_plantation__pb2.ListCollectionPointsResponse.FromString,
                 _registered_method=True)
+        self.GetCollectionPointsForFarmers = channel.unary_unary(
+                '/farmer_power.plantation.v1.PlantationService/GetCollectionPointsForFarmers',
+                request_serializer=plantation_dot_v1_dot_plantation__pb2.GetCollectionPointsForFarmersRequest.SerializeToString,
+                response_deserializer=plantation_dot_v1_dot_plantation__pb2.GetCollectionPointsForFarmersResponse.FromString,
+                _registered_method=True)
 
 
 class PlantationServiceServicer(object):
@@ -313,6 +328,14 @@ class PlantationServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ImportFarmers(self, request_iterator, context):
+        """Bulk import: the client streams row batches; each batch is answered with
+        per-row results (created farmer_id or error) once it has been written
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetCollectionPoint(self, request, context):
         """Collection Point operations
         """
@@ -390,6 +413,12 @@ class PlantationServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetFarmerSummaries(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def UpdateCommunicationPreferences(self, request, context):
         """Communication Preferences operations (Story 1.5)
         """
@@ -416,6 +445,12 @@ class PlantationServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetCollectionPointsForFarmers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_PlantationServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -499,6 +534,11 @@ def add_PlantationServiceServicer_to_server(servicer, server):
                     request_deserializer=plantation_dot_v1_dot_plantation__pb2.UpdateFarmerRequest.FromString,
                     response_serializer=plantation_dot_v1_dot_plantation__pb2.Farmer.SerializeToString,
             ),
+            'ImportFarmers': grpc.stream_stream_rpc_method_handler(
+                    servicer.ImportFarmers,
+                    request_deserializer=plantation_dot_v1_dot_plantation__pb2.ImportFarmersRequest.FromString,
+                    response_serializer=plantation_dot_v1_dot_plantation__pb2.ImportFarmersResponse.SerializeToString,
+            ),
             'GetCollectionPoint': grpc.unary_unary_rpc_method_handler(
                     servicer.GetCollectionPoint,
                     request_deserializer=plantation_dot_v1_dot_plantation__pb2.GetCollectionPointRequest.FromString,
@@ -559,6 +599,11 @@ def add_PlantationServiceServicer_to_server(servicer, server):
                     request_deserializer=plantation_dot_v1_dot_plantation__pb2.GetFarmerSummaryRequest.FromString,
                     response_serializer=plantation_dot_v1_dot_plantation__pb2.FarmerSummary.SerializeToString,
             ),
+            'GetFarmerSummaries': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetFarmerSummaries,
+                    request_deserializer=plantation_dot_v1_dot_plantation__pb2.GetFarmerSummariesRequest.FromString,
+                    response_serializer=plantation_dot_v1_dot_plantation__pb2.GetFarmerSummariesResponse.SerializeToString,
+            ),
             'UpdateCommunicationPreferences': grpc.unary_unary_rpc_method_handler(
                     servicer.UpdateCommunicationPreferences,
                     request_deserializer=plantation_dot_v1_dot_plantation__pb2.UpdateCommunicationPreferencesRequest.FromString,
@@ -579,6 +624,11 @@ def add_PlantationServiceServicer_to_server(servicer, server):
                     request_deserializer=plantation_dot_v1_dot_plantation__pb2.GetCollectionPointsForFarmerRequest.FromString,
                     response_serializer=plantation_dot_v1_dot_plantation__pb2.ListCollectionPointsResponse.SerializeToString,
             ),
+            'GetCollectionPointsForFarmers': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetCollectionPointsForFarmers,
+                    request_deserializer=plantation_dot_v1_dot_plantation__pb2.GetCollectionPointsForFarmersRequest.FromString,
+                    response_serializer=plantation_dot_v1_dot_plantation__pb2.GetCollectionPointsForFarmersResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'farmer_power.plantation.v1.PlantationService', rpc_method_handlers)
@@ -1029,6 +1079,33 @@ class PlantationService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ImportFarmers(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/farmer_power.plantation.v1.PlantationService/ImportFarmers',
+            plantation_dot_v1_dot_plantation__pb2.ImportFarmersRequest.SerializeToString,
+            plantation_dot_v1_dot_plantation__pb2.ImportFarmersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetCollectionPoint(request,
             target,
@@ -1353,6 +1430,33 @@ class PlantationService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetFarmerSummaries(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/farmer_power.plantation.v1.PlantationService/GetFarmerSummaries',
+            plantation_dot_v1_dot_plantation__pb2.GetFarmerSummariesRequest.SerializeToString,
+            plantation_dot_v1_dot_plantation__pb2.GetFarmerSummariesResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def UpdateCommunicationPreferences(request,
             target,
@@ -1460,3 +1564,30 @@ class PlantationService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetCollectionPointsForFarmers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/farmer_power.plantation.v1.PlantationService/GetCollectionPointsForFarmers',
+            plantation_dot_v1_dot_plantation__pb2.GetCollectionPointsForFarmersRequest.SerializeToString,
+            plantation_dot_v1_dot_plantation__pb2.GetCollectionPointsForFarmersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -2,6 +2,7 @@
 
 import base64
 import json
+from dataclasses import dataclass
 from typing import Any
 
 import grpc
@@ -63,6 +64,34 @@ def _serialize_result(result: Any) -> str:
     return json.dumps(result, default=str)
 
 
+@dataclass
+class BinaryResult:
+    """Tool result carrying a binary payload (e.g. image bytes).
+
+    Sent in ToolCallResponse.result_binary to callers that set accept_binary,
+    with only the metadata in result_json. Other callers get the payload
+    base64-encoded in result_json under base64_field.
+    """
+
+    metadata: dict[str, Any]
+    payload: bytes
+    base64_field: str
+
+    def to_response(self, accept_binary: bool) -> mcp_tool_pb2.ToolCallResponse:
+        """Build the success response for the caller's transport."""
+        if accept_binary:
+            return mcp_tool_pb2.ToolCallResponse(
+                success=True,
+                result_json=_serialize_result(self.metadata),
+                result_binary=self.payload,
+            )
+        encoded = base64.b64encode(self.payload).decode("utf-8")
+        return mcp_tool_pb2.ToolCallResponse(
+            success=True,
+            result_json=_serialize_result({**self.metadata, self.base64_field: encoded}),
+        )
+
+
 class McpToolServiceServicer(mcp_tool_pb2_grpc.McpToolServiceServicer):
     """MCP Tool Service implementation for Collection Model data.
 
@@ -206,6 +235,8 @@ class McpToolServiceServicer(mcp_tool_pb2_grpc.McpToolServiceServicer):
                 span.set_attribute("mcp.success", True)
                 logger.info("Tool call succeeded", tool_name=request.tool_name)
 
+                if isinstance(result, BinaryResult):
+                    return result.to_response(request.accept_binary)
                 return mcp_tool_pb2.ToolCallResponse(
                     success=True,
                     result_json=_serialize_result(result),
@@ -239,7 +270,7 @@ class McpToolServiceServicer(mcp_tool_pb2_grpc.McpToolServiceServicer):
                 )
 
     # =========================================================================
-    # Tool Handlers - Return Pydantic models or dicts
+    # Tool Handlers - Return Pydantic models, dicts or BinaryResult
     # Serialization to JSON happens at the boundary (_serialize_result)
     # =========================================================================
 
@@ -372,14 +403,14 @@ class McpToolServiceServicer(mcp_tool_pb2_grpc.McpToolServiceServicer):
             "enabled_only": enabled_only,
         }
 
-    async def _handle_get_document_thumbnail(self, arguments: dict[str, Any]) -> dict[str, Any]:
+    async def _handle_get_document_thumbnail(self, arguments: dict[str, Any]) -> BinaryResult:
         """Handle get_document_thumbnail tool call (Story 2.13).
 
         Args:
             arguments: Tool arguments with document_id.
 
         Returns:
-            Dict with base64-encoded thumbnail image and metadata.
+            BinaryResult with the thumbnail bytes and metadata.
 
         Raises:
             DocumentNotFoundError: If document doesn't exist.
@@ -434,23 +465,23 @@ class McpToolServiceServicer(mcp_tool_pb2_grpc.McpToolServiceServicer):
             )
             raise DocumentNotFoundError(f"{document_id} (thumbnail blob not found)")
 
-        # Encode as base64 for JSON transport
-        thumbnail_base64 = base64.b64encode(thumbnail_bytes).decode("utf-8")
-
         logger.info(
             "Thumbnail retrieved",
             document_id=document_id,
             size_bytes=len(thumbnail_bytes),
         )
 
-        return {
-            "document_id": document_id,
-            "thumbnail_base64": thumbnail_base64,
-            "content_type": "image/jpeg",
-            "size_bytes": len(thumbnail_bytes),
-        }
+        return BinaryResult(
+            metadata={
+                "document_id": document_id,
+                "content_type": "image/jpeg",
+                "size_bytes": len(thumbnail_bytes),
+            },
+            payload=thumbnail_bytes,
+            base64_field="thumbnail_base64",
+        )
 
-    async def _handle_get_document_image(self, arguments: dict[str, Any]) -> dict[str, Any]:
+    async def _handle_get_document_image(self, arguments: dict[str, Any]) -> BinaryResult:
         """Handle get_document_image tool call (Story 0.75.22).
 
         Fetches the original image bytes for a document. Used for Tier 2 diagnosis
@@ -460,7 +491,7 @@ class McpToolServiceServicer(mcp_tool_pb2_grpc.McpToolServiceServicer):
             arguments: Tool arguments with document_id.
 
         Returns:
-            Dict with base64-encoded image and metadata.
+            BinaryResult with the image bytes and metadata.
 
         Raises:
             DocumentNotFoundError: If document doesn't exist or has no image.
@@ -502,9 +533,6 @@ class McpToolServiceServicer(mcp_tool_pb2_grpc.McpToolServiceServicer):
             )
             raise DocumentNotFoundError(f"{document_id} (image blob not found)")
 
-        # Encode as base64 for JSON transport
-        image_base64 = base64.b64encode(image_bytes).decode("utf-8")
-
         # Determine content type from blob path extension or default to jpeg
         content_type = "image/jpeg"
         if blob_path.lower().endswith(".png"):
@@ -521,9 +549,12 @@ class McpToolServiceServicer(mcp_tool_pb2_grpc.McpToolServiceServicer):
             content_type=content_type,
         )
 
-        return {
-            "document_id": document_id,
-            "image_base64": image_base64,
-            "content_type": content_type,
-            "size_bytes": len(image_bytes),
-        }
+        return BinaryResult(
+            metadata={
+                "document_id": document_id,
+                "content_type": content_type,
+                "size_bytes": len(image_bytes),
+            },
+            payload=image_bytes,
+            base64_field="image_base64",
+        )
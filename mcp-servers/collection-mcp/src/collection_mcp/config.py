@@ -21,6 +21,8 @@ class Settings(BaseSettings):
     azure_storage_account_name: str = ""
     azure_storage_account_key: str = ""
     sas_token_validity_hours: int = 1
+    # LRU cache of downloaded thumbnails/images, validated by ETag (0 disables)
+    blob_cache_max_bytes: int = 64 * 1024 * 1024
 
     # OpenTelemetry
     otel_service_name: str = "collection-mcp"
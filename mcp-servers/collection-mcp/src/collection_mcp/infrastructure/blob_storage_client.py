@@ -1,13 +1,26 @@
 """Azure Blob Storage client for downloading blobs.
 
 Story 2.13: Thumbnail Generation for AI Tiered Vision Processing
+
+Tiered-Vision fetches the same thumbnails and originals repeatedly (retries,
+re-analysis, Tier 1 then Tier 2), so downloaded bytes are kept in a bounded
+in-process LRU keyed by blob path and ETag. Every download still checks the
+blob's current ETag (one properties request, which replaces the previous
+existence check), so a replaced blob is never served from the cache; only the
+payload transfer is saved.
 """
 
+from collections import OrderedDict
+
 import structlog
+from azure.core.exceptions import ResourceNotFoundError
 from azure.storage.blob.aio import BlobServiceClient
 
 logger = structlog.get_logger(__name__)
 
+# Default cache budget (total bytes of cached blobs)
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
 
 class BlobNotFoundError(Exception):
     """Raised when a blob is not found."""
@@ -19,16 +32,40 @@ class BlobNotFoundError(Exception):
 
 
 class BlobStorageClient:
-    """Async client for Azure Blob Storage operations."""
-
-    def __init__(self, connection_string: str) -> None:
+    """Async client for Azure Blob Storage operations.
+
+    Attributes:
+        cache_max_bytes: Total size of cached blobs (0 disables the cache).
+        cache_max_entry_bytes: Blobs larger than this are never cached.
+        cache_hits: Downloads served from the cache.
+        cache_misses: Downloads that transferred the blob.
+    """
+
+    def __init__(
+        self,
+        connection_string: str,
+        cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        cache_max_entry_bytes: int | None = None,
+    ) -> None:
         """Initialize the blob storage client.
 
         Args:
             connection_string: Azure Storage connection string.
+            cache_max_bytes: Byte budget of the LRU cache (0 disables it).
+            cache_max_entry_bytes: Largest blob kept in the cache
+                (default: a quarter of cache_max_bytes).
         """
         self._connection_string = connection_string
         self._client: BlobServiceClient | None = None
+        self.cache_max_bytes = cache_max_bytes
+        self.cache_max_entry_bytes = (
+            cache_max_entry_bytes if cache_max_entry_bytes is not None else cache_max_bytes // 4
+        )
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # (container, blob_path) -> (etag, content), least recently used first
+        self._cache: OrderedDict[tuple[str, str], tuple[str, bytes]] = OrderedDict()
+        self._cache_bytes = 0
 
     async def _get_client(self) -> BlobServiceClient:
         """Get or create the blob service client."""
@@ -39,6 +76,9 @@ class BlobStorageClient:
     async def download_blob(self, container: str, blob_path: str) -> bytes:
         """Download a blob's content as bytes.
 
+        Served from the cache when the cached copy still has the blob's
+        current ETag.
+
         Args:
             container: The container name.
             blob_path: The blob path within the container.
@@ -53,11 +93,28 @@ class BlobStorageClient:
             client = await self._get_client()
             blob_client = client.get_blob_client(container=container, blob=blob_path)
 
-            if not await blob_client.exists():
-                raise BlobNotFoundError(container, blob_path)
-
+            try:
+                properties = await blob_client.get_blob_properties()
+            except ResourceNotFoundError:
+                raise BlobNotFoundError(container, blob_path) from None
+
+            etag = properties.etag
+            cached = self._cache_get(container, blob_path, etag)
+            if cached is not None:
+                self.cache_hits += 1
+                logger.debug(
+                    "Blob served from cache",
+                    container=container,
+                    blob_path=blob_path,
+                    size_bytes=len(cached),
+                )
+                return cached
+
+            self.cache_misses += 1
             stream = await blob_client.download_blob()
             content = await stream.readall()
+            # The blob may have been replaced since the properties request
+            self._cache_put(container, blob_path, stream.properties.etag or etag, content)
 
             logger.debug(
                 "Blob downloaded successfully",
@@ -78,6 +135,36 @@ class BlobStorageClient:
             )
             raise
 
+    def _cache_get(self, container: str, blob_path: str, etag: str) -> bytes | None:
+        """Cached content of a blob if its ETag is still current."""
+        key = (container, blob_path)
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        cached_etag, content = entry
+        if cached_etag != etag:
+            # Blob was overwritten: the cached copy is stale
+            self._cache_evict(key)
+            return None
+        self._cache.move_to_end(key)
+        return content
+
+    def _cache_put(self, container: str, blob_path: str, etag: str, content: bytes) -> None:
+        """Cache a downloaded blob, evicting least recently used blobs to fit."""
+        if len(content) > self.cache_max_entry_bytes or len(content) > self.cache_max_bytes:
+            return
+        key = (container, blob_path)
+        self._cache_evict(key)
+        while self._cache and self._cache_bytes + len(content) > self.cache_max_bytes:
+            self._cache_evict(next(iter(self._cache)))
+        self._cache[key] = (etag, content)
+        self._cache_bytes += len(content)
+
+    def _cache_evict(self, key: tuple[str, str]) -> None:
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._cache_bytes -= len(entry[1])
+
     async def close(self) -> None:
         """Close the blob service client."""
         if self._client:
@@ -1,5 +1,15 @@
-"""MongoDB document client for querying the documents collection."""
-
+"""MongoDB document client for querying the documents collection.
+
+search_documents runs a $text query against the text index that
+collection-model maintains from each source's storage.search_fields
+(weighted per field), ranked by textScore. Farmer and source filters are
+combined with the text query as separate clauses. collection-model creates
+the index (covering document_id at least) for every collection it writes,
+so the escaped document_id regex fallback only serves collections it has
+not written yet, or the moment an index is being replaced.
+"""
+
+import re
 from datetime import datetime
 from typing import Any
 
@@ -7,9 +17,32 @@ import structlog
 from fp_common.converters import document_from_dict, search_result_from_dict
 from fp_common.models import Document, SearchResult
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo.errors import OperationFailure
 
 logger = structlog.get_logger(__name__)
 
+# MongoDB error code when $text is used on a collection without a text index
+INDEX_NOT_FOUND_CODE = 27
+
+# Search terms: word characters only, so user input cannot form $text
+# operators (leading "-" negation, quoted phrases)
+SEARCH_TERM_PATTERN = re.compile(r"\w+")
+
+
+def _search_terms(query_text: str) -> list[str]:
+    """Split a search query into plain terms."""
+    return SEARCH_TERM_PATTERN.findall(query_text.lower())
+
+
+def _farmer_clause(farmer_id: str) -> dict[str, Any]:
+    """Match farmer_id in either linkage_fields or extracted_fields."""
+    return {
+        "$or": [
+            {"linkage_fields.farmer_id": farmer_id},
+            {"extracted_fields.farmer_id": farmer_id},
+        ]
+    }
+
 
 class DocumentNotFoundError(Exception):
     """Raised when a document is not found."""
@@ -90,10 +123,7 @@ class DocumentClient:
 
         if farmer_id:
             # Check both linkage_fields and extracted_fields for farmer_id
-            query["$or"] = [
-                {"linkage_fields.farmer_id": farmer_id},
-                {"extracted_fields.farmer_id": farmer_id},
-            ]
+            query.update(_farmer_clause(farmer_id))
 
         if linkage:
             for key, value in linkage.items():
@@ -222,12 +252,7 @@ class DocumentClient:
             List of Document Pydantic models sorted by created_at descending.
         """
         # Check both linkage_fields and extracted_fields for farmer_id
-        query: dict[str, Any] = {
-            "$or": [
-                {"linkage_fields.farmer_id": farmer_id},
-                {"extracted_fields.farmer_id": farmer_id},
-            ]
-        }
+        query: dict[str, Any] = _farmer_clause(farmer_id)
 
         if source_ids:
             query["ingestion.source_id"] = {"$in": source_ids}
@@ -273,7 +298,8 @@ class DocumentClient:
     ) -> list[SearchResult]:
         """Full-text search across documents.
 
-        Uses MongoDB text index if available, otherwise falls back to regex search.
+        Ranked by MongoDB textScore over the weighted search fields. Falls back
+        to a document_id regex only when the collection has no text index.
 
         Args:
             query_text: The search query
@@ -287,61 +313,67 @@ class DocumentClient:
         # Enforce maximum limit
         limit = min(limit, 100)
 
-        # Build base filter using correct field paths from DocumentIndex schema
-        filter_query: dict[str, Any] = {}
+        terms = _search_terms(query_text)
+        if not terms:
+            return []
+
+        # Filters are separate clauses: the farmer $or must not be merged
+        # (and overwritten) with any other $or in the query
+        filters: list[dict[str, Any]] = []
         if source_ids:
-            filter_query["ingestion.source_id"] = {"$in": source_ids}
+            filters.append({"ingestion.source_id": {"$in": source_ids}})
         if farmer_id:
-            filter_query["$or"] = [
-                {"linkage_fields.farmer_id": farmer_id},
-                {"extracted_fields.farmer_id": farmer_id},
-            ]
+            filters.append(_farmer_clause(farmer_id))
 
         logger.debug(
             "Searching documents",
             query=query_text,
+            terms=terms,
             source_ids=source_ids,
             farmer_id=farmer_id,
             limit=limit,
         )
 
-        # Try text search first (requires text index)
+        text_query: dict[str, Any] = {"$text": {"$search": " ".join(terms)}}
+        if filters:
+            text_query["$and"] = filters
         try:
-            text_query = {"$text": {"$search": query_text}, **filter_query}
             cursor = (
                 self._default_collection.find(text_query, {"score": {"$meta": "textScore"}})
-                .sort([("score", {"$meta": "textScore"})])
+                .sort([("score", {"$meta": "textScore"}), ("created_at", -1)])
                 .limit(limit)
             )
             raw_documents = await cursor.to_list(length=limit)
-
-            if raw_documents:
-                # Convert to SearchResult models with relevance score
-                results = []
-                for doc in raw_documents:
-                    doc["relevance_score"] = doc.pop("score", 1.0)
-                    results.append(search_result_from_dict(doc))
-
-                logger.info(
-                    "Text search completed",
-                    query=query_text,
-                    count=len(results),
-                )
-                return results
-        except Exception as e:
-            logger.debug(
-                "Text search failed, falling back to regex",
-                error=str(e),
+        except OperationFailure as e:
+            if e.code != INDEX_NOT_FOUND_CODE:
+                raise
+            logger.warning(
+                "No text index on documents collection, falling back to document_id regex",
+                collection=self._default_collection.name,
             )
+            return await self._regex_search(query_text, filters, limit)
 
-        # Fallback to regex search on common fields using correct schema paths
-        regex_pattern = {"$regex": query_text, "$options": "i"}
-        regex_query = {
-            "$or": [
-                {"extracted_fields": regex_pattern},
-                {"document_id": regex_pattern},
-            ],
-            **filter_query,
+        results = []
+        for doc in raw_documents:
+            doc["relevance_score"] = doc.pop("score", 1.0)
+            results.append(search_result_from_dict(doc))
+
+        logger.info(
+            "Text search completed",
+            query=query_text,
+            count=len(results),
+        )
+        return results
+
+    async def _regex_search(
+        self,
+        query_text: str,
+        filters: list[dict[str, Any]],
+        limit: int,
+    ) -> list[SearchResult]:
+        """Match the literal query in document_id (collections without a text index)."""
+        regex_query: dict[str, Any] = {
+            "$and": [*filters, {"document_id": {"$regex": re.escape(query_text), "$options": "i"}}],
         }
 
         cursor = self._default_collection.find(regex_query).limit(limit)
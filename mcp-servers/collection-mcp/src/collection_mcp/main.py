@@ -77,6 +77,7 @@ async def serve() -> None:
     if settings.azure_storage_connection_string:
         blob_storage_client = BlobStorageClient(
             connection_string=settings.azure_storage_connection_string,
+            cache_max_bytes=settings.blob_cache_max_bytes,
         )
 
     # Add MCP Tool Service
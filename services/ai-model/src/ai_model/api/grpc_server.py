@@ -165,7 +165,27 @@ class GrpcServer:
             from ai_model.services.embedding_service import EmbeddingService
             from ai_model.services.vectorization_pipeline import VectorizationPipeline
 
-            embedding_service = EmbeddingService(settings=settings)
+            embedding_cache = None
+            if settings.embedding_cache_enabled:
+                from ai_model.infrastructure.repositories import EmbeddingCacheRepository
+                from ai_model.services.embedding_cache import EmbeddingCache
+
+                embedding_cache_repository = EmbeddingCacheRepository(
+                    db=db,
+                    ttl_days=settings.embedding_cache_ttl_days,
+                )
+                await embedding_cache_repository.ensure_indexes()
+                embedding_cache = EmbeddingCache(
+                    repository=embedding_cache_repository,
+                    lru_size=settings.embedding_cache_lru_size,
+                )
+                logger.info(
+                    "EmbeddingCache initialized",
+                    lru_size=settings.embedding_cache_lru_size,
+                    ttl_days=settings.embedding_cache_ttl_days,
+                )
+
+            embedding_service = EmbeddingService(settings=settings, cache=embedding_cache)
             vector_store = PineconeVectorStore(settings=settings)
 
             # Story 0.75.13d: Add job_repository for persistent job tracking
@@ -209,6 +229,8 @@ class GrpcServer:
                 embedding_service=embedding_service,
                 vector_store=vector_store,
                 chunk_repository=rag_chunk_repository,
+                chunk_cache_size=settings.retrieval_chunk_cache_size,
+                chunk_cache_ttl_seconds=settings.retrieval_chunk_cache_ttl_seconds,
             )
             logger.info("RetrievalService initialized for RAGDocumentService")
         else:
@@ -4,6 +4,8 @@ Story 0.75.5: Added LLM Gateway configuration.
 Story 13.7: Added unified_cost_topic and embedding_cost_per_1k_tokens for DAPR cost publishing (ADR-016).
 """
 
+from typing import Literal
+
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -90,6 +92,12 @@ class Settings(BaseSettings):
     # Rate limiting (per minute)
     llm_rate_limit_rpm: int = 60  # Requests per minute
     llm_rate_limit_tpm: int = 100000  # Tokens per minute
+    # "memory": limits apply per replica; "mongodb": shared by all replicas
+    llm_rate_limit_backend: Literal["memory", "mongodb"] = "memory"
+    llm_rate_limit_collection: str = "llm_rate_limits"
+    # Additional (rpm, tpm) limits, e.g. {"openai/gpt-4o": [30, 50000]}
+    llm_rate_limit_models: dict[str, tuple[int, int]] = {}
+    llm_rate_limit_agent_types: dict[str, tuple[int, int]] = {}
 
     # ========================================
     # Cost Publishing Configuration (Story 13.7 - ADR-016)
@@ -122,6 +130,11 @@ class Settings(BaseSettings):
     # After this duration, tools are re-discovered from MCP servers
     mcp_tool_cache_ttl_seconds: int = 300  # 5 minutes
 
+    # Read-through cache for idempotent MCP tool results (TTL per tool category)
+    mcp_result_cache_enabled: bool = True
+    mcp_result_cache_max_entries: int = 1024
+    mcp_result_cache_max_bytes: int = 64 * 1024 * 1024  # 64 MB
+
     # ========================================
     # Azure Blob Storage Configuration (Story 0.75.10b)
     # ========================================
@@ -233,6 +246,15 @@ class Settings(BaseSettings):
     # Uses exponential backoff (1s min, 10s max) with tenacity
     embedding_retry_max_attempts: int = 3
 
+    # Content-addressed embedding cache (MongoDB, optional in-process LRU)
+    # Texts already embedded with the same model and input type are not
+    # sent to Pinecone again
+    embedding_cache_enabled: bool = True
+    # In-process LRU entries (0 disables the tier); ~10 KB per 1024-dim embedding
+    embedding_cache_lru_size: int = 512
+    # Cached embeddings expire after this many days (0 = never)
+    embedding_cache_ttl_days: int = 90
+
     # ========================================
     # Vectorization Pipeline Configuration (Story 0.75.13b)
     # ========================================
@@ -241,6 +263,10 @@ class Settings(BaseSettings):
     # Balances memory usage with throughput
     vectorization_batch_size: int = 50
 
+    # Embedded batches queued ahead of the store stage (upsert + chunk updates)
+    # Embedding of the next batch overlaps storage of the current one
+    vectorization_pipeline_depth: int = 2
+
     # ========================================
     # Vectorization Job Persistence Configuration (Story 0.75.13d)
     # ========================================
@@ -250,6 +276,17 @@ class Settings(BaseSettings):
     # after this many hours from completion. Set to 0 to disable TTL.
     vectorization_job_ttl_hours: int = 24
 
+    # ========================================
+    # Retrieval Configuration
+    # ========================================
+
+    # Max chunks kept in the in-process LRU of hydrated RAG chunks
+    # Set to 0 to disable (every query reads chunks from MongoDB)
+    retrieval_chunk_cache_size: int = 2048
+
+    # TTL for cached chunks (seconds), bounds staleness after re-chunking
+    retrieval_chunk_cache_ttl_seconds: float = 300.0
+
     # ========================================
     # LangGraph Workflow Configuration (Story 0.75.16)
     # ========================================
@@ -4,6 +4,7 @@ This module defines Pydantic models for embedding operations:
 - EmbeddingInputType: Enum for passage vs query input types
 - EmbeddingRequest: Request model for batch embedding
 - EmbeddingResult: Response model with embeddings and usage stats
+- CachedEmbedding: Embedding stored in the content-addressed embedding cache
 
 Story 0.75.12: RAG Embedding Configuration (Pinecone Inference)
 Story 13.7: Removed EmbeddingCostEvent - cost tracking now via DAPR to platform-cost (ADR-016)
@@ -71,6 +72,8 @@ class EmbeddingUsage(BaseModel):
 
     Attributes:
         total_tokens: Total tokens processed across all texts.
+        cached_count: Texts served from the embedding cache.
+        tokens_saved: Tokens the cached texts cost when they were embedded.
     """
 
     total_tokens: int = Field(
@@ -78,6 +81,16 @@ class EmbeddingUsage(BaseModel):
         ge=0,
         description="Total tokens processed",
     )
+    cached_count: int = Field(
+        default=0,
+        ge=0,
+        description="Texts served from the embedding cache (not sent to Pinecone)",
+    )
+    tokens_saved: int = Field(
+        default=0,
+        ge=0,
+        description="Tokens the cached texts cost when they were embedded",
+    )
 
 
 class EmbeddingResult(BaseModel):
@@ -116,3 +129,22 @@ class EmbeddingResult(BaseModel):
     def count(self) -> int:
         """Return number of embeddings in result."""
         return len(self.embeddings)
+
+
+class CachedEmbedding(BaseModel):
+    """Embedding stored in the content-addressed embedding cache.
+
+    Attributes:
+        values: The embedding vector.
+        tokens: Tokens the text cost when it was embedded (share of its batch).
+    """
+
+    values: list[float] = Field(
+        ...,
+        description="Embedding vector",
+    )
+    tokens: int = Field(
+        default=0,
+        ge=0,
+        description="Tokens the text cost when it was embedded",
+    )
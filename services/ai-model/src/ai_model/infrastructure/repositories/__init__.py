@@ -6,6 +6,7 @@ Story 0.75.9: Added RagDocumentRepository.
 Story 0.75.10b: Added ExtractionJobRepository.
 Story 0.75.10d: Added RagChunkRepository.
 Story 0.75.13d: Added VectorizationJobRepository.
+Story 0.75.12: Added EmbeddingCacheRepository.
 Story 13.7: Removed LlmCostEventRepository, EmbeddingCostEventRepository - costs now via DAPR (ADR-016)
 """
 
@@ -13,6 +14,9 @@ from ai_model.infrastructure.repositories.agent_config_repository import (
     AgentConfigRepository,
 )
 from ai_model.infrastructure.repositories.base import BaseRepository
+from ai_model.infrastructure.repositories.embedding_cache_repository import (
+    EmbeddingCacheRepository,
+)
 from ai_model.infrastructure.repositories.extraction_job_repository import (
     ExtractionJobRepository,
 )
@@ -31,6 +35,7 @@ from ai_model.infrastructure.repositories.vectorization_job_repository import (
 __all__ = [
     "AgentConfigRepository",
     "BaseRepository",
+    "EmbeddingCacheRepository",
     "ExtractionJobRepository",
     "MongoDBVectorizationJobRepository",
     "PromptRepository",
@@ -0,0 +1,108 @@
+"""Embedding cache repository for MongoDB persistence.
+
+This module provides the EmbeddingCacheRepository class storing embeddings
+in the ai_model.embedding_cache collection, keyed by a hash of
+(embedding model, input type, normalized text).
+
+Story 0.75.12: RAG Embedding Configuration (Pinecone Inference)
+"""
+
+from datetime import UTC, datetime
+
+import structlog
+from ai_model.domain.embedding import CachedEmbedding
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+
+logger = structlog.get_logger(__name__)
+
+
+class EmbeddingCacheRepository:
+    """Repository for cached embeddings.
+
+    Documents use the cache key as _id, so lookups and writes need no
+    secondary index. Entries are immutable: an embedding depends only on
+    its key, so writes never overwrite an existing entry.
+    """
+
+    COLLECTION_NAME = "embedding_cache"
+
+    def __init__(self, db: AsyncIOMotorDatabase, ttl_days: int = 90) -> None:
+        """Initialize the repository.
+
+        Args:
+            db: MongoDB database instance (should be ai_model database).
+            ttl_days: Days after creation to automatically delete entries.
+                      Set to 0 to keep entries forever.
+        """
+        self._collection = db[self.COLLECTION_NAME]
+        self._ttl_days = ttl_days
+
+    async def ensure_indexes(self) -> None:
+        """Create indexes for the embedding_cache collection.
+
+        Indexes:
+        - created_at: TTL index bounding the cache size (if ttl_days > 0)
+        """
+        if self._ttl_days > 0:
+            await self._collection.create_index(
+                "created_at",
+                expireAfterSeconds=self._ttl_days * 86400,
+                name="idx_created_at_ttl",
+            )
+        logger.info("Embedding cache indexes created", ttl_days=self._ttl_days)
+
+    async def get_many(self, keys: list[str]) -> dict[str, CachedEmbedding]:
+        """Get cached embeddings in one read.
+
+        Args:
+            keys: Cache keys to look up.
+
+        Returns:
+            Cached embedding by key, for the keys found.
+        """
+        if not keys:
+            return {}
+
+        cursor = self._collection.find(
+            {"_id": {"$in": keys}},
+            projection={"values": 1, "tokens": 1},
+        )
+        return {doc["_id"]: CachedEmbedding(values=doc["values"], tokens=doc.get("tokens", 0)) async for doc in cursor}
+
+    async def put_many(
+        self,
+        entries: dict[str, CachedEmbedding],
+        model: str,
+        input_type: str,
+    ) -> None:
+        """Store embeddings in one unordered bulk write.
+
+        Args:
+            entries: Embedding by cache key.
+            model: Embedding model that produced them.
+            input_type: Input type they were embedded with (passage/query).
+        """
+        if not entries:
+            return
+
+        now = datetime.now(UTC)
+        operations = [
+            UpdateOne(
+                {"_id": key},
+                {
+                    "$setOnInsert": {
+                        "values": entry.values,
+                        "tokens": entry.tokens,
+                        "model": model,
+                        "input_type": input_type,
+                        "created_at": now,
+                    }
+                },
+                upsert=True,
+            )
+            for key, entry in entries.items()
+        ]
+        await self._collection.bulk_write(operations, ordered=False)
+
+        logger.debug("Stored cached embeddings", count=len(entries), model=model)
@@ -10,7 +10,7 @@ import structlog
 from ai_model.domain.rag_document import RagChunk
 from ai_model.infrastructure.repositories.base import BaseRepository
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from pymongo import ASCENDING
+from pymongo import ASCENDING, UpdateOne
 
 logger = structlog.get_logger(__name__)
 
@@ -19,6 +19,7 @@ class RagChunkRepository(BaseRepository[RagChunk]):
     """Repository for RagChunk entities.
 
     Provides CRUD operations plus specialized queries:
+    - get_by_ids: Get many chunks by chunk_id in a single query
     - get_by_document: Get all chunks for a document version
     - delete_by_document: Delete all chunks for a document version
     - count_by_document: Count chunks for a document version
@@ -53,6 +54,35 @@ class RagChunkRepository(BaseRepository[RagChunk]):
         doc.pop("_id", None)
         return RagChunk.model_validate(doc)
 
+    async def get_by_ids(self, chunk_ids: list[str]) -> list[RagChunk]:
+        """Get multiple chunks by chunk_id in a single query.
+
+        Uses one $in query instead of a round-trip per chunk. Results
+        follow the order of chunk_ids (e.g. Pinecone score order);
+        IDs with no stored chunk are omitted and duplicates collapse
+        to their first occurrence.
+
+        Args:
+            chunk_ids: The chunk identifiers, in the desired output order.
+
+        Returns:
+            List of found chunks, ordered as in chunk_ids.
+        """
+        unique_ids = list(dict.fromkeys(chunk_ids))
+        if not unique_ids:
+            return []
+
+        cursor = self._collection.find({"_id": {"$in": unique_ids}})
+        docs = await cursor.to_list(length=len(unique_ids))
+
+        by_id: dict[str, RagChunk] = {}
+        for doc in docs:
+            doc.pop("_id", None)
+            chunk = RagChunk.model_validate(doc)
+            by_id[chunk.chunk_id] = chunk
+
+        return [by_id[chunk_id] for chunk_id in unique_ids if chunk_id in by_id]
+
     async def get_by_document(
         self,
         document_id: str,
@@ -193,6 +223,32 @@ class RagChunkRepository(BaseRepository[RagChunk]):
         result.pop("_id", None)
         return RagChunk.model_validate(result)
 
+    async def bulk_update_pinecone_ids(self, pinecone_ids: dict[str, str]) -> int:
+        """Update the Pinecone vector IDs of several chunks in one bulk write.
+
+        Args:
+            pinecone_ids: Pinecone vector ID by chunk ID.
+
+        Returns:
+            Number of chunks matched.
+        """
+        if not pinecone_ids:
+            return 0
+
+        operations = [
+            UpdateOne({"_id": chunk_id}, {"$set": {"pinecone_id": pinecone_id}})
+            for chunk_id, pinecone_id in pinecone_ids.items()
+        ]
+        result = await self._collection.bulk_write(operations, ordered=False)
+
+        logger.debug(
+            "Bulk updated chunk Pinecone IDs",
+            count=len(operations),
+            matched=result.matched_count,
+        )
+
+        return result.matched_count
+
     async def get_chunks_without_vectors(
         self,
         document_id: str,
@@ -3,7 +3,7 @@
 This module provides the unified LLM gateway with:
 - OpenRouter integration via LangChain-compatible ChatOpenRouter
 - LLMGateway wrapper for retry, fallback, and cost publishing via DAPR
-- Token bucket rate limiting for RPM and TPM
+- Token bucket rate limiting for RPM and TPM (in-process or shared via MongoDB)
 
 Story 0.75.5: OpenRouter LLM Gateway with Cost Observability
 Story 13.7: Removed BudgetMonitor - cost tracking now via DAPR to platform-cost (ADR-016)
@@ -18,14 +18,22 @@ from ai_model.llm.exceptions import (
     TransientError,
 )
 from ai_model.llm.gateway import LLMGateway
-from ai_model.llm.rate_limiter import RateLimiter
+from ai_model.llm.rate_limiter import (
+    InProcessRateLimitBackend,
+    MongoDBRateLimitBackend,
+    RateLimitBackend,
+    RateLimiter,
+)
 
 __all__ = [
     "AllModelsUnavailableError",
     "ChatOpenRouter",
+    "InProcessRateLimitBackend",
     "LLMError",
     "LLMGateway",
     "ModelUnavailableError",
+    "MongoDBRateLimitBackend",
+    "RateLimitBackend",
     "RateLimitExceededError",
     "RateLimiter",
     "TransientError",
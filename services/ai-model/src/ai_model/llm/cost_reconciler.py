@@ -0,0 +1,244 @@
+"""Deferred reconciliation of LLM costs with OpenRouter's Generation Stats API.
+
+OpenRouter's /generation endpoint (native token counts and billed cost)
+usually becomes available a few hundred milliseconds after the completion.
+Instead of polling it on the request path, LLMGateway returns using the
+usage block of the response and submits the generation here. A background
+worker resolves pending generations in batches (bounded concurrency), backs
+off on generations not yet available, and publishes one cost event per
+request with the reconciled figures - or with the provisional usage figures
+once a generation is given up on.
+
+Story 0.75.5: OpenRouter LLM Gateway with Cost Observability
+"""
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+import structlog
+from opentelemetry import metrics
+
+if TYPE_CHECKING:
+    from ai_model.llm.gateway import GenerationStats
+
+logger = structlog.get_logger(__name__)
+
+# OpenTelemetry metrics
+meter = metrics.get_meter(__name__)
+llm_cost_reconciliation_lag_histogram = meter.create_histogram(
+    name="llm_cost_reconciliation_lag_seconds",
+    description="Time from LLM completion to publication of its reconciled cost",
+    unit="s",
+)
+llm_cost_unreconciled_counter = meter.create_counter(
+    name="llm_cost_unreconciled_total",
+    description="Generations whose stats were never retrieved (provisional cost published)",
+    unit="1",
+)
+
+# Delays between lookups of a generation not yet available (seconds)
+DEFAULT_RETRY_DELAYS_S = (0.5, 1.0, 2.0, 4.0, 8.0, 16.0)
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_CONCURRENCY = 8
+# Pending generations beyond this are published unreconciled immediately
+DEFAULT_MAX_PENDING = 10_000
+DEFAULT_DRAIN_TIMEOUT_S = 5.0
+
+
+@dataclass
+class PendingCost:
+    """An LLM completion waiting for its generation stats.
+
+    Attributes:
+        generation_id: OpenRouter generation ID.
+        request_id: Correlation ID the cost event is published with.
+        model: Model that answered (from the response).
+        agent_type: Type of agent that made the request.
+        agent_id: Agent configuration ID.
+        factory_id: Optional factory ID for cost attribution.
+        tokens_in: Provisional prompt tokens (response usage).
+        tokens_out: Provisional completion tokens (response usage).
+        cost_usd: Provisional cost (response usage, 0 if not reported).
+    """
+
+    generation_id: str
+    request_id: str
+    model: str
+    agent_type: str
+    agent_id: str
+    factory_id: str | None
+    tokens_in: int
+    tokens_out: int
+    cost_usd: Decimal
+    completed_at: float = field(default_factory=time.monotonic)
+    attempts: int = 0
+
+
+# (generation_id) -> stats, or None if not available yet
+FetchStats = Callable[[str], Awaitable["GenerationStats | None"]]
+# (pending, stats or None when unreconciled) -> None
+PublishCost = Callable[[PendingCost, "GenerationStats | None"], Awaitable[None]]
+
+
+class CostReconciler:
+    """Background worker resolving generation stats and publishing cost events.
+
+    The worker starts on the first submit (it needs a running event loop)
+    and stops on close(), which publishes whatever is still pending.
+
+    Attributes:
+        reconciled: Generations published with their generation stats.
+        unreconciled: Generations published with provisional usage figures.
+    """
+
+    def __init__(
+        self,
+        fetch_stats: FetchStats,
+        publish: PublishCost,
+        retry_delays_s: tuple[float, ...] = DEFAULT_RETRY_DELAYS_S,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        """Initialize the reconciler.
+
+        Args:
+            fetch_stats: Single lookup of a generation's stats (None if not available yet).
+            publish: Publishes the cost event of a pending generation.
+            retry_delays_s: Delay before each lookup; the first entry is the initial delay.
+            batch_size: Maximum generations looked up per worker pass.
+            max_concurrency: Maximum concurrent lookups.
+            max_pending: Backlog size beyond which new generations are not reconciled.
+        """
+        self._fetch_stats = fetch_stats
+        self._publish = publish
+        self._retry_delays_s = retry_delays_s
+        self._batch_size = batch_size
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_pending = max_pending
+        # (due time, sequence, pending) min-heap
+        self._queue: list[tuple[float, int, PendingCost]] = []
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+        # Provisional publishes started outside the worker
+        self._publishing: set[asyncio.Future[None]] = set()
+        self._closed = False
+        self.reconciled = 0
+        self.unreconciled = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of generations waiting for reconciliation."""
+        return len(self._queue)
+
+    def submit(self, pending: PendingCost) -> None:
+        """Queue a completed generation for cost reconciliation (never blocks)."""
+        if self._closed or len(self._queue) >= self._max_pending:
+            logger.warning(
+                "Cost reconciliation backlog full, publishing provisional cost",
+                generation_id=pending.generation_id,
+                request_id=pending.request_id,
+            )
+            task = asyncio.ensure_future(self._give_up(pending))
+            self._publishing.add(task)
+            task.add_done_callback(self._publishing.discard)
+            return
+        self._schedule(pending)
+        if self._worker is None:
+            self._worker = asyncio.ensure_future(self._run())
+
+    async def close(self, timeout_s: float = DEFAULT_DRAIN_TIMEOUT_S) -> None:
+        """Stop the worker after one last lookup of every pending generation.
+
+        Generations still unavailable, or not looked up within timeout_s,
+        are published with their provisional figures.
+
+        Args:
+            timeout_s: Maximum time spent draining.
+        """
+        self._closed = True
+        self._wakeup.set()
+        try:
+            await asyncio.wait_for(self._drain(), timeout=timeout_s)
+        except TimeoutError:
+            logger.warning("Cost reconciliation drain timed out", pending=len(self._queue))
+        while self._queue:
+            _, _, pending = heapq.heappop(self._queue)
+            await self._give_up(pending)
+
+    async def _drain(self) -> None:
+        if self._worker is not None:
+            await self._worker
+        if self._publishing:
+            await asyncio.gather(*self._publishing)
+        while self._queue:
+            batch = [heapq.heappop(self._queue)[2] for _ in range(min(self._batch_size, len(self._queue)))]
+            await asyncio.gather(*(self._reconcile(pending) for pending in batch))
+
+    def _schedule(self, pending: PendingCost) -> None:
+        due = time.monotonic() + self._retry_delays_s[min(pending.attempts, len(self._retry_delays_s) - 1)]
+        heapq.heappush(self._queue, (due, next(self._sequence), pending))
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        """Worker loop: sleep until the next generation is due, then resolve a batch."""
+        while self._queue and not self._closed:
+            now = time.monotonic()
+            due_at = self._queue[0][0]
+            if due_at > now:
+                self._wakeup.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=due_at - now)
+                continue
+
+            batch = []
+            while self._queue and self._queue[0][0] <= now and len(batch) < self._batch_size:
+                batch.append(heapq.heappop(self._queue)[2])
+            await asyncio.gather(*(self._reconcile(pending) for pending in batch))
+        self._worker = None
+
+    async def _reconcile(self, pending: PendingCost) -> None:
+        """Look up one generation; publish it, or reschedule it while attempts remain."""
+        pending.attempts += 1
+        try:
+            async with self._semaphore:
+                stats = await self._fetch_stats(pending.generation_id)
+        except Exception as e:
+            logger.warning(
+                "Error fetching generation stats",
+                generation_id=pending.generation_id,
+                error=str(e),
+            )
+            stats = None
+
+        if stats is not None:
+            await self._publish(pending, stats)
+            self.reconciled += 1
+            llm_cost_reconciliation_lag_histogram.record(
+                time.monotonic() - pending.completed_at,
+                {"model": stats.model or pending.model},
+            )
+        elif pending.attempts < len(self._retry_delays_s) and not self._closed:
+            self._schedule(pending)
+        else:
+            await self._give_up(pending)
+
+    async def _give_up(self, pending: PendingCost) -> None:
+        """Publish a generation with its provisional figures."""
+        logger.warning(
+            "Generation stats not available, publishing provisional cost",
+            generation_id=pending.generation_id,
+            request_id=pending.request_id,
+            attempts=pending.attempts,
+        )
+        self.unreconciled += 1
+        llm_cost_unreconciled_counter.add(1, {"model": pending.model})
+        await self._publish(pending, None)
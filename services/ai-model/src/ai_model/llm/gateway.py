@@ -3,7 +3,8 @@
 This module provides the LLMGateway class that wraps ChatOpenRouter to add:
 - Tenacity retry with exponential backoff for transient errors
 - Fallback chain to try multiple models
-- Cost tracking via OpenRouter Generation Stats API (published to platform-cost via DAPR)
+- Cost tracking via OpenRouter Generation Stats API (published to platform-cost via DAPR),
+  reconciled in the background so requests do not wait for the stats
 - Rate limiting integration
 - OpenTelemetry metrics
 
@@ -25,6 +26,7 @@ from ai_model.llm.chat_openrouter import (
     OPENROUTER_BASE_URL,
     ChatOpenRouter,
 )
+from ai_model.llm.cost_reconciler import CostReconciler, PendingCost
 from ai_model.llm.exceptions import (
     AllModelsUnavailableError,
     LLMError,
@@ -78,6 +80,20 @@ DEFAULT_RETRY_BACKOFF_MS = [100, 500, 2000]
 # Transient error status codes
 TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
 
+# Rough prompt size estimate used for rate limit reservations
+CHARS_PER_TOKEN = 4
+
+
+def _estimate_prompt_tokens(messages: list[BaseMessage]) -> int:
+    """Estimate the prompt tokens of a request from its text content."""
+    chars = 0
+    for message in messages:
+        if isinstance(message.content, str):
+            chars += len(message.content)
+        else:
+            chars += sum(len(part.get("text", "")) for part in message.content if isinstance(part, dict))
+    return chars // CHARS_PER_TOKEN + 1
+
 
 class GenerationStats:
     """Statistics from OpenRouter's Generation Stats API."""
@@ -178,6 +194,11 @@ class LLMGateway:
         self._cost_topic = cost_topic
         self._http_client: httpx.AsyncClient | None = None
         self._available_models: set[str] = set()
+        self._cost_reconciler = (
+            CostReconciler(fetch_stats=self._get_generation_stats, publish=self._publish_reconciled_cost)
+            if dapr_client is not None
+            else None
+        )
 
         logger.info(
             "LLM Gateway initialized",
@@ -201,7 +222,9 @@ class LLMGateway:
         return self._http_client
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Publish costs still awaiting reconciliation and close the HTTP client."""
+        if self._cost_reconciler is not None:
+            await self._cost_reconciler.close()
         if self._http_client is not None:
             await self._http_client.aclose()
             self._http_client = None
@@ -256,73 +279,55 @@ class LLMGateway:
 
         The generation stats endpoint returns native token counts and
         actual billing cost, which differ from the normalized counts
-        in the chat completion response.
+        in the chat completion response. A generation is usually not
+        available immediately; CostReconciler retries the lookup with
+        backoff in the background.
 
         Args:
             generation_id: The generation ID from the chat completion response.
 
         Returns:
-            GenerationStats if successful, None if not available.
+            GenerationStats if successful, None if not (yet) available.
         """
         # Story 13.7: Only fetch generation stats if DAPR client is configured for cost publishing
         if self._dapr_client is None:
             return None
 
         client = await self._get_http_client()
+        try:
+            response = await client.get(f"/generation?id={generation_id}")
 
-        # Retry with backoff - generation ID may not be immediately available
-        retry_delays = [0.1, 0.2, 0.5]  # 100ms, 200ms, 500ms
-
-        for attempt, delay in enumerate(retry_delays):
-            if attempt > 0:
-                import asyncio
-
-                await asyncio.sleep(delay)
-
-            try:
-                response = await client.get(f"/generation?id={generation_id}")
-
-                if response.status_code == 404:
-                    logger.debug(
-                        "Generation not yet available, retrying",
-                        generation_id=generation_id,
-                        attempt=attempt + 1,
-                    )
-                    continue
-
-                response.raise_for_status()
-                data = response.json()
-
-                return GenerationStats(
-                    generation_id=generation_id,
-                    native_tokens_prompt=data.get("native_tokens_prompt", 0),
-                    native_tokens_completion=data.get("native_tokens_completion", 0),
-                    total_cost=Decimal(str(data.get("total_cost", 0))),
-                    model=data.get("model", ""),
-                )
-
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    continue
-                logger.warning(
-                    "Failed to fetch generation stats",
-                    generation_id=generation_id,
-                    status_code=e.response.status_code,
-                )
-                return None
-            except Exception as e:
-                logger.warning(
-                    "Error fetching generation stats",
-                    generation_id=generation_id,
-                    error=str(e),
-                )
+            if response.status_code == 404:
+                logger.debug("Generation not yet available", generation_id=generation_id)
                 return None
 
-        logger.warning(
-            "Generation stats not available after retries",
-            generation_id=generation_id,
-        )
-        return None
+            response.raise_for_status()
+            data = response.json()
+            # The endpoint wraps the stats in "data"
+            data = data.get("data", data)
+
+            return GenerationStats(
+                generation_id=generation_id,
+                native_tokens_prompt=data.get("native_tokens_prompt", 0),
+                native_tokens_completion=data.get("native_tokens_completion", 0),
+                total_cost=Decimal(str(data.get("total_cost", 0))),
+                model=data.get("model", ""),
+            )
+
+        except httpx.HTTPStatusError as e:
+            logger.warning(
+                "Failed to fetch generation stats",
+                generation_id=generation_id,
+                status_code=e.response.status_code,
+            )
+            return None
+        except Exception as e:
+            logger.warning(
+                "Error fetching generation stats",
+                generation_id=generation_id,
+                error=str(e),
+            )
+            return None
 
     async def _complete_with_retry(
         self,
@@ -430,10 +435,12 @@ class LLMGateway:
         """Complete a chat request with retry and fallback.
 
         This is the main entry point for LLM requests. It handles:
-        1. Rate limiting (if configured)
+        1. Rate limiting (if configured): each model attempt reserves the
+           prompt estimate plus max_tokens, settled with the actual usage
         2. Retry with exponential backoff for transient errors
         3. Fallback to alternative models if primary fails
-        4. Cost tracking via Generation Stats API
+        4. Cost tracking via Generation Stats API (deferred: the cost event
+           is published by the background CostReconciler)
         5. OpenTelemetry metrics
 
         Args:
@@ -450,9 +457,10 @@ class LLMGateway:
             - content: The generated text content.
             - generation_id: OpenRouter generation ID.
             - model: Actual model used (may differ if fallback triggered).
-            - tokens_in: Native input token count.
-            - tokens_out: Native output token count.
-            - cost_usd: Total cost in USD (Decimal).
+            - tokens_in: Input token count (response usage).
+            - tokens_out: Output token count (response usage).
+            - cost_usd: Cost in USD reported in the response usage (Decimal,
+              0 if not reported); the reconciled cost is published separately.
             - retry_count: Number of retries before success.
 
         Raises:
@@ -462,9 +470,8 @@ class LLMGateway:
         """
         request_id = request_id or str(uuid.uuid4())
 
-        # Rate limiting
-        if self._rate_limiter:
-            await self._rate_limiter.acquire_request()
+        # Rate limiting reserves the prompt estimate plus the expected completion
+        estimated_tokens = _estimate_prompt_tokens(messages) + (kwargs.get("max_tokens") or 0)
 
         # Build model list: primary + fallbacks
         models_to_try = [model, *self._fallback_models]
@@ -483,6 +490,15 @@ class LLMGateway:
                     attempt=idx + 1,
                 )
 
+            reservation = None
+            if self._rate_limiter:
+                reservation = await self._rate_limiter.reserve(
+                    estimated_tokens,
+                    model=current_model,
+                    agent_type=agent_type or None,
+                )
+            used_tokens = 0
+
             try:
                 result, retry_count = await self._complete_with_retry(
                     model=current_model,
@@ -501,34 +517,18 @@ class LLMGateway:
                 # Get generation ID for cost tracking
                 generation_id = response_metadata.get("id", "")
 
-                # Fetch accurate cost from Generation Stats API
-                stats = await self._get_generation_stats(generation_id) if generation_id else None
-
-                if stats:
-                    tokens_in = stats.native_tokens_prompt
-                    tokens_out = stats.native_tokens_completion
-                    cost_usd = stats.total_cost
-                    actual_model = stats.model or current_model
-                else:
-                    # Fallback to normalized counts from response
-                    usage = response_metadata.get("usage", {})
-                    tokens_in = usage.get("prompt_tokens", 0)
-                    tokens_out = usage.get("completion_tokens", 0)
-                    cost_usd = Decimal("0")  # Cannot calculate without generation stats
-                    actual_model = current_model
+                # Provisional figures from the response; native counts and the
+                # billed cost are reconciled later from the Generation Stats API
+                usage = response_metadata.get("usage") or {}
+                tokens_in = usage.get("prompt_tokens", 0)
+                tokens_out = usage.get("completion_tokens", 0)
+                cost_usd = Decimal(str(usage.get("cost", 0)))
+                actual_model = current_model
+                used_tokens = tokens_in + tokens_out
 
                 # Record metrics
                 llm_tokens_counter.add(tokens_in, {"model": actual_model, "direction": "in"})
                 llm_tokens_counter.add(tokens_out, {"model": actual_model, "direction": "out"})
-                if cost_usd > 0:
-                    llm_request_cost_histogram.record(
-                        float(cost_usd),
-                        {"model": actual_model, "agent_type": agent_type},
-                    )
-
-                # Consume tokens from rate limiter
-                if self._rate_limiter:
-                    await self._rate_limiter.acquire_tokens(tokens_in + tokens_out, wait=False)
 
                 logger.info(
                     "LLM request completed",
@@ -542,18 +542,21 @@ class LLMGateway:
                 )
 
                 # Story 13.7 (ADR-016): Publish cost event to platform-cost via DAPR
-                if self._dapr_client and cost_usd > 0:
-                    await self._publish_cost_event(
-                        cost_usd=cost_usd,
-                        tokens_in=tokens_in,
-                        tokens_out=tokens_out,
-                        model=actual_model,
-                        agent_type=agent_type,
-                        agent_id=agent_id,
-                        factory_id=factory_id,
-                        request_id=request_id,
-                        success=True,
-                    )
+                pending = PendingCost(
+                    generation_id=generation_id,
+                    request_id=request_id,
+                    model=actual_model,
+                    agent_type=agent_type,
+                    agent_id=agent_id,
+                    factory_id=factory_id,
+                    tokens_in=tokens_in,
+                    tokens_out=tokens_out,
+                    cost_usd=cost_usd,
+                )
+                if self._cost_reconciler is not None and generation_id:
+                    self._cost_reconciler.submit(pending)
+                elif self._dapr_client is not None:
+                    await self._publish_reconciled_cost(pending, None)
 
                 return {
                     "content": content,
@@ -585,6 +588,11 @@ class LLMGateway:
                 )
                 continue
 
+            finally:
+                # Give back unused reserved tokens (all of them if the call failed)
+                if reservation is not None and self._rate_limiter:
+                    await self._rate_limiter.settle(reservation, used_tokens)
+
         # All models failed
         raise AllModelsUnavailableError(
             f"All {len(attempted_models)} models failed: {attempted_models}",
@@ -592,6 +600,45 @@ class LLMGateway:
             cause=last_error,
         )
 
+    async def _publish_reconciled_cost(self, pending: PendingCost, stats: GenerationStats | None) -> None:
+        """Publish the cost event of a completed request.
+
+        Uses the generation stats when available, the response's usage
+        figures otherwise. Requests without a known cost are not published.
+
+        Args:
+            pending: The completed request.
+            stats: Its generation stats, None if they could not be retrieved.
+        """
+        if stats is not None:
+            tokens_in = stats.native_tokens_prompt
+            tokens_out = stats.native_tokens_completion
+            cost_usd = stats.total_cost
+            model = stats.model or pending.model
+        else:
+            tokens_in, tokens_out, cost_usd, model = (
+                pending.tokens_in,
+                pending.tokens_out,
+                pending.cost_usd,
+                pending.model,
+            )
+        if cost_usd <= 0:
+            return
+
+        llm_request_cost_histogram.record(float(cost_usd), {"model": model, "agent_type": pending.agent_type})
+        await self._publish_cost_event(
+            cost_usd=cost_usd,
+            tokens_in=tokens_in,
+            tokens_out=tokens_out,
+            model=model,
+            agent_type=pending.agent_type,
+            agent_id=pending.agent_id,
+            factory_id=pending.factory_id,
+            request_id=pending.request_id,
+            success=True,
+            reconciled=stats is not None,
+        )
+
     async def _publish_cost_event(
         self,
         cost_usd: Decimal,
@@ -603,6 +650,7 @@ class LLMGateway:
         factory_id: str | None,
         request_id: str,
         success: bool,
+        reconciled: bool = True,
     ) -> None:
         """Publish LLM cost event to platform-cost service via DAPR (Story 13.7, ADR-016).
 
@@ -619,6 +667,8 @@ class LLMGateway:
             factory_id: Optional factory ID for cost attribution.
             request_id: Correlation ID for tracing.
             success: Whether the LLM operation succeeded.
+            reconciled: Whether the figures come from the Generation Stats API
+                (False: provisional usage figures from the response).
         """
         if not self._dapr_client:
             return
@@ -640,6 +690,7 @@ class LLMGateway:
                     "agent_id": agent_id,
                     "tokens_in": tokens_in,
                     "tokens_out": tokens_out,
+                    "cost_reconciled": reconciled,
                 },
             )
 
@@ -4,16 +4,34 @@ This module implements a token bucket algorithm for rate limiting:
 - RPM (Requests Per Minute): Limits the number of requests
 - TPM (Tokens Per Minute): Limits the total tokens processed
 
+Buckets are provided by a RateLimitBackend:
+- InProcessRateLimitBackend: buckets local to the replica. Waiters queue in
+  FIFO order and are woken when the refill covers them (no polling).
+- MongoDBRateLimitBackend: buckets shared by all ai-model replicas, refilled
+  and consumed atomically in MongoDB, so the configured limits hold for the
+  deployment rather than per pod.
+
+Besides the global buckets, RateLimiter can limit individual models and
+agent types, and reserves the expected tokens of a call before it is made
+(settled with the actual usage afterwards).
+
 Story 0.75.5: OpenRouter LLM Gateway with Cost Observability
 """
 
 import asyncio
+import contextlib
 import time
-from typing import Final
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Final
 
 import structlog
 from ai_model.llm.exceptions import RateLimitExceededError
+from motor.motor_asyncio import AsyncIOMotorDatabase
 from opentelemetry import metrics
+from pymongo import ReturnDocument
 
 logger = structlog.get_logger(__name__)
 
@@ -26,8 +44,8 @@ rate_limit_exceeded_counter = meter.create_counter(
 )
 
 
-class TokenBucket:
-    """Token bucket implementation for rate limiting.
+class RateLimitBucket(ABC):
+    """Token bucket provided by a RateLimitBackend.
 
     Tokens are added to the bucket at a fixed rate and consumed when
     requests are made. If the bucket is empty, requests must wait.
@@ -44,20 +62,119 @@ class TokenBucket:
         Args:
             capacity: Maximum number of tokens the bucket can hold.
             refill_rate: Tokens added per second.
-            name: Name for logging purposes.
+            name: Bucket name (logging, errors and shared state key).
         """
         self._capacity = capacity
         self._refill_rate = refill_rate
         self._name = name
-        self._tokens = float(capacity)
-        self._last_refill = time.monotonic()
-        self._lock = asyncio.Lock()
 
     @property
     def capacity(self) -> int:
         """Return the bucket capacity."""
         return self._capacity
 
+    @property
+    def name(self) -> str:
+        """Return the bucket name."""
+        return self._name
+
+    @property
+    @abstractmethod
+    def available_tokens(self) -> float:
+        """Return the last known number of available tokens (without refilling)."""
+
+    @abstractmethod
+    async def acquire(
+        self,
+        tokens: int = 1,
+        *,
+        wait: bool = True,
+        timeout_seconds: float | None = None,
+    ) -> bool:
+        """Acquire tokens from the bucket.
+
+        Args:
+            tokens: Number of tokens to acquire.
+            wait: If True, wait for tokens to become available.
+                  If False, return immediately if not available.
+            timeout_seconds: Maximum time to wait for tokens.
+
+        Returns:
+            True if tokens were acquired.
+
+        Raises:
+            RateLimitExceededError: If wait=False and tokens not available,
+                if timeout exceeded, or if tokens exceeds the capacity.
+        """
+
+    @abstractmethod
+    async def adjust(self, tokens: float) -> None:
+        """Give back (tokens > 0) or take (tokens < 0) tokens without waiting.
+
+        Taking may leave the bucket below zero, which delays later
+        acquisitions until the debt is refilled.
+
+        Args:
+            tokens: Tokens to add to the bucket (negative to remove).
+        """
+
+    def _check_capacity(self, tokens: float) -> None:
+        if tokens > self._capacity:
+            raise RateLimitExceededError(
+                f"Rate limit exceeded: {tokens} tokens exceed the {self._name} bucket capacity",
+                limit_type=self._name,
+                limit_value=self._capacity,
+                retry_after_seconds=None,
+            )
+
+    def _exceeded_error(self, tokens: float, available: float) -> RateLimitExceededError:
+        needed = tokens - available
+        retry_after = needed / self._refill_rate if self._refill_rate > 0 else None
+        return RateLimitExceededError(
+            f"Rate limit exceeded: {self._name} bucket has {available:.1f} tokens, need {tokens}",
+            limit_type=self._name,
+            limit_value=self._capacity,
+            retry_after_seconds=retry_after,
+        )
+
+    def _timeout_error(self, waited_seconds: float) -> RateLimitExceededError:
+        return RateLimitExceededError(
+            f"Rate limit timeout: waited {waited_seconds:.1f}s for {self._name} tokens",
+            limit_type=self._name,
+            limit_value=self._capacity,
+            retry_after_seconds=None,
+        )
+
+
+class TokenBucket(RateLimitBucket):
+    """In-process token bucket with fair waiting.
+
+    Requests that cannot be served immediately queue in FIFO order. A single
+    timer is armed for the moment the refill covers the request at the head
+    of the queue, so waiters are woken exactly once, in order, instead of
+    polling the bucket.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        refill_rate: float,
+        name: str = "bucket",
+    ) -> None:
+        """Initialize the token bucket.
+
+        Args:
+            capacity: Maximum number of tokens the bucket can hold.
+            refill_rate: Tokens added per second.
+            name: Name for logging purposes.
+        """
+        super().__init__(capacity, refill_rate, name)
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        # (tokens, future) of queued acquisitions, oldest first
+        self._waiters: deque[tuple[float, asyncio.Future[None]]] = deque()
+        self._timer: asyncio.TimerHandle | None = None
+
     @property
     def available_tokens(self) -> float:
         """Return the current number of available tokens (without refilling)."""
@@ -70,6 +187,29 @@ class TokenBucket:
         self._tokens = min(self._capacity, self._tokens + elapsed * self._refill_rate)
         self._last_refill = now
 
+    def _wake(self) -> None:
+        """Grant queued acquisitions in order and arm the timer for the next one."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._refill()
+
+        while self._waiters:
+            tokens, future = self._waiters[0]
+            if future.done():
+                # Timed out or cancelled
+                self._waiters.popleft()
+                continue
+            if self._tokens < tokens:
+                break
+            self._tokens -= tokens
+            self._waiters.popleft()
+            future.set_result(None)
+
+        if self._waiters and self._refill_rate > 0:
+            needed = self._waiters[0][0] - self._tokens
+            self._timer = asyncio.get_running_loop().call_later(needed / self._refill_rate, self._wake)
+
     async def acquire(
         self,
         tokens: int = 1,
@@ -86,52 +226,297 @@ class TokenBucket:
             timeout_seconds: Maximum time to wait for tokens.
 
         Returns:
-            True if tokens were acquired, False if not available and wait=False.
+            True if tokens were acquired.
 
         Raises:
             RateLimitExceededError: If wait=False and tokens not available,
-                or if timeout exceeded.
+                if timeout exceeded, or if tokens exceeds the capacity.
+        """
+        self._check_capacity(tokens)
+        self._refill()
+
+        # Queued requests are served first
+        if not self._waiters and self._tokens >= tokens:
+            self._tokens -= tokens
+            return True
+
+        if not wait:
+            raise self._exceeded_error(tokens, self._tokens)
+
+        start_time = time.monotonic()
+        waiter = (float(tokens), asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        self._wake()
+        try:
+            await asyncio.wait_for(waiter[1], timeout=timeout_seconds)
+        except (TimeoutError, asyncio.CancelledError) as e:
+            future = waiter[1]
+            if future.done() and not future.cancelled():
+                # Granted while the timeout or cancellation was delivered
+                self._tokens = min(self._capacity, self._tokens + tokens)
+            with contextlib.suppress(ValueError):
+                self._waiters.remove(waiter)
+            self._wake()
+            if isinstance(e, TimeoutError):
+                raise self._timeout_error(time.monotonic() - start_time) from None
+            raise
+        return True
+
+    async def adjust(self, tokens: float) -> None:
+        """Give back (tokens > 0) or take (tokens < 0) tokens without waiting.
+
+        Args:
+            tokens: Tokens to add to the bucket (negative to remove).
         """
-        async with self._lock:
-            self._refill()
-
-            if self._tokens >= tokens:
-                self._tokens -= tokens
-                return True
-
-            if not wait:
-                # Calculate when tokens will be available
-                needed = tokens - self._tokens
-                retry_after = needed / self._refill_rate if self._refill_rate > 0 else None
-                raise RateLimitExceededError(
-                    f"Rate limit exceeded: {self._name} bucket has {self._tokens:.1f} tokens, need {tokens}",
-                    limit_type=self._name,
-                    limit_value=self._capacity,
-                    retry_after_seconds=retry_after,
-                )
-
-        # Wait for tokens
+        self._refill()
+        self._tokens = min(self._capacity, self._tokens + tokens)
+        if self._waiters:
+            self._wake()
+
+
+class SharedTokenBucket(RateLimitBucket):
+    """Token bucket whose state is held by a SharedRateLimitBackend.
+
+    Within a replica, one acquisition at a time (FIFO, asyncio.Lock) updates
+    the shared state; when the bucket is short it sleeps until the refill
+    should cover it, then tries again. Replicas waiting on a bucket therefore
+    issue one update each per refill period.
+    """
+
+    def __init__(
+        self,
+        backend: "SharedRateLimitBackend",
+        capacity: int,
+        refill_rate: float,
+        name: str = "bucket",
+    ) -> None:
+        """Initialize the token bucket.
+
+        Args:
+            backend: Backend holding the bucket state.
+            capacity: Maximum number of tokens the bucket can hold.
+            refill_rate: Tokens added per second.
+            name: Bucket name (shared state key).
+        """
+        super().__init__(capacity, refill_rate, name)
+        self._backend = backend
+        self._lock = asyncio.Lock()
+        self._tokens = float(capacity)
+
+    @property
+    def available_tokens(self) -> float:
+        """Return the tokens seen by the last update of the shared state."""
+        return self._tokens
+
+    async def acquire(
+        self,
+        tokens: int = 1,
+        *,
+        wait: bool = True,
+        timeout_seconds: float | None = None,
+    ) -> bool:
+        """Acquire tokens from the shared bucket.
+
+        Args:
+            tokens: Number of tokens to acquire.
+            wait: If True, wait for tokens to become available.
+                  If False, return immediately if not available.
+            timeout_seconds: Maximum time to wait for tokens.
+
+        Returns:
+            True if tokens were acquired.
+
+        Raises:
+            RateLimitExceededError: If wait=False and tokens not available,
+                if timeout exceeded, or if tokens exceeds the capacity.
+        """
+        self._check_capacity(tokens)
+        if not wait and self._lock.locked():
+            # Local requests are already queued for this bucket
+            raise self._exceeded_error(tokens, self._tokens)
+
         start_time = time.monotonic()
-        while True:
-            async with self._lock:
-                self._refill()
-                if self._tokens >= tokens:
-                    self._tokens -= tokens
+        try:
+            async with asyncio.timeout(timeout_seconds):
+                await self._lock.acquire()
+        except TimeoutError:
+            raise self._timeout_error(time.monotonic() - start_time) from None
+
+        try:
+            while True:
+                granted, self._tokens = await self._backend.take(self._name, self._capacity, self._refill_rate, tokens)
+                if granted:
                     return True
+                if not wait or self._refill_rate <= 0:
+                    raise self._exceeded_error(tokens, self._tokens)
+
+                retry_after = (tokens - self._tokens) / self._refill_rate
+                waited = time.monotonic() - start_time
+                if timeout_seconds is not None and waited + retry_after > timeout_seconds:
+                    raise self._timeout_error(waited)
+                await asyncio.sleep(retry_after)
+        finally:
+            self._lock.release()
+
+    async def adjust(self, tokens: float) -> None:
+        """Give back (tokens > 0) or take (tokens < 0) tokens without waiting.
+
+        Args:
+            tokens: Tokens to add to the bucket (negative to remove).
+        """
+        self._tokens = await self._backend.give(self._name, self._capacity, self._refill_rate, tokens)
+
+
+class RateLimitBackend(ABC):
+    """Abstract provider of the token buckets used by RateLimiter.
+
+    Implementations decide where bucket state lives: in the process, or in
+    a store shared by all replicas.
+    """
+
+    @abstractmethod
+    def bucket(self, name: str, capacity: int, refill_rate: float) -> RateLimitBucket:
+        """Create the bucket with the given name.
+
+        Args:
+            name: Bucket name, unique within the backend.
+            capacity: Maximum number of tokens the bucket can hold.
+            refill_rate: Tokens added per second.
+
+        Returns:
+            The token bucket.
+        """
+        pass
+
+
+class InProcessRateLimitBackend(RateLimitBackend):
+    """Buckets local to this process (limits apply per replica)."""
+
+    def bucket(self, name: str, capacity: int, refill_rate: float) -> RateLimitBucket:
+        """Create an in-process token bucket."""
+        return TokenBucket(capacity=capacity, refill_rate=refill_rate, name=name)
+
+
+class SharedRateLimitBackend(RateLimitBackend):
+    """Buckets whose state is shared by all replicas.
+
+    Implementations provide the two atomic operations on the shared state;
+    waiting is handled by SharedTokenBucket.
+    """
+
+    def bucket(self, name: str, capacity: int, refill_rate: float) -> RateLimitBucket:
+        """Create a token bucket backed by the shared state."""
+        return SharedTokenBucket(self, capacity=capacity, refill_rate=refill_rate, name=name)
+
+    @abstractmethod
+    async def take(self, name: str, capacity: int, refill_rate: float, tokens: float) -> tuple[bool, float]:
+        """Atomically refill the bucket and take tokens if enough are available.
+
+        A bucket seen for the first time starts full.
+
+        Args:
+            name: Bucket name.
+            capacity: Maximum number of tokens the bucket can hold.
+            refill_rate: Tokens added per second.
+            tokens: Tokens to take.
+
+        Returns:
+            Tuple of (granted, tokens left in the bucket).
+        """
+        pass
+
+    @abstractmethod
+    async def give(self, name: str, capacity: int, refill_rate: float, tokens: float) -> float:
+        """Atomically refill the bucket and add tokens (negative to remove).
+
+        Args:
+            name: Bucket name.
+            capacity: Maximum number of tokens the bucket can hold.
+            refill_rate: Tokens added per second.
+            tokens: Tokens to add, never filling above capacity.
+
+        Returns:
+            Tokens left in the bucket.
+        """
+        pass
 
-            # Check timeout
-            if timeout_seconds is not None:
-                elapsed = time.monotonic() - start_time
-                if elapsed >= timeout_seconds:
-                    raise RateLimitExceededError(
-                        f"Rate limit timeout: waited {elapsed:.1f}s for {self._name} tokens",
-                        limit_type=self._name,
-                        limit_value=self._capacity,
-                        retry_after_seconds=None,
-                    )
 
-            # Wait a short time before retrying
-            await asyncio.sleep(0.05)  # 50ms polling interval
+# Default collection of MongoDBRateLimitBackend
+RATE_LIMIT_COLLECTION: Final[str] = "llm_rate_limits"
+
+
+class MongoDBRateLimitBackend(SharedRateLimitBackend):
+    """Shared buckets stored as one MongoDB document per bucket.
+
+    Each operation is a single find_one_and_update with an aggregation
+    pipeline: the refill is computed from the server clock ($$NOW), so
+    replicas with skewed clocks agree on the bucket state.
+    """
+
+    def __init__(self, db: AsyncIOMotorDatabase, collection_name: str = RATE_LIMIT_COLLECTION) -> None:
+        """Initialize the backend.
+
+        Args:
+            db: MongoDB database.
+            collection_name: Collection holding the bucket documents.
+        """
+        self._collection = db[collection_name]
+
+    @staticmethod
+    def _refilled(capacity: int, refill_rate: float) -> dict[str, Any]:
+        """Pipeline expression of the bucket tokens refilled up to now."""
+        elapsed_ms = {"$subtract": ["$$NOW", {"$ifNull": ["$updated_at", "$$NOW"]}]}
+        return {
+            "$min": [
+                capacity,
+                {
+                    "$add": [
+                        {"$ifNull": ["$tokens", capacity]},
+                        {"$multiply": [elapsed_ms, refill_rate / 1000]},
+                    ]
+                },
+            ]
+        }
+
+    async def take(self, name: str, capacity: int, refill_rate: float, tokens: float) -> tuple[bool, float]:
+        """Atomically refill the bucket and take tokens if enough are available."""
+        document = await self._collection.find_one_and_update(
+            {"_id": name},
+            [
+                {"$set": {"refilled": self._refilled(capacity, refill_rate), "updated_at": "$$NOW"}},
+                {"$set": {"granted": {"$gte": ["$refilled", tokens]}}},
+                {
+                    "$set": {
+                        "tokens": {"$cond": ["$granted", {"$subtract": ["$refilled", tokens]}, "$refilled"]},
+                        "capacity": capacity,
+                        "refill_rate": refill_rate,
+                    }
+                },
+                {"$unset": "refilled"},
+            ],
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return document["granted"], float(document["tokens"])
+
+    async def give(self, name: str, capacity: int, refill_rate: float, tokens: float) -> float:
+        """Atomically refill the bucket and add tokens (negative to remove)."""
+        document = await self._collection.find_one_and_update(
+            {"_id": name},
+            [
+                {
+                    "$set": {
+                        "tokens": {"$min": [capacity, {"$add": [self._refilled(capacity, refill_rate), tokens]}]},
+                        "updated_at": "$$NOW",
+                        "capacity": capacity,
+                        "refill_rate": refill_rate,
+                    }
+                },
+            ],
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return float(document["tokens"])
 
 
 # Constants for rate limiter configuration
@@ -140,6 +525,19 @@ DEFAULT_TPM: Final[int] = 100000
 SECONDS_PER_MINUTE: Final[float] = 60.0
 
 
+@dataclass
+class RateLimitReservation:
+    """Tokens reserved for one LLM call.
+
+    Attributes:
+        tpm_buckets: (TPM bucket, tokens reserved in it) for each limit that applies.
+        settled: Whether the reservation was settled with the actual usage.
+    """
+
+    tpm_buckets: list[tuple[RateLimitBucket, int]] = field(default_factory=list)
+    settled: bool = False
+
+
 class RateLimiter:
     """Combined RPM and TPM rate limiter for LLM requests.
 
@@ -147,36 +545,62 @@ class RateLimiter:
     - RPM bucket: One token consumed per request
     - TPM bucket: Tokens consumed = input_tokens + output_tokens
 
-    Both limits must be satisfied for a request to proceed.
+    Optional per-model and per-agent-type limits add their own RPM/TPM
+    buckets. All limits that apply must be satisfied for a request to
+    proceed.
     """
 
     def __init__(
         self,
         rpm: int = DEFAULT_RPM,
         tpm: int = DEFAULT_TPM,
+        *,
+        backend: RateLimitBackend | None = None,
+        model_limits: Mapping[str, tuple[int, int]] | None = None,
+        agent_type_limits: Mapping[str, tuple[int, int]] | None = None,
     ) -> None:
         """Initialize the rate limiter.
 
         Args:
             rpm: Requests per minute limit.
             tpm: Tokens per minute limit.
+            backend: Bucket backend (in-process if not provided).
+            model_limits: (rpm, tpm) limits of individual models.
+            agent_type_limits: (rpm, tpm) limits of individual agent types.
         """
-        self._rpm_bucket = TokenBucket(
-            capacity=rpm,
-            refill_rate=rpm / SECONDS_PER_MINUTE,
-            name="rpm",
-        )
-        self._tpm_bucket = TokenBucket(
-            capacity=tpm,
-            refill_rate=tpm / SECONDS_PER_MINUTE,
-            name="tpm",
-        )
+        self._backend = backend or InProcessRateLimitBackend()
+        self._rpm_bucket, self._tpm_bucket = self._create_buckets("", rpm, tpm)
+        # (scope, key) -> (rpm bucket, tpm bucket)
+        self._scoped_buckets: dict[tuple[str, str], tuple[RateLimitBucket, RateLimitBucket]] = {}
+        for scope, limits in (("model", model_limits), ("agent_type", agent_type_limits)):
+            for key, (scoped_rpm, scoped_tpm) in (limits or {}).items():
+                self._scoped_buckets[(scope, key)] = self._create_buckets(f"{scope}:{key}:", scoped_rpm, scoped_tpm)
         logger.info(
             "Rate limiter initialized",
             rpm=rpm,
             tpm=tpm,
+            backend=type(self._backend).__name__,
+            scoped_limits=[f"{scope}:{key}" for scope, key in self._scoped_buckets],
         )
 
+    def _create_buckets(self, prefix: str, rpm: int, tpm: int) -> tuple[RateLimitBucket, RateLimitBucket]:
+        return (
+            self._backend.bucket(f"{prefix}rpm", rpm, rpm / SECONDS_PER_MINUTE),
+            self._backend.bucket(f"{prefix}tpm", tpm, tpm / SECONDS_PER_MINUTE),
+        )
+
+    def _buckets_for(
+        self,
+        model: str | None,
+        agent_type: str | None,
+    ) -> list[tuple[RateLimitBucket, RateLimitBucket]]:
+        """Return the (rpm, tpm) buckets that apply to a request, global first."""
+        buckets = [(self._rpm_bucket, self._tpm_bucket)]
+        for scope in (("model", model), ("agent_type", agent_type)):
+            if scope in self._scoped_buckets:
+                buckets.append(self._scoped_buckets[scope])
+        return buckets
+
     @property
     def rpm_limit(self) -> int:
         """Return the RPM limit."""
@@ -187,6 +611,21 @@ class RateLimiter:
         """Return the TPM limit."""
         return self._tpm_bucket.capacity
 
+    async def _acquire(
+        self,
+        bucket: RateLimitBucket,
+        tokens: int,
+        limit_type: str,
+        *,
+        wait: bool,
+        timeout_seconds: float | None,
+    ) -> bool:
+        try:
+            return await bucket.acquire(tokens=tokens, wait=wait, timeout_seconds=timeout_seconds)
+        except RateLimitExceededError:
+            rate_limit_exceeded_counter.add(1, {"limit_type": limit_type, "bucket": bucket.name})
+            raise
+
     async def acquire_request(
         self,
         *,
@@ -197,7 +636,7 @@ class RateLimiter:
 
         This should be called before making an LLM request.
         Token consumption for the response should be tracked separately
-        via consume_tokens().
+        via acquire_tokens().
 
         Args:
             wait: If True, wait for tokens. If False, fail immediately.
@@ -209,15 +648,7 @@ class RateLimiter:
         Raises:
             RateLimitExceededError: If rate limit exceeded.
         """
-        try:
-            return await self._rpm_bucket.acquire(
-                tokens=1,
-                wait=wait,
-                timeout_seconds=timeout_seconds,
-            )
-        except RateLimitExceededError:
-            rate_limit_exceeded_counter.add(1, {"limit_type": "rpm"})
-            raise
+        return await self._acquire(self._rpm_bucket, 1, "rpm", wait=wait, timeout_seconds=timeout_seconds)
 
     async def acquire_tokens(
         self,
@@ -243,15 +674,7 @@ class RateLimiter:
         Raises:
             RateLimitExceededError: If rate limit exceeded.
         """
-        try:
-            return await self._tpm_bucket.acquire(
-                tokens=tokens,
-                wait=wait,
-                timeout_seconds=timeout_seconds,
-            )
-        except RateLimitExceededError:
-            rate_limit_exceeded_counter.add(1, {"limit_type": "tpm"})
-            raise
+        return await self._acquire(self._tpm_bucket, tokens, "tpm", wait=wait, timeout_seconds=timeout_seconds)
 
     async def acquire(
         self,
@@ -285,15 +708,88 @@ class RateLimiter:
 
         return True
 
+    async def reserve(
+        self,
+        estimated_tokens: int = 0,
+        *,
+        model: str | None = None,
+        agent_type: str | None = None,
+        wait: bool = True,
+        timeout_seconds: float | None = None,
+    ) -> RateLimitReservation:
+        """Reserve one request and the expected tokens of an LLM call.
+
+        The request and tokens are taken from the global buckets and from
+        the buckets of the model and agent type, if they have limits. If
+        any of them cannot be acquired, what was already taken is given
+        back. Estimates above a bucket's capacity reserve the capacity.
+
+        Args:
+            estimated_tokens: Expected prompt + completion tokens.
+            model: Model the call is made to.
+            agent_type: Agent type making the call.
+            wait: If True, wait for tokens. If False, fail immediately.
+            timeout_seconds: Maximum wait time for the whole reservation.
+
+        Returns:
+            The reservation, to settle() once the actual usage is known.
+
+        Raises:
+            RateLimitExceededError: If any rate limit exceeded.
+        """
+        deadline = None if timeout_seconds is None else time.monotonic() + timeout_seconds
+        buckets = self._buckets_for(model, agent_type)
+        reservation = RateLimitReservation(
+            tpm_buckets=[(tpm_bucket, min(estimated_tokens, tpm_bucket.capacity)) for _, tpm_bucket in buckets]
+        )
+        wanted = [(rpm_bucket, 1, "rpm") for rpm_bucket, _ in buckets]
+        if estimated_tokens > 0:
+            wanted += [(tpm_bucket, tokens, "tpm") for tpm_bucket, tokens in reservation.tpm_buckets]
+
+        acquired: list[tuple[RateLimitBucket, int]] = []
+        try:
+            for bucket, tokens, limit_type in wanted:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                await self._acquire(bucket, tokens, limit_type, wait=wait, timeout_seconds=remaining)
+                acquired.append((bucket, tokens))
+        except BaseException:
+            for bucket, tokens in acquired:
+                await bucket.adjust(tokens)
+            raise
+
+        return reservation
+
+    async def settle(self, reservation: RateLimitReservation, actual_tokens: int) -> None:
+        """Settle a reservation with the tokens the call actually used.
+
+        Unused reserved tokens are given back; usage above the reservation
+        is taken without waiting. Settling twice has no effect.
+
+        Args:
+            reservation: Reservation returned by reserve().
+            actual_tokens: Prompt + completion tokens used (0 if the call failed).
+        """
+        if reservation.settled:
+            return
+        reservation.settled = True
+        for bucket, reserved in reservation.tpm_buckets:
+            if reserved != actual_tokens:
+                await bucket.adjust(reserved - actual_tokens)
+
     def get_status(self) -> dict[str, float]:
         """Get current rate limiter status.
 
         Returns:
             Dictionary with available tokens for each bucket.
         """
-        return {
+        status: dict[str, float] = {
             "rpm_available": self._rpm_bucket.available_tokens,
             "rpm_limit": self._rpm_bucket.capacity,
             "tpm_available": self._tpm_bucket.available_tokens,
             "tpm_limit": self._tpm_bucket.capacity,
         }
+        for scoped in self._scoped_buckets.values():
+            for bucket in scoped:
+                status[f"{bucket.name}_available"] = bucket.available_tokens
+                status[f"{bucket.name}_limit"] = bucket.capacity
+        return status
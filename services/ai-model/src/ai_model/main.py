@@ -42,7 +42,7 @@ from ai_model.infrastructure.tracing import (
     setup_tracing,
     shutdown_tracing,
 )
-from ai_model.llm import LLMGateway, RateLimiter
+from ai_model.llm import LLMGateway, MongoDBRateLimitBackend, RateLimiter
 from ai_model.mcp import AgentToolProvider, McpIntegration
 from ai_model.services import AgentConfigCache, AgentExecutor, PromptCache
 from ai_model.workflows.execution_service import WorkflowExecutionService
@@ -56,6 +56,8 @@ from fp_common.events import (
     set_dlq_repository,
     start_dlq_subscription,
 )
+from fp_common.mcp import McpResultCache
+from fp_common.mcp.aio_client import default_channel_pool
 
 # Configure structured logging via fp_common (ADR-009)
 configure_logging("ai-model")
@@ -120,7 +122,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         health.set_cache_services(agent_config_cache, prompt_cache)
 
         # Story 0.75.8b: Initialize MCP integration for agent workflows
-        mcp_integration = McpIntegration(cache_ttl_seconds=settings.mcp_tool_cache_ttl_seconds)
+        mcp_result_cache = None
+        if settings.mcp_result_cache_enabled:
+            mcp_result_cache = McpResultCache(
+                max_entries=settings.mcp_result_cache_max_entries,
+                max_bytes=settings.mcp_result_cache_max_bytes,
+            )
+        mcp_integration = McpIntegration(
+            cache_ttl_seconds=settings.mcp_tool_cache_ttl_seconds,
+            result_cache=mcp_result_cache,
+        )
 
         # Extract unique servers from all cached agent configs and register
         # Note: agent_configs is a dict[str, AgentConfig], need to pass values as list
@@ -186,9 +197,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             # Story 13.7: Create DAPR client for cost event publishing
             dapr_client = DaprClient()
 
+            # Shared buckets keep the OpenRouter budget when running several replicas
+            rate_limit_backend = None
+            if settings.llm_rate_limit_backend == "mongodb":
+                rate_limit_backend = MongoDBRateLimitBackend(db, settings.llm_rate_limit_collection)
             rate_limiter = RateLimiter(
                 rpm=settings.llm_rate_limit_rpm,
                 tpm=settings.llm_rate_limit_tpm,
+                backend=rate_limit_backend,
+                model_limits=settings.llm_rate_limit_models,
+                agent_type_limits=settings.llm_rate_limit_agent_types,
             )
 
             llm_gateway = LLMGateway(
@@ -230,6 +248,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 mcp_integration=mcp_integration,
                 tool_provider=tool_provider,  # Story 0.75.16b: Wire AgentToolProvider
             )
+            # Compile every workflow graph once, before the first agent request
+            workflow_service.warm_workflow_pool()
 
             # Story 0.75.16b: Create EventPublisher for agent result events
             event_publisher = EventPublisher()
@@ -292,6 +312,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await dapr_client.close()
         logger.info("DAPR client closed")
 
+    # Close pooled MCP gRPC channels
+    await default_channel_pool.close()
+
     await stop_grpc_server()
     await close_mongodb_connection()
     shutdown_tracing()
@@ -14,7 +14,7 @@ from datetime import UTC, datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
-from fp_common.mcp import GrpcMcpTool, McpToolRegistry
+from fp_common.mcp import AioMcpClient, GrpcMcpTool, McpClient, McpResultCache, McpToolRegistry
 
 if TYPE_CHECKING:
     from ai_model.domain.agent_config import AgentConfig
@@ -58,14 +58,18 @@ class McpIntegration:
         self,
         registry: McpToolRegistry | None = None,
         cache_ttl_seconds: int = 300,
+        result_cache: McpResultCache | None = None,
     ) -> None:
         """Initialize MCP integration.
 
         Args:
-            registry: Optional McpToolRegistry instance (creates new if None)
+            registry: Optional McpToolRegistry instance (creates new if None,
+                backed by pooled AioMcpClient instances)
             cache_ttl_seconds: TTL for discovered tools cache (default 5 minutes)
+            result_cache: Optional result cache for idempotent tool calls, used
+                when a new registry is created
         """
-        self._registry = registry or McpToolRegistry()
+        self._registry = registry or McpToolRegistry(client_factory=AioMcpClient, result_cache=result_cache)
         self._registered_servers: set[str] = set()
         self._server_status: dict[str, ServerStatus] = {}
         self._last_discovery: datetime | None = None
@@ -191,6 +195,29 @@ class McpIntegration:
 
         return self._registry.get_tool(app_id, tool_name)
 
+    def get_client(self, server: str) -> McpClient:
+        """Get the registry's client for a server, registering it if needed.
+
+        Workflows that call MCP tools directly (e.g. tiered-vision image
+        fetches) use this so their calls go through the shared pooled client
+        and, when configured, the result cache.
+
+        Args:
+            server: Server name (short form, e.g., 'collection')
+
+        Returns:
+            The server's client (cache-wrapped if a result cache is configured)
+        """
+        app_id = SERVER_APP_ID_MAP.get(server, f"{server}-mcp")
+
+        if app_id not in self._registered_servers:
+            self._registry.register_server(app_id)
+            self._registered_servers.add(app_id)
+            self._server_status[app_id] = ServerStatus.REGISTERED
+            logger.debug("Registered MCP server on client request: %s", app_id)
+
+        return self._registry.get_client(app_id)
+
     @property
     def registered_servers(self) -> set[str]:
         """Get set of registered server app-ids."""
@@ -28,6 +28,7 @@ from ai_model.services.document_extractor import (
     ExtractionResult,
     PasswordProtectedError,
 )
+from ai_model.services.embedding_cache import EmbeddingCache
 from ai_model.services.embedding_service import (
     EmbeddingBatchError,
     EmbeddingService,
@@ -56,6 +57,7 @@ __all__ = [
     "DocumentExtractor",
     "DocumentNotFoundError",
     "EmbeddingBatchError",
+    "EmbeddingCache",
     "EmbeddingService",
     "EmbeddingServiceError",
     "ExtractionError",
@@ -3,11 +3,19 @@
 This module provides functions for detecting and removing near-duplicate
 chunks from retrieval results using Jaccard similarity on word tokens.
 
+deduplicate_matches tokenizes each chunk once and uses prefix-filter
+signatures (an inverted index over the rarest tokens of each kept chunk)
+to select candidate pairs, so only plausible duplicates are verified with
+an exact Jaccard computation. Results are identical to the pairwise scan
+in deduplicate_matches_exact, which is kept as the reference path.
+
 Story 0.75.15: RAG Ranking Logic
 """
 
 from __future__ import annotations
 
+import math
+from collections import Counter, defaultdict
 from typing import TYPE_CHECKING
 
 import structlog
@@ -42,27 +50,146 @@ def calculate_jaccard_similarity(text_a: str, text_b: str) -> float:
     if not text_a or not text_b:
         return 0.0
 
-    # Tokenize (simple word split, lowercased)
-    tokens_a = set(text_a.lower().split())
-    tokens_b = set(text_b.lower().split())
+    return _jaccard(_tokenize(text_a), _tokenize(text_b))
+
+
+def _tokenize(text: str) -> frozenset[str]:
+    """Tokenize text into a set of lowercased words (simple whitespace split)."""
+    return frozenset(text.lower().split()) if text else frozenset()
 
-    # Handle empty token sets
+
+def _jaccard(tokens_a: frozenset[str], tokens_b: frozenset[str]) -> float:
+    """Jaccard coefficient of two token sets (0.0 if either is empty)."""
     if not tokens_a or not tokens_b:
         return 0.0
 
     # Calculate Jaccard coefficient: intersection / union
     intersection = len(tokens_a & tokens_b)
-    union = len(tokens_a | tokens_b)
+    union = len(tokens_a) + len(tokens_b) - intersection
 
     return intersection / union if union > 0 else 0.0
 
 
+def _prefix_length(size: int, threshold: float) -> int:
+    """Number of leading (rarest) tokens that must be indexed/probed.
+
+    If J(x, y) >= t then |x & y| >= ceil(t * |x|), so x and y must share
+    at least one token among their first |x| - ceil(t * |x|) + 1 tokens
+    under a common global ordering. The epsilon errs on a longer prefix
+    so floating-point rounding can never drop a true duplicate.
+    """
+    return size - math.ceil(threshold * size - 1e-9) + 1
+
+
+def _log_duplicate(match: RankedMatch, existing: RankedMatch, similarity: float, threshold: float) -> None:
+    logger.debug(
+        "Duplicate detected",
+        new_chunk_id=match.chunk_id,
+        existing_chunk_id=existing.chunk_id,
+        similarity=round(similarity, 3),
+        threshold=threshold,
+    )
+
+
+def _log_completed(original_count: int, deduplicated_count: int, removed_count: int, threshold: float) -> None:
+    if removed_count > 0:
+        logger.info(
+            "Deduplication completed",
+            original_count=original_count,
+            deduplicated_count=deduplicated_count,
+            removed_count=removed_count,
+            threshold=threshold,
+        )
+
+
 def deduplicate_matches(
     matches: list[RankedMatch],
     threshold: float = 0.9,
 ) -> tuple[list[RankedMatch], int]:
     """Remove near-duplicate matches based on content similarity.
 
+    Same contract and results as deduplicate_matches_exact, but each
+    match is tokenized once and compared only against kept matches that
+    share a prefix-signature token, instead of against every kept match.
+
+    Args:
+        matches: List of RankedMatch objects to deduplicate.
+        threshold: Similarity threshold (0-1). Pairs above this are duplicates.
+
+    Returns:
+        Tuple of (deduplicated matches list, count of removed duplicates).
+
+    Note:
+        The input list should be sorted by rerank_score descending so that
+        higher-scored matches are kept over lower-scored duplicates.
+    """
+    if not matches:
+        return [], 0
+
+    if threshold <= 0.0:
+        # No deduplication if threshold is 0 or negative
+        return list(matches), 0
+
+    if threshold > 1.0:
+        # Jaccard never exceeds 1.0, so nothing can be a duplicate
+        return list(matches), 0
+
+    token_sets = [_tokenize(match.content) for match in matches]
+
+    # Global ordering: rarest tokens first keeps inverted-index lists short
+    frequency = Counter(token for tokens in token_sets for token in tokens)
+    signatures = [sorted(tokens, key=lambda token: (frequency[token], token)) for tokens in token_sets]
+
+    deduplicated: list[RankedMatch] = []
+    kept_tokens: list[frozenset[str]] = []
+    index: defaultdict[str, list[int]] = defaultdict(list)
+    removed_count = 0
+
+    for match, tokens, signature in zip(matches, token_sets, signatures, strict=True):
+        prefix = signature[: _prefix_length(len(signature), threshold)] if tokens else []
+
+        candidates: set[int] = set()
+        for token in prefix:
+            candidates.update(index.get(token, ()))
+
+        # Size filter: J(x, y) <= min(|x|, |y|) / max(|x|, |y|)
+        min_size = threshold * len(tokens) - 1e-9
+        max_size = len(tokens) / threshold + 1e-9
+
+        # Check in keep order so the reported existing match mirrors the exact scan
+        is_duplicate = False
+        for position in sorted(candidates):
+            other = kept_tokens[position]
+            if not min_size <= len(other) <= max_size:
+                continue
+            similarity = _jaccard(tokens, other)
+            if similarity >= threshold:
+                _log_duplicate(match, deduplicated[position], similarity, threshold)
+                is_duplicate = True
+                break
+
+        if is_duplicate:
+            removed_count += 1
+            continue
+
+        position = len(deduplicated)
+        deduplicated.append(match)
+        kept_tokens.append(tokens)
+        for token in prefix:
+            index[token].append(position)
+
+    _log_completed(len(matches), len(deduplicated), removed_count, threshold)
+
+    return deduplicated, removed_count
+
+
+def deduplicate_matches_exact(
+    matches: list[RankedMatch],
+    threshold: float = 0.9,
+) -> tuple[list[RankedMatch], int]:
+    """Remove near-duplicate matches with a pairwise Jaccard scan.
+
+    Reference implementation for deduplicate_matches: O(n^2) comparisons.
     Compares each match's content with all preceding matches. If the
     Jaccard similarity exceeds the threshold, the match is considered
     a duplicate and removed. Keeps the match with the highest rerank_score.
@@ -96,13 +223,7 @@ def deduplicate_matches(
             similarity = calculate_jaccard_similarity(match.content, existing.content)
 
             if similarity >= threshold:
-                logger.debug(
-                    "Duplicate detected",
-                    new_chunk_id=match.chunk_id,
-                    existing_chunk_id=existing.chunk_id,
-                    similarity=round(similarity, 3),
-                    threshold=threshold,
-                )
+                _log_duplicate(match, existing, similarity, threshold)
                 is_duplicate = True
                 removed_count += 1
                 break
@@ -110,13 +231,6 @@ def deduplicate_matches(
         if not is_duplicate:
             deduplicated.append(match)
 
-    if removed_count > 0:
-        logger.info(
-            "Deduplication completed",
-            original_count=len(matches),
-            deduplicated_count=len(deduplicated),
-            removed_count=removed_count,
-            threshold=threshold,
-        )
+    _log_completed(len(matches), len(deduplicated), removed_count, threshold)
 
     return deduplicated, removed_count
@@ -0,0 +1,146 @@
+"""Content-addressed embedding cache.
+
+Embeddings are keyed by (embedding model, input type, normalized text), so a
+text embedded once - e.g. a chunk unchanged between two versions of a RAG
+document - is never sent to Pinecone Inference again. Lookups go through an
+optional in-process LRU, then MongoDB (EmbeddingCacheRepository).
+
+The cache is best-effort: MongoDB errors are logged and treated as misses.
+
+Story 0.75.12: RAG Embedding Configuration (Pinecone Inference)
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import structlog
+from ai_model.domain.embedding import CachedEmbedding
+from ai_model.infrastructure.repositories.embedding_cache_repository import EmbeddingCacheRepository
+from opentelemetry import metrics
+
+logger = structlog.get_logger(__name__)
+
+# OpenTelemetry metrics
+meter = metrics.get_meter(__name__)
+embedding_cache_lookups_counter = meter.create_counter(
+    name="embedding_cache_lookups_total",
+    description="Embedding cache lookups by result (hit/miss) and tier",
+    unit="1",
+)
+
+
+def embedding_cache_key(model: str, input_type: str, text: str) -> str:
+    """Return the cache key of a text.
+
+    Whitespace is normalized (runs collapsed, ends stripped) so re-chunking
+    that only changes spacing still hits the cache.
+
+    Args:
+        model: Embedding model.
+        input_type: Input type the text is embedded with (passage/query).
+        text: The text.
+
+    Returns:
+        Hex SHA256 digest.
+    """
+    normalized = " ".join(text.split())
+    return hashlib.sha256(f"{model}\n{input_type}\n{normalized}".encode()).hexdigest()
+
+
+class EmbeddingCache:
+    """Two-tier embedding cache: in-process LRU, then MongoDB.
+
+    Attributes:
+        hits: Keys found (in either tier).
+        misses: Keys not found.
+    """
+
+    def __init__(
+        self,
+        repository: EmbeddingCacheRepository | None = None,
+        lru_size: int = 0,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            repository: Persistent tier (None for an in-process cache only).
+            lru_size: Max embeddings kept in the in-process LRU (0 disables it).
+        """
+        self._repository = repository
+        self._lru_size = lru_size
+        self._lru: OrderedDict[str, CachedEmbedding] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of looked up keys found (0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _remember(self, key: str, entry: CachedEmbedding) -> None:
+        if self._lru_size <= 0:
+            return
+        self._lru[key] = entry
+        self._lru.move_to_end(key)
+        while len(self._lru) > self._lru_size:
+            self._lru.popitem(last=False)
+
+    async def get_many(self, keys: list[str]) -> dict[str, CachedEmbedding]:
+        """Look up embeddings, LRU first, then one MongoDB read for the rest.
+
+        Args:
+            keys: Cache keys (duplicates allowed).
+
+        Returns:
+            Cached embedding by key, for the keys found.
+        """
+        found: dict[str, CachedEmbedding] = {}
+        missing: list[str] = []
+        for key in dict.fromkeys(keys):
+            entry = self._lru.get(key)
+            if entry is not None:
+                self._lru.move_to_end(key)
+                found[key] = entry
+            else:
+                missing.append(key)
+        memory_hits = len(found)
+
+        if missing and self._repository is not None:
+            try:
+                stored = await self._repository.get_many(missing)
+            except Exception as e:
+                logger.warning("Embedding cache lookup failed", keys=len(missing), error=str(e))
+                stored = {}
+            for key, entry in stored.items():
+                found[key] = entry
+                self._remember(key, entry)
+
+        store_hits = len(found) - memory_hits
+        misses = len(missing) - store_hits
+        self.hits += len(found)
+        self.misses += misses
+        if memory_hits:
+            embedding_cache_lookups_counter.add(memory_hits, {"result": "hit", "tier": "memory"})
+        if store_hits:
+            embedding_cache_lookups_counter.add(store_hits, {"result": "hit", "tier": "mongodb"})
+        if misses:
+            embedding_cache_lookups_counter.add(misses, {"result": "miss"})
+        return found
+
+    async def put_many(self, entries: dict[str, CachedEmbedding], model: str, input_type: str) -> None:
+        """Store freshly computed embeddings in both tiers.
+
+        Args:
+            entries: Embedding by cache key.
+            model: Embedding model that produced them.
+            input_type: Input type they were embedded with.
+        """
+        for key, entry in entries.items():
+            self._remember(key, entry)
+        if self._repository is None or not entries:
+            return
+        try:
+            await self._repository.put_many(entries, model=model, input_type=input_type)
+        except Exception as e:
+            logger.warning("Embedding cache write failed", entries=len(entries), error=str(e))
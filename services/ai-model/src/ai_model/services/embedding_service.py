@@ -5,6 +5,8 @@ multilingual-e5-large model. It handles:
 - Single and batch embedding operations
 - Automatic batching for large requests (max 96 texts per batch)
 - Retry logic with exponential backoff for transient errors
+- Optional content-addressed embedding cache (texts embedded before are not
+  sent to Pinecone again)
 - Cost publishing via DAPR pub/sub (Story 13.7, ADR-016)
 
 Story 0.75.12: RAG Embedding Configuration (Pinecone Inference)
@@ -12,6 +14,7 @@ Story 13.7: Refactored to publish costs via DAPR instead of persisting locally (
 """
 
 import asyncio
+import itertools
 import uuid
 from datetime import UTC, datetime
 from decimal import Decimal
@@ -20,10 +23,12 @@ from typing import Any
 import structlog
 from ai_model.config import Settings
 from ai_model.domain.embedding import (
+    CachedEmbedding,
     EmbeddingInputType,
     EmbeddingResult,
     EmbeddingUsage,
 )
+from ai_model.services.embedding_cache import EmbeddingCache, embedding_cache_key
 from dapr.aio.clients import DaprClient
 from fp_common.events.cost_recorded import CostRecordedEvent, CostType, CostUnit
 from pinecone import Pinecone
@@ -66,6 +71,7 @@ class EmbeddingService:
     - Single query embedding
     - Batch passage embedding with automatic chunking
     - Retry logic for transient errors
+    - Embedding cache lookups before calling Pinecone (if configured)
     - Cost publishing via DAPR (Story 13.7, ADR-016)
 
     The service requires Pinecone API key to be configured in settings.
@@ -81,6 +87,7 @@ class EmbeddingService:
         dapr_client: DaprClient | None = None,
         pubsub_name: str = "pubsub",
         cost_topic: str = "platform.cost.recorded",
+        cache: EmbeddingCache | None = None,
     ) -> None:
         """Initialize the embedding service.
 
@@ -89,11 +96,13 @@ class EmbeddingService:
             dapr_client: DAPR client for publishing cost events (Story 13.7, ADR-016).
             pubsub_name: DAPR pub/sub component name (default: "pubsub").
             cost_topic: Topic for cost events (default: "platform.cost.recorded").
+            cache: Embedding cache consulted before calling Pinecone (None disables caching).
         """
         self._settings = settings
         self._dapr_client = dapr_client
         self._pubsub_name = pubsub_name
         self._cost_topic = cost_topic
+        self._cache = cache
         self._client: Pinecone | None = None
 
     def _get_client(self) -> Pinecone:
@@ -127,7 +136,9 @@ class EmbeddingService:
         """Embed multiple texts with automatic batching.
 
         This method handles batching automatically if the number of texts
-        exceeds the Pinecone batch limit (96 texts per request).
+        exceeds the Pinecone batch limit (96 texts per request). With a
+        cache, only texts not found in it are embedded (once per distinct
+        text), and the new embeddings are added to it.
 
         Args:
             texts: List of texts to embed (any length - will be batched).
@@ -151,19 +162,35 @@ class EmbeddingService:
             )
 
         request_id = request_id or str(uuid.uuid4())
+        model = self._settings.pinecone_embedding_model
         batch_size = self._settings.embedding_batch_size
         all_embeddings: list[list[float]] = []
         total_tokens = 0
         batch_count = 0
         retry_count = 0
 
+        # Texts to send to Pinecone: all of them, or the distinct cache misses
+        keys: list[str] = []
+        cached: dict[str, CachedEmbedding] = {}
+        fresh: dict[str, CachedEmbedding] = {}
+        pending_keys: list[str] = []
+        pending = texts
+        if self._cache is not None:
+            keys = [embedding_cache_key(model, input_type.value, text) for text in texts]
+            cached = await self._cache.get_many(keys)
+            missed = {key: text for key, text in zip(keys, texts, strict=True) if key not in cached}
+            pending_keys, pending = list(missed), list(missed.values())
+        cached_count = sum(1 for key in keys if key in cached)
+        tokens_saved = sum(cached[key].tokens for key in keys if key in cached)
+
         # Split texts into batches
-        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        batches = [pending[i : i + batch_size] for i in range(0, len(pending), batch_size)]
 
         logger.info(
             "Starting batch embedding",
             request_id=request_id,
             total_texts=len(texts),
+            cached_texts=cached_count,
             batch_count=len(batches),
             input_type=input_type.value,
         )
@@ -179,6 +206,11 @@ class EmbeddingService:
                 total_tokens += batch_result["tokens"]
                 batch_count += 1
                 retry_count += batch_retries
+                if self._cache is not None:
+                    batch_keys = pending_keys[batch_idx * batch_size : batch_idx * batch_size + len(batch)]
+                    shares = self._token_shares(batch, batch_result["tokens"])
+                    for key, values, tokens in zip(batch_keys, batch_result["embeddings"], shares, strict=True):
+                        fresh[key] = CachedEmbedding(values=values, tokens=tokens)
             except Exception as e:
                 logger.error(
                     "Batch embedding failed",
@@ -186,15 +218,20 @@ class EmbeddingService:
                     batch_index=batch_idx,
                     error=str(e),
                 )
+                # Keep what was embedded before the failure
+                if self._cache is not None and fresh:
+                    await self._cache.put_many(fresh, model=model, input_type=input_type.value)
                 # Record failure cost event
                 await self._publish_cost_event(
                     request_id=request_id,
-                    texts_count=len(texts),
+                    texts_count=len(pending),
                     tokens_total=total_tokens,
                     knowledge_domain=knowledge_domain,
                     success=False,
                     batch_count=batch_count,
                     retry_count=retry_count,
+                    cached_count=cached_count,
+                    tokens_saved=tokens_saved,
                 )
                 raise EmbeddingBatchError(
                     f"Failed to embed batch {batch_idx}: {e}",
@@ -202,32 +239,55 @@ class EmbeddingService:
                     original_error=e if isinstance(e, Exception) else None,
                 )
 
+        if self._cache is not None:
+            await self._cache.put_many(fresh, model=model, input_type=input_type.value)
+            all_embeddings = [cached[key].values if key in cached else fresh[key].values for key in keys]
+
         # Record successful cost event
         await self._publish_cost_event(
             request_id=request_id,
-            texts_count=len(texts),
+            texts_count=len(pending),
             tokens_total=total_tokens,
             knowledge_domain=knowledge_domain,
             success=True,
             batch_count=batch_count,
             retry_count=retry_count,
+            cached_count=cached_count,
+            tokens_saved=tokens_saved,
         )
 
         logger.info(
             "Batch embedding completed",
             request_id=request_id,
             total_texts=len(texts),
+            cached_texts=cached_count,
             total_tokens=total_tokens,
             batch_count=batch_count,
         )
 
         return EmbeddingResult(
             embeddings=all_embeddings,
-            model=self._settings.pinecone_embedding_model,
+            model=model,
             dimensions=self.E5_LARGE_DIMENSIONS,
-            usage=EmbeddingUsage(total_tokens=total_tokens),
+            usage=EmbeddingUsage(
+                total_tokens=total_tokens,
+                cached_count=cached_count,
+                tokens_saved=tokens_saved,
+            ),
         )
 
+    @staticmethod
+    def _token_shares(batch: list[str], tokens: int) -> list[int]:
+        """Split the tokens of a batch between its texts, by text length.
+
+        Pinecone only reports usage per request; the shares are what a
+        cached text is counted as saving when it is served again.
+        """
+        total_chars = sum(len(text) for text in batch) or 1
+        # Shares of cumulative lengths, so they add up to the batch tokens
+        bounds = [tokens * chars // total_chars for chars in itertools.accumulate(len(text) for text in batch)]
+        return [upper - lower for lower, upper in zip([0, *bounds], bounds, strict=False)]
+
     async def _embed_batch_with_retry(
         self,
         batch: list[str],
@@ -365,6 +425,8 @@ class EmbeddingService:
         success: bool,
         batch_count: int,
         retry_count: int,
+        cached_count: int = 0,
+        tokens_saved: int = 0,
     ) -> None:
         """Publish embedding cost event to platform-cost service via DAPR (Story 13.7, ADR-016).
 
@@ -373,12 +435,14 @@ class EmbeddingService:
 
         Args:
             request_id: Correlation ID for tracing.
-            texts_count: Number of texts embedded.
+            texts_count: Number of texts sent to Pinecone.
             tokens_total: Total tokens processed.
             knowledge_domain: Domain for cost attribution.
             success: Whether the operation succeeded.
             batch_count: Number of batches used.
             retry_count: Number of retries.
+            cached_count: Texts served from the embedding cache.
+            tokens_saved: Tokens the cached texts would have cost.
         """
         if self._dapr_client is None:
             logger.debug("DAPR client not configured, skipping cost event")
@@ -387,6 +451,7 @@ class EmbeddingService:
         # Calculate USD cost using embedding_cost_per_1k_tokens setting
         cost_per_1k = Decimal(str(self._settings.embedding_cost_per_1k_tokens))
         cost_usd = cost_per_1k * Decimal(tokens_total) / Decimal(1000)
+        savings_usd = cost_per_1k * Decimal(tokens_saved) / Decimal(1000)
 
         try:
             event = CostRecordedEvent(
@@ -405,6 +470,9 @@ class EmbeddingService:
                     "batch_count": max(1, batch_count),
                     "retry_count": retry_count,
                     "knowledge_domain": knowledge_domain,
+                    "cache_hits": cached_count,
+                    "tokens_saved": tokens_saved,
+                    "savings_usd": str(savings_usd),
                 },
             )
 
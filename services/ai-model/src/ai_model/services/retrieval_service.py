@@ -4,12 +4,16 @@ This service orchestrates the retrieval pipeline:
 1. Embed query using EmbeddingService
 2. Search vectors using PineconeVectorStore
 3. Apply confidence threshold filtering
-4. Fetch chunk content from MongoDB
+4. Fetch chunk content from MongoDB (one batched read, optional LRU)
 
 Story 0.75.14: RAG Retrieval Service
 """
 
+import time
+from collections import OrderedDict
+
 import structlog
+from ai_model.domain.rag_document import RagChunk
 from ai_model.infrastructure.pinecone_vector_store import (
     PineconeNotConfiguredError as VectorStoreNotConfiguredError,
     PineconeVectorStore,
@@ -24,6 +28,39 @@ from fp_common.models import RetrievalMatch, RetrievalQuery, RetrievalResult
 logger = structlog.get_logger(__name__)
 
 
+class _ChunkCache:
+    """Bounded LRU of recently hydrated chunks.
+
+    Entries are keyed by (chunk_id, content version), where the content
+    version is the Pinecone namespace the match came from
+    (knowledge-v{version}[-staged|-archived]). Chunk IDs already embed the
+    document version, so a new document version never reads a stale entry;
+    the TTL bounds staleness when a version is re-chunked in place.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, str], tuple[float, RagChunk]] = OrderedDict()
+
+    def get(self, key: tuple[str, str]) -> RagChunk | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, chunk = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return chunk
+
+    def put(self, key: tuple[str, str], chunk: RagChunk) -> None:
+        self._entries[key] = (time.monotonic() + self._ttl_seconds, chunk)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+
 class RetrievalService:
     """Retrieval service for RAG knowledge queries.
 
@@ -36,6 +73,8 @@ class RetrievalService:
     - Domain filtering via Pinecone metadata
     - Confidence threshold filtering (post-query)
     - Multi-domain queries
+    - Batched chunk hydration (single MongoDB read per query)
+    - Optional bounded LRU of recently hydrated chunks
     - Graceful handling of Pinecone not configured
 
     All operations are async.
@@ -46,6 +85,8 @@ class RetrievalService:
         embedding_service: EmbeddingService,
         vector_store: PineconeVectorStore,
         chunk_repository: RagChunkRepository,
+        chunk_cache_size: int = 0,
+        chunk_cache_ttl_seconds: float = 300.0,
     ) -> None:
         """Initialize the retrieval service with dependencies.
 
@@ -53,10 +94,13 @@ class RetrievalService:
             embedding_service: Service for generating query embeddings.
             vector_store: Pinecone vector store for similarity search.
             chunk_repository: MongoDB repository for chunk content.
+            chunk_cache_size: Max chunks kept in the in-process LRU (0 disables it).
+            chunk_cache_ttl_seconds: How long a cached chunk stays valid.
         """
         self._embedding_service = embedding_service
         self._vector_store = vector_store
         self._chunk_repository = chunk_repository
+        self._chunk_cache = _ChunkCache(chunk_cache_size, chunk_cache_ttl_seconds) if chunk_cache_size > 0 else None
 
     async def retrieve(
         self,
@@ -169,8 +213,8 @@ class RetrievalService:
             confidence_threshold=confidence_threshold,
         )
 
-        # Step 4: Fetch chunk content from MongoDB
-        retrieval_matches: list[RetrievalMatch] = []
+        # Step 4: Fetch chunk content from MongoDB (cache first, then one batched read)
+        hydrate_matches = []
         for match in filtered_matches:
             if not match.metadata:
                 logger.warning(
@@ -178,9 +222,17 @@ class RetrievalService:
                     vector_id=match.id,
                 )
                 continue
+            hydrate_matches.append((match, match.metadata))
 
-            chunk_id = match.metadata.chunk_id
-            chunk = await self._chunk_repository.get_by_id(chunk_id)
+        chunks = await self._hydrate_chunks(
+            [metadata.chunk_id for _, metadata in hydrate_matches],
+            namespace,
+        )
+
+        retrieval_matches: list[RetrievalMatch] = []
+        for match, metadata in hydrate_matches:
+            chunk_id = metadata.chunk_id
+            chunk = chunks.get(chunk_id)
 
             if chunk is None:
                 logger.warning(
@@ -192,21 +244,21 @@ class RetrievalService:
 
             # Build metadata dict for additional info
             additional_metadata: dict[str, str | list[str] | None] = {}
-            if match.metadata.region:
-                additional_metadata["region"] = match.metadata.region
-            if match.metadata.season:
-                additional_metadata["season"] = match.metadata.season
-            if match.metadata.tags:
-                additional_metadata["tags"] = match.metadata.tags
+            if metadata.region:
+                additional_metadata["region"] = metadata.region
+            if metadata.season:
+                additional_metadata["season"] = metadata.season
+            if metadata.tags:
+                additional_metadata["tags"] = metadata.tags
 
             retrieval_matches.append(
                 RetrievalMatch(
                     chunk_id=chunk_id,
                     content=chunk.content,
                     score=match.score,
-                    document_id=match.metadata.document_id,
-                    title=match.metadata.title,
-                    domain=match.metadata.domain,
+                    document_id=metadata.document_id,
+                    title=metadata.title,
+                    domain=metadata.domain,
                     metadata=additional_metadata,
                 )
             )
@@ -227,6 +279,52 @@ class RetrievalService:
             total_matches=total_matches,
         )
 
+    async def _hydrate_chunks(
+        self,
+        chunk_ids: list[str],
+        namespace: str | None,
+    ) -> dict[str, RagChunk]:
+        """Resolve chunk content, serving from the LRU where possible.
+
+        Cache misses are fetched with a single RagChunkRepository.get_by_ids
+        call, so each query costs at most one MongoDB round-trip.
+
+        Args:
+            chunk_ids: Chunk IDs in Pinecone score order.
+            namespace: Pinecone namespace, used as the cache content version.
+
+        Returns:
+            Mapping of chunk_id to chunk for every chunk that was found.
+        """
+        if not chunk_ids:
+            return {}
+
+        version = namespace or ""
+        chunks: dict[str, RagChunk] = {}
+        missing: list[str] = []
+
+        for chunk_id in chunk_ids:
+            cached = self._chunk_cache.get((chunk_id, version)) if self._chunk_cache is not None else None
+            if cached is not None:
+                chunks[chunk_id] = cached
+            elif chunk_id not in missing:
+                missing.append(chunk_id)
+
+        if missing:
+            for chunk in await self._chunk_repository.get_by_ids(missing):
+                chunks[chunk.chunk_id] = chunk
+                if self._chunk_cache is not None:
+                    self._chunk_cache.put((chunk.chunk_id, version), chunk)
+
+        logger.debug(
+            "Chunks hydrated",
+            requested=len(chunk_ids),
+            cache_hits=len(chunk_ids) - len(missing),
+            fetched=len(missing),
+        )
+
+        return chunks
+
     async def retrieve_from_query(self, retrieval_query: RetrievalQuery) -> RetrievalResult:
         """Retrieve using a RetrievalQuery object.
 
@@ -9,6 +9,8 @@ full vectorization flow:
 
 The pipeline supports:
 - Batch processing for memory efficiency
+- Pipelined stages: embedding of the next batch overlaps the Pinecone upsert
+  and chunk updates of the current one (bounded queue between the stages)
 - Partial failure handling (continues with remaining chunks)
 - Progress tracking and async job support
 - Namespace-based version isolation
@@ -16,7 +18,9 @@ The pipeline supports:
 Story 0.75.13b: RAG Vectorization Pipeline (Orchestration)
 """
 
+import asyncio
 import hashlib
+import time
 import uuid
 from datetime import UTC, datetime
 
@@ -50,6 +54,9 @@ __all__ = [
     "VectorizationPipeline",
 ]
 
+# Minimum interval between IN_PROGRESS updates of the job repository
+PROGRESS_REPORT_INTERVAL_SECONDS = 1.0
+
 
 class VectorizationPipeline:
     """Orchestrates the full vectorization flow for RAG documents.
@@ -62,7 +69,9 @@ class VectorizationPipeline:
 
     The pipeline processes chunks in configurable batches (default: 50)
     and handles partial failures gracefully, continuing with remaining
-    chunks when some fail.
+    chunks when some fail. Batches flow through two stages - embed, then
+    store (upsert + one bulk chunk update) - connected by a queue of
+    vectorization_pipeline_depth batches.
     """
 
     def __init__(
@@ -210,9 +219,12 @@ class VectorizationPipeline:
         This is the main entry point for vectorization. It:
         1. Loads the document and validates status
         2. Gets all un-vectorized chunks
-        3. Processes chunks in batches (embed + store)
-        4. Updates chunk records with Pinecone IDs
-        5. Updates document with namespace, IDs, and content hash
+        3. Processes chunks in batches: the embed stage runs ahead of the
+           store stage (upsert + chunk records updated with Pinecone IDs)
+        4. Updates document with namespace, IDs, and content hash
+
+        While running, the job is reported IN_PROGRESS with its progress
+        (at most every PROGRESS_REPORT_INTERVAL_SECONDS).
 
         Args:
             document_id: The stable document ID (e.g., "disease-diagnosis-guide").
@@ -295,45 +307,76 @@ class VectorizationPipeline:
             batch_size=batch_size,
         )
 
-        for batch_idx, batch in enumerate(batches):
-            try:
-                batch_ids = await self._process_batch(
-                    batch=batch,
-                    document=document,
-                    namespace=namespace,
-                    job_id=job_id,
-                    batch_idx=batch_idx,
+        def record_failure(batch: list[RagChunk], batch_idx: int, stage: str, error: Exception) -> None:
+            # Log error but continue with next batch
+            logger.error(
+                "Batch processing failed",
+                job_id=job_id,
+                batch_idx=batch_idx,
+                stage=stage,
+                error=str(error),
+            )
+            # Track individual failures
+            for chunk in batch:
+                failed_chunks.append(
+                    FailedChunk(
+                        chunk_id=chunk.chunk_id,
+                        chunk_index=chunk.chunk_index,
+                        error_message=str(error),
+                    )
                 )
-                all_pinecone_ids.extend(batch_ids)
-                progress.chunks_embedded += len(batch)
-                progress.chunks_stored += len(batch)
+            progress.failed_count += len(batch)
 
-                logger.debug(
-                    "Batch processed successfully",
-                    job_id=job_id,
-                    batch_idx=batch_idx,
-                    batch_size=len(batch),
-                )
+        # Embedded batches waiting for the store stage; None marks the end
+        embedded: asyncio.Queue[tuple[int, list[RagChunk], list[VectorUpsertRequest]] | None] = asyncio.Queue(
+            maxsize=max(1, self._settings.vectorization_pipeline_depth)
+        )
 
-            except Exception as e:
-                # Log error but continue with next batch
-                logger.error(
-                    "Batch processing failed",
-                    job_id=job_id,
-                    batch_idx=batch_idx,
-                    error=str(e),
-                )
-                # Track individual failures
-                for chunk in batch:
-                    failed_chunks.append(
-                        FailedChunk(
-                            chunk_id=chunk.chunk_id,
-                            chunk_index=chunk.chunk_index,
-                            error_message=str(e),
-                        )
+        async def embed_stage() -> None:
+            for batch_idx, batch in enumerate(batches):
+                try:
+                    vectors = await self._embed_batch(
+                        batch=batch,
+                        document=document,
+                        job_id=job_id,
+                        batch_idx=batch_idx,
+                    )
+                except Exception as e:
+                    record_failure(batch, batch_idx, "embed", e)
+                    continue
+                progress.chunks_embedded += len(batch)
+                await embedded.put((batch_idx, batch, vectors))
+            await embedded.put(None)
+
+        await self._report_progress(job_id, document, namespace, progress, started_at)
+        last_report = time.monotonic()
+
+        embed_task = asyncio.create_task(embed_stage())
+        try:
+            while (item := await embedded.get()) is not None:
+                batch_idx, batch, vectors = item
+                try:
+                    batch_ids = await self._store_batch(batch=batch, vectors=vectors, namespace=namespace)
+                except Exception as e:
+                    record_failure(batch, batch_idx, "store", e)
+                else:
+                    all_pinecone_ids.extend(batch_ids)
+                    progress.chunks_stored += len(batch)
+                    logger.debug(
+                        "Batch processed successfully",
+                        job_id=job_id,
+                        batch_idx=batch_idx,
+                        batch_size=len(batch),
                     )
-                progress.failed_count += len(batch)
-                continue
+
+                if time.monotonic() - last_report >= PROGRESS_REPORT_INTERVAL_SECONDS:
+                    await self._report_progress(job_id, document, namespace, progress, started_at)
+                    last_report = time.monotonic()
+            await embed_task
+        finally:
+            if not embed_task.done():
+                embed_task.cancel()
+                await asyncio.gather(embed_task, return_exceptions=True)
 
         # 5. Compute content hash
         content_hash = self._compute_content_hash(chunks)
@@ -399,35 +442,72 @@ class VectorizationPipeline:
 
         return result
 
-    async def _process_batch(
+    async def _report_progress(
         self,
-        batch: list[RagChunk],
+        job_id: str,
         document: RagDocument,
         namespace: str,
+        progress: VectorizationProgress,
+        started_at: datetime,
+    ) -> None:
+        """Record an IN_PROGRESS snapshot of a running job.
+
+        Updates the in-memory cache and, if available, the job repository.
+        Repository failures are logged and do not stop the job.
+
+        Args:
+            job_id: The job being processed.
+            document: The document being vectorized.
+            namespace: Target Pinecone namespace.
+            progress: Current progress counters (copied).
+            started_at: When the job started.
+        """
+        snapshot = VectorizationResult(
+            job_id=job_id,
+            status=VectorizationJobStatus.IN_PROGRESS,
+            document_id=document.document_id,
+            document_version=document.version,
+            namespace=namespace,
+            progress=progress.model_copy(),
+            started_at=started_at,
+        )
+        self._jobs[job_id] = snapshot
+
+        if self._job_repository is not None:
+            try:
+                await self._job_repository.update(snapshot)
+            except Exception as e:
+                logger.warning(
+                    "Failed to persist job progress to repository",
+                    job_id=job_id,
+                    error=str(e),
+                )
+
+    async def _embed_batch(
+        self,
+        batch: list[RagChunk],
+        document: RagDocument,
         job_id: str,
         batch_idx: int,
-    ) -> list[str]:
-        """Process a single batch of chunks.
+    ) -> list[VectorUpsertRequest]:
+        """Embed a batch of chunks (embed stage).
 
         Steps:
         1. Extract text content for embedding
         2. Generate embeddings via EmbeddingService
         3. Build VectorUpsertRequest objects
-        4. Upsert to Pinecone
-        5. Update chunk records with Pinecone IDs
 
         Args:
             batch: List of chunks to process.
             document: Parent document for metadata.
-            namespace: Target Pinecone namespace.
             job_id: Correlation ID for logging.
             batch_idx: Batch index for logging.
 
         Returns:
-            List of Pinecone vector IDs that were stored.
+            Vectors to upsert, in batch order.
 
         Raises:
-            Exception: If embedding or upsert fails.
+            Exception: If embedding fails.
         """
         # 1. Extract text content
         passages = [chunk.content for chunk in batch]
@@ -451,20 +531,39 @@ class VectorizationPipeline:
                     metadata=metadata,
                 )
             )
+        return vectors
 
-        # 4. Upsert to Pinecone
+    async def _store_batch(
+        self,
+        batch: list[RagChunk],
+        vectors: list[VectorUpsertRequest],
+        namespace: str,
+    ) -> list[str]:
+        """Store an embedded batch (store stage).
+
+        Steps:
+        1. Upsert to Pinecone
+        2. Update chunk records with Pinecone IDs (one bulk write)
+
+        Args:
+            batch: Chunks of the batch.
+            vectors: Their vectors, in batch order.
+            namespace: Target Pinecone namespace.
+
+        Returns:
+            List of Pinecone vector IDs that were stored.
+
+        Raises:
+            Exception: If upsert or chunk update fails.
+        """
+        # 1. Upsert to Pinecone
         await self._vector_store.upsert(vectors=vectors, namespace=namespace)
 
-        # 5. Update chunk records with Pinecone IDs
-        pinecone_ids: list[str] = []
-        for chunk, vector in zip(batch, vectors, strict=True):
-            await self._chunk_repo.update_pinecone_id(
-                chunk_id=chunk.chunk_id,
-                pinecone_id=vector.id,
-            )
-            pinecone_ids.append(vector.id)
+        # 2. Update chunk records with Pinecone IDs
+        pinecone_ids = {chunk.chunk_id: vector.id for chunk, vector in zip(batch, vectors, strict=True)}
+        await self._chunk_repo.bulk_update_pinecone_ids(pinecone_ids)
 
-        return pinecone_ids
+        return list(pinecone_ids.values())
 
     async def _update_document_after_vectorization(
         self,
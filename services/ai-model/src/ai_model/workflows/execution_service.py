@@ -6,6 +6,11 @@ with proper initialization, checkpointing, and error handling.
 Story 0.75.16: LangGraph SDK Integration & Base Workflows
 Story 0.75.16b: Refactored to accept Pydantic AgentConfig models for type safety
 ADR-014: Checkpointing temporarily disabled during Motor → PyMongo Async migration
+
+Workflow instances hold only their dependencies and compiled graph; all
+per-request data travels in the graph state. One compiled workflow per
+(agent type, checkpointer mode) is therefore kept in a pool and shared by
+concurrent executions instead of rebuilding the StateGraph per request.
 """
 
 import uuid
@@ -21,6 +26,7 @@ from ai_model.domain.agent_config import (
     GeneratorConfig,
     TieredVisionConfig,
 )
+from ai_model.workflows.base import WorkflowBuilder
 from ai_model.workflows.conversational import ConversationalWorkflow
 from ai_model.workflows.explorer import ExplorerWorkflow
 from ai_model.workflows.extractor import ExtractorWorkflow
@@ -54,7 +60,7 @@ class WorkflowExecutionService:
     """Service for executing LangGraph workflows.
 
     This service provides:
-    - Workflow factory by agent type
+    - Workflow factory by agent type, with a pool of compiled workflows
     - MongoDB checkpointer integration (using PyMongo for langgraph compatibility)
     - Unified execution interface
     - Proper state initialization
@@ -90,6 +96,7 @@ class WorkflowExecutionService:
         mcp_integration: Any | None = None,  # MCPIntegration
         tool_provider: Any | None = None,  # AgentToolProvider (Story 0.75.16b)
         checkpoint_ttl_seconds: int = 1800,  # 30 minutes
+        pool_workflows: bool = True,
     ) -> None:
         """Initialize the workflow execution service.
 
@@ -101,6 +108,8 @@ class WorkflowExecutionService:
             mcp_integration: Optional MCP integration for context.
             tool_provider: Optional AgentToolProvider for resolving agent tools.
             checkpoint_ttl_seconds: TTL for checkpoints (unused - ADR-014).
+            pool_workflows: Reuse compiled workflows across executions
+                (False builds and compiles one per execution).
         """
         # ADR-014: Checkpointing disabled during Motor → PyMongo Async migration
         # MongoDB client and checkpointer params ignored until migration complete
@@ -110,6 +119,9 @@ class WorkflowExecutionService:
         self._mcp_integration = mcp_integration
         self._tool_provider = tool_provider
         self._checkpointer: Any | None = None
+        self._pool_workflows = pool_workflows
+        # (agent type, checkpointing enabled) -> compiled workflow
+        self._workflow_pool: dict[tuple[AgentType, bool], WorkflowBuilder] = {}
 
     def _get_checkpointer(self) -> Any:
         """Get or create the MongoDB checkpointer.
@@ -119,6 +131,58 @@ class WorkflowExecutionService:
         """
         return None
 
+    def warm_workflow_pool(self) -> int:
+        """Compile the pooled workflow of every agent type ahead of the first request.
+
+        Returns:
+            Number of workflows in the pool.
+        """
+        for agent_type in AgentType:
+            self._get_workflow(agent_type, use_checkpointer=False, checkpointer=None)
+        logger.info("Workflow pool warmed", workflow_count=len(self._workflow_pool))
+        return len(self._workflow_pool)
+
+    def _get_workflow(
+        self,
+        agent_type: AgentType | str,
+        use_checkpointer: bool = False,
+        checkpointer: Any = None,
+    ) -> WorkflowBuilder:
+        """Get the compiled workflow for an agent type, from the pool when enabled.
+
+        Args:
+            agent_type: Type of agent/workflow.
+            use_checkpointer: Whether to enable checkpointing.
+            checkpointer: Optional pre-created checkpointer.
+
+        Returns:
+            Compiled workflow instance (shared between concurrent executions when pooled).
+
+        Raises:
+            WorkflowExecutionError: If agent type is unknown.
+        """
+        agent_type = self._parse_agent_type(agent_type)
+        if not self._pool_workflows:
+            workflow = self._create_workflow(agent_type, use_checkpointer, checkpointer)
+            workflow.compile()
+            return workflow
+
+        key = (agent_type, use_checkpointer and checkpointer is not None)
+        workflow = self._workflow_pool.get(key)
+        if workflow is None:
+            # Compilation is synchronous, so no other execution can interleave here
+            workflow = self._create_workflow(agent_type, use_checkpointer, checkpointer)
+            workflow.compile()
+            self._workflow_pool[key] = workflow
+        return workflow
+
+    @staticmethod
+    def _parse_agent_type(agent_type: AgentType | str) -> AgentType:
+        try:
+            return AgentType(agent_type)
+        except ValueError:
+            raise WorkflowExecutionError(f"Unknown agent type: {agent_type}")
+
     def _create_workflow(
         self,
         agent_type: AgentType | str,
@@ -138,12 +202,7 @@ class WorkflowExecutionService:
         Raises:
             WorkflowExecutionError: If agent type is unknown.
         """
-        if isinstance(agent_type, str):
-            try:
-                agent_type = AgentType(agent_type)
-            except ValueError:
-                raise WorkflowExecutionError(f"Unknown agent type: {agent_type}")
-
+        agent_type = self._parse_agent_type(agent_type)
         cp = checkpointer if use_checkpointer else None
 
         if agent_type == AgentType.EXTRACTOR:
@@ -177,6 +236,8 @@ class WorkflowExecutionService:
             return TieredVisionWorkflow(
                 llm_gateway=self._llm_gateway,
                 ranking_service=self._ranking_service,
+                # Shared registry client: pooled, and result-cached when enabled
+                mcp_client=self._mcp_integration.get_client("collection") if self._mcp_integration else None,
                 checkpointer=cp,
             )
         else:
@@ -240,8 +301,8 @@ class WorkflowExecutionService:
             # ADR-014: Checkpointing disabled, always None
             checkpointer = None
 
-            # Create workflow
-            workflow = self._create_workflow(
+            # Get compiled workflow (pooled)
+            workflow = self._get_workflow(
                 agent_type=agent_type,
                 use_checkpointer=use_checkpointer,
                 checkpointer=checkpointer,
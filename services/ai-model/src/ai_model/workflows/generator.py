@@ -6,6 +6,7 @@ fetch_context → retrieve_knowledge → generate → format → output
 Story 0.75.16: LangGraph SDK Integration & Base Workflows
 """
 
+import asyncio
 import json
 from typing import Any, Literal
 
@@ -361,6 +362,7 @@ class GeneratorWorkflow(WorkflowBuilder[GeneratorState]):
             return {}
 
         context: dict[str, Any] = {}
+        calls: list[tuple[str, str, Any]] = []
 
         for source in mcp_sources:
             server = source.get("server", "")
@@ -374,27 +376,6 @@ class GeneratorWorkflow(WorkflowBuilder[GeneratorState]):
             try:
                 # Get the tool from tool_provider or mcp_integration
                 tool = tool_source.get_tool(server, tool_name)
-
-                # Build tool arguments from input data using arg_mapping
-                tool_args = {}
-                for arg_name, input_key in arg_mapping.items():
-                    if input_key in input_data:
-                        tool_args[arg_name] = input_data[input_key]
-
-                # Invoke the tool
-                result = await tool.ainvoke(tool_args)
-
-                # Store result under server.tool key
-                key = f"{server}.{tool_name}"
-                context[key] = result
-
-                logger.debug(
-                    "MCP tool call succeeded",
-                    server=server,
-                    tool=tool_name,
-                    result_type=type(result).__name__,
-                )
-
             except ValueError as e:
                 # Server not registered or tool not found
                 logger.warning(
@@ -403,14 +384,50 @@ class GeneratorWorkflow(WorkflowBuilder[GeneratorState]):
                     tool=tool_name,
                     error=str(e),
                 )
+                continue
             except Exception as e:
-                # Tool invocation failed
                 logger.warning(
                     "MCP tool call failed",
                     server=server,
                     tool=tool_name,
                     error=str(e),
                 )
+                continue
+
+            # Build tool arguments from input data using arg_mapping
+            tool_args = {}
+            for arg_name, input_key in arg_mapping.items():
+                if input_key in input_data:
+                    tool_args[arg_name] = input_data[input_key]
+
+            calls.append((server, tool_name, tool.ainvoke(tool_args)))
+
+        # Sources are independent, so invoke all tools concurrently
+        results = await asyncio.gather(*(call for _, _, call in calls), return_exceptions=True)
+
+        for (server, tool_name, _), result in zip(calls, results, strict=True):
+            if isinstance(result, Exception):
+                # Tool invocation failed
+                logger.warning(
+                    "MCP tool call failed",
+                    server=server,
+                    tool=tool_name,
+                    error=str(result),
+                )
+                continue
+            if isinstance(result, BaseException):
+                raise result
+
+            # Store result under server.tool key
+            key = f"{server}.{tool_name}"
+            context[key] = result
+
+            logger.debug(
+                "MCP tool call succeeded",
+                server=server,
+                tool=tool_name,
+                result_type=type(result).__name__,
+            )
 
         return context
 
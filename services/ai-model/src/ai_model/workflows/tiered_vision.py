@@ -7,6 +7,7 @@ Story 0.75.16: LangGraph SDK Integration & Base Workflows
 Story 0.75.22: MCP integration for image fetching
 """
 
+import base64
 import json
 from typing import Any, Literal
 
@@ -17,7 +18,8 @@ from ai_model.workflows.states.tiered_vision import (
     ScreenResult,
     TieredVisionState,
 )
-from fp_common.mcp.client import GrpcMcpClient
+from fp_common.mcp.aio_client import AioMcpClient
+from fp_common.mcp.result_cache import McpClient
 from langchain_core.messages import HumanMessage, SystemMessage
 from langgraph.graph import END, START, StateGraph
 
@@ -67,7 +69,7 @@ class TieredVisionWorkflow(WorkflowBuilder[TieredVisionState]):
     def __init__(
         self,
         llm_gateway: Any,  # LLMGateway
-        mcp_client: GrpcMcpClient | None = None,  # MCP client for Collection MCP
+        mcp_client: McpClient | None = None,  # MCP client for Collection MCP
         ranking_service: Any | None = None,  # RankingService
         checkpointer: Any | None = None,
     ) -> None:
@@ -82,7 +84,7 @@ class TieredVisionWorkflow(WorkflowBuilder[TieredVisionState]):
         """
         super().__init__(checkpointer=checkpointer)
         self._llm_gateway = llm_gateway
-        self._mcp_client = mcp_client or GrpcMcpClient(COLLECTION_MCP_APP_ID)
+        self._mcp_client = mcp_client or AioMcpClient(COLLECTION_MCP_APP_ID)
         self._ranking_service = ranking_service
 
     def _get_state_schema(self) -> type[TieredVisionState]:
@@ -145,6 +147,30 @@ class TieredVisionWorkflow(WorkflowBuilder[TieredVisionState]):
 
         return "skip"
 
+    async def _fetch_image(
+        self,
+        tool_name: str,
+        doc_id: str,
+        agent_id: str | None,
+        base64_field: str,
+    ) -> tuple[str, dict[str, Any]]:
+        """Fetch image bytes via MCP and base64-encode them for the LLM data URI.
+
+        Bytes travel raw over the MCP binary transport; servers without it
+        return the image base64-encoded in base64_field instead.
+
+        Returns:
+            Tuple of (base64 image data, tool result metadata).
+        """
+        result, payload = await self._mcp_client.call_tool_binary(
+            tool_name=tool_name,
+            arguments={"document_id": doc_id},
+            caller_agent_id=agent_id,
+        )
+        if payload:
+            return base64.b64encode(payload).decode("ascii"), result
+        return result.get(base64_field, ""), result
+
     @create_node_wrapper("preprocess", "tiered_vision")
     async def _preprocess_node(self, state: TieredVisionState) -> dict[str, Any]:
         """Preprocess: Fetch image(s) via MCP for Tier 1 screening.
@@ -171,12 +197,9 @@ class TieredVisionWorkflow(WorkflowBuilder[TieredVisionState]):
         try:
             if has_thumbnail:
                 # Scenario A: Fetch pre-generated thumbnail for Tier 1
-                result = await self._mcp_client.call_tool(
-                    tool_name="get_document_thumbnail",
-                    arguments={"document_id": doc_id},
-                    caller_agent_id=agent_id,
+                thumbnail_data, result = await self._fetch_image(
+                    "get_document_thumbnail", doc_id, agent_id, "thumbnail_base64"
                 )
-                thumbnail_data = result.get("thumbnail_base64", "")
 
                 logger.debug(
                     "Thumbnail fetched via MCP",
@@ -191,12 +214,7 @@ class TieredVisionWorkflow(WorkflowBuilder[TieredVisionState]):
                 }
             else:
                 # Scenario B: Small image (<256px) - fetch original, use for both tiers
-                result = await self._mcp_client.call_tool(
-                    tool_name="get_document_image",
-                    arguments={"document_id": doc_id},
-                    caller_agent_id=agent_id,
-                )
-                original_data = result.get("image_base64", "")
+                original_data, result = await self._fetch_image("get_document_image", doc_id, agent_id, "image_base64")
 
                 logger.debug(
                     "Original image fetched via MCP (no thumbnail)",
@@ -364,12 +382,7 @@ class TieredVisionWorkflow(WorkflowBuilder[TieredVisionState]):
         if not original_data:
             # Need to fetch original image for Tier 2
             try:
-                result = await self._mcp_client.call_tool(
-                    tool_name="get_document_image",
-                    arguments={"document_id": doc_id},
-                    caller_agent_id=agent_id,
-                )
-                original_data = result.get("image_base64", "")
+                original_data, result = await self._fetch_image("get_document_image", doc_id, agent_id, "image_base64")
                 # Update state with fetched original
                 state_update["original_data"] = original_data
 
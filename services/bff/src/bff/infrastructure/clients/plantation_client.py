@@ -11,6 +11,9 @@ Pattern follows:
 CRITICAL: Uses fp-common domain models for type safety. Never returns dict[str, Any].
 """
 
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
 from datetime import datetime
 
 import grpc
@@ -47,6 +50,7 @@ from fp_common.models import (
     PerformanceSummary,
     PreferredLanguage,
     QualityThresholds,
+    QualityTier,
     Region,
     RegionalWeather,
     RegionCreate,
@@ -72,6 +76,41 @@ from google.protobuf.timestamp_pb2 import Timestamp
 
 logger = structlog.get_logger(__name__)
 
+# Domain -> proto enums for ListFarmers filters
+FARM_SCALE_TO_PROTO: dict[FarmScale, int] = {
+    FarmScale.SMALLHOLDER: plantation_pb2.FARM_SCALE_SMALLHOLDER,
+    FarmScale.MEDIUM: plantation_pb2.FARM_SCALE_MEDIUM,
+    FarmScale.ESTATE: plantation_pb2.FARM_SCALE_ESTATE,
+}
+QUALITY_TIER_TO_PROTO: dict[QualityTier, int] = {
+    QualityTier.TIER_1: plantation_pb2.QUALITY_TIER_TIER_1,
+    QualityTier.TIER_2: plantation_pb2.QUALITY_TIER_TIER_2,
+    QualityTier.TIER_3: plantation_pb2.QUALITY_TIER_TIER_3,
+    QualityTier.BELOW_TIER_3: plantation_pb2.QUALITY_TIER_BELOW_TIER_3,
+}
+QUALITY_TIER_FROM_PROTO: dict[int, QualityTier] = {proto: tier for tier, proto in QUALITY_TIER_TO_PROTO.items()}
+
+# Max farmer IDs per batch RPC (matches plantation-model's MAX_BATCH_FARMER_IDS)
+BATCH_FARMER_IDS_LIMIT = 500
+
+# Max rows per ImportFarmers stream message (matches plantation-model's MAX_IMPORT_ROWS_PER_REQUEST)
+IMPORT_FARMER_ROWS_LIMIT = 1000
+
+
+@dataclass(frozen=True)
+class FarmerImportRowResult:
+    """Outcome of one row of a streamed farmer import.
+
+    Attributes:
+        row_number: Caller's row number (e.g. CSV line).
+        farmer_id: ID of the created farmer, None if the row failed.
+        error: Reason the row was rejected, None if it was created.
+    """
+
+    row_number: int
+    farmer_id: str | None
+    error: str | None
+
 
 def _timestamp_to_datetime(ts: Timestamp) -> datetime | None:
     """Convert protobuf Timestamp to Python datetime."""
@@ -117,9 +156,11 @@ class PlantationClient(BaseGrpcClient):
     Provides 13 read methods and 11 write methods across 5 domains:
 
     Read Operations:
-    - Farmer: get_farmer, get_farmer_by_phone, list_farmers, get_farmer_summary
+    - Farmer: get_farmer, get_farmer_by_phone, list_farmers, get_farmer_summary,
+      get_farmer_summaries (batch)
     - Factory: get_factory, list_factories
-    - Collection Point: get_collection_point, list_collection_points
+    - Collection Point: get_collection_point, list_collection_points,
+      get_collection_points_for_farmers (batch)
     - Region: get_region, list_regions, get_region_weather, get_current_flush
     - Performance: get_performance_summary
 
@@ -220,16 +261,24 @@ class PlantationClient(BaseGrpcClient):
         page_size: int = 50,
         page_token: str | None = None,
         active_only: bool = True,
+        farm_scale: FarmScale | None = None,
+        search: str | None = None,
+        tier: QualityTier | None = None,
     ) -> PaginatedResponse[Farmer]:
         """List farmers with optional filtering.
 
         Story 9.5a: collection_point_id filter removed - use get_farmers_for_collection_point.
+        All filters are applied by plantation-model, so pages are full and
+        total_count is exact.
 
         Args:
             region_id: Optional filter by region.
             page_size: Number of results per page (default: 50).
             page_token: Token for pagination.
             active_only: Only return active farmers (default: True).
+            farm_scale: Optional filter by farm scale.
+            search: Optional case-insensitive prefix of name, phone or farmer ID.
+            tier: Optional filter by precomputed quality tier.
 
         Returns:
             PaginatedResponse containing farmers list with pagination metadata.
@@ -244,6 +293,9 @@ class PlantationClient(BaseGrpcClient):
                 page_size=page_size,
                 page_token=page_token or "",
                 active_only=active_only,
+                farm_scale=FARM_SCALE_TO_PROTO.get(farm_scale, plantation_pb2.FARM_SCALE_UNSPECIFIED),
+                search=search or "",
+                tier=QUALITY_TIER_TO_PROTO.get(tier, plantation_pb2.QUALITY_TIER_UNSPECIFIED),
             )
             response = await stub.ListFarmers(request, metadata=self._get_metadata())
             farmers = [self._proto_to_farmer(f) for f in response.farmers]
@@ -321,6 +373,41 @@ class PlantationClient(BaseGrpcClient):
             self._handle_grpc_error(e, f"Farmer summary {farmer_id}")
             raise
 
+    async def get_farmer_summaries(self, farmer_ids: list[str]) -> dict[str, FarmerPerformance]:
+        """Get performance metrics for many farmers in a constant number of calls.
+
+        Issues one GetFarmerSummaries RPC per BATCH_FARMER_IDS_LIMIT farmers
+        (concurrently) instead of one GetFarmerSummary per farmer.
+
+        Args:
+            farmer_ids: The farmer IDs.
+
+        Returns:
+            Mapping of farmer_id to FarmerPerformance; unknown farmers are absent.
+
+        Raises:
+            ServiceUnavailableError: If service is unavailable.
+        """
+        unique_ids = list(dict.fromkeys(farmer_ids))
+        chunks = [unique_ids[i : i + BATCH_FARMER_IDS_LIMIT] for i in range(0, len(unique_ids), BATCH_FARMER_IDS_LIMIT)]
+        responses = await asyncio.gather(*(self._get_farmer_summaries_batch(chunk) for chunk in chunks))
+        return {
+            summary.farmer_id: self._proto_to_farmer_performance(summary)
+            for response in responses
+            for summary in response.summaries
+        }
+
+    @grpc_retry
+    async def _get_farmer_summaries_batch(self, farmer_ids: list[str]) -> plantation_pb2.GetFarmerSummariesResponse:
+        """Issue a single GetFarmerSummaries RPC."""
+        try:
+            stub = await self._get_plantation_stub()
+            request = plantation_pb2.GetFarmerSummariesRequest(farmer_ids=farmer_ids)
+            return await stub.GetFarmerSummaries(request, metadata=self._get_metadata())
+        except grpc.aio.AioRpcError as e:
+            self._handle_grpc_error(e, f"Farmer summaries ({len(farmer_ids)} farmers)")
+            raise
+
     # =========================================================================
     # Factory Operations (2 read methods)
     # =========================================================================
@@ -655,27 +742,79 @@ class PlantationClient(BaseGrpcClient):
         """
         try:
             stub = await self._get_plantation_stub()
-            request = plantation_pb2.CreateFarmerRequest(
-                first_name=farmer_data.first_name,
-                last_name=farmer_data.last_name,
-                farm_location=plantation_pb2.GeoLocation(
-                    latitude=farmer_data.latitude,
-                    longitude=farmer_data.longitude,
-                    altitude_meters=0,  # Will be fetched by service
-                ),
-                contact=plantation_pb2.ContactInfo(
-                    phone=farmer_data.phone,
-                ),
-                farm_size_hectares=farmer_data.farm_size_hectares,
-                national_id=farmer_data.national_id,
-                grower_number=farmer_data.grower_number or "",
-            )
+            request = self._farmer_create_to_proto(farmer_data)
             response = await stub.CreateFarmer(request, metadata=self._get_metadata())
             return self._proto_to_farmer(response)
         except grpc.aio.AioRpcError as e:
             self._handle_grpc_error(e, "Create farmer")
             raise
 
+    async def import_farmers(
+        self,
+        batches: Iterable[list[tuple[int, FarmerCreate]]],
+    ) -> AsyncIterator[list[FarmerImportRowResult]]:
+        """Stream farmers to ImportFarmers, yielding each batch's results as they arrive.
+
+        Not retried: a partially consumed import stream cannot be replayed
+        without creating farmers twice.
+
+        Args:
+            batches: Batches of (row_number, farmer) pairs, at most
+                IMPORT_FARMER_ROWS_LIMIT rows each. Consumed lazily.
+
+        Yields:
+            Per-row results of one batch, in the order the batches were sent.
+
+        Raises:
+            ServiceUnavailableError: If service is unavailable.
+        """
+
+        def _requests():
+            for batch in batches:
+                yield plantation_pb2.ImportFarmersRequest(
+                    rows=[
+                        plantation_pb2.ImportFarmerRow(
+                            row_number=row_number,
+                            farmer=self._farmer_create_to_proto(farmer_data),
+                        )
+                        for row_number, farmer_data in batch
+                    ]
+                )
+
+        try:
+            stub = await self._get_plantation_stub()
+            call = stub.ImportFarmers(_requests(), metadata=self._get_metadata())
+            async for response in call:
+                yield [
+                    FarmerImportRowResult(
+                        row_number=result.row_number,
+                        farmer_id=result.farmer_id or None,
+                        error=result.error or None,
+                    )
+                    for result in response.results
+                ]
+        except grpc.aio.AioRpcError as e:
+            self._handle_grpc_error(e, "Import farmers")
+            raise
+
+    def _farmer_create_to_proto(self, farmer_data: FarmerCreate) -> plantation_pb2.CreateFarmerRequest:
+        """Build a CreateFarmerRequest from FarmerCreate."""
+        return plantation_pb2.CreateFarmerRequest(
+            first_name=farmer_data.first_name,
+            last_name=farmer_data.last_name,
+            farm_location=plantation_pb2.GeoLocation(
+                latitude=farmer_data.latitude,
+                longitude=farmer_data.longitude,
+                altitude_meters=0,  # Will be fetched by service
+            ),
+            contact=plantation_pb2.ContactInfo(
+                phone=farmer_data.phone,
+            ),
+            farm_size_hectares=farmer_data.farm_size_hectares,
+            national_id=farmer_data.national_id,
+            grower_number=farmer_data.grower_number or "",
+        )
+
     @grpc_retry
     async def update_farmer(self, farmer_id: str, farmer_data: FarmerUpdate) -> Farmer:
         """Update an existing farmer.
@@ -1099,6 +1238,49 @@ class PlantationClient(BaseGrpcClient):
             self._handle_grpc_error(e, f"Collection points for farmer {farmer_id}")
             raise
 
+    async def get_collection_points_for_farmers(self, farmer_ids: list[str]) -> dict[str, list[CollectionPoint]]:
+        """Get collection point memberships for many farmers in a constant number of calls.
+
+        Issues one GetCollectionPointsForFarmers RPC per BATCH_FARMER_IDS_LIMIT
+        farmers (concurrently) instead of one GetCollectionPointsForFarmer per farmer.
+
+        Args:
+            farmer_ids: The farmer IDs.
+
+        Returns:
+            Mapping of every requested farmer_id to its collection points
+            (empty list if unassigned or unknown).
+
+        Raises:
+            ServiceUnavailableError: If service is unavailable.
+        """
+        unique_ids = list(dict.fromkeys(farmer_ids))
+        chunks = [unique_ids[i : i + BATCH_FARMER_IDS_LIMIT] for i in range(0, len(unique_ids), BATCH_FARMER_IDS_LIMIT)]
+        responses = await asyncio.gather(*(self._get_collection_points_for_farmers_batch(chunk) for chunk in chunks))
+
+        memberships: dict[str, list[CollectionPoint]] = {farmer_id: [] for farmer_id in unique_ids}
+        for response in responses:
+            collection_points = {cp.id: self._proto_to_collection_point(cp) for cp in response.collection_points}
+            for membership in response.memberships:
+                memberships[membership.farmer_id] = [
+                    collection_points[cp_id] for cp_id in membership.collection_point_ids if cp_id in collection_points
+                ]
+        return memberships
+
+    @grpc_retry
+    async def _get_collection_points_for_farmers_batch(
+        self,
+        farmer_ids: list[str],
+    ) -> plantation_pb2.GetCollectionPointsForFarmersResponse:
+        """Issue a single GetCollectionPointsForFarmers RPC."""
+        try:
+            stub = await self._get_plantation_stub()
+            request = plantation_pb2.GetCollectionPointsForFarmersRequest(farmer_ids=farmer_ids)
+            return await stub.GetCollectionPointsForFarmers(request, metadata=self._get_metadata())
+        except grpc.aio.AioRpcError as e:
+            self._handle_grpc_error(e, f"Collection points for {len(farmer_ids)} farmers")
+            raise
+
     # =========================================================================
     # Region Write Operations (2 methods)
     # =========================================================================
@@ -1759,6 +1941,7 @@ class PlantationClient(BaseGrpcClient):
             farm_scale=FarmScale(farm_scale_str) if farm_scale_str else FarmScale.SMALLHOLDER,
             historical=historical,
             today=today,
+            tier=QUALITY_TIER_FROM_PROTO.get(proto.tier),
         )
 
     def _proto_to_performance_summary(self, proto: plantation_pb2.PerformanceSummary) -> PerformanceSummary:
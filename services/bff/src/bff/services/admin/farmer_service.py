@@ -3,9 +3,12 @@
 Orchestrates PlantationClient calls for farmer management.
 """
 
+import asyncio
 import csv
 import io
+from collections.abc import Iterator
 
+import grpc.aio
 from bff.api.schemas.admin.farmer_schemas import (
     AdminFarmerCreateRequest,
     AdminFarmerDetail,
@@ -16,21 +19,25 @@ from bff.api.schemas.admin.farmer_schemas import (
     ImportErrorRow,
 )
 from bff.api.schemas.farmer_schemas import TierLevel
-from bff.infrastructure.clients import NotFoundError
+from bff.api.schemas.responses import PaginationMeta
+from bff.infrastructure.clients import NotFoundError, ServiceUnavailableError
 from bff.infrastructure.clients.plantation_client import PlantationClient
 from bff.services.base_service import BaseService
 from bff.transformers.admin.farmer_transformer import AdminFarmerTransformer
 from fp_common.models import Farmer
 from fp_common.models.farmer import FarmerCreate, FarmerUpdate, FarmScale
 from fp_common.models.farmer_performance import FarmerPerformance
-from fp_common.models.value_objects import QualityThresholds
+from fp_common.models.value_objects import QualityThresholds, QualityTier
+
+# Rows per ImportFarmers stream message
+IMPORT_BATCH_SIZE = 500
 
 
 class AdminFarmerService(BaseService):
     """Service for admin farmer operations.
 
     Orchestrates PlantationClient calls and transforms to API schemas.
-    Uses parallel fetch for enrichment (performance data).
+    Uses batch RPCs for enrichment (performance data, CP memberships).
     """
 
     def __init__(
@@ -102,58 +109,23 @@ class AdminFarmerService(BaseService):
             if cp_response.data:
                 cp_id = cp_response.data[0].id
 
-        if cp_id:
-            # Get farmers assigned to this CP using N:M relationship
-            farmers = await self._plantation.get_farmers_for_collection_point(cp_id)
-
-            # Filter by active_only if needed
-            if active_only:
-                farmers = [f for f in farmers if f.is_active]
-
-            if not farmers:
-                from bff.api.schemas.responses import PaginationMeta
-
-                return AdminFarmerListResponse(
-                    data=[],
-                    pagination=PaginationMeta(
-                        page=1,
-                        page_size=page_size,
-                        total_count=0,
-                        total_pages=0,
-                    ),
-                )
-
-            # Get factory for quality thresholds
-            cp = await self._plantation.get_collection_point(cp_id)
-            factory = await self._plantation.get_factory(cp.factory_id)
-        else:
-            # List farmers - optionally filtered by region
-            # If no region_id, list all farmers across all regions
-            response = await self._plantation.list_farmers(
-                region_id=region_id,  # None means all regions
+        if not cp_id:
+            return await self._list_farmers_paged(
+                region_id=region_id,
+                farm_scale=farm_scale,
+                tier=tier,
+                search=search,
                 page_size=page_size,
                 page_token=page_token,
                 active_only=active_only,
             )
-            farmers = response.data
 
-            if not farmers:
-                return AdminFarmerListResponse(
-                    data=[],
-                    pagination=response.pagination,
-                )
+        # Get farmers assigned to this CP using N:M relationship
+        farmers = await self._plantation.get_farmers_for_collection_point(cp_id)
 
-            # Get first farmer's factory for thresholds (or use defaults)
-            try:
-                # Get CP for first farmer to get factory
-                first_farmer = farmers[0]
-                cps_response = await self._plantation.get_collection_points_for_farmer(first_farmer.id)
-                if cps_response.data:
-                    factory = await self._plantation.get_factory(cps_response.data[0].factory_id)
-                else:
-                    factory = None
-            except Exception:
-                factory = None
+        # The CP path returns the whole membership, so filters apply in memory
+        if active_only:
+            farmers = [f for f in farmers if f.is_active]
 
         # Pre-enrichment filtering: farm_scale and search (AC 9.5.1)
         if farm_scale:
@@ -171,8 +143,6 @@ class AdminFarmerService(BaseService):
             ]
 
         if not farmers:
-            from bff.api.schemas.responses import PaginationMeta
-
             return AdminFarmerListResponse(
                 data=[],
                 pagination=PaginationMeta(
@@ -183,14 +153,13 @@ class AdminFarmerService(BaseService):
                 ),
             )
 
-        # Enrich with performance data using parallel fetch
-        # Use factory thresholds if available, otherwise use defaults
-        from bff.api.schemas.responses import PaginationMeta
+        # Get factory for quality thresholds
+        cp = await self._plantation.get_collection_point(cp_id)
+        factory = await self._plantation.get_factory(cp.factory_id)
 
-        thresholds = factory.quality_thresholds if factory else QualityThresholds()
         summaries = await self._enrich_farmers_to_summaries(
             farmers=farmers,
-            thresholds=thresholds,
+            thresholds=factory.quality_thresholds,
         )
 
         # Post-enrichment filtering: tier (computed from performance data)
@@ -218,6 +187,66 @@ class AdminFarmerService(BaseService):
             pagination=pagination,
         )
 
+    async def _list_farmers_paged(
+        self,
+        region_id: str | None,
+        farm_scale: FarmScale | None,
+        tier: TierLevel | None,
+        search: str | None,
+        page_size: int,
+        page_token: str | None,
+        active_only: bool,
+    ) -> AdminFarmerListResponse:
+        """List farmers with every filter pushed down to Plantation Model.
+
+        Pages are exactly page_size long and pagination (total_count,
+        next_page_token) comes straight from the server.
+        """
+        response = await self._plantation.list_farmers(
+            region_id=region_id,  # None means all regions
+            page_size=page_size,
+            page_token=page_token,
+            active_only=active_only,
+            farm_scale=farm_scale,
+            search=search,
+            tier=QualityTier(tier.value) if tier else None,
+        )
+        farmers = response.data
+
+        if not farmers:
+            return AdminFarmerListResponse(
+                data=[],
+                pagination=response.pagination,
+            )
+
+        # Fallback thresholds for farmers whose tier is not precomputed yet:
+        # first farmer's factory (or defaults)
+        try:
+            cps_response = await self._plantation.get_collection_points_for_farmer(farmers[0].id)
+            if cps_response.data:
+                factory = await self._plantation.get_factory(cps_response.data[0].factory_id)
+            else:
+                factory = None
+        except Exception:
+            factory = None
+
+        thresholds = factory.quality_thresholds if factory else QualityThresholds()
+        summaries = await self._enrich_farmers_to_summaries(
+            farmers=farmers,
+            thresholds=thresholds,
+        )
+
+        self._logger.info(
+            "listed_farmers",
+            count=len(summaries),
+            total_count=response.pagination.total_count,
+        )
+
+        return AdminFarmerListResponse(
+            data=summaries,
+            pagination=response.pagination,
+        )
+
     async def get_farmer(self, farmer_id: str) -> AdminFarmerDetail:
         """Get farmer detail by ID.
 
@@ -403,6 +432,15 @@ class AdminFarmerService(BaseService):
 
         Story 9.5a: collection_point_id removed - CP assignment via delivery.
 
+        Valid rows are streamed to plantation-model's ImportFarmers RPC in
+        batches of IMPORT_BATCH_SIZE while the CSV is still being parsed; each
+        batch's per-row results are collected as they come back.
+
+        If the stream fails after some results came back, the partial report
+        is returned instead of the error: rows sent but not confirmed, and
+        rows not read yet, are reported as errors so they can be checked and
+        re-imported. A failure before any result is raised as usual.
+
         Args:
             csv_content: CSV content as string.
             skip_header: Whether to skip the first row.
@@ -416,56 +454,95 @@ class AdminFarmerService(BaseService):
         )
 
         reader = csv.DictReader(io.StringIO(csv_content))
-        rows = list(reader)
-
-        created_count = 0
         error_rows: list[ImportErrorRow] = []
+        # Rows sent to plantation-model, kept to report their data on failure
+        sent_rows: dict[int, dict] = {}
+        total_rows = 0
+
+        def row_number(index: int) -> int:
+            return index + 2 if skip_header else index + 1  # Account for header
+
+        def parse_batches() -> Iterator[list[tuple[int, FarmerCreate]]]:
+            """Validate rows and group them into stream batches (consumed lazily)."""
+            nonlocal total_rows
+            batch: list[tuple[int, FarmerCreate]] = []
+            for row in reader:
+                row_num = row_number(total_rows)
+                total_rows += 1
+                try:
+                    # Story 9.5a: collection_point_id removed - CP assignment via delivery
+                    create_data = FarmerCreate(
+                        first_name=row["first_name"],
+                        last_name=row["last_name"],
+                        phone=row["phone"],
+                        national_id=row["national_id"],
+                        farm_size_hectares=float(row["farm_size_hectares"]),
+                        latitude=float(row["latitude"]),
+                        longitude=float(row["longitude"]),
+                        grower_number=row.get("grower_number"),
+                    )
+                except Exception as e:
+                    error_rows.append(ImportErrorRow(row=row_num, error=str(e), data=row))
+                    continue
+                sent_rows[row_num] = row
+                batch.append((row_num, create_data))
+                if len(batch) == IMPORT_BATCH_SIZE:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
 
-        async def process_row(row_num: int, row: dict) -> bool:
-            """Process a single row. Returns True if successful."""
-            try:
-                # Story 9.5a: collection_point_id removed - CP assignment via delivery
-                create_data = FarmerCreate(
-                    first_name=row["first_name"],
-                    last_name=row["last_name"],
-                    phone=row["phone"],
-                    national_id=row["national_id"],
-                    farm_size_hectares=float(row["farm_size_hectares"]),
-                    latitude=float(row["latitude"]),
-                    longitude=float(row["longitude"]),
-                    grower_number=row.get("grower_number"),
+        created_count = 0
+        received_results = False
+        try:
+            async for results in self._plantation.import_farmers(parse_batches()):
+                received_results = True
+                for result in results:
+                    row = sent_rows.pop(result.row_number, {})
+                    if result.error:
+                        error_rows.append(ImportErrorRow(row=result.row_number, error=result.error, data=row))
+                    else:
+                        created_count += 1
+                self._logger.info(
+                    "farmer_import_progress",
+                    created_count=created_count,
+                    error_count=len(error_rows),
+                    rows_read=total_rows,
                 )
-
-                await self._plantation.create_farmer(create_data)
-                return True
-            except Exception as e:
+        except (ServiceUnavailableError, NotFoundError, grpc.aio.AioRpcError) as e:
+            if not received_results:
+                raise
+            self._logger.warning(
+                "farmer_import_interrupted",
+                error=str(e),
+                created_count=created_count,
+                unconfirmed_rows=len(sent_rows),
+                rows_read=total_rows,
+            )
+            # Sent rows may or may not have been created before the stream failed
+            for row_num, row in sent_rows.items():
                 error_rows.append(
-                    ImportErrorRow(
-                        row=row_num,
-                        error=str(e),
-                        data=row,
-                    )
+                    ImportErrorRow(row=row_num, error=f"Import interrupted, outcome unknown: {e}", data=row)
                 )
-                return False
-
-        # Process rows with bounded concurrency
-        for i, row in enumerate(rows):
-            row_num = i + 2 if skip_header else i + 1  # Account for header
-            if await process_row(row_num, row):
-                created_count += 1
+            for row in reader:
+                error_rows.append(
+                    ImportErrorRow(row=row_number(total_rows), error=f"Not imported, import interrupted: {e}", data=row)
+                )
+                total_rows += 1
 
+        error_rows.sort(key=lambda error_row: error_row.row)
         self._logger.info(
             "imported_farmers",
             created_count=created_count,
             error_count=len(error_rows),
-            total_rows=len(rows),
+            total_rows=total_rows,
         )
 
         return FarmerImportResponse(
             created_count=created_count,
             error_count=len(error_rows),
             error_rows=error_rows,
-            total_rows=len(rows),
+            total_rows=total_rows,
         )
 
     async def _enrich_farmers_to_summaries(
@@ -475,7 +552,8 @@ class AdminFarmerService(BaseService):
     ) -> list[AdminFarmerSummary]:
         """Enrich farmers with performance data and transform to summaries.
 
-        Uses bounded parallel execution (Semaphore(5)).
+        Uses the batch summary and CP membership RPCs, so a page costs two
+        round-trips regardless of its size.
 
         Args:
             farmers: List of farmer domain models.
@@ -484,11 +562,23 @@ class AdminFarmerService(BaseService):
         Returns:
             List of AdminFarmerSummary in same order as input.
         """
-
-        async def enrich_single(farmer: Farmer) -> AdminFarmerSummary:
-            try:
-                performance = await self._plantation.get_farmer_summary(farmer.id)
-            except NotFoundError:
+        farmer_ids = [farmer.id for farmer in farmers]
+        performances, memberships = await asyncio.gather(
+            self._plantation.get_farmer_summaries(farmer_ids),
+            self._plantation.get_collection_points_for_farmers(farmer_ids),
+            return_exceptions=True,
+        )
+        if isinstance(performances, BaseException):
+            raise performances
+        if isinstance(memberships, BaseException):
+            # Story 9.5a: CP count is informational - fall back to 0
+            self._logger.warning("cp_membership_lookup_failed", error=str(memberships))
+            memberships = {}
+
+        summaries = []
+        for farmer in farmers:
+            performance = performances.get(farmer.id)
+            if performance is None:
                 # No performance data yet - use defaults
                 performance = FarmerPerformance.initialize_for_farmer(
                     farmer_id=farmer.id,
@@ -498,18 +588,12 @@ class AdminFarmerService(BaseService):
                     grading_model_version="1.0.0",
                 )
 
-            # Story 9.5a: Get CP count for N:M model
-            try:
-                cps_response = await self._plantation.get_collection_points_for_farmer(farmer.id)
-                cp_count = len(cps_response.data)
-            except Exception:
-                cp_count = 0
-
-            return self._transformer.to_summary(
-                farmer=farmer,
-                performance=performance,
-                thresholds=thresholds,
-                cp_count=cp_count,
+            summaries.append(
+                self._transformer.to_summary(
+                    farmer=farmer,
+                    performance=performance,
+                    thresholds=thresholds,
+                    cp_count=len(memberships.get(farmer.id, [])),
+                )
             )
-
-        return await self._parallel_map(farmers, enrich_single)
+        return summaries
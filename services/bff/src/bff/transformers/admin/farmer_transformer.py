@@ -45,6 +45,24 @@ class AdminFarmerTransformer:
             return TierLevel.TIER_3
         return TierLevel.BELOW_TIER_3
 
+    @classmethod
+    def resolve_tier(cls, performance: FarmerPerformance, thresholds: QualityThresholds) -> TierLevel:
+        """Use the tier precomputed by Plantation Model, else compute it.
+
+        The precomputed tier is what ListFarmers filters on, so preferring it
+        keeps displayed tiers consistent with tier-filtered listings.
+
+        Args:
+            performance: Farmer performance (tier may be None if not yet computed).
+            thresholds: Factory's quality thresholds (fallback only).
+
+        Returns:
+            TierLevel enum value.
+        """
+        if performance.tier is not None:
+            return TierLevel(performance.tier.value)
+        return cls.compute_tier(performance.historical.primary_percentage_30d, thresholds)
+
     @staticmethod
     def map_trend(trend_direction: TrendDirection) -> TrendIndicator:
         """Map domain TrendDirection to API TrendIndicator.
@@ -82,8 +100,7 @@ class AdminFarmerTransformer:
         Returns:
             AdminFarmerSummary for API response.
         """
-        primary_pct = performance.historical.primary_percentage_30d
-        tier = self.compute_tier(primary_pct, thresholds)
+        tier = self.resolve_tier(performance, thresholds)
         trend = self.map_trend(performance.historical.improvement_trend)
 
         return AdminFarmerSummary(
@@ -118,8 +135,7 @@ class AdminFarmerTransformer:
         Returns:
             AdminFarmerDetail for API response.
         """
-        primary_pct = performance.historical.primary_percentage_30d
-        tier = self.compute_tier(primary_pct, thresholds)
+        tier = self.resolve_tier(performance, thresholds)
         trend = self.map_trend(performance.historical.improvement_trend)
 
         performance_metrics = FarmerPerformanceMetrics(
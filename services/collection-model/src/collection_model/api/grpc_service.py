@@ -7,8 +7,14 @@ ADR-011: gRPC server runs on port 50051 alongside FastAPI health on port 8000.
 This module provides:
 - CollectionServiceServicer: gRPC handler implementation for document queries
 - serve_grpc: Async function to start gRPC server with both services
+
+Page tokens are opaque keyset cursors (base64 of the last document's
+created_at and document_id), not offsets.
 """
 
+import base64
+import binascii
+import json
 from datetime import UTC, datetime
 from typing import Any
 
@@ -45,6 +51,24 @@ def _dict_to_string_map(d: dict[str, Any]) -> dict[str, str]:
     return {k: str(v) for k, v in d.items()}
 
 
+def _encode_page_token(doc: DocumentIndex) -> str:
+    """Build the opaque cursor pointing after doc."""
+    payload = json.dumps({"created_at": doc.created_at.isoformat(), "document_id": doc.document_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_page_token(page_token: str) -> tuple[datetime, str] | None:
+    """Decode a cursor from _encode_page_token; None (first page) if invalid."""
+    if not page_token:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(page_token.encode()))
+        return datetime.fromisoformat(payload["created_at"]), str(payload["document_id"])
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        logger.warning("Invalid page_token format, starting from first page", page_token=page_token)
+        return None
+
+
 def _document_index_to_proto(doc: DocumentIndex) -> collection_pb2.Document:
     """Convert DocumentIndex Pydantic model to proto Document message."""
     return collection_pb2.Document(
@@ -87,14 +111,15 @@ class CollectionServiceServicer(collection_pb2_grpc.CollectionServiceServicer):
     ADR-011 compliant: Pure query-only, no mutations exposed via gRPC.
     """
 
-    def __init__(self, db: AsyncIOMotorDatabase) -> None:
+    def __init__(self, db: AsyncIOMotorDatabase, count_cache_ttl_seconds: float = 30.0) -> None:
         """Initialize the gRPC servicer with MongoDB database.
 
         Args:
             db: Async MongoDB database connection.
+            count_cache_ttl_seconds: How long total counts are reused across pages.
         """
         self.db = db
-        self.document_repository = DocumentRepository(db)
+        self.document_repository = DocumentRepository(db, count_cache_ttl_seconds=count_cache_ttl_seconds)
 
     async def GetDocument(
         self,
@@ -171,50 +196,27 @@ class CollectionServiceServicer(collection_pb2_grpc.CollectionServiceServicer):
             page_token=request.page_token or None,
         )
 
-        collection = self.db[request.collection_name]
-
         # Build query
         query: dict[str, Any] = {}
         if request.farmer_id:
             query["linkage_fields.farmer_id"] = request.farmer_id
 
-        # Handle pagination via skip (page_token is skip count encoded as string)
-        skip = 0
-        if request.page_token:
-            try:
-                skip = int(request.page_token)
-                if skip < 0:
-                    logger.warning("Negative page_token received, resetting to 0", page_token=request.page_token)
-                    skip = 0
-            except ValueError:
-                logger.warning("Invalid page_token format, resetting to 0", page_token=request.page_token)
-                skip = 0
-
-        # Execute query
-        cursor = collection.find(query).sort("created_at", -1).skip(skip).limit(page_size + 1)
-
-        documents: list[collection_pb2.Document] = []
-        has_more = False
-
-        async for raw_doc in cursor:
-            if len(documents) >= page_size:
-                has_more = True
-                break
-            doc = DocumentIndex.model_validate(raw_doc)
-            documents.append(_document_index_to_proto(doc))
-
-        # Get total count
-        total_count = await collection.count_documents(query)
-
-        # Build next page token
-        next_page_token = ""
-        if has_more:
-            next_page_token = str(skip + page_size)
+        documents, has_more = await self.document_repository.find_page(
+            collection_name=request.collection_name,
+            query=query,
+            page_size=page_size,
+            after=_decode_page_token(request.page_token),
+        )
+
+        total_count, estimated = 0, False
+        if not request.skip_total_count:
+            total_count, estimated = await self.document_repository.count(request.collection_name, query)
 
         return collection_pb2.ListDocumentsResponse(
-            documents=documents,
-            next_page_token=next_page_token,
+            documents=[_document_index_to_proto(doc) for doc in documents],
+            next_page_token=_encode_page_token(documents[-1]) if has_more else "",
             total_count=total_count,
+            total_count_estimated=estimated,
         )
 
     async def GetDocumentsByFarmer(
@@ -293,8 +295,6 @@ class CollectionServiceServicer(collection_pb2_grpc.CollectionServiceServicer):
             page_size=page_size,
         )
 
-        collection = self.db[request.collection_name]
-
         # Build query
         query: dict[str, Any] = {}
 
@@ -319,43 +319,22 @@ class CollectionServiceServicer(collection_pb2_grpc.CollectionServiceServicer):
         for field_name, field_value in request.linkage_filters.items():
             query[f"linkage_fields.{field_name}"] = field_value
 
-        # Handle pagination
-        skip = 0
-        if request.page_token:
-            try:
-                skip = int(request.page_token)
-                if skip < 0:
-                    logger.warning("Negative page_token received, resetting to 0", page_token=request.page_token)
-                    skip = 0
-            except ValueError:
-                logger.warning("Invalid page_token format, resetting to 0", page_token=request.page_token)
-                skip = 0
-
-        # Execute query
-        cursor = collection.find(query).sort("created_at", -1).skip(skip).limit(page_size + 1)
-
-        documents: list[collection_pb2.Document] = []
-        has_more = False
-
-        async for raw_doc in cursor:
-            if len(documents) >= page_size:
-                has_more = True
-                break
-            doc = DocumentIndex.model_validate(raw_doc)
-            documents.append(_document_index_to_proto(doc))
-
-        # Get total count
-        total_count = await collection.count_documents(query)
-
-        # Build next page token
-        next_page_token = ""
-        if has_more:
-            next_page_token = str(skip + page_size)
+        documents, has_more = await self.document_repository.find_page(
+            collection_name=request.collection_name,
+            query=query,
+            page_size=page_size,
+            after=_decode_page_token(request.page_token),
+        )
+
+        total_count, estimated = 0, False
+        if not request.skip_total_count:
+            total_count, estimated = await self.document_repository.count(request.collection_name, query)
 
         return collection_pb2.SearchDocumentsResponse(
-            documents=documents,
-            next_page_token=next_page_token,
+            documents=[_document_index_to_proto(doc) for doc in documents],
+            next_page_token=_encode_page_token(documents[-1]) if has_more else "",
             total_count=total_count,
+            total_count_estimated=estimated,
         )
 
 
@@ -363,6 +342,7 @@ async def serve_grpc(
     db: AsyncIOMotorDatabase,
     host: str = "0.0.0.0",
     port: int = 50051,
+    count_cache_ttl_seconds: float = 30.0,
 ) -> grpc.aio.Server:
     """Start the gRPC server with both CollectionService and SourceConfigService.
 
@@ -372,6 +352,7 @@ async def serve_grpc(
         db: MongoDB database connection.
         host: Host to bind to.
         port: Port to listen on.
+        count_cache_ttl_seconds: How long document total counts are reused across pages.
 
     Returns:
         Running gRPC server instance.
@@ -379,7 +360,9 @@ async def serve_grpc(
     server = grpc.aio.server()
 
     # Register CollectionService (Story 0.5.1a)
-    collection_pb2_grpc.add_CollectionServiceServicer_to_server(CollectionServiceServicer(db), server)
+    collection_pb2_grpc.add_CollectionServiceServicer_to_server(
+        CollectionServiceServicer(db, count_cache_ttl_seconds), server
+    )
 
     # Register SourceConfigService (Story 9.11a - ADR-019)
     collection_pb2_grpc.add_SourceConfigServiceServicer_to_server(SourceConfigServiceServicer(db), server)
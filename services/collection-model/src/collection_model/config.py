@@ -44,6 +44,14 @@ class Settings(BaseSettings):
     worker_poll_interval: float = 5.0
     worker_batch_size: int = 10
     worker_max_retries: int = 3
+    worker_concurrency: int = 4  # Max jobs processed in parallel per replica
+    worker_lease_seconds: float = 300.0  # Job lease duration before another replica may reclaim it
+    worker_heartbeat_interval: float = 60.0  # Lease renewal interval (must be < worker_lease_seconds)
+    worker_push_enabled: bool = True  # Wake on ingestion queue change stream instead of fixed polling
+    worker_fallback_poll_interval: float = 60.0  # Poll interval in push mode (safety net for missed events)
+
+    # Document query API (gRPC) configuration
+    document_count_cache_ttl_seconds: float = 30.0  # Reuse of total counts across pages of the same listing
 
     # AI Model DAPR configuration
     ai_model_app_id: str = "ai-model"
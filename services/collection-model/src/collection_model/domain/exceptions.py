@@ -72,6 +72,16 @@ class BlobNotFoundError(StorageError):
     pass
 
 
+class BlobTooLargeError(StorageError):
+    """Raised when a streamed blob download exceeds its size limit.
+
+    The download is aborted as soon as the limit is passed, so the rest of
+    the blob is never read.
+    """
+
+    pass
+
+
 class DuplicateDocumentError(StorageError):
     """Raised when a document with the same content hash already exists.
 
@@ -43,6 +43,10 @@ class IngestionJob(BaseModel):
         # Pull mode fields (Story 2.7)
         content: Inline content from HTTP fetch (bytes).
         linkage: Fields injected from iteration item for linkage.
+
+        # Lease fields (concurrent workers)
+        lease_owner: Worker ID currently holding the processing lease.
+        lease_expires_at: When the lease lapses unless renewed by heartbeat.
     """
 
     # Observability fields (per Architect review)
@@ -102,6 +106,16 @@ class IngestionJob(BaseModel):
         description="When processing completed (success or failure)",
     )
 
+    # Processing lease (set by IngestionQueue.claim_job, renewed by heartbeat)
+    lease_owner: str | None = Field(
+        default=None,
+        description="Worker ID currently holding the processing lease",
+    )
+    lease_expires_at: datetime | None = Field(
+        default=None,
+        description="When the processing lease expires unless renewed",
+    )
+
     @model_validator(mode="after")
     def validate_content_source(self) -> "IngestionJob":
         """Validate that either blob_path or content is set.
@@ -4,14 +4,15 @@ This module provides the BlobStorageClient class for downloading and uploading
 blobs using the Azure SDK's async client.
 """
 
+from collections.abc import Callable
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, BinaryIO
 
 import structlog
 from azure.storage.blob import ContentSettings
 from azure.storage.blob.aio import BlobServiceClient
 from collection_model.config import settings
-from collection_model.domain.exceptions import BlobNotFoundError, StorageError
+from collection_model.domain.exceptions import BlobNotFoundError, BlobTooLargeError, StorageError
 from pydantic import BaseModel, Field
 
 logger = structlog.get_logger(__name__)
@@ -109,22 +110,91 @@ class BlobStorageClient:
             )
             raise StorageError(f"Failed to download blob: {e}") from e
 
+    async def download_blob_to_file(
+        self,
+        container: str,
+        blob_path: str,
+        destination: BinaryIO,
+        on_chunk: Callable[[bytes], None] | None = None,
+        max_bytes: int | None = None,
+    ) -> int:
+        """Stream a blob's content into a file-like object chunk by chunk.
+
+        Only one download chunk is held in memory at a time, so large blobs
+        can be spooled to disk instead of materialized as bytes. With
+        ``max_bytes`` the download is aborted as soon as the running total
+        passes the limit, without reading the remaining chunks.
+
+        Args:
+            container: The container name.
+            blob_path: The blob path within the container.
+            destination: Writable binary file object (e.g., SpooledTemporaryFile).
+            on_chunk: Optional callback invoked with each chunk (e.g., hasher.update).
+            max_bytes: Optional size limit in bytes.
+
+        Returns:
+            Total number of bytes written.
+
+        Raises:
+            BlobNotFoundError: If the blob does not exist.
+            BlobTooLargeError: If the blob exceeds max_bytes.
+            StorageError: If download fails for other reasons.
+        """
+        try:
+            client = await self._get_client()
+            blob_client = client.get_blob_client(container=container, blob=blob_path)
+
+            if not await blob_client.exists():
+                raise BlobNotFoundError(f"Blob not found: {container}/{blob_path}")
+
+            stream = await blob_client.download_blob()
+            size_bytes = 0
+            async for chunk in stream.chunks():
+                if max_bytes is not None and size_bytes + len(chunk) > max_bytes:
+                    raise BlobTooLargeError(f"Blob exceeds maximum size: {container}/{blob_path} > {max_bytes} bytes")
+                destination.write(chunk)
+                if on_chunk:
+                    on_chunk(chunk)
+                size_bytes += len(chunk)
+
+            logger.debug(
+                "Blob streamed to file",
+                container=container,
+                blob_path=blob_path,
+                size_bytes=size_bytes,
+            )
+            return size_bytes
+
+        except (BlobNotFoundError, BlobTooLargeError):
+            raise
+        except Exception as e:
+            logger.exception(
+                "Failed to stream blob",
+                container=container,
+                blob_path=blob_path,
+                error=str(e),
+            )
+            raise StorageError(f"Failed to download blob: {e}") from e
+
     async def upload_blob(
         self,
         container: str,
         blob_path: str,
-        content: bytes,
+        content: bytes | BinaryIO,
         content_type: str = "application/octet-stream",
         metadata: dict[str, str] | None = None,
+        length: int | None = None,
     ) -> BlobReference:
         """Upload content to a blob.
 
         Args:
             container: The container name.
             blob_path: The blob path within the container.
-            content: The content to upload.
+            content: The content to upload, as bytes or a readable binary
+                stream positioned at the start of the data.
             content_type: MIME type of the content.
             metadata: Optional metadata to attach to the blob.
+            length: Content size in bytes (required when content is a stream).
 
         Returns:
             BlobReference with details of the uploaded blob.
@@ -135,10 +205,12 @@ class BlobStorageClient:
         try:
             client = await self._get_client()
             blob_client = client.get_blob_client(container=container, blob=blob_path)
+            size_bytes = len(content) if isinstance(content, bytes) else length
 
             # Upload with overwrite
             result = await blob_client.upload_blob(
                 content,
+                length=size_bytes,
                 overwrite=True,
                 content_settings=ContentSettings(content_type=content_type),
                 metadata=metadata or {},
@@ -148,7 +220,7 @@ class BlobStorageClient:
                 "Blob uploaded successfully",
                 container=container,
                 blob_path=blob_path,
-                size_bytes=len(content),
+                size_bytes=size_bytes,
                 etag=result.get("etag"),
             )
 
@@ -156,7 +228,7 @@ class BlobStorageClient:
                 container=container,
                 blob_path=blob_path,
                 content_type=content_type,
-                size_bytes=len(content),
+                size_bytes=size_bytes or 0,
                 etag=result.get("etag"),
                 stored_at=datetime.now(UTC),
             )
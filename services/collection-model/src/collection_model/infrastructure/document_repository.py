@@ -3,18 +3,56 @@
 This module provides the DocumentRepository class for storing documents
 in MongoDB collections specified by source configuration. The repository
 is collection-agnostic - it reads the collection name from config.
+
+Listings are paged with keyset cursors on (created_at, document_id) rather
+than skip offsets, so page 500 costs the same index seek as page 1. Total
+counts are cached for a short TTL so paging does not recount every request.
+
+Full-text search (collection-mcp search_documents) is served by one managed
+text index per collection, built from the storage.search_fields of every
+source config writing to it. MongoDB allows a single text index per
+collection, so fields from different sources are merged into it; the index
+only grows (a field dropped from one config may still be used by another).
+The worker builds every index once at startup from all source configs, so
+rebuilds during ingestion only happen for configs changed since. Rebuilds
+are serialized per collection within a process; replicas racing on the
+same index see an index conflict or a missing index, re-read the current
+index and retry.
 """
 
+import asyncio
+import json
+import time
+from datetime import datetime
 from typing import Any
 
 import structlog
 from collection_model.domain.document_index import DocumentIndex
 from collection_model.domain.exceptions import StorageError
+from fp_common.models.source_config import SourceConfig
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from pymongo.errors import DuplicateKeyError
+from pymongo import ASCENDING, DESCENDING, TEXT
+from pymongo.errors import DuplicateKeyError, OperationFailure
 
 logger = structlog.get_logger(__name__)
 
+# Page order: newest first, document_id breaks created_at ties
+PAGE_SORT = [("created_at", DESCENDING), ("document_id", DESCENDING)]
+
+# Upper bound on cached counts (distinct collection/filter combinations)
+COUNT_CACHE_MAX_ENTRIES = 1_000
+
+# Managed full-text index: document_id is always searchable
+SEARCH_INDEX_NAME = "idx_search_text"
+SEARCH_BASE_WEIGHTS = {"document_id": 1}
+# Documents carry no per-document language field; keep the default (english) for all
+SEARCH_LANGUAGE_OVERRIDE = "search_language"
+# Error codes when another process changed the text index between our read
+# and our write: it was dropped (IndexNotFound) or replaced (IndexOptionsConflict,
+# IndexKeySpecsConflict)
+SEARCH_INDEX_RACE_CODES = frozenset({27, 85, 86})
+SEARCH_INDEX_ATTEMPTS = 3
+
 
 class DocumentRepository:
     """Generic repository for document indexes.
@@ -23,16 +61,27 @@ class DocumentRepository:
     This enables different source types to store in different collections.
     """
 
-    def __init__(self, db: AsyncIOMotorDatabase) -> None:
+    def __init__(self, db: AsyncIOMotorDatabase, count_cache_ttl_seconds: float = 30.0) -> None:
         """Initialize the document repository.
 
         Args:
             db: MongoDB database instance.
+            count_cache_ttl_seconds: How long a filtered count is reused (0 = no cache).
         """
         self.db = db
         self._ensured_collections: set[str] = set()
+        # Text index weights known to be in place, per collection
+        self._search_weights: dict[str, dict[str, int]] = {}
+        self._search_locks: dict[str, asyncio.Lock] = {}
+        self._count_cache_ttl = count_cache_ttl_seconds
+        self._count_cache: dict[tuple[str, str], tuple[float, int]] = {}
 
-    async def ensure_indexes(self, collection_name: str, link_field: str) -> None:
+    async def ensure_indexes(
+        self,
+        collection_name: str,
+        link_field: str,
+        search_fields: dict[str, int] | None = None,
+    ) -> None:
         """Ensure indexes exist for a collection.
 
         Creates indexes dynamically based on the link_field from source config.
@@ -40,7 +89,12 @@ class DocumentRepository:
         Args:
             collection_name: The collection to ensure indexes for.
             link_field: The field to create an index on for linkage.
+            search_fields: Extracted fields to include in the text index,
+                mapped to their weight (source_config.storage.search_fields).
         """
+        # document_id is searchable even when the source declares no fields
+        await self.ensure_search_index(collection_name, search_fields or {})
+
         if collection_name in self._ensured_collections:
             return
 
@@ -72,6 +126,22 @@ class DocumentRepository:
             name="idx_created_at",
         )
 
+        # Keyset pagination indexes: (created_at, document_id) in page order,
+        # alone and behind the equality filters of ListDocuments/SearchDocuments
+        await collection.create_index(
+            PAGE_SORT,
+            name="idx_created_at_document_id",
+        )
+        await collection.create_index(
+            [("ingestion.source_id", ASCENDING), *PAGE_SORT],
+            name="idx_source_id_created_at_document_id",
+        )
+        if link_field:
+            await collection.create_index(
+                [(f"linkage_fields.{link_field}", ASCENDING), *PAGE_SORT],
+                name=f"idx_linkage_{link_field}_created_at_document_id",
+            )
+
         self._ensured_collections.add(collection_name)
         logger.info(
             "Document repository indexes ensured",
@@ -79,6 +149,102 @@ class DocumentRepository:
             link_field=link_field,
         )
 
+    async def ensure_search_indexes(self, source_configs: list[SourceConfig]) -> None:
+        """Build each collection's text index once from all source configs.
+
+        Fields of every source writing to a collection are merged up front,
+        so ingestion does not rebuild the index source by source.
+
+        Args:
+            source_configs: All loaded source configurations.
+        """
+        by_collection: dict[str, dict[str, int]] = {}
+        for config in source_configs:
+            by_collection.setdefault(config.storage.index_collection, {}).update(config.storage.search_fields)
+        for collection_name, search_fields in by_collection.items():
+            await self.ensure_search_index(collection_name, search_fields)
+
+    async def ensure_search_index(self, collection_name: str, search_fields: dict[str, int]) -> None:
+        """Ensure the collection's text index covers the given fields.
+
+        The index is rebuilt only when it is missing, a field is missing or
+        its weight changed; fields already indexed for other sources are
+        kept. A rebuild that races with another process is retried against
+        the index that process left; if it keeps losing, the index is left
+        to the next call rather than failing the caller.
+
+        Args:
+            collection_name: The collection to index.
+            search_fields: Extracted field name to weight.
+        """
+        requested = {f"extracted_fields.{name}": weight for name, weight in search_fields.items()}
+        if self._search_index_covers(collection_name, requested):
+            return
+
+        lock = self._search_locks.setdefault(collection_name, asyncio.Lock())
+        async with lock:
+            # Another task may have built it while we waited
+            if self._search_index_covers(collection_name, requested):
+                return
+
+            for attempt in range(1, SEARCH_INDEX_ATTEMPTS + 1):
+                try:
+                    self._search_weights[collection_name] = await self._merge_search_index(collection_name, requested)
+                    return
+                except OperationFailure as e:
+                    if e.code not in SEARCH_INDEX_RACE_CODES:
+                        raise
+                    logger.info(
+                        "Search index changed concurrently, retrying",
+                        collection=collection_name,
+                        attempt=attempt,
+                        code=e.code,
+                    )
+            logger.warning(
+                "Search index not settled, will retry on next use",
+                collection=collection_name,
+                attempts=SEARCH_INDEX_ATTEMPTS,
+            )
+
+    def _search_index_covers(self, collection_name: str, requested: dict[str, int]) -> bool:
+        """Whether the text index known to be in place has the requested fields."""
+        known = self._search_weights.get(collection_name)
+        return known is not None and requested.items() <= known.items()
+
+    async def _merge_search_index(self, collection_name: str, requested: dict[str, int]) -> dict[str, int]:
+        """Read the current text index and replace it with one covering the requested fields.
+
+        Returns:
+            The weights of the index now in place.
+        """
+        collection = self.db[collection_name]
+        existing_name, existing_weights = None, {}
+        for name, spec in (await collection.index_information()).items():
+            if ("_fts", "text") in spec.get("key", []):
+                existing_name, existing_weights = name, dict(spec.get("weights", {}))
+                break
+
+        weights = {**SEARCH_BASE_WEIGHTS, **existing_weights, **requested}
+        if existing_name == SEARCH_INDEX_NAME and weights == existing_weights:
+            return weights
+
+        # Only one text index per collection: replace the previous one
+        if existing_name is not None:
+            await collection.drop_index(existing_name)
+        await collection.create_index(
+            [(field, TEXT) for field in weights],
+            weights=weights,
+            name=SEARCH_INDEX_NAME,
+            language_override=SEARCH_LANGUAGE_OVERRIDE,
+        )
+        logger.info(
+            "Document search index built",
+            collection=collection_name,
+            fields=sorted(weights),
+            replaced=existing_name,
+        )
+        return weights
+
     async def save(
         self,
         document: DocumentIndex,
@@ -171,6 +337,72 @@ class DocumentRepository:
             documents.append(DocumentIndex.model_validate(doc))
         return documents
 
+    async def find_page(
+        self,
+        collection_name: str,
+        query: dict[str, Any],
+        page_size: int,
+        after: tuple[datetime, str] | None = None,
+    ) -> tuple[list[DocumentIndex], bool]:
+        """Get one page of documents, newest first, using a keyset cursor.
+
+        Args:
+            collection_name: The collection to search in.
+            query: MongoDB filter.
+            page_size: Maximum number of documents to return.
+            after: (created_at, document_id) of the last document of the
+                previous page; None for the first page.
+
+        Returns:
+            The page of documents and whether more documents follow.
+        """
+        collection = self.db[collection_name]
+        if after is not None:
+            created_at, document_id = after
+            keyset = {
+                "$or": [
+                    {"created_at": {"$lt": created_at}},
+                    {"created_at": created_at, "document_id": {"$lt": document_id}},
+                ]
+            }
+            query = {"$and": [query, keyset]} if query else keyset
+
+        cursor = collection.find(query).sort(PAGE_SORT).limit(page_size + 1)
+        documents = [DocumentIndex.model_validate(doc) async for doc in cursor]
+        return documents[:page_size], len(documents) > page_size
+
+    async def count(self, collection_name: str, query: dict[str, Any]) -> tuple[int, bool]:
+        """Count documents matching a filter, cheaply.
+
+        Unfiltered counts come from collection metadata; filtered counts are
+        cached for count_cache_ttl_seconds.
+
+        Args:
+            collection_name: The collection to count in.
+            query: MongoDB filter.
+
+        Returns:
+            The count and whether it is estimated (metadata or cached).
+        """
+        collection = self.db[collection_name]
+        if not query:
+            return await collection.estimated_document_count(), True
+
+        key = (collection_name, json.dumps(query, sort_keys=True, default=str))
+        now = time.monotonic()
+        cached = self._count_cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1], True
+
+        total = await collection.count_documents(query)
+        if self._count_cache_ttl > 0:
+            self._count_cache.pop(key, None)
+            if len(self._count_cache) >= COUNT_CACHE_MAX_ENTRIES:
+                # Drop the oldest entry (dicts keep insertion order)
+                del self._count_cache[next(iter(self._count_cache))]
+            self._count_cache[key] = (now + self._count_cache_ttl, total)
+        return total, False
+
     async def count_by_source(
         self,
         source_id: str,
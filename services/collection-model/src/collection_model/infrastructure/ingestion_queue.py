@@ -4,17 +4,25 @@ This module provides the IngestionQueue class which manages the
 ingestion_queue MongoDB collection for storing IngestionJob documents.
 """
 
-from datetime import UTC, datetime
+import asyncio
+import contextlib
+from datetime import UTC, datetime, timedelta
 
 import structlog
 from collection_model.domain.ingestion_job import IngestionJob
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from pymongo.errors import DuplicateKeyError
+from pymongo.errors import DuplicateKeyError, OperationFailure
 
 logger = structlog.get_logger(__name__)
 
 COLLECTION_NAME = "ingestion_queue"
 
+# Statuses in which a job is held by a worker lease
+LEASED_STATUSES = ("processing", "extracting")
+
+# MongoDB error code when a resume token has rolled off the oplog
+CHANGE_STREAM_HISTORY_LOST = 286
+
 
 class IngestionQueue:
     """Queue for ingestion jobs stored in MongoDB.
@@ -23,6 +31,8 @@ class IngestionQueue:
     - Ensuring indexes (idempotency + processing order)
     - Queuing new jobs with duplicate detection
     - Retrieving pending jobs for processing
+    - Atomically claiming jobs under a renewable lease (multi-replica workers)
+    - Change stream wakeup when jobs become available (push mode)
 
     Attributes:
         COLLECTION_NAME: Name of the MongoDB collection.
@@ -39,12 +49,19 @@ class IngestionQueue:
         self.db = db
         self.collection = db[COLLECTION_NAME]
 
+        # Push mode state (change stream wakeup)
+        self._job_available = asyncio.Event()
+        self._change_stream_task: asyncio.Task | None = None
+        self._change_stream_active: bool = False
+        self._resume_token: dict | None = None
+
     async def ensure_indexes(self) -> None:
         """Create required indexes for the ingestion queue.
 
         Creates:
         - Unique compound index on (blob_path, blob_etag) for idempotency
         - Index on (status, created_at) for efficient queue processing
+        - Index on (status, lease_expires_at) for expired lease reclaim
 
         """
         # Unique compound index for Event Grid retry idempotency
@@ -60,6 +77,12 @@ class IngestionQueue:
             name="idx_status_created",
         )
 
+        # Index for reclaiming jobs whose worker lease has expired
+        await self.collection.create_index(
+            [("status", 1), ("lease_expires_at", 1)],
+            name="idx_status_lease_expires",
+        )
+
         # Index for source_id queries
         await self.collection.create_index(
             "source_id",
@@ -123,6 +146,150 @@ class IngestionQueue:
             jobs.append(IngestionJob.model_validate(doc))
         return jobs
 
+    async def claim_job(
+        self,
+        worker_id: str,
+        lease_seconds: float,
+        exclude_sources: set[str] | None = None,
+        max_retries: int | None = None,
+    ) -> IngestionJob | None:
+        """Atomically claim the oldest available job under a lease.
+
+        A job is available if it is queued, or if it is in a leased status
+        whose lease has expired (worker crashed or lost connectivity). The
+        claim is a single find_one_and_update, so concurrent workers across
+        replicas never receive the same job. Reclaiming an expired lease
+        counts as a failed attempt and increments retry_count.
+
+        Args:
+            worker_id: Unique ID of the claiming worker.
+            lease_seconds: Lease duration; must be renewed before expiry.
+            exclude_sources: Source IDs to skip (per-source concurrency caps).
+            max_retries: If set, expired jobs whose next attempt would reach
+                this count are not reclaimed (see fail_exhausted_leases).
+
+        Returns:
+            The claimed IngestionJob with status "processing", or None if
+            no job is available.
+
+        """
+        now = datetime.now(UTC)
+        expired_clause: dict = {"status": {"$in": list(LEASED_STATUSES)}, "lease_expires_at": {"$lt": now}}
+        if max_retries is not None:
+            expired_clause["retry_count"] = {"$lt": max_retries - 1}
+        query: dict = {"$or": [{"status": "queued"}, expired_clause]}
+        if exclude_sources:
+            query["source_id"] = {"$nin": sorted(exclude_sources)}
+
+        # Pipeline update: expressions see the pre-claim document, so only a
+        # reclaim (job still in a leased status) bumps retry_count
+        reclaimed = {"$in": ["$status", list(LEASED_STATUSES)]}
+        doc = await self.collection.find_one_and_update(
+            query,
+            [
+                {
+                    "$set": {
+                        "retry_count": {
+                            "$cond": [
+                                reclaimed,
+                                {"$add": [{"$ifNull": ["$retry_count", 0]}, 1]},
+                                {"$ifNull": ["$retry_count", 0]},
+                            ],
+                        },
+                        "status": "processing",
+                        "lease_owner": worker_id,
+                        "lease_expires_at": now + timedelta(seconds=lease_seconds),
+                    },
+                },
+            ],
+            sort=[("created_at", 1)],
+            return_document=True,
+        )
+        if not doc:
+            return None
+
+        job = IngestionJob.model_validate(doc)
+        logger.debug(
+            "Ingestion job claimed",
+            ingestion_id=job.ingestion_id,
+            source_id=job.source_id,
+            worker_id=worker_id,
+            retry_count=job.retry_count,
+        )
+        return job
+
+    async def fail_exhausted_leases(self, max_retries: int) -> int:
+        """Permanently fail expired-lease jobs that have used up their retries.
+
+        A job whose worker keeps dying (poison job) is never reclaimed by
+        claim_job once its next attempt would reach max_retries; this moves
+        such jobs to "failed" instead of leaving them stuck in a leased status.
+
+        Args:
+            max_retries: Max attempts before permanent failure.
+
+        Returns:
+            Number of jobs marked failed.
+
+        """
+        now = datetime.now(UTC)
+        result = await self.collection.update_many(
+            {
+                "status": {"$in": list(LEASED_STATUSES)},
+                "lease_expires_at": {"$lt": now},
+                "retry_count": {"$gte": max_retries - 1},
+            },
+            {
+                "$set": {
+                    "status": "failed",
+                    "processed_at": now,
+                    "error_message": "Worker lease expired after max retries",
+                    "lease_owner": None,
+                    "lease_expires_at": None,
+                },
+                "$inc": {"retry_count": 1},
+            },
+        )
+        if result.modified_count:
+            logger.error(
+                "Jobs failed after repeated lease expiry",
+                count=result.modified_count,
+                max_retries=max_retries,
+            )
+        return result.modified_count
+
+    async def renew_lease(self, ingestion_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """Extend the lease on a job held by this worker (heartbeat).
+
+        Args:
+            ingestion_id: The ingestion_id of the leased job.
+            worker_id: Worker ID that claimed the job.
+            lease_seconds: New lease duration from now.
+
+        Returns:
+            True if the lease was renewed, False if the job is no longer
+            held by this worker (lease expired and was reclaimed, or the
+            job already finished).
+
+        """
+        result = await self.collection.update_one(
+            {
+                "ingestion_id": ingestion_id,
+                "lease_owner": worker_id,
+                "status": {"$in": list(LEASED_STATUSES)},
+            },
+            {"$set": {"lease_expires_at": datetime.now(UTC) + timedelta(seconds=lease_seconds)}},
+        )
+        if result.matched_count > 0:
+            return True
+
+        logger.warning(
+            "Lease lost for ingestion job",
+            ingestion_id=ingestion_id,
+            worker_id=worker_id,
+        )
+        return False
+
     async def update_job_status(
         self,
         ingestion_id: str,
@@ -131,6 +298,7 @@ class IngestionQueue:
         error_type: str | None = None,
         document_id: str | None = None,
         no_retry: bool = False,
+        lease_owner: str | None = None,
     ) -> bool:
         """Update the status of a job.
 
@@ -141,14 +309,22 @@ class IngestionQueue:
             error_type: Optional error type classification.
             document_id: Optional document ID if processing completed.
             no_retry: If True, marks job as permanently failed (config error).
+            lease_owner: If set, only update while this worker still holds the
+                lease, so a worker whose lease was reclaimed cannot overwrite
+                the new owner's result.
 
         Returns:
-            True if job was found and updated, False otherwise.
+            True if job was found and updated, False otherwise (including
+            when the lease is no longer held by ``lease_owner``).
 
         """
         update_doc: dict = {"status": status}
         if status in ("completed", "failed"):
             update_doc["processed_at"] = datetime.now(UTC)
+        if status not in LEASED_STATUSES:
+            # Leaving a leased status releases the worker lease
+            update_doc["lease_owner"] = None
+            update_doc["lease_expires_at"] = None
         if error_message:
             update_doc["error_message"] = error_message
         if error_type:
@@ -156,10 +332,11 @@ class IngestionQueue:
         if document_id:
             update_doc["document_id"] = document_id
 
-        result = await self.collection.update_one(
-            {"ingestion_id": ingestion_id},
-            {"$set": update_doc},
-        )
+        query: dict = {"ingestion_id": ingestion_id}
+        if lease_owner is not None:
+            query["lease_owner"] = lease_owner
+
+        result = await self.collection.update_one(query, {"$set": update_doc})
 
         if result.modified_count > 0:
             logger.debug(
@@ -173,21 +350,28 @@ class IngestionQueue:
         logger.warning(
             "Job not found for status update",
             ingestion_id=ingestion_id,
+            lease_owner=lease_owner,
         )
         return False
 
-    async def increment_retry_count(self, ingestion_id: str) -> int:
+    async def increment_retry_count(self, ingestion_id: str, lease_owner: str | None = None) -> int:
         """Increment the retry count for a job and return new count.
 
         Args:
             ingestion_id: The ingestion_id of the job to update.
+            lease_owner: If set, only increment while this worker holds the lease.
 
         Returns:
-            The new retry count after increment.
+            The new retry count after increment, or 0 if the job was not
+            found (or the lease is no longer held).
 
         """
+        query: dict = {"ingestion_id": ingestion_id}
+        if lease_owner is not None:
+            query["lease_owner"] = lease_owner
+
         result = await self.collection.find_one_and_update(
-            {"ingestion_id": ingestion_id},
+            query,
             {"$inc": {"retry_count": 1}},
             return_document=True,
         )
@@ -221,3 +405,104 @@ class IngestionQueue:
         if doc:
             return IngestionJob.model_validate(doc)
         return None
+
+    # -------------------------------------------------------------------------
+    # Push mode: change stream wakeup
+    # -------------------------------------------------------------------------
+
+    async def start_change_stream(self) -> None:
+        """Start watching the queue collection for newly available jobs.
+
+        Spawns a background task that sets the job-available signal on every
+        insert and on every update that re-queues a job (retry), so waiting
+        workers claim it immediately instead of on their next poll.
+        """
+        if self._change_stream_task is not None and not self._change_stream_task.done():
+            logger.warning("Ingestion queue change stream already running")
+            return
+
+        self._change_stream_active = True
+        self._change_stream_task = asyncio.create_task(
+            self._watch_changes(),
+            name="ingestion_queue_change_stream",
+        )
+        logger.info("Ingestion queue change stream started")
+
+    async def stop_change_stream(self) -> None:
+        """Stop the change stream watcher."""
+        self._change_stream_active = False
+        if self._change_stream_task:
+            self._change_stream_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._change_stream_task
+            self._change_stream_task = None
+        logger.info("Ingestion queue change stream stopped")
+
+    @property
+    def change_stream_active(self) -> bool:
+        """Whether the change stream watcher is running."""
+        return self._change_stream_task is not None and not self._change_stream_task.done()
+
+    async def wait_for_job(self) -> None:
+        """Wait until the change stream signals that a job may be available.
+
+        The signal is consumed on return, so each wakeup triggers one claim
+        round. Signals arriving during that round wake the next wait at once.
+        """
+        await self._job_available.wait()
+        self._job_available.clear()
+
+    async def _watch_changes(self) -> None:
+        """Watch the queue collection for inserted or re-queued jobs.
+
+        Uses a resume token for reconnection. Every (re)connect signals a
+        wakeup so jobs inserted while disconnected are claimed; if the
+        resume token is lost from the oplog, the stream restarts from now
+        and that catch-up claim covers the gap.
+        """
+        pipeline = [
+            {
+                "$match": {
+                    "$or": [
+                        {"operationType": "insert"},
+                        {"operationType": "update", "updateDescription.updatedFields.status": "queued"},
+                    ],
+                },
+            },
+        ]
+
+        while self._change_stream_active:
+            try:
+                async with self.collection.watch(pipeline, resume_after=self._resume_token) as stream:
+                    logger.debug(
+                        "Ingestion queue change stream connected",
+                        has_resume_token=self._resume_token is not None,
+                    )
+                    self._job_available.set()
+                    async for change in stream:
+                        if not self._change_stream_active:
+                            break
+                        self._resume_token = change.get("_id")
+                        self._job_available.set()
+
+            except asyncio.CancelledError:
+                logger.debug("Ingestion queue change stream cancelled")
+                break
+            except OperationFailure as e:
+                if not self._change_stream_active:
+                    break
+                if e.code == CHANGE_STREAM_HISTORY_LOST:
+                    logger.warning("Ingestion queue resume token lost, restarting change stream")
+                    self._resume_token = None
+                else:
+                    logger.warning("Ingestion queue change stream failed, reconnecting...", error=str(e))
+                await asyncio.sleep(1)
+            except Exception as e:
+                if not self._change_stream_active:
+                    break
+                logger.warning(
+                    "Ingestion queue change stream disconnected, reconnecting...",
+                    error=str(e),
+                    has_resume_token=self._resume_token is not None,
+                )
+                await asyncio.sleep(1)  # Brief pause before reconnect
@@ -7,6 +7,7 @@ for deduplication.
 
 import hashlib
 from datetime import UTC, datetime
+from typing import BinaryIO
 
 import structlog
 from collection_model.domain.exceptions import DuplicateDocumentError, StorageError
@@ -80,21 +81,29 @@ class RawDocumentStore:
 
     async def store_raw_document(
         self,
-        content: bytes,
+        content: bytes | BinaryIO,
         source_config: SourceConfig,
         ingestion_id: str,
         metadata: dict[str, str] | None = None,
+        content_hash: str | None = None,
+        size_bytes: int | None = None,
     ) -> RawDocument:
         """Store raw document content with deduplication.
 
         Computes content hash and checks for duplicates before storing.
         If a duplicate exists, raises DuplicateDocumentError.
 
+        Content may be a seekable binary stream (e.g., a spooled ZIP) so
+        large documents are uploaded without being held in memory. Streams
+        must come with a precomputed content_hash and size_bytes.
+
         Args:
-            content: The raw content bytes to store.
+            content: The raw content bytes or seekable binary stream to store.
             source_config: Typed SourceConfig with storage settings.
             ingestion_id: ID of the ingestion job.
             metadata: Optional metadata from path extraction.
+            content_hash: Precomputed SHA-256 hex digest (required for streams).
+            size_bytes: Content size in bytes (required for streams).
 
         Returns:
             RawDocument with storage details.
@@ -107,7 +116,11 @@ class RawDocumentStore:
         source_id = source_config.source_id or "unknown"
         raw_container = source_config.storage.raw_container
 
-        content_hash = self.compute_content_hash(content)
+        if isinstance(content, bytes):
+            content_hash = content_hash or self.compute_content_hash(content)
+            size_bytes = len(content)
+        elif content_hash is None or size_bytes is None:
+            raise ValueError("content_hash and size_bytes are required when storing a stream")
 
         # Check for duplicate
         existing = await self.collection.find_one(
@@ -130,11 +143,14 @@ class RawDocumentStore:
         content_type = self._get_content_type(source_config)
 
         try:
+            if not isinstance(content, bytes):
+                content.seek(0)
             await self.blob_client.upload_blob(
                 container=raw_container,
                 blob_path=blob_path,
                 content=content,
                 content_type=content_type,
+                length=size_bytes,
             )
         except Exception as e:
             logger.exception(
@@ -153,7 +169,7 @@ class RawDocumentStore:
             blob_path=blob_path,
             content_hash=content_hash,
             content_type=content_type,
-            size_bytes=len(content),
+            size_bytes=size_bytes,
             stored_at=datetime.now(UTC),
             metadata=metadata or {},
         )
@@ -166,7 +182,7 @@ class RawDocumentStore:
                 document_id=raw_doc.document_id,
                 source_id=source_id,
                 content_hash=content_hash,
-                size_bytes=len(content),
+                size_bytes=size_bytes,
             )
             return raw_doc
         except DuplicateKeyError:
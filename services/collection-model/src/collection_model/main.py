@@ -233,6 +233,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             db=db,
             host=settings.host,
             port=settings.grpc_port,
+            count_cache_ttl_seconds=settings.document_count_cache_ttl_seconds,
         )
         app.state.grpc_server = grpc_server
         logger.info(
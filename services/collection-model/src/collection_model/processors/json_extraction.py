@@ -627,7 +627,7 @@ class JsonExtractionProcessor(ContentProcessor):
         link_field = source_config.transformation.link_field
 
         # Ensure indexes exist
-        await self._doc_repo.ensure_indexes(collection_name, link_field)
+        await self._doc_repo.ensure_indexes(collection_name, link_field, source_config.storage.search_fields)
 
         # Save document
         await self._doc_repo.save(document, collection_name)
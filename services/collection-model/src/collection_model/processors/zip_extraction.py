@@ -4,14 +4,27 @@ This module provides the ZipExtractionProcessor class which handles
 ZIP file ingestion following the Generic ZIP Manifest Format. It is
 FULLY GENERIC - no hardcoded collection names, container names,
 event topics, or domain-specific field names.
+
+ZIPs are streamed from blob storage into a spooled temporary file (content
+hash computed during the download) and members are extracted one at a time,
+so peak memory is bounded by roughly one member per in-flight document
+rather than the archive.
+
+Manifest documents are processed with bounded parallelism: decompression and
+thumbnail generation run in the default thread pool, and blob uploads for
+different documents overlap. Documents are only persisted once every
+document succeeded, preserving all-or-nothing batch semantics.
 """
 
+import asyncio
+import hashlib
 import io
 import json
 import re
+import tempfile
 import zipfile
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, BinaryIO
 
 import structlog
 from collection_model.domain.document_index import (
@@ -22,6 +35,7 @@ from collection_model.domain.document_index import (
 )
 from collection_model.domain.exceptions import (
     BatchProcessingError,
+    BlobTooLargeError,
     ConfigurationError,
     DuplicateDocumentError,
     ManifestValidationError,
@@ -46,6 +60,8 @@ logger = structlog.get_logger(__name__)
 MAX_ZIP_SIZE_BYTES = 500 * 1024 * 1024  # 500 MB
 MAX_DOCUMENTS_PER_ZIP = 10000
 MAX_FILES_PER_DOCUMENT = 100
+ZIP_SPOOL_MAX_MEMORY_BYTES = 8 * 1024 * 1024  # Spill downloaded ZIPs to disk above 8 MB
+MAX_PARALLEL_DOCUMENTS = 8  # Manifest documents extracted/uploaded concurrently
 
 
 class ZipExtractionProcessor(ContentProcessor):
@@ -58,10 +74,10 @@ class ZipExtractionProcessor(ContentProcessor):
     - NO hardcoded field names (copies linkage AS-IS, stores payload AS-IS)
 
     Processing pipeline:
-    1. Download ZIP blob from Azure Blob Storage
+    1. Stream ZIP blob from Azure Blob Storage into a spooled temp file
     2. Store raw ZIP to config-driven raw_container
     3. Extract and validate manifest.json
-    4. Process each document in manifest:
+    4. Process manifest documents in parallel (bounded):
        a. Extract files and store to config-driven file_container
        b. Parse metadata files AS-IS
        c. Create DocumentIndex with config-driven linkage
@@ -119,45 +135,46 @@ class ZipExtractionProcessor(ContentProcessor):
         )
 
         try:
-            # Step 1: Download ZIP blob
-            zip_content = await self._download_blob(job)
-
-            # Validate ZIP size
-            if len(zip_content) > MAX_ZIP_SIZE_BYTES:
-                raise ZipExtractionError(f"ZIP exceeds maximum size: {len(zip_content)} > {MAX_ZIP_SIZE_BYTES}")
-
-            # Step 2: Store raw ZIP first (before processing)
-            raw_zip_ref = await self._store_raw_zip(
-                zip_content=zip_content,
-                job=job,
-                source_config=source_config,
-            )
-
-            # Step 3: Extract and validate manifest
-            manifest = self._extract_and_validate_manifest(
-                zip_content=zip_content,
-                source_config=source_config,
-            )
+            # Reject oversized ZIPs before downloading when the size is known
+            if job.content_length and job.content_length > MAX_ZIP_SIZE_BYTES:
+                raise ZipExtractionError(f"ZIP exceeds maximum size: {job.content_length} > {MAX_ZIP_SIZE_BYTES}")
+
+            with tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_MEMORY_BYTES) as zip_file:
+                # Step 1: Stream ZIP blob to spool, hashing during download
+                # (aborted as soon as it passes MAX_ZIP_SIZE_BYTES)
+                content_hash, zip_size = await self._download_blob_to_spool(job, zip_file)
+
+                # Step 2: Store raw ZIP first (before processing)
+                raw_zip_ref = await self._store_raw_zip(
+                    zip_content=zip_file,
+                    job=job,
+                    source_config=source_config,
+                    content_hash=content_hash,
+                    size_bytes=zip_size,
+                )
 
-            # Validate document count
-            if len(manifest.documents) > MAX_DOCUMENTS_PER_ZIP:
-                raise ZipExtractionError(
-                    f"ZIP exceeds maximum document count: {len(manifest.documents)} > {MAX_DOCUMENTS_PER_ZIP}"
+                # Step 3: Extract and validate manifest
+                manifest = self._extract_and_validate_manifest(
+                    zip_content=zip_file,
+                    source_config=source_config,
                 )
 
-            # Step 4: Process each document in manifest (open ZipFile once for efficiency)
-            documents: list[DocumentIndex] = []
-            with zipfile.ZipFile(io.BytesIO(zip_content), "r") as zf:
-                for doc_entry in manifest.documents:
-                    doc = await self._process_document(
+                # Validate document count
+                if len(manifest.documents) > MAX_DOCUMENTS_PER_ZIP:
+                    raise ZipExtractionError(
+                        f"ZIP exceeds maximum document count: {len(manifest.documents)} > {MAX_DOCUMENTS_PER_ZIP}"
+                    )
+
+                # Step 4: Process documents in parallel (open ZipFile once, read members one at a time)
+                zip_file.seek(0)
+                with zipfile.ZipFile(zip_file, "r") as zf:
+                    documents = await self._process_documents(
                         zf=zf,
-                        doc_entry=doc_entry,
                         manifest=manifest,
                         raw_zip_ref=raw_zip_ref,
                         job=job,
                         source_config=source_config,
                     )
-                    documents.append(doc)
 
             # Step 5: Store all documents atomically
             await self._store_documents_atomic(documents, source_config)
@@ -177,7 +194,7 @@ class ZipExtractionProcessor(ContentProcessor):
             )
 
             # Record storage metrics
-            StorageMetrics.record_stored(source_id, len(zip_content))
+            StorageMetrics.record_stored(source_id, zip_size)
 
             return ProcessorResult(
                 success=True,
@@ -282,21 +299,42 @@ class ZipExtractionProcessor(ContentProcessor):
             "application/x-zip",
         )
 
-    async def _download_blob(self, job: IngestionJob) -> bytes:
-        """Download blob content from Azure Blob Storage."""
+    async def _download_blob_to_spool(self, job: IngestionJob, spool: BinaryIO) -> tuple[str, int]:
+        """Stream blob content into a spool file, hashing it incrementally.
+
+        Args:
+            job: The ingestion job with blob location.
+            spool: Writable, seekable binary file to receive the ZIP.
+
+        Returns:
+            Tuple of (SHA-256 hex digest, size in bytes).
+
+        Raises:
+            ZipExtractionError: If the ZIP exceeds MAX_ZIP_SIZE_BYTES.
+        """
         if not self._blob_client:
             raise ConfigurationError("Blob client not configured")
 
-        return await self._blob_client.download_blob(
-            container=job.container,
-            blob_path=job.blob_path,
-        )
+        hasher = hashlib.sha256()
+        try:
+            size_bytes = await self._blob_client.download_blob_to_file(
+                container=job.container,
+                blob_path=job.blob_path,
+                destination=spool,
+                on_chunk=hasher.update,
+                max_bytes=MAX_ZIP_SIZE_BYTES,
+            )
+        except BlobTooLargeError as e:
+            raise ZipExtractionError(f"ZIP exceeds maximum size: > {MAX_ZIP_SIZE_BYTES}") from e
+        return hasher.hexdigest(), size_bytes
 
     async def _store_raw_zip(
         self,
-        zip_content: bytes,
+        zip_content: bytes | BinaryIO,
         job: IngestionJob,
         source_config: SourceConfig,
+        content_hash: str | None = None,
+        size_bytes: int | None = None,
     ) -> RawDocumentRef:
         """Store raw ZIP in blob storage before processing."""
         if not self._raw_store:
@@ -307,6 +345,8 @@ class ZipExtractionProcessor(ContentProcessor):
             source_config=source_config,
             ingestion_id=job.ingestion_id,
             metadata=job.metadata,
+            content_hash=content_hash,
+            size_bytes=size_bytes,
         )
 
         return RawDocumentRef(
@@ -319,13 +359,13 @@ class ZipExtractionProcessor(ContentProcessor):
 
     def _extract_and_validate_manifest(
         self,
-        zip_content: bytes,
+        zip_content: bytes | BinaryIO,
         source_config: SourceConfig,
     ) -> ZipManifest:
         """Extract and validate manifest.json from ZIP.
 
         Args:
-            zip_content: ZIP file content bytes.
+            zip_content: ZIP file content bytes or seekable binary file.
             source_config: Typed SourceConfig with validation settings.
 
         Returns:
@@ -335,8 +375,12 @@ class ZipExtractionProcessor(ContentProcessor):
             ZipExtractionError: If ZIP is corrupt or manifest missing.
             ManifestValidationError: If manifest fails validation.
         """
+        if isinstance(zip_content, bytes):
+            zip_content = io.BytesIO(zip_content)
+        zip_content.seek(0)
+
         try:
-            with zipfile.ZipFile(io.BytesIO(zip_content), "r") as zf:
+            with zipfile.ZipFile(zip_content, "r") as zf:
                 # Check ZIP integrity
                 if zf.testzip() is not None:
                     raise ZipExtractionError("Corrupt ZIP file detected")
@@ -376,6 +420,53 @@ class ZipExtractionProcessor(ContentProcessor):
 
         return manifest
 
+    async def _process_documents(
+        self,
+        zf: zipfile.ZipFile,
+        manifest: ZipManifest,
+        raw_zip_ref: RawDocumentRef,
+        job: IngestionJob,
+        source_config: SourceConfig,
+    ) -> list[DocumentIndex]:
+        """Process all manifest documents with bounded parallelism.
+
+        At most MAX_PARALLEL_DOCUMENTS documents are extracted and uploaded
+        at once. Results keep manifest order. If any document fails, the
+        remaining ones are cancelled and the error propagates, so nothing
+        reaches _store_documents_atomic.
+
+        Args:
+            zf: Open ZipFile object (reads are serialized by zipfile).
+            manifest: The validated manifest.
+            raw_zip_ref: Reference to the stored raw ZIP.
+            job: The ingestion job.
+            source_config: Source configuration.
+
+        Returns:
+            DocumentIndex list in manifest order.
+        """
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_DOCUMENTS)
+
+        async def process_bounded(doc_entry: ManifestDocument) -> DocumentIndex:
+            async with semaphore:
+                return await self._process_document(
+                    zf=zf,
+                    doc_entry=doc_entry,
+                    manifest=manifest,
+                    raw_zip_ref=raw_zip_ref,
+                    job=job,
+                    source_config=source_config,
+                )
+
+        tasks = [asyncio.create_task(process_bounded(doc_entry)) for doc_entry in manifest.documents]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
     async def _process_document(
         self,
         zf: zipfile.ZipFile,
@@ -468,11 +559,13 @@ class ZipExtractionProcessor(ContentProcessor):
             )
 
         # Verify file exists in ZIP
-        if file_entry.path not in zf.namelist():
+        try:
+            zf.getinfo(file_entry.path)
+        except KeyError:
             raise ZipExtractionError(f"File not found in ZIP: {file_entry.path} (document: {doc_entry.document_id})")
 
-        # Extract file content
-        file_content = zf.read(file_entry.path)
+        # Extract file content off the event loop (decompression is CPU-bound)
+        file_content = await asyncio.to_thread(zf.read, file_entry.path)
 
         # Get container from config (NO hardcoded container names)
         # Note: StorageConfig may not have file_container - use getattr for optional field
@@ -497,34 +590,23 @@ class ZipExtractionProcessor(ContentProcessor):
         # Determine content type
         content_type = file_entry.mime_type or self._guess_mime_type(file_entry.path)
 
-        # Upload original to blob storage
-        blob_ref = await self._blob_client.upload_blob(
-            container=container,
-            blob_path=blob_path,
-            content=file_content,
-            content_type=content_type,
+        # Upload original while the thumbnail is generated and uploaded
+        blob_ref, thumbnail_blob_path = await asyncio.gather(
+            self._blob_client.upload_blob(
+                container=container,
+                blob_path=blob_path,
+                content=file_content,
+                content_type=content_type,
+            ),
+            self._store_thumbnail(
+                file_content=file_content,
+                file_entry=file_entry,
+                content_type=content_type,
+                container=container,
+                blob_path=blob_path,
+            ),
         )
 
-        # Generate thumbnail for image files (Story 2.13)
-        thumbnail_blob_path: str | None = None
-        if self._thumbnail_gen and file_entry.role == "image" and self._thumbnail_gen.supports_format(content_type):
-            thumbnail_bytes = self._thumbnail_gen.generate_thumbnail(file_content)
-            if thumbnail_bytes:
-                thumb_path = f"{blob_path}_thumb.jpg"
-                await self._blob_client.upload_blob(
-                    container=container,
-                    blob_path=thumb_path,
-                    content=thumbnail_bytes,
-                    content_type="image/jpeg",
-                )
-                thumbnail_blob_path = thumb_path
-                logger.debug(
-                    "Thumbnail stored",
-                    original_path=blob_path,
-                    thumbnail_path=thumb_path,
-                    thumbnail_size=len(thumbnail_bytes),
-                )
-
         # Return BlobReference with thumbnail path
         return BlobReference(
             container=blob_ref.container,
@@ -536,6 +618,45 @@ class ZipExtractionProcessor(ContentProcessor):
             thumbnail_blob_path=thumbnail_blob_path,
         )
 
+    async def _store_thumbnail(
+        self,
+        file_content: bytes,
+        file_entry: ManifestFile,
+        content_type: str,
+        container: str,
+        blob_path: str,
+    ) -> str | None:
+        """Generate and upload a thumbnail for image files (Story 2.13).
+
+        Thumbnail generation runs in a worker thread (PIL is CPU-bound).
+
+        Returns:
+            Blob path of the stored thumbnail, or None if not generated.
+        """
+        if not (
+            self._thumbnail_gen and file_entry.role == "image" and self._thumbnail_gen.supports_format(content_type)
+        ):
+            return None
+
+        thumbnail_bytes = await asyncio.to_thread(self._thumbnail_gen.generate_thumbnail, file_content)
+        if not thumbnail_bytes:
+            return None
+
+        thumb_path = f"{blob_path}_thumb.jpg"
+        await self._blob_client.upload_blob(
+            container=container,
+            blob_path=thumb_path,
+            content=thumbnail_bytes,
+            content_type="image/jpeg",
+        )
+        logger.debug(
+            "Thumbnail stored",
+            original_path=blob_path,
+            thumbnail_path=thumb_path,
+            thumbnail_size=len(thumbnail_bytes),
+        )
+        return thumb_path
+
     def _build_blob_path(
         self,
         pattern: str,
@@ -711,7 +832,7 @@ class ZipExtractionProcessor(ContentProcessor):
         link_field = source_config.transformation.link_field
 
         # Ensure indexes exist
-        await self._doc_repo.ensure_indexes(collection_name, link_field)
+        await self._doc_repo.ensure_indexes(collection_name, link_field, source_config.storage.search_fields)
 
         # Store all documents
         # TODO: Implement actual MongoDB transaction for true atomicity
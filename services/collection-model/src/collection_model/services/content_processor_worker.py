@@ -3,10 +3,25 @@
 This module provides the ContentProcessorWorker class which polls the
 ingestion queue and processes jobs using the appropriate processor
 based on source configuration.
+
+Jobs are claimed atomically under a lease (IngestionQueue.claim_job) and
+processed concurrently up to ``worker_concurrency`` per replica, with an
+optional per-source cap from ``ingestion.max_concurrent_jobs``. A heartbeat
+renews the lease while a job runs; jobs whose lease expires (crashed
+replica) are reclaimed by the next poll of any worker, counting as a retry.
+Status updates are scoped to the lease owner, so a worker whose lease was
+reclaimed cannot overwrite the new owner's result.
+
+In push mode (default) the worker is woken by the ingestion queue change
+stream as soon as a job is inserted or re-queued; polling then only runs at
+``worker_fallback_poll_interval`` as a safety net.
 """
 
 import asyncio
+import contextlib
+import socket
 from typing import Any
+from uuid import uuid4
 
 import structlog
 from collection_model.config import settings
@@ -31,6 +46,8 @@ class ContentProcessorWorker:
 
     Polls the ingestion_queue collection for pending jobs and processes
     them using the appropriate processor based on source configuration.
+    Several replicas can drain the same queue: each job is claimed under a
+    lease owned by ``worker_id`` so it is processed by one worker at a time.
     """
 
     def __init__(
@@ -42,6 +59,11 @@ class ContentProcessorWorker:
         poll_interval: float | None = None,
         batch_size: int | None = None,
         max_retries: int | None = None,
+        concurrency: int | None = None,
+        lease_seconds: float | None = None,
+        heartbeat_interval: float | None = None,
+        push_enabled: bool | None = None,
+        fallback_poll_interval: float | None = None,
     ) -> None:
         """Initialize the worker.
 
@@ -51,8 +73,13 @@ class ContentProcessorWorker:
             source_config_service: Service for source config lookups.
             processing_metrics: Metrics for recording processing stats (optional).
             poll_interval: Seconds between queue polls (defaults to settings).
-            batch_size: Max jobs to process per poll (defaults to settings).
+            batch_size: Max jobs to claim per poll (defaults to settings).
             max_retries: Max retry attempts before permanent failure.
+            concurrency: Max jobs processed in parallel (defaults to settings).
+            lease_seconds: Job lease duration (defaults to settings).
+            heartbeat_interval: Seconds between lease renewals (defaults to settings).
+            push_enabled: Wake on queue change stream events (defaults to settings).
+            fallback_poll_interval: Poll interval in push mode (defaults to settings).
         """
         self.db = db
         self.queue = ingestion_queue
@@ -61,8 +88,18 @@ class ContentProcessorWorker:
         self.poll_interval = poll_interval or settings.worker_poll_interval
         self.batch_size = batch_size or settings.worker_batch_size
         self.max_retries = max_retries or settings.worker_max_retries
+        self.concurrency = concurrency or settings.worker_concurrency
+        self.lease_seconds = lease_seconds or settings.worker_lease_seconds
+        self.heartbeat_interval = heartbeat_interval or settings.worker_heartbeat_interval
+        self.push_enabled = settings.worker_push_enabled if push_enabled is None else push_enabled
+        self.fallback_poll_interval = fallback_poll_interval or settings.worker_fallback_poll_interval
+        self.worker_id = f"{socket.gethostname()}-{uuid4().hex[:8]}"
         self._running = False
 
+        # In-flight jobs: ingestion_id -> task, and per-source counts for caps
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self._source_in_flight: dict[str, int] = {}
+
         # Infrastructure clients (initialized on start)
         self._blob_client: BlobStorageClient | None = None
         self._raw_store: RawDocumentStore | None = None
@@ -78,23 +115,39 @@ class ContentProcessorWorker:
             poll_interval=self.poll_interval,
             batch_size=self.batch_size,
             max_retries=self.max_retries,
+            concurrency=self.concurrency,
+            push_enabled=self.push_enabled,
+            worker_id=self.worker_id,
         )
 
         # Initialize infrastructure clients
         await self._init_infrastructure()
 
+        if self.push_enabled:
+            await self.queue.start_change_stream()
+
         while self._running:
             try:
                 await self._process_pending_jobs()
             except Exception as e:
                 logger.exception("Worker loop error", error=str(e))
 
-            await asyncio.sleep(self.poll_interval)
+            await self._wait_for_next_poll()
 
     async def stop(self) -> None:
-        """Stop the worker loop."""
+        """Stop the worker loop.
+
+        In-flight jobs are allowed to finish so their leases are released
+        cleanly instead of waiting for expiry.
+        """
         self._running = False
-        logger.info("Content processor worker stopping")
+        logger.info("Content processor worker stopping", in_flight=len(self._in_flight))
+
+        if self.push_enabled:
+            await self.queue.stop_change_stream()
+
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight.values(), return_exceptions=True)
 
         # Cleanup
         if self._blob_client:
@@ -113,22 +166,122 @@ class ContentProcessorWorker:
         # Ensure raw document indexes
         await self._raw_store.ensure_indexes()
 
+        # Build the merged search indexes before concurrent jobs need them
+        await self._doc_repo.ensure_search_indexes(await self.config_service.get_all_configs())
+
         logger.info("Infrastructure clients initialized")
 
-    async def _process_pending_jobs(self) -> None:
-        """Process all pending jobs in the queue."""
-        jobs = await self.queue.get_pending_jobs(limit=self.batch_size)
+    async def _process_pending_jobs(self) -> int:
+        """Claim available jobs into free concurrency slots and dispatch them.
 
-        if not jobs:
-            return
+        Returns:
+            Number of jobs claimed in this round.
+        """
+        free_slots = min(self.concurrency - len(self._in_flight), self.batch_size)
+        if free_slots <= 0:
+            return 0
+
+        await self.queue.fail_exhausted_leases(self.max_retries)
+        source_limits = await self._get_source_limits()
+
+        claimed = 0
+        while claimed < free_slots:
+            job = await self.queue.claim_job(
+                self.worker_id,
+                self.lease_seconds,
+                exclude_sources=self._saturated_sources(source_limits),
+                max_retries=self.max_retries,
+            )
+            if job is None:
+                break
+            self._dispatch(job)
+            claimed += 1
 
-        logger.debug("Processing pending jobs", count=len(jobs))
+        if claimed:
+            logger.debug("Claimed pending jobs", count=claimed, in_flight=len(self._in_flight))
+        return claimed
+
+    async def _wait_for_next_poll(self) -> None:
+        """Wait until the next claim round.
+
+        Wakes early when an in-flight job finishes (a slot frees up) or, in
+        push mode, when the queue change stream signals an available job.
+        """
+        waiters: list[asyncio.Future] = list(self._in_flight.values())
+        wakeup: asyncio.Task | None = None
+        if self.push_enabled:
+            wakeup = asyncio.create_task(self.queue.wait_for_job())
+            waiters.append(wakeup)
 
-        for job in jobs:
+        timeout = self.fallback_poll_interval if self.push_enabled else self.poll_interval
+        try:
+            if waiters:
+                await asyncio.wait(waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            else:
+                await asyncio.sleep(timeout)
+        finally:
+            if wakeup and not wakeup.done():
+                wakeup.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await wakeup
+
+    async def _get_source_limits(self) -> dict[str, int]:
+        """Get per-source concurrency caps from source configs (cached)."""
+        configs = await self.config_service.get_all_configs()
+        return {
+            config.source_id: config.ingestion.max_concurrent_jobs
+            for config in configs
+            if config.ingestion.max_concurrent_jobs
+        }
+
+    def _saturated_sources(self, source_limits: dict[str, int]) -> set[str]:
+        """Get source IDs that have reached their per-source concurrency cap."""
+        return {
+            source_id for source_id, limit in source_limits.items() if self._source_in_flight.get(source_id, 0) >= limit
+        }
+
+    def _dispatch(self, job: Any) -> None:
+        """Start processing a claimed job as a background task."""
+        self._source_in_flight[job.source_id] = self._source_in_flight.get(job.source_id, 0) + 1
+        task = asyncio.create_task(self._run_leased_job(job), name=f"ingestion_job_{job.ingestion_id}")
+        self._in_flight[job.ingestion_id] = task
+        task.add_done_callback(lambda _task: self._release_slot(job))
+
+    def _release_slot(self, job: Any) -> None:
+        """Free the concurrency slot held by a finished job."""
+        self._in_flight.pop(job.ingestion_id, None)
+        remaining = self._source_in_flight.get(job.source_id, 0) - 1
+        if remaining > 0:
+            self._source_in_flight[job.source_id] = remaining
+        else:
+            self._source_in_flight.pop(job.source_id, None)
+
+    async def _run_leased_job(self, job: Any) -> None:
+        """Process a claimed job while a heartbeat keeps its lease alive."""
+        heartbeat = asyncio.create_task(self._heartbeat(job.ingestion_id))
+        try:
             await self._process_job(job)
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+
+    async def _heartbeat(self, ingestion_id: str) -> None:
+        """Renew the job lease periodically until cancelled or the lease is lost."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                if not await self.queue.renew_lease(ingestion_id, self.worker_id, self.lease_seconds):
+                    return
+            except Exception as e:
+                # Transient failure - lease may still be renewed on the next beat
+                logger.warning("Lease renewal failed", ingestion_id=ingestion_id, error=str(e))
 
     async def _process_job(self, job: Any) -> None:
-        """Process a single ingestion job."""
+        """Process a single ingestion job.
+
+        The job has already been moved to "processing" by claim_job.
+        """
         import time
 
         start_time = time.time()
@@ -141,9 +294,6 @@ class ContentProcessorWorker:
         )
 
         try:
-            # Update status to processing
-            await self.queue.update_job_status(job.ingestion_id, "processing")
-
             # Get source config
             source_config = await self._get_source_config(job.source_id)
 
@@ -151,7 +301,7 @@ class ContentProcessorWorker:
             processor = await self._get_processor(source_config)
 
             # Update status to extracting
-            await self.queue.update_job_status(job.ingestion_id, "extracting")
+            await self.queue.update_job_status(job.ingestion_id, "extracting", lease_owner=self.worker_id)
 
             # Process the job
             result = await processor.process(job, source_config)
@@ -161,11 +311,14 @@ class ContentProcessorWorker:
             self._record_metrics(job.source_id, result.success, duration, result.error_type)
 
             if result.success:
-                await self.queue.update_job_status(
+                if not await self.queue.update_job_status(
                     job.ingestion_id,
                     "completed",
                     document_id=result.document_id,
-                )
+                    lease_owner=self.worker_id,
+                ):
+                    logger.warning("Lease lost before job completion recorded", ingestion_id=job.ingestion_id)
+                    return
                 logger.info(
                     "Job completed successfully",
                     ingestion_id=job.ingestion_id,
@@ -187,6 +340,7 @@ class ContentProcessorWorker:
                 error_message=str(e),
                 error_type="config",
                 no_retry=True,
+                lease_owner=self.worker_id,
             )
             self._record_metrics(job.source_id, False, time.time() - start_time, "config")
             logger.error("Processor not found", error=str(e), source_id=job.source_id)
@@ -199,6 +353,7 @@ class ContentProcessorWorker:
                 error_message=str(e),
                 error_type="config",
                 no_retry=True,
+                lease_owner=self.worker_id,
             )
             self._record_metrics(job.source_id, False, time.time() - start_time, "config")
             logger.error("Configuration error", error=str(e), source_id=job.source_id)
@@ -243,7 +398,11 @@ class ContentProcessorWorker:
         error_type: str,
     ) -> None:
         """Handle job failure with retry logic."""
-        retry_count = await self.queue.increment_retry_count(job.ingestion_id)
+        retry_count = await self.queue.increment_retry_count(job.ingestion_id, lease_owner=self.worker_id)
+        if retry_count == 0:
+            # Lease was reclaimed by another worker, which now owns the job
+            logger.warning("Lease lost before job failure recorded", ingestion_id=job.ingestion_id)
+            return
 
         if retry_count >= self.max_retries:
             await self.queue.update_job_status(
@@ -251,6 +410,7 @@ class ContentProcessorWorker:
                 "failed",
                 error_message=error_message,
                 error_type=error_type,
+                lease_owner=self.worker_id,
             )
             logger.error(
                 "Job failed after max retries",
@@ -265,6 +425,7 @@ class ContentProcessorWorker:
                 "queued",  # Re-queue for retry
                 error_message=error_message,
                 error_type=error_type,
+                lease_owner=self.worker_id,
             )
             logger.warning(
                 "Job failed, will retry",
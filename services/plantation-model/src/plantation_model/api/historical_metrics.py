@@ -0,0 +1,44 @@
+"""Admin endpoints for historical metrics maintenance."""
+
+from typing import Any
+
+from fastapi import APIRouter, HTTPException, Path, status
+
+router = APIRouter(prefix="/admin/historical-metrics", tags=["admin"])
+
+
+# Global reference to the HistoricalMetricsEngine (set by main.py)
+_historical_engine: Any = None
+
+
+def set_historical_metrics_engine(engine: Any) -> None:
+    """Set the engine used by the recompute endpoint.
+
+    This allows the router to be included before MongoDB is connected
+    without creating circular imports.
+    """
+    global _historical_engine
+    _historical_engine = engine
+
+
+@router.post(
+    "/factories/{factory_id}/recompute",
+    status_code=status.HTTP_200_OK,
+    summary="Recompute a factory's historical metrics",
+    description="Rebuilds the 30/90/365-day windows of every farmer of the factory from daily buckets.",
+)
+async def recompute_factory(
+    factory_id: str = Path(..., description="Factory ID", max_length=64),
+) -> dict[str, Any]:
+    """Backfill historical metrics for all farmers of a factory.
+
+    Raises:
+        HTTPException: 503 if the engine is not configured, 404 if the factory does not exist.
+    """
+    if _historical_engine is None:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Historical metrics not configured")
+
+    recomputed = await _historical_engine.backfill_factory(factory_id)
+    if recomputed is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Factory not found: {factory_id}")
+    return {"factory_id": factory_id, "farmers_recomputed": recomputed}
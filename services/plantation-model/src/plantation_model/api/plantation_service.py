@@ -1,6 +1,8 @@
 """PlantationService gRPC implementation."""
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 
 import grpc
@@ -39,6 +41,7 @@ from plantation_model.domain.models import (
     PolygonRing,
     PreferredLanguage,
     QualityThresholds,
+    QualityTier,
     Region,
     RegionalWeather,
     RegionBoundary,
@@ -48,7 +51,7 @@ from plantation_model.domain.models import (
 )
 from plantation_model.domain.models.id_generator import IDGenerator
 from plantation_model.domain.services.region_assignment import RegionAssignmentService
-from plantation_model.events.publisher import publish_event
+from plantation_model.events.publisher import publish_event, publish_events
 from plantation_model.infrastructure.google_elevation import (
     GoogleElevationClient,
     assign_region_from_altitude,
@@ -82,6 +85,12 @@ VALID_CP_STATUSES: set[str] = {"active", "inactive", "seasonal"}
 VALID_STORAGE_TYPES: set[str] = {"covered_shed", "open_air", "refrigerated"}
 VALID_COLLECTION_DAYS: set[str] = {"mon", "tue", "wed", "thu", "fri", "sat", "sun"}
 
+# Upper bound on farmer IDs accepted by the batch farmer RPCs
+MAX_BATCH_FARMER_IDS = 500
+
+# Upper bound on rows per ImportFarmers stream message
+MAX_IMPORT_ROWS_PER_REQUEST = 1000
+
 # PaymentPolicyType mappings (Story 1.9)
 # Domain enum -> Proto enum (for outgoing responses)
 PAYMENT_POLICY_TYPE_TO_PROTO: dict[PaymentPolicyType, int] = {
@@ -90,6 +99,19 @@ PAYMENT_POLICY_TYPE_TO_PROTO: dict[PaymentPolicyType, int] = {
     PaymentPolicyType.DELAYED_PAYMENT: plantation_pb2.PAYMENT_POLICY_TYPE_DELAYED_PAYMENT,
     PaymentPolicyType.FEEDBACK_ONLY: plantation_pb2.PAYMENT_POLICY_TYPE_FEEDBACK_ONLY,
 }
+# FarmScale / QualityTier proto enums -> domain enums (for ListFarmers filters)
+FARM_SCALE_FROM_PROTO: dict[int, FarmScale] = {
+    plantation_pb2.FARM_SCALE_SMALLHOLDER: FarmScale.SMALLHOLDER,
+    plantation_pb2.FARM_SCALE_MEDIUM: FarmScale.MEDIUM,
+    plantation_pb2.FARM_SCALE_ESTATE: FarmScale.ESTATE,
+}
+QUALITY_TIER_FROM_PROTO: dict[int, QualityTier] = {
+    plantation_pb2.QUALITY_TIER_TIER_1: QualityTier.TIER_1,
+    plantation_pb2.QUALITY_TIER_TIER_2: QualityTier.TIER_2,
+    plantation_pb2.QUALITY_TIER_TIER_3: QualityTier.TIER_3,
+    plantation_pb2.QUALITY_TIER_BELOW_TIER_3: QualityTier.BELOW_TIER_3,
+}
+QUALITY_TIER_TO_PROTO: dict[QualityTier, int] = {tier: proto for proto, tier in QUALITY_TIER_FROM_PROTO.items()}
 # Proto enum -> Domain enum (for incoming requests)
 PAYMENT_POLICY_TYPE_FROM_PROTO: dict[int, PaymentPolicyType] = {
     plantation_pb2.PAYMENT_POLICY_TYPE_SPLIT_PAYMENT: PaymentPolicyType.SPLIT_PAYMENT,
@@ -239,18 +261,27 @@ class PlantationServiceServicer(plantation_pb2_grpc.PlantationServiceServicer):
         Returns:
             region_id of the assigned region.
         """
-        # Try polygon-based assignment if region repository is available
-        if self._region_repo is not None:
-            regions, _, _ = await self._region_repo.list_active(page_size=1000)
-            if regions:
-                region_id = self._region_assignment_service.assign_region(
-                    latitude=latitude,
-                    longitude=longitude,
-                    altitude=altitude,
-                    regions=regions,
-                )
-                if region_id is not None:
-                    return region_id
+        return self._assign_region_from(await self._load_regions(), latitude, longitude, altitude)
+
+    async def _load_regions(self) -> list[Region]:
+        """Active regions used for polygon-based assignment (empty without a region repository)."""
+        if self._region_repo is None:
+            return []
+        regions, _, _ = await self._region_repo.list_active(page_size=1000)
+        return regions
+
+    def _assign_region_from(self, regions: list[Region], latitude: float, longitude: float, altitude: float) -> str:
+        """Assign a region against an already loaded set of active regions."""
+        # Try polygon-based assignment if regions are configured
+        if regions:
+            region_id = self._region_assignment_service.assign_region(
+                latitude=latitude,
+                longitude=longitude,
+                altitude=altitude,
+                regions=regions,
+            )
+            if region_id is not None:
+                return region_id
 
         # Fall back to legacy bounding box assignment
         return assign_region_from_altitude(latitude, longitude, altitude)
@@ -428,9 +459,34 @@ class PlantationServiceServicer(plantation_pb2_grpc.PlantationServiceServicer):
                 f"Factory {request.id} not found",
             )
 
+        if "quality_thresholds" in updates:
+            await self._recompute_factory_tiers(factory)
+
         logger.info("Updated factory %s", factory.id)
         return self._factory_to_proto(factory)
 
+    async def _recompute_factory_tiers(self, factory: Factory) -> None:
+        """Re-derive precomputed farmer tiers after a factory's thresholds change.
+
+        Farmers assigned to several factories take the thresholds of the
+        factory updated last.
+        """
+        if not self._farmer_performance_repo:
+            return
+
+        farmer_ids: set[str] = set()
+        page_token = None
+        while True:
+            cps, page_token, _ = await self._cp_repo.list_by_factory(factory.id, page_size=500, page_token=page_token)
+            for cp in cps:
+                farmer_ids.update(cp.farmer_ids)
+            if not page_token:
+                break
+
+        if farmer_ids:
+            updated = await self._farmer_performance_repo.recompute_tiers(factory.quality_thresholds, list(farmer_ids))
+            logger.info("Recomputed tiers for %d farmers of factory %s", updated, factory.id)
+
     async def DeleteFactory(
         self,
         request: plantation_pb2.DeleteFactoryRequest,
@@ -831,19 +887,18 @@ class PlantationServiceServicer(plantation_pb2_grpc.PlantationServiceServicer):
         """List farmers with optional filtering.
 
         Story 9.5a: collection_point_id filter removed - filter via CP.farmer_ids.
+        All filters (farm scale, prefix search, precomputed tier) are applied
+        in MongoDB, so pages are full and total_count is exact.
         """
-        filters = {}
-        if request.region_id:
-            filters["region_id"] = request.region_id
-        # Story 9.5a: collection_point_id filter removed
-        if request.active_only:
-            filters["is_active"] = True
-
         page_size = request.page_size if request.page_size > 0 else 100
         page_token = request.page_token if request.page_token else None
 
-        farmers, next_token, total = await self._farmer_repo.list(
-            filters=filters if filters else None,
+        farmers, next_token, total = await self._farmer_repo.list_filtered(
+            region_id=request.region_id or None,
+            active_only=request.active_only,
+            farm_scale=FARM_SCALE_FROM_PROTO.get(request.farm_scale),
+            search=request.search or None,
+            tier=QUALITY_TIER_FROM_PROTO.get(request.tier),
             page_size=page_size,
             page_token=page_token,
         )
@@ -958,6 +1013,143 @@ class PlantationServiceServicer(plantation_pb2_grpc.PlantationServiceServicer):
 
         return self._farmer_to_proto(farmer)
 
+    async def ImportFarmers(
+        self,
+        request_iterator: AsyncIterator[plantation_pb2.ImportFarmersRequest],
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncIterator[plantation_pb2.ImportFarmersResponse]:
+        """Bulk-register farmers, answering each request batch with per-row results.
+
+        Each batch costs a fixed number of round trips instead of several per
+        farmer: one duplicate lookup, batched elevation requests, one ID
+        block reservation, one unordered insert_many and one bulk event
+        publish. Regions are loaded once per import and assigned in memory.
+        Duplicate phones and national IDs are also rejected within the import.
+        """
+        regions = await self._load_regions()
+        seen_phones: set[str] = set()
+        seen_national_ids: set[str] = set()
+        imported = failed = 0
+
+        async for request in request_iterator:
+            if len(request.rows) > MAX_IMPORT_ROWS_PER_REQUEST:
+                await context.abort(
+                    grpc.StatusCode.INVALID_ARGUMENT,
+                    f"At most {MAX_IMPORT_ROWS_PER_REQUEST} rows per request",
+                )
+            results = await self._import_farmer_batch(list(request.rows), regions, seen_phones, seen_national_ids)
+            imported += sum(1 for result in results if result.farmer_id)
+            failed += sum(1 for result in results if result.error)
+            yield plantation_pb2.ImportFarmersResponse(results=results)
+
+        logger.info("Farmer import finished: %d created, %d failed", imported, failed)
+
+    async def _import_farmer_batch(
+        self,
+        rows: list[plantation_pb2.ImportFarmerRow],
+        regions: list[Region],
+        seen_phones: set[str],
+        seen_national_ids: set[str],
+    ) -> list[plantation_pb2.ImportFarmerRowResult]:
+        """Validate, enrich and insert one ImportFarmers batch."""
+        errors: dict[int, str] = {}
+        candidates: list[int] = []
+        for index, row in enumerate(rows):
+            phone, national_id = row.farmer.contact.phone, row.farmer.national_id
+            if phone in seen_phones:
+                errors[index] = f"Duplicate phone number in import: {phone}"
+            elif national_id in seen_national_ids:
+                errors[index] = f"Duplicate national ID in import: {national_id}"
+            else:
+                seen_phones.add(phone)
+                seen_national_ids.add(national_id)
+                candidates.append(index)
+
+        existing_phones, existing_national_ids = await self._farmer_repo.find_existing_contacts(
+            [rows[i].farmer.contact.phone for i in candidates],
+            [rows[i].farmer.national_id for i in candidates],
+        )
+        pending = []
+        for index in candidates:
+            farmer = rows[index].farmer
+            if farmer.contact.phone in existing_phones:
+                errors[index] = "Phone number already registered"
+            elif farmer.national_id in existing_national_ids:
+                errors[index] = "National ID already registered"
+            else:
+                pending.append(index)
+
+        altitudes = await self._elevation_client.get_altitudes(
+            [(rows[i].farmer.farm_location.latitude, rows[i].farmer.farm_location.longitude) for i in pending]
+        )
+        now = datetime.now(UTC)
+        farmers: dict[int, Farmer] = {}
+        for index, altitude in zip(pending, altitudes, strict=True):
+            request = rows[index].farmer
+            latitude, longitude = request.farm_location.latitude, request.farm_location.longitude
+            altitude = altitude if altitude is not None else 0.0
+            try:
+                # ID assigned after validation so rejected rows do not consume IDs
+                farmers[index] = Farmer(
+                    id="",
+                    grower_number=request.grower_number if request.grower_number else None,
+                    first_name=request.first_name,
+                    last_name=request.last_name,
+                    region_id=self._assign_region_from(regions, latitude, longitude, altitude),
+                    farm_location=GeoLocation(latitude=latitude, longitude=longitude, altitude_meters=altitude),
+                    contact=ContactInfo(
+                        phone=request.contact.phone,
+                        email=request.contact.email if request.contact.email else "",
+                        address=request.contact.address if request.contact.address else "",
+                    ),
+                    farm_size_hectares=request.farm_size_hectares,
+                    farm_scale=FarmScale.from_hectares(request.farm_size_hectares),
+                    national_id=request.national_id,
+                    registration_date=now,
+                    is_active=True,
+                    created_at=now,
+                    updated_at=now,
+                )
+            except ValueError as e:
+                errors[index] = f"Invalid farmer: {e}"
+
+        farmer_ids = await self._id_generator.generate_farmer_ids(len(farmers))
+        to_insert = [
+            farmer.model_copy(update={"id": farmer_id})
+            for farmer, farmer_id in zip(farmers.values(), farmer_ids, strict=True)
+        ]
+        insert_errors = await self._farmer_repo.insert_many(to_insert)
+        created: dict[int, Farmer] = {}
+        for position, (index, farmer) in enumerate(zip(farmers, to_insert, strict=True)):
+            if position in insert_errors:
+                errors[index] = insert_errors[position]
+            else:
+                created[index] = farmer
+
+        if created:
+            await publish_events(
+                pubsub_name=settings.dapr_pubsub_name,
+                topic=settings.dapr_farmer_events_topic,
+                events=[
+                    FarmerRegisteredEvent(
+                        farmer_id=farmer.id,
+                        phone=farmer.contact.phone,
+                        region_id=farmer.region_id,
+                        farm_scale=farmer.farm_scale.value,
+                    )
+                    for farmer in created.values()
+                ],
+            )
+
+        return [
+            plantation_pb2.ImportFarmerRowResult(
+                row_number=row.row_number,
+                farmer_id=created[index].id if index in created else "",
+                error=errors.get(index, ""),
+            )
+            for index, row in enumerate(rows)
+        ]
+
     async def UpdateFarmer(
         self,
         request: plantation_pb2.UpdateFarmerRequest,
@@ -1366,6 +1558,7 @@ class PlantationServiceServicer(plantation_pb2_grpc.PlantationServiceServicer):
             notification_channel=self._notification_channel_to_proto(farmer.notification_channel),
             interaction_pref=self._interaction_pref_to_proto(farmer.interaction_pref),
             pref_lang=self._pref_lang_to_proto(farmer.pref_lang),
+            tier=QUALITY_TIER_TO_PROTO.get(performance.tier, plantation_pb2.QUALITY_TIER_UNSPECIFIED),
         )
 
     async def GetFarmerSummary(
@@ -1418,6 +1611,73 @@ class PlantationServiceServicer(plantation_pb2_grpc.PlantationServiceServicer):
 
         return self._farmer_summary_to_proto(farmer, performance)
 
+    async def _default_grading_models(self, farmer_ids: list[str]) -> dict[str, GradingModel]:
+        """Resolve the grading model of each farmer's first CP factory (batch of GetFarmerSummary defaults)."""
+        if not self._grading_model_repo or not farmer_ids:
+            return {}
+
+        memberships = await self._cp_repo.list_by_farmers(farmer_ids)
+        factory_by_farmer = {farmer_id: cps[0].factory_id for farmer_id, cps in memberships.items() if cps}
+        factory_ids = list(dict.fromkeys(factory_by_farmer.values()))
+        models = await asyncio.gather(*(self._grading_model_repo.get_by_factory(f) for f in factory_ids))
+        model_by_factory = {f: m for f, m in zip(factory_ids, models, strict=True) if m is not None}
+
+        return {
+            farmer_id: model_by_factory[factory_id]
+            for farmer_id, factory_id in factory_by_farmer.items()
+            if factory_id in model_by_factory
+        }
+
+    async def GetFarmerSummaries(
+        self,
+        request: plantation_pb2.GetFarmerSummariesRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> plantation_pb2.GetFarmerSummariesResponse:
+        """Get farmer summaries for a list of farmers.
+
+        Batch variant of GetFarmerSummary: farmers and performances are read
+        with one $in query each, defaults are filled in the same way, and
+        unknown farmer IDs are reported instead of failing the call.
+        """
+        if not self._farmer_performance_repo:
+            await context.abort(
+                grpc.StatusCode.UNIMPLEMENTED,
+                "Farmer performance repository not configured",
+            )
+        if len(request.farmer_ids) > MAX_BATCH_FARMER_IDS:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"At most {MAX_BATCH_FARMER_IDS} farmer IDs per request",
+            )
+
+        farmer_ids = list(dict.fromkeys(request.farmer_ids))
+        farmers, performances = await asyncio.gather(
+            self._farmer_repo.get_by_ids(farmer_ids),
+            self._farmer_performance_repo.get_by_farmer_ids(farmer_ids),
+        )
+
+        defaults = await self._default_grading_models([f.id for f in farmers if f.id not in performances])
+
+        summaries = []
+        for farmer in farmers:
+            performance = performances.get(farmer.id)
+            if performance is None:
+                grading_model = defaults.get(farmer.id)
+                performance = FarmerPerformance.initialize_for_farmer(
+                    farmer_id=farmer.id,
+                    farm_size_hectares=farmer.farm_size_hectares,
+                    farm_scale=farmer.farm_scale,
+                    grading_model_id=grading_model.model_id if grading_model else "",
+                    grading_model_version=grading_model.model_version if grading_model else "",
+                )
+            summaries.append(self._farmer_summary_to_proto(farmer, performance))
+
+        found = {f.id for f in farmers}
+        return plantation_pb2.GetFarmerSummariesResponse(
+            summaries=summaries,
+            not_found_farmer_ids=[farmer_id for farmer_id in farmer_ids if farmer_id not in found],
+        )
+
     # =========================================================================
     # Communication Preferences Operations (Story 1.5)
     # =========================================================================
@@ -1634,6 +1894,36 @@ class PlantationServiceServicer(plantation_pb2_grpc.PlantationServiceServicer):
             total_count=total,
         )
 
+    async def GetCollectionPointsForFarmers(
+        self,
+        request: plantation_pb2.GetCollectionPointsForFarmersRequest,
+        context: grpc.aio.ServicerContext,
+    ) -> plantation_pb2.GetCollectionPointsForFarmersResponse:
+        """Get collection point memberships for a list of farmers.
+
+        Batch variant of GetCollectionPointsForFarmer backed by a single $in
+        query. Unknown farmer IDs simply have no memberships.
+        """
+        if len(request.farmer_ids) > MAX_BATCH_FARMER_IDS:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"At most {MAX_BATCH_FARMER_IDS} farmer IDs per request",
+            )
+
+        memberships = await self._cp_repo.list_by_farmers(list(request.farmer_ids))
+
+        collection_points = {cp.id: cp for cps in memberships.values() for cp in cps}
+        return plantation_pb2.GetCollectionPointsForFarmersResponse(
+            collection_points=[collection_point_to_proto(cp) for cp in collection_points.values()],
+            memberships=[
+                plantation_pb2.FarmerCollectionPointIds(
+                    farmer_id=farmer_id,
+                    collection_point_ids=[cp.id for cp in cps],
+                )
+                for farmer_id, cps in memberships.items()
+            ],
+        )
+
     # =========================================================================
     # Region Operations (Story 1.8)
     # =========================================================================
@@ -60,6 +60,18 @@ class Settings(BaseSettings):
     collection_app_id: str = "collection-model"  # DAPR app ID for service invocation
     collection_grpc_host: str = ""  # Direct gRPC host (empty = use DAPR sidecar)
 
+    # Reference data cache for quality event processing
+    # Per-key caches invalidated by MongoDB Change Streams
+    reference_cache_enabled: bool = True
+    reference_cache_max_farmers: int = 20_000
+    reference_cache_max_entries: int = 2_000  # Per cache: factories, regions, grading models, CPs
+
+    # Quality event micro-batching (bulk FarmerPerformance writes and event publishes)
+    quality_batch_enabled: bool = True
+    quality_batch_max_size: int = 100
+    quality_batch_max_wait_ms: int = 50
+    quality_batch_max_pending: int = 1_000
+
 
 # Global settings instance
 settings = Settings()
@@ -21,6 +21,7 @@ from fp_common.models import (
     ConditionalReject,
     ContactInfo,
     Coordinate,
+    DailyDeliveryMetrics,
     Factory,
     FactoryCreate,
     FactoryUpdate,
@@ -48,6 +49,7 @@ from fp_common.models import (
     PreferredChannel,
     PreferredLanguage,
     QualityThresholds,
+    QualityTier,
     Region,
     RegionalWeather,
     RegionBoundary,
@@ -71,6 +73,7 @@ __all__ = [
     "ConditionalReject",
     "ContactInfo",
     "Coordinate",
+    "DailyDeliveryMetrics",
     "Factory",
     "FactoryCreate",
     "FactoryUpdate",
@@ -98,6 +101,7 @@ __all__ = [
     "PreferredChannel",
     "PreferredLanguage",
     "QualityThresholds",
+    "QualityTier",
     "Region",
     "RegionBoundary",
     "RegionCreate",
@@ -68,3 +68,26 @@ class IDGenerator:
             return_document=ReturnDocument.AFTER,
         )
         return f"WM-{result['seq']:04d}"
+
+    async def generate_farmer_ids(self, count: int) -> list[str]:
+        """Reserve a contiguous block of farmer IDs with a single counter update.
+
+        Used by bulk import; IDs left unused (e.g. rows failing on insert)
+        are skipped, as with any failed single registration.
+
+        Args:
+            count: Number of IDs to reserve.
+
+        Returns:
+            Farmer IDs in format WM-XXXX, in ascending order.
+        """
+        if count <= 0:
+            return []
+        result = await self._counters.find_one_and_update(
+            {"_id": "farmer"},
+            {"$inc": {"seq": count}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        first = result["seq"] - count + 1
+        return [f"WM-{seq:04d}" for seq in range(first, result["seq"] + 1)]
@@ -1,5 +1,7 @@
 """Domain services for Plantation Model."""
 
+from plantation_model.domain.services.historical_metrics import HistoricalMetricsEngine
+from plantation_model.domain.services.quality_event_batcher import QualityEventBatcher
 from plantation_model.domain.services.quality_event_processor import (
     QualityEventProcessingError,
     QualityEventProcessor,
@@ -9,6 +11,8 @@ from plantation_model.domain.services.region_assignment import (
 )
 
 __all__ = [
+    "HistoricalMetricsEngine",
+    "QualityEventBatcher",
     "QualityEventProcessingError",
     "QualityEventProcessor",
     "RegionAssignmentService",
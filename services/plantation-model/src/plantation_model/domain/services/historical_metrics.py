@@ -0,0 +1,474 @@
+"""Rolling-window engine for FarmerPerformance historical metrics.
+
+Each farmer's TodayMetrics snapshot is closed into a daily bucket when the
+day rolls over. HistoricalMetrics holds the sums of those buckets over the
+30, 90 and 365 days ending at historical.metrics_through, so advancing the
+windows by one day only reads the bucket entering and the buckets leaving
+each window instead of re-aggregating a year of deliveries.
+
+recompute_farmers() / backfill_factory() rebuild the windows from the daily
+buckets for many farmers at once (one streamed query per chunk of farmers),
+e.g. for farmers that had no delivery for a while or after a repair.
+
+Records written before daily buckets existed have historical values but no
+metrics_through. Those values seed the windows once (buckets are added on
+top of them) instead of being discarded; having no buckets, they never
+leave a window on their own and only go when a year passes without any
+delivery.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import structlog
+from opentelemetry import trace
+from plantation_model.domain.models import (
+    DailyDeliveryMetrics,
+    FarmerPerformance,
+    HistoricalMetrics,
+    QualityThresholds,
+    TrendDirection,
+)
+
+if TYPE_CHECKING:
+    from plantation_model.infrastructure.reference_data_cache import ReferenceDataCache
+    from plantation_model.infrastructure.repositories.collection_point_repository import CollectionPointRepository
+    from plantation_model.infrastructure.repositories.daily_metrics_repository import DailyMetricsRepository
+    from plantation_model.infrastructure.repositories.factory_repository import FactoryRepository
+    from plantation_model.infrastructure.repositories.farmer_performance_repository import (
+        FarmerPerformanceRepository,
+    )
+    from plantation_model.infrastructure.repositories.grading_model_repository import GradingModelRepository
+
+logger = structlog.get_logger(__name__)
+tracer = trace.get_tracer(__name__)
+
+# HistoricalMetrics field suffix -> window length in days
+WINDOWS: dict[str, int] = {"30d": 30, "90d": 90, "year": 365}
+LONGEST_WINDOW_DAYS = max(WINDOWS.values())
+
+# Farmers per bucket query / bulk write in recompute_farmers()
+RECOMPUTE_CHUNK_SIZE = 500
+
+# Primary percentage difference (30d vs 90d) that counts as a trend
+TREND_THRESHOLD = 5.0
+
+DEFAULT_PRIMARY_GRADE = "Primary"
+
+
+@dataclass
+class WindowTotals:
+    """Sums of daily buckets over one window."""
+
+    grade_counts: dict[str, int] = field(default_factory=dict)
+    attribute_counts: dict[str, dict[str, int]] = field(default_factory=dict)
+    total_kg: float = 0.0
+
+    @classmethod
+    def from_historical(cls, historical: HistoricalMetrics, suffix: str) -> WindowTotals:
+        """Read the stored totals of one window."""
+        return cls(
+            grade_counts=dict(getattr(historical, f"grade_distribution_{suffix}")),
+            attribute_counts={
+                name: dict(counts) for name, counts in getattr(historical, f"attribute_distributions_{suffix}").items()
+            },
+            total_kg=getattr(historical, f"total_kg_{suffix}"),
+        )
+
+    def add(self, day: DailyDeliveryMetrics, sign: int = 1) -> None:
+        """Add (sign=1) or remove (sign=-1) one daily bucket."""
+        self.total_kg += sign * day.total_kg
+        for grade, count in day.grade_counts.items():
+            self.grade_counts[grade] = self.grade_counts.get(grade, 0) + sign * count
+        for attr_name, class_counts in day.attribute_counts.items():
+            totals = self.attribute_counts.setdefault(attr_name, {})
+            for class_name, count in class_counts.items():
+                totals[class_name] = totals.get(class_name, 0) + sign * count
+
+    def normalized(self) -> WindowTotals:
+        """Drop emptied counters and float drift left by removals."""
+        return WindowTotals(
+            grade_counts={grade: count for grade, count in self.grade_counts.items() if count > 0},
+            attribute_counts={
+                name: {cls: count for cls, count in counts.items() if count > 0}
+                for name, counts in self.attribute_counts.items()
+                if any(count > 0 for count in counts.values())
+            },
+            total_kg=max(0.0, round(self.total_kg, 3)),
+        )
+
+    def primary_percentage(self, primary_grade: str) -> float:
+        """Percentage of deliveries graded primary in this window."""
+        total = sum(self.grade_counts.values())
+        if total <= 0:
+            return 0.0
+        return min(100.0, self.grade_counts.get(primary_grade, 0) / total * 100.0)
+
+
+def in_window(day: dt.date, through: dt.date | None, days: int) -> bool:
+    """Whether a day belongs to the window of `days` days ending at `through`."""
+    return through is not None and through - dt.timedelta(days=days) < day <= through
+
+
+def boundary_ranges(old_through: dt.date, new_through: dt.date) -> list[tuple[dt.date, dt.date]]:
+    """(after, through] ranges holding every bucket that enters or leaves a window.
+
+    Entering: (old_through, new_through]. Leaving, per window of N days:
+    (old_through - N, min(old_through, new_through - N)].
+    """
+    ranges = [(old_through, new_through)]
+    for days in WINDOWS.values():
+        delta = dt.timedelta(days=days)
+        ranges.append((old_through - delta, min(old_through, new_through - delta)))
+    return ranges
+
+
+def advance_windows(
+    historical: HistoricalMetrics,
+    buckets: list[DailyDeliveryMetrics],
+    new_through: dt.date,
+) -> dict[str, WindowTotals]:
+    """Move every window from historical.metrics_through to new_through.
+
+    Each bucket is added to the windows it enters and removed from those
+    it leaves. With no previous metrics_through the stored totals (empty,
+    or values written before daily buckets existed) seed the windows and
+    `buckets` must cover the whole longest window.
+    """
+    old_through = historical.metrics_through
+    windows: dict[str, WindowTotals] = {}
+    for suffix, days in WINDOWS.items():
+        totals = WindowTotals.from_historical(historical, suffix)
+        for bucket in buckets:
+            sign = int(in_window(bucket.metrics_date, new_through, days)) - int(
+                in_window(bucket.metrics_date, old_through, days)
+            )
+            if sign:
+                totals.add(bucket, sign)
+        windows[suffix] = totals.normalized()
+    return windows
+
+
+def improvement_trend(primary_30d: float, primary_90d: float, has_data: bool) -> TrendDirection:
+    """Compare the 30-day and 90-day primary percentages."""
+    if not has_data:
+        return TrendDirection.STABLE
+    if primary_30d > primary_90d + TREND_THRESHOLD:
+        return TrendDirection.IMPROVING
+    if primary_30d < primary_90d - TREND_THRESHOLD:
+        return TrendDirection.DECLINING
+    return TrendDirection.STABLE
+
+
+def build_historical(
+    windows: dict[str, WindowTotals],
+    through: dt.date,
+    primary_grade: str,
+    farm_size_hectares: float,
+    computed_at: datetime,
+) -> HistoricalMetrics:
+    """Derive HistoricalMetrics (percentages, yields, trend) from window totals."""
+    values: dict = {}
+    for suffix, totals in windows.items():
+        values[f"grade_distribution_{suffix}"] = totals.grade_counts
+        values[f"attribute_distributions_{suffix}"] = totals.attribute_counts
+        values[f"primary_percentage_{suffix}"] = totals.primary_percentage(primary_grade)
+        values[f"total_kg_{suffix}"] = totals.total_kg
+        values[f"yield_kg_per_hectare_{suffix}"] = (
+            totals.total_kg / farm_size_hectares if farm_size_hectares > 0 else 0.0
+        )
+    values["improvement_trend"] = improvement_trend(
+        values["primary_percentage_30d"],
+        values["primary_percentage_90d"],
+        has_data=bool(windows["90d"].grade_counts),
+    )
+    return HistoricalMetrics(**values, computed_at=computed_at, metrics_through=through)
+
+
+class HistoricalMetricsEngine:
+    """Maintains FarmerPerformance.historical from daily delivery buckets.
+
+    - roll_up: close stale today snapshots and advance the windows
+      incrementally (called by QualityEventProcessor at date rollover)
+    - recompute_farmers: rebuild windows for many farmers from their buckets
+    - backfill_factory: recompute_farmers for every farmer of a factory
+    - backfill_tiers: assign tiers to records that have none, using each
+      factory's thresholds
+
+    Historical metrics cover whole days up to the day before as_of; the
+    current day stays in FarmerPerformance.today.
+    """
+
+    def __init__(
+        self,
+        daily_metrics_repo: DailyMetricsRepository,
+        farmer_performance_repo: FarmerPerformanceRepository,
+        grading_model_repo: GradingModelRepository,
+        factory_repo: FactoryRepository,
+        cp_repo: CollectionPointRepository | None = None,
+        reference_cache: ReferenceDataCache | None = None,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            daily_metrics_repo: Repository for daily delivery buckets.
+            farmer_performance_repo: Repository for farmer performance.
+            grading_model_repo: Repository for grading models (primary grade label).
+            factory_repo: Repository for factories (quality thresholds).
+            cp_repo: Repository for collection points (factory backfill).
+            reference_cache: Optional cache used instead of the repositories
+                for grading model and factory reads.
+        """
+        self._daily_metrics_repo = daily_metrics_repo
+        self._farmer_performance_repo = farmer_performance_repo
+        self._grading_model_repo = grading_model_repo
+        self._factory_repo = factory_repo
+        self._cp_repo = cp_repo
+        self._reference_cache = reference_cache
+
+    async def roll_up(
+        self,
+        performances: list[FarmerPerformance],
+        factory_ids: dict[str, str] | None = None,
+        as_of: dt.date | None = None,
+    ) -> dict[str, HistoricalMetrics]:
+        """Close past-day today snapshots and advance the farmers' windows.
+
+        Windows that are already current are left alone; farmers idle for a
+        year or more are rebuilt from their buckets. Farmers never computed
+        are seeded from their stored historical values plus a year of
+        buckets; with no buckets at all, the stored values are kept as they
+        are and only metrics_through is set.
+
+        Args:
+            performances: Farmer performances as read before the today reset.
+            factory_ids: Factory per farmer, for tier thresholds (defaults if absent).
+            as_of: Current day (defaults to today).
+
+        Returns:
+            New historical metrics per farmer that was advanced.
+        """
+        as_of = as_of or dt.date.today()
+        through = as_of - dt.timedelta(days=1)
+        factory_ids = factory_ids or {}
+
+        with tracer.start_as_current_span("roll_up_historical_metrics") as span:
+            await self._close_days(performances, as_of)
+
+            updates: list[tuple[str, HistoricalMetrics, QualityThresholds | None]] = []
+            thresholds_by_factory: dict[str, QualityThresholds | None] = {}
+            primary_by_model: dict[tuple[str, str], str] = {}
+            for performance in performances:
+                historical = performance.historical
+                old_through = historical.metrics_through
+                if old_through is not None and old_through >= through:
+                    continue
+                if old_through is not None and (through - old_through).days >= LONGEST_WINDOW_DAYS:
+                    # Idle for a whole year: nothing stored is still in a window
+                    historical = HistoricalMetrics()
+                if historical.metrics_through is None:
+                    ranges = [(through - dt.timedelta(days=LONGEST_WINDOW_DAYS), through)]
+                else:
+                    ranges = boundary_ranges(historical.metrics_through, through)
+                buckets = await self._daily_metrics_repo.find_in_ranges(performance.farmer_id, ranges)
+
+                computed_at = datetime.now(dt.UTC)
+                if old_through is None and not buckets:
+                    # Written before daily buckets existed: keep the stored windows
+                    new_historical = historical.model_copy(
+                        update={"metrics_through": through, "computed_at": computed_at}
+                    )
+                else:
+                    new_historical = build_historical(
+                        advance_windows(historical, buckets, through),
+                        through=through,
+                        primary_grade=await self._primary_grade(performance, primary_by_model),
+                        farm_size_hectares=performance.farm_size_hectares,
+                        computed_at=computed_at,
+                    )
+                factory_id = factory_ids.get(performance.farmer_id)
+                updates.append(
+                    (performance.farmer_id, new_historical, await self._thresholds(factory_id, thresholds_by_factory))
+                )
+
+            span.set_attribute("farmers", len(updates))
+            await self._farmer_performance_repo.update_historical_many(updates)
+            logger.debug("Rolled up historical metrics", farmers=len(updates), through=through.isoformat())
+            return {farmer_id: historical for farmer_id, historical, _ in updates}
+
+    async def recompute_farmers(
+        self,
+        farmer_ids: list[str],
+        thresholds: QualityThresholds | None = None,
+        as_of: dt.date | None = None,
+    ) -> int:
+        """Rebuild historical windows from daily buckets for many farmers.
+
+        Farmers are processed in chunks: one $in read of their performances,
+        one bulk write of their stale today snapshots, one streamed bucket
+        query and one bulk write of the results per chunk.
+
+        Farmers never computed from buckets start from their stored values
+        (see roll_up) and are left alone when they have no bucket in the
+        longest window, so values written before daily buckets existed are
+        not wiped.
+
+        Args:
+            farmer_ids: Farmers to recompute.
+            thresholds: Quality thresholds for the derived tier (defaults if None).
+            as_of: Current day (defaults to today).
+
+        Returns:
+            Number of farmer performances recomputed.
+        """
+        as_of = as_of or dt.date.today()
+        through = as_of - dt.timedelta(days=1)
+        after = through - dt.timedelta(days=LONGEST_WINDOW_DAYS)
+        unique_ids = list(dict.fromkeys(farmer_ids))
+        primary_by_model: dict[tuple[str, str], str] = {}
+        recomputed = 0
+
+        with tracer.start_as_current_span("recompute_historical_metrics") as span:
+            for start in range(0, len(unique_ids), RECOMPUTE_CHUNK_SIZE):
+                chunk = unique_ids[start : start + RECOMPUTE_CHUNK_SIZE]
+                performances = await self._farmer_performance_repo.get_by_farmer_ids(chunk)
+                if not performances:
+                    continue
+                await self._close_days(list(performances.values()), as_of)
+
+                windows: dict[str, dict[str, WindowTotals]] = {
+                    farmer_id: {suffix: WindowTotals() for suffix in WINDOWS}
+                    for farmer_id, performance in performances.items()
+                    if performance.historical.metrics_through is not None
+                }
+                async for bucket in self._daily_metrics_repo.iter_for_farmers(list(performances), after, through):
+                    farmer_windows = windows.get(bucket.farmer_id)
+                    if farmer_windows is None:
+                        # Never computed from buckets: seed with the stored values
+                        historical = performances[bucket.farmer_id].historical
+                        farmer_windows = windows[bucket.farmer_id] = {
+                            suffix: WindowTotals.from_historical(historical, suffix) for suffix in WINDOWS
+                        }
+                    for suffix, days in WINDOWS.items():
+                        if in_window(bucket.metrics_date, through, days):
+                            farmer_windows[suffix].add(bucket)
+
+                computed_at = datetime.now(dt.UTC)
+                updates: list[tuple[str, HistoricalMetrics, QualityThresholds | None]] = []
+                for farmer_id, farmer_windows in windows.items():
+                    performance = performances[farmer_id]
+                    historical = build_historical(
+                        {suffix: totals.normalized() for suffix, totals in farmer_windows.items()},
+                        through=through,
+                        primary_grade=await self._primary_grade(performance, primary_by_model),
+                        farm_size_hectares=performance.farm_size_hectares,
+                        computed_at=computed_at,
+                    )
+                    updates.append((farmer_id, historical, thresholds))
+                recomputed += await self._farmer_performance_repo.update_historical_many(updates)
+
+            span.set_attribute("farmers", recomputed)
+        logger.info("Recomputed historical metrics", farmers=recomputed, through=through.isoformat())
+        return recomputed
+
+    async def backfill_factory(self, factory_id: str, as_of: dt.date | None = None) -> int | None:
+        """Recompute historical metrics for every farmer of a factory.
+
+        Args:
+            factory_id: The factory whose collection points' farmers to recompute.
+            as_of: Current day (defaults to today).
+
+        Returns:
+            Number of farmer performances recomputed, or None if the factory does not exist.
+        """
+        factory = await self._factory_repo.get_by_id(factory_id)
+        if factory is None:
+            return None
+        if self._cp_repo is None:
+            return 0
+
+        farmer_ids = await self._factory_farmer_ids(factory_id)
+        return await self.recompute_farmers(sorted(farmer_ids), factory.quality_thresholds, as_of)
+
+    async def backfill_tiers(self) -> int:
+        """Assign tiers to performance records written before tiers were stored.
+
+        Each factory's farmers are classified with that factory's thresholds
+        (a farmer of several factories takes the first one listed); farmers
+        without a collection point fall back to the default thresholds.
+        Records that already have a tier are left alone.
+
+        Returns:
+            Number of records that received a tier.
+        """
+        backfilled = 0
+        if self._cp_repo is not None:
+            page_token = None
+            while True:
+                factories, page_token, _ = await self._factory_repo.list(page_size=100, page_token=page_token)
+                for factory in factories:
+                    farmer_ids = await self._factory_farmer_ids(factory.id)
+                    if farmer_ids:
+                        backfilled += await self._farmer_performance_repo.recompute_tiers(
+                            factory.quality_thresholds, sorted(farmer_ids), only_missing=True
+                        )
+                if not page_token:
+                    break
+
+        backfilled += await self._farmer_performance_repo.recompute_tiers(QualityThresholds())
+        if backfilled:
+            logger.info("Backfilled farmer tiers", farmers=backfilled)
+        return backfilled
+
+    async def _factory_farmer_ids(self, factory_id: str) -> set[str]:
+        """IDs of the farmers assigned to any collection point of a factory."""
+        farmer_ids: set[str] = set()
+        page_token = None
+        while True:
+            cps, page_token, _ = await self._cp_repo.list_by_factory(factory_id, page_size=500, page_token=page_token)
+            for cp in cps:
+                farmer_ids.update(cp.farmer_ids)
+            if not page_token:
+                break
+        return farmer_ids
+
+    async def _close_days(self, performances: list[FarmerPerformance], as_of: dt.date) -> None:
+        """Store the today snapshots that belong to a past day as daily buckets."""
+        closed = [
+            DailyDeliveryMetrics.from_today(performance.farmer_id, performance.today)
+            for performance in performances
+            if performance.today.metrics_date < as_of and performance.today.deliveries > 0
+        ]
+        await self._daily_metrics_repo.upsert_days(closed)
+
+    async def _primary_grade(self, performance: FarmerPerformance, cache: dict[tuple[str, str], str]) -> str:
+        """Label of the primary grade (first grade label) of the farmer's grading model."""
+        key = (performance.grading_model_id, performance.grading_model_version)
+        if key not in cache:
+            if self._reference_cache is not None:
+                grading_model = await self._reference_cache.grading_models.get_model(*key)
+            else:
+                grading_model = await self._grading_model_repo.get_by_id_and_version(*key)
+            labels = list(grading_model.grade_labels.values()) if grading_model else []
+            cache[key] = labels[0] if labels else DEFAULT_PRIMARY_GRADE
+        return cache[key]
+
+    async def _thresholds(
+        self,
+        factory_id: str | None,
+        cache: dict[str, QualityThresholds | None],
+    ) -> QualityThresholds | None:
+        """Quality thresholds of a factory (None means defaults)."""
+        if factory_id is None:
+            return None
+        if factory_id not in cache:
+            if self._reference_cache is not None:
+                factory = await self._reference_cache.factories.get(factory_id)
+            else:
+                factory = await self._factory_repo.get_by_id(factory_id)
+            cache[factory_id] = factory.quality_thresholds if factory else None
+        return cache[factory_id]
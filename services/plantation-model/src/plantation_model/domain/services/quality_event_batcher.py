@@ -0,0 +1,77 @@
+"""Micro-batching stage for quality result events.
+
+Sits between the DAPR subscription and QualityEventProcessor: events that
+arrive within a short window (or until the batch is full) are handed to
+QualityEventProcessor.process_batch() together, so a QC machine's morning
+backlog becomes a few bulk writes and bulk publishes instead of thousands of
+individual round trips. Each caller still awaits the outcome of its own
+event, which keeps per-message success/retry (and so DLQ) semantics.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from fp_common.events import MicroBatcher
+from opentelemetry import metrics
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from plantation_model.domain.services.quality_event_processor import QualityEventProcessor
+
+meter = metrics.get_meter("plantation-model")
+
+quality_batch_size = meter.create_histogram(
+    name="plantation_quality_batch_size",
+    description="Number of quality events per processed micro-batch",
+    unit="1",
+)
+
+
+class QualityEventBatcher(MicroBatcher[tuple[str, str], dict[str, Any]]):
+    """Collects quality events into micro-batches for QualityEventProcessor.
+
+    Attributes:
+        max_batch_size: Events per batch before it is flushed immediately.
+        max_wait_seconds: Longest an event waits for its batch to fill.
+        max_pending: Upper bound on events submitted but not yet answered
+            (enforced by the subscriber, which blocks on it).
+    """
+
+    def __init__(
+        self,
+        processor: QualityEventProcessor,
+        max_batch_size: int = 100,
+        max_wait_ms: int = 50,
+        max_pending: int = 1_000,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            processor: Processor that handles each batch.
+            max_batch_size: Flush as soon as this many events are pending.
+            max_wait_ms: Flush a partial batch after this many milliseconds.
+            max_pending: Maximum events in flight across all batches.
+        """
+        super().__init__(max_batch_size=max_batch_size, max_wait_ms=max_wait_ms, max_pending=max_pending)
+        self._processor = processor
+
+    async def submit(self, document_id: str, farmer_id: str) -> dict[str, Any]:  # type: ignore[override]
+        """Queue one event and wait for the result of its batch.
+
+        Args:
+            document_id: The Collection Model document ID.
+            farmer_id: The farmer/plantation ID.
+
+        Returns:
+            The processing result for this event (see QualityEventProcessor.process).
+
+        Raises:
+            QualityEventProcessingError: If this event failed.
+        """
+        return await super().submit((document_id, farmer_id))
+
+    async def _process_batch(self, items: list[tuple[str, str]]) -> Sequence[dict[str, Any] | BaseException]:
+        quality_batch_size.record(len(items))
+        return await self._processor.process_batch(items)
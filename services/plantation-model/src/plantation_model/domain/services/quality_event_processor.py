@@ -11,9 +11,15 @@ This service processes quality result events from Collection Model:
 5. Emits plantation.quality.graded event
 6. Computes performance summary
 7. Emits plantation.performance_updated event for Engagement Model
+
+process_batch() runs the same pipeline for a micro-batch of events: steps 1-3
+per event, step 4 as one bulk write of per-farmer merged increments, and the
+events as bulk publishes (one performance update per farmer).
 """
 
+import asyncio
 import datetime as dt
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
@@ -21,13 +27,15 @@ import structlog
 from fp_common.models import Document
 from opentelemetry import metrics, trace
 from plantation_model.config import settings
-from plantation_model.domain.models import TrendDirection
-from plantation_model.events.publisher import publish_event
+from plantation_model.domain.models import FarmerPerformance, TrendDirection
+from plantation_model.domain.services.historical_metrics import HistoricalMetricsEngine
+from plantation_model.events.publisher import publish_event, publish_events
 from plantation_model.infrastructure.collection_grpc_client import (
     CollectionClientError,
     CollectionGrpcClient,
     DocumentNotFoundError,
 )
+from plantation_model.infrastructure.reference_data_cache import ReferenceDataCache
 from plantation_model.infrastructure.repositories.collection_point_repository import (
     CollectionPointRepository,
 )
@@ -35,6 +43,7 @@ from plantation_model.infrastructure.repositories.factory_repository import (
     FactoryRepository,
 )
 from plantation_model.infrastructure.repositories.farmer_performance_repository import (
+    DeliveryIncrement,
     FarmerPerformanceRepository,
 )
 from plantation_model.infrastructure.repositories.farmer_repository import (
@@ -113,6 +122,25 @@ class QualityEventProcessingError(Exception):
         return " | ".join(parts)
 
 
+@dataclass
+class PreparedDelivery:
+    """A validated quality event with the metrics extracted from its document."""
+
+    document_id: str
+    farmer_id: str
+    factory_id: str
+    grading_model_id: str
+    grading_model_version: str | None
+    grade_counts: dict[str, int]
+    attribute_distribution: dict[str, dict[str, int]]
+    total_weight_kg: float
+
+    @property
+    def primary_grade(self) -> str:
+        """Grade incremented for this delivery (first grade in counts)."""
+        return next(iter(self.grade_counts.keys())) if self.grade_counts else "Primary"
+
+
 class QualityEventProcessor:
     """Processes quality result events and updates farmer performance.
 
@@ -122,10 +150,14 @@ class QualityEventProcessor:
 
     Key Design Principles:
     - Model-Driven: Grade labels come from GradingModel, not hardcoded
-    - Atomic Updates: Uses MongoDB $inc for thread-safe counter updates
+    - Atomic Updates: One pipeline update per farmer rolls the date over and increments
     - Event Sourcing: Emits events for downstream consumers (Engagement Model)
 
     Story 0.6.13: Uses gRPC via DAPR instead of direct MongoDB access.
+
+    With a ReferenceDataCache, linkage validation, grading model lookup and
+    the CP membership check are served from memory, leaving the document
+    fetch and the performance update as the only per-event I/O.
     """
 
     def __init__(
@@ -137,6 +169,8 @@ class QualityEventProcessor:
         factory_repo: FactoryRepository | None = None,
         region_repo: RegionRepository | None = None,
         cp_repo: CollectionPointRepository | None = None,
+        reference_cache: ReferenceDataCache | None = None,
+        historical_engine: HistoricalMetricsEngine | None = None,
     ) -> None:
         """Initialize the processor with required dependencies.
 
@@ -148,6 +182,10 @@ class QualityEventProcessor:
             factory_repo: Repository for factory validation (Story 0.6.10).
             region_repo: Repository for region validation (Story 0.6.10).
             cp_repo: Repository for collection point operations (Story 1.11).
+            reference_cache: Optional change-stream-invalidated cache used for
+                reference data reads instead of the repositories.
+            historical_engine: Optional engine that rolls the previous day's
+                today metrics into the historical windows at date rollover.
 
         Note:
             Story 0.6.14: DAPR publishing now uses module-level publish_event() function
@@ -160,6 +198,8 @@ class QualityEventProcessor:
         self._factory_repo = factory_repo
         self._region_repo = region_repo
         self._cp_repo = cp_repo
+        self._reference_cache = reference_cache
+        self._historical_engine = historical_engine
 
     async def process(
         self,
@@ -193,74 +233,19 @@ class QualityEventProcessor:
             span.set_attribute("farmer_id", farmer_id)
 
             try:
-                # Step 1: Fetch document from Collection Model
-                document = await self._fetch_document(document_id)
-
-                # =====================================================================
-                # Story 0.6.10: Linkage Field Validation (ADR-008)
-                # ALL 4 linkage fields must be validated with exceptions, not warnings.
-                # =====================================================================
-
-                # Step 2: Validate farmer_id (AC1)
-                farmer = await self._validate_farmer_id(document_id, farmer_id)
-
-                # Step 2b: Auto-assign farmer to collection point (Story 1.11)
-                cp_id = self._get_collection_point_id(document)
-                if cp_id:
-                    await self._ensure_farmer_assigned_to_cp(farmer_id, cp_id)
-
-                # Step 3: Validate factory_id (AC2)
-                factory_id = self._get_factory_id(document)
-                if factory_id and factory_id != "unknown":
-                    await self._validate_factory_id(document_id, farmer_id, factory_id)
-
-                # Step 4: Validate grading_model_id (AC3)
-                grading_model_id = self._get_grading_model_id(document)
-                grading_model_version = self._get_grading_model_version(document)
-
-                if not grading_model_id:
-                    linkage_validation_failures.add(1, {"field": "grading_model_id", "error": "missing"})
-                    raise QualityEventProcessingError(
-                        "Document missing grading_model_id",
-                        document_id=document_id,
-                        farmer_id=farmer_id,
-                        error_type="missing_grading_model",
-                        field_name="grading_model_id",
-                    )
-
-                # Step 5: Load grading model and validate it exists
-                grading_model = await self._load_grading_model(grading_model_id, grading_model_version)
-
-                if grading_model is None:
-                    linkage_validation_failures.add(1, {"field": "grading_model_id", "error": "not_found"})
-                    raise QualityEventProcessingError(
-                        f"Grading model not found: {grading_model_id}@{grading_model_version}",
-                        document_id=document_id,
-                        farmer_id=farmer_id,
-                        error_type="grading_model_not_found",
-                        field_name="grading_model_id",
-                        field_value=grading_model_id,
-                    )
+                # Steps 1-7: Fetch document, validate linkage, extract metrics
+                delivery = await self._prepare_delivery(document_id, farmer_id)
 
-                # Step 6: Validate region_id (AC4) - via farmer's region reference
-                if farmer and farmer.region_id:
-                    await self._validate_region_id(document_id, farmer_id, farmer.region_id)
-
-                # Step 7: Extract quality metrics from document
-                bag_summary = self._get_bag_summary(document)
-                grade_counts = self._extract_grade_counts(bag_summary, grading_model)
-                attribute_distribution = self._extract_attribute_distribution(bag_summary, grading_model)
-                total_weight_kg = self._get_total_weight(bag_summary)
-
-                span.set_attribute("grade_counts", str(grade_counts))
-                span.set_attribute("total_weight_kg", total_weight_kg)
+                span.set_attribute("grade_counts", str(delivery.grade_counts))
+                span.set_attribute("total_weight_kg", delivery.total_weight_kg)
 
                 # Step 8: Check for date rollover and update farmer performance
                 performance = await self._update_farmer_performance(
                     farmer_id=farmer_id,
-                    grade_counts=grade_counts,
-                    attribute_counts=attribute_distribution,
-                    weight_kg=total_weight_kg,
+                    factory_id=delivery.factory_id,
+                    grade_counts=delivery.grade_counts,
+                    attribute_counts=delivery.attribute_distribution,
+                    weight_kg=delivery.total_weight_kg,
                 )
 
                 # Note: performance can be None if FarmerPerformance record doesn't exist yet
@@ -271,21 +256,16 @@ class QualityEventProcessor:
                         farmer_id=farmer_id,
                         document_id=document_id,
                     )
-                    return {
-                        "status": "skipped",
-                        "reason": "no_performance_record",
-                        "document_id": document_id,
-                        "farmer_id": farmer_id,
-                    }
+                    return self._skipped_result(document_id, farmer_id)
 
                 # Step 9: Emit plantation.quality.graded event
                 await self._emit_quality_graded_event(
                     farmer_id=farmer_id,
                     document_id=document_id,
-                    grading_model_id=grading_model_id,
-                    grading_model_version=grading_model_version or "unknown",
-                    grade_counts=grade_counts,
-                    attribute_distribution=attribute_distribution,
+                    grading_model_id=delivery.grading_model_id,
+                    grading_model_version=delivery.grading_model_version or "unknown",
+                    grade_counts=delivery.grade_counts,
+                    attribute_distribution=delivery.attribute_distribution,
                 )
 
                 # Step 10: Compute performance summary and emit update event
@@ -294,60 +274,250 @@ class QualityEventProcessor:
 
                 await self._emit_performance_updated_event(
                     farmer_id=farmer_id,
-                    factory_id=factory_id,
+                    factory_id=delivery.factory_id,
                     primary_percentage=primary_percentage,
                     improvement_trend=improvement_trend,
-                    today_summary={
-                        "deliveries": performance.today.deliveries,
-                        "total_kg": performance.today.total_kg,
-                        "grade_counts": performance.today.grade_counts,
-                    },
+                    today_summary=self._today_summary(performance),
                     triggered_by_document_id=document_id,
                 )
 
                 span.set_attribute("processing.success", True)
 
-                return {
-                    "status": "success",
-                    "document_id": document_id,
-                    "farmer_id": farmer_id,
-                    "grade_counts": grade_counts,
-                    "primary_percentage": primary_percentage,
-                    "improvement_trend": improvement_trend.value,
-                }
+                return self._success_result(delivery, primary_percentage, improvement_trend)
 
             except QualityEventProcessingError:
                 raise
-            except DocumentNotFoundError as e:
-                raise QualityEventProcessingError(
-                    f"Document not found: {document_id}",
-                    document_id=document_id,
-                    farmer_id=farmer_id,
-                    error_type="document_not_found",
-                    cause=e,
-                ) from e
-            except CollectionClientError as e:
-                raise QualityEventProcessingError(
-                    f"Failed to fetch document: {e}",
-                    document_id=document_id,
-                    farmer_id=farmer_id,
-                    error_type="collection_client_error",
-                    cause=e,
-                ) from e
             except Exception as e:
-                logger.exception(
-                    "Unexpected error processing quality event",
-                    document_id=document_id,
-                    farmer_id=farmer_id,
-                    error=str(e),
+                raise self._processing_error(e, document_id, farmer_id) from e
+
+    async def process_batch(
+        self,
+        events: list[tuple[str, str]],
+    ) -> list[dict[str, Any] | QualityEventProcessingError]:
+        """Process a micro-batch of quality result events.
+
+        Each event is fetched and validated on its own, so a linkage failure
+        only fails that event. Deliveries are then merged per farmer and
+        applied with a single bulk write, quality.graded events are bulk
+        published, and one performance_updated event is published per farmer
+        (triggered by the farmer's last document in the batch).
+
+        Args:
+            events: (document_id, farmer_id) pairs in arrival order.
+
+        Returns:
+            One entry per event, in order: the result dict (as returned by
+            process()) or the QualityEventProcessingError for that event.
+        """
+        with tracer.start_as_current_span("process_quality_event_batch") as span:
+            span.set_attribute("batch_size", len(events))
+
+            prepared = await asyncio.gather(
+                *(self._prepare_delivery_or_error(document_id, farmer_id) for document_id, farmer_id in events)
+            )
+            results: list[dict[str, Any] | QualityEventProcessingError] = list(prepared)  # type: ignore[arg-type]
+            deliveries = [(i, item) for i, item in enumerate(prepared) if isinstance(item, PreparedDelivery)]
+            if not deliveries:
+                return results
+
+            try:
+                performances = await self._update_farmer_performances([delivery for _, delivery in deliveries])
+            except Exception as e:
+                logger.exception("Bulk farmer performance update failed", batch_size=len(deliveries))
+                for i, delivery in deliveries:
+                    results[i] = self._processing_error(e, delivery.document_id, delivery.farmer_id)
+                return results
+
+            graded_events: list[dict[str, Any]] = []
+            latest_by_farmer: dict[str, PreparedDelivery] = {}
+            for i, delivery in deliveries:
+                performance = performances.get(delivery.farmer_id)
+                if performance is None:
+                    results[i] = self._skipped_result(delivery.document_id, delivery.farmer_id)
+                    continue
+                graded_events.append(
+                    self._quality_graded_payload(
+                        farmer_id=delivery.farmer_id,
+                        document_id=delivery.document_id,
+                        grading_model_id=delivery.grading_model_id,
+                        grading_model_version=delivery.grading_model_version or "unknown",
+                        grade_counts=delivery.grade_counts,
+                        attribute_distribution=delivery.attribute_distribution,
+                    )
                 )
-                raise QualityEventProcessingError(
-                    f"Unexpected error: {e}",
-                    document_id=document_id,
+                latest_by_farmer[delivery.farmer_id] = delivery
+                results[i] = self._success_result(
+                    delivery,
+                    self._compute_primary_percentage(performance.today.grade_counts),
+                    self._compute_improvement_trend(performance),
+                )
+
+            updated_events = [
+                self._performance_updated_payload(
                     farmer_id=farmer_id,
-                    error_type="unexpected_error",
-                    cause=e,
-                ) from e
+                    factory_id=delivery.factory_id,
+                    primary_percentage=self._compute_primary_percentage(performances[farmer_id].today.grade_counts),
+                    improvement_trend=self._compute_improvement_trend(performances[farmer_id]),
+                    today_summary=self._today_summary(performances[farmer_id]),
+                    triggered_by_document_id=delivery.document_id,
+                )
+                for farmer_id, delivery in latest_by_farmer.items()
+            ]
+            await publish_events(settings.dapr_pubsub_name, "plantation.quality.graded", graded_events)
+            await publish_events(settings.dapr_pubsub_name, "plantation.performance_updated", updated_events)
+
+            span.set_attribute("farmers", len(latest_by_farmer))
+            logger.info(
+                "Processed quality event batch",
+                events=len(events),
+                failed=len(events) - len(deliveries),
+                farmers=len(latest_by_farmer),
+            )
+            return results
+
+    async def _prepare_delivery(self, document_id: str, farmer_id: str) -> PreparedDelivery:
+        """Fetch the document, validate its linkage fields and extract its metrics (steps 1-7)."""
+        # Step 1: Fetch document from Collection Model
+        document = await self._fetch_document(document_id)
+
+        # =====================================================================
+        # Story 0.6.10: Linkage Field Validation (ADR-008)
+        # ALL 4 linkage fields must be validated with exceptions, not warnings.
+        # =====================================================================
+
+        # Step 2: Validate farmer_id (AC1)
+        farmer = await self._validate_farmer_id(document_id, farmer_id)
+
+        # Step 2b: Auto-assign farmer to collection point (Story 1.11)
+        cp_id = self._get_collection_point_id(document)
+        if cp_id:
+            await self._ensure_farmer_assigned_to_cp(farmer_id, cp_id)
+
+        # Step 3: Validate factory_id (AC2)
+        factory_id = self._get_factory_id(document)
+        if factory_id and factory_id != "unknown":
+            await self._validate_factory_id(document_id, farmer_id, factory_id)
+
+        # Step 4: Validate grading_model_id (AC3)
+        grading_model_id = self._get_grading_model_id(document)
+        grading_model_version = self._get_grading_model_version(document)
+
+        if not grading_model_id:
+            linkage_validation_failures.add(1, {"field": "grading_model_id", "error": "missing"})
+            raise QualityEventProcessingError(
+                "Document missing grading_model_id",
+                document_id=document_id,
+                farmer_id=farmer_id,
+                error_type="missing_grading_model",
+                field_name="grading_model_id",
+            )
+
+        # Step 5: Load grading model and validate it exists
+        grading_model = await self._load_grading_model(grading_model_id, grading_model_version)
+
+        if grading_model is None:
+            linkage_validation_failures.add(1, {"field": "grading_model_id", "error": "not_found"})
+            raise QualityEventProcessingError(
+                f"Grading model not found: {grading_model_id}@{grading_model_version}",
+                document_id=document_id,
+                farmer_id=farmer_id,
+                error_type="grading_model_not_found",
+                field_name="grading_model_id",
+                field_value=grading_model_id,
+            )
+
+        # Step 6: Validate region_id (AC4) - via farmer's region reference
+        if farmer and farmer.region_id:
+            await self._validate_region_id(document_id, farmer_id, farmer.region_id)
+
+        # Step 7: Extract quality metrics from document
+        bag_summary = self._get_bag_summary(document)
+        return PreparedDelivery(
+            document_id=document_id,
+            farmer_id=farmer_id,
+            factory_id=factory_id,
+            grading_model_id=grading_model_id,
+            grading_model_version=grading_model_version,
+            grade_counts=self._extract_grade_counts(bag_summary, grading_model),
+            attribute_distribution=self._extract_attribute_distribution(bag_summary, grading_model),
+            total_weight_kg=self._get_total_weight(bag_summary),
+        )
+
+    async def _prepare_delivery_or_error(
+        self, document_id: str, farmer_id: str
+    ) -> PreparedDelivery | QualityEventProcessingError:
+        """_prepare_delivery for one event of a batch, returning its error instead of raising."""
+        try:
+            return await self._prepare_delivery(document_id, farmer_id)
+        except QualityEventProcessingError as e:
+            return e
+        except Exception as e:
+            return self._processing_error(e, document_id, farmer_id)
+
+    def _processing_error(self, error: Exception, document_id: str, farmer_id: str) -> QualityEventProcessingError:
+        """Classify an exception raised while processing one event."""
+        if isinstance(error, DocumentNotFoundError):
+            return QualityEventProcessingError(
+                f"Document not found: {document_id}",
+                document_id=document_id,
+                farmer_id=farmer_id,
+                error_type="document_not_found",
+                cause=error,
+            )
+        if isinstance(error, CollectionClientError):
+            return QualityEventProcessingError(
+                f"Failed to fetch document: {error}",
+                document_id=document_id,
+                farmer_id=farmer_id,
+                error_type="collection_client_error",
+                cause=error,
+            )
+        logger.error(
+            "Unexpected error processing quality event",
+            document_id=document_id,
+            farmer_id=farmer_id,
+            error=str(error),
+            exc_info=error,
+        )
+        return QualityEventProcessingError(
+            f"Unexpected error: {error}",
+            document_id=document_id,
+            farmer_id=farmer_id,
+            error_type="unexpected_error",
+            cause=error,
+        )
+
+    @staticmethod
+    def _skipped_result(document_id: str, farmer_id: str) -> dict[str, Any]:
+        return {
+            "status": "skipped",
+            "reason": "no_performance_record",
+            "document_id": document_id,
+            "farmer_id": farmer_id,
+        }
+
+    @staticmethod
+    def _success_result(
+        delivery: PreparedDelivery,
+        primary_percentage: float,
+        improvement_trend: TrendDirection,
+    ) -> dict[str, Any]:
+        return {
+            "status": "success",
+            "document_id": delivery.document_id,
+            "farmer_id": delivery.farmer_id,
+            "grade_counts": delivery.grade_counts,
+            "primary_percentage": primary_percentage,
+            "improvement_trend": improvement_trend.value,
+        }
+
+    @staticmethod
+    def _today_summary(performance) -> dict[str, Any]:
+        return {
+            "deliveries": performance.today.deliveries,
+            "total_kg": performance.today.total_kg,
+            "grade_counts": performance.today.grade_counts,
+        }
 
     async def _fetch_document(self, document_id: str) -> Document:
         """Fetch quality document from Collection Model via gRPC.
@@ -390,7 +560,10 @@ class QualityEventProcessor:
             return None
 
         with tracer.start_as_current_span("validate_farmer_id"):
-            farmer = await self._farmer_repo.get_by_id(farmer_id)
+            if self._reference_cache is not None:
+                farmer = await self._reference_cache.farmers.get(farmer_id)
+            else:
+                farmer = await self._farmer_repo.get_by_id(farmer_id)
 
             if farmer is None:
                 linkage_validation_failures.add(1, {"field": "farmer_id", "error": "not_found"})
@@ -427,7 +600,10 @@ class QualityEventProcessor:
             return
 
         with tracer.start_as_current_span("validate_factory_id"):
-            factory = await self._factory_repo.get_by_id(factory_id)
+            if self._reference_cache is not None:
+                factory = await self._reference_cache.factories.get(factory_id)
+            else:
+                factory = await self._factory_repo.get_by_id(factory_id)
 
             if factory is None:
                 linkage_validation_failures.add(1, {"field": "factory_id", "error": "not_found"})
@@ -463,7 +639,10 @@ class QualityEventProcessor:
             return
 
         with tracer.start_as_current_span("validate_region_id"):
-            region = await self._region_repo.get_by_id(region_id)
+            if self._reference_cache is not None:
+                region = await self._reference_cache.regions.get(region_id)
+            else:
+                region = await self._region_repo.get_by_id(region_id)
 
             if region is None:
                 linkage_validation_failures.add(1, {"field": "region_id", "error": "not_found"})
@@ -481,7 +660,9 @@ class QualityEventProcessor:
     async def _load_grading_model(self, model_id: str, model_version: str | None):
         """Load grading model by ID and version."""
         with tracer.start_as_current_span("load_grading_model"):
-            if model_version:
+            if self._reference_cache is not None:
+                model = await self._reference_cache.grading_models.get_model(model_id, model_version)
+            elif model_version:
                 # Use versioned lookup for exact match
                 model = await self._grading_model_repo.get_by_id_and_version(model_id, model_version)
             else:
@@ -585,8 +766,12 @@ class QualityEventProcessor:
 
             try:
                 # First check if farmer is already assigned (optimization to avoid write if not needed)
-                cps, _, _ = await self._cp_repo.list_by_farmer(farmer_id, page_size=100)
-                already_assigned = any(cp.id == cp_id for cp in cps)
+                if self._reference_cache is not None:
+                    cp = await self._reference_cache.collection_points.get(cp_id)
+                    already_assigned = cp is not None and farmer_id in cp.farmer_ids
+                else:
+                    cps, _, _ = await self._cp_repo.list_by_farmer(farmer_id, page_size=100)
+                    already_assigned = any(cp.id == cp_id for cp in cps)
 
                 if already_assigned:
                     duration_ms = (time.time() - start_time) * 1000
@@ -615,6 +800,9 @@ class QualityEventProcessor:
                     farmer_auto_assignments.add(1, {"status": "cp_not_found"})
                     return False
 
+                if self._reference_cache is not None:
+                    self._reference_cache.collection_points.put(updated_cp)
+
                 logger.info(
                     "Farmer auto-assigned to collection point",
                     farmer_id=farmer_id,
@@ -757,51 +945,106 @@ class QualityEventProcessor:
         grade_counts: dict[str, int],
         attribute_counts: dict[str, dict[str, int]],
         weight_kg: float,
+        factory_id: str | None = None,
     ):
         """Update farmer performance with quality metrics.
 
-        Handles date rollover - if it's a new day, resets today metrics first.
-        Uses atomic $inc operations for thread-safe updates.
+        A single atomic update handles the date rollover (today metrics of
+        an earlier day are reset) and the increment; a closed day is then
+        rolled into the historical windows.
         """
         with tracer.start_as_current_span("update_farmer_performance"):
-            # Get current performance to check date
-            performance = await self._farmer_performance_repo.get_by_farmer_id(farmer_id)
-
-            if performance is None:
-                return None
+            # Determine primary grade for increment (first grade in counts)
+            primary_grade = next(iter(grade_counts.keys())) if grade_counts else "Primary"
+            increment = DeliveryIncrement(farmer_id=farmer_id)
+            increment.add(weight_kg, primary_grade, attribute_counts)
 
-            # Check for date rollover
             today = dt.date.today()
-            if performance.today.metrics_date != today:
-                logger.info(
-                    "Date rollover detected - resetting today metrics",
-                    farmer_id=farmer_id,
-                    old_date=performance.today.metrics_date.isoformat(),
-                    new_date=today.isoformat(),
-                )
-                performance = await self._farmer_performance_repo.reset_today(farmer_id)
+            update = await self._farmer_performance_repo.apply_delivery(increment, today=today)
+            if update is None:
+                return None
 
-            # Determine primary grade for increment (first grade in counts)
-            primary_grade = next(iter(grade_counts.keys())) if grade_counts else "Primary"
+            if update.rolled_over:
+                await self._roll_up_closed_days([update.previous], {farmer_id: factory_id} if factory_id else {}, today)
 
-            # Increment today's metrics atomically
-            performance = await self._farmer_performance_repo.increment_today_delivery(
+            performance = update.performance
+            logger.info(
+                "Updated farmer performance",
                 farmer_id=farmer_id,
-                kg_amount=weight_kg,
-                grade=primary_grade,
-                attribute_counts=attribute_counts,
+                deliveries=performance.today.deliveries,
+                total_kg=performance.today.total_kg,
+                grade_counts=performance.today.grade_counts,
             )
+            return performance
 
-            if performance:
-                logger.info(
-                    "Updated farmer performance",
-                    farmer_id=farmer_id,
-                    deliveries=performance.today.deliveries,
-                    total_kg=performance.today.total_kg,
-                    grade_counts=performance.today.grade_counts,
-                )
+    async def _update_farmer_performances(self, deliveries: list[PreparedDelivery]) -> dict[str, FarmerPerformance]:
+        """Apply a batch of deliveries with one bulk write of per-farmer merged increments.
 
-            return performance
+        Farmers whose today metrics belong to a past day are updated one by
+        one with apply_delivery, so the day each of them closes can be rolled
+        up; the rest (almost all of them) share one bulk write. A farmer
+        whose day ends between the read and the bulk write is rolled over by
+        the bulk write itself, which hands back the closed day as well.
+
+        Returns:
+            Updated performance per farmer; farmers without a record are absent.
+        """
+        with tracer.start_as_current_span("update_farmer_performances") as span:
+            current = await self._farmer_performance_repo.get_by_farmer_ids([d.farmer_id for d in deliveries])
+
+            increments: dict[str, DeliveryIncrement] = {}
+            for delivery in deliveries:
+                if delivery.farmer_id not in current:
+                    continue
+                increment = increments.setdefault(delivery.farmer_id, DeliveryIncrement(farmer_id=delivery.farmer_id))
+                increment.add(delivery.total_weight_kg, delivery.primary_grade, delivery.attribute_distribution)
+
+            today = dt.date.today()
+            rolling = [inc for farmer_id, inc in increments.items() if current[farmer_id].today.metrics_date < today]
+            steady = [inc for farmer_id, inc in increments.items() if current[farmer_id].today.metrics_date >= today]
+            span.set_attribute("farmers", len(increments))
+            span.set_attribute("rollovers", len(rolling))
+
+            updates = await asyncio.gather(
+                *(self._farmer_performance_repo.apply_delivery(increment, today=today) for increment in rolling)
+            )
+            batch = await self._farmer_performance_repo.increment_today_deliveries(steady, today=today)
+            performances = batch.performances
+            performances.update({update.performance.farmer_id: update.performance for update in updates if update})
+
+            closed = [update.previous for update in updates if update and update.rolled_over] + batch.closed
+            if closed:
+                factory_ids = {delivery.farmer_id: delivery.factory_id for delivery in deliveries}
+                await self._roll_up_closed_days(closed, factory_ids, today)
+            return performances
+
+    async def _roll_up_closed_days(
+        self,
+        previous: list[FarmerPerformance],
+        factory_ids: dict[str, str],
+        today: dt.date,
+    ) -> None:
+        """Hand the days closed by a rollover to the historical metrics engine.
+
+        The deliveries are already applied at this point, so a failure is
+        logged rather than raised: retrying the event would count it twice.
+        """
+        for performance in previous:
+            logger.info(
+                "Date rollover - today metrics reset",
+                farmer_id=performance.farmer_id,
+                old_date=performance.today.metrics_date.isoformat(),
+                new_date=today.isoformat(),
+            )
+        if self._historical_engine is None:
+            return
+        try:
+            await self._historical_engine.roll_up(previous, factory_ids, as_of=today)
+        except Exception:
+            logger.exception(
+                "Historical metrics roll-up failed; recompute the factory to repair",
+                farmer_ids=[performance.farmer_id for performance in previous],
+            )
 
     def _compute_primary_percentage(self, grade_counts: dict[str, int]) -> float:
         """Compute primary percentage from today's grade counts.
@@ -856,16 +1099,14 @@ class QualityEventProcessor:
 
         Story 0.6.14: Uses module-level publish_event() per ADR-010.
         """
-        payload = {
-            "event_type": "plantation.quality.graded",
-            "farmer_id": farmer_id,
-            "document_id": document_id,
-            "grading_model_id": grading_model_id,
-            "grading_model_version": grading_model_version,
-            "grade_counts": grade_counts,
-            "attribute_distribution": attribute_distribution,
-            "timestamp": datetime.now(dt.UTC).isoformat(),
-        }
+        payload = self._quality_graded_payload(
+            farmer_id=farmer_id,
+            document_id=document_id,
+            grading_model_id=grading_model_id,
+            grading_model_version=grading_model_version,
+            grade_counts=grade_counts,
+            attribute_distribution=attribute_distribution,
+        )
 
         success = await publish_event(
             pubsub_name=settings.dapr_pubsub_name,
@@ -897,16 +1138,14 @@ class QualityEventProcessor:
 
         Story 0.6.14: Uses module-level publish_event() per ADR-010.
         """
-        payload = {
-            "event_type": "plantation.performance_updated",
-            "farmer_id": farmer_id,
-            "factory_id": factory_id,
-            "primary_percentage": round(primary_percentage, 2),
-            "improvement_trend": improvement_trend.value,
-            "today": today_summary,
-            "triggered_by_document_id": triggered_by_document_id,
-            "timestamp": datetime.now(dt.UTC).isoformat(),
-        }
+        payload = self._performance_updated_payload(
+            farmer_id=farmer_id,
+            factory_id=factory_id,
+            primary_percentage=primary_percentage,
+            improvement_trend=improvement_trend,
+            today_summary=today_summary,
+            triggered_by_document_id=triggered_by_document_id,
+        )
 
         success = await publish_event(
             pubsub_name=settings.dapr_pubsub_name,
@@ -922,3 +1161,45 @@ class QualityEventProcessor:
                 primary_percentage=primary_percentage,
             )
         return success
+
+    @staticmethod
+    def _quality_graded_payload(
+        farmer_id: str,
+        document_id: str,
+        grading_model_id: str,
+        grading_model_version: str,
+        grade_counts: dict[str, int],
+        attribute_distribution: dict[str, dict[str, int]],
+    ) -> dict[str, Any]:
+        """Build the plantation.quality.graded payload for one delivery."""
+        return {
+            "event_type": "plantation.quality.graded",
+            "farmer_id": farmer_id,
+            "document_id": document_id,
+            "grading_model_id": grading_model_id,
+            "grading_model_version": grading_model_version,
+            "grade_counts": grade_counts,
+            "attribute_distribution": attribute_distribution,
+            "timestamp": datetime.now(dt.UTC).isoformat(),
+        }
+
+    @staticmethod
+    def _performance_updated_payload(
+        farmer_id: str,
+        factory_id: str,
+        primary_percentage: float,
+        improvement_trend: TrendDirection,
+        today_summary: dict[str, Any],
+        triggered_by_document_id: str,
+    ) -> dict[str, Any]:
+        """Build the plantation.performance_updated payload for one farmer."""
+        return {
+            "event_type": "plantation.performance_updated",
+            "farmer_id": farmer_id,
+            "factory_id": factory_id,
+            "primary_percentage": round(primary_percentage, 2),
+            "improvement_trend": improvement_trend.value,
+            "today": today_summary,
+            "triggered_by_document_id": triggered_by_document_id,
+            "timestamp": datetime.now(dt.UTC).isoformat(),
+        }
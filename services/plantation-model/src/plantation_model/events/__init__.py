@@ -8,25 +8,30 @@ Publisher (publisher.py):
 Subscriber (subscriber.py):
 - run_streaming_subscriptions: Background thread function for streaming subscriptions
 - handle_quality_result: Processes quality events from Collection Model
+- dispatch_quality_result: Hands quality events to the micro-batcher (batched mode)
 - handle_weather_updated: Processes weather events from Collection Model
 """
 
 from plantation_model.events.publisher import publish_event
 from plantation_model.events.subscriber import (
+    dispatch_quality_result,
     handle_quality_result,
     handle_weather_updated,
     run_streaming_subscriptions,
     set_main_event_loop,
+    set_quality_event_batcher,
     set_quality_event_processor,
     set_regional_weather_repo,
 )
 
 __all__ = [
+    "dispatch_quality_result",
     "handle_quality_result",
     "handle_weather_updated",
     "publish_event",
     "run_streaming_subscriptions",
     "set_main_event_loop",
+    "set_quality_event_batcher",
     "set_quality_event_processor",
     "set_regional_weather_repo",
 ]
@@ -78,3 +78,69 @@ async def publish_event(
             str(e),
         )
         return False
+
+
+async def publish_events(
+    pubsub_name: str,
+    topic: str,
+    events: list[BaseModel | dict[str, Any]],
+) -> int:
+    """Publish several events to one topic with a single DAPR bulk publish.
+
+    Args:
+        pubsub_name: Name of the DAPR pub/sub component (e.g., "pubsub").
+        topic: Topic name to publish to (e.g., "plantation.quality.graded").
+        events: Event data as Pydantic models or dicts.
+
+    Returns:
+        Number of events published successfully (0 if the sidecar is unavailable).
+    """
+    if not events:
+        return 0
+    payloads = [event.model_dump(mode="json") if isinstance(event, BaseModel) else event for event in events]
+
+    try:
+        with DaprClient() as client:
+            response = client.publish_events(
+                pubsub_name=pubsub_name,
+                topic_name=topic,
+                data=[json.dumps(payload) for payload in payloads],
+                data_content_type="application/json",
+            )
+
+        published = len(payloads) - len(response.failed_entries)
+        if response.failed_entries:
+            logger.warning(
+                "Bulk publish partially failed: pubsub=%s topic=%s failed=%d error=%s",
+                pubsub_name,
+                topic,
+                len(response.failed_entries),
+                response.failed_entries[0].error,
+            )
+        logger.info(
+            "Bulk published events to DAPR pub/sub: pubsub=%s topic=%s count=%d",
+            pubsub_name,
+            topic,
+            published,
+        )
+        return published
+
+    except (DaprInternalError, RpcError) as e:
+        logger.warning(
+            "DAPR sidecar unavailable, events not published: pubsub=%s topic=%s count=%d error=%s",
+            pubsub_name,
+            topic,
+            len(payloads),
+            str(e),
+        )
+        return 0
+
+    except Exception as e:
+        logger.error(
+            "Unexpected error bulk publishing to DAPR pub/sub: pubsub=%s topic=%s count=%d error=%s",
+            pubsub_name,
+            topic,
+            len(payloads),
+            str(e),
+        )
+        return 0
@@ -14,17 +14,23 @@ Key Pattern:
 
 import asyncio
 import json
+import threading
 import time
+from collections.abc import Callable
 from datetime import date, datetime
 from typing import TYPE_CHECKING
 
 import structlog
 from dapr.clients import DaprClient
 from dapr.clients.grpc._response import TopicEventResponse
+from fp_common.events.streaming import stream_subscription
 from opentelemetry import metrics, trace
 from pydantic import BaseModel, Field, ValidationError
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from plantation_model.domain.services.quality_event_batcher import QualityEventBatcher
     from plantation_model.domain.services.quality_event_processor import (
         QualityEventProcessor,
     )
@@ -80,6 +86,7 @@ class WeatherUpdatedEvent(BaseModel):
 # =============================================================================
 
 _quality_event_processor: "QualityEventProcessor | None" = None
+_quality_event_batcher: "QualityEventBatcher | None" = None
 _regional_weather_repo: "RegionalWeatherRepository | None" = None
 _main_event_loop: asyncio.AbstractEventLoop | None = None
 
@@ -91,6 +98,17 @@ def set_quality_event_processor(processor: "QualityEventProcessor") -> None:
     logger.info("Quality event processor set for streaming subscriptions")
 
 
+def set_quality_event_batcher(batcher: "QualityEventBatcher | None") -> None:
+    """Set the quality event batcher (called during service startup).
+
+    When set, quality results are consumed through a non-blocking stream
+    loop and processed in micro-batches instead of one at a time.
+    """
+    global _quality_event_batcher
+    _quality_event_batcher = batcher
+    logger.info("Quality event batcher set for streaming subscriptions", enabled=batcher is not None)
+
+
 def set_regional_weather_repo(repo: "RegionalWeatherRepository") -> None:
     """Set the regional weather repository (called during service startup)."""
     global _regional_weather_repo
@@ -115,6 +133,114 @@ def set_main_event_loop(loop: asyncio.AbstractEventLoop) -> None:
 # =============================================================================
 
 
+def _parse_quality_result(message, span) -> "QualityResultEvent | TopicEventResponse":
+    """Extract and validate a quality result payload.
+
+    Returns:
+        The validated event, or the drop response for an unusable message.
+    """
+    # Extract message data - DAPR SDK returns dict, NOT JSON string
+    try:
+        raw_data = message.data()
+        # Handle both dict and string formats for safety
+        if isinstance(raw_data, str):
+            data = json.loads(raw_data)
+        elif isinstance(raw_data, bytes):
+            data = json.loads(raw_data.decode("utf-8"))
+        else:
+            data = raw_data
+
+        # Extract payload from CloudEvent wrapper if present
+        if "data" in data and isinstance(data.get("data"), dict):
+            payload = data["data"].get("payload", data["data"])
+        elif "payload" in data:
+            payload = data["payload"]
+        else:
+            payload = data
+
+    except Exception as e:
+        logger.error("Failed to parse message data", error=str(e))
+        span.set_attribute("error", "parse_failed")
+        event_processing_counter.add(1, {"topic": "quality_result", "status": "drop"})
+        return TopicEventResponse("drop")
+
+    # Validate payload
+    try:
+        event_data = QualityResultEvent.model_validate(payload)
+        span.set_attribute("event.document_id", event_data.document_id)
+        span.set_attribute("event.farmer_id", event_data.farmer_id)
+
+        logger.info(
+            "Processing quality result event via streaming",
+            document_id=event_data.document_id,
+            farmer_id=event_data.farmer_id,
+        )
+        return event_data
+
+    except ValidationError as e:
+        logger.error("Invalid event payload", error=str(e), payload=payload)
+        span.set_attribute("error", "validation_failed")
+        event_processing_counter.add(1, {"topic": "quality_result", "status": "drop"})
+        return TopicEventResponse("drop")
+
+
+def _quality_result_success(event_data: QualityResultEvent, span) -> TopicEventResponse:
+    logger.info(
+        "Quality result event processed successfully",
+        document_id=event_data.document_id,
+        farmer_id=event_data.farmer_id,
+    )
+    span.set_attribute("processing.success", True)
+    event_processing_counter.add(1, {"topic": "quality_result", "status": "success"})
+    return TopicEventResponse("success")
+
+
+def _quality_result_failure(e: Exception, event_data: QualityResultEvent, span) -> TopicEventResponse:
+    """Map a processing error to retry (linkage failures reach the DLQ after max retries)."""
+    if isinstance(e, (ConnectionError, TimeoutError)):
+        # Transient errors - retry
+        logger.warning(
+            "Transient error processing quality event, will retry",
+            error=str(e),
+            document_id=event_data.document_id,
+        )
+        span.set_attribute("error", str(e))
+        event_processing_counter.add(1, {"topic": "quality_result", "status": "retry"})
+        return TopicEventResponse("retry")
+
+    # Story 0.6.10: Check for QualityEventProcessingError (linkage validation failures)
+    # These errors should RETRY so they go to DLQ after max retries (ADR-006)
+    from plantation_model.domain.services.quality_event_processor import (
+        QualityEventProcessingError,
+    )
+
+    if isinstance(e, QualityEventProcessingError):
+        # Linkage validation failure - return retry to trigger DLQ flow
+        logger.warning(
+            "Linkage validation failed - will retry then DLQ",
+            error_type=e.error_type,
+            field=e.field_name,
+            value=e.field_value,
+            document_id=e.document_id,
+        )
+        span.set_attribute("error", str(e))
+        span.set_attribute("error_type", e.error_type)
+        if e.field_name:
+            span.set_attribute("error_field", e.field_name)
+        event_processing_counter.add(1, {"topic": "quality_result", "status": "retry"})
+        return TopicEventResponse("retry")
+
+    # Unknown error - retry (might be transient)
+    logger.error(
+        "Unexpected error processing quality event",
+        document_id=event_data.document_id,
+        exc_info=e,
+    )
+    span.set_attribute("error", str(e))
+    event_processing_counter.add(1, {"topic": "quality_result", "status": "retry"})
+    return TopicEventResponse("retry")
+
+
 def handle_quality_result(message) -> TopicEventResponse:
     """Handle quality result events from Collection Model.
 
@@ -129,48 +255,9 @@ def handle_quality_result(message) -> TopicEventResponse:
         TopicEventResponse indicating success, retry, or drop.
     """
     with tracer.start_as_current_span("handle_quality_result_streaming") as span:
-        # Extract message data - DAPR SDK returns dict, NOT JSON string
-        try:
-            raw_data = message.data()
-            # Handle both dict and string formats for safety
-            if isinstance(raw_data, str):
-                data = json.loads(raw_data)
-            elif isinstance(raw_data, bytes):
-                data = json.loads(raw_data.decode("utf-8"))
-            else:
-                data = raw_data
-
-            # Extract payload from CloudEvent wrapper if present
-            if "data" in data and isinstance(data.get("data"), dict):
-                payload = data["data"].get("payload", data["data"])
-            elif "payload" in data:
-                payload = data["payload"]
-            else:
-                payload = data
-
-        except Exception as e:
-            logger.error("Failed to parse message data", error=str(e))
-            span.set_attribute("error", "parse_failed")
-            event_processing_counter.add(1, {"topic": "quality_result", "status": "drop"})
-            return TopicEventResponse("drop")
-
-        # Validate payload
-        try:
-            event_data = QualityResultEvent.model_validate(payload)
-            span.set_attribute("event.document_id", event_data.document_id)
-            span.set_attribute("event.farmer_id", event_data.farmer_id)
-
-            logger.info(
-                "Processing quality result event via streaming",
-                document_id=event_data.document_id,
-                farmer_id=event_data.farmer_id,
-            )
-
-        except ValidationError as e:
-            logger.error("Invalid event payload", error=str(e), payload=payload)
-            span.set_attribute("error", "validation_failed")
-            event_processing_counter.add(1, {"topic": "quality_result", "status": "drop"})
-            return TopicEventResponse("drop")
+        event_data = _parse_quality_result(message, span)
+        if isinstance(event_data, TopicEventResponse):
+            return event_data
 
         # Check processor initialization
         if _quality_event_processor is None:
@@ -199,58 +286,61 @@ def handle_quality_result(message) -> TopicEventResponse:
                 _main_event_loop,
             )
             future.result(timeout=30)  # 30 second timeout
+            return _quality_result_success(event_data, span)
 
-            logger.info(
-                "Quality result event processed successfully",
-                document_id=event_data.document_id,
-                farmer_id=event_data.farmer_id,
-            )
-            span.set_attribute("processing.success", True)
-            event_processing_counter.add(1, {"topic": "quality_result", "status": "success"})
-            return TopicEventResponse("success")
+        except Exception as e:
+            return _quality_result_failure(e, event_data, span)
 
-        except (ConnectionError, TimeoutError) as e:
-            # Transient errors - retry
-            logger.warning(
-                "Transient error processing quality event, will retry",
-                error=str(e),
-                document_id=event_data.document_id,
-            )
-            span.set_attribute("error", str(e))
-            event_processing_counter.add(1, {"topic": "quality_result", "status": "retry"})
-            return TopicEventResponse("retry")
 
-        except Exception as e:
-            # Story 0.6.10: Check for QualityEventProcessingError (linkage validation failures)
-            # These errors should RETRY so they go to DLQ after max retries (ADR-006)
-            from plantation_model.domain.services.quality_event_processor import (
-                QualityEventProcessingError,
-            )
+def dispatch_quality_result(subscription, message, on_done: Callable[[], None]) -> None:
+    """Submit a quality result to the batcher and respond when its batch completes.
 
-            if isinstance(e, QualityEventProcessingError):
-                # Linkage validation failure - return retry to trigger DLQ flow
-                logger.warning(
-                    "Linkage validation failed - will retry then DLQ",
-                    error_type=e.error_type,
-                    field=e.field_name,
-                    value=e.field_value,
-                    document_id=e.document_id,
-                )
-                span.set_attribute("error", str(e))
-                span.set_attribute("error_type", e.error_type)
-                if e.field_name:
-                    span.set_attribute("error_field", e.field_name)
-                event_processing_counter.add(1, {"topic": "quality_result", "status": "retry"})
-                return TopicEventResponse("retry")
-
-            # Unknown error - retry (might be transient)
-            logger.exception(
-                "Unexpected error processing quality event",
-                document_id=event_data.document_id,
-            )
-            span.set_attribute("error", str(e))
+    Unlike handle_quality_result this does not block the receiving thread,
+    so the stream keeps delivering messages while a batch fills. The
+    per-message response (success/retry/drop) is the same.
+
+    Args:
+        subscription: DAPR streaming subscription the message came from.
+        message: DAPR subscription message.
+        on_done: Called once the message has been answered.
+    """
+
+    def respond(response: TopicEventResponse) -> None:
+        try:
+            subscription.respond(message, response.status)
+        finally:
+            on_done()
+
+    with tracer.start_as_current_span("dispatch_quality_result_batched") as span:
+        event_data = _parse_quality_result(message, span)
+        if isinstance(event_data, TopicEventResponse):
+            respond(event_data)
+            return
+
+        if _quality_event_batcher is None or _main_event_loop is None:
+            logger.error("Quality event batcher or main event loop not initialized - will retry")
+            span.set_attribute("error", "batcher_not_initialized")
             event_processing_counter.add(1, {"topic": "quality_result", "status": "retry"})
-            return TopicEventResponse("retry")
+            respond(TopicEventResponse("retry"))
+            return
+
+        future = asyncio.run_coroutine_threadsafe(
+            asyncio.wait_for(
+                _quality_event_batcher.submit(event_data.document_id, event_data.farmer_id),
+                timeout=30,
+            ),
+            _main_event_loop,
+        )
+
+    def complete(done: "Future[dict]") -> None:
+        with tracer.start_as_current_span("complete_quality_result_batched") as done_span:
+            error = done.exception()
+            if error is None:
+                respond(_quality_result_success(event_data, done_span))
+            else:
+                respond(_quality_result_failure(error, event_data, done_span))
+
+    future.add_done_callback(complete)
 
 
 def handle_weather_updated(message) -> TopicEventResponse:
@@ -386,6 +476,7 @@ def handle_weather_updated(message) -> TopicEventResponse:
 # Subscription Startup (ADR-010 Pattern)
 # =============================================================================
 
+
 # Module-level event for signaling subscription readiness
 subscription_ready = False
 
@@ -414,17 +505,33 @@ def run_streaming_subscriptions() -> None:
         client = DaprClient()
 
         # Subscribe to quality results with DLQ
-        quality_close = client.subscribe_with_handler(
-            pubsub_name="pubsub",
-            topic="collection.quality_result.received",
-            handler_fn=handle_quality_result,
-            dead_letter_topic="events.dlq",
-        )
-        close_fns.append(quality_close)
+        if _quality_event_batcher is not None:
+            # Batched: answer messages asynchronously so batches can fill
+            quality_subscription = client.subscribe(
+                pubsub_name="pubsub",
+                topic="collection.quality_result.received",
+                dead_letter_topic="events.dlq",
+            )
+            threading.Thread(
+                target=stream_subscription,
+                args=(quality_subscription, dispatch_quality_result, _quality_event_batcher.max_pending),
+                daemon=True,
+                name="dapr-quality-batched",
+            ).start()
+            close_fns.append(quality_subscription.close)
+        else:
+            quality_close = client.subscribe_with_handler(
+                pubsub_name="pubsub",
+                topic="collection.quality_result.received",
+                handler_fn=handle_quality_result,
+                dead_letter_topic="events.dlq",
+            )
+            close_fns.append(quality_close)
         logger.info(
             "Subscription established",
             topic="collection.quality_result.received",
             dlq="events.dlq",
+            batched=_quality_event_batcher is not None,
         )
 
         # Subscribe to weather updates with DLQ
@@ -1,11 +1,51 @@
-"""Google Elevation API client for fetching altitude data."""
+"""Google Elevation API client for fetching altitude data.
 
+Altitudes are cached by geohash cell (about 5m x 5m at the default
+precision), so farms registered at the same spot cost one lookup. Bulk
+imports use the API's multi-location mode: up to ELEVATION_BATCH_SIZE
+coordinates per request instead of one request per farm.
+"""
+
+import asyncio
 import logging
+from collections import OrderedDict
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# Coordinates per multi-location request (API maximum is 512; kept lower so
+# the URL stays under the 16k character limit)
+ELEVATION_BATCH_SIZE = 256
+
+# Geohash cell used as cache key (precision 9 = ~4.8m x 4.8m)
+GEOHASH_PRECISION = 9
+DEFAULT_CACHE_SIZE = 100_000
+
+_GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Encode coordinates as a geohash string of the given length."""
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars = []
+    bits, bit_count, even = 0, 0, True
+    while len(chars) < precision:
+        value, bounds = (longitude, lng_range) if even else (latitude, lat_range)
+        mid = (bounds[0] + bounds[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            bounds[0] = mid
+        else:
+            bounds[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_GEOHASH_ALPHABET[bits])
+            bits, bit_count = 0, 0
+    return "".join(chars)
+
 
 class GoogleElevationClient:
     """Fetches altitude from Google Elevation API.
@@ -16,13 +56,30 @@ class GoogleElevationClient:
 
     BASE_URL = "https://maps.googleapis.com/maps/api/elevation/json"
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(self, api_key: str, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
         """Initialize the client.
 
         Args:
             api_key: Google Cloud API key with Elevation API enabled.
+            cache_size: Geohash cells kept in the altitude cache (0 disables it).
         """
         self._api_key = api_key
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, float] = OrderedDict()
+
+    def _cache_get(self, key: str) -> float | None:
+        altitude = self._cache.get(key)
+        if altitude is not None:
+            self._cache.move_to_end(key)
+        return altitude
+
+    def _cache_put(self, key: str, altitude: float) -> None:
+        if self._cache_size <= 0:
+            return
+        self._cache[key] = altitude
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
 
     async def get_altitude(self, latitude: float, longitude: float) -> float | None:
         """Fetch altitude in meters for given GPS coordinates.
@@ -38,6 +95,11 @@ class GoogleElevationClient:
             logger.warning("Google Elevation API key not configured, returning default altitude")
             return None
 
+        key = geohash(latitude, longitude)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         try:
             async with httpx.AsyncClient() as client:
                 response = await client.get(
@@ -53,6 +115,8 @@ class GoogleElevationClient:
 
                 if data.get("status") == "OK" and data.get("results"):
                     elevation = data["results"][0].get("elevation")
+                    if elevation is not None:
+                        self._cache_put(key, elevation)
                     logger.debug(
                         "Fetched altitude %.2f meters for coordinates (%.4f, %.4f)",
                         elevation,
@@ -74,6 +138,90 @@ class GoogleElevationClient:
             logger.error("Unexpected error fetching altitude: %s", e)
             return None
 
+    async def get_altitudes(self, locations: list[tuple[float, float]]) -> list[float | None]:
+        """Fetch altitudes for many coordinates with batched multi-location requests.
+
+        Coordinates in an already cached (or repeated) geohash cell are not
+        requested again.
+
+        Args:
+            locations: (latitude, longitude) pairs in decimal degrees.
+
+        Returns:
+            Altitude in meters per location (same order), None where unavailable.
+        """
+        if not self._api_key:
+            logger.warning("Google Elevation API key not configured, returning default altitudes")
+            return [None] * len(locations)
+
+        keys = [geohash(lat, lng) for lat, lng in locations]
+        altitudes: dict[str, float | None] = {}
+        missing: dict[str, tuple[float, float]] = {}
+        for key, location in zip(keys, locations, strict=True):
+            if key in altitudes or key in missing:
+                continue
+            cached = self._cache_get(key)
+            if cached is not None:
+                altitudes[key] = cached
+            else:
+                missing[key] = location
+
+        pending = list(missing.items())
+        if pending:
+            batches = [pending[i : i + ELEVATION_BATCH_SIZE] for i in range(0, len(pending), ELEVATION_BATCH_SIZE)]
+            async with httpx.AsyncClient() as client:
+                results = await asyncio.gather(*(self._fetch_batch(client, batch) for batch in batches))
+            for batch_result in results:
+                altitudes.update(batch_result)
+            logger.debug(
+                "Fetched %d altitudes in %d requests (%d locations, %d cached)",
+                len(pending),
+                len(batches),
+                len(locations),
+                len(locations) - len(pending),
+            )
+
+        return [altitudes.get(key) for key in keys]
+
+    async def _fetch_batch(
+        self,
+        client: httpx.AsyncClient,
+        batch: list[tuple[str, tuple[float, float]]],
+    ) -> dict[str, float | None]:
+        """Fetch one multi-location request; failures yield None for the whole batch."""
+        try:
+            response = await client.get(
+                self.BASE_URL,
+                params={
+                    "locations": "|".join(f"{lat:.6f},{lng:.6f}" for _, (lat, lng) in batch),
+                    "key": self._api_key,
+                },
+                timeout=10.0,
+            )
+            response.raise_for_status()
+            data = response.json()
+        except Exception as e:
+            logger.error("Failed to fetch %d altitudes from Google Elevation API: %s", len(batch), e)
+            return {key: None for key, _ in batch}
+
+        results = data.get("results") or []
+        if data.get("status") != "OK" or len(results) != len(batch):
+            logger.warning(
+                "Google Elevation API returned status: %s (%d/%d results)",
+                data.get("status", "UNKNOWN"),
+                len(results),
+                len(batch),
+            )
+            return {key: None for key, _ in batch}
+
+        altitudes: dict[str, float | None] = {}
+        for (key, _), result in zip(batch, results, strict=True):
+            elevation = result.get("elevation")
+            altitudes[key] = elevation
+            if elevation is not None:
+                self._cache_put(key, elevation)
+        return altitudes
+
 
 def assign_region_from_altitude(latitude: float, longitude: float, altitude: float) -> str:
     """Assign a farm to a region based on location and altitude.
@@ -0,0 +1,190 @@
+"""Reference data caches for quality event processing.
+
+Farmers, factories, regions, grading models and collection points change a
+few times a day but are read for every quality event. These caches keep
+them in memory per key, bounded by an LRU limit, and drop individual
+entries when MongoDB Change Streams report a change to their document.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from fp_common.cache import KeyedMongoChangeStreamCache
+from plantation_model.domain.models import CollectionPoint, Factory, Farmer, GradingModel, Region
+from plantation_model.infrastructure.repositories.collection_point_repository import CollectionPointRepository
+from plantation_model.infrastructure.repositories.factory_repository import FactoryRepository
+from plantation_model.infrastructure.repositories.farmer_repository import FarmerRepository
+from plantation_model.infrastructure.repositories.grading_model_repository import GradingModelRepository
+from plantation_model.infrastructure.repositories.region_repository import RegionRepository
+
+if TYPE_CHECKING:
+    from motor.motor_asyncio import AsyncIOMotorDatabase
+
+logger = structlog.get_logger(__name__)
+
+# Separator between model_id and model_version in grading model cache keys
+GRADING_MODEL_KEY_SEPARATOR = "@"
+
+
+def grading_model_key(model_id: str, model_version: str | None) -> str:
+    """Cache key for a grading model lookup (no version means the stored one)."""
+    if not model_version:
+        return model_id
+    return f"{model_id}{GRADING_MODEL_KEY_SEPARATOR}{model_version}"
+
+
+class FarmerCache(KeyedMongoChangeStreamCache[Farmer]):
+    """Farmers by ID."""
+
+    def __init__(self, db: AsyncIOMotorDatabase, max_entries: int) -> None:
+        super().__init__(db, FarmerRepository.COLLECTION_NAME, "plantation_farmer", max_entries)
+
+    def _get_cache_key(self, item: Farmer) -> str:
+        return item.id
+
+    def _parse_document(self, doc: dict) -> Farmer:
+        doc.pop("_id", None)
+        return Farmer.model_validate(doc)
+
+    def _get_key_filter(self, key: str) -> dict:
+        return {"_id": key}
+
+
+class FactoryCache(KeyedMongoChangeStreamCache[Factory]):
+    """Factories by ID."""
+
+    def __init__(self, db: AsyncIOMotorDatabase, max_entries: int) -> None:
+        super().__init__(db, FactoryRepository.COLLECTION_NAME, "plantation_factory", max_entries)
+
+    def _get_cache_key(self, item: Factory) -> str:
+        return item.id
+
+    def _parse_document(self, doc: dict) -> Factory:
+        doc.pop("_id", None)
+        return Factory.model_validate(doc)
+
+    def _get_key_filter(self, key: str) -> dict:
+        return {"_id": key}
+
+
+class RegionCache(KeyedMongoChangeStreamCache[Region]):
+    """Regions by region_id."""
+
+    def __init__(self, db: AsyncIOMotorDatabase, max_entries: int) -> None:
+        super().__init__(db, RegionRepository.COLLECTION_NAME, "plantation_region", max_entries)
+
+    def _get_cache_key(self, item: Region) -> str:
+        return item.region_id
+
+    def _parse_document(self, doc: dict) -> Region:
+        doc.pop("_id", None)
+        return Region.model_validate(doc)
+
+    def _get_key_filter(self, key: str) -> dict:
+        return {"_id": key}
+
+
+class CollectionPointCache(KeyedMongoChangeStreamCache[CollectionPoint]):
+    """Collection points (including farmer_ids) by ID."""
+
+    def __init__(self, db: AsyncIOMotorDatabase, max_entries: int) -> None:
+        super().__init__(db, CollectionPointRepository.COLLECTION_NAME, "plantation_collection_point", max_entries)
+
+    def _get_cache_key(self, item: CollectionPoint) -> str:
+        return item.id
+
+    def _parse_document(self, doc: dict) -> CollectionPoint:
+        doc.pop("_id", None)
+        return CollectionPoint.model_validate(doc)
+
+    def _get_key_filter(self, key: str) -> dict:
+        return {"_id": key}
+
+
+class GradingModelCache(KeyedMongoChangeStreamCache[GradingModel]):
+    """Grading models by grading_model_key(model_id, model_version)."""
+
+    def __init__(self, db: AsyncIOMotorDatabase, max_entries: int) -> None:
+        super().__init__(db, GradingModelRepository.COLLECTION_NAME, "plantation_grading_model", max_entries)
+
+    def _get_cache_key(self, item: GradingModel) -> str:
+        return grading_model_key(item.model_id, item.model_version)
+
+    def _parse_document(self, doc: dict) -> GradingModel:
+        doc.pop("_id", None)
+        return GradingModel.model_validate(doc)
+
+    def _get_key_filter(self, key: str) -> dict:
+        model_id, _, model_version = key.partition(GRADING_MODEL_KEY_SEPARATOR)
+        if not model_version:
+            return {"_id": model_id}
+        return {"model_id": model_id, "model_version": model_version}
+
+    async def get_model(self, model_id: str, model_version: str | None) -> GradingModel | None:
+        """Get a grading model by ID and optional version.
+
+        Args:
+            model_id: The grading model's unique identifier.
+            model_version: Exact version, or None for the stored model.
+
+        Returns:
+            The grading model if found, None otherwise.
+        """
+        return await self.get(grading_model_key(model_id, model_version))
+
+
+class ReferenceDataCache:
+    """The reference data caches used by QualityEventProcessor.
+
+    Attributes:
+        farmers: Farmer cache.
+        factories: Factory cache.
+        regions: Region cache.
+        grading_models: Grading model cache.
+        collection_points: Collection point cache.
+    """
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        max_farmers: int = 20_000,
+        max_entries: int = 2_000,
+    ) -> None:
+        """Create the caches (nothing is loaded until first use).
+
+        Args:
+            db: MongoDB database instance.
+            max_farmers: Maximum number of cached farmers.
+            max_entries: Maximum entries for each of the other caches.
+        """
+        self.farmers = FarmerCache(db, max_farmers)
+        self.factories = FactoryCache(db, max_entries)
+        self.regions = RegionCache(db, max_entries)
+        self.grading_models = GradingModelCache(db, max_entries)
+        self.collection_points = CollectionPointCache(db, max_entries)
+
+    @property
+    def _caches(self) -> dict[str, KeyedMongoChangeStreamCache[Any]]:
+        return {
+            "farmers": self.farmers,
+            "factories": self.factories,
+            "regions": self.regions,
+            "grading_models": self.grading_models,
+            "collection_points": self.collection_points,
+        }
+
+    async def start(self) -> None:
+        """Start the change stream watchers for all caches."""
+        await asyncio.gather(*(cache.start_change_stream() for cache in self._caches.values()))
+        logger.info("Reference data cache change streams started")
+
+    async def stop(self) -> None:
+        """Stop the change stream watchers for all caches."""
+        await asyncio.gather(*(cache.stop_change_stream() for cache in self._caches.values()))
+
+    def get_health_status(self) -> dict[str, Any]:
+        """Get per-cache health status for the health endpoint."""
+        return {name: cache.get_health_status() for name, cache in self._caches.items()}
@@ -4,6 +4,9 @@ from plantation_model.infrastructure.repositories.base import BaseRepository
 from plantation_model.infrastructure.repositories.collection_point_repository import (
     CollectionPointRepository,
 )
+from plantation_model.infrastructure.repositories.daily_metrics_repository import (
+    DailyMetricsRepository,
+)
 from plantation_model.infrastructure.repositories.factory_repository import (
     FactoryRepository,
 )
@@ -20,6 +23,7 @@ from plantation_model.infrastructure.repositories.grading_model_repository impor
 __all__ = [
     "BaseRepository",
     "CollectionPointRepository",
+    "DailyMetricsRepository",
     "FactoryRepository",
     "FarmerPerformanceRepository",
     "FarmerRepository",
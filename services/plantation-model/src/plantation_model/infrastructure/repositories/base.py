@@ -66,6 +66,27 @@ class BaseRepository(Generic[T]):
         doc.pop("_id", None)
         return self._model_class.model_validate(doc)
 
+    async def get_by_ids(self, entity_ids: list[str]) -> list[T]:
+        """Get several entities by ID in a single query.
+
+        Args:
+            entity_ids: Entity identifiers (duplicates are ignored).
+
+        Returns:
+            Found entities in the order of entity_ids; missing IDs are skipped.
+        """
+        unique_ids = list(dict.fromkeys(entity_ids))
+        if not unique_ids:
+            return []
+        cursor = self._collection.find({"_id": {"$in": unique_ids}})
+        docs = await cursor.to_list(length=len(unique_ids))
+
+        by_id: dict[str, T] = {}
+        for doc in docs:
+            entity_id = doc.pop("_id")
+            by_id[entity_id] = self._model_class.model_validate(doc)
+        return [by_id[entity_id] for entity_id in unique_ids if entity_id in by_id]
+
     async def update(self, entity_id: str, updates: dict) -> T | None:
         """Update an entity.
 
@@ -171,6 +171,34 @@ class CollectionPointRepository(BaseRepository[CollectionPoint]):
         """
         return await self.list({"farmer_ids": farmer_id}, page_size, page_token)
 
+    async def list_by_farmers(self, farmer_ids: list[str]) -> dict[str, list[CollectionPoint]]:
+        """Get collection point memberships for several farmers in one query.
+
+        Uses a single $in on the farmer_ids multikey index instead of one
+        list_by_farmer call per farmer.
+
+        Args:
+            farmer_ids: The farmer identifiers.
+
+        Returns:
+            Mapping of every requested farmer_id to its collection points
+            (sorted by ID, empty list if unassigned). A CP shared by several
+            farmers is the same object in each list.
+        """
+        unique_ids = list(dict.fromkeys(farmer_ids))
+        memberships: dict[str, list[CollectionPoint]] = {farmer_id: [] for farmer_id in unique_ids}
+        if not unique_ids:
+            return memberships
+
+        cursor = self._collection.find({"farmer_ids": {"$in": unique_ids}}).sort("_id", 1)
+        for doc in await cursor.to_list(length=None):
+            doc.pop("_id", None)
+            cp = CollectionPoint.model_validate(doc)
+            for farmer_id in cp.farmer_ids:
+                if farmer_id in memberships:
+                    memberships[farmer_id].append(cp)
+        return memberships
+
     async def ensure_indexes(self) -> None:
         """Create indexes for the collection_points collection.
 
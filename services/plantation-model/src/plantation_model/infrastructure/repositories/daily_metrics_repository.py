@@ -0,0 +1,131 @@
+"""Daily delivery metrics repository for MongoDB persistence."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import structlog
+from plantation_model.domain.models import DailyDeliveryMetrics
+from pymongo import ASCENDING, UpdateOne
+
+if TYPE_CHECKING:
+    import datetime as dt
+    from collections.abc import AsyncIterator
+
+    from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+
+logger = structlog.get_logger("plantation_model.infrastructure.repositories.daily_metrics_repository")
+
+
+class DailyMetricsRepository:
+    """Repository for per-farmer daily delivery buckets.
+
+    Buckets are stored with a composite key (farmer_id, metrics_date) and
+    dates as ISO strings, so date ranges are plain string range queries.
+    Writes are idempotent: closing the same day twice overwrites the bucket.
+    """
+
+    COLLECTION_NAME = "farmer_daily_metrics"
+
+    def __init__(self, db: AsyncIOMotorDatabase) -> None:
+        """Initialize the daily metrics repository.
+
+        Args:
+            db: MongoDB database instance.
+        """
+        self._db = db
+        self._collection: AsyncIOMotorCollection = db[self.COLLECTION_NAME]
+
+    @staticmethod
+    def _composite_id(farmer_id: str, metrics_date: dt.date) -> str:
+        return f"{farmer_id}_{metrics_date.isoformat()}"
+
+    @staticmethod
+    def _to_model(doc: dict) -> DailyDeliveryMetrics:
+        doc.pop("_id", None)
+        return DailyDeliveryMetrics.model_validate(doc)
+
+    async def upsert_days(self, days: list[DailyDeliveryMetrics]) -> int:
+        """Upsert daily buckets in one bulk write.
+
+        Args:
+            days: Buckets to store (one per farmer and date).
+
+        Returns:
+            Number of buckets inserted or changed.
+        """
+        if not days:
+            return 0
+        operations = [
+            UpdateOne(
+                {"_id": self._composite_id(day.farmer_id, day.metrics_date)},
+                {"$set": day.model_dump(mode="json")},
+                upsert=True,
+            )
+            for day in days
+        ]
+        result = await self._collection.bulk_write(operations, ordered=False)
+        logger.debug("Upserted %d daily metrics buckets", len(days))
+        return result.upserted_count + result.modified_count
+
+    async def find_in_ranges(
+        self,
+        farmer_id: str,
+        ranges: list[tuple[dt.date, dt.date]],
+    ) -> list[DailyDeliveryMetrics]:
+        """Get a farmer's buckets falling in any of several date ranges.
+
+        Args:
+            farmer_id: The farmer's unique identifier.
+            ranges: (after, through) pairs; a bucket matches when
+                after < metrics_date <= through. Empty ranges are ignored.
+
+        Returns:
+            Matching buckets ordered by date.
+        """
+        clauses = [
+            {"metrics_date": {"$gt": after.isoformat(), "$lte": through.isoformat()}}
+            for after, through in ranges
+            if after < through
+        ]
+        if not clauses:
+            return []
+        cursor = self._collection.find({"farmer_id": farmer_id, "$or": clauses}).sort("metrics_date", ASCENDING)
+        return [self._to_model(doc) async for doc in cursor]
+
+    async def iter_for_farmers(
+        self,
+        farmer_ids: list[str],
+        after: dt.date,
+        through: dt.date,
+    ) -> AsyncIterator[DailyDeliveryMetrics]:
+        """Stream the buckets of many farmers in a date range with one cursor.
+
+        Args:
+            farmer_ids: The farmers' unique identifiers.
+            after: Exclusive lower date bound.
+            through: Inclusive upper date bound.
+
+        Yields:
+            Buckets with after < metrics_date <= through.
+        """
+        if not farmer_ids:
+            return
+        cursor = self._collection.find(
+            {
+                "farmer_id": {"$in": farmer_ids},
+                "metrics_date": {"$gt": after.isoformat(), "$lte": through.isoformat()},
+            }
+        )
+        async for doc in cursor:
+            yield self._to_model(doc)
+
+    async def ensure_indexes(self) -> None:
+        """Create indexes for the farmer_daily_metrics collection."""
+        # Compound index for farmer_id + date range queries
+        await self._collection.create_index(
+            [("farmer_id", ASCENDING), ("metrics_date", ASCENDING)],
+            unique=True,
+            name="idx_farmer_daily_metrics_farmer_date",
+        )
+        logger.info("Daily metrics indexes created")
@@ -1,6 +1,8 @@
 """FarmerPerformance repository for MongoDB persistence."""
 
+import asyncio
 import datetime as dt
+from dataclasses import dataclass, field
 from datetime import datetime
 
 import structlog
@@ -9,25 +11,188 @@ from plantation_model.domain.models import (
     FarmerPerformance,
     FarmScale,
     HistoricalMetrics,
+    QualityThresholds,
+    QualityTier,
     TodayMetrics,
 )
 from plantation_model.infrastructure.repositories.base import BaseRepository
-from pymongo import ASCENDING
+from pymongo import ASCENDING, ReturnDocument, UpdateOne
 
 logger = structlog.get_logger("plantation_model.infrastructure.repositories.farmer_performance_repository")
 
+# Today metrics reset by a bulk delivery write, kept until the writer claims them for roll-up
+CLOSED_DAYS_FIELD = "closed_days"
+
+
+def _tier_expression(thresholds: QualityThresholds) -> dict:
+    """Aggregation expression equivalent to QualityThresholds.classify(primary_percentage_30d)."""
+    primary = "$historical.primary_percentage_30d"
+    return {
+        "$switch": {
+            "branches": [
+                {"case": {"$gte": [primary, thresholds.tier_1]}, "then": QualityTier.TIER_1.value},
+                {"case": {"$gte": [primary, thresholds.tier_2]}, "then": QualityTier.TIER_2.value},
+                {"case": {"$gte": [primary, thresholds.tier_3]}, "then": QualityTier.TIER_3.value},
+            ],
+            "default": QualityTier.BELOW_TIER_3.value,
+        }
+    }
+
+
+@dataclass
+class DeliveryIncrement:
+    """Today-metrics increments for one farmer, merged from several deliveries."""
+
+    farmer_id: str
+    deliveries: int = 0
+    total_kg: float = 0.0
+    grade_counts: dict[str, int] = field(default_factory=dict)
+    attribute_counts: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    def add(self, kg_amount: float, grade: str, attribute_counts: dict[str, dict[str, int]] | None = None) -> None:
+        """Merge one delivery into the increment."""
+        self.deliveries += 1
+        self.total_kg += kg_amount
+        self.grade_counts[grade] = self.grade_counts.get(grade, 0) + 1
+        for attr_name, class_counts in (attribute_counts or {}).items():
+            merged = self.attribute_counts.setdefault(attr_name, {})
+            for class_name, count in class_counts.items():
+                merged[class_name] = merged.get(class_name, 0) + count
+
+
+@dataclass
+class DeliveryUpdate:
+    """A farmer performance before and after a delivery was applied."""
+
+    previous: FarmerPerformance
+    performance: FarmerPerformance
+
+    @property
+    def rolled_over(self) -> bool:
+        """Whether the update started a new day (previous.today is the closed day)."""
+        return self.previous.today.metrics_date != self.performance.today.metrics_date
+
+
+@dataclass
+class DeliveryBatchUpdate:
+    """Farmer performances after a bulk delivery write, and the days it closed."""
+
+    performances: dict[str, FarmerPerformance] = field(default_factory=dict)
+    # Records as they were before a rollover: today holds the closed day
+    closed: list[FarmerPerformance] = field(default_factory=list)
+
+
+def _empty_today(today_str: str) -> dict:
+    """Today's metrics for a day without deliveries."""
+    return {
+        "deliveries": 0,
+        "total_kg": 0.0,
+        "grade_counts": {},
+        "attribute_counts": {},
+        "last_delivery": None,
+        "metrics_date": today_str,
+    }
+
+
+def _added(path: str, amount: float) -> dict:
+    """Aggregation expression adding amount to a possibly missing counter."""
+    return {"$add": [{"$ifNull": [f"$today.{path}", 0]}, amount]}
+
+
+def _increment_update(
+    increment: DeliveryIncrement,
+    now: datetime,
+    today_str: str,
+    keep_closed: bool = False,
+) -> list[dict]:
+    """Pipeline update applying a DeliveryIncrement to today's metrics.
+
+    The first stage resets today's metrics when they belong to an earlier
+    day, so the date rollover and the increment are one atomic update.
+    Metrics already dated today_str or later (another replica past
+    midnight first) are incremented as they are. With keep_closed, the
+    metrics being reset are appended to CLOSED_DAYS_FIELD so a caller
+    without the pre-image (bulk writes) can still roll the day up.
+    """
+    is_past_day = {"$lt": [{"$ifNull": ["$today.metrics_date", ""]}, today_str]}
+    reset_stage: dict = {"today": {"$cond": [is_past_day, {"$literal": _empty_today(today_str)}, "$today"]}}
+    if keep_closed:
+        closes_day = {"$and": [is_past_day, {"$ne": [{"$type": "$today"}, "missing"]}]}
+        reset_stage[CLOSED_DAYS_FIELD] = {
+            "$cond": [
+                closes_day,
+                {"$concatArrays": [{"$ifNull": [f"${CLOSED_DAYS_FIELD}", []]}, ["$today"]]},
+                {"$ifNull": [f"${CLOSED_DAYS_FIELD}", "$$REMOVE"]},
+            ],
+        }
+    increments: dict = {
+        "today.deliveries": _added("deliveries", increment.deliveries),
+        "today.total_kg": _added("total_kg", increment.total_kg),
+    }
+    for grade, count in increment.grade_counts.items():
+        increments[f"today.grade_counts.{grade}"] = _added(f"grade_counts.{grade}", count)
+    for attr_name, class_counts in increment.attribute_counts.items():
+        for class_name, count in class_counts.items():
+            path = f"attribute_counts.{attr_name}.{class_name}"
+            increments[f"today.{path}"] = _added(path, count)
+    return [
+        {"$set": reset_stage},
+        {"$set": {**increments, "today.last_delivery": {"$literal": now}, "updated_at": {"$literal": now}}},
+    ]
+
+
+def _apply_increment(
+    previous: FarmerPerformance, increment: DeliveryIncrement, now: datetime, today: dt.date
+) -> FarmerPerformance:
+    """The record _increment_update produces from `previous`, computed locally."""
+    if previous.today.metrics_date < today:
+        today_metrics = TodayMetrics(metrics_date=today)
+    else:
+        today_metrics = previous.today.model_copy(deep=True)
+    today_metrics.deliveries += increment.deliveries
+    today_metrics.total_kg += increment.total_kg
+    for grade, count in increment.grade_counts.items():
+        today_metrics.grade_counts[grade] = today_metrics.grade_counts.get(grade, 0) + count
+    for attr_name, class_counts in increment.attribute_counts.items():
+        merged = today_metrics.attribute_counts.setdefault(attr_name, {})
+        for class_name, count in class_counts.items():
+            merged[class_name] = merged.get(class_name, 0) + count
+    today_metrics.last_delivery = now
+    return previous.model_copy(update={"today": today_metrics, "updated_at": now})
+
+
+def _reset_today_update(now: datetime, today_str: str) -> dict:
+    """Update that replaces today's metrics with an empty day."""
+    return {
+        "$set": {
+            "today": _empty_today(today_str),
+            "updated_at": now,
+        },
+    }
+
 
 class FarmerPerformanceRepository(BaseRepository[FarmerPerformance]):
     """Repository for FarmerPerformance entities.
 
     Provides CRUD operations plus specialized queries:
     - get_by_farmer_id: Get performance by farmer ID
+    - get_by_farmer_ids: Get performances for many farmers in one query
     - initialize_for_farmer: Create default performance for new farmer
     - update_historical: Update historical metrics (batch job)
+    - update_historical_many: Update historical metrics for many farmers in one bulk write
     - update_today: Update today's metrics (streaming events)
-    - increment_today_delivery: Atomically increment today's delivery count
+    - increment_today_delivery: Atomically roll over and increment today's delivery count
+    - apply_delivery: Same, also returning the record as it was before the update
+    - increment_today_deliveries: Apply merged increments for many farmers in one bulk write,
+      returning the days closed by rollovers in it
     - reset_today: Reset today's metrics for a new day
     - list_by_grading_model: List performances using a specific grading model
+    - recompute_tiers: Re-derive the precomputed tier after threshold changes
+
+    The tier field is kept in sync with historical.primary_percentage_30d on
+    every write that can change it, so farmer listings can filter on it.
+    Callers pass the farmer's factory thresholds; writes without them use
+    the QualityThresholds defaults.
     """
 
     COLLECTION_NAME = "farmer_performances"
@@ -40,13 +205,18 @@ class FarmerPerformanceRepository(BaseRepository[FarmerPerformance]):
         """
         super().__init__(db, self.COLLECTION_NAME, FarmerPerformance)
 
-    async def create(self, entity: FarmerPerformance) -> FarmerPerformance:
+    async def create(
+        self,
+        entity: FarmerPerformance,
+        thresholds: QualityThresholds | None = None,
+    ) -> FarmerPerformance:
         """Create a new farmer performance record.
 
         Uses farmer_id as the MongoDB _id.
 
         Args:
             entity: The farmer performance to create.
+            thresholds: The farmer's factory quality thresholds for the tier.
 
         Returns:
             The created farmer performance.
@@ -54,6 +224,7 @@ class FarmerPerformanceRepository(BaseRepository[FarmerPerformance]):
         # Use mode="json" to serialize enums and dates as strings for MongoDB
         doc = entity.model_dump(mode="json")
         doc["_id"] = doc["farmer_id"]
+        doc["tier"] = self._tier_for(entity, thresholds).value
         await self._collection.insert_one(doc)
         logger.debug("Created farmer performance for %s", entity.farmer_id)
         return entity
@@ -73,6 +244,28 @@ class FarmerPerformanceRepository(BaseRepository[FarmerPerformance]):
         doc.pop("_id", None)
         return FarmerPerformance.model_validate(doc)
 
+    async def get_by_farmer_ids(self, farmer_ids: list[str]) -> dict[str, FarmerPerformance]:
+        """Get farmer performances for several farmers with a single $in query.
+
+        Args:
+            farmer_ids: The farmers' unique identifiers.
+
+        Returns:
+            Mapping of farmer_id to performance; farmers without a record are absent.
+        """
+        unique_ids = list(dict.fromkeys(farmer_ids))
+        if not unique_ids:
+            return {}
+        cursor = self._collection.find({"_id": {"$in": unique_ids}})
+        docs = await cursor.to_list(length=len(unique_ids))
+
+        performances: dict[str, FarmerPerformance] = {}
+        for doc in docs:
+            doc.pop("_id", None)
+            performance = FarmerPerformance.model_validate(doc)
+            performances[performance.farmer_id] = performance
+        return performances
+
     async def initialize_for_farmer(
         self,
         farmer_id: str,
@@ -80,6 +273,7 @@ class FarmerPerformanceRepository(BaseRepository[FarmerPerformance]):
         farm_scale: FarmScale,
         grading_model_id: str,
         grading_model_version: str,
+        thresholds: QualityThresholds | None = None,
     ) -> FarmerPerformance:
         """Create default performance record for a new farmer.
 
@@ -92,6 +286,7 @@ class FarmerPerformanceRepository(BaseRepository[FarmerPerformance]):
             farm_scale: Farm scale classification.
             grading_model_id: The grading model assigned to the farmer's factory.
             grading_model_version: Version of the grading model.
+            thresholds: The factory's quality thresholds for the tier.
 
         Returns:
             A new FarmerPerformance with default empty metrics.
@@ -103,10 +298,14 @@ class FarmerPerformanceRepository(BaseRepository[FarmerPerformance]):
             grading_model_id=grading_model_id,
             grading_model_version=grading_model_version,
         )
-        await self.create(performance)
+        await self.create(performance, thresholds)
         return performance
 
-    async def upsert(self, entity: FarmerPerformance) -> FarmerPerformance:
+    async def upsert(
+        self,
+        entity: FarmerPerformance,
+        thresholds: QualityThresholds | None = None,
+    ) -> FarmerPerformance:
         """Create or update a farmer performance record atomically.
 
         Uses MongoDB's upsert to atomically create if not exists,
@@ -114,6 +313,7 @@ class FarmerPerformanceRepository(BaseRepository[FarmerPerformance]):
 
         Args:
             entity: The farmer performance to create or update.
+            thresholds: The farmer's factory quality thresholds for the tier.
 
         Returns:
             The upserted farmer performance.
@@ -121,6 +321,7 @@ class FarmerPerformanceRepository(BaseRepository[FarmerPerformance]):
         # Use mode="json" to serialize enums and dates as strings for MongoDB
         doc = entity.model_dump(mode="json")
         doc["_id"] = doc["farmer_id"]
+        doc["tier"] = self._tier_for(entity, thresholds).value
         doc["updated_at"] = datetime.now(dt.UTC).isoformat()
 
         await self._collection.replace_one(
@@ -131,23 +332,38 @@ class FarmerPerformanceRepository(BaseRepository[FarmerPerformance]):
         logger.debug("Upserted farmer performance for %s", entity.farmer_id)
         return entity
 
-    async def update_historical(self, farmer_id: str, historical: HistoricalMetrics) -> FarmerPerformance | None:
-        """Update the historical metrics for a farmer.
+    @staticmethod
+    def _tier_for(entity: FarmerPerformance, thresholds: QualityThresholds | None) -> QualityTier:
+        """Tier to persist: classified with the given thresholds, else the entity's own, else defaults."""
+        if thresholds is None and entity.tier is not None:
+            return entity.tier
+        return (thresholds or QualityThresholds()).classify(entity.historical.primary_percentage_30d)
+
+    async def update_historical(
+        self,
+        farmer_id: str,
+        historical: HistoricalMetrics,
+        thresholds: QualityThresholds | None = None,
+    ) -> FarmerPerformance | None:
+        """Update the historical metrics (and derived tier) for a farmer.
 
         Called by batch jobs that aggregate quality events.
 
         Args:
             farmer_id: The farmer's unique identifier.
             historical: The updated historical metrics.
+            thresholds: The farmer's factory quality thresholds (defaults if None).
 
         Returns:
             The updated farmer performance if found, None otherwise.
         """
+        tier = (thresholds or QualityThresholds()).classify(historical.primary_percentage_30d)
         result = await self._collection.find_one_and_update(
             {"_id": farmer_id},
             {
                 "$set": {
                     "historical": historical.model_dump(mode="json"),
+                    "tier": tier.value,
                     "updated_at": datetime.now(dt.UTC),
                 },
             },
@@ -159,6 +375,39 @@ class FarmerPerformanceRepository(BaseRepository[FarmerPerformance]):
         logger.debug("Updated historical metrics for farmer %s", farmer_id)
         return FarmerPerformance.model_validate(result)
 
+    async def update_historical_many(
+        self,
+        updates: list[tuple[str, HistoricalMetrics, QualityThresholds | None]],
+    ) -> int:
+        """Update historical metrics (and derived tiers) for many farmers in one bulk write.
+
+        Args:
+            updates: (farmer_id, historical, thresholds) per farmer; None
+                thresholds mean the defaults.
+
+        Returns:
+            Number of farmer performances matched.
+        """
+        if not updates:
+            return 0
+        now = datetime.now(dt.UTC)
+        operations = [
+            UpdateOne(
+                {"_id": farmer_id},
+                {
+                    "$set": {
+                        "historical": historical.model_dump(mode="json"),
+                        "tier": (thresholds or QualityThresholds()).classify(historical.primary_percentage_30d).value,
+                        "updated_at": now,
+                    },
+                },
+            )
+            for farmer_id, historical, thresholds in updates
+        ]
+        result = await self._collection.bulk_write(operations, ordered=False)
+        logger.debug("Bulk updated historical metrics", farmers=len(updates), matched=result.matched_count)
+        return result.matched_count
+
     async def update_today(self, farmer_id: str, today: TodayMetrics) -> FarmerPerformance | None:
         """Update today's metrics for a farmer.
 
@@ -194,7 +443,9 @@ class FarmerPerformanceRepository(BaseRepository[FarmerPerformance]):
     ) -> FarmerPerformance | None:
         """Atomically increment today's delivery metrics.
 
-        Called when a new quality event arrives for a farmer.
+        Called when a new quality event arrives for a farmer. Today's
+        metrics are reset first, in the same update, if they belong to an
+        earlier day.
 
         Args:
             farmer_id: The farmer's unique identifier.
@@ -205,44 +456,48 @@ class FarmerPerformanceRepository(BaseRepository[FarmerPerformance]):
         Returns:
             The updated farmer performance if found, None otherwise.
         """
-        now = datetime.now(dt.UTC)
-        today_str = dt.date.today().isoformat()
+        increment = DeliveryIncrement(farmer_id=farmer_id)
+        increment.add(kg_amount, grade, attribute_counts)
+        update = await self.apply_delivery(increment)
+        return update.performance if update else None
 
-        # Build atomic update
-        update: dict = {
-            "$inc": {
-                "today.deliveries": 1,
-                "today.total_kg": kg_amount,
-                f"today.grade_counts.{grade}": 1,
-            },
-            "$set": {
-                "today.last_delivery": now,
-                "today.metrics_date": today_str,
-                "updated_at": now,
-            },
-        }
+    async def apply_delivery(
+        self,
+        increment: DeliveryIncrement,
+        today: dt.date | None = None,
+    ) -> DeliveryUpdate | None:
+        """Apply a delivery increment with the date rollover in one round trip.
+
+        The update returns the document as it was before, so a rollover
+        hands back the exact metrics of the day it closed; the updated
+        record is derived from it locally.
 
-        # Add attribute count increments if provided
-        if attribute_counts:
-            for attr_name, class_counts in attribute_counts.items():
-                for class_name, count in class_counts.items():
-                    update["$inc"][f"today.attribute_counts.{attr_name}.{class_name}"] = count
+        Args:
+            increment: The delivery (or merged deliveries) for one farmer.
+            today: Current day (defaults to today).
 
+        Returns:
+            The record before and after the update if found, None otherwise.
+        """
+        today = today or dt.date.today()
+        now = datetime.now(dt.UTC)
         result = await self._collection.find_one_and_update(
-            {"_id": farmer_id},
-            update,
-            return_document=True,
+            {"_id": increment.farmer_id},
+            _increment_update(increment, now, today.isoformat()),
+            return_document=ReturnDocument.BEFORE,
         )
         if result is None:
             return None
         result.pop("_id", None)
+        previous = FarmerPerformance.model_validate(result)
+        update = DeliveryUpdate(previous=previous, performance=_apply_increment(previous, increment, now, today))
         logger.debug(
-            "Incremented today delivery for farmer %s: +%.1f kg, grade=%s",
-            farmer_id,
-            kg_amount,
-            grade,
+            "Incremented today delivery for farmer %s: +%.1f kg, rolled_over=%s",
+            increment.farmer_id,
+            increment.total_kg,
+            update.rolled_over,
         )
-        return FarmerPerformance.model_validate(result)
+        return update
 
     async def reset_today(self, farmer_id: str) -> FarmerPerformance | None:
         """Reset today's metrics for a new day.
@@ -259,19 +514,7 @@ class FarmerPerformanceRepository(BaseRepository[FarmerPerformance]):
 
         result = await self._collection.find_one_and_update(
             {"_id": farmer_id},
-            {
-                "$set": {
-                    "today": {
-                        "deliveries": 0,
-                        "total_kg": 0.0,
-                        "grade_counts": {},
-                        "attribute_counts": {},
-                        "last_delivery": None,
-                        "metrics_date": today_str,
-                    },
-                    "updated_at": datetime.now(dt.UTC),
-                },
-            },
+            _reset_today_update(datetime.now(dt.UTC), today_str),
             return_document=True,
         )
         if result is None:
@@ -280,6 +523,93 @@ class FarmerPerformanceRepository(BaseRepository[FarmerPerformance]):
         logger.debug("Reset today metrics for farmer %s", farmer_id)
         return FarmerPerformance.model_validate(result)
 
+    async def increment_today_deliveries(
+        self,
+        increments: list[DeliveryIncrement],
+        today: dt.date | None = None,
+    ) -> DeliveryBatchUpdate:
+        """Apply merged delivery increments for many farmers in one bulk write.
+
+        Each update carries its own date rollover (see apply_delivery). A
+        bulk write cannot return pre-images, so the today metrics it resets
+        are parked on the record (CLOSED_DAYS_FIELD) and claimed right after
+        the write with an atomic unset; they come back in ``closed`` for the
+        caller to roll up.
+
+        Args:
+            increments: One merged increment per farmer.
+            today: Current day (defaults to today).
+
+        Returns:
+            Updated performance per farmer (farmers without a record are
+            absent) and the records whose day was closed by this write.
+        """
+        if not increments:
+            return DeliveryBatchUpdate()
+        now = datetime.now(dt.UTC)
+        today_str = (today or dt.date.today()).isoformat()
+        farmer_ids = [increment.farmer_id for increment in increments]
+
+        operations = [
+            UpdateOne({"_id": increment.farmer_id}, _increment_update(increment, now, today_str, keep_closed=True))
+            for increment in increments
+        ]
+        result = await self._collection.bulk_write(operations, ordered=False)
+
+        batch = DeliveryBatchUpdate()
+        rolled: list[str] = []
+        docs = await self._collection.find({"_id": {"$in": farmer_ids}}).to_list(length=len(farmer_ids))
+        for doc in docs:
+            doc.pop("_id", None)
+            performance = FarmerPerformance.model_validate(doc)
+            batch.performances[performance.farmer_id] = performance
+            if doc.get(CLOSED_DAYS_FIELD):
+                rolled.append(performance.farmer_id)
+        if rolled:
+            batch.closed = await self._claim_closed_days(rolled, batch.performances)
+
+        logger.debug(
+            "Bulk incremented today deliveries",
+            farmers=len(increments),
+            modified=result.modified_count,
+            rolled_over=len(batch.closed),
+        )
+        return batch
+
+    async def _claim_closed_days(
+        self,
+        farmer_ids: list[str],
+        performances: dict[str, FarmerPerformance],
+    ) -> list[FarmerPerformance]:
+        """Atomically take the parked closed days of some farmers.
+
+        Each parked day is returned exactly once, even if several writers
+        race to claim it.
+
+        Returns:
+            One record per closed day, with ``today`` set to that day.
+        """
+        claimed = await asyncio.gather(
+            *(
+                self._collection.find_one_and_update(
+                    {"_id": farmer_id, CLOSED_DAYS_FIELD: {"$exists": True}},
+                    {"$unset": {CLOSED_DAYS_FIELD: ""}},
+                    projection={CLOSED_DAYS_FIELD: True},
+                    return_document=ReturnDocument.BEFORE,
+                )
+                for farmer_id in farmer_ids
+            )
+        )
+        closed: list[FarmerPerformance] = []
+        for farmer_id, doc in zip(farmer_ids, claimed, strict=True):
+            if doc is None:
+                continue  # Claimed by another writer
+            for day in doc.get(CLOSED_DAYS_FIELD) or []:
+                if day:
+                    today_metrics = TodayMetrics.model_validate(day)
+                    closed.append(performances[farmer_id].model_copy(update={"today": today_metrics}))
+        return closed
+
     async def list_by_grading_model(
         self,
         grading_model_id: str,
@@ -323,15 +653,45 @@ class FarmerPerformanceRepository(BaseRepository[FarmerPerformance]):
 
         return performances, next_page_token, total_count
 
+    async def recompute_tiers(
+        self,
+        thresholds: QualityThresholds,
+        farmer_ids: list[str] | None = None,
+        only_missing: bool = False,
+    ) -> int:
+        """Re-derive the stored tier server-side in a single update.
+
+        Args:
+            thresholds: Quality thresholds to classify with.
+            farmer_ids: Farmers to update; None means records that have no
+                tier yet (backfill).
+            only_missing: Restrict farmer_ids to records that have no tier yet.
+
+        Returns:
+            Number of records whose tier changed.
+        """
+        query: dict = {}
+        if farmer_ids is not None:
+            query["_id"] = {"$in": farmer_ids}
+        if farmer_ids is None or only_missing:
+            query["tier"] = {"$exists": False}
+        result = await self._collection.update_many(query, [{"$set": {"tier": _tier_expression(thresholds)}}])
+        logger.debug("Recomputed farmer tiers", modified=result.modified_count)
+        return result.modified_count
+
     async def ensure_indexes(self) -> None:
         """Create indexes for the farmer_performances collection.
 
+        Records written before tiers were precomputed are backfilled with
+        their factory's thresholds by HistoricalMetricsEngine.backfill_tiers.
+
         Indexes:
         - farmer_id (unique): Primary key lookup
         - grading_model_id: List by grading model
         - farm_scale: Filter by farm scale
         - historical.improvement_trend: Filter by trend
         - updated_at: Sort and filter by update time
+        - tier: Filter farmer listings by quality tier
         """
         await self._collection.create_index(
             [("farmer_id", ASCENDING)],
@@ -354,4 +714,8 @@ class FarmerPerformanceRepository(BaseRepository[FarmerPerformance]):
             [("updated_at", ASCENDING)],
             name="idx_farmer_perf_updated_at",
         )
+        await self._collection.create_index(
+            [("tier", ASCENDING)],
+            name="idx_farmer_perf_tier",
+        )
         logger.info("Farmer performance indexes created")
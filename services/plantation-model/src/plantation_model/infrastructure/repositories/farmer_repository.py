@@ -1,13 +1,46 @@
 """Farmer repository for MongoDB persistence."""
 
+import re
+
 import structlog
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from plantation_model.domain.models import Farmer
+from plantation_model.domain.models import Farmer, FarmScale, QualityTier
 from plantation_model.infrastructure.repositories.base import BaseRepository
 from pymongo import ASCENDING
+from pymongo.errors import BulkWriteError
 
 logger = structlog.get_logger("plantation_model.infrastructure.repositories.farmer_repository")
 
+DUPLICATE_KEY_ERROR_CODE = 11000
+
+# Fields whose change requires recomputing search_terms
+SEARCH_TERM_SOURCE_FIELDS = frozenset({"first_name", "last_name", "contact"})
+
+# Server-side equivalent of _search_terms(), used to backfill existing documents
+SEARCH_TERMS_EXPRESSION = [
+    {"$toLower": "$id"},
+    {"$toLower": "$first_name"},
+    {"$toLower": "$last_name"},
+    {"$toLower": {"$concat": ["$first_name", " ", "$last_name"]}},
+    {"$ltrim": {"input": {"$ifNull": ["$contact.phone", ""]}, "chars": "+"}},
+]
+
+
+def _search_terms(farmer: Farmer) -> list[str]:
+    """Lowercased keys matched by prefix search (ID, names, full name, phone)."""
+    return [
+        farmer.id.lower(),
+        farmer.first_name.lower(),
+        farmer.last_name.lower(),
+        f"{farmer.first_name} {farmer.last_name}".lower(),
+        farmer.contact.phone.lstrip("+"),
+    ]
+
+
+def normalize_search(search: str) -> str:
+    """Normalize a free-text search the same way search_terms are built."""
+    return search.strip().lower().lstrip("+")
+
 
 class FarmerRepository(BaseRepository[Farmer]):
     """Repository for Farmer entities.
@@ -15,7 +48,12 @@ class FarmerRepository(BaseRepository[Farmer]):
     Provides CRUD operations plus specialized queries:
     - get_by_phone: For duplicate phone detection during registration
     - get_by_national_id: For duplicate national ID detection
+    - find_existing_contacts / insert_many: Batched duplicate check and writes for bulk import
     - list_by_region: List farmers in a region
+    - list_filtered: Filtered listing (scale, prefix search, tier) with exact pages
+
+    Each document carries a search_terms array (lowercased ID, names and
+    phone) backing indexed, case-insensitive prefix search.
 
     Story 9.5a: Farmer-CP relationship moved to CollectionPoint.farmer_ids
     """
@@ -30,6 +68,40 @@ class FarmerRepository(BaseRepository[Farmer]):
         """
         super().__init__(db, self.COLLECTION_NAME, Farmer)
 
+    async def create(self, entity: Farmer) -> Farmer:
+        """Create a new farmer with its search_terms.
+
+        Args:
+            entity: The farmer to create.
+
+        Returns:
+            The created farmer.
+        """
+        doc = entity.model_dump()
+        doc["_id"] = doc["id"]
+        doc["search_terms"] = _search_terms(entity)
+        await self._collection.insert_one(doc)
+        logger.debug("Created Farmer with id %s", doc["id"])
+        return entity
+
+    async def update(self, entity_id: str, updates: dict) -> Farmer | None:
+        """Update a farmer, refreshing search_terms when names or contact change.
+
+        Args:
+            entity_id: The farmer's unique identifier.
+            updates: Dictionary of fields to update.
+
+        Returns:
+            The updated farmer if found, None otherwise.
+        """
+        farmer = await super().update(entity_id, updates)
+        if farmer is not None and SEARCH_TERM_SOURCE_FIELDS.intersection(updates):
+            await self._collection.update_one(
+                {"_id": entity_id},
+                {"$set": {"search_terms": _search_terms(farmer)}},
+            )
+        return farmer
+
     async def get_by_phone(self, phone: str) -> Farmer | None:
         """Get a farmer by phone number.
 
@@ -64,6 +136,73 @@ class FarmerRepository(BaseRepository[Farmer]):
         doc.pop("_id", None)
         return Farmer.model_validate(doc)
 
+    async def find_existing_contacts(self, phones: list[str], national_ids: list[str]) -> tuple[set[str], set[str]]:
+        """Find which phones and national IDs are already registered.
+
+        One query for a whole import batch instead of two lookups per row.
+
+        Args:
+            phones: Phone numbers to check.
+            national_ids: National IDs to check.
+
+        Returns:
+            Tuple of (registered phones, registered national IDs) among those given.
+        """
+        clauses = []
+        if phones:
+            clauses.append({"contact.phone": {"$in": phones}})
+        if national_ids:
+            clauses.append({"national_id": {"$in": national_ids}})
+        if not clauses:
+            return set(), set()
+
+        phone_set, national_id_set = set(phones), set(national_ids)
+        existing_phones: set[str] = set()
+        existing_national_ids: set[str] = set()
+        cursor = self._collection.find({"$or": clauses}, {"_id": 0, "contact.phone": 1, "national_id": 1})
+        async for doc in cursor:
+            phone = doc.get("contact", {}).get("phone")
+            if phone in phone_set:
+                existing_phones.add(phone)
+            if doc.get("national_id") in national_id_set:
+                existing_national_ids.add(doc["national_id"])
+        return existing_phones, existing_national_ids
+
+    async def insert_many(self, farmers: list[Farmer]) -> dict[int, str]:
+        """Insert farmers in one unordered bulk write.
+
+        Rows rejected by a unique index (e.g. a phone registered concurrently)
+        do not stop the other inserts.
+
+        Args:
+            farmers: Farmers to create.
+
+        Returns:
+            Error message per rejected farmer, keyed by its index in farmers.
+        """
+        if not farmers:
+            return {}
+        docs = []
+        for farmer in farmers:
+            doc = farmer.model_dump()
+            doc["_id"] = doc["id"]
+            doc["search_terms"] = _search_terms(farmer)
+            docs.append(doc)
+
+        try:
+            await self._collection.insert_many(docs, ordered=False)
+        except BulkWriteError as e:
+            errors: dict[int, str] = {}
+            for write_error in e.details.get("writeErrors", []):
+                if write_error.get("code") == DUPLICATE_KEY_ERROR_CODE:
+                    errors[write_error["index"]] = "Farmer already exists (duplicate phone or national ID)"
+                else:
+                    errors[write_error["index"]] = write_error.get("errmsg", "Insert failed")
+            logger.warning("Bulk farmer insert had %d rejected rows", len(errors))
+            return errors
+        logger.debug("Created %d farmers", len(docs))
+        return {}
+
     # Story 9.5a: list_by_collection_point removed - use CollectionPoint.farmer_ids
 
     async def list_by_region(
@@ -116,6 +255,97 @@ class FarmerRepository(BaseRepository[Farmer]):
             filters["is_active"] = True
         return await self.list(filters, page_size, page_token)
 
+    async def list_filtered(
+        self,
+        region_id: str | None = None,
+        active_only: bool = False,
+        farm_scale: FarmScale | None = None,
+        search: str | None = None,
+        tier: QualityTier | None = None,
+        page_size: int = 100,
+        page_token: str | None = None,
+    ) -> tuple[list[Farmer], str | None, int]:
+        """List farmers with all predicates evaluated in MongoDB.
+
+        Every page holds exactly page_size farmers (except the last) and
+        total_count reflects all filters. Without a tier filter this is a
+        plain indexed find; with one, each farmer is joined to its
+        farmer_performances document (by _id) and matched on the precomputed
+        tier. Farmers without performance data count as below_tier_3.
+
+        Args:
+            region_id: Optional region filter.
+            active_only: If True, only return active farmers.
+            farm_scale: Optional farm scale filter.
+            search: Optional case-insensitive prefix of farmer ID, first
+                name, last name, full name or phone.
+            tier: Optional precomputed quality tier filter.
+            page_size: Number of results per page.
+            page_token: Token for the next page (farmer ID).
+
+        Returns:
+            Tuple of (farmers, next_page_token, total_count).
+        """
+        filters: dict = {}
+        if region_id:
+            filters["region_id"] = region_id
+        if active_only:
+            filters["is_active"] = True
+        if farm_scale:
+            filters["farm_scale"] = farm_scale.value
+        if search and normalize_search(search):
+            # Anchored, case-sensitive regex on lowercased terms uses index bounds
+            filters["search_terms"] = {"$regex": f"^{re.escape(normalize_search(search))}"}
+
+        if tier is None:
+            return await self.list(filters, page_size, page_token)
+
+        tier_stages = self._tier_stages(tier)
+        count_docs = await self._collection.aggregate([{"$match": filters}, *tier_stages, {"$count": "total"}]).to_list(
+            length=1
+        )
+        total_count = count_docs[0]["total"] if count_docs else 0
+
+        page_filters = {**filters, "_id": {"$gt": page_token}} if page_token else filters
+        docs = await self._collection.aggregate(
+            [
+                {"$match": page_filters},
+                {"$sort": {"_id": 1}},
+                *tier_stages,
+                {"$limit": page_size + 1},
+                {"$project": {"_performance": 0}},
+            ]
+        ).to_list(length=page_size + 1)
+
+        next_page_token = None
+        if len(docs) > page_size:
+            docs = docs[:page_size]
+            next_page_token = docs[-1]["_id"]
+
+        farmers = []
+        for doc in docs:
+            doc.pop("_id", None)
+            farmers.append(Farmer.model_validate(doc))
+        return farmers, next_page_token, total_count
+
+    @staticmethod
+    def _tier_stages(tier: QualityTier) -> list[dict]:
+        """Aggregation stages joining farmer_performances and matching on tier."""
+        tier_match: dict = {"_performance.tier": tier.value}
+        if tier == QualityTier.BELOW_TIER_3:
+            tier_match = {"$or": [tier_match, {"_performance": {"$size": 0}}]}
+        return [
+            {
+                "$lookup": {
+                    "from": "farmer_performances",
+                    "localField": "_id",
+                    "foreignField": "_id",
+                    "as": "_performance",
+                }
+            },
+            {"$match": tier_match},
+        ]
+
     async def list_active(
         self,
         page_size: int = 100,
@@ -142,6 +372,9 @@ class FarmerRepository(BaseRepository[Farmer]):
         - region_id: List farmers by region
         - farm_scale: Filter by farm classification
         - is_active: Filter active/inactive farmers
+        - search_terms (multikey): Prefix search on ID, names and phone
+
+        Documents created before search_terms existed are backfilled here.
 
         Story 9.5a: collection_point_id index removed - relationship via CP.farmer_ids
         """
@@ -173,4 +406,14 @@ class FarmerRepository(BaseRepository[Farmer]):
             [("is_active", ASCENDING)],
             name="idx_farmer_active",
         )
+        await self._collection.create_index(
+            [("search_terms", ASCENDING)],
+            name="idx_farmer_search_terms",
+        )
+        backfill = await self._collection.update_many(
+            {"search_terms": {"$exists": False}},
+            [{"$set": {"search_terms": SEARCH_TERMS_EXPRESSION}}],
+        )
+        if backfill.modified_count:
+            logger.info("Backfilled farmer search terms", count=backfill.modified_count)
         logger.info("Farmer indexes created")
@@ -25,13 +25,14 @@ from fp_common.events import (
     set_dlq_repository,
     start_dlq_subscription,
 )
-from plantation_model.api import health
+from plantation_model.api import health, historical_metrics
 from plantation_model.api.grpc_server import start_grpc_server, stop_grpc_server
 from plantation_model.config import settings
-from plantation_model.domain.services import QualityEventProcessor
+from plantation_model.domain.services import HistoricalMetricsEngine, QualityEventBatcher, QualityEventProcessor
 from plantation_model.events.subscriber import (
     run_streaming_subscriptions,
     set_main_event_loop,
+    set_quality_event_batcher,
     set_quality_event_processor,
     set_regional_weather_repo,
 )
@@ -42,9 +43,13 @@ from plantation_model.infrastructure.mongodb import (
     get_database,
     get_mongodb_client,
 )
+from plantation_model.infrastructure.reference_data_cache import ReferenceDataCache
 from plantation_model.infrastructure.repositories.collection_point_repository import (
     CollectionPointRepository,
 )
+from plantation_model.infrastructure.repositories.daily_metrics_repository import (
+    DailyMetricsRepository,
+)
 from plantation_model.infrastructure.repositories.factory_repository import (
     FactoryRepository,
 )
@@ -114,6 +119,34 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         collection_client = CollectionGrpcClient()
         app.state.collection_client = collection_client
 
+        # Reference data cache: in-memory linkage validation for quality events
+        reference_cache = None
+        if settings.reference_cache_enabled:
+            reference_cache = ReferenceDataCache(
+                db,
+                max_farmers=settings.reference_cache_max_farmers,
+                max_entries=settings.reference_cache_max_entries,
+            )
+            await reference_cache.start()
+            app.state.reference_cache = reference_cache
+
+        # Rolling-window historical metrics, advanced at each farmer's date rollover
+        daily_metrics_repo = DailyMetricsRepository(db)
+        await daily_metrics_repo.ensure_indexes()
+        historical_engine = HistoricalMetricsEngine(
+            daily_metrics_repo=daily_metrics_repo,
+            farmer_performance_repo=farmer_performance_repo,
+            grading_model_repo=grading_model_repo,
+            factory_repo=factory_repo,
+            cp_repo=cp_repo,
+            reference_cache=reference_cache,
+        )
+        historical_metrics.set_historical_metrics_engine(historical_engine)
+
+        # Precomputed farmer tiers: index, then backfill records that have none
+        await farmer_performance_repo.ensure_indexes()
+        await historical_engine.backfill_tiers()
+
         # Initialize QualityEventProcessor (Story 1.7 + Story 0.6.10 + Story 1.11)
         # Story 0.6.14: DAPR publishing uses module-level publish_event() per ADR-010
         quality_event_processor = QualityEventProcessor(
@@ -124,12 +157,23 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             factory_repo=factory_repo,
             region_repo=region_repo,
             cp_repo=cp_repo,
+            reference_cache=reference_cache,
+            historical_engine=historical_engine,
         )
         app.state.quality_event_processor = quality_event_processor
         logger.info("QualityEventProcessor initialized")
 
         # Set processor references for streaming subscription handlers (Story 0.6.5)
         set_quality_event_processor(quality_event_processor)
+        if settings.quality_batch_enabled:
+            quality_event_batcher = QualityEventBatcher(
+                quality_event_processor,
+                max_batch_size=settings.quality_batch_max_size,
+                max_wait_ms=settings.quality_batch_max_wait_ms,
+                max_pending=settings.quality_batch_max_pending,
+            )
+            app.state.quality_event_batcher = quality_event_batcher
+            set_quality_event_batcher(quality_event_batcher)
         set_regional_weather_repo(regional_weather_repo)
         logger.info("Subscription handler dependencies configured")
 
@@ -192,6 +236,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     await stop_grpc_server()
 
+    if hasattr(app.state, "quality_event_batcher"):
+        await app.state.quality_event_batcher.close()
+
+    if hasattr(app.state, "reference_cache"):
+        await app.state.reference_cache.stop()
+
     # Close Collection client (Story 1.7)
     if hasattr(app.state, "collection_client"):
         await app.state.collection_client.close()
@@ -226,6 +276,7 @@ app.add_middleware(
 # Include routers
 # Note: HTTP event handlers removed in Story 0.6.5 - using DAPR streaming subscriptions
 app.include_router(health.router)
+app.include_router(historical_metrics.router)
 app.include_router(create_admin_router())  # Story 0.6.15: Runtime log level control
 
 # Instrument FastAPI with OpenTelemetry
@@ -64,6 +64,13 @@ class Settings(BaseSettings):
     # After this period, cost events are automatically deleted via MongoDB TTL index
     cost_event_retention_days: int = 90
 
+    # Group-commit buffering of cost event writes: events are flushed with one
+    # insert_many per batch and acknowledged to DAPR once their flush is written
+    cost_event_buffer_enabled: bool = True
+    cost_event_buffer_max_size: int = 200
+    cost_event_buffer_max_wait_ms: int = 10
+    cost_event_buffer_max_pending: int = 2_000
+
     # Logging configuration
     log_level: str = "INFO"
     log_format: str = "json"
@@ -2,9 +2,11 @@
 
 Story 13.5: DAPR Cost Event Subscription
 - cost_event_handler module: Subscribes to platform.cost.recorded events
+- dispatch_cost_event: Hands cost events to the group-commit buffer (buffered mode)
 """
 
 from platform_cost.handlers.cost_event_handler import (
+    dispatch_cost_event,
     handle_cost_event,
     run_cost_subscription,
     set_handler_dependencies,
@@ -12,6 +14,7 @@ from platform_cost.handlers.cost_event_handler import (
 )
 
 __all__ = [
+    "dispatch_cost_event",
     "handle_cost_event",
     "run_cost_subscription",
     "set_handler_dependencies",
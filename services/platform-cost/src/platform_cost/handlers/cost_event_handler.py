@@ -6,7 +6,8 @@ Receives cost events from all services via pub/sub and persists them to MongoDB.
 Alerting is handled via OTEL metrics (BudgetMonitor), NOT via pub/sub events.
 
 Key Pattern (per ADR-010/ADR-011):
-- Handlers receive message via `subscribe_with_handler()`
+- Handlers receive message via `subscribe_with_handler()`, or via `subscribe()`
+  with out-of-order responses when the group-commit buffer is enabled
 - `message.data()` returns dict directly (NOT JSON string)
 - Return `TopicEventResponse("success"|"retry"|"drop")`
 - Use `asyncio.run_coroutine_threadsafe()` for async operations on main event loop
@@ -14,15 +15,22 @@ Key Pattern (per ADR-010/ADR-011):
 Event Flow:
 1. Parse `message.data()` (handles dict, str, bytes formats)
 2. Validate as `CostRecordedEvent` using Pydantic
-3. Generate UUID for event ID
+3. Derive the event ID from the CloudEvent ID (stable across redeliveries)
 4. Convert to `UnifiedCostEvent.from_event()`
-5. Insert via `UnifiedCostRepository.insert()`
-6. Record cost via `BudgetMonitor.record_cost()`
-7. Return appropriate `TopicEventResponse`
+5. Insert via `UnifiedCostRepository.insert()`, or submit to the
+   `CostEventBuffer` which writes batches with one `insert_many()`
+6. Fold into hourly/daily rollups via `CostRollupRepository.record_events()`
+7. Record cost via `BudgetMonitor.record_cost()` (event ID as idempotency key)
+8. Return appropriate `TopicEventResponse` (after the event is written)
+
+Redeliveries hit a duplicate key on insert and are acknowledged without
+being counted again in the rollups or the budget.
 
 Error Handling Strategy:
 - ValidationError → "drop" (malformed event, won't fix on retry)
 - Repository insert error → "retry" (transient DB issue)
+- Rollup update error → logged and counted, not retried (the event is already
+  stored, a retry would store it twice); repair with the rollup rebuild command
 - Budget monitor error → "retry" (transient, should succeed on retry)
 - Parse error → "drop" (malformed payload)
 - Services not initialized → "retry" (startup timing, will resolve)
@@ -30,24 +38,34 @@ Error Handling Strategy:
 
 import asyncio
 import json
+import threading
 import time
 import uuid
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 import structlog
 from dapr.clients import DaprClient
 from dapr.clients.grpc._response import TopicEventResponse
 from fp_common.events.cost_recorded import CostRecordedEvent
+from fp_common.events.streaming import stream_subscription
 from opentelemetry import metrics, trace
 from pydantic import ValidationError
+from pymongo.errors import DuplicateKeyError
 
 from platform_cost.domain.cost_event import UnifiedCostEvent
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future
+
     from platform_cost.infrastructure.repositories.cost_repository import (
         UnifiedCostRepository,
     )
+    from platform_cost.infrastructure.repositories.cost_rollup_repository import (
+        CostRollupRepository,
+    )
     from platform_cost.services.budget_monitor import BudgetMonitor
+    from platform_cost.services.cost_event_buffer import CostEventBuffer
 
 logger = structlog.get_logger(__name__)
 tracer = trace.get_tracer(__name__)
@@ -59,6 +77,14 @@ event_processing_counter = meter.create_counter(
     description="Total cost events processed by subscription handler",
     unit="1",
 )
+rollup_failure_counter = meter.create_counter(
+    name="platform_cost_rollup_update_failures_total",
+    description="Cost events stored but not folded into the cost rollups",
+    unit="1",
+)
+
+# Namespace for event IDs derived from CloudEvent IDs
+EVENT_ID_NAMESPACE = uuid.UUID("5b0c5c1e-3f57-4b8e-9a4f-2f1d6c0e7a13")
 
 
 # =============================================================================
@@ -67,22 +93,31 @@ event_processing_counter = meter.create_counter(
 
 _cost_repository: "UnifiedCostRepository | None" = None
 _budget_monitor: "BudgetMonitor | None" = None
+_rollup_repository: "CostRollupRepository | None" = None
+_event_buffer: "CostEventBuffer | None" = None
 _main_event_loop: asyncio.AbstractEventLoop | None = None
 
 
 def set_handler_dependencies(
     cost_repository: "UnifiedCostRepository",
     budget_monitor: "BudgetMonitor",
+    rollup_repository: "CostRollupRepository | None" = None,
+    event_buffer: "CostEventBuffer | None" = None,
 ) -> None:
     """Set the cost handler dependencies (called during service startup).
 
     Args:
         cost_repository: Repository for persisting cost events.
         budget_monitor: Monitor for budget threshold tracking.
+        rollup_repository: Optional repository for hourly/daily cost rollups.
+        event_buffer: Optional group-commit buffer; when set, events are
+            written in batches and the subscription answers asynchronously.
     """
-    global _cost_repository, _budget_monitor
+    global _cost_repository, _budget_monitor, _rollup_repository, _event_buffer
     _cost_repository = cost_repository
     _budget_monitor = budget_monitor
+    _rollup_repository = rollup_repository
+    _event_buffer = event_buffer
     logger.info("Cost event handler dependencies set")
 
 
@@ -98,22 +133,45 @@ def set_main_event_loop(loop: asyncio.AbstractEventLoop) -> None:
     logger.info("Main event loop set for cost event handler")
 
 
+def derive_event_id(message: Any) -> str | None:
+    """Derive a stable cost event ID from the DAPR message.
+
+    The CloudEvent ID is kept across redeliveries, so the derived ID makes
+    a redelivered event collide with the stored one.
+
+    Args:
+        message: DAPR subscription message.
+
+    Returns:
+        The event ID, or None if the message carries no CloudEvent ID.
+    """
+    try:
+        message_id = message.id()
+    except Exception:
+        return None
+    if not isinstance(message_id, str) or not message_id:
+        return None
+    return str(uuid.uuid5(EVENT_ID_NAMESPACE, message_id))
+
+
 # =============================================================================
 # Async Processing Logic
 # =============================================================================
 
 
-async def _process_cost_event_async(event: CostRecordedEvent) -> str:
+async def _process_cost_event_async(event: CostRecordedEvent, event_id: str | None = None) -> str:
     """Process a cost event asynchronously.
 
     This function contains the actual cost event processing logic:
-    1. Generate UUID for event ID
+    1. Use the derived event ID (UUID if none)
     2. Convert to UnifiedCostEvent
-    3. Insert via repository
-    4. Update budget monitor
+    3. Insert via repository (or the group-commit buffer)
+    4. Update the cost rollups
+    5. Update budget monitor
 
     Args:
         event: The validated CostRecordedEvent from DAPR pub/sub.
+        event_id: Idempotency key derived from the message (see derive_event_id).
 
     Returns:
         The event ID of the persisted event.
@@ -125,12 +183,18 @@ async def _process_cost_event_async(event: CostRecordedEvent) -> str:
     if _cost_repository is None or _budget_monitor is None:
         raise ConnectionError("Cost event handler services not initialized")
 
-    # Generate UUID for event ID
-    event_id = str(uuid.uuid4())
+    # Without a message-derived ID, redeliveries cannot be recognized
+    event_id = event_id or str(uuid.uuid4())
 
     # Convert to storage model
     unified_event = UnifiedCostEvent.from_event(event_id, event)
 
+    if _event_buffer is not None:
+        # Insert, rollups and budget are updated by the buffer's flush
+        stored = await _event_buffer.submit(unified_event)
+        logger.debug("Cost event flushed", event_id=event_id, duplicate=not stored)
+        return event_id
+
     logger.debug(
         "Processing cost event",
         event_id=event_id,
@@ -139,14 +203,27 @@ async def _process_cost_event_async(event: CostRecordedEvent) -> str:
         source_service=unified_event.source_service,
     )
 
-    # Insert into MongoDB
-    await _cost_repository.insert(unified_event)
+    # Insert into MongoDB; a duplicate ID is a redelivery that is already counted
+    try:
+        await _cost_repository.insert(unified_event)
+    except DuplicateKeyError:
+        logger.info("Duplicate cost event skipped", event_id=event_id)
+        return event_id
+
+    # Fold into rollups; the event is stored, so a failure here must not retry it
+    if _rollup_repository is not None:
+        try:
+            await _rollup_repository.record_events([unified_event])
+        except Exception as e:
+            logger.error("Failed to update cost rollups", event_id=event_id, error=str(e))
+            rollup_failure_counter.add(1, {"cost_type": unified_event.cost_type})
 
     # Update budget monitor (synchronous operation)
     _budget_monitor.record_cost(
         cost_type=unified_event.cost_type,
         amount_usd=unified_event.amount_usd,
         timestamp=unified_event.timestamp,
+        idempotency_key=event_id,
     )
 
     logger.info(
@@ -164,6 +241,112 @@ async def _process_cost_event_async(event: CostRecordedEvent) -> str:
 # =============================================================================
 
 
+def _parse_cost_event(message: Any, span: Any) -> CostRecordedEvent | TopicEventResponse:
+    """Parse and validate a cost event message.
+
+    Returns:
+        The validated event, or the response to send if it cannot be processed.
+    """
+    # Extract message data - handle dict, string, and bytes formats
+    try:
+        raw_data = message.data()
+        if isinstance(raw_data, str):
+            data = json.loads(raw_data)
+        elif isinstance(raw_data, bytes):
+            data = json.loads(raw_data.decode("utf-8"))
+        else:
+            data = raw_data
+
+    except Exception as e:
+        logger.error("Failed to parse message data", error=str(e))
+        span.set_attribute("error", "parse_failed")
+        event_processing_counter.add(1, {"topic": "platform.cost.recorded", "status": "drop"})
+        return TopicEventResponse("drop")
+
+    # Check service initialization
+    if _cost_repository is None or _budget_monitor is None:
+        logger.error("Cost event handler services not initialized - will retry")
+        span.set_attribute("error", "services_not_initialized")
+        event_processing_counter.add(1, {"topic": "platform.cost.recorded", "status": "retry"})
+        return TopicEventResponse("retry")
+
+    # Check main event loop initialization
+    if _main_event_loop is None:
+        logger.error("Main event loop not initialized - will retry")
+        span.set_attribute("error", "event_loop_not_initialized")
+        event_processing_counter.add(1, {"topic": "platform.cost.recorded", "status": "retry"})
+        return TopicEventResponse("retry")
+
+    # Validate event payload
+    try:
+        event = CostRecordedEvent.model_validate(data)
+        span.set_attribute("event.cost_type", event.cost_type)
+        span.set_attribute("event.source_service", event.source_service)
+        span.set_attribute("event.amount_usd", str(event.amount_usd))
+        return event
+
+    except ValidationError as e:
+        logger.error(
+            "Invalid cost event payload - dropping to DLQ",
+            error=str(e),
+            data=data,
+        )
+        span.set_attribute("error", "validation_failed")
+        event_processing_counter.add(1, {"topic": "platform.cost.recorded", "status": "drop"})
+        return TopicEventResponse("drop")
+
+
+def _cost_event_success(event: CostRecordedEvent, event_id: str, span: Any) -> TopicEventResponse:
+    logger.info(
+        "Cost event handled successfully",
+        event_id=event_id,
+        cost_type=event.cost_type,
+    )
+    span.set_attribute("processing.success", True)
+    span.set_attribute("event.id", event_id)
+    event_processing_counter.add(1, {"topic": "platform.cost.recorded", "status": "success"})
+    return TopicEventResponse("success")
+
+
+def _cost_event_failure(e: BaseException, span: Any) -> TopicEventResponse:
+    if isinstance(e, ConnectionError):
+        # Transient database error - retry
+        logger.warning(
+            "Transient error processing cost event, will retry",
+            error=str(e),
+        )
+        span.set_attribute("error", str(e))
+        event_processing_counter.add(1, {"topic": "platform.cost.recorded", "status": "retry"})
+        return TopicEventResponse("retry")
+
+    if isinstance(e, TimeoutError):
+        # Timeout - retry
+        logger.warning(
+            "Timeout processing cost event, will retry",
+            error=str(e),
+        )
+        span.set_attribute("error", "timeout")
+        event_processing_counter.add(1, {"topic": "platform.cost.recorded", "status": "retry"})
+        return TopicEventResponse("retry")
+
+    # Unknown error - check if permanent or transient
+    error_str = str(e).lower()
+    if any(term in error_str for term in ["validation", "invalid", "malformed"]):
+        logger.error(
+            "Permanent error processing cost event - sending to DLQ",
+            error=str(e),
+        )
+        span.set_attribute("error", str(e))
+        event_processing_counter.add(1, {"topic": "platform.cost.recorded", "status": "drop"})
+        return TopicEventResponse("drop")
+
+    # Assume transient - retry
+    logger.error("Unexpected error processing cost event", error=str(e), error_type=type(e).__name__)
+    span.set_attribute("error", str(e))
+    event_processing_counter.add(1, {"topic": "platform.cost.recorded", "status": "retry"})
+    return TopicEventResponse("retry")
+
+
 def handle_cost_event(message: Any) -> TopicEventResponse:
     """Handle cost events via DAPR streaming subscription.
 
@@ -179,108 +362,63 @@ def handle_cost_event(message: Any) -> TopicEventResponse:
         TopicEventResponse indicating success, retry, or drop.
     """
     with tracer.start_as_current_span("handle_cost_event") as span:
-        # Extract message data - handle dict, string, and bytes formats
-        try:
-            raw_data = message.data()
-            if isinstance(raw_data, str):
-                data = json.loads(raw_data)
-            elif isinstance(raw_data, bytes):
-                data = json.loads(raw_data.decode("utf-8"))
-            else:
-                data = raw_data
-
-        except Exception as e:
-            logger.error("Failed to parse message data", error=str(e))
-            span.set_attribute("error", "parse_failed")
-            event_processing_counter.add(1, {"topic": "platform.cost.recorded", "status": "drop"})
-            return TopicEventResponse("drop")
-
-        # Check service initialization
-        if _cost_repository is None or _budget_monitor is None:
-            logger.error("Cost event handler services not initialized - will retry")
-            span.set_attribute("error", "services_not_initialized")
-            event_processing_counter.add(1, {"topic": "platform.cost.recorded", "status": "retry"})
-            return TopicEventResponse("retry")
-
-        # Check main event loop initialization
-        if _main_event_loop is None:
-            logger.error("Main event loop not initialized - will retry")
-            span.set_attribute("error", "event_loop_not_initialized")
-            event_processing_counter.add(1, {"topic": "platform.cost.recorded", "status": "retry"})
-            return TopicEventResponse("retry")
-
-        # Validate event payload
-        try:
-            event = CostRecordedEvent.model_validate(data)
-            span.set_attribute("event.cost_type", event.cost_type)
-            span.set_attribute("event.source_service", event.source_service)
-            span.set_attribute("event.amount_usd", str(event.amount_usd))
-
-        except ValidationError as e:
-            logger.error(
-                "Invalid cost event payload - dropping to DLQ",
-                error=str(e),
-                data=data,
-            )
-            span.set_attribute("error", "validation_failed")
-            event_processing_counter.add(1, {"topic": "platform.cost.recorded", "status": "drop"})
-            return TopicEventResponse("drop")
+        event = _parse_cost_event(message, span)
+        if isinstance(event, TopicEventResponse):
+            return event
 
         # Process event on MAIN event loop using run_coroutine_threadsafe
         try:
             future = asyncio.run_coroutine_threadsafe(
-                _process_cost_event_async(event),
+                _process_cost_event_async(event, derive_event_id(message)),
                 _main_event_loop,
             )
             event_id = future.result(timeout=30)  # 30 second timeout
-
-            logger.info(
-                "Cost event handled successfully",
-                event_id=event_id,
-                cost_type=event.cost_type,
-            )
-            span.set_attribute("processing.success", True)
-            span.set_attribute("event.id", event_id)
-            event_processing_counter.add(1, {"topic": "platform.cost.recorded", "status": "success"})
-            return TopicEventResponse("success")
-
-        except ConnectionError as e:
-            # Transient database error - retry
-            logger.warning(
-                "Transient error processing cost event, will retry",
-                error=str(e),
-            )
-            span.set_attribute("error", str(e))
-            event_processing_counter.add(1, {"topic": "platform.cost.recorded", "status": "retry"})
-            return TopicEventResponse("retry")
-
-        except TimeoutError as e:
-            # Timeout - retry
-            logger.warning(
-                "Timeout processing cost event, will retry",
-                error=str(e),
-            )
-            span.set_attribute("error", "timeout")
-            event_processing_counter.add(1, {"topic": "platform.cost.recorded", "status": "retry"})
-            return TopicEventResponse("retry")
+            return _cost_event_success(event, event_id, span)
 
         except Exception as e:
-            # Unknown error - check if permanent or transient
-            error_str = str(e).lower()
-            if any(term in error_str for term in ["validation", "invalid", "malformed"]):
-                logger.error(
-                    "Permanent error processing cost event - sending to DLQ",
-                    error=str(e),
-                )
-                span.set_attribute("error", str(e))
-                event_processing_counter.add(1, {"topic": "platform.cost.recorded", "status": "drop"})
-                return TopicEventResponse("drop")
-
-            # Assume transient - retry
-            logger.exception("Unexpected error processing cost event")
-            span.set_attribute("error", str(e))
-            event_processing_counter.add(1, {"topic": "platform.cost.recorded", "status": "retry"})
-            return TopicEventResponse("retry")
+            return _cost_event_failure(e, span)
+
+
+def dispatch_cost_event(subscription: Any, message: Any, on_done: Callable[[], None]) -> None:
+    """Submit a cost event to the write buffer and respond once it is flushed.
+
+    Unlike handle_cost_event this does not block the receiving thread, so
+    the stream keeps delivering messages while a flush fills. The response
+    (success/retry/drop) is the same, and success is only sent after the
+    flush containing the event has been written.
+
+    Args:
+        subscription: DAPR streaming subscription the message came from.
+        message: DAPR subscription message.
+        on_done: Called once the message has been answered.
+    """
+
+    def respond(response: TopicEventResponse) -> None:
+        try:
+            subscription.respond(message, response.status)
+        finally:
+            on_done()
+
+    with tracer.start_as_current_span("dispatch_cost_event_buffered") as span:
+        event = _parse_cost_event(message, span)
+        if isinstance(event, TopicEventResponse):
+            respond(event)
+            return
+
+        future = asyncio.run_coroutine_threadsafe(
+            asyncio.wait_for(_process_cost_event_async(event, derive_event_id(message)), timeout=30),
+            _main_event_loop,
+        )
+
+    def complete(done: "Future[str]") -> None:
+        with tracer.start_as_current_span("complete_cost_event_buffered") as done_span:
+            error = done.exception()
+            if error is None:
+                respond(_cost_event_success(event, done.result(), done_span))
+            else:
+                respond(_cost_event_failure(error, done_span))
+
+    future.add_done_callback(complete)
 
 
 # =============================================================================
@@ -312,18 +450,34 @@ def run_cost_subscription() -> None:
         client = DaprClient()
 
         # Subscribe to cost events with DLQ
-        close_fn = client.subscribe_with_handler(
-            pubsub_name=settings.dapr_pubsub_name,
-            topic=settings.cost_event_topic,
-            handler_fn=handle_cost_event,
-            dead_letter_topic="events.dlq",
-        )
+        if _event_buffer is not None:
+            # Buffered: answer messages asynchronously so flushes can fill
+            subscription = client.subscribe(
+                pubsub_name=settings.dapr_pubsub_name,
+                topic=settings.cost_event_topic,
+                dead_letter_topic="events.dlq",
+            )
+            threading.Thread(
+                target=stream_subscription,
+                args=(subscription, dispatch_cost_event, _event_buffer.max_pending),
+                daemon=True,
+                name="dapr-cost-buffered",
+            ).start()
+            close_fn = subscription.close
+        else:
+            close_fn = client.subscribe_with_handler(
+                pubsub_name=settings.dapr_pubsub_name,
+                topic=settings.cost_event_topic,
+                handler_fn=handle_cost_event,
+                dead_letter_topic="events.dlq",
+            )
 
         logger.info(
             "Cost event subscription established",
             pubsub=settings.dapr_pubsub_name,
             topic=settings.cost_event_topic,
             dlq="events.dlq",
+            buffered=_event_buffer is not None,
         )
 
         # Keep subscription alive - client must not be garbage collected
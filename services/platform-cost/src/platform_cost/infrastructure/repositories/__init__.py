@@ -4,18 +4,23 @@ Story 13.3: Cost Repository and Budget Monitor
 
 Repositories:
 - UnifiedCostRepository: Storage and querying for all cost events
+- CostRollupRepository: Hourly/daily cost rollups serving range queries
 - ThresholdRepository: Budget threshold configuration persistence
 """
 
 from platform_cost.infrastructure.repositories.cost_repository import (
     UnifiedCostRepository,
 )
+from platform_cost.infrastructure.repositories.cost_rollup_repository import (
+    CostRollupRepository,
+)
 from platform_cost.infrastructure.repositories.threshold_repository import (
     ThresholdConfig,
     ThresholdRepository,
 )
 
 __all__ = [
+    "CostRollupRepository",
     "ThresholdConfig",
     "ThresholdRepository",
     "UnifiedCostRepository",
@@ -5,11 +5,17 @@ Story 13.3: Cost Repository and Budget Monitor
 This module provides the repository for storing and querying unified cost events
 across all cost types (LLM, Document, Embedding, SMS). It supports:
 - Event insertion with automatic index creation (including TTL)
+- Idempotent bulk insertion (group commit of buffered events)
 - Cost summaries by type
 - Daily cost trends with breakdown
 - Current day/month cost for budget monitoring
 - LLM-specific breakdowns by agent type and model
 
+Range queries (summaries, trends and breakdowns) are served from the hourly
+and daily rollups of CostRollupRepository rather than the raw events, so their
+cost does not grow with traffic; rebuild_rollups() recomputes the rollups of
+any range still within retention.
+
 Indexes (per AC #1):
 - timestamp (descending) for recent queries
 - cost_type for type filtering
@@ -21,6 +27,7 @@ Indexes (per AC #1):
 - TTL index on timestamp (90 days default)
 """
 
+from dataclasses import dataclass, field
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 from typing import Any
@@ -28,6 +35,7 @@ from typing import Any
 import structlog
 from motor.motor_asyncio import AsyncIOMotorDatabase
 from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import BulkWriteError
 
 from platform_cost.domain.cost_event import (
     AgentTypeCost,
@@ -39,12 +47,30 @@ from platform_cost.domain.cost_event import (
     ModelCost,
     UnifiedCostEvent,
 )
+from platform_cost.infrastructure.repositories.cost_rollup_repository import (
+    ROLLUP_DIMENSIONS,
+    CostRollupRepository,
+    RollupCounters,
+    RollupRows,
+)
 
 logger = structlog.get_logger(__name__)
 
 # Collection name for cost events
 COLLECTION_NAME = "cost_events"
 
+# MongoDB duplicate key error code
+DUPLICATE_KEY_ERROR = 11000
+
+
+@dataclass
+class CostInsertResult:
+    """Outcome of an unordered bulk insert of cost events."""
+
+    inserted_ids: set[str] = field(default_factory=set)
+    # Index into the inserted events -> MongoDB writeError, for failures other than duplicate IDs
+    write_errors: dict[int, dict[str, Any]] = field(default_factory=dict)
+
 
 class UnifiedCostRepository:
     """Repository for unified cost event persistence and querying.
@@ -58,6 +84,7 @@ class UnifiedCostRepository:
         self,
         db: AsyncIOMotorDatabase,
         retention_days: int = 90,
+        rollups: CostRollupRepository | None = None,
     ) -> None:
         """Initialize the repository.
 
@@ -65,10 +92,17 @@ class UnifiedCostRepository:
             db: MongoDB database instance.
             retention_days: Number of days to retain cost events (default 90).
                            Events older than this are automatically deleted via TTL.
+            rollups: Rollup repository serving range queries (created if None).
         """
         self._db = db
         self._collection = db[COLLECTION_NAME]
         self._retention_days = retention_days
+        self._rollups = rollups or CostRollupRepository(db, retention_days=retention_days)
+
+    @property
+    def rollups(self) -> CostRollupRepository:
+        """Rollup repository serving range queries."""
+        return self._rollups
 
     @property
     def data_available_from(self) -> datetime:
@@ -82,6 +116,21 @@ class UnifiedCostRepository:
         """
         return datetime.now(UTC) - timedelta(days=self._retention_days)
 
+    def _time_range(self, start_date: date | None, end_date: date | None) -> tuple[datetime, datetime]:
+        """[start, end) datetimes of an inclusive date range.
+
+        None start = data_available_from, None end = now.
+        """
+        start_dt = (
+            datetime.combine(start_date, datetime.min.time(), tzinfo=UTC) if start_date else self.data_available_from
+        )
+        end_dt = (
+            datetime.combine(end_date, datetime.min.time(), tzinfo=UTC) + timedelta(days=1)
+            if end_date
+            else datetime.now(UTC)
+        )
+        return start_dt, end_dt
+
     async def ensure_indexes(self) -> None:
         """Create indexes for efficient querying.
 
@@ -96,6 +145,7 @@ class UnifiedCostRepository:
         - request_id (sparse) for tracing
         - Compound indexes for LLM agent/model queries
         - TTL index on timestamp
+        - Rollup collection indexes (CostRollupRepository.ensure_indexes)
         """
         # Calculate TTL in seconds (0 means no TTL, keep forever)
         ttl_seconds = self._retention_days * 86400 if self._retention_days > 0 else 0
@@ -185,6 +235,8 @@ class UnifiedCostRepository:
                 error=str(e),
             )
 
+        await self._rollups.ensure_indexes()
+
     async def insert(self, event: UnifiedCostEvent) -> str:
         """Insert a new cost event.
 
@@ -204,6 +256,52 @@ class UnifiedCostRepository:
         )
         return event.id
 
+    async def insert_many(self, events: list[UnifiedCostEvent]) -> CostInsertResult:
+        """Insert cost events in one unordered bulk insert.
+
+        Event IDs are idempotency keys: events whose ID is already stored
+        (redeliveries) are skipped rather than reported as errors. Other
+        write errors only affect their own event; the rest of the batch is
+        still inserted and reported.
+
+        Args:
+            events: The cost events to insert.
+
+        Returns:
+            IDs of the newly inserted events, and the write error of each
+            event (by index) that failed for a reason other than a duplicate ID.
+
+        Raises:
+            BulkWriteError: If the write concern failed (the inserts may not be durable).
+        """
+        if not events:
+            return CostInsertResult()
+        try:
+            await self._collection.insert_many([event.to_mongo_doc() for event in events], ordered=False)
+            errors: list[dict[str, Any]] = []
+        except BulkWriteError as e:
+            if e.details.get("writeConcernErrors"):
+                raise
+            errors = e.details.get("writeErrors", [])
+
+        failed = {error["index"]: error for error in errors}
+        result = CostInsertResult(
+            inserted_ids={event.id for index, event in enumerate(events) if index not in failed},
+            write_errors={index: error for index, error in failed.items() if error.get("code") != DUPLICATE_KEY_ERROR},
+        )
+        if result.write_errors:
+            logger.warning(
+                "Cost events failed to insert",
+                failed=len(result.write_errors),
+                codes=sorted({error.get("code", 0) for error in result.write_errors.values()}),
+            )
+        logger.debug(
+            "Cost events inserted",
+            inserted=len(result.inserted_ids),
+            duplicates=len(failed) - len(result.write_errors),
+        )
+        return result
+
     async def get_summary_by_type(
         self,
         start_date: date | None = None,
@@ -220,49 +318,22 @@ class UnifiedCostRepository:
         Returns:
             List of CostTypeSummary models, sorted by total cost descending.
         """
-        # Build time filter
-        start_dt = (
-            datetime.combine(start_date, datetime.min.time(), tzinfo=UTC) if start_date else self.data_available_from
-        )
-        end_dt = (
-            datetime.combine(end_date, datetime.min.time(), tzinfo=UTC) + timedelta(days=1)
-            if end_date
-            else datetime.now(UTC)
-        )
-
-        # Build match filter
-        match_filter: dict[str, Any] = {"timestamp": {"$gte": start_dt, "$lt": end_dt}}
-        if factory_id:
-            match_filter["factory_id"] = factory_id
-
-        pipeline: list[dict[str, Any]] = [
-            {"$match": match_filter},
-            {
-                "$group": {
-                    "_id": "$cost_type",
-                    "total_cost_usd": {"$sum": {"$toDecimal": "$amount_usd"}},
-                    "total_quantity": {"$sum": "$quantity"},
-                    "request_count": {"$sum": 1},
-                }
-            },
-            {"$sort": {"total_cost_usd": -1}},
-        ]
-
-        cursor = self._collection.aggregate(pipeline)
-        results = await cursor.to_list(length=100)
+        start_dt, end_dt = self._time_range(start_date, end_date)
+        match = {"factory_id": factory_id} if factory_id else None
+        results = await self._rollups.summarize(start_dt, end_dt, "$cost_type", match)
 
         # Calculate total for percentages
-        total_cost = sum(Decimal(str(r.get("total_cost_usd", 0))) for r in results)
+        total_cost = sum(Decimal(str(r.get("cost_usd", 0))) for r in results)
 
         summaries = []
         for result in results:
-            cost = Decimal(str(result.get("total_cost_usd", 0)))
+            cost = Decimal(str(result.get("cost_usd", 0)))
             percentage = float(cost / total_cost * 100) if total_cost > 0 else 0.0
             summaries.append(
                 CostTypeSummary(
                     cost_type=result["_id"],
                     total_cost_usd=cost,
-                    total_quantity=result.get("total_quantity", 0),
+                    total_quantity=result.get("quantity", 0),
                     request_count=result.get("request_count", 0),
                     percentage=round(percentage, 2),
                 )
@@ -295,22 +366,14 @@ class UnifiedCostRepository:
         start_dt = datetime.combine(start_date, datetime.min.time(), tzinfo=UTC)
         end_dt = datetime.combine(end_date, datetime.min.time(), tzinfo=UTC) + timedelta(days=1)
 
-        pipeline: list[dict[str, Any]] = [
-            {"$match": {"timestamp": {"$gte": start_dt, "$lt": end_dt}}},
+        results = await self._rollups.summarize(
+            start_dt,
+            end_dt,
             {
-                "$group": {
-                    "_id": {
-                        "date": {"$dateToString": {"format": "%Y-%m-%d", "date": "$timestamp"}},
-                        "cost_type": "$cost_type",
-                    },
-                    "cost_usd": {"$sum": {"$toDecimal": "$amount_usd"}},
-                }
+                "date": {"$dateToString": {"format": "%Y-%m-%d", "date": "$bucket"}},
+                "cost_type": "$cost_type",
             },
-            {"$sort": {"_id.date": 1}},
-        ]
-
-        cursor = self._collection.aggregate(pipeline)
-        results = await cursor.to_list(length=1000)  # Up to ~365 days * 4 types
+        )
 
         # Aggregate by date
         daily_costs: dict[str, dict[str, Decimal]] = {}
@@ -435,37 +498,13 @@ class UnifiedCostRepository:
         Returns:
             List of AgentTypeCost models, sorted by cost descending.
         """
-        start_dt = (
-            datetime.combine(start_date, datetime.min.time(), tzinfo=UTC) if start_date else self.data_available_from
+        start_dt, end_dt = self._time_range(start_date, end_date)
+        results = await self._rollups.summarize(
+            start_dt,
+            end_dt,
+            "$agent_type",
+            {"cost_type": "llm", "agent_type": {"$ne": None}},
         )
-        end_dt = (
-            datetime.combine(end_date, datetime.min.time(), tzinfo=UTC) + timedelta(days=1)
-            if end_date
-            else datetime.now(UTC)
-        )
-
-        pipeline: list[dict[str, Any]] = [
-            {
-                "$match": {
-                    "timestamp": {"$gte": start_dt, "$lt": end_dt},
-                    "cost_type": "llm",
-                    "agent_type": {"$ne": None},
-                }
-            },
-            {
-                "$group": {
-                    "_id": "$agent_type",
-                    "cost_usd": {"$sum": {"$toDecimal": "$amount_usd"}},
-                    "request_count": {"$sum": 1},
-                    "tokens_in": {"$sum": {"$ifNull": ["$metadata.tokens_in", 0]}},
-                    "tokens_out": {"$sum": {"$ifNull": ["$metadata.tokens_out", 0]}},
-                }
-            },
-            {"$sort": {"cost_usd": -1}},
-        ]
-
-        cursor = self._collection.aggregate(pipeline)
-        results = await cursor.to_list(length=100)
 
         # Calculate total for percentages
         total_cost = sum(Decimal(str(r.get("cost_usd", 0))) for r in results)
@@ -501,38 +540,14 @@ class UnifiedCostRepository:
         Returns:
             List of ModelCost models, sorted by cost descending.
         """
-        start_dt = (
-            datetime.combine(start_date, datetime.min.time(), tzinfo=UTC) if start_date else self.data_available_from
-        )
-        end_dt = (
-            datetime.combine(end_date, datetime.min.time(), tzinfo=UTC) + timedelta(days=1)
-            if end_date
-            else datetime.now(UTC)
+        start_dt, end_dt = self._time_range(start_date, end_date)
+        results = await self._rollups.summarize(
+            start_dt,
+            end_dt,
+            "$model",
+            {"cost_type": "llm", "model": {"$ne": None}},
         )
 
-        pipeline: list[dict[str, Any]] = [
-            {
-                "$match": {
-                    "timestamp": {"$gte": start_dt, "$lt": end_dt},
-                    "cost_type": "llm",
-                    "model": {"$ne": None},
-                }
-            },
-            {
-                "$group": {
-                    "_id": "$model",
-                    "cost_usd": {"$sum": {"$toDecimal": "$amount_usd"}},
-                    "request_count": {"$sum": 1},
-                    "tokens_in": {"$sum": {"$ifNull": ["$metadata.tokens_in", 0]}},
-                    "tokens_out": {"$sum": {"$ifNull": ["$metadata.tokens_out", 0]}},
-                }
-            },
-            {"$sort": {"cost_usd": -1}},
-        ]
-
-        cursor = self._collection.aggregate(pipeline)
-        results = await cursor.to_list(length=100)
-
         # Calculate total for percentages
         total_cost = sum(Decimal(str(r.get("cost_usd", 0))) for r in results)
 
@@ -567,34 +582,8 @@ class UnifiedCostRepository:
         Returns:
             DocumentCostSummary with total, pages, avg cost per page.
         """
-        start_dt = (
-            datetime.combine(start_date, datetime.min.time(), tzinfo=UTC) if start_date else self.data_available_from
-        )
-        end_dt = (
-            datetime.combine(end_date, datetime.min.time(), tzinfo=UTC) + timedelta(days=1)
-            if end_date
-            else datetime.now(UTC)
-        )
-
-        pipeline: list[dict[str, Any]] = [
-            {
-                "$match": {
-                    "timestamp": {"$gte": start_dt, "$lt": end_dt},
-                    "cost_type": "document",
-                }
-            },
-            {
-                "$group": {
-                    "_id": None,
-                    "total_cost_usd": {"$sum": {"$toDecimal": "$amount_usd"}},
-                    "total_pages": {"$sum": "$quantity"},
-                    "document_count": {"$sum": 1},
-                }
-            },
-        ]
-
-        cursor = self._collection.aggregate(pipeline)
-        results = await cursor.to_list(length=1)
+        start_dt, end_dt = self._time_range(start_date, end_date)
+        results = await self._rollups.summarize(start_dt, end_dt, None, {"cost_type": "document"})
 
         if not results:
             return DocumentCostSummary(
@@ -605,15 +594,15 @@ class UnifiedCostRepository:
             )
 
         result = results[0]
-        total_cost = Decimal(str(result.get("total_cost_usd", 0)))
-        total_pages = result.get("total_pages", 0)
+        total_cost = Decimal(str(result.get("cost_usd", 0)))
+        total_pages = result.get("quantity", 0)
         avg_cost = total_cost / total_pages if total_pages > 0 else Decimal("0")
 
         return DocumentCostSummary(
             total_cost_usd=total_cost,
             total_pages=total_pages,
             avg_cost_per_page_usd=avg_cost,
-            document_count=result.get("document_count", 0),
+            document_count=result.get("request_count", 0),
         )
 
     async def get_embedding_cost_by_domain(
@@ -630,37 +619,14 @@ class UnifiedCostRepository:
         Returns:
             List of DomainCost models, sorted by cost descending.
         """
-        start_dt = (
-            datetime.combine(start_date, datetime.min.time(), tzinfo=UTC) if start_date else self.data_available_from
-        )
-        end_dt = (
-            datetime.combine(end_date, datetime.min.time(), tzinfo=UTC) + timedelta(days=1)
-            if end_date
-            else datetime.now(UTC)
+        start_dt, end_dt = self._time_range(start_date, end_date)
+        results = await self._rollups.summarize(
+            start_dt,
+            end_dt,
+            "$knowledge_domain",
+            {"cost_type": "embedding", "knowledge_domain": {"$ne": None}},
         )
 
-        pipeline: list[dict[str, Any]] = [
-            {
-                "$match": {
-                    "timestamp": {"$gte": start_dt, "$lt": end_dt},
-                    "cost_type": "embedding",
-                    "knowledge_domain": {"$ne": None},
-                }
-            },
-            {
-                "$group": {
-                    "_id": "$knowledge_domain",
-                    "cost_usd": {"$sum": {"$toDecimal": "$amount_usd"}},
-                    "tokens_total": {"$sum": "$quantity"},
-                    "texts_count": {"$sum": 1},
-                }
-            },
-            {"$sort": {"cost_usd": -1}},
-        ]
-
-        cursor = self._collection.aggregate(pipeline)
-        results = await cursor.to_list(length=100)
-
         # Calculate total for percentages
         total_cost = sum(Decimal(str(r.get("cost_usd", 0))) for r in results)
 
@@ -672,10 +638,72 @@ class UnifiedCostRepository:
                 DomainCost(
                     knowledge_domain=result["_id"],
                     cost_usd=cost,
-                    tokens_total=result.get("tokens_total", 0),
-                    texts_count=result.get("texts_count", 0),
+                    tokens_total=result.get("quantity", 0),
+                    texts_count=result.get("request_count", 0),
                     percentage=round(percentage, 2),
                 )
             )
 
         return domain_costs
+
+    async def rebuild_rollups(self, start_date: date, end_date: date) -> int:
+        """Recompute the hourly and daily rollups of a date range from raw events.
+
+        Days are rebuilt one at a time (one aggregation over the day's
+        events, then a replace of that day's rollups). Days that start
+        before data_available_from are skipped: their raw events may already
+        be gone and the existing rollups are the only record left.
+
+        Args:
+            start_date: First day to rebuild (inclusive).
+            end_date: Last day to rebuild (inclusive).
+
+        Returns:
+            Number of days rebuilt.
+        """
+        rebuilt = 0
+        day = start_date
+        while day <= end_date:
+            day_start_dt = datetime.combine(day, datetime.min.time(), tzinfo=UTC)
+            day_end_dt = day_start_dt + timedelta(days=1)
+            if self._retention_days > 0 and day_start_dt < self.data_available_from:
+                logger.warning("Skipping rollup rebuild outside retention", day=day.isoformat())
+                day += timedelta(days=1)
+                continue
+
+            pipeline: list[dict[str, Any]] = [
+                {"$match": {"timestamp": {"$gte": day_start_dt, "$lt": day_end_dt}}},
+                {
+                    "$group": {
+                        "_id": {
+                            "bucket": {"$dateTrunc": {"date": "$timestamp", "unit": "hour"}},
+                            **{name: f"${name}" for name in ROLLUP_DIMENSIONS},
+                        },
+                        "cost_usd": {"$sum": {"$toDecimal": "$amount_usd"}},
+                        "quantity": {"$sum": "$quantity"},
+                        "request_count": {"$sum": 1},
+                        "tokens_in": {"$sum": {"$ifNull": ["$metadata.tokens_in", 0]}},
+                        "tokens_out": {"$sum": {"$ifNull": ["$metadata.tokens_out", 0]}},
+                    }
+                },
+            ]
+            rows = RollupRows()
+            async for result in self._collection.aggregate(pipeline, allowDiskUse=True):
+                key = result["_id"]
+                rows.add(
+                    RollupCounters(
+                        bucket=key["bucket"].replace(tzinfo=UTC),
+                        dimensions={name: key.get(name) for name in ROLLUP_DIMENSIONS},
+                        cost_usd=Decimal(str(result["cost_usd"])),
+                        quantity=result["quantity"],
+                        request_count=result["request_count"],
+                        tokens_in=result["tokens_in"],
+                        tokens_out=result["tokens_out"],
+                    )
+                )
+            written = await self._rollups.replace_range(day_start_dt, day_end_dt, rows)
+            logger.info("Rebuilt cost rollups", day=day.isoformat(), documents=written)
+            rebuilt += 1
+            day += timedelta(days=1)
+
+        return rebuilt
@@ -0,0 +1,321 @@
+"""Cost Rollup Repository for pre-aggregated cost queries.
+
+Cost queries used to $group the raw cost_events collection on every request,
+so their cost grew with traffic and retention. This module maintains hourly
+and daily rollups instead, one document per bucket and dimension combination:
+
+- bucket: start of the hour/day (UTC)
+- dimensions: cost_type, model, agent_type, factory_id, knowledge_domain
+- counters: cost_usd (Decimal128), quantity, request_count, tokens_in, tokens_out
+
+Rollups are updated with atomic $inc upserts as events arrive (see
+cost_event_handler) and can be rebuilt from the raw events for any range
+still within retention (UnifiedCostRepository.rebuild_rollups).
+
+Queries read whole days from the daily collection and only the partial days
+at the range edges from the hourly one, so a query touches at most
+(days + 48 hours) x dimension combinations documents whatever the traffic.
+
+Indexes:
+- bucket (descending) for range queries
+- cost_type + bucket (compound) for type+time queries
+- TTL on hourly bucket (retention + 1 day); daily rollups are kept
+"""
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import structlog
+from bson import Decimal128
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING, IndexModel, ReplaceOne, UpdateOne
+
+from platform_cost.domain.cost_event import UnifiedCostEvent
+
+logger = structlog.get_logger(__name__)
+
+# Collection names for rollups
+HOURLY_COLLECTION_NAME = "cost_rollups_hourly"
+DAILY_COLLECTION_NAME = "cost_rollups_daily"
+
+# Breakdown dimensions of every rollup document
+ROLLUP_DIMENSIONS = ("cost_type", "model", "agent_type", "factory_id", "knowledge_domain")
+
+
+def hour_start(value: datetime) -> datetime:
+    """Start of the UTC hour containing value."""
+    return value.astimezone(UTC).replace(minute=0, second=0, microsecond=0)
+
+
+def day_start(value: datetime) -> datetime:
+    """Start of the UTC day containing value."""
+    return hour_start(value).replace(hour=0)
+
+
+def rollup_segments(
+    start_dt: datetime, end_dt: datetime
+) -> tuple[list[tuple[datetime, datetime]], list[tuple[datetime, datetime]]]:
+    """Split [start_dt, end_dt) into daily and hourly bucket ranges.
+
+    Edges are widened to whole hours. Whole days are read from the daily
+    rollups, the partial days at either end from the hourly rollups.
+
+    Returns:
+        (daily_ranges, hourly_ranges), each a list of [start, end) pairs.
+    """
+    start_h = hour_start(start_dt)
+    end_h = hour_start(end_dt)
+    if end_h < end_dt.astimezone(UTC):
+        end_h += timedelta(hours=1)
+    if end_h <= start_h:
+        return [], []
+
+    first_day = day_start(start_h)
+    if first_day < start_h:
+        first_day += timedelta(days=1)
+    last_day = day_start(end_h)
+    if first_day >= last_day:
+        return [], [(start_h, end_h)]
+
+    hourly = [(s, e) for s, e in ((start_h, first_day), (last_day, end_h)) if s < e]
+    return [(first_day, last_day)], hourly
+
+
+@dataclass
+class RollupCounters:
+    """Counters accumulated for one rollup bucket and dimension combination."""
+
+    bucket: datetime
+    dimensions: dict[str, str | None]
+    cost_usd: Decimal = Decimal("0")
+    quantity: int = 0
+    request_count: int = 0
+    tokens_in: int = 0
+    tokens_out: int = 0
+
+    @property
+    def key(self) -> str:
+        """Document _id: bucket plus every dimension (empty when None)."""
+        parts = [self.bucket.isoformat()] + [self.dimensions.get(name) or "" for name in ROLLUP_DIMENSIONS]
+        return "|".join(parts)
+
+    def add(self, other: "RollupCounters") -> None:
+        """Add another set of counters for the same bucket and dimensions."""
+        self.cost_usd += other.cost_usd
+        self.quantity += other.quantity
+        self.request_count += other.request_count
+        self.tokens_in += other.tokens_in
+        self.tokens_out += other.tokens_out
+
+    @classmethod
+    def from_event(cls, event: UnifiedCostEvent, bucket: datetime) -> "RollupCounters":
+        """Counters of a single cost event."""
+        return cls(
+            bucket=bucket,
+            dimensions={name: getattr(event, name) for name in ROLLUP_DIMENSIONS},
+            cost_usd=event.amount_usd,
+            quantity=event.quantity,
+            request_count=1,
+            tokens_in=int(event.metadata.get("tokens_in") or 0),
+            tokens_out=int(event.metadata.get("tokens_out") or 0),
+        )
+
+    def to_mongo_doc(self, now: datetime) -> dict[str, Any]:
+        """Full rollup document (used by rebuilds)."""
+        return {
+            "_id": self.key,
+            "bucket": self.bucket,
+            **self.dimensions,
+            "cost_usd": Decimal128(str(self.cost_usd)),
+            "quantity": self.quantity,
+            "request_count": self.request_count,
+            "tokens_in": self.tokens_in,
+            "tokens_out": self.tokens_out,
+            "updated_at": now,
+        }
+
+    def to_increment(self, now: datetime) -> UpdateOne:
+        """Atomic upsert adding these counters to the stored document."""
+        return UpdateOne(
+            {"_id": self.key},
+            {
+                "$inc": {
+                    "cost_usd": Decimal128(str(self.cost_usd)),
+                    "quantity": self.quantity,
+                    "request_count": self.request_count,
+                    "tokens_in": self.tokens_in,
+                    "tokens_out": self.tokens_out,
+                },
+                "$setOnInsert": {"bucket": self.bucket, **self.dimensions},
+                "$set": {"updated_at": now},
+            },
+            upsert=True,
+        )
+
+
+@dataclass
+class RollupRows:
+    """Hourly and daily counters keyed by document _id."""
+
+    hourly: dict[str, RollupCounters] = field(default_factory=dict)
+    daily: dict[str, RollupCounters] = field(default_factory=dict)
+
+    def add(self, hourly: RollupCounters) -> None:
+        """Add hourly counters and fold them into their day."""
+        for rows, bucket in ((self.hourly, hourly.bucket), (self.daily, day_start(hourly.bucket))):
+            counters = RollupCounters(bucket=bucket, dimensions=hourly.dimensions)
+            counters = rows.setdefault(counters.key, counters)
+            counters.add(hourly)
+
+
+class CostRollupRepository:
+    """Repository for hourly and daily cost rollups.
+
+    - record_events: fold new cost events into both rollups (one bulk write each)
+    - replace_range: replace the rollups of a time range with rebuilt counters
+    - summarize: $group rollup documents over a time range
+    """
+
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase,
+        retention_days: int = 90,
+    ) -> None:
+        """Initialize the repository.
+
+        Args:
+            db: MongoDB database instance.
+            retention_days: Cost event retention; hourly rollups are kept one
+                day longer so range edges within retention stay exact.
+        """
+        self._db = db
+        self._hourly = db[HOURLY_COLLECTION_NAME]
+        self._daily = db[DAILY_COLLECTION_NAME]
+        self._retention_days = retention_days
+
+    async def ensure_indexes(self) -> None:
+        """Create indexes for both rollup collections (TTL on hourly only)."""
+        for collection, name in ((self._hourly, HOURLY_COLLECTION_NAME), (self._daily, DAILY_COLLECTION_NAME)):
+            indexes = [
+                IndexModel([("bucket", DESCENDING)], name="idx_bucket"),
+                IndexModel([("cost_type", ASCENDING), ("bucket", DESCENDING)], name="idx_cost_type_bucket"),
+            ]
+            if collection is self._hourly and self._retention_days > 0:
+                indexes.append(
+                    IndexModel(
+                        [("bucket", ASCENDING)],
+                        name="idx_ttl",
+                        expireAfterSeconds=(self._retention_days + 1) * 86400,
+                    )
+                )
+            try:
+                await collection.create_indexes(indexes)
+                logger.info("Cost rollup indexes created", collection=name, index_count=len(indexes))
+            except Exception as e:
+                logger.warning("Failed to create some indexes", collection=name, error=str(e))
+
+    async def record_events(self, events: list[UnifiedCostEvent]) -> int:
+        """Fold cost events into the hourly and daily rollups.
+
+        Events sharing a bucket and dimensions are merged first, so each
+        rollup document gets a single $inc per call.
+
+        Args:
+            events: Persisted cost events.
+
+        Returns:
+            Number of hourly rollup documents touched.
+        """
+        if not events:
+            return 0
+        rows = RollupRows()
+        for event in events:
+            rows.add(RollupCounters.from_event(event, hour_start(event.timestamp)))
+
+        now = datetime.now(UTC)
+        for collection, counters in ((self._hourly, rows.hourly), (self._daily, rows.daily)):
+            await collection.bulk_write([c.to_increment(now) for c in counters.values()], ordered=False)
+        logger.debug("Cost rollups updated", events=len(events), hourly_buckets=len(rows.hourly))
+        return len(rows.hourly)
+
+    async def replace_range(self, start_dt: datetime, end_dt: datetime, rows: RollupRows) -> int:
+        """Replace the rollups of whole days in [start_dt, end_dt) with rebuilt rows.
+
+        Rebuilt documents are upserted, then documents of the range that were
+        not rebuilt are deleted. Events recorded while a range is rebuilt may
+        be overwritten; rebuild closed ranges, or rebuild again.
+
+        Args:
+            start_dt: Range start (a UTC day boundary).
+            end_dt: Range end, exclusive (a UTC day boundary).
+            rows: Counters rebuilt from the raw events of the range.
+
+        Returns:
+            Number of rollup documents written.
+        """
+        now = datetime.now(UTC)
+        written = 0
+        for collection, counters in ((self._hourly, rows.hourly), (self._daily, rows.daily)):
+            if counters:
+                operations = [ReplaceOne({"_id": key}, c.to_mongo_doc(now), upsert=True) for key, c in counters.items()]
+                await collection.bulk_write(operations, ordered=False)
+                written += len(operations)
+            await collection.delete_many({"bucket": {"$gte": start_dt, "$lt": end_dt}, "_id": {"$nin": list(counters)}})
+        return written
+
+    async def summarize(
+        self,
+        start_dt: datetime,
+        end_dt: datetime,
+        group_by: str | dict[str, Any] | None,
+        match: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Sum rollup counters over a time range.
+
+        Args:
+            start_dt: Range start (widened to the hour).
+            end_dt: Range end, exclusive (widened to the hour).
+            group_by: $group _id expression over rollup fields (None = one row).
+            match: Extra filter on dimensions (e.g. {"cost_type": "llm"}).
+
+        Returns:
+            Rows with _id, cost_usd, quantity, request_count, tokens_in and
+            tokens_out, sorted by cost_usd descending.
+        """
+        daily_ranges, hourly_ranges = rollup_segments(start_dt, end_dt)
+        if not daily_ranges and not hourly_ranges:
+            return []
+
+        def _match(ranges: list[tuple[datetime, datetime]]) -> dict[str, Any]:
+            return {
+                "$match": {
+                    **(match or {}),
+                    "$or": [{"bucket": {"$gte": start, "$lt": end}} for start, end in ranges],
+                }
+            }
+
+        group = {
+            "$group": {
+                "_id": group_by,
+                "cost_usd": {"$sum": "$cost_usd"},
+                "quantity": {"$sum": "$quantity"},
+                "request_count": {"$sum": "$request_count"},
+                "tokens_in": {"$sum": "$tokens_in"},
+                "tokens_out": {"$sum": "$tokens_out"},
+            }
+        }
+        # Whole days come from the daily rollups, partial-day edges are unioned in
+        if daily_ranges:
+            pipeline: list[dict[str, Any]] = [_match(daily_ranges)]
+            if hourly_ranges:
+                pipeline.append({"$unionWith": {"coll": HOURLY_COLLECTION_NAME, "pipeline": [_match(hourly_ranges)]}})
+            collection = self._daily
+        else:
+            pipeline = [_match(hourly_ranges)]
+            collection = self._hourly
+        pipeline += [group, {"$sort": {"cost_usd": -1}}]
+
+        cursor = collection.aggregate(pipeline)
+        return await cursor.to_list(length=None)
@@ -48,7 +48,7 @@ from platform_cost.infrastructure.tracing import (
     setup_tracing,
     shutdown_tracing,
 )
-from platform_cost.services import BudgetMonitor
+from platform_cost.services import BudgetMonitor, CostEventBuffer
 
 # Configure structured logging via fp_common (ADR-009)
 configure_logging("platform-cost")
@@ -67,6 +67,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     grpc_server: GrpcServer | None = None
     subscription_thread: threading.Thread | None = None
+    event_buffer: CostEventBuffer | None = None
 
     # Startup
     logger.info(
@@ -154,8 +155,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         )
 
         # Story 13.5: Set up DAPR streaming subscription for cost events
-        # Set handler dependencies (repository, budget monitor)
-        set_handler_dependencies(cost_repository, budget_monitor)
+        # Set handler dependencies (repository, budget monitor, write buffer)
+        if settings.cost_event_buffer_enabled:
+            event_buffer = CostEventBuffer(
+                cost_repository,
+                budget_monitor,
+                cost_repository.rollups,
+                max_batch_size=settings.cost_event_buffer_max_size,
+                max_wait_ms=settings.cost_event_buffer_max_wait_ms,
+                max_pending=settings.cost_event_buffer_max_pending,
+            )
+        set_handler_dependencies(cost_repository, budget_monitor, cost_repository.rollups, event_buffer)
 
         # Capture main event loop for async operations in subscription handler
         set_main_event_loop(asyncio.get_running_loop())
@@ -189,6 +199,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         await grpc_server.stop()
         logger.info("gRPC server stopped")
 
+    # Flush buffered cost events before closing MongoDB
+    if event_buffer is not None:
+        await event_buffer.close()
+        logger.info("Cost event buffer flushed")
+
     await close_mongodb_connection()
     shutdown_tracing()
 
@@ -0,0 +1,61 @@
+"""Rebuild the hourly and daily cost rollups from raw cost events.
+
+Recomputes the rollups of a date range, e.g. after a rollup update failure
+(platform_cost_rollup_update_failures_total) or when enabling rollups on a
+database that already holds events. Days before the retention window are
+skipped since their raw events may already have expired.
+
+Usage:
+    python -m platform_cost.rebuild_rollups --start 2026-01-01 --end 2026-01-31
+    python -m platform_cost.rebuild_rollups --days 7
+"""
+
+import argparse
+import asyncio
+from datetime import date, timedelta
+
+import structlog
+from fp_common import configure_logging
+
+from platform_cost.config import settings
+from platform_cost.infrastructure.mongodb import close_mongodb_connection, get_database
+from platform_cost.infrastructure.repositories import UnifiedCostRepository
+
+logger = structlog.get_logger("platform_cost.rebuild_rollups")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the rebuild range from the command line."""
+    parser = argparse.ArgumentParser(description="Rebuild platform cost rollups from raw cost events.")
+    parser.add_argument("--start", type=date.fromisoformat, help="First day to rebuild (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, help="Last day to rebuild (YYYY-MM-DD, default today)")
+    parser.add_argument("--days", type=int, default=1, help="Days ending at --end to rebuild when --start is omitted")
+    args = parser.parse_args(argv)
+    args.end = args.end or date.today()
+    args.start = args.start or args.end - timedelta(days=args.days - 1)
+    if args.start > args.end:
+        parser.error("--start must not be after --end")
+    return args
+
+
+async def rebuild(start: date, end: date) -> int:
+    """Rebuild the rollups of [start, end] and return the number of days rebuilt."""
+    db = await get_database()
+    repository = UnifiedCostRepository(db=db, retention_days=settings.cost_event_retention_days)
+    try:
+        await repository.rollups.ensure_indexes()
+        return await repository.rebuild_rollups(start, end)
+    finally:
+        await close_mongodb_connection()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command-line entry point."""
+    configure_logging("platform-cost")
+    args = parse_args(argv)
+    rebuilt = asyncio.run(rebuild(args.start, args.end))
+    logger.info("Cost rollup rebuild complete", start=args.start.isoformat(), end=args.end.isoformat(), days=rebuilt)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ Story 13.3: Cost Repository and Budget Monitor
 
 Services:
 - BudgetMonitor: Threshold checking with OTEL metrics and warm-up pattern
+- CostEventBuffer: Group-commit buffering of cost event writes
 """
 
 from platform_cost.services.budget_monitor import (
@@ -11,9 +12,11 @@ from platform_cost.services.budget_monitor import (
     BudgetStatus,
     ThresholdType,
 )
+from platform_cost.services.cost_event_buffer import CostEventBuffer
 
 __all__ = [
     "BudgetMonitor",
     "BudgetStatus",
+    "CostEventBuffer",
     "ThresholdType",
 ]
@@ -12,6 +12,7 @@ Key features:
 - Warm-up from MongoDB on restart (fail-fast if query fails)
 - Runtime threshold updates
 - Per-type cost breakdowns
+- Idempotency keys so redelivered events are not counted twice
 
 OpenTelemetry Metrics (per AC #4):
 - platform_cost_daily_total_usd: Running daily cost
@@ -24,6 +25,7 @@ OpenTelemetry Metrics (per AC #4):
 - platform_cost_events_total: Counter of events processed
 """
 
+from collections import OrderedDict
 from datetime import UTC, date, datetime
 from decimal import Decimal
 from enum import Enum
@@ -43,6 +45,9 @@ logger = structlog.get_logger(__name__)
 # OpenTelemetry meter
 meter = metrics.get_meter("platform_cost.budget_monitor")
 
+# Number of recent idempotency keys remembered for duplicate detection
+IDEMPOTENCY_KEY_CAPACITY = 10_000
+
 
 class ThresholdType(str, Enum):
     """Types of cost thresholds."""
@@ -104,8 +109,8 @@ class BudgetMonitor:
         # Warm up from repository on startup
         await monitor.warm_up_from_repository(cost_repository)
 
-        # After each cost event
-        monitor.record_cost(cost_type="llm", amount_usd=Decimal("0.01"))
+        # After each cost event (the event ID makes redeliveries no-ops)
+        monitor.record_cost(cost_type="llm", amount_usd=Decimal("0.01"), idempotency_key=event.id)
         ```
     """
 
@@ -138,6 +143,9 @@ class BudgetMonitor:
         self._daily_alert_triggered = False
         self._monthly_alert_triggered = False
 
+        # Recently recorded idempotency keys (oldest first)
+        self._recent_keys: OrderedDict[str, None] = OrderedDict()
+
         # Event counter
         self._event_counter = meter.create_counter(
             name="platform_cost_events_total",
@@ -284,6 +292,7 @@ class BudgetMonitor:
         cost_type: str,
         amount_usd: Decimal,
         timestamp: datetime | None = None,
+        idempotency_key: str | None = None,
     ) -> ThresholdType | None:
         """Record a cost and check for threshold breaches.
 
@@ -291,10 +300,20 @@ class BudgetMonitor:
             cost_type: Type of cost (llm, document, embedding, sms).
             amount_usd: Cost amount in USD.
             timestamp: When the cost was incurred. Defaults to now.
+            idempotency_key: Optional key (the cost event ID). A cost whose key
+                was recorded recently is ignored.
 
         Returns:
             ThresholdType if a threshold was exceeded (first time), None otherwise.
         """
+        if idempotency_key is not None:
+            if idempotency_key in self._recent_keys:
+                logger.debug("Duplicate cost ignored", idempotency_key=idempotency_key)
+                return None
+            self._recent_keys[idempotency_key] = None
+            if len(self._recent_keys) > IDEMPOTENCY_KEY_CAPACITY:
+                self._recent_keys.popitem(last=False)
+
         now = timestamp or datetime.now(UTC)
         self._check_reset(now)
 
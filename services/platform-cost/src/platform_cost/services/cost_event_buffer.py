@@ -0,0 +1,164 @@
+"""Group-commit buffer for cost event persistence.
+
+Every LLM call, embedding batch and document page emits a cost event, and
+each used to cost one insert_one round trip. CostEventBuffer sits between
+the DAPR subscription and the repositories: events arriving within a few
+milliseconds (or until the batch is full) are written with a single
+unordered insert_many, then folded into the rollups and the BudgetMonitor.
+Each caller awaits its own event, so the DAPR acknowledgement is only sent
+once the flush that contains the event has been written.
+
+Event IDs double as idempotency keys: redelivered events hit a duplicate
+key on insert and are neither re-counted in the rollups nor in the budget.
+An event whose insert fails for another reason (e.g. validation) fails only
+its own caller; the rest of the flush is stored and counted as usual.
+
+OpenTelemetry Metrics:
+- platform_cost_flush_size: Events per flush
+- platform_cost_flush_latency_ms: Duration of a flush (insert + rollups)
+- platform_cost_duplicate_events_total: Redelivered events skipped
+- platform_cost_failed_events_total: Events whose insert failed
+"""
+
+import time
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import structlog
+from fp_common.events import MicroBatcher
+from opentelemetry import metrics
+from pymongo.errors import WriteError
+
+if TYPE_CHECKING:
+    from platform_cost.domain.cost_event import UnifiedCostEvent
+    from platform_cost.infrastructure.repositories.cost_repository import (
+        UnifiedCostRepository,
+    )
+    from platform_cost.infrastructure.repositories.cost_rollup_repository import (
+        CostRollupRepository,
+    )
+    from platform_cost.services.budget_monitor import BudgetMonitor
+
+logger = structlog.get_logger(__name__)
+meter = metrics.get_meter("platform_cost.cost_event_buffer")
+
+flush_size_histogram = meter.create_histogram(
+    name="platform_cost_flush_size",
+    description="Number of cost events written per group commit",
+    unit="1",
+)
+flush_latency_histogram = meter.create_histogram(
+    name="platform_cost_flush_latency_ms",
+    description="Duration of a cost event group commit",
+    unit="ms",
+)
+duplicate_event_counter = meter.create_counter(
+    name="platform_cost_duplicate_events_total",
+    description="Redelivered cost events skipped by idempotency key",
+    unit="1",
+)
+failed_event_counter = meter.create_counter(
+    name="platform_cost_failed_events_total",
+    description="Cost events whose insert failed (retried by the subscription)",
+    unit="1",
+)
+
+
+class CostEventBuffer(MicroBatcher["UnifiedCostEvent", bool]):
+    """Collects cost events and persists them in group commits.
+
+    Attributes:
+        max_batch_size: Events per flush before it is written immediately.
+        max_wait_seconds: Longest an event waits for its flush.
+        max_pending: Upper bound on events submitted but not yet answered
+            (enforced by the subscriber, which blocks on it).
+    """
+
+    def __init__(
+        self,
+        cost_repository: "UnifiedCostRepository",
+        budget_monitor: "BudgetMonitor",
+        rollup_repository: "CostRollupRepository | None" = None,
+        max_batch_size: int = 200,
+        max_wait_ms: int = 10,
+        max_pending: int = 2_000,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            cost_repository: Repository the events are inserted into.
+            budget_monitor: Monitor updated with newly stored events.
+            rollup_repository: Optional rollups updated with newly stored events.
+            max_batch_size: Flush as soon as this many events are pending.
+            max_wait_ms: Flush a partial batch after this many milliseconds.
+            max_pending: Maximum events in flight across all flushes.
+        """
+        super().__init__(max_batch_size=max_batch_size, max_wait_ms=max_wait_ms, max_pending=max_pending)
+        self._cost_repository = cost_repository
+        self._budget_monitor = budget_monitor
+        self._rollup_repository = rollup_repository
+
+    async def submit(self, event: "UnifiedCostEvent") -> bool:
+        """Queue one event and wait until its flush has been written.
+
+        Args:
+            event: The cost event; its ID is the idempotency key.
+
+        Returns:
+            True if the event was stored, False if it was already stored (redelivery).
+
+        Raises:
+            Exception: The insert error if the flush or this event's insert
+                failed (the event should be retried).
+        """
+        return await super().submit(event)
+
+    async def _process_batch(self, items: list["UnifiedCostEvent"]) -> Sequence[bool | BaseException]:
+        start = time.perf_counter()
+        # The same event redelivered within one batch is written once
+        unique = list({event.id: event for event in items}.values())
+        flush_size_histogram.record(len(unique))
+        result = await self._cost_repository.insert_many(unique)
+
+        errors = {unique[index].id: error for index, error in result.write_errors.items()}
+        stored = [event for event in unique if event.id in result.inserted_ids]
+        if self._rollup_repository is not None and stored:
+            # Events are stored: a rollup failure must not fail (and re-insert) them
+            try:
+                await self._rollup_repository.record_events(stored)
+            except Exception as e:
+                logger.error("Failed to update cost rollups", events=len(stored), error=str(e))
+        for event in stored:
+            self._budget_monitor.record_cost(
+                cost_type=event.cost_type,
+                amount_usd=event.amount_usd,
+                timestamp=event.timestamp,
+                idempotency_key=event.id,
+            )
+        flush_latency_histogram.record((time.perf_counter() - start) * 1000)
+
+        failed = sum(1 for event in items if event.id in errors)
+        duplicates = len(items) - len(stored) - failed
+        if duplicates:
+            duplicate_event_counter.add(duplicates)
+        if failed:
+            failed_event_counter.add(failed)
+        logger.debug(
+            "Cost events flushed",
+            batch_size=len(items),
+            stored=len(stored),
+            duplicates=duplicates,
+            failed=failed,
+        )
+
+        # Only the first occurrence of an ID in the batch reports it as stored
+        outcomes: list[bool | BaseException] = []
+        reported: set[str] = set()
+        for event in items:
+            error = errors.get(event.id)
+            if error is not None:
+                outcomes.append(WriteError(error.get("errmsg", "Cost event insert failed"), error.get("code"), error))
+            else:
+                outcomes.append(event.id in result.inserted_ids and event.id not in reported)
+            reported.add(event.id)
+        return outcomes
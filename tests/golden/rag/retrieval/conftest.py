@@ -168,7 +168,7 @@ def mock_chunk_repository(seed_documents: list[dict[str, Any]]) -> MagicMock:
         seed_documents: The seed documents to use for chunk content.
 
     Returns:
-        Mock RagChunkRepository with get_by_id method.
+        Mock RagChunkRepository with get_by_id and get_by_ids methods.
     """
     from ai_model.domain.rag_document import RagChunk
 
@@ -197,7 +197,11 @@ def mock_chunk_repository(seed_documents: list[dict[str, Any]]) -> MagicMock:
         """Return chunk by ID or None if not found."""
         return chunks.get(chunk_id)
 
+    async def mock_get_by_ids(chunk_ids: list[str]) -> list[RagChunk]:
+        return [chunks[chunk_id] for chunk_id in chunk_ids if chunk_id in chunks]
+
     repo.get_by_id = AsyncMock(side_effect=mock_get_by_id)
+    repo.get_by_ids = AsyncMock(side_effect=mock_get_by_ids)
     return repo
 
 
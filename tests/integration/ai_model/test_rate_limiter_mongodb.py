@@ -0,0 +1,58 @@
+"""Integration tests for the MongoDB rate limit backend.
+
+Several RateLimiter instances stand in for ai-model replicas sharing one
+database.
+
+Prerequisites:
+    docker-compose -f tests/docker-compose.test.yaml up -d
+
+Usage:
+    PYTHONPATH="${PYTHONPATH}:libs/fp-common:libs/fp-proto/src:services/ai-model/src" \
+        pytest tests/integration/ai_model/test_rate_limiter_mongodb.py -m mongodb
+
+Story 0.75.5: OpenRouter LLM Gateway with Cost Observability
+"""
+
+import asyncio
+
+import pytest
+from ai_model.llm.exceptions import RateLimitExceededError
+from ai_model.llm.rate_limiter import RATE_LIMIT_COLLECTION, MongoDBRateLimitBackend, RateLimiter
+
+
+@pytest.mark.mongodb
+@pytest.mark.asyncio
+class TestMongoDBRateLimitBackend:
+    """Tests for buckets shared through MongoDB."""
+
+    async def test_concurrent_replicas_share_budget(self, test_db) -> None:
+        """Test concurrent acquisitions from several replicas never exceed the limit."""
+        replicas = [RateLimiter(rpm=20, tpm=100000, backend=MongoDBRateLimitBackend(test_db)) for _ in range(4)]
+
+        async def _try(limiter: RateLimiter) -> bool:
+            try:
+                return await limiter.acquire_request(wait=False)
+            except RateLimitExceededError:
+                return False
+
+        results = await asyncio.gather(*(_try(replicas[i % 4]) for i in range(40)))
+
+        assert sum(results) == 20
+        document = await test_db[RATE_LIMIT_COLLECTION].find_one({"_id": "rpm"})
+        assert document["tokens"] < 1
+
+    async def test_reservation_settled_in_shared_buckets(self, test_db) -> None:
+        """Test reservations and settlements update the model buckets of every replica."""
+        limits = {"model-a": (100, 1000)}
+        first = RateLimiter(rpm=100, tpm=10000, backend=MongoDBRateLimitBackend(test_db), model_limits=limits)
+        second = RateLimiter(rpm=100, tpm=10000, backend=MongoDBRateLimitBackend(test_db), model_limits=limits)
+
+        reservation = await first.reserve(800, model="model-a")
+        with pytest.raises(RateLimitExceededError):
+            await second.reserve(800, model="model-a", wait=False)
+
+        await first.settle(reservation, 200)
+        await second.reserve(600, model="model-a", wait=False)
+
+        document = await test_db[RATE_LIMIT_COLLECTION].find_one({"_id": "model:model-a:tpm"})
+        assert document["tokens"] == pytest.approx(200, abs=5)
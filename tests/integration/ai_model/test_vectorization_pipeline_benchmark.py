@@ -0,0 +1,156 @@
+"""Throughput benchmark for VectorizationPipeline with stubbed backends.
+
+The embedding service, vector store and chunk repository are stand-ins that
+only sleep for a fixed latency per call, so the benchmark measures how the
+pipeline schedules its calls. It compares the pipelined vectorize_document
+(embed stage ahead of the store stage, one bulk chunk update per batch)
+with the serial strategy it replaced: embed, upsert, then one chunk update
+per chunk, batch after batch.
+
+Usage:
+    PYTHONPATH="${PYTHONPATH}:libs/fp-common:libs/fp-proto/src:services/ai-model/src" \
+        pytest tests/integration/ai_model/test_vectorization_pipeline_benchmark.py -m slow -s
+
+Environment:
+    VECTORIZATION_BENCHMARK_CHUNKS: Chunks in the document (default 2000)
+    VECTORIZATION_BENCHMARK_EMBED_MS: Latency of one embedding call (default 40)
+    VECTORIZATION_BENCHMARK_UPSERT_MS: Latency of one Pinecone upsert (default 30)
+    VECTORIZATION_BENCHMARK_WRITE_MS: Latency of one MongoDB write (default 1)
+"""
+
+import asyncio
+import os
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+from ai_model.config import Settings
+from ai_model.domain.rag_document import (
+    KnowledgeDomain,
+    RagChunk,
+    RagDocument,
+    RAGDocumentMetadata,
+    RagDocumentStatus,
+)
+from ai_model.infrastructure.repositories.rag_document_repository import RagDocumentRepository
+from ai_model.services.vectorization_pipeline import VectorizationPipeline
+
+CHUNKS = int(os.environ.get("VECTORIZATION_BENCHMARK_CHUNKS", "2000"))
+EMBED_S = float(os.environ.get("VECTORIZATION_BENCHMARK_EMBED_MS", "40")) / 1000
+UPSERT_S = float(os.environ.get("VECTORIZATION_BENCHMARK_UPSERT_MS", "30")) / 1000
+WRITE_S = float(os.environ.get("VECTORIZATION_BENCHMARK_WRITE_MS", "1")) / 1000
+
+DIMENSIONS = 1024
+
+
+class StubEmbeddingService:
+    """Embedding service answering after EMBED_S per call."""
+
+    async def embed_passages(self, passages: list[str], request_id: str, knowledge_domain: str) -> list[list[float]]:
+        await asyncio.sleep(EMBED_S)
+        return [[0.1] * DIMENSIONS for _ in passages]
+
+
+class StubVectorStore:
+    """Vector store answering after UPSERT_S per upsert."""
+
+    async def upsert(self, vectors: list, namespace: str) -> None:
+        await asyncio.sleep(UPSERT_S)
+
+
+class StubChunkRepository:
+    """Chunk repository answering after WRITE_S per write."""
+
+    def __init__(self, chunks: list[RagChunk]) -> None:
+        self._chunks = chunks
+        self.writes = 0
+
+    async def get_chunks_without_vectors(self, document_id: str, document_version: int) -> list[RagChunk]:
+        return self._chunks
+
+    async def update_pinecone_id(self, chunk_id: str, pinecone_id: str) -> None:
+        self.writes += 1
+        await asyncio.sleep(WRITE_S)
+
+    async def bulk_update_pinecone_ids(self, pinecone_ids: dict[str, str]) -> int:
+        self.writes += 1
+        await asyncio.sleep(WRITE_S)
+        return len(pinecone_ids)
+
+
+def _document() -> RagDocument:
+    return RagDocument(
+        id="agronomy-manual:v1",
+        document_id="agronomy-manual",
+        version=1,
+        title="Agronomy Manual",
+        domain=KnowledgeDomain.PLANT_DISEASES,
+        content="",
+        status=RagDocumentStatus.ACTIVE,
+        metadata=RAGDocumentMetadata(author="benchmark"),
+    )
+
+
+def _chunks() -> list[RagChunk]:
+    return [
+        RagChunk(
+            chunk_id=f"agronomy-manual-v1-chunk-{i}",
+            document_id="agronomy-manual",
+            document_version=1,
+            chunk_index=i,
+            content=f"Section {i} of the agronomy manual.",
+            word_count=6,
+            char_count=36,
+        )
+        for i in range(CHUNKS)
+    ]
+
+
+async def _serial(pipeline: VectorizationPipeline, chunks: list[RagChunk], document: RagDocument, batch_size: int):
+    """The pre-pipelining strategy: every step of every batch awaited in turn."""
+    namespace = pipeline._generate_namespace(document)
+    for batch_idx, offset in enumerate(range(0, len(chunks), batch_size)):
+        batch = chunks[offset : offset + batch_size]
+        vectors = await pipeline._embed_batch(batch=batch, document=document, job_id="serial", batch_idx=batch_idx)
+        await pipeline._vector_store.upsert(vectors=vectors, namespace=namespace)
+        for chunk, vector in zip(batch, vectors, strict=True):
+            await pipeline._chunk_repo.update_pinecone_id(chunk_id=chunk.chunk_id, pinecone_id=vector.id)
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+@pytest.mark.timeout(600)
+class TestVectorizationPipelineBenchmark:
+    """Chunks per second, serial vs pipelined."""
+
+    async def test_pipelined_throughput(self, monkeypatch) -> None:
+        """Vectorize CHUNKS chunks both ways and check the pipeline is faster."""
+        monkeypatch.setenv("PINECONE_API_KEY", "benchmark")
+        settings = Settings(_env_file=None)
+        document = _document()
+        chunks = _chunks()
+        document_repository = AsyncMock(spec=RagDocumentRepository)
+        document_repository.get_by_version.return_value = document
+
+        report: dict[str, tuple[float, int]] = {}
+        for mode in ("serial", "pipelined"):
+            chunk_repository = StubChunkRepository(chunks)
+            pipeline = VectorizationPipeline(
+                chunk_repository=chunk_repository,
+                document_repository=document_repository,
+                embedding_service=StubEmbeddingService(),
+                vector_store=StubVectorStore(),
+                settings=settings,
+            )
+            began = time.perf_counter()
+            if mode == "serial":
+                await _serial(pipeline, chunks, document, settings.vectorization_batch_size)
+            else:
+                result = await pipeline.vectorize_document("agronomy-manual", 1)
+                assert result.progress.chunks_stored == CHUNKS
+            report[mode] = (time.perf_counter() - began, chunk_repository.writes)
+
+        print(f"\nvectorize_document over {CHUNKS} chunks (batch size {settings.vectorization_batch_size})")
+        for mode, (elapsed, writes) in report.items():
+            print(f"  {mode:<10} {elapsed:7.2f} s  {CHUNKS / elapsed:8.0f} chunks/s  {writes:5d} chunk writes")
+        assert report["pipelined"][0] < report["serial"][0]
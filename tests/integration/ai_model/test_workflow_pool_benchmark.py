@@ -0,0 +1,99 @@
+"""Per-request overhead of WorkflowExecutionService with and without the workflow pool.
+
+Runs extractor executions against a stub LLM gateway (no network), so the
+measured time is the service's own overhead: workflow construction and
+graph compilation when not pooled, state handling and graph traversal in
+both cases. Reports mean and p95 per execution for each mode.
+
+Usage:
+    PYTHONPATH="${PYTHONPATH}:libs/fp-common:libs/fp-proto/src:services/ai-model/src" \\
+        pytest tests/integration/ai_model/test_workflow_pool_benchmark.py -m slow -s
+
+Environment:
+    WORKFLOW_POOL_BENCHMARK_REQUESTS: Executions per mode (default 500)
+"""
+
+import json
+import os
+import statistics
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from ai_model.domain.agent_config import (
+    AgentConfigMetadata,
+    ExtractorConfig,
+    InputConfig,
+    LLMConfig,
+    OutputConfig,
+)
+from ai_model.workflows.execution_service import WorkflowExecutionService
+
+REQUESTS = int(os.environ.get("WORKFLOW_POOL_BENCHMARK_REQUESTS", "500"))
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+@pytest.fixture
+def extractor_config() -> ExtractorConfig:
+    """Minimal extractor configuration."""
+    return ExtractorConfig(
+        id="benchmark-extractor:1.0.0",
+        agent_id="benchmark-extractor",
+        version="1.0.0",
+        description="Benchmark extractor",
+        input=InputConfig(event="benchmark.input", schema={"type": "object"}),
+        output=OutputConfig(event="benchmark.output", schema={"type": "object"}),
+        llm=LLMConfig(model="anthropic/claude-3-haiku"),
+        metadata=AgentConfigMetadata(author="benchmark"),
+        extraction_schema={"type": "object", "properties": {}},
+    )
+
+
+@pytest.fixture
+def llm_gateway() -> MagicMock:
+    """Gateway answering instantly."""
+    gateway = MagicMock()
+    gateway.complete = AsyncMock(
+        return_value={"content": json.dumps({"grade": "primary"}), "model": "stub", "tokens_in": 1, "tokens_out": 1}
+    )
+    return gateway
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+@pytest.mark.timeout(600)
+class TestWorkflowPoolBenchmark:
+    """Execution overhead with and without pooled compiled workflows."""
+
+    async def test_pooled_vs_per_request(self, llm_gateway: MagicMock, extractor_config: ExtractorConfig) -> None:
+        """Time REQUESTS extractor executions per mode; the pool must not be slower."""
+        report: dict[str, list[float]] = {}
+        for mode, pooled in (("per-request", False), ("pooled", True)):
+            service = WorkflowExecutionService(
+                mongodb_uri="mongodb://unused",
+                mongodb_database="unused",
+                llm_gateway=llm_gateway,
+                pool_workflows=pooled,
+            )
+            if pooled:
+                service.warm_workflow_pool()
+            samples: list[float] = []
+            for i in range(REQUESTS):
+                began = time.perf_counter()
+                result = await service.execute_extractor(
+                    agent_id="benchmark-extractor",
+                    agent_config=extractor_config,
+                    input_data={"doc_id": f"doc-{i}"},
+                )
+                samples.append((time.perf_counter() - began) * 1000)
+                assert result["success"]
+            report[mode] = samples
+
+        print(f"\nWorkflowExecutionService extractor overhead ({REQUESTS} executions per mode)")
+        for mode, samples in report.items():
+            print(f"  {mode:<12} mean={statistics.mean(samples):7.3f} ms  p95={_percentile(samples, 0.95):7.3f} ms")
+        assert statistics.mean(report["pooled"]) <= statistics.mean(report["per-request"])
@@ -0,0 +1,126 @@
+"""Latency benchmark for collection-mcp search_documents with real MongoDB.
+
+Seeds a documents collection (1M documents by default), builds the managed
+text index the way collection-model does (DocumentRepository.ensure_indexes
+with storage.search_fields), then times search_documents queries - text
+only, with a source filter and with a farmer filter - and reports p50/p95.
+
+Prerequisites:
+    docker-compose -f tests/docker-compose.test.yaml up -d
+
+Usage:
+    PYTHONPATH="${PYTHONPATH}:libs/fp-common:libs/fp-proto/src:services/collection-model/src:mcp-servers/collection-mcp/src" \
+        pytest tests/integration/test_document_search_benchmark.py -m mongodb -s
+
+Environment:
+    SEARCH_BENCHMARK_DOCUMENTS: Documents to seed (default 1000000)
+    SEARCH_BENCHMARK_QUERIES: Timed queries per query shape (default 200)
+    SEARCH_BENCHMARK_P95_MS: p95 budget asserted per query shape (default 250)
+"""
+
+import os
+import random
+import statistics
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from collection_mcp.infrastructure.document_client import DocumentClient
+from collection_model.infrastructure.document_repository import DocumentRepository
+
+from tests.conftest_integration import MONGODB_TEST_URI
+
+DOCUMENTS = int(os.environ.get("SEARCH_BENCHMARK_DOCUMENTS", "1000000"))
+QUERIES = int(os.environ.get("SEARCH_BENCHMARK_QUERIES", "200"))
+P95_BUDGET_MS = float(os.environ.get("SEARCH_BENCHMARK_P95_MS", "250"))
+
+BATCH_SIZE = 10_000
+FARMERS = 20_000
+SOURCES = ["qc-analyzer-result", "qc-analyzer-exceptions", "market-prices"]
+VOCABULARY = [f"term{i:03d}" for i in range(300)]
+SEARCH_FIELDS = {"defect_notes": 10, "grade": 2}
+
+
+def _document(i: int, rng: random.Random, start: datetime) -> dict:
+    farmer_id = f"WM-{rng.randrange(FARMERS):05d}"
+    created_at = start + timedelta(seconds=i)
+    return {
+        "document_id": f"doc-{i:08d}",
+        "raw_document": {
+            "blob_container": "raw",
+            "blob_path": f"raw/{i}.json",
+            "content_hash": f"{i:064x}",
+            "size_bytes": 1024,
+            "stored_at": created_at,
+        },
+        "extraction": {
+            "ai_agent_id": "benchmark",
+            "extraction_timestamp": created_at,
+            "confidence": 0.9,
+            "validation_passed": True,
+        },
+        "ingestion": {
+            "ingestion_id": f"ing-{i}",
+            "source_id": SOURCES[i % len(SOURCES)],
+            "received_at": created_at,
+            "processed_at": created_at,
+        },
+        "extracted_fields": {
+            "farmer_id": farmer_id,
+            "defect_notes": " ".join(rng.sample(VOCABULARY, 4)),
+            "grade": rng.choice(["primary", "secondary", "rejected"]),
+        },
+        "linkage_fields": {"farmer_id": farmer_id},
+        "created_at": created_at,
+    }
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+@pytest.mark.mongodb
+@pytest.mark.slow
+@pytest.mark.asyncio
+@pytest.mark.timeout(7200)
+class TestDocumentSearchBenchmark:
+    """p95 latency of search_documents at scale."""
+
+    async def test_search_p95_latency(self, test_db) -> None:
+        """Seed DOCUMENTS documents and check p95 of each query shape against the budget."""
+        rng = random.Random(42)
+        collection = test_db[DocumentClient.DEFAULT_COLLECTION]
+        start = datetime(2025, 1, 1, tzinfo=UTC)
+        for offset in range(0, DOCUMENTS, BATCH_SIZE):
+            batch = [_document(i, rng, start) for i in range(offset, min(offset + BATCH_SIZE, DOCUMENTS))]
+            await collection.insert_many(batch, ordered=False)
+
+        repository = DocumentRepository(test_db)
+        await repository.ensure_indexes(DocumentClient.DEFAULT_COLLECTION, "farmer_id", SEARCH_FIELDS)
+
+        client = DocumentClient(mongodb_uri=MONGODB_TEST_URI, database_name=test_db.name)
+        shapes = {
+            "text": lambda: {},
+            "text+source": lambda: {"source_ids": [rng.choice(SOURCES)]},
+            "text+farmer": lambda: {"farmer_id": f"WM-{rng.randrange(FARMERS):05d}"},
+        }
+        report: dict[str, tuple[float, float]] = {}
+        try:
+            for shape, filters in shapes.items():
+                samples: list[float] = []
+                for _ in range(QUERIES):
+                    query_text = " ".join(rng.sample(VOCABULARY, 2))
+                    began = time.perf_counter()
+                    results = await client.search_documents(query_text=query_text, limit=20, **filters())
+                    samples.append((time.perf_counter() - began) * 1000)
+                    assert all(r.relevance_score > 0 for r in results)
+                report[shape] = (statistics.median(samples), _percentile(samples, 0.95))
+        finally:
+            await client.close()
+
+        print(f"\nsearch_documents over {DOCUMENTS} documents ({QUERIES} queries per shape)")
+        for shape, (p50, p95) in report.items():
+            print(f"  {shape:<12} p50={p50:8.1f} ms  p95={p95:8.1f} ms")
+        for shape, (_, p95) in report.items():
+            assert p95 <= P95_BUDGET_MS, f"{shape} p95 {p95:.1f} ms exceeds {P95_BUDGET_MS} ms"
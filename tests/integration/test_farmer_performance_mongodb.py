@@ -11,6 +11,8 @@ Usage:
         pytest tests/integration/test_farmer_performance_mongodb.py -v
 """
 
+import asyncio
+import datetime as dt
 from datetime import UTC, datetime
 
 import pytest
@@ -22,6 +24,7 @@ from plantation_model.domain.models import (
     TrendDirection,
 )
 from plantation_model.infrastructure.repositories.farmer_performance_repository import (
+    DeliveryIncrement,
     FarmerPerformanceRepository,
 )
 
@@ -331,6 +334,58 @@ class TestFarmerPerformanceRepository:
         assert result.today.attribute_counts["leaf_type"]["one_leaf_bud"] == 10
         assert result.today.attribute_counts["banji_hardness"]["soft"] == 2
 
+    async def test_concurrent_deliveries_across_rollover(self, test_db) -> None:
+        """Test parallel deliveries on a past-day record roll over exactly once.
+
+        Every update resets and increments in one server-side step, so no
+        delivery is lost to a concurrent reset and exactly one caller gets
+        the closed day back.
+        """
+        repo = FarmerPerformanceRepository(test_db)
+        today = dt.date.today()
+        await repo.create(
+            FarmerPerformance(
+                farmer_id="WM-0014",
+                grading_model_id="tbk_kenya_tea_v1",
+                grading_model_version="1.0.0",
+                farm_size_hectares=1.5,
+                farm_scale=FarmScale.MEDIUM,
+                today=TodayMetrics(
+                    deliveries=7,
+                    total_kg=70.0,
+                    grade_counts={"Primary": 7},
+                    metrics_date=today - dt.timedelta(days=1),
+                ),
+            )
+        )
+
+        increments = []
+        for _ in range(20):
+            increment = DeliveryIncrement(farmer_id="WM-0014")
+            increment.add(2.0, "Secondary")
+            increments.append(increment)
+        updates = await asyncio.gather(*(repo.apply_delivery(increment, today=today) for increment in increments))
+
+        rollovers = [update for update in updates if update.rolled_over]
+        assert len(rollovers) == 1
+        assert rollovers[0].previous.today.deliveries == 7
+        assert rollovers[0].previous.today.grade_counts == {"Primary": 7}
+
+        stored = await repo.get_by_farmer_id("WM-0014")
+        assert stored.today.metrics_date == today
+        assert stored.today.deliveries == 20
+        assert stored.today.total_kg == 40.0
+        assert stored.today.grade_counts == {"Secondary": 20}
+
+        # A replica still on yesterday does not reset the new day
+        late = DeliveryIncrement(farmer_id="WM-0014")
+        late.add(1.0, "Secondary")
+        update = await repo.apply_delivery(late, today=today - dt.timedelta(days=1))
+        assert not update.rolled_over
+        assert update.previous.today.deliveries == 20
+        stored = await repo.get_by_farmer_id("WM-0014")
+        assert stored.today.deliveries == 21
+
     async def test_reset_today_metrics(self, test_db) -> None:
         """Test resetting today's metrics for new day."""
         repo = FarmerPerformanceRepository(test_db)
@@ -0,0 +1,170 @@
+"""Unit tests for CostReconciler and deferred cost publishing in LLMGateway.
+
+Tests:
+- Stats resolved after retries published with the same request_id
+- Generations never available published with provisional figures
+- Batches bounded by batch_size / max_concurrency
+- Pending generations drained on close
+- LLMGateway.complete not waiting for generation stats
+"""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from ai_model.llm.cost_reconciler import CostReconciler, PendingCost
+from ai_model.llm.gateway import GenerationStats, LLMGateway
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+FAST_DELAYS = (0.001, 0.001, 0.001)
+
+
+def _pending(generation_id: str = "gen-1", request_id: str = "req-1") -> PendingCost:
+    return PendingCost(
+        generation_id=generation_id,
+        request_id=request_id,
+        model="test-model",
+        agent_type="extractor",
+        agent_id="agent-1",
+        factory_id=None,
+        tokens_in=10,
+        tokens_out=5,
+        cost_usd=Decimal("0.001"),
+    )
+
+
+def _stats(generation_id: str) -> GenerationStats:
+    return GenerationStats(
+        generation_id=generation_id,
+        native_tokens_prompt=12,
+        native_tokens_completion=6,
+        total_cost=Decimal("0.0012"),
+        model="test-model",
+    )
+
+
+class TestCostReconciler:
+    """Tests for the background reconciliation worker."""
+
+    @pytest.mark.asyncio
+    async def test_stats_resolved_after_retries(self) -> None:
+        """Test a generation unavailable at first is published once its stats appear."""
+        fetch = AsyncMock(side_effect=[None, None, _stats("gen-1")])
+        publish = AsyncMock()
+        reconciler = CostReconciler(fetch, publish, retry_delays_s=FAST_DELAYS)
+
+        reconciler.submit(_pending())
+        await asyncio.wait_for(reconciler._worker, timeout=1)
+
+        assert fetch.await_count == 3
+        pending, stats = publish.call_args.args
+        assert pending.request_id == "req-1"
+        assert stats.total_cost == Decimal("0.0012")
+        assert (reconciler.reconciled, reconciler.unreconciled, reconciler.pending) == (1, 0, 0)
+
+    @pytest.mark.asyncio
+    async def test_never_available_published_provisionally(self) -> None:
+        """Test a generation still unavailable after every retry is published without stats."""
+        fetch = AsyncMock(side_effect=[None, RuntimeError("boom"), None])
+        publish = AsyncMock()
+        reconciler = CostReconciler(fetch, publish, retry_delays_s=FAST_DELAYS)
+
+        reconciler.submit(_pending())
+        await asyncio.wait_for(reconciler._worker, timeout=1)
+
+        publish.assert_awaited_once()
+        assert publish.call_args.args[1] is None
+        assert reconciler.unreconciled == 1
+
+    @pytest.mark.asyncio
+    async def test_lookups_bounded_by_concurrency(self) -> None:
+        """Test no more than max_concurrency lookups run at once."""
+        in_flight = peak = 0
+
+        async def _fetch(generation_id: str) -> GenerationStats:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return _stats(generation_id)
+
+        publish = AsyncMock()
+        reconciler = CostReconciler(_fetch, publish, retry_delays_s=FAST_DELAYS, batch_size=10, max_concurrency=3)
+
+        for i in range(25):
+            reconciler.submit(_pending(f"gen-{i}", f"req-{i}"))
+        await asyncio.wait_for(reconciler._worker, timeout=1)
+
+        assert publish.await_count == 25
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_close_drains_pending(self) -> None:
+        """Test close looks up pending generations once and publishes all of them."""
+        fetch = AsyncMock(side_effect=lambda generation_id: _stats(generation_id) if generation_id == "gen-1" else None)
+        publish = AsyncMock()
+        reconciler = CostReconciler(fetch, publish, retry_delays_s=(60.0,))
+
+        reconciler.submit(_pending("gen-1", "req-1"))
+        reconciler.submit(_pending("gen-2", "req-2"))
+        await reconciler.close()
+
+        published = {call.args[0].request_id: call.args[1] for call in publish.call_args_list}
+        assert published["req-1"] is not None
+        assert published["req-2"] is None
+
+    @pytest.mark.asyncio
+    async def test_backlog_full_published_provisionally(self) -> None:
+        """Test generations beyond max_pending are not queued."""
+        publish = AsyncMock()
+        reconciler = CostReconciler(AsyncMock(return_value=None), publish, retry_delays_s=(60.0,), max_pending=1)
+
+        reconciler.submit(_pending("gen-1", "req-1"))
+        reconciler.submit(_pending("gen-2", "req-2"))
+        await asyncio.sleep(0)
+
+        assert reconciler.pending == 1
+        assert publish.call_args.args[0].request_id == "req-2"
+        await reconciler.close(timeout_s=0.1)
+
+
+class TestGatewayDeferredCost:
+    """Tests for LLMGateway publishing costs through the reconciler."""
+
+    @pytest.mark.asyncio
+    async def test_complete_returns_before_stats(self) -> None:
+        """Test complete returns usage figures and the cost event follows with the same request_id."""
+        dapr_client = MagicMock()
+        dapr_client.publish_event = AsyncMock()
+        gateway = LLMGateway(api_key="test-key", dapr_client=dapr_client)
+        gateway._cost_reconciler._retry_delays_s = FAST_DELAYS
+        generation = ChatGeneration(
+            message=AIMessage(content="ok"),
+            text="ok",
+            generation_info={"id": "gen-1", "usage": {"prompt_tokens": 10, "completion_tokens": 5, "cost": 0.001}},
+        )
+        chat_client = AsyncMock()
+        chat_client.agenerate = AsyncMock(return_value=LLMResult(generations=[[generation]]))
+        fetch = AsyncMock(return_value=_stats("gen-1"))
+
+        with (
+            patch.object(gateway, "_create_chat_client", return_value=chat_client),
+            patch.object(gateway._cost_reconciler, "_fetch_stats", fetch),
+        ):
+            result = await gateway.complete(messages=[HumanMessage(content="hi")], request_id="req-1")
+
+            assert result["cost_usd"] == Decimal("0.001")
+            assert result["tokens_in"] == 10
+            fetch.assert_not_called()
+            dapr_client.publish_event.assert_not_called()
+
+            await asyncio.wait_for(gateway._cost_reconciler._worker, timeout=1)
+
+        event_json = dapr_client.publish_event.call_args.kwargs["data"]
+        assert '"request_id":"req-1"' in event_json
+        assert '"amount_usd":"0.0012"' in event_json
+        assert '"cost_reconciled":true' in event_json
+        await gateway.close()
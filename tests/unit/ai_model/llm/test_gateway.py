@@ -15,7 +15,7 @@ from ai_model.llm.exceptions import (
     RateLimitExceededError,
 )
 from ai_model.llm.gateway import DEFAULT_RETRY_MAX_ATTEMPTS, GenerationStats, LLMGateway
-from ai_model.llm.rate_limiter import RateLimiter
+from ai_model.llm.rate_limiter import RateLimiter, RateLimitReservation
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.outputs import ChatGeneration, LLMResult
 
@@ -228,8 +228,9 @@ class TestLLMGatewayComplete:
     ) -> None:
         """Test completion respects rate limiter."""
         mock_rate_limiter = AsyncMock(spec=RateLimiter)
-        mock_rate_limiter.acquire_request = AsyncMock(return_value=True)
-        mock_rate_limiter.acquire_tokens = AsyncMock(return_value=True)
+        reservation = RateLimitReservation()
+        mock_rate_limiter.reserve = AsyncMock(return_value=reservation)
+        mock_rate_limiter.settle = AsyncMock()
 
         gateway = LLMGateway(
             api_key="test-key",
@@ -240,9 +241,45 @@ class TestLLMGatewayComplete:
         mock_chat_client.agenerate = AsyncMock(return_value=mock_llm_result)
 
         with patch.object(gateway, "_create_chat_client", return_value=mock_chat_client):
+            result = await gateway.complete(
+                messages=sample_messages,
+                model="test-model",
+                agent_type="extractor",
+                max_tokens=500,
+            )
+
+        mock_rate_limiter.reserve.assert_called_once()
+        estimated_tokens = mock_rate_limiter.reserve.call_args.args[0]
+        assert estimated_tokens > 500
+        assert mock_rate_limiter.reserve.call_args.kwargs == {"model": "test-model", "agent_type": "extractor"}
+        mock_rate_limiter.settle.assert_awaited_once_with(reservation, result["tokens_in"] + result["tokens_out"])
+
+    @pytest.mark.asyncio
+    async def test_complete_failure_releases_reservation(
+        self,
+        sample_messages: list[HumanMessage],
+    ) -> None:
+        """Test a failed model attempt settles its reservation with no tokens used."""
+        mock_rate_limiter = AsyncMock(spec=RateLimiter)
+        reservation = RateLimitReservation()
+        mock_rate_limiter.reserve = AsyncMock(return_value=reservation)
+        mock_rate_limiter.settle = AsyncMock()
+
+        gateway = LLMGateway(
+            api_key="test-key",
+            rate_limiter=mock_rate_limiter,
+        )
+
+        mock_chat_client = AsyncMock()
+        mock_chat_client.agenerate = AsyncMock(side_effect=Exception("model not found"))
+
+        with (
+            patch.object(gateway, "_create_chat_client", return_value=mock_chat_client),
+            pytest.raises(AllModelsUnavailableError),
+        ):
             await gateway.complete(messages=sample_messages, model="test-model")
 
-        mock_rate_limiter.acquire_request.assert_called_once()
+        mock_rate_limiter.settle.assert_awaited_once_with(reservation, 0)
 
     @pytest.mark.asyncio
     async def test_complete_rate_limit_exceeded(
@@ -251,7 +288,7 @@ class TestLLMGatewayComplete:
     ) -> None:
         """Test completion fails when rate limit exceeded."""
         mock_rate_limiter = AsyncMock(spec=RateLimiter)
-        mock_rate_limiter.acquire_request = AsyncMock(
+        mock_rate_limiter.reserve = AsyncMock(
             side_effect=RateLimitExceededError(
                 "Rate limit exceeded",
                 limit_type="rpm",
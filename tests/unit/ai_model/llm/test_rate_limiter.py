@@ -8,7 +8,33 @@ import time
 
 import pytest
 from ai_model.llm.exceptions import RateLimitExceededError
-from ai_model.llm.rate_limiter import RateLimiter, TokenBucket
+from ai_model.llm.rate_limiter import RateLimiter, SharedRateLimitBackend, TokenBucket
+
+
+class LocalSharedBackend(SharedRateLimitBackend):
+    """In-memory stand-in for the shared store (same semantics as MongoDB)."""
+
+    def __init__(self) -> None:
+        self.buckets: dict[str, tuple[float, float]] = {}
+        self.takes = 0
+
+    def _refilled(self, name: str, capacity: int, refill_rate: float) -> float:
+        tokens, updated_at = self.buckets.get(name, (capacity, time.monotonic()))
+        return min(capacity, tokens + (time.monotonic() - updated_at) * refill_rate)
+
+    async def take(self, name: str, capacity: int, refill_rate: float, tokens: float) -> tuple[bool, float]:
+        self.takes += 1
+        available = self._refilled(name, capacity, refill_rate)
+        granted = available >= tokens
+        if granted:
+            available -= tokens
+        self.buckets[name] = (available, time.monotonic())
+        return granted, available
+
+    async def give(self, name: str, capacity: int, refill_rate: float, tokens: float) -> float:
+        available = min(capacity, self._refilled(name, capacity, refill_rate) + tokens)
+        self.buckets[name] = (available, time.monotonic())
+        return available
 
 
 class TestTokenBucket:
@@ -91,6 +117,64 @@ class TestTokenBucket:
         result = await bucket.acquire(tokens=3, wait=False)
         assert result is True
 
+    @pytest.mark.asyncio
+    async def test_waiters_served_in_order(self) -> None:
+        """Test queued acquisitions are granted FIFO, even when a later one is smaller."""
+        bucket = TokenBucket(capacity=5, refill_rate=100.0, name="fifo")
+        await bucket.acquire(tokens=5)
+        order: list[str] = []
+
+        async def _acquire(label: str, tokens: int) -> None:
+            await bucket.acquire(tokens=tokens)
+            order.append(label)
+
+        await asyncio.gather(_acquire("large", 4), _acquire("small", 1), _acquire("medium", 2))
+
+        assert order == ["large", "small", "medium"]
+
+    @pytest.mark.asyncio
+    async def test_waiter_woken_when_refilled(self) -> None:
+        """Test a waiter is woken by a single timer when the refill covers it."""
+        bucket = TokenBucket(capacity=10, refill_rate=20.0, name="timer")
+        await bucket.acquire(tokens=10)
+
+        start = time.monotonic()
+        await bucket.acquire(tokens=2)  # 100ms of refill
+
+        assert 0.09 <= time.monotonic() - start < 0.2
+        assert bucket._timer is None
+        assert not bucket._waiters
+
+    @pytest.mark.asyncio
+    async def test_timed_out_waiter_leaves_queue(self) -> None:
+        """Test a timed out waiter does not hold back the waiters behind it."""
+        bucket = TokenBucket(capacity=10, refill_rate=10.0, name="timeout")
+        await bucket.acquire(tokens=10)
+
+        blocked = asyncio.ensure_future(bucket.acquire(tokens=10, timeout_seconds=0.05))
+        quick = asyncio.ensure_future(bucket.acquire(tokens=1))
+
+        with pytest.raises(RateLimitExceededError):
+            await blocked
+        assert await asyncio.wait_for(quick, timeout=0.5) is True
+
+    @pytest.mark.asyncio
+    async def test_acquire_above_capacity_raises(self, bucket: TokenBucket) -> None:
+        """Test a request larger than the bucket fails instead of waiting forever."""
+        with pytest.raises(RateLimitExceededError):
+            await bucket.acquire(tokens=11)
+
+    @pytest.mark.asyncio
+    async def test_adjust_returns_and_takes_tokens(self, bucket: TokenBucket) -> None:
+        """Test adjust gives back tokens up to capacity and can take tokens into debt."""
+        await bucket.acquire(tokens=4)
+        await bucket.adjust(100)
+        assert bucket.available_tokens == 10
+
+        await bucket.adjust(-15)
+        with pytest.raises(RateLimitExceededError):
+            await bucket.acquire(tokens=1, wait=False)
+
 
 class TestRateLimiter:
     """Tests for RateLimiter class."""
@@ -178,3 +262,83 @@ class TestRateLimiter:
         """Test rpm_limit and tpm_limit properties."""
         assert rate_limiter.rpm_limit == 60
         assert rate_limiter.tpm_limit == 1000
+
+    @pytest.mark.asyncio
+    async def test_reserve_applies_model_and_agent_type_limits(self) -> None:
+        """Test a reservation takes from the global, model and agent type buckets."""
+        limiter = RateLimiter(
+            rpm=100,
+            tpm=10000,
+            model_limits={"model-a": (2, 1000)},
+            agent_type_limits={"extractor": (100, 500)},
+        )
+
+        await limiter.reserve(400, model="model-a", agent_type="extractor")
+
+        status = limiter.get_status()
+        assert status["tpm_available"] == pytest.approx(9600, abs=1)
+        assert status["model:model-a:tpm_available"] == pytest.approx(600, abs=1)
+        assert status["agent_type:extractor:tpm_available"] == pytest.approx(100, abs=1)
+
+        # Agent type budget exhausted, other agent types unaffected
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            await limiter.reserve(400, model="model-a", agent_type="extractor", wait=False)
+        assert exc_info.value.limit_type == "agent_type:extractor:tpm"
+        await limiter.reserve(400, model="model-b", agent_type="explorer", wait=False)
+
+    @pytest.mark.asyncio
+    async def test_failed_reservation_gives_back_tokens(self) -> None:
+        """Test buckets acquired before a failing one are given back."""
+        limiter = RateLimiter(rpm=100, tpm=10000, model_limits={"model-a": (1, 1000)})
+        await limiter.reserve(100, model="model-a")
+
+        with pytest.raises(RateLimitExceededError):
+            await limiter.reserve(100, model="model-a", wait=False)
+
+        status = limiter.get_status()
+        assert status["rpm_available"] == pytest.approx(99, abs=0.1)
+        assert status["tpm_available"] == pytest.approx(9900, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_settle_returns_unused_and_charges_overrun(self) -> None:
+        """Test settle gives back unused reserved tokens and takes the overrun."""
+        limiter = RateLimiter(rpm=100, tpm=1000)
+
+        reservation = await limiter.reserve(600)
+        await limiter.settle(reservation, 100)
+        await limiter.settle(reservation, 100)  # No effect
+        assert limiter.get_status()["tpm_available"] == pytest.approx(900, abs=1)
+
+        reservation = await limiter.reserve(0)
+        await limiter.settle(reservation, 300)
+        assert limiter.get_status()["tpm_available"] == pytest.approx(600, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_shared_backend_limits_all_replicas(self) -> None:
+        """Test limiters on a shared backend share one budget."""
+        backend = LocalSharedBackend()
+        replicas = [RateLimiter(rpm=3, tpm=1000, backend=backend) for _ in range(2)]
+
+        await replicas[0].acquire_request()
+        await replicas[1].acquire_request()
+        await replicas[0].acquire_request()
+
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            await replicas[1].acquire_request(wait=False)
+        assert exc_info.value.limit_type == "rpm"
+
+    @pytest.mark.asyncio
+    async def test_shared_bucket_waits_for_refill(self) -> None:
+        """Test a shared bucket sleeps until the refill covers it instead of polling."""
+        backend = LocalSharedBackend()
+        bucket = backend.bucket("tpm", capacity=10, refill_rate=50.0)
+        await bucket.acquire(tokens=10)
+
+        start = time.monotonic()
+        await asyncio.gather(bucket.acquire(tokens=2), bucket.acquire(tokens=2))
+
+        assert time.monotonic() - start >= 0.07
+        assert backend.takes <= 5
+
+        with pytest.raises(RateLimitExceededError):
+            await bucket.acquire(tokens=10, timeout_seconds=0.01)
@@ -302,6 +302,33 @@ class TestGetTool:
             integration.get_tool("unknown-server", "some_tool")
 
 
+class TestGetClient:
+    """Tests for get_client method."""
+
+    def test_get_client_returns_registry_client(
+        self, mock_registry: MagicMock, sample_extractor_config: ExtractorConfig
+    ) -> None:
+        """Clients come from the registry so they share its pool and result cache."""
+        mock_client = MagicMock()
+        mock_registry.get_client = MagicMock(return_value=mock_client)
+
+        integration = McpIntegration(registry=mock_registry)
+        integration.register_from_agent_configs([sample_extractor_config])
+
+        assert integration.get_client("collection") is mock_client
+        mock_registry.get_client.assert_called_once_with("collection-mcp")
+
+    def test_get_client_registers_unknown_server(self, mock_registry: MagicMock) -> None:
+        """A server not named by any agent config is registered on demand."""
+        mock_registry.get_client = MagicMock()
+
+        integration = McpIntegration(registry=mock_registry)
+        integration.get_client("collection")
+
+        mock_registry.register_server.assert_called_once_with("collection-mcp")
+        assert integration.server_status["collection-mcp"] == ServerStatus.REGISTERED
+
+
 # =============================================================================
 # ERROR HANDLING TESTS (2 tests)
 # =============================================================================
@@ -3,6 +3,9 @@
 import os
 from unittest.mock import patch
 
+import pytest
+from pydantic import ValidationError
+
 
 class TestSettings:
     """Tests for AI Model Settings configuration."""
@@ -88,3 +91,21 @@ class TestSettings:
         assert settings.otel_exporter_endpoint == "http://localhost:4317"
         assert settings.otel_exporter_insecure is True
         assert settings.otel_service_namespace == "farmer-power"
+
+    def test_rate_limit_backend_accepts_known_values(self) -> None:
+        """Rate limit backend defaults to memory and accepts mongodb."""
+        from ai_model.config import Settings
+
+        assert Settings().llm_rate_limit_backend == "memory"
+        with patch.dict(os.environ, {"AI_MODEL_LLM_RATE_LIMIT_BACKEND": "mongodb"}, clear=False):
+            assert Settings().llm_rate_limit_backend == "mongodb"
+
+    def test_rate_limit_backend_rejects_typos(self) -> None:
+        """A misspelled backend fails at startup instead of silently using memory."""
+        from ai_model.config import Settings
+
+        with (
+            patch.dict(os.environ, {"AI_MODEL_LLM_RATE_LIMIT_BACKEND": "mongo"}, clear=False),
+            pytest.raises(ValidationError),
+        ):
+            Settings()
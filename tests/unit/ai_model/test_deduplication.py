@@ -0,0 +1,124 @@
+"""Unit tests for prefix-signature deduplication.
+
+Tests cover:
+1. Equivalence with the exact pairwise Jaccard path
+2. Threshold edge cases (1.0, >1.0, empty content)
+3. Micro-benchmark at 50/200/1000 candidates (marked slow)
+"""
+
+import random
+import time
+
+import pytest
+from ai_model.domain.ranking import RankedMatch
+from ai_model.services.deduplication import deduplicate_matches, deduplicate_matches_exact
+
+VOCABULARY = [f"word{i}" for i in range(2000)]
+
+
+def _match(index: int, content: str) -> RankedMatch:
+    return RankedMatch(
+        chunk_id=f"c{index}",
+        content=content,
+        score=0.5,
+        rerank_score=1.0 - index / 10_000,
+        document_id=f"d{index}",
+        title="Test",
+        domain="test",
+    )
+
+
+def _candidates(count: int, seed: int) -> list[RankedMatch]:
+    """Build ranked candidates where roughly a third are near-duplicates of earlier ones."""
+    rng = random.Random(seed)
+    texts: list[str] = []
+    for _ in range(count):
+        if texts and rng.random() < 0.35:
+            words = rng.choice(texts).split()
+            # Mutate a few words so similarity straddles common thresholds
+            for _ in range(rng.randint(0, 4)):
+                words[rng.randrange(len(words))] = rng.choice(VOCABULARY).upper()
+            texts.append(" ".join(words))
+        else:
+            texts.append(" ".join(rng.choices(VOCABULARY, k=rng.randint(20, 120))))
+    return [_match(i, text) for i, text in enumerate(texts)]
+
+
+class TestEquivalenceWithExact:
+    """deduplicate_matches must return exactly what the pairwise scan returns."""
+
+    @pytest.mark.parametrize("threshold", [0.3, 0.5, 0.7, 0.8, 0.9, 0.95, 1.0])
+    @pytest.mark.parametrize("seed", range(5))
+    def test_same_result_as_exact(self, threshold: float, seed: int) -> None:
+        """Test kept matches, order and removed count match the exact path."""
+        matches = _candidates(120, seed)
+
+        fast, fast_removed = deduplicate_matches(matches, threshold=threshold)
+        exact, exact_removed = deduplicate_matches_exact(matches, threshold=threshold)
+
+        assert [m.chunk_id for m in fast] == [m.chunk_id for m in exact]
+        assert fast_removed == exact_removed
+
+    def test_case_insensitive_like_exact(self) -> None:
+        """Test tokens are lowercased the same way as the exact path."""
+        matches = [_match(0, "Blister Blight on TEA"), _match(1, "blister blight on tea")]
+
+        result, removed = deduplicate_matches(matches, threshold=0.9)
+
+        assert [m.chunk_id for m in result] == ["c0"]
+        assert removed == 1
+
+
+class TestThresholdEdgeCases:
+    """Test boundary thresholds and degenerate content."""
+
+    def test_threshold_above_one_keeps_everything(self) -> None:
+        """Test identical matches survive when the threshold is unreachable."""
+        matches = [_match(0, "same text"), _match(1, "same text")]
+
+        result, removed = deduplicate_matches(matches, threshold=1.5)
+
+        assert len(result) == 2
+        assert removed == 0
+
+    def test_threshold_one_removes_only_identical_sets(self) -> None:
+        """Test threshold 1.0 removes identical token sets only."""
+        matches = [_match(0, "a b c"), _match(1, "c b a"), _match(2, "a b c d")]
+
+        result, removed = deduplicate_matches(matches, threshold=1.0)
+
+        assert [m.chunk_id for m in result] == ["c0", "c2"]
+        assert removed == 1
+
+    def test_whitespace_content_never_duplicate(self) -> None:
+        """Test content with no tokens is never treated as a duplicate."""
+        matches = [_match(0, "   "), _match(1, "   ")]
+
+        result, removed = deduplicate_matches(matches, threshold=0.5)
+
+        assert len(result) == 2
+        assert removed == 0
+
+
+@pytest.mark.slow
+class TestDeduplicationBenchmark:
+    """Micro-benchmark against the pairwise path (run with -m slow, -s for timings)."""
+
+    @pytest.mark.parametrize("count", [50, 200, 1000])
+    def test_benchmark(self, count: int) -> None:
+        """Time both paths on the same candidates and check they agree."""
+        matches = _candidates(count, seed=count)
+
+        start = time.perf_counter()
+        fast, _ = deduplicate_matches(matches, threshold=0.9)
+        fast_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        exact, _ = deduplicate_matches_exact(matches, threshold=0.9)
+        exact_elapsed = time.perf_counter() - start
+
+        print(
+            f"\ndedup n={count}: signatures {fast_elapsed * 1000:.2f} ms, "
+            f"exact {exact_elapsed * 1000:.2f} ms, kept {len(fast)}"
+        )
+        assert [m.chunk_id for m in fast] == [m.chunk_id for m in exact]
@@ -0,0 +1,206 @@
+"""Unit tests for the content-addressed embedding cache.
+
+Tests cover:
+- Cache key normalization
+- In-process LRU tier
+- MongoDB tier (EmbeddingCacheRepository)
+- Repository errors treated as misses
+- Hit rate
+
+Story 0.75.12: RAG Embedding Configuration (Pinecone Inference)
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from ai_model.domain.embedding import CachedEmbedding
+from ai_model.infrastructure.repositories.embedding_cache_repository import EmbeddingCacheRepository
+from ai_model.services.embedding_cache import EmbeddingCache, embedding_cache_key
+
+
+def _entry(value: float, tokens: int = 10) -> CachedEmbedding:
+    return CachedEmbedding(values=[value] * 4, tokens=tokens)
+
+
+@pytest.fixture
+def mock_repository():
+    """Create a mock EmbeddingCacheRepository."""
+    repository = MagicMock(spec=EmbeddingCacheRepository)
+    repository.get_many = AsyncMock(return_value={})
+    repository.put_many = AsyncMock()
+    return repository
+
+
+class TestEmbeddingCacheKey:
+    """Tests for embedding_cache_key."""
+
+    def test_whitespace_normalized(self):
+        """Test texts differing only in whitespace share a key."""
+        assert embedding_cache_key("m", "passage", "Tea  leaves\n rust ") == embedding_cache_key(
+            "m", "passage", "Tea leaves rust"
+        )
+
+    def test_model_and_input_type_in_key(self):
+        """Test the model and input type are part of the key."""
+        key = embedding_cache_key("m", "passage", "Tea leaves")
+        assert key != embedding_cache_key("other", "passage", "Tea leaves")
+        assert key != embedding_cache_key("m", "query", "Tea leaves")
+
+    def test_content_in_key(self):
+        """Test different texts get different keys."""
+        assert embedding_cache_key("m", "passage", "Tea leaves") != embedding_cache_key("m", "passage", "Tea roots")
+
+
+class TestEmbeddingCacheMemoryTier:
+    """Tests for the in-process LRU tier."""
+
+    @pytest.mark.asyncio
+    async def test_put_then_get(self):
+        """Test stored embeddings are served from memory."""
+        cache = EmbeddingCache(lru_size=10)
+        await cache.put_many({"a": _entry(0.1)}, model="m", input_type="passage")
+
+        found = await cache.get_many(["a", "b"])
+
+        assert list(found) == ["a"]
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_evicted(self):
+        """Test the LRU evicts the least recently used entry."""
+        cache = EmbeddingCache(lru_size=2)
+        await cache.put_many({"a": _entry(0.1), "b": _entry(0.2)}, model="m", input_type="passage")
+        await cache.get_many(["a"])
+        await cache.put_many({"c": _entry(0.3)}, model="m", input_type="passage")
+
+        found = await cache.get_many(["a", "b", "c"])
+
+        assert set(found) == {"a", "c"}
+
+    @pytest.mark.asyncio
+    async def test_lru_disabled(self):
+        """Test nothing is kept in memory with lru_size=0."""
+        cache = EmbeddingCache(lru_size=0)
+        await cache.put_many({"a": _entry(0.1)}, model="m", input_type="passage")
+
+        assert await cache.get_many(["a"]) == {}
+
+
+class TestEmbeddingCacheRepositoryTier:
+    """Tests for the MongoDB tier."""
+
+    @pytest.mark.asyncio
+    async def test_memory_misses_read_in_one_call(self, mock_repository):
+        """Test keys not in memory are read from the repository once, deduplicated."""
+        mock_repository.get_many.return_value = {"b": _entry(0.2)}
+        cache = EmbeddingCache(repository=mock_repository, lru_size=10)
+        await cache.put_many({"a": _entry(0.1)}, model="m", input_type="passage")
+
+        found = await cache.get_many(["a", "b", "c", "b"])
+
+        mock_repository.get_many.assert_awaited_once_with(["b", "c"])
+        assert set(found) == {"a", "b"}
+        assert cache.hits == 2
+        assert cache.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_repository_hits_promoted_to_memory(self, mock_repository):
+        """Test entries read from the repository are then served from memory."""
+        mock_repository.get_many.return_value = {"b": _entry(0.2)}
+        cache = EmbeddingCache(repository=mock_repository, lru_size=10)
+        await cache.get_many(["b"])
+        mock_repository.get_many.reset_mock()
+
+        found = await cache.get_many(["b"])
+
+        assert set(found) == {"b"}
+        mock_repository.get_many.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_put_writes_repository(self, mock_repository):
+        """Test new embeddings are written to the repository."""
+        cache = EmbeddingCache(repository=mock_repository)
+        entries = {"a": _entry(0.1)}
+
+        await cache.put_many(entries, model="m", input_type="passage")
+
+        mock_repository.put_many.assert_awaited_once_with(entries, model="m", input_type="passage")
+
+    @pytest.mark.asyncio
+    async def test_lookup_error_is_a_miss(self, mock_repository):
+        """Test repository read errors are treated as misses."""
+        mock_repository.get_many.side_effect = RuntimeError("MongoDB unavailable")
+        cache = EmbeddingCache(repository=mock_repository)
+
+        assert await cache.get_many(["a"]) == {}
+        assert cache.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_write_error_ignored(self, mock_repository):
+        """Test repository write errors do not propagate."""
+        mock_repository.put_many.side_effect = RuntimeError("MongoDB unavailable")
+        cache = EmbeddingCache(repository=mock_repository)
+
+        await cache.put_many({"a": _entry(0.1)}, model="m", input_type="passage")
+
+
+class TestEmbeddingCacheHitRate:
+    """Tests for hit_rate."""
+
+    @pytest.mark.asyncio
+    async def test_hit_rate(self):
+        """Test hit_rate is hits over lookups."""
+        cache = EmbeddingCache(lru_size=10)
+        assert cache.hit_rate == 0.0
+
+        await cache.put_many({"a": _entry(0.1)}, model="m", input_type="passage")
+        await cache.get_many(["a", "b", "c", "d"])
+
+        assert cache.hit_rate == 0.25
+
+
+class TestEmbeddingCacheRepository:
+    """Tests for EmbeddingCacheRepository."""
+
+    @pytest.fixture
+    def collection(self):
+        """Create a mock collection."""
+        collection = MagicMock()
+        collection.create_index = AsyncMock()
+        collection.bulk_write = AsyncMock()
+        return collection
+
+    @pytest.fixture
+    def repository(self, collection):
+        """Create a repository on a mock database."""
+        db = MagicMock()
+        db.__getitem__ = MagicMock(return_value=collection)
+        return EmbeddingCacheRepository(db, ttl_days=30)
+
+    @pytest.mark.asyncio
+    async def test_ensure_indexes_creates_ttl_index(self, repository, collection):
+        """Test the TTL index on created_at."""
+        await repository.ensure_indexes()
+
+        args, kwargs = collection.create_index.call_args
+        assert args[0] == "created_at"
+        assert kwargs["expireAfterSeconds"] == 30 * 86400
+
+    @pytest.mark.asyncio
+    async def test_put_many_single_unordered_upsert(self, repository, collection):
+        """Test entries are upserted in one unordered bulk write without overwriting."""
+        await repository.put_many({"a": _entry(0.1), "b": _entry(0.2)}, model="m", input_type="passage")
+
+        collection.bulk_write.assert_awaited_once()
+        operations = collection.bulk_write.call_args.args[0]
+        assert len(operations) == 2
+        assert collection.bulk_write.call_args.kwargs["ordered"] is False
+        assert "$setOnInsert" in operations[0]._doc
+
+    @pytest.mark.asyncio
+    async def test_put_many_empty_skips_write(self, repository, collection):
+        """Test no write for no entries."""
+        await repository.put_many({}, model="m", input_type="passage")
+
+        collection.bulk_write.assert_not_awaited()
@@ -7,12 +7,15 @@ Tests cover:
 - Passage vs query input types
 - Retry on transient errors
 - Configuration validation
+- Embedding cache (only misses embedded, savings in cost events)
 
 Story 0.75.12: RAG Embedding Configuration (Pinecone Inference)
 Story 13.7: Removed cost repository tests - costs now published via DAPR (ADR-016)
 """
 
-from unittest.mock import MagicMock, patch
+import json
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from ai_model.config import Settings
@@ -22,6 +25,7 @@ from ai_model.domain.embedding import (
     EmbeddingResult,
     EmbeddingUsage,
 )
+from ai_model.services.embedding_cache import EmbeddingCache
 from ai_model.services.embedding_service import (
     EmbeddingBatchError,
     EmbeddingService,
@@ -515,3 +519,80 @@ class TestEmbeddingServiceErrorHandling:
 
         # Original error should be PineconeNotConfiguredError
         assert isinstance(exc_info.value.original_error, PineconeNotConfiguredError)
+
+
+class TestEmbeddingServiceCache:
+    """Tests for embedding with an EmbeddingCache."""
+
+    @staticmethod
+    def _embed_side_effect(*args, **kwargs):
+        inputs = kwargs.get("inputs", args[0] if args else [])
+        response = MagicMock()
+        response.data = [{"values": [float(len(text))] * 1024} for text in inputs]
+        response.usage = MagicMock()
+        response.usage.total_tokens = 10 * len(inputs)
+        return response
+
+    @pytest.mark.asyncio
+    async def test_only_misses_sent_to_pinecone(self, mock_pinecone_settings, mock_pinecone_client):
+        """Test cached texts are not embedded again and results keep input order."""
+        mock_pinecone_client.inference.embed.side_effect = self._embed_side_effect
+        service = EmbeddingService(settings=mock_pinecone_settings, cache=EmbeddingCache(lru_size=100))
+
+        with patch.object(service, "_get_client", return_value=mock_pinecone_client):
+            await service.embed_passages(["aa", "bbbb"])
+            result = await service.embed_texts(["bbbb", "ccc", "aa"])
+
+        assert mock_pinecone_client.inference.embed.call_args.kwargs["inputs"] == ["ccc"]
+        assert [embedding[0] for embedding in result.embeddings] == [4.0, 3.0, 2.0]
+        assert result.usage.total_tokens == 10
+        assert result.usage.cached_count == 2
+        assert result.usage.tokens_saved == 20
+
+    @pytest.mark.asyncio
+    async def test_duplicates_embedded_once(self, mock_pinecone_settings, mock_pinecone_client):
+        """Test identical texts in one request are embedded once."""
+        mock_pinecone_client.inference.embed.side_effect = self._embed_side_effect
+        service = EmbeddingService(settings=mock_pinecone_settings, cache=EmbeddingCache())
+
+        with patch.object(service, "_get_client", return_value=mock_pinecone_client):
+            result = await service.embed_texts(["aa", "aa ", "bbb"])
+
+        assert mock_pinecone_client.inference.embed.call_args.kwargs["inputs"] == ["aa ", "bbb"]
+        assert result.count == 3
+
+    @pytest.mark.asyncio
+    async def test_query_and_passage_cached_separately(self, mock_pinecone_settings, mock_pinecone_client):
+        """Test a query is not served the passage embedding of the same text."""
+        mock_pinecone_client.inference.embed.side_effect = self._embed_side_effect
+        service = EmbeddingService(settings=mock_pinecone_settings, cache=EmbeddingCache(lru_size=100))
+
+        with patch.object(service, "_get_client", return_value=mock_pinecone_client):
+            await service.embed_passages(["blister blight"])
+            await service.embed_query("blister blight")
+            await service.embed_query("blister blight")
+
+        assert mock_pinecone_client.inference.embed.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cost_event_reports_savings(self, mock_pinecone_settings, mock_pinecone_client):
+        """Test the cost event carries cache hits and the tokens and USD saved."""
+        mock_pinecone_client.inference.embed.side_effect = self._embed_side_effect
+        mock_pinecone_settings.embedding_cost_per_1k_tokens = 0.1
+        dapr_client = AsyncMock()
+        service = EmbeddingService(
+            settings=mock_pinecone_settings,
+            dapr_client=dapr_client,
+            cache=EmbeddingCache(lru_size=100),
+        )
+
+        with patch.object(service, "_get_client", return_value=mock_pinecone_client):
+            await service.embed_passages(["aa", "bb"])
+            await service.embed_passages(["aa", "bb"])
+
+        assert mock_pinecone_client.inference.embed.call_count == 1
+        event = json.loads(dapr_client.publish_event.call_args.kwargs["data"])
+        assert event["quantity"] == 0
+        assert event["metadata"]["cache_hits"] == 2
+        assert event["metadata"]["tokens_saved"] == 20
+        assert Decimal(event["metadata"]["savings_usd"]) == Decimal("0.002")
@@ -146,6 +146,57 @@ class TestRagChunkRepositoryGetById:
         mock_db["rag_chunks"].find_one.assert_called_once_with({"_id": "my-chunk-123"})
 
 
+class TestRagChunkRepositoryGetByIds:
+    """Tests for get_by_ids method."""
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids_single_in_query(self, repository, mock_db, sample_chunks):
+        """Test get_by_ids issues one $in query for all IDs."""
+        mock_cursor = MagicMock()
+        mock_cursor.to_list = AsyncMock(return_value=[{"_id": c.chunk_id, **c.model_dump()} for c in sample_chunks])
+        mock_db["rag_chunks"].find.return_value = mock_cursor
+
+        ids = [c.chunk_id for c in sample_chunks]
+        await repository.get_by_ids(ids)
+
+        mock_db["rag_chunks"].find.assert_called_once_with({"_id": {"$in": ids}})
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids_preserves_input_order(self, repository, mock_db, sample_chunks):
+        """Test results follow the requested order, not MongoDB's return order."""
+        mock_cursor = MagicMock()
+        mock_cursor.to_list = AsyncMock(return_value=[{"_id": c.chunk_id, **c.model_dump()} for c in sample_chunks])
+        mock_db["rag_chunks"].find.return_value = mock_cursor
+
+        requested = [sample_chunks[2].chunk_id, sample_chunks[0].chunk_id, sample_chunks[1].chunk_id]
+        chunks = await repository.get_by_ids(requested)
+
+        assert [c.chunk_id for c in chunks] == requested
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids_skips_missing_and_duplicates(self, repository, mock_db, sample_chunks):
+        """Test missing IDs are omitted and duplicates are queried once."""
+        mock_cursor = MagicMock()
+        mock_cursor.to_list = AsyncMock(
+            return_value=[{"_id": sample_chunks[0].chunk_id, **sample_chunks[0].model_dump()}]
+        )
+        mock_db["rag_chunks"].find.return_value = mock_cursor
+
+        chunk_id = sample_chunks[0].chunk_id
+        chunks = await repository.get_by_ids([chunk_id, "missing", chunk_id])
+
+        assert [c.chunk_id for c in chunks] == [chunk_id]
+        mock_db["rag_chunks"].find.assert_called_once_with({"_id": {"$in": [chunk_id, "missing"]}})
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids_empty_skips_query(self, repository, mock_db):
+        """Test get_by_ids with no IDs does not hit MongoDB."""
+        chunks = await repository.get_by_ids([])
+
+        assert chunks == []
+        mock_db["rag_chunks"].find.assert_not_called()
+
+
 class TestRagChunkRepositoryGetByDocument:
     """Tests for get_by_document method."""
 
@@ -323,3 +374,28 @@ class TestRagChunkRepositoryEnsureIndexes:
 
         # Should create 4 indexes
         assert mock_db["rag_chunks"].create_index.call_count == 4
+
+
+class TestRagChunkRepositoryBulkUpdatePineconeIds:
+    """Tests for bulk_update_pinecone_ids method."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_single_write(self, repository, mock_db):
+        """Test all chunks are updated with one unordered bulk write."""
+        mock_db["rag_chunks"].bulk_write = AsyncMock(return_value=MagicMock(matched_count=2))
+
+        matched = await repository.bulk_update_pinecone_ids({"chunk-0": "doc-0", "chunk-1": "doc-1"})
+
+        assert matched == 2
+        operations = mock_db["rag_chunks"].bulk_write.call_args.args[0]
+        assert [op._filter for op in operations] == [{"_id": "chunk-0"}, {"_id": "chunk-1"}]
+        assert operations[1]._doc == {"$set": {"pinecone_id": "doc-1"}}
+        assert mock_db["rag_chunks"].bulk_write.call_args.kwargs == {"ordered": False}
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_empty(self, repository, mock_db):
+        """Test nothing is written without chunks."""
+        mock_db["rag_chunks"].bulk_write = AsyncMock()
+
+        assert await repository.bulk_update_pinecone_ids({}) == 0
+        mock_db["rag_chunks"].bulk_write.assert_not_called()
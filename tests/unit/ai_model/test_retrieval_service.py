@@ -12,6 +12,7 @@ Tests cover:
 """
 
 from datetime import UTC, datetime
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -78,34 +79,35 @@ def mock_chunk_repository() -> MagicMock:
     """Create a mock chunk repository."""
     repo = MagicMock()
 
-    async def get_by_id(chunk_id: str) -> RagChunk | None:
-        chunks = {
-            "doc-1-v1-chunk-0": RagChunk(
-                chunk_id="doc-1-v1-chunk-0",
-                document_id="doc-1",
-                document_version=1,
-                chunk_index=0,
-                content="This is test content about plant diseases.",
-                section_title="Test Section 1",
-                word_count=8,
-                char_count=46,
-                created_at=datetime.now(UTC),
-            ),
-            "doc-2-v1-chunk-0": RagChunk(
-                chunk_id="doc-2-v1-chunk-0",
-                document_id="doc-2",
-                document_version=1,
-                chunk_index=0,
-                content="This is test content about tea cultivation.",
-                section_title="Test Section 2",
-                word_count=8,
-                char_count=45,
-                created_at=datetime.now(UTC),
-            ),
-        }
-        return chunks.get(chunk_id)
-
-    repo.get_by_id = AsyncMock(side_effect=get_by_id)
+    chunks = {
+        "doc-1-v1-chunk-0": RagChunk(
+            chunk_id="doc-1-v1-chunk-0",
+            document_id="doc-1",
+            document_version=1,
+            chunk_index=0,
+            content="This is test content about plant diseases.",
+            section_title="Test Section 1",
+            word_count=8,
+            char_count=46,
+            created_at=datetime.now(UTC),
+        ),
+        "doc-2-v1-chunk-0": RagChunk(
+            chunk_id="doc-2-v1-chunk-0",
+            document_id="doc-2",
+            document_version=1,
+            chunk_index=0,
+            content="This is test content about tea cultivation.",
+            section_title="Test Section 2",
+            word_count=8,
+            char_count=45,
+            created_at=datetime.now(UTC),
+        ),
+    }
+
+    async def get_by_ids(chunk_ids: list[str]) -> list[RagChunk]:
+        return [chunks[chunk_id] for chunk_id in chunk_ids if chunk_id in chunks]
+
+    repo.get_by_ids = AsyncMock(side_effect=get_by_ids)
     return repo
 
 
@@ -146,8 +148,8 @@ class TestRetrievalServiceOrchestration:
         assert call_kwargs["embedding"] == [0.1] * 1024
         assert call_kwargs["top_k"] == 5
 
-        # Verify chunk repository was called for each match
-        assert mock_chunk_repository.get_by_id.call_count == 2
+        # Verify all matches were hydrated with a single batched read
+        mock_chunk_repository.get_by_ids.assert_called_once_with(["doc-1-v1-chunk-0", "doc-2-v1-chunk-0"])
 
         # Verify result structure
         assert isinstance(result, RetrievalResult)
@@ -350,7 +352,7 @@ class TestErrorHandling:
         """Test handling when chunk is not found in MongoDB."""
         # Repository returns None for all chunks
         mock_chunk_repository = MagicMock()
-        mock_chunk_repository.get_by_id = AsyncMock(return_value=None)
+        mock_chunk_repository.get_by_ids = AsyncMock(return_value=[])
 
         service = RetrievalService(
             embedding_service=mock_embedding_service,
@@ -523,3 +525,112 @@ class TestResultContent:
         match2 = result.matches[1]
         assert match2.metadata.get("region") == "Rwanda"
         assert match2.metadata.get("season") == "dry_season"
+
+
+@pytest.mark.asyncio
+class TestChunkHydrationCache:
+    """Test batched hydration with the optional chunk LRU."""
+
+    def _service(
+        self,
+        mock_embedding_service: MagicMock,
+        mock_vector_store: MagicMock,
+        mock_chunk_repository: MagicMock,
+        **kwargs: Any,
+    ) -> RetrievalService:
+        return RetrievalService(
+            embedding_service=mock_embedding_service,
+            vector_store=mock_vector_store,
+            chunk_repository=mock_chunk_repository,
+            **kwargs,
+        )
+
+    async def test_cache_disabled_reads_every_query(
+        self,
+        retrieval_service: RetrievalService,
+        mock_chunk_repository: MagicMock,
+    ) -> None:
+        """Test each query hits MongoDB once when the cache is disabled."""
+        await retrieval_service.retrieve(query="test")
+        await retrieval_service.retrieve(query="test")
+
+        assert mock_chunk_repository.get_by_ids.call_count == 2
+
+    async def test_cache_hit_skips_mongodb(
+        self,
+        mock_embedding_service: MagicMock,
+        mock_vector_store: MagicMock,
+        mock_chunk_repository: MagicMock,
+    ) -> None:
+        """Test repeated queries are served from the LRU."""
+        service = self._service(mock_embedding_service, mock_vector_store, mock_chunk_repository, chunk_cache_size=10)
+
+        first = await service.retrieve(query="test", namespace="knowledge-v1")
+        second = await service.retrieve(query="test", namespace="knowledge-v1")
+
+        mock_chunk_repository.get_by_ids.assert_called_once()
+        assert [m.content for m in second.matches] == [m.content for m in first.matches]
+
+    async def test_cache_fetches_only_misses(
+        self,
+        mock_embedding_service: MagicMock,
+        mock_vector_store: MagicMock,
+        mock_chunk_repository: MagicMock,
+    ) -> None:
+        """Test a partial hit fetches only the uncached chunk IDs."""
+        service = self._service(mock_embedding_service, mock_vector_store, mock_chunk_repository, chunk_cache_size=1)
+
+        await service.retrieve(query="test")
+        await service.retrieve(query="test")
+
+        # Size-1 LRU keeps only the last chunk stored by the first query
+        assert mock_chunk_repository.get_by_ids.call_args_list[1].args[0] == ["doc-1-v1-chunk-0"]
+
+    async def test_cache_keyed_by_namespace(
+        self,
+        mock_embedding_service: MagicMock,
+        mock_vector_store: MagicMock,
+        mock_chunk_repository: MagicMock,
+    ) -> None:
+        """Test a different namespace (content version) misses the cache."""
+        service = self._service(mock_embedding_service, mock_vector_store, mock_chunk_repository, chunk_cache_size=10)
+
+        await service.retrieve(query="test", namespace="knowledge-v1")
+        await service.retrieve(query="test", namespace="knowledge-v2")
+
+        assert mock_chunk_repository.get_by_ids.call_count == 2
+
+    async def test_cache_entries_expire(
+        self,
+        mock_embedding_service: MagicMock,
+        mock_vector_store: MagicMock,
+        mock_chunk_repository: MagicMock,
+    ) -> None:
+        """Test expired entries are re-read from MongoDB."""
+        service = self._service(
+            mock_embedding_service,
+            mock_vector_store,
+            mock_chunk_repository,
+            chunk_cache_size=10,
+            chunk_cache_ttl_seconds=0,
+        )
+
+        await service.retrieve(query="test")
+        await service.retrieve(query="test")
+
+        assert mock_chunk_repository.get_by_ids.call_count == 2
+
+    async def test_results_keep_pinecone_order(
+        self,
+        mock_embedding_service: MagicMock,
+        mock_vector_store: MagicMock,
+        mock_chunk_repository: MagicMock,
+    ) -> None:
+        """Test matches stay in score order even when MongoDB returns them reversed."""
+        chunks = await mock_chunk_repository.get_by_ids(["doc-1-v1-chunk-0", "doc-2-v1-chunk-0"])
+        mock_chunk_repository.get_by_ids = AsyncMock(return_value=list(reversed(chunks)))
+        service = self._service(mock_embedding_service, mock_vector_store, mock_chunk_repository)
+
+        result = await service.retrieve(query="test")
+
+        assert [m.chunk_id for m in result.matches] == ["doc-1-v1-chunk-0", "doc-2-v1-chunk-0"]
@@ -13,6 +13,7 @@ Tests cover:
 Story 0.75.13b: RAG Vectorization Pipeline (Orchestration)
 """
 
+import asyncio
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
@@ -39,6 +40,7 @@ from ai_model.domain.vectorization import (
 from ai_model.infrastructure.pinecone_vector_store import PineconeVectorStore
 from ai_model.infrastructure.repositories.rag_chunk_repository import RagChunkRepository
 from ai_model.infrastructure.repositories.rag_document_repository import RagDocumentRepository
+from ai_model.infrastructure.repositories.vectorization_job_repository import VectorizationJobRepository
 from ai_model.services.embedding_service import EmbeddingService
 from ai_model.services.vectorization_pipeline import VectorizationPipeline
 
@@ -163,6 +165,22 @@ def sample_chunks() -> list[RagChunk]:
     ]
 
 
+def _chunks(count: int) -> list[RagChunk]:
+    """Create count chunks of the disease-guide document."""
+    return [
+        RagChunk(
+            chunk_id=f"chunk-{i}",
+            document_id="disease-guide",
+            document_version=1,
+            chunk_index=i,
+            content=f"Content {i}",
+            word_count=2,
+            char_count=10,
+        )
+        for i in range(count)
+    ]
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # DOMAIN MODEL TESTS
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -608,6 +626,107 @@ class TestBatchProcessing:
         assert mock_vector_store.upsert.call_count == 3
         assert result.progress.chunks_stored == 25
 
+    @pytest.mark.asyncio
+    async def test_embedding_overlaps_storage(
+        self,
+        pipeline,
+        mock_document_repository,
+        mock_chunk_repository,
+        mock_embedding_service,
+        mock_vector_store,
+        sample_document,
+    ):
+        """Test the next batch is embedded while the previous one is being stored."""
+        chunks = _chunks(20)
+        mock_document_repository.get_by_version.return_value = sample_document
+        mock_chunk_repository.get_chunks_without_vectors.return_value = chunks
+        events: list[str] = []
+        second_embedded = asyncio.Event()
+
+        async def _embed(passages, request_id, knowledge_domain):
+            events.append(f"embed-{request_id[-1]}")
+            if request_id.endswith("1"):
+                second_embedded.set()
+            return [[0.1] * 1024] * len(passages)
+
+        async def _upsert(vectors, namespace):
+            events.append("upsert")
+            # Batch 1 is embedded before batch 0 finishes storing
+            await asyncio.wait_for(second_embedded.wait(), timeout=1)
+            return MagicMock(upserted_count=len(vectors))
+
+        mock_embedding_service.embed_passages.side_effect = _embed
+        mock_vector_store.upsert.side_effect = _upsert
+        mock_chunk_repository.bulk_update_pinecone_ids.side_effect = lambda ids: len(ids)
+
+        result = await pipeline.vectorize_document("disease-guide", 1)
+
+        # A serial pipeline would time out storing batch 0
+        assert result.status == VectorizationJobStatus.COMPLETED
+        assert events == ["embed-0", "embed-1", "upsert", "upsert"]
+        assert result.pinecone_ids == [f"disease-guide-{i}" for i in range(20)]
+
+    @pytest.mark.asyncio
+    async def test_chunk_updates_one_bulk_write_per_batch(
+        self,
+        pipeline,
+        mock_document_repository,
+        mock_chunk_repository,
+        mock_embedding_service,
+        mock_vector_store,
+        sample_document,
+    ):
+        """Test chunk records are updated with one bulk write per batch."""
+        chunks = _chunks(15)
+        mock_document_repository.get_by_version.return_value = sample_document
+        mock_chunk_repository.get_chunks_without_vectors.return_value = chunks
+        mock_embedding_service.embed_passages.side_effect = lambda passages, **kwargs: [[0.1] * 1024] * len(passages)
+
+        await pipeline.vectorize_document("disease-guide", 1)
+
+        assert mock_chunk_repository.bulk_update_pinecone_ids.await_count == 2
+        second = mock_chunk_repository.bulk_update_pinecone_ids.call_args_list[1].args[0]
+        assert second == {f"chunk-{i}": f"disease-guide-{i}" for i in range(10, 15)}
+        mock_chunk_repository.update_pinecone_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_store_failure_progress(
+        self,
+        mock_chunk_repository,
+        mock_document_repository,
+        mock_embedding_service,
+        mock_vector_store,
+        mock_settings,
+        sample_document,
+    ):
+        """Test progress counts embedded and stored chunks separately and is reported while running."""
+        job_repository = AsyncMock(spec=VectorizationJobRepository)
+        pipeline = VectorizationPipeline(
+            chunk_repository=mock_chunk_repository,
+            document_repository=mock_document_repository,
+            embedding_service=mock_embedding_service,
+            vector_store=mock_vector_store,
+            settings=mock_settings,
+            job_repository=job_repository,
+        )
+        mock_document_repository.get_by_version.return_value = sample_document
+        mock_chunk_repository.get_chunks_without_vectors.return_value = _chunks(25)
+        mock_embedding_service.embed_passages.side_effect = lambda passages, **kwargs: [[0.1] * 1024] * len(passages)
+        mock_vector_store.upsert.side_effect = [MagicMock(), Exception("Pinecone down"), MagicMock()]
+
+        result = await pipeline.vectorize_document("disease-guide", 1, request_id="job-1")
+
+        assert result.status == VectorizationJobStatus.PARTIAL
+        assert result.progress.chunks_embedded == 25
+        assert result.progress.chunks_stored == 15
+        assert result.progress.failed_count == 10
+        assert [c.chunk_index for c in result.failed_chunks] == list(range(10, 20))
+
+        reported = [call.args[0] for call in job_repository.update.call_args_list]
+        assert reported[0].status == VectorizationJobStatus.IN_PROGRESS
+        assert reported[0].progress.chunks_total == 25
+        assert reported[-1].status == VectorizationJobStatus.PARTIAL
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # JOB STATUS TESTS
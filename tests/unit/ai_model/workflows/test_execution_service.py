@@ -6,6 +6,7 @@ Story 0.75.16: LangGraph SDK Integration & Base Workflows
 ADR-014: Updated tests - checkpointing disabled during Motor → PyMongo migration
 """
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -242,6 +243,28 @@ class TestWorkflowExecutionService:
 
         assert workflow.workflow_name == "tiered_vision"
 
+    def test_create_workflow_tiered_vision_uses_integration_client(
+        self,
+        mock_llm_gateway: MagicMock,
+        mock_ranking_service: MagicMock,
+    ) -> None:
+        """Tiered-vision image fetches go through the MCP integration's client."""
+        mcp_client = MagicMock()
+        mcp_integration = MagicMock()
+        mcp_integration.get_client.return_value = mcp_client
+        service = WorkflowExecutionService(
+            mongodb_uri="mongodb://localhost:27017",
+            mongodb_database="test_db",
+            llm_gateway=mock_llm_gateway,
+            ranking_service=mock_ranking_service,
+            mcp_integration=mcp_integration,
+        )
+
+        workflow = service._create_workflow(AgentType.TIERED_VISION)
+
+        mcp_integration.get_client.assert_called_once_with("collection")
+        assert workflow._mcp_client is mcp_client
+
     def test_create_workflow_from_string(
         self,
         execution_service: WorkflowExecutionService,
@@ -260,6 +283,68 @@ class TestWorkflowExecutionService:
             execution_service._create_workflow("unknown_type")
 
 
+class TestWorkflowPool:
+    """Tests for the pool of compiled workflows."""
+
+    def test_workflow_reused_per_agent_type(
+        self,
+        execution_service: WorkflowExecutionService,
+    ) -> None:
+        """Test the same compiled workflow is returned for an agent type (string or enum)."""
+        first = execution_service._get_workflow(AgentType.EXTRACTOR)
+
+        assert execution_service._get_workflow("extractor") is first
+        assert execution_service._get_workflow(AgentType.GENERATOR) is not first
+        assert first._compiled_graph is not None
+
+    def test_warm_compiles_every_agent_type(
+        self,
+        execution_service: WorkflowExecutionService,
+    ) -> None:
+        """Test warming builds one compiled workflow per agent type."""
+        with patch.object(execution_service, "_create_workflow", wraps=execution_service._create_workflow) as create:
+            assert execution_service.warm_workflow_pool() == len(AgentType)
+            execution_service.warm_workflow_pool()
+
+        assert create.call_count == len(AgentType)
+
+    def test_pool_disabled_creates_per_call(
+        self,
+        mock_llm_gateway: MagicMock,
+    ) -> None:
+        """Test pool_workflows=False compiles a fresh workflow for every call."""
+        service = WorkflowExecutionService(
+            mongodb_uri="mongodb://localhost:27017",
+            mongodb_database="test_db",
+            llm_gateway=mock_llm_gateway,
+            pool_workflows=False,
+        )
+
+        assert service._get_workflow(AgentType.EXTRACTOR) is not service._get_workflow(AgentType.EXTRACTOR)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_executions_share_workflow(
+        self,
+        execution_service: WorkflowExecutionService,
+        extractor_config: ExtractorConfig,
+    ) -> None:
+        """Test concurrent executions on the pooled workflow keep their own state."""
+
+        async def _execute(doc_id: str) -> dict:
+            return await execution_service.execute_extractor(
+                agent_id="test-extractor",
+                agent_config=extractor_config,
+                input_data={"doc_id": doc_id},
+                correlation_id=doc_id,
+            )
+
+        results = await asyncio.gather(*(_execute(f"doc-{i}") for i in range(5)))
+
+        assert [r["correlation_id"] for r in results] == [f"doc-{i}" for i in range(5)]
+        assert [r["input_data"]["doc_id"] for r in results] == [f"doc-{i}" for i in range(5)]
+        assert len(execution_service._workflow_pool) == 1
+
+
 class TestTypeSpecificState:
     """Tests for type-specific state initialization."""
 
@@ -9,6 +9,7 @@ Tests for:
 - Graceful handling of unavailable servers/tools
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -247,6 +248,40 @@ class TestExplorerWorkflowMcpContext:
         assert "good.tool1" in result
         assert "bad.tool2" not in result
 
+    @pytest.mark.asyncio
+    async def test_fetch_mcp_context_invokes_tools_concurrently(
+        self,
+        mock_llm_gateway: MagicMock,
+    ) -> None:
+        """Test independent MCP sources are fetched in parallel."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_invoke(_args: dict) -> dict:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"ok": True}
+
+        tool = MagicMock()
+        tool.ainvoke = slow_invoke
+        mock_provider = MagicMock()
+        mock_provider.get_tool = MagicMock(return_value=tool)
+
+        workflow = ExplorerWorkflow(
+            llm_gateway=mock_llm_gateway,
+            tool_provider=mock_provider,
+        )
+
+        mcp_sources = [{"server": "plantation", "tool": f"tool{i}", "arg_mapping": {}} for i in range(3)]
+
+        result = await workflow._fetch_mcp_context(mcp_sources, {})
+
+        assert set(result) == {"plantation.tool0", "plantation.tool1", "plantation.tool2"}
+        assert peak == 3
+
     @pytest.mark.asyncio
     async def test_fetch_mcp_context_skips_invalid_sources(
         self,
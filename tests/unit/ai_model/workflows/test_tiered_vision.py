@@ -44,6 +44,7 @@ def mock_mcp_client() -> MagicMock:
     """Create a mock MCP client."""
     client = MagicMock()
     client.call_tool = AsyncMock()
+    client.call_tool_binary = AsyncMock()
     return client
 
 
@@ -134,13 +135,12 @@ class TestPreprocessNode:
         workflow: TieredVisionWorkflow,
         mock_mcp_client: MagicMock,
     ) -> None:
-        """Test preprocessing fetches thumbnail via MCP when has_thumbnail=True."""
-        # Configure mock
-        mock_mcp_client.call_tool.return_value = {
-            "thumbnail_base64": "dGh1bWJuYWls",  # "thumbnail" base64
-            "content_type": "image/jpeg",
-            "size_bytes": 1024,
-        }
+        """Test preprocessing fetches thumbnail bytes via MCP when has_thumbnail=True."""
+        # Configure mock (binary transport: raw bytes, metadata only in JSON)
+        mock_mcp_client.call_tool_binary.return_value = (
+            {"content_type": "image/jpeg", "size_bytes": 9},
+            b"thumbnail",
+        )
 
         state: TieredVisionState = {
             "doc_id": "test-doc-001",
@@ -151,7 +151,7 @@ class TestPreprocessNode:
         result = await workflow._preprocess_node(state)
 
         # Verify MCP call
-        mock_mcp_client.call_tool.assert_called_once_with(
+        mock_mcp_client.call_tool_binary.assert_called_once_with(
             tool_name="get_document_thumbnail",
             arguments={"document_id": "test-doc-001"},
             caller_agent_id="test-agent",
@@ -168,12 +168,15 @@ class TestPreprocessNode:
         mock_mcp_client: MagicMock,
     ) -> None:
         """Test preprocessing fetches original via MCP when has_thumbnail=False."""
-        # Configure mock
-        mock_mcp_client.call_tool.return_value = {
-            "image_base64": "b3JpZ2luYWw=",  # "original" base64
-            "content_type": "image/jpeg",
-            "size_bytes": 2048,
-        }
+        # Configure mock (server without binary transport: base64 in JSON)
+        mock_mcp_client.call_tool_binary.return_value = (
+            {
+                "image_base64": "b3JpZ2luYWw=",  # "original" base64
+                "content_type": "image/jpeg",
+                "size_bytes": 2048,
+            },
+            b"",
+        )
 
         state: TieredVisionState = {
             "doc_id": "test-doc-002",
@@ -184,7 +187,7 @@ class TestPreprocessNode:
         result = await workflow._preprocess_node(state)
 
         # Verify MCP call
-        mock_mcp_client.call_tool.assert_called_once_with(
+        mock_mcp_client.call_tool_binary.assert_called_once_with(
             tool_name="get_document_image",
             arguments={"document_id": "test-doc-002"},
             caller_agent_id="test-agent",
@@ -216,7 +219,7 @@ class TestPreprocessNode:
         mock_mcp_client: MagicMock,
     ) -> None:
         """Test preprocessing handles MCP errors gracefully."""
-        mock_mcp_client.call_tool.side_effect = Exception("MCP connection failed")
+        mock_mcp_client.call_tool_binary.side_effect = Exception("MCP connection failed")
 
         state: TieredVisionState = {
             "doc_id": "test-doc-003",
@@ -403,11 +406,10 @@ class TestDiagnoseNode:
     ) -> None:
         """Test diagnose fetches original image via MCP when not in state."""
         # Configure mocks
-        mock_mcp_client.call_tool.return_value = {
-            "image_base64": "b3JpZ2luYWw=",
-            "content_type": "image/jpeg",
-            "size_bytes": 4096,
-        }
+        mock_mcp_client.call_tool_binary.return_value = (
+            {"content_type": "image/jpeg", "size_bytes": 8},
+            b"original",
+        )
 
         mock_llm_gateway.complete.return_value = {
             "content": json.dumps(
@@ -440,7 +442,7 @@ class TestDiagnoseNode:
         result = await workflow._diagnose_node(state)
 
         # Verify MCP call for original
-        mock_mcp_client.call_tool.assert_called_once_with(
+        mock_mcp_client.call_tool_binary.assert_called_once_with(
             tool_name="get_document_image",
             arguments={"document_id": "test-doc-001"},
             caller_agent_id="test-agent",
@@ -491,7 +493,7 @@ class TestDiagnoseNode:
         result = await workflow._diagnose_node(state)
 
         # Verify MCP NOT called (original already in state)
-        mock_mcp_client.call_tool.assert_not_called()
+        mock_mcp_client.call_tool_binary.assert_not_called()
 
         # Verify result
         assert result["diagnose_result"]["primary_issue"] == "healthy"
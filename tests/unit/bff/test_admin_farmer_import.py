@@ -0,0 +1,104 @@
+"""Tests for AdminFarmerService.import_farmers.
+
+Tests CSV parsing, batching into the ImportFarmers stream, aggregation of
+per-row results and the partial report of an interrupted stream.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from bff.infrastructure.clients import ServiceUnavailableError
+from bff.infrastructure.clients.plantation_client import FarmerImportRowResult, PlantationClient
+from bff.services.admin import farmer_service
+from bff.services.admin.farmer_service import AdminFarmerService
+
+HEADER = "first_name,last_name,phone,national_id,farm_size_hectares,latitude,longitude,grower_number\n"
+
+
+def _csv_line(i: int, hectares: str = "1.5") -> str:
+    return f"John,Mwangi,+2547000000{i:02d},100000{i:02d},{hectares},-0.4,36.9,\n"
+
+
+@pytest.fixture
+def plantation_client() -> MagicMock:
+    """PlantationClient whose import rejects national ID 10000003."""
+    client = MagicMock(spec=PlantationClient)
+    client.sent_batches = []
+
+    async def _import(batches):
+        for batch in batches:
+            client.sent_batches.append([row_number for row_number, _ in batch])
+            yield [
+                FarmerImportRowResult(row_number, None, "National ID already registered")
+                if farmer.national_id == "10000003"
+                else FarmerImportRowResult(row_number, f"WM-{row_number:04d}", None)
+                for row_number, farmer in batch
+            ]
+
+    client.import_farmers = MagicMock(side_effect=_import)
+    return client
+
+
+class TestImportFarmers:
+    """Tests for the streamed CSV import."""
+
+    @pytest.mark.asyncio
+    async def test_rows_streamed_in_batches(
+        self, plantation_client: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test valid rows go out in IMPORT_BATCH_SIZE batches and errors keep row numbers and data."""
+        monkeypatch.setattr(farmer_service, "IMPORT_BATCH_SIZE", 2)
+        csv_content = HEADER + _csv_line(1) + _csv_line(2, hectares="abc") + "".join(_csv_line(i) for i in range(3, 6))
+        service = AdminFarmerService(plantation_client=plantation_client)
+
+        response = await service.import_farmers(csv_content)
+
+        assert plantation_client.sent_batches == [[2, 4], [5, 6]]
+        assert response.total_rows == 5
+        assert response.created_count == 3
+        assert response.error_count == 2
+        assert [(e.row, e.data["national_id"]) for e in response.error_rows] == [(3, "10000002"), (4, "10000003")]
+        assert response.error_rows[1].error == "National ID already registered"
+
+    @pytest.mark.asyncio
+    async def test_stream_failure_returns_partial_report(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a stream failing midway reports created rows, unconfirmed rows and unread rows."""
+        monkeypatch.setattr(farmer_service, "IMPORT_BATCH_SIZE", 2)
+        client = MagicMock(spec=PlantationClient)
+
+        async def _import(batches):
+            batches = iter(batches)
+            first = next(batches)
+            yield [FarmerImportRowResult(row_number, f"WM-{row_number:04d}", None) for row_number, _ in first]
+            next(batches)  # Sent, then the stream dies before its results
+            raise ServiceUnavailableError("Service unavailable for Import farmers: connection reset")
+
+        client.import_farmers = MagicMock(side_effect=_import)
+        csv_content = HEADER + "".join(_csv_line(i) for i in range(1, 7))
+        service = AdminFarmerService(plantation_client=client)
+
+        response = await service.import_farmers(csv_content)
+
+        assert response.total_rows == 6
+        assert response.created_count == 2
+        assert response.error_count == 4
+        assert [e.row for e in response.error_rows] == [4, 5, 6, 7]
+        assert response.error_rows[0].error.startswith("Import interrupted, outcome unknown")
+        assert response.error_rows[0].data["national_id"] == "10000003"
+        assert response.error_rows[2].error.startswith("Not imported, import interrupted")
+        assert response.error_rows[3].data["national_id"] == "10000006"
+
+    @pytest.mark.asyncio
+    async def test_stream_failure_before_any_result_raises(self) -> None:
+        """Test a failure before any row is confirmed is raised, not reported."""
+        client = MagicMock(spec=PlantationClient)
+
+        async def _import(batches):
+            raise ServiceUnavailableError("Service unavailable for Import farmers")
+            yield  # pragma: no cover
+
+        client.import_farmers = MagicMock(side_effect=_import)
+        service = AdminFarmerService(plantation_client=client)
+
+        with pytest.raises(ServiceUnavailableError):
+            await service.import_farmers(HEADER + _csv_line(1))
@@ -22,6 +22,7 @@ from fp_common.models import (
     GeoLocation,
     OperatingHours,
     QualityThresholds,
+    QualityTier,
 )
 from fp_common.models.farmer_performance import (
     FarmerPerformance,
@@ -339,6 +340,18 @@ class TestAdminFarmerTransformer:
         # Below Tier 3
         assert AdminFarmerTransformer.compute_tier(49.9, default_thresholds) == TierLevel.BELOW_TIER_3
 
+    def test_resolve_tier_prefers_precomputed(
+        self,
+        sample_performance: FarmerPerformance,
+        default_thresholds: QualityThresholds,
+    ):
+        """Test the tier stored by Plantation Model wins over local computation."""
+        precomputed = sample_performance.model_copy(update={"tier": QualityTier.TIER_1})
+
+        assert AdminFarmerTransformer.resolve_tier(precomputed, default_thresholds) == TierLevel.TIER_1
+        # Without a stored tier it falls back to the thresholds (82.5% -> tier_2)
+        assert AdminFarmerTransformer.resolve_tier(sample_performance, default_thresholds) == TierLevel.TIER_2
+
     def test_map_trend(self):
         """Test trend mapping."""
         assert AdminFarmerTransformer.map_trend(TrendDirection.IMPROVING) == TrendIndicator.UP
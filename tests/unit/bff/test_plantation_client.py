@@ -28,6 +28,7 @@ from fp_common.models import (
     OperatingHours,
     PerformanceSummary,
     PreferredLanguage,
+    QualityTier,
     Region,
     RegionalWeather,
     RegionCreate,
@@ -66,6 +67,8 @@ def mock_plantation_stub() -> MagicMock:
     stub.GetFarmerByPhone = AsyncMock()
     stub.ListFarmers = AsyncMock()
     stub.GetFarmerSummary = AsyncMock()
+    stub.GetFarmerSummaries = AsyncMock()
+    stub.GetCollectionPointsForFarmers = AsyncMock()
     stub.GetFactory = AsyncMock()
     stub.ListFactories = AsyncMock()
     stub.GetCollectionPoint = AsyncMock()
@@ -249,6 +252,38 @@ class TestFarmerOperations:
         assert result.pagination.page_size == 10
         assert result.pagination.has_next is False
 
+    @pytest.mark.asyncio
+    async def test_list_farmers_with_filters(
+        self,
+        plantation_client_with_mock_stub: tuple[PlantationClient, MagicMock],
+    ) -> None:
+        """Test farm_scale, search and tier are sent to plantation-model."""
+        client, stub = plantation_client_with_mock_stub
+        stub.ListFarmers.return_value = plantation_pb2.ListFarmersResponse(total_count=0)
+
+        await client.list_farmers(farm_scale=FarmScale.ESTATE, search="wanj", tier=QualityTier.TIER_3)
+
+        request = stub.ListFarmers.call_args[0][0]
+        assert request.farm_scale == plantation_pb2.FARM_SCALE_ESTATE
+        assert request.search == "wanj"
+        assert request.tier == plantation_pb2.QUALITY_TIER_TIER_3
+
+    @pytest.mark.asyncio
+    async def test_list_farmers_without_filters_sends_unspecified(
+        self,
+        plantation_client_with_mock_stub: tuple[PlantationClient, MagicMock],
+    ) -> None:
+        """Test omitted filters are sent as proto defaults."""
+        client, stub = plantation_client_with_mock_stub
+        stub.ListFarmers.return_value = plantation_pb2.ListFarmersResponse(total_count=0)
+
+        await client.list_farmers()
+
+        request = stub.ListFarmers.call_args[0][0]
+        assert request.farm_scale == plantation_pb2.FARM_SCALE_UNSPECIFIED
+        assert request.search == ""
+        assert request.tier == plantation_pb2.QUALITY_TIER_UNSPECIFIED
+
     @pytest.mark.asyncio
     async def test_get_farmer_summary_success(
         self,
@@ -266,6 +301,68 @@ class TestFarmerOperations:
         assert performance.today.deliveries == 2
 
 
+class TestBatchFarmerOperations:
+    """Tests for batch summary and CP membership lookups."""
+
+    @pytest.mark.asyncio
+    async def test_get_farmer_summaries(
+        self,
+        plantation_client_with_mock_stub: tuple[PlantationClient, MagicMock],
+    ) -> None:
+        """Test summaries are returned keyed by farmer ID from one RPC."""
+        client, stub = plantation_client_with_mock_stub
+        stub.GetFarmerSummaries.return_value = plantation_pb2.GetFarmerSummariesResponse(
+            summaries=[create_farmer_summary_proto("WM-0001"), create_farmer_summary_proto("WM-0002")],
+            not_found_farmer_ids=["WM-9999"],
+        )
+
+        performances = await client.get_farmer_summaries(["WM-0001", "WM-0002", "WM-9999"])
+
+        assert set(performances) == {"WM-0001", "WM-0002"}
+        assert isinstance(performances["WM-0002"], FarmerPerformance)
+        stub.GetFarmerSummaries.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_farmer_summaries_chunks_large_requests(
+        self,
+        plantation_client_with_mock_stub: tuple[PlantationClient, MagicMock],
+    ) -> None:
+        """Test requests above the batch limit are split into limit-sized RPCs."""
+        client, stub = plantation_client_with_mock_stub
+        stub.GetFarmerSummaries.return_value = plantation_pb2.GetFarmerSummariesResponse()
+
+        await client.get_farmer_summaries([f"WM-{i:04d}" for i in range(1200)])
+
+        sizes = [len(call.args[0].farmer_ids) for call in stub.GetFarmerSummaries.await_args_list]
+        assert sorted(sizes) == [200, 500, 500]
+
+    @pytest.mark.asyncio
+    async def test_get_collection_points_for_farmers(
+        self,
+        plantation_client_with_mock_stub: tuple[PlantationClient, MagicMock],
+    ) -> None:
+        """Test memberships resolve shared CPs and include unassigned farmers."""
+        client, stub = plantation_client_with_mock_stub
+        stub.GetCollectionPointsForFarmers.return_value = plantation_pb2.GetCollectionPointsForFarmersResponse(
+            collection_points=[create_collection_point_proto(farmer_ids=["WM-0001", "WM-0002"])],
+            memberships=[
+                plantation_pb2.FarmerCollectionPointIds(
+                    farmer_id="WM-0001", collection_point_ids=["nyeri-highland-cp-001"]
+                ),
+                plantation_pb2.FarmerCollectionPointIds(
+                    farmer_id="WM-0002", collection_point_ids=["nyeri-highland-cp-001"]
+                ),
+                plantation_pb2.FarmerCollectionPointIds(farmer_id="WM-0003"),
+            ],
+        )
+
+        memberships = await client.get_collection_points_for_farmers(["WM-0001", "WM-0002", "WM-0003"])
+
+        assert [cp.id for cp in memberships["WM-0001"]] == ["nyeri-highland-cp-001"]
+        assert isinstance(memberships["WM-0002"][0], CollectionPoint)
+        assert memberships["WM-0003"] == []
+
+
 class TestFactoryOperations:
     """Tests for Factory read operations (2 methods)."""
 
@@ -804,6 +901,49 @@ class TestFarmerWriteOperations:
         with pytest.raises(grpc.aio.AioRpcError):
             await client.create_farmer(farmer_data)
 
+    @pytest.mark.asyncio
+    async def test_import_farmers_streams_batches(
+        self,
+        plantation_client_with_mock_stub: tuple[PlantationClient, MagicMock],
+    ) -> None:
+        """Test import_farmers sends one request per batch and yields results per response."""
+        client, stub = plantation_client_with_mock_stub
+        sent: list[plantation_pb2.ImportFarmersRequest] = []
+
+        async def _import(requests, metadata):
+            for request in requests:
+                sent.append(request)
+                yield plantation_pb2.ImportFarmersResponse(
+                    results=[
+                        plantation_pb2.ImportFarmerRowResult(
+                            row_number=row.row_number,
+                            farmer_id="" if row.row_number == 3 else f"WM-{row.row_number:04d}",
+                            error="Phone number already registered" if row.row_number == 3 else "",
+                        )
+                        for row in request.rows
+                    ]
+                )
+
+        stub.ImportFarmers = MagicMock(side_effect=_import)
+        farmer_data = FarmerCreate(
+            first_name="Test",
+            last_name="Farmer",
+            phone="+254712345678",
+            national_id="12345678",
+            farm_size_hectares=0.5,
+            latitude=-0.4200,
+            longitude=36.9560,
+        )
+
+        responses = [results async for results in client.import_farmers([[(2, farmer_data)], [(3, farmer_data)]])]
+
+        assert [len(request.rows) for request in sent] == [1, 1]
+        assert sent[0].rows[0].farmer.contact.phone == "+254712345678"
+        assert [[(r.row_number, r.farmer_id, r.error) for r in results] for results in responses] == [
+            [(2, "WM-0002", None)],
+            [(3, None, "Phone number already registered")],
+        ]
+
 
 class TestFactoryWriteOperations:
     """Tests for Factory write operations (3 methods)."""
@@ -0,0 +1,280 @@
+"""Unit tests for ContentProcessorWorker concurrent, lease-based execution.
+
+Tests cover:
+- Bounded concurrency across claimed jobs
+- Per-source concurrency caps from SourceConfig
+- Lease heartbeat while a job runs
+- Lease-owner scoped status updates
+- Change stream (push mode) wakeup
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from collection_model.domain.ingestion_job import IngestionJob
+from collection_model.services.content_processor_worker import ContentProcessorWorker
+
+from .conftest import create_source_config
+
+
+class FakeLeaseQueue:
+    """In-memory IngestionQueue stand-in implementing claim semantics."""
+
+    def __init__(self, jobs: list[IngestionJob]) -> None:
+        self.pending = list(jobs)
+        self.claims: list[tuple[str, set[str] | None]] = []
+        self.renewals: list[str] = []
+        self.update_job_status = AsyncMock(return_value=True)
+        self.increment_retry_count = AsyncMock(return_value=1)
+        self.fail_exhausted_leases = AsyncMock(return_value=0)
+        self.job_signal = asyncio.Event()
+        self.start_change_stream = AsyncMock()
+        self.stop_change_stream = AsyncMock()
+
+    async def claim_job(
+        self,
+        worker_id: str,
+        lease_seconds: float,
+        exclude_sources: set[str] | None = None,
+        max_retries: int | None = None,
+    ) -> IngestionJob | None:
+        self.claims.append((worker_id, exclude_sources))
+        for job in self.pending:
+            if not exclude_sources or job.source_id not in exclude_sources:
+                self.pending.remove(job)
+                return job
+        return None
+
+    async def renew_lease(self, ingestion_id: str, worker_id: str, lease_seconds: float) -> bool:
+        self.renewals.append(ingestion_id)
+        return True
+
+    async def wait_for_job(self) -> None:
+        await self.job_signal.wait()
+        self.job_signal.clear()
+
+
+def _job(ingestion_id: str, source_id: str = "qc-analyzer") -> IngestionJob:
+    return IngestionJob(
+        ingestion_id=ingestion_id,
+        blob_path=f"results/{ingestion_id}.json",
+        blob_etag=f'"{ingestion_id}"',
+        container="qc-landing",
+        source_id=source_id,
+    )
+
+
+def _worker(queue: FakeLeaseQueue, configs: list, **kwargs) -> ContentProcessorWorker:
+    config_service = MagicMock()
+    config_service.get_all_configs = AsyncMock(return_value=configs)
+    kwargs.setdefault("push_enabled", False)
+    return ContentProcessorWorker(
+        db=MagicMock(),
+        ingestion_queue=queue,
+        source_config_service=config_service,
+        poll_interval=0.01,
+        **kwargs,
+    )
+
+
+class TestConcurrentExecution:
+    """Tests for bounded concurrent job processing."""
+
+    @pytest.mark.asyncio
+    async def test_jobs_run_concurrently_up_to_limit(self) -> None:
+        """Worker never runs more jobs in parallel than its concurrency."""
+        queue = FakeLeaseQueue([_job(f"ing-{i}") for i in range(5)])
+        worker = _worker(queue, [create_source_config(source_id="qc-analyzer")], concurrency=3, batch_size=10)
+
+        running = 0
+        peak = 0
+        release = asyncio.Event()
+
+        async def slow_process(job: IngestionJob) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+
+        worker._process_job = slow_process
+
+        claimed = await worker._process_pending_jobs()
+        await asyncio.sleep(0)
+
+        assert claimed == 3
+        assert peak == 3
+        assert len(queue.pending) == 2
+        # No free slots - next poll claims nothing
+        assert await worker._process_pending_jobs() == 0
+
+        release.set()
+        await asyncio.gather(*worker._in_flight.values())
+        assert worker._in_flight == {}
+        assert await worker._process_pending_jobs() == 2
+        await asyncio.gather(*worker._in_flight.values())
+
+    @pytest.mark.asyncio
+    async def test_per_source_cap_excludes_saturated_source(self) -> None:
+        """Jobs of a source at its cap are skipped in favour of other sources."""
+        capped = create_source_config(source_id="qc-zip")
+        capped.ingestion.max_concurrent_jobs = 1
+        queue = FakeLeaseQueue([_job("zip-1", "qc-zip"), _job("zip-2", "qc-zip"), _job("json-1", "qc-json")])
+        worker = _worker(queue, [capped, create_source_config(source_id="qc-json")], concurrency=4)
+
+        release = asyncio.Event()
+
+        async def slow_process(job: IngestionJob) -> None:
+            await release.wait()
+
+        worker._process_job = slow_process
+
+        claimed = await worker._process_pending_jobs()
+
+        assert claimed == 2
+        assert set(worker._in_flight) == {"zip-1", "json-1"}
+        assert [job.ingestion_id for job in queue.pending] == ["zip-2"]
+        assert queue.claims[-1][1] == {"qc-zip"}
+
+        release.set()
+        await asyncio.gather(*worker._in_flight.values())
+        assert worker._source_in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_renews_lease_while_processing(self) -> None:
+        """Lease is renewed on the heartbeat interval until the job finishes."""
+        queue = FakeLeaseQueue([_job("ing-1")])
+        worker = _worker(queue, [], concurrency=1, heartbeat_interval=0.01)
+        renewed_twice = asyncio.Event()
+        renew_lease = queue.renew_lease
+
+        async def counting_renew(ingestion_id: str, worker_id: str, lease_seconds: float) -> bool:
+            renewed = await renew_lease(ingestion_id, worker_id, lease_seconds)
+            if len(queue.renewals) >= 2:
+                renewed_twice.set()
+            return renewed
+
+        queue.renew_lease = counting_renew
+
+        async def slow_process(job: IngestionJob) -> None:
+            # Finishes only once the heartbeat has renewed twice, however slow the loop
+            await asyncio.wait_for(renewed_twice.wait(), timeout=5)
+
+        worker._process_job = slow_process
+
+        await worker._process_pending_jobs()
+        await asyncio.gather(*worker._in_flight.values())
+        renewals = len(queue.renewals)
+
+        assert renewals >= 2
+        # The heartbeat was cancelled with the job: later beats would renew again
+        await asyncio.sleep(0.03)
+        assert len(queue.renewals) == renewals
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_in_flight_jobs(self) -> None:
+        """Stopping the worker lets in-flight jobs finish and release their lease."""
+        queue = FakeLeaseQueue([_job("ing-1")])
+        worker = _worker(queue, [], concurrency=2)
+        finished = []
+
+        async def slow_process(job: IngestionJob) -> None:
+            await asyncio.sleep(0.02)
+            finished.append(job.ingestion_id)
+
+        worker._process_job = slow_process
+
+        await worker._process_pending_jobs()
+        await worker.stop()
+
+        assert finished == ["ing-1"]
+
+
+class TestLeaseOwnership:
+    """Tests for status updates scoped to the lease owner."""
+
+    @pytest.mark.asyncio
+    async def test_status_updates_are_scoped_to_worker(self) -> None:
+        """Every status update of a processed job carries this worker's lease."""
+        queue = FakeLeaseQueue([])
+        worker = _worker(queue, [create_source_config(source_id="qc-analyzer")])
+        processor = MagicMock()
+        processor.process = AsyncMock(return_value=MagicMock(success=True, document_id="doc-1", error_type=None))
+        worker._get_processor = AsyncMock(return_value=processor)
+
+        await worker._process_job(_job("ing-1"))
+
+        statuses = [call.args[1] for call in queue.update_job_status.call_args_list]
+        assert statuses == ["extracting", "completed"]
+        for call in queue.update_job_status.call_args_list:
+            assert call.kwargs["lease_owner"] == worker.worker_id
+
+    @pytest.mark.asyncio
+    async def test_failure_after_lost_lease_is_not_recorded(self) -> None:
+        """A worker whose lease was reclaimed leaves the job to the new owner."""
+        queue = FakeLeaseQueue([])
+        queue.increment_retry_count = AsyncMock(return_value=0)
+        worker = _worker(queue, [])
+
+        await worker._handle_failure(_job("ing-1"), "boom", "extraction")
+
+        queue.increment_retry_count.assert_awaited_once_with("ing-1", lease_owner=worker.worker_id)
+        queue.update_job_status.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_claim_round_fails_exhausted_leases(self) -> None:
+        """Poison jobs are failed before claiming, and reclaims honour max_retries."""
+        queue = FakeLeaseQueue([])
+        worker = _worker(queue, [], max_retries=5)
+
+        await worker._process_pending_jobs()
+
+        queue.fail_exhausted_leases.assert_awaited_once_with(5)
+
+
+class TestPushMode:
+    """Tests for change stream driven wakeup."""
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_on_queue_signal(self) -> None:
+        """In push mode the worker wakes on a queue signal, not the fallback poll."""
+        queue = FakeLeaseQueue([])
+        worker = _worker(queue, [], push_enabled=True, fallback_poll_interval=10)
+
+        waiter = asyncio.create_task(worker._wait_for_next_poll())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        queue.job_signal.set()
+        await asyncio.wait_for(waiter, timeout=1)
+        assert not queue.job_signal.is_set()
+
+    @pytest.mark.asyncio
+    async def test_wait_falls_back_to_polling(self) -> None:
+        """Without a signal the worker still polls at the fallback interval."""
+        queue = FakeLeaseQueue([])
+        worker = _worker(queue, [], push_enabled=True, fallback_poll_interval=0.02)
+
+        await asyncio.wait_for(worker._wait_for_next_poll(), timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_polling_mode_ignores_change_stream(self) -> None:
+        """With push disabled the worker sleeps for poll_interval only."""
+        queue = FakeLeaseQueue([])
+        worker = _worker(queue, [], push_enabled=False)
+
+        await asyncio.wait_for(worker._wait_for_next_poll(), timeout=1)
+        await worker.stop()
+
+        queue.stop_change_stream.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stop_stops_change_stream(self) -> None:
+        """Stopping a push-mode worker stops the queue change stream."""
+        queue = FakeLeaseQueue([])
+        worker = _worker(queue, [], push_enabled=True)
+
+        await worker.stop()
+
+        queue.stop_change_stream.assert_awaited_once()
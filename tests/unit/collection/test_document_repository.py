@@ -0,0 +1,195 @@
+"""Unit tests for DocumentRepository search index management.
+
+Tests:
+- Text index built from configured search fields with their weights
+- Fields of several sources merged into the single text index
+- No rebuild when the requested fields are already indexed
+- document_id index created for sources without search fields
+- Merged startup build from all source configs
+- Rebuilds serialized per collection and retried after concurrent changes
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from collection_model.infrastructure.document_repository import (
+    SEARCH_INDEX_ATTEMPTS,
+    SEARCH_INDEX_NAME,
+    DocumentRepository,
+)
+from pymongo.errors import OperationFailure
+
+
+def _text_index(weights: dict[str, int], name: str = SEARCH_INDEX_NAME) -> dict:
+    """index_information() entry of a text index."""
+    return {name: {"key": [("_fts", "text"), ("_ftsx", 1)], "weights": weights}}
+
+
+@pytest.fixture
+def collection() -> MagicMock:
+    """Mock collection without a text index."""
+    collection = MagicMock()
+    collection.index_information = AsyncMock(return_value={"_id_": {"key": [("_id", 1)]}})
+    collection.create_index = AsyncMock()
+    collection.drop_index = AsyncMock()
+    return collection
+
+
+@pytest.fixture
+def repository(collection: MagicMock) -> DocumentRepository:
+    """Repository over a database returning the mock collection."""
+    db = MagicMock()
+    db.__getitem__.return_value = collection
+    return DocumentRepository(db)
+
+
+class TestEnsureSearchIndex:
+    """Tests for DocumentRepository.ensure_search_index."""
+
+    @pytest.mark.asyncio
+    async def test_creates_weighted_text_index(self, repository: DocumentRepository, collection: MagicMock) -> None:
+        """Test configured fields are indexed under extracted_fields with their weights."""
+        await repository.ensure_search_index("documents", {"defect_notes": 10, "grade": 2})
+
+        keys = collection.create_index.call_args.args[0]
+        kwargs = collection.create_index.call_args.kwargs
+        assert kwargs["name"] == SEARCH_INDEX_NAME
+        assert kwargs["weights"] == {
+            "document_id": 1,
+            "extracted_fields.defect_notes": 10,
+            "extracted_fields.grade": 2,
+        }
+        assert all(kind == "text" for _, kind in keys)
+        collection.drop_index.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_merges_fields_of_other_sources(self, repository: DocumentRepository, collection: MagicMock) -> None:
+        """Test a new field replaces the text index with the union of old and new fields."""
+        collection.index_information.return_value = _text_index(
+            {"document_id": 1, "extracted_fields.grade": 2}, name="legacy_text"
+        )
+
+        await repository.ensure_search_index("documents", {"market_notes": 5})
+
+        collection.drop_index.assert_awaited_once_with("legacy_text")
+        assert collection.create_index.call_args.kwargs["weights"] == {
+            "document_id": 1,
+            "extracted_fields.grade": 2,
+            "extracted_fields.market_notes": 5,
+        }
+
+    @pytest.mark.asyncio
+    async def test_indexed_fields_not_rebuilt(self, repository: DocumentRepository, collection: MagicMock) -> None:
+        """Test fields already indexed (by this or another source) cause no rebuild or lookup."""
+        collection.index_information.return_value = _text_index(
+            {"document_id": 1, "extracted_fields.grade": 2, "extracted_fields.market_notes": 5}
+        )
+
+        await repository.ensure_search_index("documents", {"grade": 2})
+        await repository.ensure_search_index("documents", {"market_notes": 5})
+
+        collection.create_index.assert_not_called()
+        collection.index_information.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_base_index_without_search_fields(
+        self, repository: DocumentRepository, collection: MagicMock
+    ) -> None:
+        """Test ensure_indexes creates the document_id text index when no fields are configured."""
+        await repository.ensure_indexes("documents", "farmer_id")
+
+        text_calls = [c for c in collection.create_index.call_args_list if c.kwargs.get("name") == SEARCH_INDEX_NAME]
+        assert len(text_calls) == 1
+        assert text_calls[0].kwargs["weights"] == {"document_id": 1}
+
+    @pytest.mark.asyncio
+    async def test_startup_build_merges_all_sources(
+        self, repository: DocumentRepository, collection: MagicMock
+    ) -> None:
+        """Test fields of every source writing to a collection go into one build."""
+        configs = [
+            SimpleNamespace(storage=SimpleNamespace(index_collection="documents", search_fields={"grade": 2})),
+            SimpleNamespace(storage=SimpleNamespace(index_collection="documents", search_fields={"notes": 5})),
+        ]
+
+        await repository.ensure_search_indexes(configs)
+        await repository.ensure_search_index("documents", {"notes": 5})
+
+        collection.create_index.assert_awaited_once()
+        assert collection.create_index.call_args.kwargs["weights"] == {
+            "document_id": 1,
+            "extracted_fields.grade": 2,
+            "extracted_fields.notes": 5,
+        }
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_build_once(self, repository: DocumentRepository, collection: MagicMock) -> None:
+        """Test tasks asking for the same fields wait for one build instead of racing."""
+
+        async def slow_index_information() -> dict:
+            await asyncio.sleep(0)
+            return {}
+
+        collection.index_information.side_effect = slow_index_information
+
+        await asyncio.gather(*(repository.ensure_search_index("documents", {"grade": 2}) for _ in range(3)))
+
+        collection.create_index.assert_awaited_once()
+        collection.index_information.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_conflict_rereads_and_merges(self, repository: DocumentRepository, collection: MagicMock) -> None:
+        """Test an index built by another replica meanwhile is re-read and merged, not lost."""
+        collection.index_information.side_effect = [
+            {},
+            _text_index({"document_id": 1, "extracted_fields.notes": 5}),
+        ]
+        collection.create_index.side_effect = [OperationFailure("conflict", code=85), None]
+
+        await repository.ensure_search_index("documents", {"grade": 2})
+
+        collection.drop_index.assert_awaited_once_with(SEARCH_INDEX_NAME)
+        assert collection.create_index.call_args.kwargs["weights"] == {
+            "document_id": 1,
+            "extracted_fields.notes": 5,
+            "extracted_fields.grade": 2,
+        }
+
+    @pytest.mark.asyncio
+    async def test_index_dropped_meanwhile_is_retried(
+        self, repository: DocumentRepository, collection: MagicMock
+    ) -> None:
+        """Test IndexNotFound on drop (another replica replaced it) leads to a retry."""
+        collection.index_information.side_effect = [_text_index({"document_id": 1}, name="legacy_text"), {}]
+        collection.drop_index.side_effect = OperationFailure("index not found", code=27)
+
+        await repository.ensure_search_index("documents", {"grade": 2})
+
+        collection.create_index.assert_awaited_once()
+        assert collection.create_index.call_args.kwargs["weights"] == {
+            "document_id": 1,
+            "extracted_fields.grade": 2,
+        }
+
+    @pytest.mark.asyncio
+    async def test_unsettled_index_does_not_fail_caller(
+        self, repository: DocumentRepository, collection: MagicMock
+    ) -> None:
+        """Test losing every retry leaves the index to the next call instead of raising."""
+        collection.create_index.side_effect = OperationFailure("conflict", code=86)
+
+        await repository.ensure_search_index("documents", {"grade": 2})
+        collection.create_index.side_effect = None
+        await repository.ensure_search_index("documents", {"grade": 2})
+
+        assert collection.create_index.await_count == SEARCH_INDEX_ATTEMPTS + 1
+
+    @pytest.mark.asyncio
+    async def test_other_failures_propagate(self, repository: DocumentRepository, collection: MagicMock) -> None:
+        """Test errors other than concurrent index changes are raised."""
+        collection.create_index.side_effect = OperationFailure("unauthorized", code=13)
+
+        with pytest.raises(OperationFailure):
+            await repository.ensure_search_index("documents", {"grade": 2})
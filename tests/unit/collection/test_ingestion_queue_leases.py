@@ -0,0 +1,280 @@
+"""Unit tests for IngestionQueue lease-based job claiming.
+
+Tests cover:
+- claim_job atomic claim query (queued or expired lease)
+- per-source exclusion for concurrency caps
+- renew_lease heartbeat semantics
+- lease release on status transitions
+- retry accounting for reclaimed (expired) leases
+- change stream wakeup (push mode)
+"""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from collection_model.domain.ingestion_job import IngestionJob
+from collection_model.infrastructure.ingestion_queue import IngestionQueue
+from pymongo.errors import OperationFailure
+
+
+def _job_doc(**overrides) -> dict:
+    job = IngestionJob(
+        ingestion_id="ing-001",
+        blob_path="results/batch-001.json",
+        blob_etag='"etag-1"',
+        container="qc-landing",
+        source_id="qc-analyzer",
+    )
+    return {**job.model_dump(), **overrides}
+
+
+@pytest.fixture
+def mock_collection() -> MagicMock:
+    collection = MagicMock()
+    collection.find_one_and_update = AsyncMock()
+    collection.update_one = AsyncMock()
+    collection.update_many = AsyncMock()
+    return collection
+
+
+@pytest.fixture
+def queue(mock_collection: MagicMock) -> IngestionQueue:
+    mock_db = MagicMock()
+    mock_db.__getitem__ = MagicMock(return_value=mock_collection)
+    return IngestionQueue(mock_db)
+
+
+class TestClaimJob:
+    """Tests for atomic job claiming."""
+
+    @pytest.mark.asyncio
+    async def test_claim_job_returns_leased_job(self, queue, mock_collection) -> None:
+        """Claimed job is returned with status processing and lease owner set."""
+        expires = datetime(2030, 1, 1, tzinfo=UTC)
+        mock_collection.find_one_and_update.return_value = _job_doc(
+            status="processing", lease_owner="worker-a", lease_expires_at=expires
+        )
+
+        job = await queue.claim_job("worker-a", lease_seconds=60)
+
+        assert job is not None
+        assert job.status == "processing"
+        assert job.lease_owner == "worker-a"
+        assert job.lease_expires_at == expires
+
+    @pytest.mark.asyncio
+    async def test_claim_job_query_includes_expired_leases(self, queue, mock_collection) -> None:
+        """Claim matches queued jobs and leased jobs whose lease expired, oldest first."""
+        mock_collection.find_one_and_update.return_value = None
+
+        before = datetime.now(UTC)
+        await queue.claim_job("worker-a", lease_seconds=60)
+
+        args, kwargs = mock_collection.find_one_and_update.call_args
+        query, update = args
+        assert {"status": "queued"} in query["$or"]
+        expired_clause = next(c for c in query["$or"] if "lease_expires_at" in c)
+        assert expired_clause["status"] == {"$in": ["processing", "extracting"]}
+        assert expired_clause["lease_expires_at"]["$lt"] >= before
+        assert "source_id" not in query
+
+        stage = update[0]["$set"]
+        assert stage["status"] == "processing"
+        assert stage["lease_owner"] == "worker-a"
+        assert (stage["lease_expires_at"] - before).total_seconds() >= 60
+        assert kwargs["sort"] == [("created_at", 1)]
+
+    @pytest.mark.asyncio
+    async def test_reclaim_increments_retry_count(self, queue, mock_collection) -> None:
+        """retry_count is bumped only when the claimed job was still leased."""
+        mock_collection.find_one_and_update.return_value = None
+
+        await queue.claim_job("worker-a", lease_seconds=60)
+
+        update = mock_collection.find_one_and_update.call_args[0][1]
+        condition, reclaimed, fresh = update[0]["$set"]["retry_count"]["$cond"]
+        assert condition == {"$in": ["$status", ["processing", "extracting"]]}
+        assert reclaimed == {"$add": [{"$ifNull": ["$retry_count", 0]}, 1]}
+        assert fresh == {"$ifNull": ["$retry_count", 0]}
+
+    @pytest.mark.asyncio
+    async def test_claim_job_skips_exhausted_expired_jobs(self, queue, mock_collection) -> None:
+        """Expired jobs whose next attempt would reach max_retries are not reclaimed."""
+        mock_collection.find_one_and_update.return_value = None
+
+        await queue.claim_job("worker-a", lease_seconds=60, max_retries=3)
+
+        query = mock_collection.find_one_and_update.call_args[0][0]
+        expired_clause = next(c for c in query["$or"] if "lease_expires_at" in c)
+        assert expired_clause["retry_count"] == {"$lt": 2}
+
+    @pytest.mark.asyncio
+    async def test_claim_job_excludes_saturated_sources(self, queue, mock_collection) -> None:
+        """Sources at their concurrency cap are excluded from the claim."""
+        mock_collection.find_one_and_update.return_value = None
+
+        await queue.claim_job("worker-a", lease_seconds=60, exclude_sources={"b-source", "a-source"})
+
+        query = mock_collection.find_one_and_update.call_args[0][0]
+        assert query["source_id"] == {"$nin": ["a-source", "b-source"]}
+
+    @pytest.mark.asyncio
+    async def test_claim_job_returns_none_when_empty(self, queue, mock_collection) -> None:
+        """No available job returns None."""
+        mock_collection.find_one_and_update.return_value = None
+
+        assert await queue.claim_job("worker-a", lease_seconds=60) is None
+
+
+class TestFailExhaustedLeases:
+    """Tests for the max-retries cutoff on expired leases."""
+
+    @pytest.mark.asyncio
+    async def test_exhausted_expired_jobs_are_failed(self, queue, mock_collection) -> None:
+        """Poison jobs are moved to failed and their lease released."""
+        mock_collection.update_many.return_value = MagicMock(modified_count=2)
+
+        assert await queue.fail_exhausted_leases(max_retries=3) == 2
+
+        query, update = mock_collection.update_many.call_args[0]
+        assert query["status"] == {"$in": ["processing", "extracting"]}
+        assert query["retry_count"] == {"$gte": 2}
+        assert "$lt" in query["lease_expires_at"]
+        assert update["$set"]["status"] == "failed"
+        assert update["$set"]["lease_owner"] is None
+        assert update["$inc"] == {"retry_count": 1}
+
+
+class TestRenewLease:
+    """Tests for lease heartbeat renewal."""
+
+    @pytest.mark.asyncio
+    async def test_renew_lease_success(self, queue, mock_collection) -> None:
+        """Renewal is scoped to the owning worker and a leased status."""
+        mock_collection.update_one.return_value = MagicMock(matched_count=1)
+
+        assert await queue.renew_lease("ing-001", "worker-a", lease_seconds=60) is True
+
+        query, update = mock_collection.update_one.call_args[0]
+        assert query["ingestion_id"] == "ing-001"
+        assert query["lease_owner"] == "worker-a"
+        assert query["status"] == {"$in": ["processing", "extracting"]}
+        assert "lease_expires_at" in update["$set"]
+
+    @pytest.mark.asyncio
+    async def test_renew_lease_lost(self, queue, mock_collection) -> None:
+        """Renewal fails when another worker reclaimed the job."""
+        mock_collection.update_one.return_value = MagicMock(matched_count=0)
+
+        assert await queue.renew_lease("ing-001", "worker-a", lease_seconds=60) is False
+
+
+class TestLeaseRelease:
+    """Tests for lease release on status transitions."""
+
+    @pytest.mark.asyncio
+    async def test_terminal_status_clears_lease(self, queue, mock_collection) -> None:
+        """Completed/failed/queued statuses release the lease."""
+        mock_collection.update_one.return_value = MagicMock(modified_count=1)
+
+        for status in ("completed", "failed", "queued"):
+            await queue.update_job_status("ing-001", status)
+            update = mock_collection.update_one.call_args[0][1]
+            assert update["$set"]["lease_owner"] is None
+            assert update["$set"]["lease_expires_at"] is None
+
+    @pytest.mark.asyncio
+    async def test_lease_owner_scopes_status_update(self, queue, mock_collection) -> None:
+        """A lease_owner filter stops a reclaimed worker overwriting the new owner."""
+        mock_collection.update_one.return_value = MagicMock(modified_count=0)
+
+        assert await queue.update_job_status("ing-001", "completed", lease_owner="worker-a") is False
+
+        query = mock_collection.update_one.call_args[0][0]
+        assert query == {"ingestion_id": "ing-001", "lease_owner": "worker-a"}
+
+    @pytest.mark.asyncio
+    async def test_leased_status_keeps_lease(self, queue, mock_collection) -> None:
+        """Moving between leased statuses keeps the lease."""
+        mock_collection.update_one.return_value = MagicMock(modified_count=1)
+
+        await queue.update_job_status("ing-001", "extracting")
+
+        update = mock_collection.update_one.call_args[0][1]
+        assert "lease_owner" not in update["$set"]
+
+
+def _mock_stream(changes: list[dict], then: BaseException | None = None) -> MagicMock:
+    """Build a mock change stream context manager yielding the given changes."""
+    remaining = list(changes)
+
+    async def next_change(*_args):
+        if remaining:
+            return remaining.pop(0)
+        if then is not None:
+            raise then
+        await asyncio.Event().wait()
+
+    stream = MagicMock()
+    stream.__aenter__ = AsyncMock(return_value=stream)
+    stream.__aexit__ = AsyncMock(return_value=False)
+    stream.__aiter__ = lambda self: self
+    stream.__anext__ = next_change
+    return stream
+
+
+class TestChangeStreamWakeup:
+    """Tests for push mode change stream wakeup."""
+
+    @pytest.mark.asyncio
+    async def test_insert_wakes_waiting_worker(self, queue, mock_collection) -> None:
+        """A change event signals wait_for_job and stores the resume token."""
+        mock_collection.watch = MagicMock(return_value=_mock_stream([{"_id": {"_data": "token-1"}}]))
+
+        await queue.start_change_stream()
+        await asyncio.wait_for(queue.wait_for_job(), timeout=1)
+        await asyncio.sleep(0)
+
+        assert queue._resume_token == {"_data": "token-1"}
+        pipeline = mock_collection.watch.call_args[0][0]
+        assert {"operationType": "insert"} in pipeline[0]["$match"]["$or"]
+
+        await queue.stop_change_stream()
+        assert queue.change_stream_active is False
+
+    @pytest.mark.asyncio
+    async def test_wait_for_job_consumes_signal(self, queue) -> None:
+        """Each signal triggers exactly one wakeup."""
+        queue._job_available.set()
+
+        await asyncio.wait_for(queue.wait_for_job(), timeout=1)
+
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(queue.wait_for_job(), timeout=0.02)
+
+    @pytest.mark.asyncio
+    async def test_lost_resume_token_restarts_stream(self, queue, mock_collection, monkeypatch) -> None:
+        """History-lost errors drop the resume token and reconnect from now."""
+        real_sleep = asyncio.sleep
+        monkeypatch.setattr(asyncio, "sleep", AsyncMock())
+        queue._resume_token = {"_data": "stale"}
+        mock_collection.watch = MagicMock(
+            side_effect=[
+                _mock_stream([], then=OperationFailure("history lost", code=286)),
+                _mock_stream([]),
+            ]
+        )
+
+        await queue.start_change_stream()
+        for _ in range(10):
+            await real_sleep(0)
+            if mock_collection.watch.call_count == 2:
+                break
+
+        assert mock_collection.watch.call_count == 2
+        assert mock_collection.watch.call_args_list[1].kwargs["resume_after"] is None
+
+        monkeypatch.undo()
+        await queue.stop_change_stream()
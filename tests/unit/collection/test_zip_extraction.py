@@ -6,9 +6,12 @@ Tests cover:
 - Document creation with config-driven fields
 - Atomic batch storage
 - Error handling (corrupt ZIP, missing manifest, etc.)
+- Streamed download size limit
 - Event emission
 """
 
+import asyncio
+import hashlib
 import io
 import json
 import zipfile
@@ -17,11 +20,16 @@ from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from collection_model.domain.exceptions import BlobTooLargeError
 from collection_model.domain.ingestion_job import IngestionJob
 from collection_model.domain.manifest import ManifestFile, ZipManifest
-from collection_model.infrastructure.blob_storage import BlobReference
+from collection_model.infrastructure.blob_storage import BlobReference, BlobStorageClient
 from collection_model.processors.registry import ProcessorRegistry
-from collection_model.processors.zip_extraction import ZipExtractionProcessor
+from collection_model.processors.zip_extraction import (
+    MAX_PARALLEL_DOCUMENTS,
+    MAX_ZIP_SIZE_BYTES,
+    ZipExtractionProcessor,
+)
 from fp_common.models.source_config import SourceConfig
 
 
@@ -43,6 +51,21 @@ def create_test_zip(
     return buffer.getvalue()
 
 
+def stream_download_blob(client: MagicMock):
+    """Build a download_blob_to_file side effect streaming client.download_blob's content."""
+
+    async def _download_to_file(container, blob_path, destination, on_chunk=None, max_bytes=None):
+        content = client.download_blob.return_value
+        for start in range(0, len(content), 1024):
+            chunk = content[start : start + 1024]
+            destination.write(chunk)
+            if on_chunk:
+                on_chunk(chunk)
+        return len(content)
+
+    return _download_to_file
+
+
 def create_sample_manifest(
     source_id: str = "qc-analyzer-exceptions",
     documents: list[dict[str, Any]] | None = None,
@@ -70,6 +93,39 @@ def create_sample_manifest(
     }
 
 
+class TestStreamedDownloadLimit:
+    """Tests for BlobStorageClient.download_blob_to_file size limit."""
+
+    @pytest.mark.asyncio
+    async def test_download_stops_once_limit_is_passed(self) -> None:
+        """No chunk after the one crossing max_bytes is read or written."""
+        chunks_read = 0
+
+        async def chunks():
+            nonlocal chunks_read
+            for _ in range(100):
+                chunks_read += 1
+                yield b"x" * 10
+
+        stream = MagicMock()
+        stream.chunks = chunks
+        blob_client = MagicMock()
+        blob_client.exists = AsyncMock(return_value=True)
+        blob_client.download_blob = AsyncMock(return_value=stream)
+        service_client = MagicMock()
+        service_client.get_blob_client.return_value = blob_client
+
+        client = BlobStorageClient(connection_string="UseDevelopmentStorage=true")
+        client._get_client = AsyncMock(return_value=service_client)
+        destination = io.BytesIO()
+
+        with pytest.raises(BlobTooLargeError):
+            await client.download_blob_to_file("container", "big.zip", destination, max_bytes=25)
+
+        assert chunks_read == 3
+        assert destination.getvalue() == b"x" * 20
+
+
 class TestZipManifestModel:
     """Tests for ZipManifest Pydantic model."""
 
@@ -158,6 +214,7 @@ class TestZipExtractionProcessor:
             size_bytes=1000,
         )
         client.download_blob = AsyncMock()
+        client.download_blob_to_file = AsyncMock(side_effect=stream_download_blob(client))
         client.upload_blob = AsyncMock(return_value=blob_ref)
         return client
 
@@ -277,7 +334,7 @@ class TestZipExtractionProcessor:
         assert result.extracted_data["document_count"] == 1
 
         # Verify steps were called
-        mock_blob_client.download_blob.assert_called_once()
+        mock_blob_client.download_blob_to_file.assert_called_once()
         mock_raw_store.store_raw_document.assert_called_once()
         mock_doc_repo.save.assert_called_once()
         mock_event_publisher.publish.assert_called_once()
@@ -570,6 +627,194 @@ class TestZipExtractionProcessor:
         assert processor._guess_mime_type("unknown.xyz") == "application/octet-stream"
         assert processor._guess_mime_type("noextension") == "application/octet-stream"
 
+    @pytest.mark.asyncio
+    async def test_process_streams_zip_to_raw_store(
+        self,
+        mock_blob_client: MagicMock,
+        mock_raw_store: MagicMock,
+        mock_doc_repo: MagicMock,
+        mock_event_publisher: MagicMock,
+        sample_job: IngestionJob,
+        sample_source_config: SourceConfig,
+    ) -> None:
+        """Raw ZIP is stored from the spool with a hash computed during download."""
+        zip_content = create_test_zip(
+            create_sample_manifest(),
+            {"images/leaf_001.jpg": b"fake image data", "metadata/leaf_001.json": b"{}"},
+        )
+        mock_blob_client.download_blob = AsyncMock(return_value=zip_content)
+        stored_bytes: list[bytes] = []
+
+        async def capture_raw(content, **kwargs):
+            content.seek(0)
+            stored_bytes.append(content.read())
+            return mock_raw_store.store_raw_document.return_value
+
+        mock_raw_store.store_raw_document.side_effect = capture_raw
+
+        processor = ZipExtractionProcessor()
+        processor.set_dependencies(
+            blob_client=mock_blob_client,
+            raw_document_store=mock_raw_store,
+            ai_model_client=MagicMock(),
+            document_repository=mock_doc_repo,
+            event_publisher=mock_event_publisher,
+        )
+
+        result = await processor.process(sample_job, sample_source_config)
+
+        assert result.success is True
+        mock_blob_client.download_blob.assert_not_called()
+        kwargs = mock_raw_store.store_raw_document.call_args.kwargs
+        assert not isinstance(kwargs["content"], bytes)
+        assert kwargs["content_hash"] == hashlib.sha256(zip_content).hexdigest()
+        assert kwargs["size_bytes"] == len(zip_content)
+        assert stored_bytes == [zip_content]
+
+    @pytest.mark.asyncio
+    async def test_process_rejects_oversized_zip_before_download(
+        self,
+        mock_blob_client: MagicMock,
+        mock_raw_store: MagicMock,
+        sample_job: IngestionJob,
+        sample_source_config: SourceConfig,
+    ) -> None:
+        """A known content_length above the limit fails without downloading."""
+        sample_job.content_length = MAX_ZIP_SIZE_BYTES + 1
+
+        processor = ZipExtractionProcessor()
+        processor.set_dependencies(
+            blob_client=mock_blob_client,
+            raw_document_store=mock_raw_store,
+            ai_model_client=MagicMock(),
+            document_repository=MagicMock(),
+            event_publisher=MagicMock(),
+        )
+
+        result = await processor.process(sample_job, sample_source_config)
+
+        assert result.success is False
+        assert result.error_type == "extraction"
+        assert "maximum size" in result.error_message
+        mock_blob_client.download_blob_to_file.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_process_rejects_zip_exceeding_limit_during_download(
+        self,
+        mock_blob_client: MagicMock,
+        mock_raw_store: MagicMock,
+        sample_job: IngestionJob,
+        sample_source_config: SourceConfig,
+    ) -> None:
+        """A ZIP without content_length is capped by the streamed download."""
+        mock_blob_client.download_blob_to_file = AsyncMock(side_effect=BlobTooLargeError("too large"))
+
+        processor = ZipExtractionProcessor()
+        processor.set_dependencies(
+            blob_client=mock_blob_client,
+            raw_document_store=mock_raw_store,
+            ai_model_client=MagicMock(),
+            document_repository=MagicMock(),
+            event_publisher=MagicMock(),
+        )
+
+        result = await processor.process(sample_job, sample_source_config)
+
+        assert result.success is False
+        assert result.error_type == "extraction"
+        assert "maximum size" in result.error_message
+        assert mock_blob_client.download_blob_to_file.call_args.kwargs["max_bytes"] == MAX_ZIP_SIZE_BYTES
+        mock_raw_store.store_raw_document.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_process_documents_in_parallel_preserving_order(
+        self,
+        mock_blob_client: MagicMock,
+        mock_raw_store: MagicMock,
+        mock_doc_repo: MagicMock,
+        mock_event_publisher: MagicMock,
+        sample_job: IngestionJob,
+        sample_source_config: SourceConfig,
+    ) -> None:
+        """Documents upload concurrently (bounded) and keep manifest order."""
+        documents = [
+            {"document_id": f"leaf_{i:03d}", "files": [{"path": f"images/leaf_{i:03d}.jpg", "role": "image"}]}
+            for i in range(20)
+        ]
+        files = {f"images/leaf_{i:03d}.jpg": f"image {i}".encode() for i in range(20)}
+        mock_blob_client.download_blob = AsyncMock(
+            return_value=create_test_zip(create_sample_manifest(documents=documents), files)
+        )
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_upload(container, blob_path, content, content_type):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return BlobReference(container=container, blob_path=blob_path, content_type=content_type)
+
+        mock_blob_client.upload_blob = AsyncMock(side_effect=slow_upload)
+
+        processor = ZipExtractionProcessor()
+        processor.set_dependencies(
+            blob_client=mock_blob_client,
+            raw_document_store=mock_raw_store,
+            ai_model_client=MagicMock(),
+            document_repository=mock_doc_repo,
+            event_publisher=mock_event_publisher,
+        )
+
+        result = await processor.process(sample_job, sample_source_config)
+
+        assert result.success is True
+        assert 1 < peak <= MAX_PARALLEL_DOCUMENTS
+        assert result.extracted_data["document_ids"] == [
+            f"qc-analyzer-exceptions/WM-4521/leaf_{i:03d}" for i in range(20)
+        ]
+        assert mock_doc_repo.save.call_count == 20
+
+    @pytest.mark.asyncio
+    async def test_parallel_failure_stores_nothing(
+        self,
+        mock_blob_client: MagicMock,
+        mock_raw_store: MagicMock,
+        mock_doc_repo: MagicMock,
+        mock_event_publisher: MagicMock,
+        sample_job: IngestionJob,
+        sample_source_config: SourceConfig,
+    ) -> None:
+        """A failing document aborts the batch before any document is stored."""
+        documents = [
+            {"document_id": f"leaf_{i:03d}", "files": [{"path": f"images/leaf_{i:03d}.jpg", "role": "image"}]}
+            for i in range(10)
+        ]
+        # leaf_005 is listed in the manifest but missing from the archive
+        files = {f"images/leaf_{i:03d}.jpg": b"image" for i in range(10) if i != 5}
+        mock_blob_client.download_blob = AsyncMock(
+            return_value=create_test_zip(create_sample_manifest(documents=documents), files)
+        )
+
+        processor = ZipExtractionProcessor()
+        processor.set_dependencies(
+            blob_client=mock_blob_client,
+            raw_document_store=mock_raw_store,
+            ai_model_client=MagicMock(),
+            document_repository=mock_doc_repo,
+            event_publisher=mock_event_publisher,
+        )
+
+        result = await processor.process(sample_job, sample_source_config)
+
+        assert result.success is False
+        assert result.error_type == "extraction"
+        assert "leaf_005" in result.error_message
+        mock_doc_repo.save.assert_not_called()
+        mock_event_publisher.publish.assert_not_called()
+
 
 class TestZipExtractionProcessorDeduplication:
     """Tests for ZIP processor duplicate detection (Story 2.6)."""
@@ -585,6 +830,7 @@ class TestZipExtractionProcessorDeduplication:
             size_bytes=1000,
         )
         client.download_blob = AsyncMock()
+        client.download_blob_to_file = AsyncMock(side_effect=stream_download_blob(client))
         client.upload_blob = AsyncMock(return_value=blob_ref)
         return client
 
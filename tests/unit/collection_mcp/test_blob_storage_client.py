@@ -0,0 +1,130 @@
+"""Unit tests for BlobStorageClient download caching.
+
+Tests:
+- Repeated downloads served from the cache while the ETag is unchanged
+- Overwritten blobs (new ETag) downloaded again
+- Missing blobs raising BlobNotFoundError
+- LRU eviction by byte budget and oversized blobs not cached
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+from collection_mcp.infrastructure.blob_storage_client import (
+    BlobNotFoundError,
+    BlobStorageClient,
+)
+
+
+class FakeBlobs:
+    """In-memory blob container exposing the BlobClient calls used by the client."""
+
+    def __init__(self) -> None:
+        self.blobs: dict[str, tuple[str, bytes]] = {}
+        self.downloads: list[str] = []
+
+    def put(self, blob_path: str, content: bytes, etag: str) -> None:
+        self.blobs[blob_path] = (etag, content)
+
+    def get_blob_client(self, container: str, blob: str) -> MagicMock:
+        blob_client = MagicMock()
+
+        async def _properties():
+            if blob not in self.blobs:
+                raise ResourceNotFoundError("not found")
+            return MagicMock(etag=self.blobs[blob][0])
+
+        async def _download():
+            self.downloads.append(blob)
+            etag, content = self.blobs[blob]
+            stream = MagicMock()
+            stream.properties.etag = etag
+            stream.readall = AsyncMock(return_value=content)
+            return stream
+
+        blob_client.get_blob_properties = AsyncMock(side_effect=_properties)
+        blob_client.download_blob = AsyncMock(side_effect=_download)
+        return blob_client
+
+
+@pytest.fixture
+def blobs() -> FakeBlobs:
+    """In-memory blobs."""
+    return FakeBlobs()
+
+
+def _client(blobs: FakeBlobs, **kwargs) -> BlobStorageClient:
+    client = BlobStorageClient("UseDevelopmentStorage=true", **kwargs)
+    client._client = blobs  # type: ignore[assignment]
+    return client
+
+
+class TestBlobCache:
+    """Tests for the ETag-validated LRU cache."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_blob_served_from_cache(self, blobs: FakeBlobs) -> None:
+        """Test a second download with the same ETag transfers nothing."""
+        blobs.put("thumbs/doc-1.jpg", b"thumbnail", etag='"0x1"')
+        client = _client(blobs)
+
+        assert await client.download_blob("thumbnails", "thumbs/doc-1.jpg") == b"thumbnail"
+        assert await client.download_blob("thumbnails", "thumbs/doc-1.jpg") == b"thumbnail"
+
+        assert blobs.downloads == ["thumbs/doc-1.jpg"]
+        assert (client.cache_hits, client.cache_misses) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_overwritten_blob_downloaded_again(self, blobs: FakeBlobs) -> None:
+        """Test a new ETag invalidates the cached copy."""
+        blobs.put("img.jpg", b"old", etag='"0x1"')
+        client = _client(blobs)
+        await client.download_blob("images", "img.jpg")
+
+        blobs.put("img.jpg", b"new", etag='"0x2"')
+
+        assert await client.download_blob("images", "img.jpg") == b"new"
+        assert await client.download_blob("images", "img.jpg") == b"new"
+        assert blobs.downloads == ["img.jpg", "img.jpg"]
+
+    @pytest.mark.asyncio
+    async def test_missing_blob_raises(self, blobs: FakeBlobs) -> None:
+        """Test a missing blob raises BlobNotFoundError."""
+        client = _client(blobs)
+
+        with pytest.raises(BlobNotFoundError):
+            await client.download_blob("images", "missing.jpg")
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_and_size_limits(self, blobs: FakeBlobs) -> None:
+        """Test least recently used blobs are evicted and oversized blobs are not cached."""
+        for name in ("a", "b", "c"):
+            blobs.put(name, name.encode() * 4, etag=name)
+        blobs.put("big", b"x" * 6, etag="big")
+        client = _client(blobs, cache_max_bytes=8, cache_max_entry_bytes=5)
+
+        await client.download_blob("c1", "a")
+        await client.download_blob("c1", "b")
+        await client.download_blob("c1", "a")  # a is now most recently used
+        await client.download_blob("c1", "c")  # evicts b
+        await client.download_blob("c1", "big")  # too large to cache
+        blobs.downloads.clear()
+
+        await client.download_blob("c1", "a")
+        await client.download_blob("c1", "c")
+        await client.download_blob("c1", "b")
+        await client.download_blob("c1", "big")
+
+        assert blobs.downloads == ["b", "big"]
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled(self, blobs: FakeBlobs) -> None:
+        """Test cache_max_bytes=0 always downloads."""
+        blobs.put("img.jpg", b"bytes", etag="e")
+        client = _client(blobs, cache_max_bytes=0)
+
+        await client.download_blob("images", "img.jpg")
+        await client.download_blob("images", "img.jpg")
+
+        assert blobs.downloads == ["img.jpg", "img.jpg"]
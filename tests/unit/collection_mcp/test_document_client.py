@@ -418,3 +418,50 @@ class TestDocumentClientSearchDocuments:
 
         # The limit should be capped in the method
         # (Implementation detail - verified via code review)
+
+    @pytest.mark.asyncio
+    async def test_search_documents_composes_farmer_and_source_filters(self, client: DocumentClient) -> None:
+        """Verify farmer and source filters are kept as separate clauses of the text query."""
+        mock_cursor = MagicMock()
+        mock_cursor.sort = MagicMock(return_value=MockAsyncCursor([]))
+        client._default_collection = MagicMock()
+        client._default_collection.find = MagicMock(return_value=mock_cursor)
+
+        result = await client.search_documents(
+            query_text='-"Coarse" leaf!', source_ids=["qc-analyzer-result"], farmer_id="WM-0001"
+        )
+
+        assert result == []
+        # No regex fallback for an empty text result
+        client._default_collection.find.assert_called_once()
+        query = client._default_collection.find.call_args[0][0]
+        assert query["$text"] == {"$search": "coarse leaf"}
+        assert query["$and"] == [
+            {"ingestion.source_id": {"$in": ["qc-analyzer-result"]}},
+            {"$or": [{"linkage_fields.farmer_id": "WM-0001"}, {"extracted_fields.farmer_id": "WM-0001"}]},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_documents_regex_fallback_without_text_index(self, client: DocumentClient) -> None:
+        """Verify a missing text index falls back to an escaped regex that keeps the filters."""
+        from pymongo.errors import OperationFailure
+
+        text_cursor = MagicMock()
+        text_cursor.sort = MagicMock(side_effect=OperationFailure("text index required", code=27))
+        client._default_collection = MagicMock()
+        client._default_collection.find = MagicMock(side_effect=[text_cursor, MockAsyncCursor([])])
+
+        await client.search_documents(query_text="doc-00.1", farmer_id="WM-0001")
+
+        regex_query = client._default_collection.find.call_args_list[1][0][0]
+        farmer_clause, id_clause = regex_query["$and"]
+        assert "$or" in farmer_clause
+        assert id_clause == {"document_id": {"$regex": r"doc\-00\.1", "$options": "i"}}
+
+    @pytest.mark.asyncio
+    async def test_search_documents_without_terms(self, client: DocumentClient) -> None:
+        """Verify a query with no searchable terms returns nothing without querying."""
+        client._default_collection = MagicMock()
+
+        assert await client.search_documents(query_text=" -- ") == []
+        client._default_collection.find.assert_not_called()
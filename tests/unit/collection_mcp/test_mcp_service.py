@@ -100,10 +100,12 @@ class MockToolCallRequest:
         tool_name: str,
         arguments: dict[str, Any] | None = None,
         caller_agent_id: str = "test-agent",
+        accept_binary: bool = False,
     ) -> None:
         self.tool_name = tool_name
         self.arguments_json = json.dumps(arguments) if arguments else ""
         self.caller_agent_id = caller_agent_id
+        self.accept_binary = accept_binary
 
 
 class MockListToolsRequest:
@@ -575,6 +577,55 @@ class TestGetDocumentImageHandler:
         decoded = base64.b64decode(result["image_base64"])
         assert decoded == b"test_image_bytes"
 
+    @pytest.mark.asyncio
+    async def test_get_document_image_binary_transport(
+        self,
+        servicer_with_blob_storage: McpToolServiceServicer,
+        mock_document_client: MagicMock,
+        mock_blob_storage_client: MagicMock,
+    ) -> None:
+        """Verify callers accepting binary get raw bytes and metadata-only JSON."""
+        now = datetime.now(UTC)
+        mock_document_client.get_document_by_id.return_value = Document(
+            document_id="doc-001",
+            raw_document=RawDocumentRef(
+                blob_container="images",
+                blob_path="path/to/image.jpg",
+                content_hash="abc123",
+                size_bytes=1024,
+                stored_at=now,
+            ),
+            extraction=ExtractionMetadata(
+                ai_agent_id="test",
+                extraction_timestamp=now,
+                confidence=0.95,
+                validation_passed=True,
+            ),
+            ingestion=IngestionMetadata(
+                ingestion_id="ing-001",
+                source_id="test-source",
+                received_at=now,
+                processed_at=now,
+            ),
+            created_at=now,
+        )
+        mock_blob_storage_client.download_blob.return_value = b"\xff\xd8raw_jpeg"
+
+        request = MockToolCallRequest(
+            tool_name="get_document_image",
+            arguments={"document_id": "doc-001"},
+            accept_binary=True,
+        )
+
+        response = await servicer_with_blob_storage.CallTool(request, MockContext())
+
+        assert response.success is True
+        assert response.result_binary == b"\xff\xd8raw_jpeg"
+        result = json.loads(response.result_json)
+        assert "image_base64" not in result
+        assert result["content_type"] == "image/jpeg"
+        assert result["size_bytes"] == len(b"\xff\xd8raw_jpeg")
+
     @pytest.mark.asyncio
     async def test_get_document_image_png_content_type(
         self,
@@ -2,7 +2,8 @@
 
 Story 0.5.1a: Tests for CollectionServiceServicer gRPC handlers.
 Tests all 4 document query methods: GetDocument, ListDocuments,
-GetDocumentsByFarmer, SearchDocuments.
+GetDocumentsByFarmer, SearchDocuments, including keyset page tokens and
+cached total counts.
 """
 
 import copy
@@ -53,6 +54,15 @@ def _matches_filter(doc: dict[str, Any], filter: dict[str, Any]) -> bool:
         True if document matches all filter criteria.
     """
     for key, expected in filter.items():
+        # Handle logical operators
+        if key == "$or":
+            if not any(_matches_filter(doc, clause) for clause in expected):
+                return False
+            continue
+        if key == "$and":
+            if not all(_matches_filter(doc, clause) for clause in expected):
+                return False
+            continue
         # Handle operators
         if isinstance(expected, dict):
             actual = _get_nested_value(doc, key)
@@ -79,8 +89,7 @@ class MockMongoCursorWithNestedFields:
         self._documents = documents
         self._skip = 0
         self._limit_val: int | None = None
-        self._sort_key: str | None = None
-        self._sort_direction: int = 1
+        self._sort_keys: list[tuple[str, int]] = []
 
     def __aiter__(self) -> "MockMongoCursorWithNestedFields":
         return self
@@ -101,10 +110,11 @@ class MockMongoCursorWithNestedFields:
     def _get_sorted_docs(self) -> list[dict[str, Any]]:
         """Get documents with sorting applied."""
         docs = self._documents.copy()
-        if self._sort_key:
+        # Stable sorts applied from the least significant key
+        for key, direction in reversed(self._sort_keys):
             docs.sort(
-                key=lambda d: _get_nested_value(d, self._sort_key) or "",
-                reverse=self._sort_direction == -1,
+                key=lambda d, key=key: _get_nested_value(d, key) or "",
+                reverse=direction == -1,
             )
         return docs
 
@@ -131,8 +141,9 @@ class MockMongoCursorWithNestedFields:
     def sort(self, key_or_list: Any, direction: int = 1) -> "MockMongoCursorWithNestedFields":
         """Sort documents."""
         if isinstance(key_or_list, str):
-            self._sort_key = key_or_list
-            self._sort_direction = direction
+            self._sort_keys = [(key_or_list, direction)]
+        else:
+            self._sort_keys = list(key_or_list)
         return self
 
 
@@ -168,8 +179,13 @@ class MockMongoCollectionWithNestedFields:
 
     async def count_documents(self, filter: dict[str, Any]) -> int:
         """Mock count_documents operation with nested field support."""
+        self.count_calls = getattr(self, "count_calls", 0) + 1
         return sum(1 for doc in self._documents.values() if _matches_filter(doc, filter))
 
+    async def estimated_document_count(self) -> int:
+        """Mock estimated_document_count operation (collection metadata)."""
+        return len(self._documents)
+
 
 class MockMongoDatabaseWithNestedFields:
     """Mock MongoDB database with nested field support."""
@@ -422,6 +438,92 @@ async def test_list_documents_pagination(
     assert len(result2.documents) == 2
 
 
+@pytest.mark.asyncio
+async def test_list_documents_keyset_pages_cover_all_documents(
+    mock_db: MockMongoDatabaseWithNestedFields,
+    grpc_context: MagicMock,
+    sample_document_data: dict,
+) -> None:
+    """Test paging with keyset tokens returns every document once, newest first.
+
+    Documents share created_at timestamps, so document_id must break ties.
+    """
+    for i in range(7):
+        doc = copy.deepcopy(sample_document_data)
+        doc["document_id"] = f"doc-{i:03d}"
+        doc["created_at"] = datetime(2025, 12, 28, 10, i // 3, 0, tzinfo=UTC)
+        await mock_db["qc_documents"].insert_one(doc)
+
+    servicer = CollectionServiceServicer(mock_db)
+    seen: list[str] = []
+    page_token = ""
+    while True:
+        result = await servicer.ListDocuments(
+            collection_pb2.ListDocumentsRequest(collection_name="qc_documents", page_size=3, page_token=page_token),
+            grpc_context,
+        )
+        seen.extend(doc.document_id for doc in result.documents)
+        page_token = result.next_page_token
+        if not page_token:
+            break
+
+    assert seen == [f"doc-{i:03d}" for i in reversed(range(7))]
+
+
+@pytest.mark.asyncio
+async def test_list_documents_invalid_page_token_starts_over(
+    mock_db: MockMongoDatabaseWithNestedFields,
+    grpc_context: MagicMock,
+    sample_document_data: dict,
+) -> None:
+    """Test an unreadable (e.g. legacy offset) page token returns the first page."""
+    await mock_db["qc_documents"].insert_one(copy.deepcopy(sample_document_data))
+
+    servicer = CollectionServiceServicer(mock_db)
+    request = collection_pb2.ListDocumentsRequest(collection_name="qc_documents", page_token="20")
+
+    result = await servicer.ListDocuments(request, grpc_context)
+
+    assert [doc.document_id for doc in result.documents] == ["doc-001"]
+
+
+@pytest.mark.asyncio
+async def test_list_documents_total_count_cached_and_optional(
+    mock_db: MockMongoDatabaseWithNestedFields,
+    grpc_context: MagicMock,
+    sample_document_data: dict,
+) -> None:
+    """Test filtered counts are reused across pages and can be skipped."""
+    for i in range(4):
+        doc = copy.deepcopy(sample_document_data)
+        doc["document_id"] = f"doc-{i:03d}"
+        await mock_db["qc_documents"].insert_one(doc)
+
+    servicer = CollectionServiceServicer(mock_db)
+    request = collection_pb2.ListDocumentsRequest(collection_name="qc_documents", farmer_id="WM-0001", page_size=2)
+
+    first = await servicer.ListDocuments(request, grpc_context)
+    second = await servicer.ListDocuments(
+        collection_pb2.ListDocumentsRequest(
+            collection_name="qc_documents",
+            farmer_id="WM-0001",
+            page_size=2,
+            page_token=first.next_page_token,
+        ),
+        grpc_context,
+    )
+    skipped = await servicer.ListDocuments(
+        collection_pb2.ListDocumentsRequest(collection_name="qc_documents", farmer_id="WM-0001", skip_total_count=True),
+        grpc_context,
+    )
+
+    assert (first.total_count, first.total_count_estimated) == (4, False)
+    assert (second.total_count, second.total_count_estimated) == (4, True)
+    assert mock_db["qc_documents"].count_calls == 1
+    assert skipped.total_count == 0
+    assert len(skipped.documents) == 4
+
+
 @pytest.mark.asyncio
 async def test_list_documents_missing_collection_name(
     mock_db: MockMongoDatabaseWithNestedFields,
@@ -635,6 +737,18 @@ async def test_search_documents_pagination(
     assert result.total_count == 5
     assert result.next_page_token != ""
 
+    # Following pages continue after the cursor without repeating documents
+    request2 = collection_pb2.SearchDocumentsRequest(
+        collection_name="qc_documents",
+        page_size=4,
+        page_token=result.next_page_token,
+    )
+    result2 = await servicer.SearchDocuments(request2, grpc_context)
+
+    assert len(result2.documents) == 3
+    assert result2.next_page_token == ""
+    assert not {d.document_id for d in result.documents} & {d.document_id for d in result2.documents}
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONVERSION HELPER TESTS
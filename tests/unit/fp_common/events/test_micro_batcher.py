@@ -0,0 +1,129 @@
+"""Unit tests for MicroBatcher and the non-blocking subscription loop.
+
+Tests:
+- Flushing by batch size and by timer
+- Per-item errors delivered only to their own caller
+- Batch failure propagated to every caller
+- Flush of pending items on close
+- stream_subscription dispatching without waiting, and stopping on close
+"""
+
+import asyncio
+from collections.abc import Sequence
+from unittest.mock import MagicMock
+
+import pytest
+from dapr.common.pubsub.subscription import StreamInactiveError
+from fp_common.events import MicroBatcher, stream_subscription
+
+
+class _EchoBatcher(MicroBatcher[str, str]):
+    """Upper-cases each item; items starting with "!" fail, "boom" fails the batch."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.batches: list[list[str]] = []
+
+    async def _process_batch(self, items: list[str]) -> Sequence[str | BaseException]:
+        self.batches.append(items)
+        if "boom" in items:
+            raise ConnectionError("backend down")
+        return [ValueError(item) if item.startswith("!") else item.upper() for item in items]
+
+
+class TestMicroBatcher:
+    """Batch boundaries and per-item outcomes."""
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_immediately(self) -> None:
+        """Test reaching max_batch_size dispatches without waiting for the timer."""
+        batcher = _EchoBatcher(max_batch_size=3, max_wait_ms=60_000, max_pending=10)
+
+        results = await asyncio.wait_for(asyncio.gather(*(batcher.submit(x) for x in "abc")), timeout=1)
+
+        assert results == ["A", "B", "C"]
+        assert batcher.batches == [["a", "b", "c"]]
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_flushes_after_wait(self) -> None:
+        """Test items below max_batch_size are processed together when the timer fires."""
+        batcher = _EchoBatcher(max_batch_size=100, max_wait_ms=5, max_pending=10)
+
+        assert await asyncio.gather(batcher.submit("a"), batcher.submit("b")) == ["A", "B"]
+        assert batcher.batches == [["a", "b"]]
+
+    @pytest.mark.asyncio
+    async def test_item_error_fails_only_its_caller(self) -> None:
+        """Test an exception in the results is raised to that item's caller only."""
+        batcher = _EchoBatcher(max_batch_size=2, max_wait_ms=60_000, max_pending=10)
+
+        ok, failed = await asyncio.gather(batcher.submit("a"), batcher.submit("!b"), return_exceptions=True)
+
+        assert ok == "A"
+        assert isinstance(failed, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_fails_every_caller(self) -> None:
+        """Test an exception raised by _process_batch reaches all callers of that batch."""
+        batcher = _EchoBatcher(max_batch_size=2, max_wait_ms=60_000, max_pending=10)
+
+        results = await asyncio.gather(batcher.submit("a"), batcher.submit("boom"), return_exceptions=True)
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending(self) -> None:
+        """Test close processes items still waiting for their timer."""
+        batcher = _EchoBatcher(max_batch_size=100, max_wait_ms=60_000, max_pending=10)
+        pending = asyncio.create_task(batcher.submit("a"))
+        await asyncio.sleep(0)
+
+        await batcher.close()
+
+        assert await pending == "A"
+
+
+class TestStreamSubscription:
+    """Tests for the non-blocking receive loop."""
+
+    def test_dispatches_every_message_until_stream_closes(self) -> None:
+        """Test each message is dispatched (empty polls skipped) and the loop ends on close."""
+        messages = ["m1", None, "m2"]
+
+        def receive():
+            yield from messages
+            raise StreamInactiveError("closed")
+
+        subscription = MagicMock()
+        subscription.__iter__.side_effect = receive
+        dispatched: list[str] = []
+
+        def dispatch(sub, message, on_done) -> None:
+            assert sub is subscription
+            dispatched.append(message)
+            on_done()
+
+        stream_subscription(subscription, dispatch, max_pending=1)
+
+        assert dispatched == ["m1", "m2"]
+
+    def test_reconnects_after_stream_error(self) -> None:
+        """Test a dead stream is reconnected and consumption resumes."""
+        attempts = iter([RuntimeError("stream died"), StreamInactiveError("closed")])
+
+        def receive():
+            yield "m1"
+            raise next(attempts)
+
+        subscription = MagicMock()
+        subscription.__iter__.side_effect = receive
+        dispatched: list[str] = []
+
+        def dispatch(_sub, message, on_done) -> None:
+            dispatched.append(message)
+            on_done()
+
+        stream_subscription(subscription, dispatch, max_pending=2)
+
+        subscription.reconnect_stream.assert_called_once()
+        assert dispatched == ["m1", "m1"]
@@ -8,6 +8,7 @@ from fp_common.models.value_objects import (
     PaymentPolicy,
     PaymentPolicyType,
     QualityThresholds,
+    QualityTier,
 )
 from pydantic import ValidationError
 
@@ -141,6 +142,22 @@ class TestQualityThresholds:
             QualityThresholds(tier_1=85.0, tier_2=70.0, tier_3=75.0)
         assert "tier_3" in str(exc_info.value)
 
+    @pytest.mark.parametrize(
+        ("primary_percentage", "expected"),
+        [
+            (100.0, QualityTier.TIER_1),
+            (85.0, QualityTier.TIER_1),
+            (84.9, QualityTier.TIER_2),
+            (70.0, QualityTier.TIER_2),
+            (50.0, QualityTier.TIER_3),
+            (49.9, QualityTier.BELOW_TIER_3),
+            (0.0, QualityTier.BELOW_TIER_3),
+        ],
+    )
+    def test_quality_thresholds_classify(self, primary_percentage, expected):
+        """classify maps Primary % to a tier; thresholds are inclusive."""
+        assert QualityThresholds().classify(primary_percentage) == expected
+
 
 class TestPaymentPolicy:
     """Tests for PaymentPolicy value object."""
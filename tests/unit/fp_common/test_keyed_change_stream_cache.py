@@ -0,0 +1,257 @@
+"""Unit tests for KeyedMongoChangeStreamCache.
+
+Covers per-key loading, negative caching, partial invalidation from change
+stream events, the LRU bound, single-flight loading and TTL expiry.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fp_common.cache import KeyedMongoChangeStreamCache, MongoChangeStreamCache
+from pydantic import BaseModel
+
+
+class SampleModel(BaseModel):
+    """Sample Pydantic model for testing."""
+
+    id: str
+    name: str
+
+
+class SampleKeyedCache(KeyedMongoChangeStreamCache[SampleModel]):
+    """Concrete implementation for testing."""
+
+    def _get_cache_key(self, item: SampleModel) -> str:
+        return item.id
+
+    def _parse_document(self, doc: dict) -> SampleModel:
+        doc.pop("_id", None)
+        return SampleModel.model_validate(doc)
+
+    def _get_key_filter(self, key: str) -> dict:
+        return {"_id": key}
+
+
+@pytest.fixture
+def documents() -> dict[str, dict]:
+    """Documents served by the mock collection, by _id."""
+    return {
+        "a": {"_id": "a", "id": "a", "name": "Alpha"},
+        "b": {"_id": "b", "id": "b", "name": "Beta"},
+        "c": {"_id": "c", "id": "c", "name": "Gamma"},
+    }
+
+
+@pytest.fixture
+def mock_collection(documents: dict[str, dict]) -> MagicMock:
+    """Mock collection whose find_one looks documents up by _id."""
+    collection = MagicMock()
+
+    async def find_one(query: dict) -> dict | None:
+        doc = documents.get(query["_id"])
+        return dict(doc) if doc is not None else None
+
+    collection.find_one = AsyncMock(side_effect=find_one)
+    return collection
+
+
+@pytest.fixture
+def cache(mock_collection: MagicMock) -> SampleKeyedCache:
+    """Create a SampleKeyedCache over the mock collection."""
+    db = MagicMock()
+    db.__getitem__ = MagicMock(return_value=mock_collection)
+    return SampleKeyedCache(db=db, collection_name="samples", cache_name="sample_keyed", max_entries=2)
+
+
+class TestKeyedLookup:
+    """Hits, misses and negative caching."""
+
+    @pytest.mark.asyncio
+    async def test_miss_then_hit(self, cache: SampleKeyedCache, mock_collection: MagicMock) -> None:
+        """Test the first get loads one key and the second is served from memory."""
+        first = await cache.get("a")
+        second = await cache.get("a")
+
+        assert first == second == SampleModel(id="a", name="Alpha")
+        mock_collection.find_one.assert_awaited_once_with({"_id": "a"})
+
+    @pytest.mark.asyncio
+    async def test_missing_key_is_cached(self, cache: SampleKeyedCache, mock_collection: MagicMock) -> None:
+        """Test a key with no document is cached as None."""
+        assert await cache.get("missing") is None
+        assert await cache.get("missing") is None
+
+        assert mock_collection.find_one.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_all_scans_and_warms_entries(self, cache: SampleKeyedCache, mock_collection: MagicMock) -> None:
+        """Test get_all returns every document and later gets hit the LRU."""
+        docs = [{"_id": "a", "id": "a", "name": "Alpha"}, {"_id": "b", "id": "b", "name": "Beta"}]
+
+        async def find(_query: dict):
+            for doc in docs:
+                yield doc
+
+        mock_collection.find = MagicMock(side_effect=find)
+
+        items = await cache.get_all()
+
+        assert items == {"a": SampleModel(id="a", name="Alpha"), "b": SampleModel(id="b", name="Beta")}
+        mock_collection.find.assert_called_once_with({})
+        assert await cache.get("b") == SampleModel(id="b", name="Beta")
+        mock_collection.find_one.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_put_stores_without_loading(self, cache: SampleKeyedCache, mock_collection: MagicMock) -> None:
+        """Test put makes an item available without a read."""
+        cache.put(SampleModel(id="a", name="Written"))
+
+        assert (await cache.get("a")).name == "Written"
+        mock_collection.find_one.assert_not_called()
+
+
+class TestPartialInvalidation:
+    """Change stream events drop only affected entries."""
+
+    @pytest.mark.asyncio
+    async def test_update_drops_only_changed_document(
+        self, cache: SampleKeyedCache, mock_collection: MagicMock, documents: dict[str, dict]
+    ) -> None:
+        """Test an update invalidates the entry loaded from that document only."""
+        await cache.get("a")
+        await cache.get("b")
+        documents["a"]["name"] = "Alpha v2"
+
+        cache._on_change("update", "a")
+
+        assert (await cache.get("a")).name == "Alpha v2"
+        assert (await cache.get("b")).name == "Beta"
+        assert mock_collection.find_one.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_insert_drops_cached_misses(
+        self, cache: SampleKeyedCache, mock_collection: MagicMock, documents: dict[str, dict]
+    ) -> None:
+        """Test an insert makes previously missing keys load again."""
+        assert await cache.get("d") is None
+        documents["d"] = {"_id": "d", "id": "d", "name": "Delta"}
+
+        cache._on_change("insert", "d")
+
+        assert (await cache.get("d")).name == "Delta"
+
+    @pytest.mark.asyncio
+    async def test_delete_drops_entry(
+        self, cache: SampleKeyedCache, mock_collection: MagicMock, documents: dict[str, dict]
+    ) -> None:
+        """Test a delete invalidates the entry so the key becomes missing."""
+        await cache.get("a")
+        del documents["a"]
+
+        cache._on_change("delete", "a")
+
+        assert await cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_load_racing_invalidation_is_not_stored(
+        self, cache: SampleKeyedCache, mock_collection: MagicMock
+    ) -> None:
+        """Test a value read before an invalidation is returned but not cached."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_find_one(query: dict) -> dict:
+            started.set()
+            await release.wait()
+            return {"_id": "a", "id": "a", "name": "Stale"}
+
+        mock_collection.find_one = AsyncMock(side_effect=slow_find_one)
+        pending = asyncio.create_task(cache.get("a"))
+        await started.wait()
+        cache._on_change("update", "a")
+        release.set()
+
+        assert (await pending).name == "Stale"
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_manual_invalidation_clears_everything(self, cache: SampleKeyedCache) -> None:
+        """Test the public invalidate_cache still drops all entries."""
+        await cache.get("a")
+        await cache.get("b")
+
+        cache.invalidate_cache()
+
+        assert len(cache) == 0
+
+
+class TestBoundsAndConcurrency:
+    """LRU bound, TTL and single-flight."""
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self, cache: SampleKeyedCache, mock_collection: MagicMock) -> None:
+        """Test the least recently used key is evicted beyond max_entries."""
+        await cache.get("a")
+        await cache.get("b")
+        await cache.get("a")  # refresh a
+        await cache.get("c")  # evicts b
+
+        assert len(cache) == 2
+        await cache.get("a")
+        assert mock_collection.find_one.await_count == 3
+        await cache.get("b")
+        assert mock_collection.find_one.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_entry_expires_after_ttl(self, cache: SampleKeyedCache, mock_collection: MagicMock) -> None:
+        """Test entries older than CACHE_TTL_MINUTES are reloaded."""
+        now = time.monotonic()
+        with patch("fp_common.cache.keyed_change_stream_cache.time.monotonic", return_value=now):
+            await cache.get("a")
+        with patch(
+            "fp_common.cache.keyed_change_stream_cache.time.monotonic",
+            return_value=now + cache.CACHE_TTL_MINUTES * 60 + 1,
+        ):
+            await cache.get("a")
+
+        assert mock_collection.find_one.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self, cache: SampleKeyedCache, mock_collection: MagicMock) -> None:
+        """Test concurrent gets for the same key issue a single read."""
+        results = await asyncio.gather(*(cache.get("a") for _ in range(5)))
+
+        assert all(r.name == "Alpha" for r in results)
+        assert mock_collection.find_one.await_count == 1
+
+    def test_health_status(self, cache: SampleKeyedCache) -> None:
+        """Test health status reports size and bound."""
+        assert cache.get_health_status() == {"cache_size": 0, "max_entries": 2, "change_stream_active": False}
+
+
+class TestBaseOnChange:
+    """The base class keeps its all-or-nothing behavior."""
+
+    def test_default_on_change_invalidates_whole_cache(self) -> None:
+        """Test MongoChangeStreamCache._on_change drops the full cache."""
+
+        class FullCache(MongoChangeStreamCache[SampleModel]):
+            def _get_cache_key(self, item: SampleModel) -> str:
+                return item.id
+
+            def _parse_document(self, doc: dict) -> SampleModel:
+                return SampleModel.model_validate(doc)
+
+            def _get_filter(self) -> dict:
+                return {}
+
+        full = FullCache(db=MagicMock(), collection_name="samples", cache_name="sample_full")
+        full._cache = {"a": SampleModel(id="a", name="Alpha")}
+
+        full._on_change("update", "a")
+
+        assert full._cache is None
@@ -0,0 +1,215 @@
+"""Tests for AioMcpClient and McpChannelPool.
+
+Runs against an in-process grpc.aio McpToolService so pooling, metadata,
+deadlines and error mapping are exercised over a real channel.
+"""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+
+import grpc
+import pytest
+from fp_common.mcp.aio_client import AioMcpClient, McpChannelPool
+from fp_common.mcp.client import GrpcMcpClient
+from fp_common.mcp.errors import ErrorCode, McpToolError
+from fp_proto.mcp.v1 import mcp_tool_pb2, mcp_tool_pb2_grpc
+
+
+class FakeMcpServicer(mcp_tool_pb2_grpc.McpToolServiceServicer):
+    """McpToolService that echoes arguments and records call metadata."""
+
+    def __init__(self) -> None:
+        self.app_ids: list[str] = []
+        self.delay = 0.0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def CallTool(self, request, context):
+        self.app_ids.append(dict(context.invocation_metadata()).get("dapr-app-id", ""))
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        if request.tool_name == "fail":
+            return mcp_tool_pb2.ToolCallResponse(
+                success=False,
+                error_code=mcp_tool_pb2.ERROR_CODE_INVALID_ARGUMENTS,
+                error_message="bad input",
+            )
+        if request.tool_name == "crash":
+            await context.abort(grpc.StatusCode.INTERNAL, "boom")
+
+        result = {"tool": request.tool_name, "args": json.loads(request.arguments_json)}
+        if request.tool_name == "get_image" and request.accept_binary:
+            return mcp_tool_pb2.ToolCallResponse(
+                success=True, result_json=json.dumps(result), result_binary=b"\x89PNG raw"
+            )
+        return mcp_tool_pb2.ToolCallResponse(success=True, result_json=json.dumps(result))
+
+    async def ListTools(self, request, context):
+        return mcp_tool_pb2.ListToolsResponse(
+            tools=[
+                mcp_tool_pb2.ToolDefinition(
+                    name="get_farmer",
+                    description="Get farmer",
+                    input_schema_json='{"type": "object"}',
+                    category=request.category or "query",
+                )
+            ]
+        )
+
+
+@pytest.fixture
+async def mcp_server() -> AsyncIterator[tuple[FakeMcpServicer, McpChannelPool]]:
+    """Start an in-process MCP server and a pool pointed at it."""
+    servicer = FakeMcpServicer()
+    server = grpc.aio.server()
+    mcp_tool_pb2_grpc.add_McpToolServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    pool = McpChannelPool(target=f"127.0.0.1:{port}")
+    yield servicer, pool
+    await pool.close()
+    await server.stop(None)
+
+
+class TestAioMcpClientContract:
+    """AioMcpClient keeps the GrpcMcpClient contract."""
+
+    def test_is_grpc_mcp_client(self) -> None:
+        """Drop-in for places typed as GrpcMcpClient (GrpcMcpTool, registry)."""
+        assert isinstance(AioMcpClient("plantation-mcp"), GrpcMcpClient)
+
+    @pytest.mark.asyncio
+    async def test_call_tool_success(self, mcp_server) -> None:
+        """call_tool returns the deserialized result and sends dapr-app-id."""
+        servicer, pool = mcp_server
+        client = AioMcpClient("plantation-mcp", pool=pool)
+
+        result = await client.call_tool("get_farmer", {"farmer_id": "WM-4521"})
+
+        assert result == {"tool": "get_farmer", "args": {"farmer_id": "WM-4521"}}
+        assert servicer.app_ids == ["plantation-mcp"]
+
+    @pytest.mark.asyncio
+    async def test_call_tool_binary(self, mcp_server) -> None:
+        """call_tool_binary opts into binary transport and returns (metadata, bytes)."""
+        _, pool = mcp_server
+        client = AioMcpClient("collection-mcp", pool=pool)
+
+        result, payload = await client.call_tool_binary("get_image", {"document_id": "doc-1"})
+        _, no_payload = await client.call_tool_binary("get_farmer", {})
+
+        assert result == {"tool": "get_image", "args": {"document_id": "doc-1"}}
+        assert payload == b"\x89PNG raw"
+        assert no_payload == b""
+
+    @pytest.mark.asyncio
+    async def test_call_tool_failure_response_raises(self, mcp_server) -> None:
+        """Failure responses map to McpToolError with the response error code."""
+        _, pool = mcp_server
+        client = AioMcpClient("plantation-mcp", pool=pool)
+
+        with pytest.raises(McpToolError) as exc_info:
+            await client.call_tool("fail", {})
+
+        assert exc_info.value.error_code == ErrorCode.INVALID_ARGUMENTS
+        assert exc_info.value.message == "bad input"
+        assert exc_info.value.tool_name == "fail"
+
+    @pytest.mark.asyncio
+    async def test_list_tools(self, mcp_server) -> None:
+        """list_tools returns tool definitions with parsed schemas."""
+        _, pool = mcp_server
+        client = AioMcpClient("plantation-mcp", pool=pool)
+
+        tools = await client.list_tools(category="query")
+
+        assert tools == [
+            {
+                "name": "get_farmer",
+                "description": "Get farmer",
+                "input_schema": {"type": "object"},
+                "category": "query",
+            }
+        ]
+
+
+class TestAioMcpClientTransport:
+    """Deadlines, transport errors and pooling."""
+
+    @pytest.mark.asyncio
+    async def test_deadline_maps_to_service_unavailable(self, mcp_server) -> None:
+        """An expired per-call deadline raises SERVICE_UNAVAILABLE."""
+        servicer, pool = mcp_server
+        servicer.delay = 1.0
+        client = AioMcpClient("plantation-mcp", pool=pool)
+
+        with pytest.raises(McpToolError) as exc_info:
+            await client.call_tool("get_farmer", {}, timeout=0.05)
+
+        assert exc_info.value.error_code == ErrorCode.SERVICE_UNAVAILABLE
+        assert "DEADLINE_EXCEEDED" in exc_info.value.message
+
+    @pytest.mark.asyncio
+    async def test_unreachable_server_maps_to_service_unavailable(self) -> None:
+        """A sidecar that is not listening raises SERVICE_UNAVAILABLE."""
+        pool = McpChannelPool(target="127.0.0.1:1")
+        client = AioMcpClient("plantation-mcp", pool=pool, timeout=1.0)
+
+        with pytest.raises(McpToolError) as exc_info:
+            await client.call_tool("get_farmer", {})
+
+        assert exc_info.value.error_code == ErrorCode.SERVICE_UNAVAILABLE
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_other_rpc_errors_propagate(self, mcp_server) -> None:
+        """Non-transport gRPC errors are re-raised unchanged, as before."""
+        _, pool = mcp_server
+        client = AioMcpClient("plantation-mcp", pool=pool)
+
+        with pytest.raises(grpc.aio.AioRpcError) as exc_info:
+            await client.call_tool("crash", {})
+
+        assert exc_info.value.code() == grpc.StatusCode.INTERNAL
+
+    @pytest.mark.asyncio
+    async def test_channel_reused_per_app_id(self, mcp_server) -> None:
+        """Clients for the same app_id share one channel; other app_ids get their own."""
+        _, pool = mcp_server
+
+        first = pool.get_channel("plantation-mcp")
+        assert pool.get_channel("plantation-mcp") is first
+        assert pool.get_channel("collection-mcp") is not first
+
+        await AioMcpClient("plantation-mcp", pool=pool).call_tool("get_farmer", {})
+        await AioMcpClient("plantation-mcp", pool=pool).call_tool("get_farmer", {})
+        assert pool.get_channel("plantation-mcp") is first
+
+    @pytest.mark.asyncio
+    async def test_call_tools_fans_out_concurrently(self, mcp_server) -> None:
+        """Independent calls run concurrently and keep input order."""
+        servicer, pool = mcp_server
+        servicer.delay = 0.1
+        client = AioMcpClient("plantation-mcp", pool=pool)
+
+        results = await client.call_tools([("a", {"n": 1}), ("b", {"n": 2}), ("c", {"n": 3})])
+
+        assert [r["tool"] for r in results] == ["a", "b", "c"]
+        assert servicer.peak_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_call_tools_return_exceptions(self, mcp_server) -> None:
+        """With return_exceptions, a failing call does not hide the others."""
+        _, pool = mcp_server
+        client = AioMcpClient("plantation-mcp", pool=pool)
+
+        results = await client.call_tools([("ok", {}), ("fail", {})], return_exceptions=True)
+
+        assert results[0]["tool"] == "ok"
+        assert isinstance(results[1], McpToolError)
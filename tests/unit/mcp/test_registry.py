@@ -163,3 +163,17 @@ class TestMcpToolRegistryGetTool:
             assert isinstance(tool, GrpcMcpTool)
             assert tool.name == "get_farmer"
             assert tool.description == "Get farmer by ID"
+
+
+class TestMcpToolRegistryClientFactory:
+    """Tests for pluggable client construction."""
+
+    def test_client_factory_builds_registered_clients(self) -> None:
+        """Registry uses the given factory (e.g. AioMcpClient) for new servers."""
+        from fp_common.mcp.aio_client import AioMcpClient
+
+        registry = McpToolRegistry(client_factory=AioMcpClient)
+        registry.register_server("plantation-mcp")
+
+        assert isinstance(registry._clients["plantation-mcp"], AioMcpClient)
+        assert registry._clients["plantation-mcp"].app_id == "plantation-mcp"
@@ -0,0 +1,309 @@
+"""Tests for McpResultCache and CachingMcpClient."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fp_common.mcp.client import GrpcMcpClient
+from fp_common.mcp.errors import ErrorCode, McpToolError
+from fp_common.mcp.registry import McpToolRegistry
+from fp_common.mcp.result_cache import CachingMcpClient, McpResultCache, canonicalize_arguments
+from fp_common.mcp.tool import GrpcMcpTool
+
+TOOLS = [
+    {"name": "get_farmer", "description": "", "input_schema": {}, "category": "query"},
+    {"name": "search_documents", "description": "", "input_schema": {}, "category": "search"},
+    {"name": "create_ticket", "description": "", "input_schema": {}, "category": "command"},
+]
+
+
+def _inner_client(app_id: str = "plantation-mcp") -> GrpcMcpClient:
+    client = GrpcMcpClient(app_id)
+    client.call_tool = AsyncMock(side_effect=lambda tool_name, arguments, **_: {"tool": tool_name, "args": arguments})
+    client.list_tools = AsyncMock(return_value=TOOLS)
+    return client
+
+
+@pytest.fixture
+def cache() -> McpResultCache:
+    cache = McpResultCache()
+    cache.register_tools("plantation-mcp", TOOLS)
+    return cache
+
+
+class TestCanonicalArguments:
+    """Argument canonicalization for cache keys."""
+
+    def test_key_order_does_not_matter(self) -> None:
+        """Dicts with the same items produce the same key."""
+        assert canonicalize_arguments({"a": 1, "b": {"y": 2, "x": 1}}) == canonicalize_arguments(
+            {"b": {"x": 1, "y": 2}, "a": 1}
+        )
+
+    def test_different_values_differ(self) -> None:
+        """Different argument values produce different keys."""
+        assert canonicalize_arguments({"a": 1}) != canonicalize_arguments({"a": 2})
+
+
+class TestMcpResultCacheTtl:
+    """TTL resolution from tool metadata and explicit overrides."""
+
+    def test_ttl_from_category(self, cache: McpResultCache) -> None:
+        """Known categories map to their default TTL; others are uncached."""
+        assert cache.ttl_for("plantation-mcp", "get_farmer") == 60.0
+        assert cache.ttl_for("plantation-mcp", "search_documents") == 30.0
+        assert cache.ttl_for("plantation-mcp", "create_ticket") == 0.0
+        assert cache.ttl_for("plantation-mcp", "unknown_tool") == 0.0
+
+    def test_explicit_tool_ttl_overrides_metadata(self) -> None:
+        """tool_ttls wins over category metadata, including 0 to disable."""
+        cache = McpResultCache(tool_ttls={("plantation-mcp", "get_farmer"): 0, ("plantation-mcp", "create_ticket"): 5})
+        cache.register_tools("plantation-mcp", TOOLS)
+
+        assert cache.ttl_for("plantation-mcp", "get_farmer") == 0
+        assert cache.ttl_for("plantation-mcp", "create_ticket") == 5
+
+    @pytest.mark.asyncio
+    async def test_entry_expires_after_ttl(self, cache: McpResultCache) -> None:
+        """An expired entry triggers a fresh call."""
+        call = AsyncMock(return_value={"v": 1})
+
+        with patch("fp_common.mcp.result_cache.time.monotonic", return_value=1000.0):
+            await cache.get_or_call("plantation-mcp", "get_farmer", {"id": "1"}, call)
+            await cache.get_or_call("plantation-mcp", "get_farmer", {"id": "1"}, call)
+        assert call.await_count == 1
+
+        with patch("fp_common.mcp.result_cache.time.monotonic", return_value=1061.0):
+            await cache.get_or_call("plantation-mcp", "get_farmer", {"id": "1"}, call)
+        assert call.await_count == 2
+
+
+class TestMcpResultCacheLookup:
+    """Hits, misses, bounds and single-flight."""
+
+    @pytest.mark.asyncio
+    async def test_hit_returns_independent_copy(self, cache: McpResultCache) -> None:
+        """Repeated calls hit the cache and callers cannot mutate the cached value."""
+        call = AsyncMock(return_value={"items": [1]})
+
+        first = await cache.get_or_call("plantation-mcp", "get_farmer", {"id": "1"}, call)
+        first["items"].append(2)
+        second = await cache.get_or_call("plantation-mcp", "get_farmer", {"id": "1"}, call)
+
+        assert call.await_count == 1
+        assert second == {"items": [1]}
+
+    @pytest.mark.asyncio
+    async def test_uncached_tool_always_calls(self, cache: McpResultCache) -> None:
+        """Tools without a cacheable category bypass the cache."""
+        call = AsyncMock(return_value={"ok": True})
+
+        await cache.get_or_call("plantation-mcp", "create_ticket", {}, call)
+        await cache.get_or_call("plantation-mcp", "create_ticket", {}, call)
+
+        assert call.await_count == 2
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, cache: McpResultCache) -> None:
+        """A failed call propagates and the next call retries."""
+        error = McpToolError(ErrorCode.SERVICE_UNAVAILABLE, "down", "", "plantation-mcp", "get_farmer")
+        call = AsyncMock(side_effect=[error, {"v": 1}])
+
+        with pytest.raises(McpToolError):
+            await cache.get_or_call("plantation-mcp", "get_farmer", {}, call)
+        assert await cache.get_or_call("plantation-mcp", "get_farmer", {}, call) == {"v": 1}
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_entries(self) -> None:
+        """The least recently used entry is evicted when max_entries is exceeded."""
+        cache = McpResultCache(max_entries=2)
+        cache.register_tools("plantation-mcp", TOOLS)
+        call = AsyncMock(side_effect=lambda: {"v": 1})
+
+        await cache.get_or_call("plantation-mcp", "get_farmer", {"id": "a"}, call)
+        await cache.get_or_call("plantation-mcp", "get_farmer", {"id": "b"}, call)
+        await cache.get_or_call("plantation-mcp", "get_farmer", {"id": "a"}, call)  # refresh a
+        await cache.get_or_call("plantation-mcp", "get_farmer", {"id": "c"}, call)  # evicts b
+        assert call.await_count == 3
+
+        await cache.get_or_call("plantation-mcp", "get_farmer", {"id": "a"}, call)
+        assert call.await_count == 3
+        await cache.get_or_call("plantation-mcp", "get_farmer", {"id": "b"}, call)
+        assert call.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_eviction_by_bytes(self) -> None:
+        """Entries are evicted to stay under max_bytes; oversized results are not stored."""
+        cache = McpResultCache(max_bytes=100)
+        cache.register_tools("plantation-mcp", TOOLS)
+
+        await cache.get_or_call("plantation-mcp", "get_farmer", {"id": "a"}, AsyncMock(return_value={"v": "x" * 60}))
+        await cache.get_or_call("plantation-mcp", "get_farmer", {"id": "b"}, AsyncMock(return_value={"v": "x" * 60}))
+        assert len(cache) == 1
+
+        await cache.get_or_call("plantation-mcp", "get_farmer", {"id": "c"}, AsyncMock(return_value={"v": "x" * 200}))
+        assert len(cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_are_coalesced(self, cache: McpResultCache) -> None:
+        """Concurrent identical calls share a single underlying call."""
+        release = asyncio.Event()
+        calls = 0
+
+        async def call() -> dict:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"v": calls}
+
+        tasks = [
+            asyncio.create_task(cache.get_or_call("plantation-mcp", "get_farmer", {"id": "1"}, call)) for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert results == [{"v": 1}] * 5
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_call(self, cache: McpResultCache) -> None:
+        """Cancelling one caller leaves the shared call running for the others."""
+        release = asyncio.Event()
+
+        async def call() -> dict:
+            await release.wait()
+            return {"v": 1}
+
+        first = asyncio.create_task(cache.get_or_call("plantation-mcp", "get_farmer", {}, call))
+        second = asyncio.create_task(cache.get_or_call("plantation-mcp", "get_farmer", {}, call))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == {"v": 1}
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self, cache: McpResultCache) -> None:
+        """invalidate drops matching entries only."""
+        call = AsyncMock(return_value={"v": 1})
+        await cache.get_or_call("plantation-mcp", "get_farmer", {"id": "1"}, call)
+        await cache.get_or_call("plantation-mcp", "search_documents", {"q": "x"}, call)
+
+        assert cache.invalidate(tool_name="get_farmer") == 1
+        assert len(cache) == 1
+        assert cache.invalidate("plantation-mcp") == 1
+        assert len(cache) == 0
+
+
+class TestCachingMcpClient:
+    """Client wrapper behavior."""
+
+    def test_wraps_instead_of_subclassing(self) -> None:
+        """The wrapper delegates to its client and is accepted wherever an MCP client is."""
+        inner = _inner_client()
+        inner.timeout = 7.5
+        client = CachingMcpClient(inner, McpResultCache())
+
+        assert not isinstance(client, GrpcMcpClient)
+        assert client.app_id == "plantation-mcp"
+        assert client.timeout == 7.5
+        tool = GrpcMcpTool(name="get_farmer", description="", mcp_client=client)
+        assert tool.mcp_client is client
+
+    @pytest.mark.asyncio
+    async def test_call_tool_binary_uses_wrapped_client(self, cache: McpResultCache) -> None:
+        """Binary calls go through the wrapped client's transport and are not cached."""
+        inner = _inner_client()
+        inner.call_tool_binary = AsyncMock(return_value=({"mime_type": "image/jpeg"}, b"\xff\xd8"))
+        inner._call_tool = AsyncMock(side_effect=AssertionError("sync DaprClient path"))
+        client = CachingMcpClient(inner, cache)
+
+        first = await client.call_tool_binary("get_document_image", {"document_id": "d1"}, timeout=5.0)
+        second = await client.call_tool_binary("get_document_image", {"document_id": "d1"})
+
+        assert first == second == ({"mime_type": "image/jpeg"}, b"\xff\xd8")
+        assert inner.call_tool_binary.await_count == 2
+        assert inner.call_tool_binary.await_args_list[0].kwargs == {"caller_agent_id": None, "timeout": 5.0}
+        inner._call_tool.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_call_tools_read_through_cache(self, cache: McpResultCache) -> None:
+        """Concurrent call_tools share the cache with call_tool."""
+        inner = _inner_client()
+        client = CachingMcpClient(inner, cache)
+
+        results = await client.call_tools(
+            [("get_farmer", {"id": "1"}), ("get_farmer", {"id": "1"}), ("create_ticket", {"id": "1"})]
+        )
+
+        assert results[0] == results[1] == {"tool": "get_farmer", "args": {"id": "1"}}
+        assert inner.call_tool.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_loads_metadata_lazily_once(self) -> None:
+        """Tool metadata is fetched once, then calls are served from cache."""
+        inner = _inner_client()
+        client = CachingMcpClient(inner, McpResultCache())
+
+        await asyncio.gather(*(client.call_tool("get_farmer", {"id": "1"}) for _ in range(3)))
+        await client.call_tool("get_farmer", {"id": "1"})
+
+        inner.list_tools.assert_awaited_once()
+        assert inner.call_tool.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_metadata_failure_falls_back_to_uncached(self) -> None:
+        """If list_tools fails, calls still go through (uncached) and metadata is retried."""
+        inner = _inner_client()
+        inner.list_tools = AsyncMock(side_effect=[RuntimeError("down"), TOOLS])
+        client = CachingMcpClient(inner, McpResultCache())
+
+        await client.call_tool("get_farmer", {"id": "1"})
+        await client.call_tool("get_farmer", {"id": "1"})
+        await client.call_tool("get_farmer", {"id": "1"})
+
+        assert inner.list_tools.await_count == 2
+        assert inner.call_tool.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_passes_through_call_arguments(self, cache: McpResultCache) -> None:
+        """caller_agent_id and extra kwargs reach the underlying client."""
+        inner = _inner_client()
+        client = CachingMcpClient(inner, cache)
+
+        await client.call_tool("get_farmer", {"id": "1"}, caller_agent_id="agent-1", timeout=5.0)
+
+        inner.call_tool.assert_awaited_once_with("get_farmer", {"id": "1"}, caller_agent_id="agent-1", timeout=5.0)
+
+
+class TestRegistryWithResultCache:
+    """McpToolRegistry wraps clients and feeds discovered metadata to the cache."""
+
+    @pytest.mark.asyncio
+    async def test_registry_wraps_clients_and_registers_metadata(self) -> None:
+        """Discovery registers TTLs, and tools built by the registry read through the cache."""
+        inner = _inner_client()
+        cache = McpResultCache()
+        registry = McpToolRegistry(client_factory=lambda _app_id: inner, result_cache=cache)
+        registry.register_server("plantation-mcp")
+
+        await registry.discover_tools("plantation-mcp")
+        client = registry.get_client("plantation-mcp")
+
+        assert isinstance(client, CachingMcpClient)
+        assert cache.knows_app("plantation-mcp")
+
+        await client.call_tool("get_farmer", {"id": "1"})
+        await client.call_tool("get_farmer", {"id": "1"})
+        inner.list_tools.assert_awaited_once()
+        assert inner.call_tool.await_count == 1
+
+    def test_registry_without_cache_uses_plain_client(self) -> None:
+        """No result cache means clients are not wrapped."""
+        registry = McpToolRegistry(client_factory=_inner_client)
+        registry.register_server("plantation-mcp")
+
+        assert not isinstance(registry.get_client("plantation-mcp"), CachingMcpClient)
@@ -445,6 +445,28 @@ class TestCollectionPointFarmerAssignment:
         query_filter = call_args[0][0]
         assert query_filter["farmer_ids"] == "WM-0001"
 
+    @pytest.mark.asyncio
+    async def test_list_by_farmers_single_query(
+        self,
+        repository: CollectionPointRepository,
+        mock_db: MagicMock,
+        sample_cp_with_farmers: CollectionPoint,
+    ) -> None:
+        """Test batch membership lookup uses one $in query and maps every requested farmer."""
+        cp_doc = sample_cp_with_farmers.model_dump()
+        cp_doc["_id"] = cp_doc["id"]
+
+        mock_cursor = MagicMock()
+        mock_cursor.sort = MagicMock(return_value=mock_cursor)
+        mock_cursor.to_list = AsyncMock(return_value=[cp_doc])
+        mock_db["collection_points"].find = MagicMock(return_value=mock_cursor)
+
+        memberships = await repository.list_by_farmers(["WM-0001", "WM-9999"])
+
+        assert [cp.id for cp in memberships["WM-0001"]] == [sample_cp_with_farmers.id]
+        assert memberships["WM-9999"] == []
+        mock_db["collection_points"].find.assert_called_once_with({"farmer_ids": {"$in": ["WM-0001", "WM-9999"]}})
+
     @pytest.mark.asyncio
     async def test_list_by_farmer_empty(
         self,
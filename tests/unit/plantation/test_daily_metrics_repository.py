@@ -0,0 +1,97 @@
+"""Unit tests for DailyMetricsRepository."""
+
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from plantation_model.domain.models import DailyDeliveryMetrics
+from plantation_model.infrastructure.repositories.daily_metrics_repository import (
+    DailyMetricsRepository,
+)
+
+
+def create_test_day(farmer_id: str, metrics_date: date, deliveries: int = 2) -> DailyDeliveryMetrics:
+    """Create a test daily bucket."""
+    return DailyDeliveryMetrics(
+        farmer_id=farmer_id,
+        metrics_date=metrics_date,
+        deliveries=deliveries,
+        total_kg=12.5 * deliveries,
+        grade_counts={"Primary": deliveries},
+    )
+
+
+async def seed(repo: DailyMetricsRepository, days: list[DailyDeliveryMetrics]) -> None:
+    """Insert buckets the way upsert_days stores them."""
+    for day in days:
+        doc = day.model_dump(mode="json")
+        doc["_id"] = f"{day.farmer_id}_{day.metrics_date.isoformat()}"
+        await repo._collection.insert_one(doc)
+
+
+class TestDailyMetricsRepository:
+    """Tests for DailyMetricsRepository."""
+
+    @pytest.mark.asyncio
+    async def test_upsert_days_bulk_write(self) -> None:
+        """Test buckets are upserted in one unordered bulk write keyed by farmer and date."""
+        repo = DailyMetricsRepository(MagicMock())
+        repo._collection.bulk_write = AsyncMock(return_value=MagicMock(upserted_count=1, modified_count=1))
+
+        written = await repo.upsert_days(
+            [create_test_day("WM-0001", date(2026, 1, 5)), create_test_day("WM-0002", date(2026, 1, 5))]
+        )
+
+        assert written == 2
+        operations = repo._collection.bulk_write.call_args.args[0]
+        assert repo._collection.bulk_write.call_args.kwargs == {"ordered": False}
+        assert [op._filter for op in operations] == [{"_id": "WM-0001_2026-01-05"}, {"_id": "WM-0002_2026-01-05"}]
+        assert operations[0]._upsert is True
+        assert operations[0]._doc["$set"]["metrics_date"] == "2026-01-05"
+
+    @pytest.mark.asyncio
+    async def test_upsert_days_empty(self) -> None:
+        """Test no buckets means no write."""
+        repo = DailyMetricsRepository(MagicMock())
+        repo._collection.bulk_write = AsyncMock()
+
+        assert await repo.upsert_days([]) == 0
+        repo._collection.bulk_write.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_find_in_ranges(self, mock_mongodb_client) -> None:
+        """Test ranges exclude their start, include their end and skip empty ranges."""
+        repo = DailyMetricsRepository(mock_mongodb_client["plantation_model"])
+        base = date(2026, 1, 1)
+        await seed(repo, [create_test_day("WM-0001", base + timedelta(days=i)) for i in range(10)])
+        await seed(repo, [create_test_day("WM-0002", base + timedelta(days=3))])
+
+        days = await repo.find_in_ranges(
+            "WM-0001",
+            [
+                (base + timedelta(days=2), base + timedelta(days=4)),
+                (base + timedelta(days=8), base + timedelta(days=8)),
+            ],
+        )
+
+        assert [day.metrics_date for day in days] == [base + timedelta(days=3), base + timedelta(days=4)]
+        assert await repo.find_in_ranges("WM-0001", []) == []
+
+    @pytest.mark.asyncio
+    async def test_iter_for_farmers(self, mock_mongodb_client) -> None:
+        """Test one cursor streams the buckets of several farmers in the date range."""
+        repo = DailyMetricsRepository(mock_mongodb_client["plantation_model"])
+        base = date(2026, 1, 1)
+        await seed(
+            repo,
+            [
+                create_test_day("WM-0001", base),
+                create_test_day("WM-0001", base + timedelta(days=1)),
+                create_test_day("WM-0002", base + timedelta(days=1)),
+                create_test_day("WM-0003", base + timedelta(days=1)),
+            ],
+        )
+
+        days = [day async for day in repo.iter_for_farmers(["WM-0001", "WM-0002"], base, base + timedelta(days=1))]
+
+        assert sorted(day.farmer_id for day in days) == ["WM-0001", "WM-0002"]
@@ -1,5 +1,6 @@
 """Unit tests for FarmerPerformanceRepository."""
 
+import datetime as dt
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -7,12 +8,17 @@ from plantation_model.domain.models import (
     FarmerPerformance,
     FarmScale,
     HistoricalMetrics,
+    QualityThresholds,
+    QualityTier,
     TodayMetrics,
     TrendDirection,
 )
 from plantation_model.infrastructure.repositories.farmer_performance_repository import (
+    DeliveryBatchUpdate,
+    DeliveryIncrement,
     FarmerPerformanceRepository,
 )
+from pymongo import ReturnDocument
 
 
 @pytest.fixture
@@ -88,6 +94,31 @@ class TestFarmerPerformanceRepository:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_by_farmer_ids(
+        self, farmer_perf_repo: FarmerPerformanceRepository, sample_farmer_performance: FarmerPerformance
+    ) -> None:
+        """Test batch lookup issues one $in query and maps results by farmer ID."""
+        doc = sample_farmer_performance.model_dump(mode="json")
+        doc["_id"] = "WM-0001"
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(return_value=[doc])
+        farmer_perf_repo._collection.find = MagicMock(return_value=cursor)
+
+        result = await farmer_perf_repo.get_by_farmer_ids(["WM-0001", "WM-0002", "WM-0001"])
+
+        assert list(result) == ["WM-0001"]
+        assert result["WM-0001"].grading_model_id == "tbk_kenya_tea_v1"
+        farmer_perf_repo._collection.find.assert_called_once_with({"_id": {"$in": ["WM-0001", "WM-0002"]}})
+
+    @pytest.mark.asyncio
+    async def test_get_by_farmer_ids_empty(self, farmer_perf_repo: FarmerPerformanceRepository) -> None:
+        """Test an empty ID list does not query MongoDB."""
+        farmer_perf_repo._collection.find = MagicMock()
+
+        assert await farmer_perf_repo.get_by_farmer_ids([]) == {}
+        farmer_perf_repo._collection.find.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_initialize_for_farmer(self, farmer_perf_repo: FarmerPerformanceRepository) -> None:
         """Test initializing performance for a new farmer."""
@@ -125,6 +156,46 @@ class TestFarmerPerformanceRepository:
 
         assert result is not None
         assert result.historical.grade_distribution_30d["Primary"] == 150
+        update = farmer_perf_repo._collection.find_one_and_update.call_args[0][1]
+        assert update["$set"]["tier"] == "tier_1"
+
+    @pytest.mark.asyncio
+    async def test_update_historical_uses_factory_thresholds(
+        self, farmer_perf_repo: FarmerPerformanceRepository, sample_farmer_performance: FarmerPerformance
+    ) -> None:
+        """Test the stored tier is classified with the given thresholds."""
+        farmer_perf_repo._collection.find_one_and_update = AsyncMock(return_value=None)
+
+        await farmer_perf_repo.update_historical(
+            sample_farmer_performance.farmer_id,
+            HistoricalMetrics(primary_percentage_30d=85.7),
+            thresholds=QualityThresholds(tier_1=90.0, tier_2=80.0, tier_3=50.0),
+        )
+
+        update = farmer_perf_repo._collection.find_one_and_update.call_args[0][1]
+        assert update["$set"]["tier"] == "tier_2"
+
+    @pytest.mark.asyncio
+    async def test_update_historical_many_bulk_write(self, farmer_perf_repo: FarmerPerformanceRepository) -> None:
+        """Test many historical updates go out as one bulk write with per-farmer tiers."""
+        farmer_perf_repo._collection.bulk_write = AsyncMock(return_value=MagicMock(matched_count=2))
+
+        matched = await farmer_perf_repo.update_historical_many(
+            [
+                ("WM-0001", HistoricalMetrics(primary_percentage_30d=85.7), None),
+                (
+                    "WM-0002",
+                    HistoricalMetrics(primary_percentage_30d=85.7),
+                    QualityThresholds(tier_1=90.0, tier_2=80.0, tier_3=50.0),
+                ),
+            ]
+        )
+
+        assert matched == 2
+        operations = farmer_perf_repo._collection.bulk_write.call_args.args[0]
+        assert [op._filter for op in operations] == [{"_id": "WM-0001"}, {"_id": "WM-0002"}]
+        assert [op._doc["$set"]["tier"] for op in operations] == ["tier_1", "tier_2"]
+        assert operations[0]._doc["$set"]["historical"]["primary_percentage_30d"] == 85.7
 
     @pytest.mark.asyncio
     async def test_update_today_metrics(
@@ -168,6 +239,176 @@ class TestFarmerPerformanceRepository:
         assert result is not None
         farmer_perf_repo._collection.find_one_and_update.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_apply_delivery_rolls_over_past_day(
+        self, farmer_perf_repo: FarmerPerformanceRepository, sample_farmer_performance: FarmerPerformance
+    ) -> None:
+        """Test a past-day record is reset and incremented in one update returning the closed day."""
+        previous_doc = sample_farmer_performance.model_dump()
+        previous_doc["_id"] = sample_farmer_performance.farmer_id
+        previous_doc["today"]["metrics_date"] = dt.date(2026, 1, 5)
+        farmer_perf_repo._collection.find_one_and_update = AsyncMock(return_value=previous_doc)
+        increment = DeliveryIncrement(farmer_id="WM-0001")
+        increment.add(10.0, "Secondary", {"leaf_type": {"bud": 1}})
+
+        update = await farmer_perf_repo.apply_delivery(increment, today=dt.date(2026, 1, 6))
+
+        assert update is not None
+        assert update.rolled_over
+        assert update.previous.today.deliveries == 2
+        assert update.previous.today.metrics_date == dt.date(2026, 1, 5)
+        assert update.performance.today.metrics_date == dt.date(2026, 1, 6)
+        assert update.performance.today.deliveries == 1
+        assert update.performance.today.total_kg == 10.0
+        assert update.performance.today.grade_counts == {"Secondary": 1}
+        assert update.performance.today.attribute_counts == {"leaf_type": {"bud": 1}}
+        call = farmer_perf_repo._collection.find_one_and_update.call_args
+        assert call.args[0] == {"_id": "WM-0001"}
+        assert call.kwargs == {"return_document": ReturnDocument.BEFORE}
+        pipeline = call.args[1]
+        reset = pipeline[0]["$set"]["today"]["$cond"]
+        assert reset[0] == {"$lt": [{"$ifNull": ["$today.metrics_date", ""]}, "2026-01-06"]}
+        assert reset[1]["$literal"]["deliveries"] == 0
+        assert reset[2] == "$today"
+        assert pipeline[1]["$set"]["today.grade_counts.Secondary"] == {
+            "$add": [{"$ifNull": ["$today.grade_counts.Secondary", 0]}, 1]
+        }
+
+    @pytest.mark.asyncio
+    async def test_apply_delivery_same_day(
+        self, farmer_perf_repo: FarmerPerformanceRepository, sample_farmer_performance: FarmerPerformance
+    ) -> None:
+        """Test a same-day delivery adds to the existing counters without rollover."""
+        today = sample_farmer_performance.today.metrics_date
+        previous_doc = sample_farmer_performance.model_dump()
+        previous_doc["_id"] = sample_farmer_performance.farmer_id
+        farmer_perf_repo._collection.find_one_and_update = AsyncMock(return_value=previous_doc)
+        increment = DeliveryIncrement(farmer_id="WM-0001")
+        increment.add(5.0, "Primary")
+
+        update = await farmer_perf_repo.apply_delivery(increment, today=today)
+
+        assert update is not None
+        assert not update.rolled_over
+        assert update.performance.today.deliveries == 3
+        assert update.performance.today.total_kg == 50.0
+        assert update.performance.today.grade_counts == {"Primary": 3}
+
+    @pytest.mark.asyncio
+    async def test_apply_delivery_not_found(self, farmer_perf_repo: FarmerPerformanceRepository) -> None:
+        """Test a missing record returns None."""
+        farmer_perf_repo._collection.find_one_and_update = AsyncMock(return_value=None)
+
+        assert await farmer_perf_repo.apply_delivery(DeliveryIncrement(farmer_id="WM-9999")) is None
+
+    @pytest.mark.asyncio
+    async def test_increment_today_deliveries_bulk_write(
+        self, farmer_perf_repo: FarmerPerformanceRepository, sample_farmer_performance: FarmerPerformance
+    ) -> None:
+        """Test merged increments go out as one unordered bulk write of rollover-aware pipelines."""
+        increment = DeliveryIncrement(farmer_id="WM-0001")
+        increment.add(10.0, "Primary", {"leaf_type": {"bud": 2}})
+        increment.add(5.0, "Primary", {"leaf_type": {"bud": 1, "coarse": 1}})
+        other = DeliveryIncrement(farmer_id="WM-0002")
+        other.add(7.5, "Secondary")
+        farmer_perf_repo._collection.bulk_write = AsyncMock(return_value=MagicMock(modified_count=2))
+        doc = sample_farmer_performance.model_dump()
+        doc["_id"] = sample_farmer_performance.farmer_id
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(return_value=[doc])
+        farmer_perf_repo._collection.find = MagicMock(return_value=cursor)
+        farmer_perf_repo._collection.find_one_and_update = AsyncMock()
+
+        result = await farmer_perf_repo.increment_today_deliveries([increment, other], today=dt.date(2026, 1, 6))
+
+        assert result == DeliveryBatchUpdate(performances={"WM-0001": sample_farmer_performance})
+        operations = farmer_perf_repo._collection.bulk_write.call_args.args[0]
+        assert farmer_perf_repo._collection.bulk_write.call_args.kwargs == {"ordered": False}
+        assert [op._filter for op in operations] == [{"_id": "WM-0001"}, {"_id": "WM-0002"}]
+        first = operations[0]._doc
+        assert first[0]["$set"]["today"]["$cond"][0]["$lt"][1] == "2026-01-06"
+        increments = {
+            path: expr["$add"][1]
+            for path, expr in first[1]["$set"].items()
+            if isinstance(expr, dict) and "$add" in expr
+        }
+        assert increments == {
+            "today.deliveries": 2,
+            "today.total_kg": 15.0,
+            "today.grade_counts.Primary": 2,
+            "today.attribute_counts.leaf_type.bud": 3,
+            "today.attribute_counts.leaf_type.coarse": 1,
+        }
+        assert operations[1]._doc[1]["$set"]["today.grade_counts.Secondary"]["$add"][1] == 1
+        assert "closed_days" in first[0]["$set"]
+        farmer_perf_repo._collection.find.assert_called_once_with({"_id": {"$in": ["WM-0001", "WM-0002"]}})
+        # Nothing parked: no claim round trip
+        farmer_perf_repo._collection.find_one_and_update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_increment_today_deliveries_returns_closed_days(
+        self, farmer_perf_repo: FarmerPerformanceRepository, sample_farmer_performance: FarmerPerformance
+    ) -> None:
+        """Test a day reset by the bulk write is claimed and returned for roll-up."""
+        today = dt.date(2026, 1, 6)
+        closed_today = TodayMetrics(deliveries=4, total_kg=80.0, metrics_date=dt.date(2026, 1, 5))
+        current = sample_farmer_performance.model_copy(update={"today": TodayMetrics(deliveries=1, metrics_date=today)})
+        doc = current.model_dump()
+        doc["_id"] = current.farmer_id
+        doc["closed_days"] = [closed_today.model_dump()]
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(return_value=[doc])
+        farmer_perf_repo._collection.bulk_write = AsyncMock(return_value=MagicMock(modified_count=1))
+        farmer_perf_repo._collection.find = MagicMock(return_value=cursor)
+        farmer_perf_repo._collection.find_one_and_update = AsyncMock(
+            return_value={"_id": current.farmer_id, "closed_days": [closed_today.model_dump()]}
+        )
+        increment = DeliveryIncrement(farmer_id="WM-0001")
+        increment.add(10.0, "Primary")
+
+        result = await farmer_perf_repo.increment_today_deliveries([increment], today=today)
+
+        assert result.performances["WM-0001"].today.deliveries == 1
+        assert len(result.closed) == 1
+        assert result.closed[0].farmer_id == "WM-0001"
+        assert result.closed[0].today == closed_today
+        assert result.closed[0].historical == current.historical
+        claim_filter, claim_update = farmer_perf_repo._collection.find_one_and_update.call_args.args
+        assert claim_filter == {"_id": "WM-0001", "closed_days": {"$exists": True}}
+        assert claim_update == {"$unset": {"closed_days": ""}}
+        assert farmer_perf_repo._collection.find_one_and_update.call_args.kwargs["return_document"] == (
+            ReturnDocument.BEFORE
+        )
+
+    @pytest.mark.asyncio
+    async def test_increment_today_deliveries_closed_day_claimed_elsewhere(
+        self, farmer_perf_repo: FarmerPerformanceRepository, sample_farmer_performance: FarmerPerformance
+    ) -> None:
+        """Test a parked day already claimed by another writer is not rolled up twice."""
+        doc = sample_farmer_performance.model_dump()
+        doc["_id"] = sample_farmer_performance.farmer_id
+        doc["closed_days"] = [TodayMetrics(deliveries=2, metrics_date=dt.date(2026, 1, 5)).model_dump()]
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(return_value=[doc])
+        farmer_perf_repo._collection.bulk_write = AsyncMock(return_value=MagicMock(modified_count=1))
+        farmer_perf_repo._collection.find = MagicMock(return_value=cursor)
+        farmer_perf_repo._collection.find_one_and_update = AsyncMock(return_value=None)
+
+        result = await farmer_perf_repo.increment_today_deliveries(
+            [DeliveryIncrement(farmer_id="WM-0001")], today=dt.date(2026, 1, 6)
+        )
+
+        assert result.closed == []
+        assert set(result.performances) == {"WM-0001"}
+
+    @pytest.mark.asyncio
+    async def test_increment_today_deliveries_empty(self, farmer_perf_repo: FarmerPerformanceRepository) -> None:
+        """Test no increments means no write."""
+        farmer_perf_repo._collection.bulk_write = AsyncMock()
+
+        assert await farmer_perf_repo.increment_today_deliveries([]) == DeliveryBatchUpdate()
+        farmer_perf_repo._collection.bulk_write.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_reset_today_metrics(
         self, farmer_perf_repo: FarmerPerformanceRepository, sample_farmer_performance: FarmerPerformance
@@ -219,6 +460,8 @@ class TestFarmerPerformanceRepository:
         farmer_perf_repo._collection.replace_one.assert_called_once()
         call_args = farmer_perf_repo._collection.replace_one.call_args
         assert call_args[1]["upsert"] is True
+        # 83.3% primary with default thresholds (85/70/50)
+        assert call_args[0][1]["tier"] == "tier_2"
         assert result.farmer_id == sample_farmer_performance.farmer_id
 
     @pytest.mark.asyncio
@@ -239,8 +482,54 @@ class TestFarmerPerformanceRepository:
     async def test_ensure_indexes(self, farmer_perf_repo: FarmerPerformanceRepository) -> None:
         """Test index creation."""
         farmer_perf_repo._collection.create_index = AsyncMock()
+        farmer_perf_repo._collection.update_many = AsyncMock(return_value=MagicMock(modified_count=0))
 
         await farmer_perf_repo.ensure_indexes()
 
-        # Should create indexes for farmer_id, grading_model_id, farm_scale, trend, and updated_at
-        assert farmer_perf_repo._collection.create_index.call_count >= 5
+        # Should create indexes for farmer_id, grading_model_id, farm_scale, trend, updated_at and tier
+        assert farmer_perf_repo._collection.create_index.call_count >= 6
+        index_names = [call.kwargs["name"] for call in farmer_perf_repo._collection.create_index.call_args_list]
+        assert "idx_farmer_perf_tier" in index_names
+        # Backfill needs factory thresholds, so it is left to HistoricalMetricsEngine
+        farmer_perf_repo._collection.update_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_recompute_missing_tiers_for_farmers(self, farmer_perf_repo: FarmerPerformanceRepository) -> None:
+        """Test only_missing restricts a farmer recompute to records without a tier."""
+        farmer_perf_repo._collection.update_many = AsyncMock(return_value=MagicMock(modified_count=1))
+
+        await farmer_perf_repo.recompute_tiers(QualityThresholds(), ["WM-0001"], only_missing=True)
+
+        query = farmer_perf_repo._collection.update_many.call_args[0][0]
+        assert query == {"_id": {"$in": ["WM-0001"]}, "tier": {"$exists": False}}
+
+    @pytest.mark.asyncio
+    async def test_upsert_classifies_with_factory_thresholds(
+        self,
+        farmer_perf_repo: FarmerPerformanceRepository,
+        sample_farmer_performance: FarmerPerformance,
+    ) -> None:
+        """Test the stored tier uses the thresholds passed in, not the defaults."""
+        farmer_perf_repo._collection.replace_one = AsyncMock()
+        await farmer_perf_repo.upsert(
+            sample_farmer_performance, QualityThresholds(tier_1=95.0, tier_2=90.0, tier_3=85.0)
+        )
+
+        doc = farmer_perf_repo._collection.replace_one.call_args[0][1]
+        assert doc["tier"] == "below_tier_3"
+
+    @pytest.mark.asyncio
+    async def test_recompute_tiers_for_farmers(self, farmer_perf_repo: FarmerPerformanceRepository) -> None:
+        """Test tiers are recomputed server-side with a pipeline update."""
+        farmer_perf_repo._collection.update_many = AsyncMock(return_value=MagicMock(modified_count=2))
+        thresholds = QualityThresholds(tier_1=90.0, tier_2=75.0, tier_3=60.0)
+
+        modified = await farmer_perf_repo.recompute_tiers(thresholds, ["WM-0001", "WM-0002"])
+
+        assert modified == 2
+        query, pipeline = farmer_perf_repo._collection.update_many.call_args[0]
+        assert query == {"_id": {"$in": ["WM-0001", "WM-0002"]}}
+        switch = pipeline[0]["$set"]["tier"]["$switch"]
+        assert [branch["case"]["$gte"][1] for branch in switch["branches"]] == [90.0, 75.0, 60.0]
+        assert [branch["then"] for branch in switch["branches"]] == ["tier_1", "tier_2", "tier_3"]
+        assert switch["default"] == QualityTier.BELOW_TIER_3.value
@@ -4,7 +4,7 @@ from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from plantation_model.domain.models import ContactInfo, Farmer, FarmScale, GeoLocation
+from plantation_model.domain.models import ContactInfo, Farmer, FarmScale, GeoLocation, QualityTier
 from plantation_model.infrastructure.repositories.farmer_repository import (
     FarmerRepository,
 )
@@ -97,6 +97,7 @@ class TestFarmerRepositoryCreate:
         assert call_args["_id"] == "WM-0001"
         assert call_args["id"] == "WM-0001"
         assert call_args["first_name"] == "Wanjiku"
+        assert call_args["search_terms"] == ["wm-0001", "wanjiku", "kamau", "wanjiku kamau", "254712345678"]
         assert result.id == sample_farmer.id
 
 
@@ -221,11 +222,31 @@ class TestFarmerRepositoryUpdate:
         updated_doc = sample_farmer_doc.copy()
         updated_doc["first_name"] = "Updated"
         collection.find_one_and_update = AsyncMock(return_value=updated_doc)
+        collection.update_one = AsyncMock()
 
         result = await farmer_repository.update("WM-0001", {"first_name": "Updated"})
 
         assert result is not None
         assert result.first_name == "Updated"
+        # Name change refreshes the prefix search terms
+        search_terms = collection.update_one.call_args[0][1]["$set"]["search_terms"]
+        assert search_terms[:4] == ["wm-0001", "updated", "kamau", "updated kamau"]
+
+    @pytest.mark.asyncio
+    async def test_update_without_name_change_keeps_search_terms(
+        self,
+        farmer_repository: FarmerRepository,
+        mock_db: MagicMock,
+        sample_farmer_doc: dict,
+    ) -> None:
+        """Test updates that do not touch names or contact skip the refresh."""
+        collection = mock_db["farmers"]
+        collection.find_one_and_update = AsyncMock(return_value=sample_farmer_doc.copy())
+        collection.update_one = AsyncMock()
+
+        await farmer_repository.update("WM-0001", {"farm_size_hectares": 2.0})
+
+        collection.update_one.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_farmer_not_found(
@@ -297,6 +318,113 @@ class TestFarmerRepositoryList:
         assert call_filters["farm_scale"] == "medium"
 
 
+class TestFarmerRepositoryListFiltered:
+    """Tests for FarmerRepository.list_filtered (server-side filters)."""
+
+    @staticmethod
+    def _mock_find(collection: MagicMock, docs: list[dict], total: int) -> None:
+        collection.count_documents = AsyncMock(return_value=total)
+        cursor_mock = MagicMock()
+        cursor_mock.sort = MagicMock(return_value=cursor_mock)
+        cursor_mock.limit = MagicMock(return_value=cursor_mock)
+        cursor_mock.to_list = AsyncMock(return_value=docs)
+        collection.find = MagicMock(return_value=cursor_mock)
+
+    @pytest.mark.asyncio
+    async def test_scale_and_search_filters(
+        self,
+        farmer_repository: FarmerRepository,
+        mock_db: MagicMock,
+        sample_farmer_doc: dict,
+    ) -> None:
+        """Test farm_scale and normalized prefix search become one indexed find."""
+        collection = mock_db["farmers"]
+        self._mock_find(collection, [sample_farmer_doc.copy()], total=1)
+
+        farmers, _, total = await farmer_repository.list_filtered(
+            region_id="nyeri-highland",
+            active_only=True,
+            farm_scale=FarmScale.MEDIUM,
+            search="  +2547 ",
+        )
+
+        assert [f.id for f in farmers] == ["WM-0001"]
+        assert total == 1
+        call_filters = collection.find.call_args[0][0]
+        assert call_filters == {
+            "region_id": "nyeri-highland",
+            "is_active": True,
+            "farm_scale": "medium",
+            "search_terms": {"$regex": "^2547"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_search_is_escaped(
+        self,
+        farmer_repository: FarmerRepository,
+        mock_db: MagicMock,
+    ) -> None:
+        """Test regex metacharacters in the search are matched literally."""
+        collection = mock_db["farmers"]
+        self._mock_find(collection, [], total=0)
+
+        await farmer_repository.list_filtered(search="Wan.*")
+
+        assert collection.find.call_args[0][0]["search_terms"] == {"$regex": r"^wan\.\*"}
+
+    @pytest.mark.asyncio
+    async def test_tier_filter_joins_performance(
+        self,
+        farmer_repository: FarmerRepository,
+        mock_db: MagicMock,
+        sample_farmer_doc: dict,
+    ) -> None:
+        """Test a tier filter counts and pages through a $lookup on the precomputed tier."""
+        collection = mock_db["farmers"]
+        second = {**sample_farmer_doc, "_id": "WM-0002", "id": "WM-0002"}
+        count_cursor = MagicMock(to_list=AsyncMock(return_value=[{"total": 5}]))
+        page_cursor = MagicMock(to_list=AsyncMock(return_value=[sample_farmer_doc.copy(), second]))
+        collection.aggregate = MagicMock(side_effect=[count_cursor, page_cursor])
+
+        farmers, next_token, total = await farmer_repository.list_filtered(
+            region_id="nyeri-highland",
+            tier=QualityTier.TIER_1,
+            page_size=1,
+            page_token="WM-0000",
+        )
+
+        assert total == 5
+        assert [f.id for f in farmers] == ["WM-0001"]
+        assert next_token == "WM-0001"
+
+        count_pipeline = collection.aggregate.call_args_list[0][0][0]
+        assert count_pipeline[0] == {"$match": {"region_id": "nyeri-highland"}}
+        assert count_pipeline[1]["$lookup"]["from"] == "farmer_performances"
+        assert count_pipeline[2] == {"$match": {"_performance.tier": "tier_1"}}
+        assert count_pipeline[-1] == {"$count": "total"}
+
+        page_pipeline = collection.aggregate.call_args_list[1][0][0]
+        assert page_pipeline[0] == {"$match": {"region_id": "nyeri-highland", "_id": {"$gt": "WM-0000"}}}
+        assert {"$limit": 2} in page_pipeline
+
+    @pytest.mark.asyncio
+    async def test_below_tier_3_includes_farmers_without_performance(
+        self,
+        farmer_repository: FarmerRepository,
+        mock_db: MagicMock,
+    ) -> None:
+        """Test below_tier_3 also matches farmers with no performance record."""
+        collection = mock_db["farmers"]
+        empty_cursor = MagicMock(to_list=AsyncMock(return_value=[]))
+        collection.aggregate = MagicMock(return_value=empty_cursor)
+
+        farmers, next_token, total = await farmer_repository.list_filtered(tier=QualityTier.BELOW_TIER_3)
+
+        assert (farmers, next_token, total) == ([], None, 0)
+        tier_match = collection.aggregate.call_args_list[0][0][0][2]["$match"]
+        assert tier_match == {"$or": [{"_performance.tier": "below_tier_3"}, {"_performance": {"$size": 0}}]}
+
+
 class TestFarmerRepositoryDuplicateDetection:
     """Tests for duplicate detection scenarios."""
 
@@ -363,11 +491,12 @@ class TestFarmerRepositoryIndexes:
         """Test ensure_indexes creates all required indexes."""
         collection = mock_db["farmers"]
         collection.create_index = AsyncMock()
+        collection.update_many = AsyncMock(return_value=MagicMock(modified_count=0))
 
         await farmer_repository.ensure_indexes()
 
-        # Should create 6 indexes (Story 9.5a: collection_point_id index removed)
-        assert collection.create_index.call_count == 6
+        # Should create 7 indexes (Story 9.5a: collection_point_id index removed)
+        assert collection.create_index.call_count == 7
 
         # Verify specific indexes were created
         index_names = [call.kwargs["name"] for call in collection.create_index.call_args_list]
@@ -378,3 +507,4 @@ class TestFarmerRepositoryIndexes:
         assert "idx_farmer_region" in index_names
         assert "idx_farmer_farm_scale" in index_names
         assert "idx_farmer_active" in index_names
+        assert "idx_farmer_search_terms" in index_names
@@ -0,0 +1,89 @@
+"""Unit tests for GoogleElevationClient batching and geohash caching.
+
+Tests:
+- Geohash encoding
+- Multi-location requests chunked by ELEVATION_BATCH_SIZE
+- Repeated and cached geohash cells not requested again
+- Failed batches yielding None without being cached
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from plantation_model.infrastructure import google_elevation
+from plantation_model.infrastructure.google_elevation import GoogleElevationClient, geohash
+
+
+def _response(locations: str) -> MagicMock:
+    """Elevation API response with altitude = 1000 + latitude * 100 per location."""
+    results = []
+    for location in locations.split("|"):
+        lat = float(location.split(",")[0])
+        results.append({"elevation": 1000 + lat * 100})
+    response = MagicMock()
+    response.json.return_value = {"status": "OK", "results": results}
+    return response
+
+
+@pytest.fixture
+def http_client() -> MagicMock:
+    """Patched httpx.AsyncClient answering elevation requests."""
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=lambda url, params, timeout: _response(params["locations"]))
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    with patch.object(httpx, "AsyncClient", return_value=client):
+        yield client
+
+
+def test_geohash() -> None:
+    """Test known geohash values and precision."""
+    assert geohash(57.64911, 10.40744, 11) == "u4pruydqqvj"
+    assert len(geohash(-0.4167, 36.95)) == google_elevation.GEOHASH_PRECISION
+
+
+class TestGetAltitudes:
+    """Tests for GoogleElevationClient.get_altitudes."""
+
+    @pytest.mark.asyncio
+    async def test_batched_requests(self, http_client: MagicMock, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test locations are fetched with one request per batch, results in input order."""
+        monkeypatch.setattr(google_elevation, "ELEVATION_BATCH_SIZE", 2)
+        client = GoogleElevationClient("key")
+        locations = [(-0.1, 36.9), (-0.2, 36.9), (-0.3, 36.9)]
+
+        altitudes = await client.get_altitudes(locations)
+
+        assert altitudes == pytest.approx([990.0, 980.0, 970.0])
+        assert http_client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_same_cell_requested_once(self, http_client: MagicMock) -> None:
+        """Test repeated cells and cached cells (including from get_altitude) cost no request."""
+        client = GoogleElevationClient("key")
+        await client.get_altitude(-0.1, 36.9)
+        http_client.get.reset_mock()
+
+        altitudes = await client.get_altitudes([(-0.2, 36.9), (-0.2, 36.9), (-0.1, 36.9)])
+
+        assert altitudes == pytest.approx([980.0, 980.0, 990.0])
+        http_client.get.assert_awaited_once()
+        assert http_client.get.call_args.kwargs["params"]["locations"] == "-0.200000,36.900000"
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_not_cached(self, http_client: MagicMock) -> None:
+        """Test a failing request yields None and is retried on the next call."""
+        http_client.get.side_effect = [httpx.ConnectError("down"), _response("-0.1,36.9")]
+        client = GoogleElevationClient("key")
+
+        assert await client.get_altitudes([(-0.1, 36.9)]) == [None]
+        assert await client.get_altitudes([(-0.1, 36.9)]) == pytest.approx([990.0])
+
+    @pytest.mark.asyncio
+    async def test_no_api_key(self, http_client: MagicMock) -> None:
+        """Test without an API key nothing is requested."""
+        client = GoogleElevationClient("")
+
+        assert await client.get_altitudes([(-0.1, 36.9), (-0.2, 36.9)]) == [None, None]
+        http_client.get.assert_not_called()
@@ -0,0 +1,212 @@
+"""Unit tests for the ImportFarmers streaming gRPC method.
+
+Tests:
+- Per-batch results with farmer IDs from one reserved ID block
+- Duplicates within the import and against registered farmers
+- Invalid rows and insert rejections reported without consuming IDs
+- One region snapshot and one batched elevation lookup per batch
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import grpc
+import pytest
+from fp_proto.plantation.v1 import plantation_pb2
+from plantation_model.api import plantation_service
+from plantation_model.api.plantation_service import PlantationServiceServicer
+from plantation_model.domain.models.id_generator import IDGenerator
+from plantation_model.infrastructure.google_elevation import GoogleElevationClient
+from plantation_model.infrastructure.repositories.collection_point_repository import (
+    CollectionPointRepository,
+)
+from plantation_model.infrastructure.repositories.factory_repository import (
+    FactoryRepository,
+)
+from plantation_model.infrastructure.repositories.farmer_repository import (
+    FarmerRepository,
+)
+from plantation_model.infrastructure.repositories.region_repository import (
+    RegionRepository,
+)
+
+
+def _row(row_number: int, phone: str, national_id: str, hectares: float = 1.5) -> plantation_pb2.ImportFarmerRow:
+    return plantation_pb2.ImportFarmerRow(
+        row_number=row_number,
+        farmer=plantation_pb2.CreateFarmerRequest(
+            first_name="John",
+            last_name="Mwangi",
+            farm_location=plantation_pb2.GeoLocation(latitude=-0.4, longitude=36.9),
+            contact=plantation_pb2.ContactInfo(phone=phone),
+            farm_size_hectares=hectares,
+            national_id=national_id,
+        ),
+    )
+
+
+async def _stream(*batches: list[plantation_pb2.ImportFarmerRow]):
+    for rows in batches:
+        yield plantation_pb2.ImportFarmersRequest(rows=rows)
+
+
+async def _collect(servicer: PlantationServiceServicer, context: MagicMock, *batches) -> list[list]:
+    return [list(response.results) async for response in servicer.ImportFarmers(_stream(*batches), context)]
+
+
+@pytest.fixture
+def farmer_repo() -> MagicMock:
+    """Farmer repository without registered farmers."""
+    repo = MagicMock(spec=FarmerRepository)
+    repo.find_existing_contacts = AsyncMock(return_value=(set(), set()))
+    repo.insert_many = AsyncMock(return_value={})
+    return repo
+
+
+@pytest.fixture
+def id_generator() -> MagicMock:
+    """ID generator handing out sequential blocks."""
+    counter = {"seq": 0}
+
+    async def _block(count: int) -> list[str]:
+        first = counter["seq"] + 1
+        counter["seq"] += count
+        return [f"WM-{seq:04d}" for seq in range(first, counter["seq"] + 1)]
+
+    generator = MagicMock(spec=IDGenerator)
+    generator.generate_farmer_ids = AsyncMock(side_effect=_block)
+    return generator
+
+
+@pytest.fixture
+def elevation_client() -> MagicMock:
+    """Elevation client returning 1800m for every location."""
+    client = MagicMock(spec=GoogleElevationClient)
+    client.get_altitudes = AsyncMock(side_effect=lambda locations: [1800.0] * len(locations))
+    return client
+
+
+@pytest.fixture
+def region_repo() -> MagicMock:
+    """Region repository without polygon regions (bounding box fallback)."""
+    repo = MagicMock(spec=RegionRepository)
+    repo.list_active = AsyncMock(return_value=([], None, 0))
+    return repo
+
+
+@pytest.fixture
+def context() -> MagicMock:
+    """Mock gRPC context."""
+    context = MagicMock(spec=grpc.aio.ServicerContext)
+    context.abort = AsyncMock(side_effect=grpc.RpcError())
+    return context
+
+
+@pytest.fixture
+def published(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Events passed to publish_events."""
+    published_events: list = []
+
+    async def _publish(pubsub_name: str, topic: str, events: list) -> int:
+        published_events.extend(events)
+        return len(events)
+
+    monkeypatch.setattr(plantation_service, "publish_events", _publish)
+    return published_events
+
+
+@pytest.fixture
+def servicer(farmer_repo, id_generator, elevation_client, region_repo) -> PlantationServiceServicer:
+    """Servicer wired to the import mocks."""
+    return PlantationServiceServicer(
+        factory_repo=MagicMock(spec=FactoryRepository),
+        collection_point_repo=MagicMock(spec=CollectionPointRepository),
+        farmer_repo=farmer_repo,
+        id_generator=id_generator,
+        elevation_client=elevation_client,
+        region_repo=region_repo,
+    )
+
+
+class TestImportFarmers:
+    """Tests for PlantationServiceServicer.ImportFarmers."""
+
+    @pytest.mark.asyncio
+    async def test_batches_answered_with_created_ids(
+        self, servicer, farmer_repo, elevation_client, region_repo, id_generator, context, published
+    ) -> None:
+        """Test each batch gets its results and costs one lookup, insert and ID reservation."""
+        responses = await _collect(
+            servicer,
+            context,
+            [_row(1, "+254700000001", "10000001"), _row(2, "+254700000002", "10000002")],
+            [_row(3, "+254700000003", "10000003")],
+        )
+
+        assert [[(r.row_number, r.farmer_id, r.error) for r in results] for results in responses] == [
+            [(1, "WM-0001", ""), (2, "WM-0002", "")],
+            [(3, "WM-0003", "")],
+        ]
+        region_repo.list_active.assert_awaited_once()
+        assert elevation_client.get_altitudes.await_count == 2
+        assert farmer_repo.insert_many.await_count == 2
+        inserted = farmer_repo.insert_many.call_args_list[0].args[0]
+        assert [f.farm_location.altitude_meters for f in inserted] == [1800.0, 1800.0]
+        assert all(f.region_id for f in inserted)
+        assert [event.farmer_id for event in published] == ["WM-0001", "WM-0002", "WM-0003"]
+
+    @pytest.mark.asyncio
+    async def test_duplicates_rejected(self, servicer, farmer_repo, context, published) -> None:
+        """Test duplicates within the import and already registered contacts are row errors."""
+        farmer_repo.find_existing_contacts.return_value = ({"+254700000009"}, {"99999999"})
+
+        (results,) = await _collect(
+            servicer,
+            context,
+            [
+                _row(1, "+254700000001", "10000001"),
+                _row(2, "+254700000001", "10000002"),
+                _row(3, "+254700000003", "10000001"),
+                _row(4, "+254700000009", "10000004"),
+                _row(5, "+254700000005", "99999999"),
+            ],
+        )
+
+        assert [r.farmer_id for r in results] == ["WM-0001", "", "", "", ""]
+        assert "Duplicate phone" in results[1].error
+        assert "Duplicate national ID" in results[2].error
+        assert results[3].error == "Phone number already registered"
+        assert results[4].error == "National ID already registered"
+
+    @pytest.mark.asyncio
+    async def test_invalid_and_rejected_rows(self, servicer, farmer_repo, id_generator, context, published) -> None:
+        """Test invalid rows take no ID and insert rejections are reported per row."""
+        farmer_repo.insert_many.return_value = {1: "Farmer already exists (duplicate phone or national ID)"}
+
+        (results,) = await _collect(
+            servicer,
+            context,
+            [
+                _row(1, "+254700000001", "10000001"),
+                _row(2, "+254700000002", "10000002", hectares=0),
+                _row(3, "+254700000003", "10000003"),
+            ],
+        )
+
+        id_generator.generate_farmer_ids.assert_awaited_once_with(2)
+        assert results[0].farmer_id == "WM-0001"
+        assert results[1].error.startswith("Invalid farmer")
+        assert (results[2].farmer_id, results[2].error) == (
+            "",
+            "Farmer already exists (duplicate phone or national ID)",
+        )
+        assert [event.farmer_id for event in published] == ["WM-0001"]
+
+    @pytest.mark.asyncio
+    async def test_oversized_batch_aborts(self, servicer, context, published) -> None:
+        """Test a request above the row limit aborts with INVALID_ARGUMENT."""
+        rows = [_row(i, f"+2547{i:08d}", f"{i:08d}") for i in range(plantation_service.MAX_IMPORT_ROWS_PER_REQUEST + 1)]
+
+        with pytest.raises(grpc.RpcError):
+            await _collect(servicer, context, rows)
+
+        assert context.abort.call_args.args[0] == grpc.StatusCode.INVALID_ARGUMENT
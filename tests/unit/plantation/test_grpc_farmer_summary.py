@@ -13,6 +13,7 @@ from plantation_model.api.plantation_service import PlantationServiceServicer
 from plantation_model.domain.models import (
     CollectionPoint,
     ContactInfo,
+    Factory,
     Farmer,
     FarmerPerformance,
     FarmScale,
@@ -22,6 +23,8 @@ from plantation_model.domain.models import (
     GradingType,
     HistoricalMetrics,
     OperatingHours,
+    QualityThresholds,
+    QualityTier,
     TodayMetrics,
     TrendDirection,
 )
@@ -322,6 +325,190 @@ class TestFarmerSummaryGrpcService:
 
         assert result.historical.improvement_trend == plantation_pb2.TREND_DIRECTION_IMPROVING
 
+    # =========================================================================
+    # Batch RPC Tests (GetFarmerSummaries / GetCollectionPointsForFarmers)
+    # =========================================================================
+
+    @pytest.mark.asyncio
+    async def test_get_farmer_summaries_batch(
+        self,
+        servicer: PlantationServiceServicer,
+        mock_farmer_repo: MagicMock,
+        mock_farmer_performance_repo: MagicMock,
+        mock_cp_repo: MagicMock,
+        mock_grading_model_repo: MagicMock,
+        mock_context: MagicMock,
+        sample_farmer: Farmer,
+        sample_farmer_performance: FarmerPerformance,
+        sample_collection_point: CollectionPoint,
+        sample_grading_model: GradingModel,
+    ) -> None:
+        """Test summaries come from one batch read each, with defaults and not-found IDs."""
+        second_farmer = sample_farmer.model_copy(update={"id": "WM-0002", "first_name": "Jane"})
+        mock_farmer_repo.get_by_ids = AsyncMock(return_value=[sample_farmer, second_farmer])
+        mock_farmer_performance_repo.get_by_farmer_ids = AsyncMock(return_value={"WM-0001": sample_farmer_performance})
+        mock_cp_repo.list_by_farmers = AsyncMock(return_value={"WM-0002": [sample_collection_point]})
+        mock_grading_model_repo.get_by_factory = AsyncMock(return_value=sample_grading_model)
+
+        request = plantation_pb2.GetFarmerSummariesRequest(farmer_ids=["WM-0001", "WM-0002", "WM-9999", "WM-0001"])
+        result = await servicer.GetFarmerSummaries(request, mock_context)
+
+        assert [s.farmer_id for s in result.summaries] == ["WM-0001", "WM-0002"]
+        assert result.summaries[0].historical.primary_percentage_30d == pytest.approx(83.3, 0.1)
+        assert result.summaries[1].grading_model_id == "tbk_kenya_tea_v1"
+        assert result.summaries[1].today.deliveries == 0
+        assert list(result.not_found_farmer_ids) == ["WM-9999"]
+        mock_farmer_repo.get_by_ids.assert_awaited_once_with(["WM-0001", "WM-0002", "WM-9999"])
+        mock_cp_repo.list_by_farmers.assert_awaited_once_with(["WM-0002"])
+
+    @pytest.mark.asyncio
+    async def test_get_farmer_summaries_rejects_oversized_batch(
+        self,
+        servicer: PlantationServiceServicer,
+        mock_context: MagicMock,
+    ) -> None:
+        """Test more than MAX_BATCH_FARMER_IDS IDs is INVALID_ARGUMENT."""
+        request = plantation_pb2.GetFarmerSummariesRequest(farmer_ids=[f"WM-{i:04d}" for i in range(501)])
+
+        with pytest.raises(grpc.RpcError):
+            await servicer.GetFarmerSummaries(request, mock_context)
+
+        assert mock_context.abort.call_args[0][0] == grpc.StatusCode.INVALID_ARGUMENT
+
+    @pytest.mark.asyncio
+    async def test_get_collection_points_for_farmers_dedupes_cps(
+        self,
+        servicer: PlantationServiceServicer,
+        mock_cp_repo: MagicMock,
+        mock_context: MagicMock,
+        sample_collection_point: CollectionPoint,
+    ) -> None:
+        """Test a CP shared by several farmers is returned once and referenced by ID."""
+        shared_cp = sample_collection_point.model_copy(update={"farmer_ids": ["WM-0001", "WM-0002"]})
+        mock_cp_repo.list_by_farmers = AsyncMock(
+            return_value={"WM-0001": [shared_cp], "WM-0002": [shared_cp], "WM-0003": []}
+        )
+
+        request = plantation_pb2.GetCollectionPointsForFarmersRequest(farmer_ids=["WM-0001", "WM-0002", "WM-0003"])
+        result = await servicer.GetCollectionPointsForFarmers(request, mock_context)
+
+        assert [cp.id for cp in result.collection_points] == ["nyeri-highland-cp-001"]
+        assert {m.farmer_id: list(m.collection_point_ids) for m in result.memberships} == {
+            "WM-0001": ["nyeri-highland-cp-001"],
+            "WM-0002": ["nyeri-highland-cp-001"],
+            "WM-0003": [],
+        }
+
+    # =========================================================================
+    # ListFarmers filters and precomputed tier
+    # =========================================================================
+
+    @pytest.mark.asyncio
+    async def test_list_farmers_pushes_filters_to_repository(
+        self,
+        servicer: PlantationServiceServicer,
+        mock_farmer_repo: MagicMock,
+        mock_context: MagicMock,
+        sample_farmer: Farmer,
+    ) -> None:
+        """Test proto filters map to list_filtered and server pagination is returned as-is."""
+        mock_farmer_repo.list_filtered = AsyncMock(return_value=([sample_farmer], "WM-0001", 42))
+
+        request = plantation_pb2.ListFarmersRequest(
+            region_id="nyeri-highland",
+            page_size=1,
+            active_only=True,
+            farm_scale=plantation_pb2.FARM_SCALE_MEDIUM,
+            search="wanj",
+            tier=plantation_pb2.QUALITY_TIER_BELOW_TIER_3,
+        )
+        result = await servicer.ListFarmers(request, mock_context)
+
+        assert [f.id for f in result.farmers] == ["WM-0001"]
+        assert result.next_page_token == "WM-0001"
+        assert result.total_count == 42
+        mock_farmer_repo.list_filtered.assert_awaited_once_with(
+            region_id="nyeri-highland",
+            active_only=True,
+            farm_scale=FarmScale.MEDIUM,
+            search="wanj",
+            tier=QualityTier.BELOW_TIER_3,
+            page_size=1,
+            page_token=None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_list_farmers_unspecified_filters_are_none(
+        self,
+        servicer: PlantationServiceServicer,
+        mock_farmer_repo: MagicMock,
+        mock_context: MagicMock,
+    ) -> None:
+        """Test unset proto enums and strings mean no filter."""
+        mock_farmer_repo.list_filtered = AsyncMock(return_value=([], None, 0))
+
+        await servicer.ListFarmers(plantation_pb2.ListFarmersRequest(), mock_context)
+
+        kwargs = mock_farmer_repo.list_filtered.call_args.kwargs
+        assert kwargs["farm_scale"] is None
+        assert kwargs["search"] is None
+        assert kwargs["tier"] is None
+        assert kwargs["page_size"] == 100
+
+    @pytest.mark.asyncio
+    async def test_get_farmer_summary_includes_precomputed_tier(
+        self,
+        servicer: PlantationServiceServicer,
+        mock_farmer_repo: MagicMock,
+        mock_farmer_performance_repo: MagicMock,
+        mock_context: MagicMock,
+        sample_farmer: Farmer,
+        sample_farmer_performance: FarmerPerformance,
+    ) -> None:
+        """Test the stored tier is mapped onto FarmerSummary."""
+        performance = sample_farmer_performance.model_copy(update={"tier": QualityTier.TIER_2})
+        mock_farmer_repo.get_by_id = AsyncMock(return_value=sample_farmer)
+        mock_farmer_performance_repo.get_by_farmer_id = AsyncMock(return_value=performance)
+
+        request = plantation_pb2.GetFarmerSummaryRequest(farmer_id="WM-0001")
+        result = await servicer.GetFarmerSummary(request, mock_context)
+
+        assert result.tier == plantation_pb2.QUALITY_TIER_TIER_2
+
+    @pytest.mark.asyncio
+    async def test_update_factory_thresholds_recomputes_tiers(
+        self,
+        servicer: PlantationServiceServicer,
+        mock_factory_repo: MagicMock,
+        mock_cp_repo: MagicMock,
+        mock_farmer_performance_repo: MagicMock,
+        mock_context: MagicMock,
+        sample_collection_point: CollectionPoint,
+    ) -> None:
+        """Test new quality thresholds re-derive tiers for the factory's farmers."""
+        thresholds = QualityThresholds(tier_1=90.0, tier_2=75.0, tier_3=55.0)
+        factory = Factory(
+            id="KEN-FAC-001",
+            name="Test Factory",
+            code="TF",
+            region_id="nyeri-highland",
+            location=GeoLocation(latitude=-0.4, longitude=36.9),
+            contact=ContactInfo(),
+            processing_capacity_kg=50000,
+            quality_thresholds=thresholds,
+        )
+        mock_factory_repo.update = AsyncMock(return_value=factory)
+        mock_cp_repo.list_by_factory = AsyncMock(return_value=([sample_collection_point], None, 1))
+        mock_farmer_performance_repo.recompute_tiers = AsyncMock(return_value=1)
+
+        request = plantation_pb2.UpdateFactoryRequest(
+            id="KEN-FAC-001",
+            quality_thresholds=plantation_pb2.QualityThresholds(tier_1=90.0, tier_2=75.0, tier_3=55.0),
+        )
+        await servicer.UpdateFactory(request, mock_context)
+
+        mock_farmer_performance_repo.recompute_tiers.assert_awaited_once_with(thresholds, ["WM-0001"])
+
 
 class TestFarmerPerformanceAutoInit:
     """Tests for auto-initialization of performance on farmer registration (Task 8.8).
@@ -0,0 +1,55 @@
+"""Unit tests for the historical metrics admin endpoints."""
+
+from collections.abc import Generator
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from plantation_model.api.historical_metrics import router, set_historical_metrics_engine
+
+
+@pytest.fixture
+def engine() -> Generator[AsyncMock, None, None]:
+    """Install a mock HistoricalMetricsEngine for the router."""
+    engine = AsyncMock()
+    set_historical_metrics_engine(engine)
+    yield engine
+    set_historical_metrics_engine(None)
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Create a test client for an app with the historical metrics router."""
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestRecomputeFactory:
+    """Tests for POST /admin/historical-metrics/factories/{factory_id}/recompute."""
+
+    def test_recompute_returns_count(self, client: TestClient, engine: AsyncMock) -> None:
+        """Test the endpoint backfills the factory and reports the farmer count."""
+        engine.backfill_factory.return_value = 42
+
+        response = client.post("/admin/historical-metrics/factories/KEN-FAC-001/recompute")
+
+        assert response.status_code == 200
+        assert response.json() == {"factory_id": "KEN-FAC-001", "farmers_recomputed": 42}
+        engine.backfill_factory.assert_awaited_once_with("KEN-FAC-001")
+
+    def test_unknown_factory_returns_404(self, client: TestClient, engine: AsyncMock) -> None:
+        """Test a missing factory is a 404."""
+        engine.backfill_factory.return_value = None
+
+        response = client.post("/admin/historical-metrics/factories/missing/recompute")
+
+        assert response.status_code == 404
+
+    def test_not_configured_returns_503(self, client: TestClient) -> None:
+        """Test the endpoint is unavailable until main.py sets the engine."""
+        response = client.post("/admin/historical-metrics/factories/KEN-FAC-001/recompute")
+
+        assert response.status_code == 503
@@ -9,7 +9,7 @@ import pytest
 from dapr.clients.exceptions import DaprInternalError
 from grpc import RpcError
 from plantation_model.domain.events.farmer_events import FarmerRegisteredEvent
-from plantation_model.events.publisher import publish_event
+from plantation_model.events.publisher import publish_event, publish_events
 
 
 class TestPublishEvent:
@@ -180,3 +180,47 @@ class TestPublishEvent:
             assert call_kwargs["data_content_type"] == "application/json"
             # Data must be JSON string, not dict
             assert isinstance(call_kwargs["data"], str)
+
+
+class TestPublishEvents:
+    """Tests for publish_events (bulk publish)."""
+
+    @pytest.mark.asyncio
+    async def test_publish_events_single_bulk_call(self) -> None:
+        """Test all events go out in one bulk publish and failures are subtracted."""
+        with patch("plantation_model.events.publisher.DaprClient") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.publish_events.return_value = MagicMock(failed_entries=[MagicMock(error="boom")])
+            mock_client_class.return_value.__enter__ = MagicMock(return_value=mock_client)
+            mock_client_class.return_value.__exit__ = MagicMock(return_value=None)
+
+            published = await publish_events(
+                pubsub_name="pubsub",
+                topic="plantation.quality.graded",
+                events=[{"farmer_id": "WM-0001"}, {"farmer_id": "WM-0002"}],
+            )
+
+            assert published == 1
+            mock_client.publish_events.assert_called_once()
+            call_kwargs = mock_client.publish_events.call_args.kwargs
+            assert call_kwargs["topic_name"] == "plantation.quality.graded"
+            assert call_kwargs["data_content_type"] == "application/json"
+            assert call_kwargs["data"] == ['{"farmer_id": "WM-0001"}', '{"farmer_id": "WM-0002"}']
+
+    @pytest.mark.asyncio
+    async def test_publish_events_empty_does_not_connect(self) -> None:
+        """Test an empty list publishes nothing."""
+        with patch("plantation_model.events.publisher.DaprClient") as mock_client_class:
+            assert await publish_events(pubsub_name="pubsub", topic="t", events=[]) == 0
+            mock_client_class.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_publish_events_sidecar_unavailable(self) -> None:
+        """Test DAPR errors are reported as zero published."""
+        with patch("plantation_model.events.publisher.DaprClient") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.publish_events.side_effect = DaprInternalError("sidecar down")
+            mock_client_class.return_value.__enter__ = MagicMock(return_value=mock_client)
+            mock_client_class.return_value.__exit__ = MagicMock(return_value=None)
+
+            assert await publish_events(pubsub_name="pubsub", topic="t", events=[{"a": 1}]) == 0
@@ -28,6 +28,7 @@ from plantation_model.domain.services.quality_event_processor import (
 from plantation_model.infrastructure.collection_grpc_client import (
     DocumentNotFoundError,
 )
+from plantation_model.infrastructure.repositories.farmer_performance_repository import DeliveryUpdate
 
 
 @pytest.fixture
@@ -179,8 +180,9 @@ class TestQualityEventProcessor:
         # Arrange
         mock_collection_client.get_document.return_value = sample_document
         mock_grading_model_repo.get_by_id_and_version.return_value = sample_grading_model
-        mock_farmer_performance_repo.get_by_farmer_id.return_value = sample_farmer_performance
-        mock_farmer_performance_repo.increment_today_delivery.return_value = sample_farmer_performance
+        mock_farmer_performance_repo.apply_delivery.return_value = DeliveryUpdate(
+            previous=sample_farmer_performance, performance=sample_farmer_performance
+        )
 
         # Act - Story 0.6.14: Patch module-level publish_event
         with patch(
@@ -266,7 +268,7 @@ class TestQualityEventProcessor:
         # Arrange
         mock_collection_client.get_document.return_value = sample_document
         mock_grading_model_repo.get_by_id_and_version.return_value = sample_grading_model
-        mock_farmer_performance_repo.get_by_farmer_id.return_value = None
+        mock_farmer_performance_repo.apply_delivery.return_value = None
 
         # Act
         result = await processor.process(
@@ -336,16 +338,16 @@ class TestQualityEventProcessor:
         sample_grading_model: GradingModel,
         sample_farmer_performance: FarmerPerformance,
     ) -> None:
-        """Test that date rollover resets today's metrics."""
+        """Test that date rollover happens inside the single delivery update."""
         # Arrange - performance from yesterday
-        yesterday_performance = sample_farmer_performance.model_copy()
+        yesterday_performance = sample_farmer_performance.model_copy(deep=True)
         yesterday_performance.today.metrics_date = dt.date.today() - dt.timedelta(days=1)
 
         mock_collection_client.get_document.return_value = sample_document
         mock_grading_model_repo.get_by_id_and_version.return_value = sample_grading_model
-        mock_farmer_performance_repo.get_by_farmer_id.return_value = yesterday_performance
-        mock_farmer_performance_repo.reset_today.return_value = sample_farmer_performance
-        mock_farmer_performance_repo.increment_today_delivery.return_value = sample_farmer_performance
+        mock_farmer_performance_repo.apply_delivery.return_value = DeliveryUpdate(
+            previous=yesterday_performance, performance=sample_farmer_performance
+        )
 
         # Act - Story 0.6.14: Patch module-level publish_event
         with patch(
@@ -358,8 +360,11 @@ class TestQualityEventProcessor:
                 farmer_id="WM-0001",
             )
 
-        # Assert
-        mock_farmer_performance_repo.reset_today.assert_called_once_with("WM-0001")
+        # Assert - one round trip: no read before and no separate reset
+        mock_farmer_performance_repo.apply_delivery.assert_awaited_once()
+        assert mock_farmer_performance_repo.apply_delivery.call_args.kwargs == {"today": dt.date.today()}
+        mock_farmer_performance_repo.get_by_farmer_id.assert_not_called()
+        mock_farmer_performance_repo.reset_today.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_process_emits_quality_graded_event(
@@ -379,8 +384,9 @@ class TestQualityEventProcessor:
         # Arrange
         mock_collection_client.get_document.return_value = sample_document
         mock_grading_model_repo.get_by_id_and_version.return_value = sample_grading_model
-        mock_farmer_performance_repo.get_by_farmer_id.return_value = sample_farmer_performance
-        mock_farmer_performance_repo.increment_today_delivery.return_value = sample_farmer_performance
+        mock_farmer_performance_repo.apply_delivery.return_value = DeliveryUpdate(
+            previous=sample_farmer_performance, performance=sample_farmer_performance
+        )
 
         # Act - Patch module-level publish_event and track calls
         with patch(
@@ -419,8 +425,9 @@ class TestQualityEventProcessor:
         # Arrange
         mock_collection_client.get_document.return_value = sample_document
         mock_grading_model_repo.get_by_id_and_version.return_value = sample_grading_model
-        mock_farmer_performance_repo.get_by_farmer_id.return_value = sample_farmer_performance
-        mock_farmer_performance_repo.increment_today_delivery.return_value = sample_farmer_performance
+        mock_farmer_performance_repo.apply_delivery.return_value = DeliveryUpdate(
+            previous=sample_farmer_performance, performance=sample_farmer_performance
+        )
 
         # Act - Patch module-level publish_event and track calls
         with patch(
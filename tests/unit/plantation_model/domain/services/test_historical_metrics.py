@@ -0,0 +1,522 @@
+"""Unit tests for the rolling-window historical metrics engine.
+
+Tests cover:
+- Window membership and boundary ranges
+- Incremental day-by-day advance matching a full recompute
+- Gaps, expiry and the full-recompute fallback
+- Values written before daily buckets existed surviving roll-up and recompute
+- Bulk recompute / factory backfill from daily buckets
+- QualityEventProcessor rolling up at date rollover
+"""
+
+import datetime as dt
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fp_common.models import Document, ExtractionMetadata, IngestionMetadata, RawDocumentRef
+from plantation_model.domain.models import (
+    CollectionPoint,
+    DailyDeliveryMetrics,
+    Factory,
+    FarmerPerformance,
+    FarmScale,
+    GeoLocation,
+    GradeRules,
+    GradingModel,
+    GradingType,
+    HistoricalMetrics,
+    QualityThresholds,
+    QualityTier,
+    TodayMetrics,
+    TrendDirection,
+)
+from plantation_model.domain.services.historical_metrics import (
+    HistoricalMetricsEngine,
+    advance_windows,
+    boundary_ranges,
+    in_window,
+)
+from plantation_model.domain.services.quality_event_processor import QualityEventProcessor
+from plantation_model.infrastructure.repositories.farmer_performance_repository import DeliveryUpdate
+
+AS_OF = dt.date(2026, 6, 1)
+
+
+class InMemoryDailyMetrics:
+    """Daily buckets kept in a dict, with the DailyMetricsRepository query API."""
+
+    def __init__(self) -> None:
+        self.days: dict[tuple[str, dt.date], DailyDeliveryMetrics] = {}
+        self.range_queries: list[list[tuple[dt.date, dt.date]]] = []
+
+    async def upsert_days(self, days: list[DailyDeliveryMetrics]) -> int:
+        for day in days:
+            self.days[(day.farmer_id, day.metrics_date)] = day
+        return len(days)
+
+    async def find_in_ranges(self, farmer_id: str, ranges: list[tuple[dt.date, dt.date]]) -> list:
+        self.range_queries.append(ranges)
+        return sorted(
+            (
+                day
+                for (fid, date), day in self.days.items()
+                if fid == farmer_id and any(after < date <= through for after, through in ranges)
+            ),
+            key=lambda day: day.metrics_date,
+        )
+
+    async def iter_for_farmers(self, farmer_ids: list[str], after: dt.date, through: dt.date):
+        for (fid, date), day in list(self.days.items()):
+            if fid in farmer_ids and after < date <= through:
+                yield day
+
+
+def _day(farmer_id: str, date: dt.date, primary: int, secondary: int = 0, kg: float = 10.0) -> DailyDeliveryMetrics:
+    grade_counts = {"Primary": primary}
+    if secondary:
+        grade_counts["Secondary"] = secondary
+    return DailyDeliveryMetrics(
+        farmer_id=farmer_id,
+        metrics_date=date,
+        deliveries=primary + secondary,
+        total_kg=kg,
+        grade_counts=grade_counts,
+        attribute_counts={"leaf_type": {"bud": primary}},
+    )
+
+
+def _performance(farmer_id: str = "WM-0001", **updates) -> FarmerPerformance:
+    performance = FarmerPerformance(
+        farmer_id=farmer_id,
+        grading_model_id="tbk_kenya_tea_v1",
+        grading_model_version="1.0.0",
+        farm_size_hectares=2.0,
+        farm_scale=FarmScale.MEDIUM,
+    )
+    return performance.model_copy(update=updates)
+
+
+def _legacy_historical() -> HistoricalMetrics:
+    """Populated windows without metrics_through, as seeded before daily buckets existed."""
+    return HistoricalMetrics(
+        grade_distribution_30d={"Primary": 8, "Secondary": 2},
+        grade_distribution_90d={"Primary": 24, "Secondary": 6},
+        grade_distribution_year={"Primary": 90, "Secondary": 10},
+        primary_percentage_30d=80.0,
+        primary_percentage_90d=80.0,
+        primary_percentage_year=90.0,
+        total_kg_30d=100.0,
+        total_kg_90d=300.0,
+        total_kg_year=1000.0,
+        improvement_trend=TrendDirection.STABLE,
+    )
+
+
+@pytest.fixture
+def grading_model() -> GradingModel:
+    """Create a grading model whose primary label is 'Primary'."""
+    return GradingModel(
+        model_id="tbk_kenya_tea_v1",
+        model_version="1.0.0",
+        regulatory_authority="Tea Board of Kenya",
+        crops_name="Tea",
+        market_name="Kenya_TBK",
+        grading_type=GradingType.BINARY,
+        attributes={},
+        grade_rules=GradeRules(),
+        grade_labels={"ACCEPT": "Primary", "REJECT": "Secondary"},
+        active_at_factory=["factory-001"],
+    )
+
+
+@pytest.fixture
+def daily_repo() -> InMemoryDailyMetrics:
+    """In-memory daily bucket store."""
+    return InMemoryDailyMetrics()
+
+
+@pytest.fixture
+def engine(daily_repo: InMemoryDailyMetrics, grading_model: GradingModel) -> HistoricalMetricsEngine:
+    """Create an engine over the in-memory buckets and mock repositories."""
+    grading_model_repo = AsyncMock()
+    grading_model_repo.get_by_id_and_version.return_value = grading_model
+    performance_repo = AsyncMock()
+    performance_repo.update_historical_many = AsyncMock(side_effect=lambda updates: len(updates))
+    return HistoricalMetricsEngine(
+        daily_metrics_repo=daily_repo,
+        farmer_performance_repo=performance_repo,
+        grading_model_repo=grading_model_repo,
+        factory_repo=AsyncMock(),
+        cp_repo=AsyncMock(),
+    )
+
+
+class TestWindowMath:
+    """Window membership and incremental advance."""
+
+    def test_in_window_bounds(self) -> None:
+        """Test a window of N days ending at t holds t-N < day <= t."""
+        assert in_window(AS_OF, AS_OF, 30)
+        assert in_window(AS_OF - dt.timedelta(days=29), AS_OF, 30)
+        assert not in_window(AS_OF - dt.timedelta(days=30), AS_OF, 30)
+        assert not in_window(AS_OF + dt.timedelta(days=1), AS_OF, 30)
+        assert not in_window(AS_OF, None, 30)
+
+    def test_boundary_ranges_for_one_day(self) -> None:
+        """Test advancing one day reads the new day and the day leaving each window."""
+        old = AS_OF - dt.timedelta(days=1)
+
+        ranges = boundary_ranges(old, AS_OF)
+
+        assert ranges[0] == (old, AS_OF)
+        for (after, through), days in zip(ranges[1:], (30, 90, 365), strict=True):
+            assert (through - after).days == 1
+            assert through == AS_OF - dt.timedelta(days=days)
+
+    def test_daily_advance_matches_full_recompute(self) -> None:
+        """Test 400 single-day advances give the same windows as summing the buckets."""
+        start = AS_OF - dt.timedelta(days=400)
+        buckets = [
+            _day("WM-0001", start + dt.timedelta(days=i), primary=i % 5, secondary=i % 3, kg=1.5 * (i % 7))
+            for i in range(400)
+            if i % 4
+        ]
+        historical = HistoricalMetrics(metrics_through=start)
+
+        through = start
+        while through < AS_OF:
+            new_through = through + dt.timedelta(days=1)
+            ranges = boundary_ranges(through, new_through)
+            moving = [b for b in buckets if any(after < b.metrics_date <= end for after, end in ranges)]
+            windows = advance_windows(historical, moving, new_through)
+            historical = HistoricalMetrics(
+                **{
+                    f"{field}_{suffix}": value
+                    for suffix, totals in windows.items()
+                    for field, value in (
+                        ("grade_distribution", totals.grade_counts),
+                        ("attribute_distributions", totals.attribute_counts),
+                        ("total_kg", totals.total_kg),
+                    )
+                },
+                metrics_through=new_through,
+            )
+            through = new_through
+
+        full = advance_windows(HistoricalMetrics(), buckets, AS_OF)
+        for suffix, totals in full.items():
+            assert getattr(historical, f"grade_distribution_{suffix}") == totals.grade_counts
+            assert getattr(historical, f"attribute_distributions_{suffix}") == totals.attribute_counts
+            assert getattr(historical, f"total_kg_{suffix}") == pytest.approx(totals.total_kg)
+
+    def test_expired_days_leave_window(self) -> None:
+        """Test a bucket 30 days back drops out of the 30-day window only."""
+        old = AS_OF - dt.timedelta(days=1)
+        leaving = _day("WM-0001", old - dt.timedelta(days=29), primary=2)
+        historical = HistoricalMetrics(
+            grade_distribution_30d={"Primary": 2},
+            grade_distribution_90d={"Primary": 2},
+            grade_distribution_year={"Primary": 2},
+            total_kg_30d=10.0,
+            total_kg_90d=10.0,
+            total_kg_year=10.0,
+            metrics_through=old,
+        )
+
+        windows = advance_windows(historical, [leaving], AS_OF)
+
+        assert windows["30d"].grade_counts == {}
+        assert windows["30d"].total_kg == 0.0
+        assert windows["90d"].grade_counts == {"Primary": 2}
+
+
+class TestRollUp:
+    """Closing today snapshots and advancing windows."""
+
+    @pytest.mark.asyncio
+    async def test_rollover_closes_snapshot_and_advances(
+        self, engine: HistoricalMetricsEngine, daily_repo: InMemoryDailyMetrics
+    ) -> None:
+        """Test yesterday's today metrics become a bucket and enter every window."""
+        yesterday = AS_OF - dt.timedelta(days=1)
+        daily_repo.days[("WM-0001", yesterday - dt.timedelta(days=40))] = _day(
+            "WM-0001", yesterday - dt.timedelta(days=40), primary=0, secondary=4
+        )
+        performance = _performance(
+            historical=HistoricalMetrics(
+                grade_distribution_90d={"Secondary": 4},
+                grade_distribution_year={"Secondary": 4},
+                total_kg_90d=10.0,
+                total_kg_year=10.0,
+                metrics_through=yesterday - dt.timedelta(days=1),
+            ),
+            today=TodayMetrics(deliveries=3, total_kg=30.0, grade_counts={"Primary": 3}, metrics_date=yesterday),
+        )
+        engine._factory_repo.get_by_id.return_value = None
+
+        result = await engine.roll_up([performance], {"WM-0001": "factory-001"}, as_of=AS_OF)
+
+        assert ("WM-0001", yesterday) in daily_repo.days
+        historical = result["WM-0001"]
+        assert historical.metrics_through == yesterday
+        assert historical.grade_distribution_30d == {"Primary": 3}
+        assert historical.primary_percentage_30d == 100.0
+        assert historical.grade_distribution_90d == {"Secondary": 4, "Primary": 3}
+        assert historical.primary_percentage_90d == pytest.approx(300 / 7)
+        assert historical.total_kg_30d == 30.0
+        assert historical.yield_kg_per_hectare_30d == 15.0
+        assert historical.improvement_trend == TrendDirection.IMPROVING
+        # Incremental: only boundary days were read
+        assert daily_repo.range_queries[-1][0] == (yesterday - dt.timedelta(days=1), yesterday)
+
+    @pytest.mark.asyncio
+    async def test_current_windows_are_not_rewritten(self, engine: HistoricalMetricsEngine) -> None:
+        """Test a farmer whose windows already end yesterday is skipped."""
+        performance = _performance(historical=HistoricalMetrics(metrics_through=AS_OF - dt.timedelta(days=1)))
+
+        assert await engine.roll_up([performance], as_of=AS_OF) == {}
+        engine._farmer_performance_repo.update_historical_many.assert_awaited_once_with([])
+
+    @pytest.mark.asyncio
+    async def test_first_roll_up_reads_whole_year(
+        self, engine: HistoricalMetricsEngine, daily_repo: InMemoryDailyMetrics
+    ) -> None:
+        """Test a farmer never computed gets windows built from a year of buckets."""
+        old_day = AS_OF - dt.timedelta(days=200)
+        daily_repo.days[("WM-0001", old_day)] = _day("WM-0001", old_day, primary=1, secondary=1)
+
+        result = await engine.roll_up([_performance()], as_of=AS_OF)
+
+        historical = result["WM-0001"]
+        assert historical.grade_distribution_30d == {}
+        assert historical.grade_distribution_90d == {}
+        assert historical.grade_distribution_year == {"Primary": 1, "Secondary": 1}
+        assert historical.primary_percentage_year == 50.0
+        assert historical.improvement_trend == TrendDirection.STABLE
+
+    @pytest.mark.asyncio
+    async def test_legacy_values_survive_roll_up_without_buckets(self, engine: HistoricalMetricsEngine) -> None:
+        """Test values written before daily buckets existed are kept and only metrics_through is set."""
+        legacy = _legacy_historical()
+
+        result = await engine.roll_up([_performance(historical=legacy)], as_of=AS_OF)
+
+        historical = result["WM-0001"]
+        assert historical.metrics_through == AS_OF - dt.timedelta(days=1)
+        assert historical.model_dump(exclude={"metrics_through", "computed_at"}) == legacy.model_dump(
+            exclude={"metrics_through", "computed_at"}
+        )
+        assert QualityThresholds().classify(historical.primary_percentage_30d) == QualityTier.TIER_2
+
+    @pytest.mark.asyncio
+    async def test_legacy_values_seed_first_roll_up(
+        self, engine: HistoricalMetricsEngine, daily_repo: InMemoryDailyMetrics
+    ) -> None:
+        """Test new buckets are added on top of values written before daily buckets existed."""
+        yesterday = AS_OF - dt.timedelta(days=1)
+        daily_repo.days[("WM-0001", yesterday)] = _day("WM-0001", yesterday, primary=0, secondary=10, kg=100.0)
+
+        result = await engine.roll_up([_performance(historical=_legacy_historical())], as_of=AS_OF)
+
+        historical = result["WM-0001"]
+        assert historical.grade_distribution_30d == {"Primary": 8, "Secondary": 12}
+        assert historical.primary_percentage_30d == 40.0
+        assert historical.grade_distribution_year == {"Primary": 90, "Secondary": 20}
+        assert historical.total_kg_year == 1100.0
+
+
+class TestRecompute:
+    """Bulk recompute and factory backfill."""
+
+    @pytest.mark.asyncio
+    async def test_backfill_factory_recomputes_all_cp_farmers(
+        self, engine: HistoricalMetricsEngine, daily_repo: InMemoryDailyMetrics
+    ) -> None:
+        """Test a backfill pages the factory's CPs and writes every farmer in one bulk call."""
+        thresholds = QualityThresholds(tier_1=90.0, tier_2=70.0, tier_3=50.0)
+        engine._factory_repo.get_by_id.return_value = Factory(
+            id="KEN-FAC-001",
+            name="Kericho",
+            code="KF",
+            region_id="kericho-highland",
+            location=GeoLocation(latitude=-0.37, longitude=35.28, altitude_meters=2000.0),
+            quality_thresholds=thresholds,
+        )
+        cp = CollectionPoint(
+            id="cp-001",
+            name="CP",
+            factory_id="KEN-FAC-001",
+            location=GeoLocation(latitude=-0.37, longitude=35.28, altitude_meters=2000.0),
+            region_id="kericho-highland",
+            farmer_ids=["WM-0001", "WM-0002"],
+        )
+        engine._cp_repo.list_by_factory.return_value = ([cp], None, 1)
+        engine._farmer_performance_repo.get_by_farmer_ids.return_value = {
+            "WM-0001": _performance("WM-0001"),
+            "WM-0002": _performance(
+                "WM-0002",
+                today=TodayMetrics(
+                    deliveries=2,
+                    total_kg=8.0,
+                    grade_counts={"Secondary": 2},
+                    metrics_date=AS_OF - dt.timedelta(days=3),
+                ),
+            ),
+        }
+        for offset in (1, 10, 60, 300, 400):
+            date = AS_OF - dt.timedelta(days=offset)
+            daily_repo.days[("WM-0001", date)] = _day("WM-0001", date, primary=1)
+
+        recomputed = await engine.backfill_factory("KEN-FAC-001", as_of=AS_OF)
+
+        assert recomputed == 2
+        engine._farmer_performance_repo.get_by_farmer_ids.assert_awaited_once_with(["WM-0001", "WM-0002"])
+        (updates,) = engine._farmer_performance_repo.update_historical_many.call_args.args
+        by_farmer = {farmer_id: (historical, used) for farmer_id, historical, used in updates}
+        first, used = by_farmer["WM-0001"]
+        assert used == thresholds
+        assert first.grade_distribution_30d == {"Primary": 2}
+        assert first.grade_distribution_90d == {"Primary": 3}
+        assert first.grade_distribution_year == {"Primary": 4}
+        # Stale today snapshot was closed into a bucket and counted
+        second, _ = by_farmer["WM-0002"]
+        assert second.grade_distribution_30d == {"Secondary": 2}
+        assert second.metrics_through == AS_OF - dt.timedelta(days=1)
+
+    @pytest.mark.asyncio
+    async def test_backfill_unknown_factory(self, engine: HistoricalMetricsEngine) -> None:
+        """Test a missing factory returns None without touching farmers."""
+        engine._factory_repo.get_by_id.return_value = None
+
+        assert await engine.backfill_factory("missing", as_of=AS_OF) is None
+        engine._farmer_performance_repo.update_historical_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_backfill_tiers_uses_factory_thresholds(self, engine: HistoricalMetricsEngine) -> None:
+        """Test untiered records get their factory's thresholds, the rest the defaults."""
+        thresholds = QualityThresholds(tier_1=90.0, tier_2=70.0, tier_3=50.0)
+        factory = Factory(
+            id="KEN-FAC-001",
+            name="Kericho",
+            code="KF",
+            region_id="kericho-highland",
+            location=GeoLocation(latitude=-0.37, longitude=35.28, altitude_meters=2000.0),
+            quality_thresholds=thresholds,
+        )
+        cp = CollectionPoint(
+            id="cp-001",
+            name="CP",
+            factory_id="KEN-FAC-001",
+            location=GeoLocation(latitude=-0.37, longitude=35.28, altitude_meters=2000.0),
+            region_id="kericho-highland",
+            farmer_ids=["WM-0002", "WM-0001"],
+        )
+        engine._factory_repo.list.return_value = ([factory], None, 1)
+        engine._cp_repo.list_by_factory.return_value = ([cp], None, 1)
+        engine._farmer_performance_repo.recompute_tiers.side_effect = [2, 1]
+
+        assert await engine.backfill_tiers() == 3
+
+        factory_call, default_call = engine._farmer_performance_repo.recompute_tiers.await_args_list
+        assert factory_call.args == (thresholds, ["WM-0001", "WM-0002"])
+        assert factory_call.kwargs == {"only_missing": True}
+        assert default_call.args == (QualityThresholds(),)
+
+    @pytest.mark.asyncio
+    async def test_recompute_leaves_legacy_farmer_without_buckets(self, engine: HistoricalMetricsEngine) -> None:
+        """Test a farmer with pre-bucket values and no buckets in range is not rewritten."""
+        engine._farmer_performance_repo.get_by_farmer_ids.return_value = {
+            "WM-0001": _performance(historical=_legacy_historical())
+        }
+
+        assert await engine.recompute_farmers(["WM-0001"], as_of=AS_OF) == 0
+        engine._farmer_performance_repo.update_historical_many.assert_awaited_once_with([])
+
+    @pytest.mark.asyncio
+    async def test_recompute_seeds_legacy_farmer(
+        self, engine: HistoricalMetricsEngine, daily_repo: InMemoryDailyMetrics
+    ) -> None:
+        """Test a recompute keeps pre-bucket values, and their tier, under new buckets."""
+        day = AS_OF - dt.timedelta(days=5)
+        daily_repo.days[("WM-0001", day)] = _day("WM-0001", day, primary=10, kg=50.0)
+        engine._farmer_performance_repo.get_by_farmer_ids.return_value = {
+            "WM-0001": _performance(historical=_legacy_historical())
+        }
+
+        assert await engine.recompute_farmers(["WM-0001"], as_of=AS_OF) == 1
+
+        ((farmer_id, historical, _),) = engine._farmer_performance_repo.update_historical_many.call_args.args[0]
+        assert farmer_id == "WM-0001"
+        assert historical.metrics_through == AS_OF - dt.timedelta(days=1)
+        assert historical.grade_distribution_30d == {"Primary": 18, "Secondary": 2}
+        assert historical.primary_percentage_30d == 90.0
+        assert historical.total_kg_90d == 350.0
+        assert QualityThresholds().classify(historical.primary_percentage_30d) == QualityTier.TIER_1
+
+
+class TestProcessorRollover:
+    """QualityEventProcessor hands the previous day to the engine."""
+
+    @pytest.mark.asyncio
+    async def test_single_event_rollover_rolls_up_previous_day(self, grading_model: GradingModel) -> None:
+        """Test the snapshot replaced by the delivery update is rolled up with the event's factory."""
+        now = datetime(2026, 1, 6, 10, 0, 0, tzinfo=UTC)
+        document = Document(
+            document_id="doc-1",
+            raw_document=RawDocumentRef(
+                blob_container="quality-data",
+                blob_path="factory/doc-1.json",
+                content_hash="sha256:test",
+                size_bytes=1024,
+                stored_at=now,
+            ),
+            extraction=ExtractionMetadata(
+                ai_agent_id="extractor-v1",
+                extraction_timestamp=now,
+                confidence=0.95,
+                validation_passed=True,
+                validation_warnings=[],
+            ),
+            ingestion=IngestionMetadata(
+                ingestion_id="ing-001",
+                source_id="qc-analyzer-result",
+                received_at=now,
+                processed_at=now,
+            ),
+            extracted_fields={
+                "grading_model_id": "tbk_kenya_tea_v1",
+                "grading_model_version": "1.0.0",
+                "factory_id": "factory-001",
+                "bag_summary": {"total_weight_kg": 20.0, "primary_percentage": 80.0},
+            },
+            linkage_fields={"farmer_id": "WM-0001", "factory_id": "factory-001"},
+            created_at=now,
+        )
+        stale = _performance(
+            today=TodayMetrics(deliveries=2, total_kg=20.0, metrics_date=dt.date.today() - dt.timedelta(days=1))
+        )
+        collection_client = AsyncMock()
+        collection_client.get_document.return_value = document
+        grading_model_repo = AsyncMock()
+        grading_model_repo.get_by_id_and_version.return_value = grading_model
+        performance_repo = AsyncMock()
+        performance_repo.apply_delivery.return_value = DeliveryUpdate(previous=stale, performance=_performance())
+        historical_engine = AsyncMock()
+        processor = QualityEventProcessor(
+            collection_client=collection_client,
+            grading_model_repo=grading_model_repo,
+            farmer_performance_repo=performance_repo,
+            historical_engine=historical_engine,
+        )
+
+        with patch(
+            "plantation_model.domain.services.quality_event_processor.publish_event",
+            new_callable=AsyncMock,
+            return_value=True,
+        ):
+            result = await processor.process(document_id="doc-1", farmer_id="WM-0001")
+
+        assert result["status"] == "success"
+        performance_repo.reset_today.assert_not_called()
+        historical_engine.roll_up.assert_awaited_once_with([stale], {"WM-0001": "factory-001"}, as_of=dt.date.today())
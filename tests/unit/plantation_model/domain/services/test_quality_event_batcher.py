@@ -0,0 +1,94 @@
+"""Unit tests for QualityEventBatcher micro-batching."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from plantation_model.domain.services.quality_event_batcher import QualityEventBatcher
+from plantation_model.domain.services.quality_event_processor import QualityEventProcessingError
+
+
+def _processor(results=None) -> AsyncMock:
+    """Processor mock whose process_batch echoes a success per event (or given results)."""
+    processor = AsyncMock()
+
+    async def process_batch(events):
+        if results is not None:
+            return results
+        return [{"status": "success", "document_id": document_id} for document_id, _ in events]
+
+    processor.process_batch = AsyncMock(side_effect=process_batch)
+    return processor
+
+
+class TestQualityEventBatcher:
+    """Batch boundaries and per-event outcomes."""
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_immediately(self) -> None:
+        """Test reaching max_batch_size dispatches without waiting for the window."""
+        processor = _processor()
+        batcher = QualityEventBatcher(processor, max_batch_size=3, max_wait_ms=60_000)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(f"doc-{i}", "WM-0001") for i in range(3))),
+            timeout=1,
+        )
+
+        assert [r["document_id"] for r in results] == ["doc-0", "doc-1", "doc-2"]
+        processor.process_batch.assert_awaited_once_with(
+            [("doc-0", "WM-0001"), ("doc-1", "WM-0001"), ("doc-2", "WM-0001")]
+        )
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_flushes_after_window(self) -> None:
+        """Test events below max_batch_size are processed together when the window ends."""
+        processor = _processor()
+        batcher = QualityEventBatcher(processor, max_batch_size=100, max_wait_ms=10)
+
+        results = await asyncio.gather(batcher.submit("doc-1", "WM-0001"), batcher.submit("doc-2", "WM-0002"))
+
+        assert len(results) == 2
+        processor.process_batch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_errors_are_delivered_per_event(self) -> None:
+        """Test one event's processing error is raised only to its own caller."""
+        error = QualityEventProcessingError("Farmer not found", document_id="doc-2", error_type="farmer_not_found")
+        batcher = QualityEventBatcher(_processor([{"status": "success"}, error]), max_batch_size=2)
+
+        first, second = await asyncio.gather(
+            batcher.submit("doc-1", "WM-0001"),
+            batcher.submit("doc-2", "WM-9999"),
+            return_exceptions=True,
+        )
+
+        assert first == {"status": "success"}
+        assert second is error
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_fails_every_event(self) -> None:
+        """Test an exception from process_batch reaches all callers of that batch."""
+        processor = AsyncMock()
+        processor.process_batch = AsyncMock(side_effect=ConnectionError("mongo down"))
+        batcher = QualityEventBatcher(processor, max_batch_size=2)
+
+        results = await asyncio.gather(
+            batcher.submit("doc-1", "WM-0001"),
+            batcher.submit("doc-2", "WM-0002"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ConnectionError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending(self) -> None:
+        """Test close processes events still waiting for their window."""
+        processor = _processor()
+        batcher = QualityEventBatcher(processor, max_batch_size=100, max_wait_ms=60_000)
+
+        pending = asyncio.create_task(batcher.submit("doc-1", "WM-0001"))
+        await asyncio.sleep(0)
+        await batcher.close()
+
+        assert (await pending)["document_id"] == "doc-1"
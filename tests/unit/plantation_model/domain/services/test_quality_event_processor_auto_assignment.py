@@ -35,6 +35,7 @@ from plantation_model.domain.models import (
 from plantation_model.domain.services.quality_event_processor import (
     QualityEventProcessor,
 )
+from plantation_model.infrastructure.repositories.farmer_performance_repository import DeliveryUpdate
 
 
 @pytest.fixture
@@ -254,8 +255,9 @@ class TestAutoAssignment:
         # Arrange
         mock_collection_client.get_document.return_value = sample_document_with_cp
         mock_grading_model_repo.get_by_id_and_version.return_value = sample_grading_model
-        mock_farmer_performance_repo.get_by_farmer_id.return_value = sample_farmer_performance
-        mock_farmer_performance_repo.increment_today_delivery.return_value = sample_farmer_performance
+        mock_farmer_performance_repo.apply_delivery.return_value = DeliveryUpdate(
+            previous=sample_farmer_performance, performance=sample_farmer_performance
+        )
 
         # CP repo returns empty list (farmer not assigned) then updated CP
         mock_cp_repo.list_by_farmer.return_value = ([], None, 0)
@@ -293,8 +295,9 @@ class TestAutoAssignment:
         # Arrange
         mock_collection_client.get_document.return_value = sample_document_with_cp
         mock_grading_model_repo.get_by_id_and_version.return_value = sample_grading_model
-        mock_farmer_performance_repo.get_by_farmer_id.return_value = sample_farmer_performance
-        mock_farmer_performance_repo.increment_today_delivery.return_value = sample_farmer_performance
+        mock_farmer_performance_repo.apply_delivery.return_value = DeliveryUpdate(
+            previous=sample_farmer_performance, performance=sample_farmer_performance
+        )
 
         # Act
         with patch(
@@ -326,8 +329,9 @@ class TestAutoAssignment:
         # Arrange
         mock_collection_client.get_document.return_value = sample_document_without_cp
         mock_grading_model_repo.get_by_id_and_version.return_value = sample_grading_model
-        mock_farmer_performance_repo.get_by_farmer_id.return_value = sample_farmer_performance
-        mock_farmer_performance_repo.increment_today_delivery.return_value = sample_farmer_performance
+        mock_farmer_performance_repo.apply_delivery.return_value = DeliveryUpdate(
+            previous=sample_farmer_performance, performance=sample_farmer_performance
+        )
 
         # Act
         with patch(
@@ -365,8 +369,9 @@ class TestIdempotentAssignment:
         # Arrange
         mock_collection_client.get_document.return_value = sample_document_with_cp
         mock_grading_model_repo.get_by_id_and_version.return_value = sample_grading_model
-        mock_farmer_performance_repo.get_by_farmer_id.return_value = sample_farmer_performance
-        mock_farmer_performance_repo.increment_today_delivery.return_value = sample_farmer_performance
+        mock_farmer_performance_repo.apply_delivery.return_value = DeliveryUpdate(
+            previous=sample_farmer_performance, performance=sample_farmer_performance
+        )
 
         # CP repo returns the CP in list_by_farmer (already assigned)
         mock_cp_repo.list_by_farmer.return_value = ([sample_collection_point], None, 1)
@@ -470,8 +475,9 @@ class TestCrossFactoryAssignment:
 
         mock_collection_client.get_document.return_value = document_factory_2
         mock_grading_model_repo.get_by_id_and_version.return_value = sample_grading_model
-        mock_farmer_performance_repo.get_by_farmer_id.return_value = sample_farmer_performance
-        mock_farmer_performance_repo.increment_today_delivery.return_value = sample_farmer_performance
+        mock_farmer_performance_repo.apply_delivery.return_value = DeliveryUpdate(
+            previous=sample_farmer_performance, performance=sample_farmer_performance
+        )
 
         # Farmer already assigned to cp-001, but NOT to cp-002
         mock_cp_repo.list_by_farmer.return_value = ([cp_factory_1], None, 1)
@@ -516,8 +522,9 @@ class TestErrorHandling:
         # Arrange
         mock_collection_client.get_document.return_value = sample_document_with_cp
         mock_grading_model_repo.get_by_id_and_version.return_value = sample_grading_model
-        mock_farmer_performance_repo.get_by_farmer_id.return_value = sample_farmer_performance
-        mock_farmer_performance_repo.increment_today_delivery.return_value = sample_farmer_performance
+        mock_farmer_performance_repo.apply_delivery.return_value = DeliveryUpdate(
+            previous=sample_farmer_performance, performance=sample_farmer_performance
+        )
 
         # CP repo can't find the farmer (not assigned yet)
         mock_cp_repo.list_by_farmer.return_value = ([], None, 0)
@@ -554,8 +561,9 @@ class TestErrorHandling:
         # Arrange
         mock_collection_client.get_document.return_value = sample_document_with_cp
         mock_grading_model_repo.get_by_id_and_version.return_value = sample_grading_model
-        mock_farmer_performance_repo.get_by_farmer_id.return_value = sample_farmer_performance
-        mock_farmer_performance_repo.increment_today_delivery.return_value = sample_farmer_performance
+        mock_farmer_performance_repo.apply_delivery.return_value = DeliveryUpdate(
+            previous=sample_farmer_performance, performance=sample_farmer_performance
+        )
 
         # CP repo throws an error
         mock_cp_repo.list_by_farmer.side_effect = Exception("Database connection error")
@@ -0,0 +1,236 @@
+"""Unit tests for QualityEventProcessor.process_batch.
+
+Tests cover:
+- Per-farmer merging into one bulk performance write
+- Per-event errors (linkage failures) alongside successful events
+- Bulk publishing with one performance_updated event per farmer
+- Date rollover candidates updated one by one so the closed day is captured
+- Days closed by the bulk write itself rolled up too
+"""
+
+import datetime as dt
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fp_common.models import Document, ExtractionMetadata, IngestionMetadata, RawDocumentRef
+from plantation_model.domain.models import (
+    FarmerPerformance,
+    FarmScale,
+    GradeRules,
+    GradingModel,
+    GradingType,
+    TodayMetrics,
+)
+from plantation_model.domain.services.quality_event_processor import (
+    QualityEventProcessingError,
+    QualityEventProcessor,
+)
+from plantation_model.infrastructure.repositories.farmer_performance_repository import (
+    DeliveryBatchUpdate,
+    DeliveryUpdate,
+)
+
+
+def _document(document_id: str, farmer_id: str, grading_model_id: str, weight_kg: float) -> Document:
+    now = datetime(2026, 1, 6, 10, 0, 0, tzinfo=UTC)
+    return Document(
+        document_id=document_id,
+        raw_document=RawDocumentRef(
+            blob_container="quality-data",
+            blob_path=f"factory/{document_id}.json",
+            content_hash="sha256:test",
+            size_bytes=1024,
+            stored_at=now,
+        ),
+        extraction=ExtractionMetadata(
+            ai_agent_id="extractor-v1",
+            extraction_timestamp=now,
+            confidence=0.95,
+            validation_passed=True,
+            validation_warnings=[],
+        ),
+        ingestion=IngestionMetadata(
+            ingestion_id="ing-001",
+            source_id="qc-analyzer-result",
+            received_at=now,
+            processed_at=now,
+        ),
+        extracted_fields={
+            "grading_model_id": grading_model_id,
+            "grading_model_version": "1.0.0",
+            "factory_id": "factory-001",
+            "bag_summary": {"total_weight_kg": weight_kg, "primary_percentage": 80.0},
+        },
+        linkage_fields={"farmer_id": farmer_id, "factory_id": "factory-001"},
+        created_at=now,
+    )
+
+
+@pytest.fixture
+def grading_model() -> GradingModel:
+    """Create a sample grading model."""
+    return GradingModel(
+        model_id="tbk_kenya_tea_v1",
+        model_version="1.0.0",
+        regulatory_authority="Tea Board of Kenya",
+        crops_name="Tea",
+        market_name="Kenya_TBK",
+        grading_type=GradingType.BINARY,
+        attributes={},
+        grade_rules=GradeRules(),
+        grade_labels={"ACCEPT": "Primary", "REJECT": "Secondary"},
+        active_at_factory=["factory-001"],
+    )
+
+
+def _performance(farmer_id: str, deliveries: int, metrics_date: dt.date) -> FarmerPerformance:
+    return FarmerPerformance(
+        farmer_id=farmer_id,
+        grading_model_id="tbk_kenya_tea_v1",
+        grading_model_version="1.0.0",
+        farm_size_hectares=1.5,
+        farm_scale=FarmScale.MEDIUM,
+        today=TodayMetrics(
+            deliveries=deliveries,
+            total_kg=20.0 * deliveries,
+            grade_counts={"Primary": deliveries},
+            metrics_date=metrics_date,
+        ),
+    )
+
+
+@pytest.fixture
+def documents() -> dict[str, Document]:
+    """Documents by ID: two deliveries for WM-0001, one for WM-0002, one with an unknown model."""
+    return {
+        "doc-1": _document("doc-1", "WM-0001", "tbk_kenya_tea_v1", 20.0),
+        "doc-2": _document("doc-2", "WM-0001", "tbk_kenya_tea_v1", 15.0),
+        "doc-3": _document("doc-3", "WM-0002", "tbk_kenya_tea_v1", 10.0),
+        "doc-4": _document("doc-4", "WM-0002", "unknown_model", 10.0),
+    }
+
+
+@pytest.fixture
+def processor(documents: dict[str, Document], grading_model: GradingModel) -> QualityEventProcessor:
+    """Create a processor whose collection client and repos are mocks."""
+    collection_client = AsyncMock()
+    collection_client.get_document = AsyncMock(side_effect=lambda document_id: documents[document_id])
+    grading_model_repo = AsyncMock()
+    grading_model_repo.get_by_id_and_version = AsyncMock(
+        side_effect=lambda model_id, _version: grading_model if model_id == grading_model.model_id else None
+    )
+    return QualityEventProcessor(
+        collection_client=collection_client,
+        grading_model_repo=grading_model_repo,
+        farmer_performance_repo=AsyncMock(),
+    )
+
+
+class TestProcessBatch:
+    """Tests for micro-batch processing."""
+
+    @pytest.mark.asyncio
+    async def test_merges_per_farmer_and_isolates_failures(self, processor: QualityEventProcessor) -> None:
+        """Test one bulk write with merged increments, and an error only for the bad event."""
+        today = dt.date.today()
+        repo = processor._farmer_performance_repo
+        repo.get_by_farmer_ids.return_value = {
+            "WM-0001": _performance("WM-0001", 1, today),
+            "WM-0002": _performance("WM-0002", 4, today - dt.timedelta(days=1)),
+        }
+        repo.increment_today_deliveries.return_value = DeliveryBatchUpdate(
+            performances={"WM-0001": _performance("WM-0001", 3, today)}
+        )
+        repo.apply_delivery.return_value = DeliveryUpdate(
+            previous=_performance("WM-0002", 4, today - dt.timedelta(days=1)),
+            performance=_performance("WM-0002", 1, today),
+        )
+
+        with patch(
+            "plantation_model.domain.services.quality_event_processor.publish_events",
+            new_callable=AsyncMock,
+        ) as mock_publish:
+            results = await processor.process_batch(
+                [("doc-1", "WM-0001"), ("doc-2", "WM-0001"), ("doc-3", "WM-0002"), ("doc-4", "WM-0002")]
+            )
+
+        assert [r["status"] for r in results[:3]] == ["success"] * 3
+        assert isinstance(results[3], QualityEventProcessingError)
+        assert results[3].error_type == "grading_model_not_found"
+
+        repo.increment_today_deliveries.assert_awaited_once()
+        (increments,) = repo.increment_today_deliveries.call_args.args
+        merged = {increment.farmer_id: increment for increment in increments}
+        assert merged["WM-0001"].deliveries == 2
+        assert merged["WM-0001"].total_kg == 35.0
+        assert merged["WM-0001"].grade_counts == {"Primary": 2}
+        assert set(merged) == {"WM-0001"}
+        assert repo.increment_today_deliveries.call_args.kwargs == {"today": today}
+        # WM-0002 rolls over: updated on its own so the closed day comes back
+        repo.apply_delivery.assert_awaited_once()
+        (rollover,) = repo.apply_delivery.call_args.args
+        assert rollover.farmer_id == "WM-0002"
+        assert rollover.deliveries == 1
+
+        topics = {call.args[1]: call.args[2] for call in mock_publish.await_args_list}
+        assert [e["document_id"] for e in topics["plantation.quality.graded"]] == ["doc-1", "doc-2", "doc-3"]
+        updated = {e["farmer_id"]: e for e in topics["plantation.performance_updated"]}
+        assert set(updated) == {"WM-0001", "WM-0002"}
+        assert updated["WM-0001"]["triggered_by_document_id"] == "doc-2"
+        assert updated["WM-0001"]["today"]["deliveries"] == 3
+
+    @pytest.mark.asyncio
+    async def test_missing_performance_record_is_skipped(self, processor: QualityEventProcessor) -> None:
+        """Test events for farmers without a performance record are skipped, not failed."""
+        repo = processor._farmer_performance_repo
+        repo.get_by_farmer_ids.return_value = {}
+        repo.increment_today_deliveries.return_value = DeliveryBatchUpdate()
+
+        with patch(
+            "plantation_model.domain.services.quality_event_processor.publish_events",
+            new_callable=AsyncMock,
+        ):
+            results = await processor.process_batch([("doc-1", "WM-0001")])
+
+        assert results == [
+            {"status": "skipped", "reason": "no_performance_record", "document_id": "doc-1", "farmer_id": "WM-0001"}
+        ]
+        assert repo.increment_today_deliveries.call_args.args[0] == []
+
+    @pytest.mark.asyncio
+    async def test_rolls_up_days_closed_by_bulk_write(self, processor: QualityEventProcessor) -> None:
+        """Test a day that ends between the read and the bulk write is still rolled up."""
+        today = dt.date.today()
+        closed_day = _performance("WM-0001", 5, today - dt.timedelta(days=1))
+        repo = processor._farmer_performance_repo
+        repo.get_by_farmer_ids.return_value = {"WM-0001": _performance("WM-0001", 5, today)}
+        repo.increment_today_deliveries.return_value = DeliveryBatchUpdate(
+            performances={"WM-0001": _performance("WM-0001", 1, today)},
+            closed=[closed_day],
+        )
+        processor._historical_engine = AsyncMock()
+
+        with patch(
+            "plantation_model.domain.services.quality_event_processor.publish_events",
+            new_callable=AsyncMock,
+        ):
+            results = await processor.process_batch([("doc-1", "WM-0001")])
+
+        assert results[0]["status"] == "success"
+        repo.apply_delivery.assert_not_called()
+        processor._historical_engine.roll_up.assert_awaited_once_with(
+            [closed_day], {"WM-0001": "factory-001"}, as_of=today
+        )
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_failure_fails_each_prepared_event(self, processor: QualityEventProcessor) -> None:
+        """Test a failed bulk write is reported per event so each message is retried."""
+        repo = processor._farmer_performance_repo
+        repo.get_by_farmer_ids.side_effect = RuntimeError("mongo down")
+
+        results = await processor.process_batch([("doc-1", "WM-0001"), ("doc-4", "WM-0002")])
+
+        assert results[0].error_type == "unexpected_error"
+        assert results[0].document_id == "doc-1"
+        assert results[1].error_type == "grading_model_not_found"
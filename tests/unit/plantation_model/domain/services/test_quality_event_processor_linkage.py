@@ -21,6 +21,7 @@ from plantation_model.domain.services.quality_event_processor import (
     QualityEventProcessingError,
     QualityEventProcessor,
 )
+from plantation_model.infrastructure.repositories.farmer_performance_repository import DeliveryUpdate
 
 
 def _create_mock_document(
@@ -110,9 +111,7 @@ def mock_grading_model_repo():
 def mock_farmer_performance_repo():
     """Mock farmer performance repository."""
     repo = MagicMock()
-    repo.get_by_farmer_id = AsyncMock(return_value=None)  # Will be set per test
-    repo.reset_today = AsyncMock()
-    repo.increment_today_delivery = AsyncMock()
+    repo.apply_delivery = AsyncMock(return_value=None)  # Will be set per test
     return repo
 
 
@@ -201,7 +200,7 @@ class TestFarmerIdValidation:
         mock_region_repo.get_by_id.return_value = MagicMock(region_id="region-001")
 
         # No farmer performance (will skip update but not raise)
-        mock_farmer_performance_repo.get_by_farmer_id.return_value = None
+        mock_farmer_performance_repo.apply_delivery.return_value = None
 
         processor = QualityEventProcessor(
             collection_client=mock_collection_client,
@@ -438,8 +437,9 @@ class TestValidEventProcessing:
         )
 
         mock_farmer_performance_repo = MagicMock()
-        mock_farmer_performance_repo.get_by_farmer_id = AsyncMock(return_value=mock_performance)
-        mock_farmer_performance_repo.increment_today_delivery = AsyncMock(return_value=mock_performance)
+        mock_farmer_performance_repo.apply_delivery = AsyncMock(
+            return_value=DeliveryUpdate(previous=mock_performance, performance=mock_performance)
+        )
 
         processor = QualityEventProcessor(
             collection_client=mock_collection_client,
@@ -528,8 +528,9 @@ class TestBackwardCompatibility:
         )
 
         mock_farmer_performance_repo = MagicMock()
-        mock_farmer_performance_repo.get_by_farmer_id = AsyncMock(return_value=mock_performance)
-        mock_farmer_performance_repo.increment_today_delivery = AsyncMock(return_value=mock_performance)
+        mock_farmer_performance_repo.apply_delivery = AsyncMock(
+            return_value=DeliveryUpdate(previous=mock_performance, performance=mock_performance)
+        )
 
         # Create processor WITHOUT linkage repos (backward compatible)
         processor = QualityEventProcessor(
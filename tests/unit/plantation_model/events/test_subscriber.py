@@ -545,3 +545,102 @@ class TestQualityEventProcessingErrorHandling:
             result = subscriber.handle_quality_result(message)
 
         assert result.status == TopicEventResponseStatus.retry
+
+
+class TestBatchedQualityDispatch:
+    """Tests for the micro-batched quality result path."""
+
+    @staticmethod
+    def _run_threadsafe(future):
+        """run_coroutine_threadsafe stand-in returning a future the test completes."""
+
+        def run(coro, _loop):
+            coro.close()
+            return future
+
+        return run
+
+    @pytest.mark.parametrize(
+        ("outcome", "expected"),
+        [
+            ({"status": "success"}, TopicEventResponseStatus.success),
+            (ConnectionError("DB unavailable"), TopicEventResponseStatus.retry),
+            (None, TopicEventResponseStatus.retry),
+        ],
+    )
+    def test_dispatch_responds_when_batch_completes(self, mock_event_loop, outcome, expected):
+        """dispatch_quality_result answers the message only once its batch result is known."""
+        from concurrent.futures import Future
+
+        from plantation_model.domain.services.quality_event_processor import QualityEventProcessingError
+        from plantation_model.events import subscriber
+
+        if outcome is None:
+            outcome = QualityEventProcessingError("Farmer not found", error_type="farmer_not_found")
+        message = MagicMock()
+        message.data.return_value = {"document_id": "doc-123", "farmer_id": "WM-4521"}
+        subscription = MagicMock()
+        on_done = MagicMock()
+        future: Future = Future()
+
+        with (
+            patch.object(subscriber, "_quality_event_batcher", MagicMock()),
+            patch.object(subscriber, "_main_event_loop", mock_event_loop),
+            patch("asyncio.run_coroutine_threadsafe", side_effect=self._run_threadsafe(future)),
+        ):
+            subscriber.dispatch_quality_result(subscription, message, on_done)
+            subscription.respond.assert_not_called()
+
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+        subscription.respond.assert_called_once_with(message, expected)
+        on_done.assert_called_once()
+
+    def test_dispatch_drops_invalid_payload_immediately(self):
+        """Invalid payloads are dropped without reaching the batcher."""
+        from plantation_model.events import subscriber
+
+        message = MagicMock()
+        message.data.return_value = {"invalid": "data"}
+        subscription = MagicMock()
+        on_done = MagicMock()
+
+        subscriber.dispatch_quality_result(subscription, message, on_done)
+
+        subscription.respond.assert_called_once_with(message, TopicEventResponseStatus.drop)
+        on_done.assert_called_once()
+
+    def test_batched_startup_uses_streaming_subscription(self):
+        """With a batcher set, quality results use subscribe() plus the non-blocking loop."""
+        from plantation_model.events import subscriber
+
+        mock_client = MagicMock()
+        sleep_call_count = [0]
+
+        def mock_sleep(seconds):
+            sleep_call_count[0] += 1
+            if sleep_call_count[0] > 1:
+                raise KeyboardInterrupt("Test interrupt")
+
+        with (
+            patch.object(subscriber, "DaprClient", return_value=mock_client),
+            patch.object(subscriber.time, "sleep", side_effect=mock_sleep),
+            patch.object(subscriber, "_quality_event_batcher", MagicMock(max_pending=10)),
+            patch.object(subscriber.threading, "Thread") as mock_thread,
+        ):
+            subscriber.run_streaming_subscriptions()
+
+        mock_client.subscribe.assert_called_once_with(
+            pubsub_name="pubsub",
+            topic="collection.quality_result.received",
+            dead_letter_topic="events.dlq",
+        )
+        thread_kwargs = mock_thread.call_args.kwargs
+        assert thread_kwargs["target"] is subscriber.stream_subscription
+        assert thread_kwargs["args"] == (mock_client.subscribe.return_value, subscriber.dispatch_quality_result, 10)
+        mock_thread.return_value.start.assert_called_once()
+        topics = [call.kwargs.get("topic") for call in mock_client.subscribe_with_handler.call_args_list]
+        assert topics == ["weather.observation.updated"]
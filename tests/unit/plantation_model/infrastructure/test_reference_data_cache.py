@@ -0,0 +1,196 @@
+"""Unit tests for the plantation reference data cache.
+
+Covers grading model cache keys and QualityEventProcessor reading linkage
+reference data through ReferenceDataCache instead of the repositories.
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fp_common.models import (
+    CollectionPoint,
+    Document,
+    ExtractionMetadata,
+    GeoLocation,
+    IngestionMetadata,
+    RawDocumentRef,
+)
+from plantation_model.domain.models import FarmerPerformance, FarmScale, GradeRules, GradingModel, GradingType
+from plantation_model.domain.services.quality_event_processor import QualityEventProcessor
+from plantation_model.infrastructure.reference_data_cache import (
+    GradingModelCache,
+    ReferenceDataCache,
+    grading_model_key,
+)
+from plantation_model.infrastructure.repositories.farmer_performance_repository import DeliveryUpdate
+
+
+def _matches(doc: dict, query: dict) -> bool:
+    return all(doc.get(field) == value for field, value in query.items())
+
+
+@pytest.fixture
+def grading_model() -> GradingModel:
+    """Create a sample grading model."""
+    return GradingModel(
+        model_id="tbk_kenya_tea_v1",
+        model_version="1.0.0",
+        regulatory_authority="Tea Board of Kenya",
+        crops_name="Tea",
+        market_name="Kenya_TBK",
+        grading_type=GradingType.BINARY,
+        attributes={},
+        grade_rules=GradeRules(),
+        grade_labels={"ACCEPT": "Primary", "REJECT": "Secondary"},
+        active_at_factory=["factory-001"],
+    )
+
+
+@pytest.fixture
+def collection_point() -> CollectionPoint:
+    """Create a collection point that does not yet list WM-0001."""
+    return CollectionPoint(
+        id="cp-001",
+        name="Wamumu CP 1",
+        factory_id="factory-001",
+        location=GeoLocation(latitude=-0.4150, longitude=36.9500, altitude_meters=1850.0),
+        region_id="region-001",
+        clerk_id="clerk-001",
+        status="active",
+        farmer_ids=["WM-0002"],
+    )
+
+
+@pytest.fixture
+def collections(grading_model: GradingModel, collection_point: CollectionPoint) -> dict[str, MagicMock]:
+    """Mock MongoDB collections whose find_one matches on equality filters."""
+    data = {
+        "grading_models": [{**grading_model.model_dump(), "_id": grading_model.model_id}],
+        "collection_points": [{**collection_point.model_dump(), "_id": collection_point.id}],
+    }
+    collections: dict[str, MagicMock] = {}
+    for name in ("farmers", "factories", "regions", "grading_models", "collection_points"):
+        docs = data.get(name, [])
+
+        async def find_one(query: dict, docs: list[dict] = docs) -> dict | None:
+            return next((dict(doc) for doc in docs if _matches(doc, query)), None)
+
+        collection = MagicMock()
+        collection.find_one = AsyncMock(side_effect=find_one)
+        collections[name] = collection
+    return collections
+
+
+@pytest.fixture
+def reference_cache(collections: dict[str, MagicMock]) -> ReferenceDataCache:
+    """Create a ReferenceDataCache over the mock collections."""
+    db = MagicMock()
+    db.__getitem__ = MagicMock(side_effect=lambda name: collections[name])
+    return ReferenceDataCache(db)
+
+
+@pytest.fixture
+def document() -> Document:
+    """Create a quality document with a collection point."""
+    now = datetime(2026, 1, 6, 10, 0, 0, tzinfo=UTC)
+    return Document(
+        document_id="doc-123",
+        raw_document=RawDocumentRef(
+            blob_container="quality-data",
+            blob_path="factory/batch.json",
+            content_hash="sha256:test",
+            size_bytes=1024,
+            stored_at=now,
+        ),
+        extraction=ExtractionMetadata(
+            ai_agent_id="extractor-v1",
+            extraction_timestamp=now,
+            confidence=0.95,
+            validation_passed=True,
+            validation_warnings=[],
+        ),
+        ingestion=IngestionMetadata(
+            ingestion_id="ing-001",
+            source_id="qc-analyzer-result",
+            received_at=now,
+            processed_at=now,
+        ),
+        extracted_fields={
+            "grading_model_id": "tbk_kenya_tea_v1",
+            "grading_model_version": "1.0.0",
+            "factory_id": "factory-001",
+            "collection_point_id": "cp-001",
+            "bag_summary": {"total_weight_kg": 25.0, "primary_percentage": 80.0},
+        },
+        linkage_fields={"farmer_id": "WM-0001", "factory_id": "factory-001", "collection_point_id": "cp-001"},
+        created_at=now,
+    )
+
+
+class TestGradingModelKeys:
+    """Grading model cache keys and filters."""
+
+    def test_key_with_and_without_version(self) -> None:
+        """Test a version is appended to the key only when given."""
+        assert grading_model_key("tbk", "1.0.0") == "tbk@1.0.0"
+        assert grading_model_key("tbk", None) == "tbk"
+
+    def test_key_filter(self) -> None:
+        """Test versioned keys filter on id and version, unversioned on _id."""
+        cache = GradingModelCache(MagicMock(), max_entries=10)
+
+        assert cache._get_key_filter("tbk@1.0.0") == {"model_id": "tbk", "model_version": "1.0.0"}
+        assert cache._get_key_filter("tbk") == {"_id": "tbk"}
+
+
+class TestProcessorWithReferenceCache:
+    """QualityEventProcessor reads reference data through the cache."""
+
+    @pytest.mark.asyncio
+    async def test_second_event_reads_no_reference_data(
+        self,
+        reference_cache: ReferenceDataCache,
+        collections: dict[str, MagicMock],
+        collection_point: CollectionPoint,
+        document: Document,
+    ) -> None:
+        """Test repeated events load the grading model and CP once and assign the farmer once."""
+        collection_client = AsyncMock()
+        collection_client.get_document.return_value = document
+        grading_model_repo = AsyncMock()
+        performance_repo = AsyncMock()
+        performance = FarmerPerformance(
+            farmer_id="WM-0001",
+            grading_model_id="tbk_kenya_tea_v1",
+            grading_model_version="1.0.0",
+            farm_size_hectares=1.5,
+            farm_scale=FarmScale.MEDIUM,
+        )
+        performance_repo.apply_delivery.return_value = DeliveryUpdate(previous=performance, performance=performance)
+        cp_repo = AsyncMock()
+        cp_repo.add_farmer.return_value = collection_point.model_copy(update={"farmer_ids": ["WM-0002", "WM-0001"]})
+        processor = QualityEventProcessor(
+            collection_client=collection_client,
+            grading_model_repo=grading_model_repo,
+            farmer_performance_repo=performance_repo,
+            cp_repo=cp_repo,
+            reference_cache=reference_cache,
+        )
+
+        with patch(
+            "plantation_model.domain.services.quality_event_processor.publish_event",
+            new_callable=AsyncMock,
+            return_value=True,
+        ):
+            first = await processor.process(document_id="doc-123", farmer_id="WM-0001")
+            second = await processor.process(document_id="doc-123", farmer_id="WM-0001")
+
+        assert first["status"] == second["status"] == "success"
+        collections["grading_models"].find_one.assert_awaited_once_with(
+            {"model_id": "tbk_kenya_tea_v1", "model_version": "1.0.0"}
+        )
+        collections["collection_points"].find_one.assert_awaited_once_with({"_id": "cp-001"})
+        grading_model_repo.get_by_id_and_version.assert_not_called()
+        cp_repo.list_by_farmer.assert_not_called()
+        cp_repo.add_farmer.assert_awaited_once_with("cp-001", "WM-0001")
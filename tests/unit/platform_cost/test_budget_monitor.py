@@ -7,6 +7,7 @@ Tests:
 - Warm-up from repository (AC #3)
 - OpenTelemetry metrics (AC #4)
 - Period resets (daily/monthly)
+- Idempotency keys (redelivered events)
 """
 
 from datetime import UTC, date, datetime, timedelta
@@ -141,6 +142,15 @@ class TestRecordCost:
         alert = budget_monitor.record_cost("llm", Decimal("5.00"))
         assert alert is None
 
+    def test_duplicate_idempotency_key_not_counted(self, budget_monitor) -> None:
+        """Test that a cost recorded twice with the same key is counted once."""
+        budget_monitor.record_cost("llm", Decimal("6.00"), idempotency_key="evt-1")
+        alert = budget_monitor.record_cost("llm", Decimal("6.00"), idempotency_key="evt-1")
+        budget_monitor.record_cost("llm", Decimal("1.00"), idempotency_key="evt-2")
+
+        assert alert is None
+        assert Decimal(budget_monitor.get_status().daily_total_usd) == Decimal("7.00")
+
 
 class TestWarmUp:
     """Tests for warm_up_from_repository method (AC #3)."""
@@ -0,0 +1,290 @@
+"""Unit tests for CostEventBuffer and the buffered cost event handler path.
+
+Tests:
+- Flushing by batch size and by timer
+- Redelivered events skipped by idempotency key (budget, rollups)
+- Insert failure propagated to every caller in the flush
+- Per-event write errors failing only their own caller
+- Rollup failure not failing the flush
+- Flush of pending events on close
+- Deterministic event IDs from CloudEvent IDs
+- Buffered dispatch responding after the flush
+"""
+
+import asyncio
+import threading
+from datetime import UTC, datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from dapr.clients.grpc._response import TopicEventResponse
+from platform_cost.domain.cost_event import UnifiedCostEvent
+from platform_cost.handlers import cost_event_handler
+from platform_cost.infrastructure.repositories.cost_repository import CostInsertResult
+from platform_cost.services.cost_event_buffer import CostEventBuffer
+from pymongo.errors import WriteError
+
+
+def _event(event_id: str, amount: str = "0.01") -> UnifiedCostEvent:
+    return UnifiedCostEvent(
+        id=event_id,
+        cost_type="llm",
+        amount_usd=Decimal(amount),
+        quantity=100,
+        unit="tokens",
+        timestamp=datetime(2026, 3, 1, 10, tzinfo=UTC),
+        source_service="ai-model",
+        success=True,
+    )
+
+
+@pytest.fixture
+def cost_repository() -> MagicMock:
+    """Mock repository storing every event it has not seen before."""
+    stored: set[str] = set()
+
+    async def _insert_many(events):
+        new = {event.id for event in events} - stored
+        stored.update(new)
+        return CostInsertResult(inserted_ids=new)
+
+    repository = MagicMock()
+    repository.insert_many = AsyncMock(side_effect=_insert_many)
+    return repository
+
+
+@pytest.fixture
+def budget_monitor() -> MagicMock:
+    """Mock BudgetMonitor."""
+    return MagicMock()
+
+
+@pytest.fixture
+def rollup_repository() -> MagicMock:
+    """Mock CostRollupRepository."""
+    repository = MagicMock()
+    repository.record_events = AsyncMock(return_value=1)
+    return repository
+
+
+@pytest.fixture
+def sample_message() -> MagicMock:
+    """DAPR message carrying a valid cost event."""
+    message = MagicMock()
+    message.id.return_value = "cloud-event-42"
+    message.data.return_value = {
+        "cost_type": "llm",
+        "amount_usd": "0.0015",
+        "quantity": 1500,
+        "unit": "tokens",
+        "timestamp": "2026-01-13T10:00:00Z",
+        "source_service": "ai-model",
+        "success": True,
+    }
+    return message
+
+
+class TestCostEventBuffer:
+    """Tests for CostEventBuffer."""
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_in_one_insert(self, cost_repository, budget_monitor, rollup_repository) -> None:
+        """Test concurrent events share one insert_many once the batch is full."""
+        buffer = CostEventBuffer(
+            cost_repository, budget_monitor, rollup_repository, max_batch_size=3, max_wait_ms=10_000
+        )
+
+        results = await asyncio.gather(*(buffer.submit(_event(f"e{i}")) for i in range(3)))
+
+        assert results == [True, True, True]
+        cost_repository.insert_many.assert_awaited_once()
+        assert [e.id for e in cost_repository.insert_many.call_args.args[0]] == ["e0", "e1", "e2"]
+        assert len(rollup_repository.record_events.call_args.args[0]) == 3
+        assert budget_monitor.record_cost.call_count == 3
+        assert budget_monitor.record_cost.call_args.kwargs["idempotency_key"] == "e2"
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_flushes_after_wait(self, cost_repository, budget_monitor) -> None:
+        """Test a lone event is written once max_wait_ms has elapsed."""
+        buffer = CostEventBuffer(cost_repository, budget_monitor, max_batch_size=100, max_wait_ms=5)
+
+        assert await asyncio.wait_for(buffer.submit(_event("e1")), timeout=1)
+        cost_repository.insert_many.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_redelivered_events_not_counted_twice(
+        self, cost_repository, budget_monitor, rollup_repository
+    ) -> None:
+        """Test an event already stored, or repeated within a flush, is acknowledged but not counted."""
+        buffer = CostEventBuffer(cost_repository, budget_monitor, rollup_repository, max_batch_size=2, max_wait_ms=5)
+        assert await buffer.submit(_event("e1"))
+
+        results = await asyncio.gather(buffer.submit(_event("e1")), buffer.submit(_event("e2")))
+        in_flush = await asyncio.gather(buffer.submit(_event("e3")), buffer.submit(_event("e3")))
+
+        assert results == [False, True]
+        assert in_flush == [True, False]
+        assert [e.id for e in cost_repository.insert_many.call_args.args[0]] == ["e3"]
+        keys = [c.kwargs["idempotency_key"] for c in budget_monitor.record_cost.call_args_list]
+        assert keys == ["e1", "e2", "e3"]
+        assert [e.id for e in rollup_repository.record_events.call_args_list[1].args[0]] == ["e2"]
+
+    @pytest.mark.asyncio
+    async def test_insert_failure_fails_every_caller(self, budget_monitor) -> None:
+        """Test a failed flush raises for every event so each one is retried."""
+        repository = MagicMock()
+        repository.insert_many = AsyncMock(side_effect=ConnectionError("mongo down"))
+        buffer = CostEventBuffer(repository, budget_monitor, max_batch_size=2, max_wait_ms=5)
+
+        results = await asyncio.gather(buffer.submit(_event("e1")), buffer.submit(_event("e2")), return_exceptions=True)
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+        budget_monitor.record_cost.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_write_error_fails_only_its_event(self, budget_monitor, rollup_repository) -> None:
+        """Test a rejected event is retried on its own while the rest of the flush is stored and counted."""
+        validation_error = {"index": 1, "code": 121, "errmsg": "Document failed validation"}
+        repository = MagicMock()
+        repository.insert_many = AsyncMock(
+            return_value=CostInsertResult(inserted_ids={"e0", "e2"}, write_errors={1: validation_error})
+        )
+        buffer = CostEventBuffer(repository, budget_monitor, rollup_repository, max_batch_size=3, max_wait_ms=10_000)
+
+        results = await asyncio.gather(
+            *(buffer.submit(_event(f"e{i}")) for i in range(3)),
+            return_exceptions=True,
+        )
+
+        assert results[0] is True
+        assert results[2] is True
+        assert isinstance(results[1], WriteError)
+        assert results[1].code == 121
+        assert [e.id for e in rollup_repository.record_events.call_args.args[0]] == ["e0", "e2"]
+        keys = [c.kwargs["idempotency_key"] for c in budget_monitor.record_cost.call_args_list]
+        assert keys == ["e0", "e2"]
+
+    @pytest.mark.asyncio
+    async def test_rollup_failure_does_not_fail_flush(self, cost_repository, budget_monitor) -> None:
+        """Test stored events are acknowledged and budgeted even if the rollups fail."""
+        rollups = MagicMock()
+        rollups.record_events = AsyncMock(side_effect=RuntimeError("rollups down"))
+        buffer = CostEventBuffer(cost_repository, budget_monitor, rollups, max_batch_size=1)
+
+        assert await buffer.submit(_event("e1"))
+        budget_monitor.record_cost.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending(self, cost_repository, budget_monitor) -> None:
+        """Test close writes events still waiting for their timer."""
+        buffer = CostEventBuffer(cost_repository, budget_monitor, max_batch_size=100, max_wait_ms=60_000)
+        pending = asyncio.ensure_future(buffer.submit(_event("e1")))
+        await asyncio.sleep(0)
+
+        await buffer.close()
+
+        assert await pending
+        cost_repository.insert_many.assert_awaited_once()
+
+
+class TestEventIds:
+    """Tests for deriving event IDs from DAPR messages."""
+
+    def test_same_cloud_event_id_same_event_id(self) -> None:
+        """Test a redelivered message maps to the stored event ID."""
+        first, redelivered, other = MagicMock(), MagicMock(), MagicMock()
+        first.id.return_value = "cloud-event-1"
+        redelivered.id.return_value = "cloud-event-1"
+        other.id.return_value = "cloud-event-2"
+
+        event_id = cost_event_handler.derive_event_id(first)
+
+        assert event_id == cost_event_handler.derive_event_id(redelivered)
+        assert event_id != cost_event_handler.derive_event_id(other)
+
+    def test_missing_cloud_event_id(self) -> None:
+        """Test messages without a CloudEvent ID get no derived ID."""
+        message = MagicMock()
+        message.id.return_value = ""
+
+        assert cost_event_handler.derive_event_id(message) is None
+
+    @pytest.mark.asyncio
+    async def test_direct_path_skips_duplicate_insert(self, budget_monitor) -> None:
+        """Test the unbuffered path acknowledges a duplicate without re-counting it."""
+        from fp_common.events.cost_recorded import CostRecordedEvent
+        from pymongo.errors import DuplicateKeyError
+
+        event = CostRecordedEvent.model_validate(
+            {
+                "cost_type": "llm",
+                "amount_usd": "0.0015",
+                "quantity": 1500,
+                "unit": "tokens",
+                "timestamp": "2026-01-13T10:00:00Z",
+                "source_service": "ai-model",
+                "success": True,
+            }
+        )
+        repository = MagicMock()
+        repository.insert = AsyncMock(side_effect=[None, DuplicateKeyError("E11000 duplicate key")])
+        cost_event_handler.set_handler_dependencies(repository, budget_monitor)
+        try:
+            assert await cost_event_handler._process_cost_event_async(event, "evt-1") == "evt-1"
+            assert await cost_event_handler._process_cost_event_async(event, "evt-1") == "evt-1"
+        finally:
+            cost_event_handler.set_handler_dependencies(None, None)
+
+        budget_monitor.record_cost.assert_called_once()
+        assert budget_monitor.record_cost.call_args.kwargs["idempotency_key"] == "evt-1"
+
+
+class TestDispatchCostEvent:
+    """Tests for the buffered subscription dispatch."""
+
+    @pytest.fixture(autouse=True)
+    def reset_module_state(self):
+        """Reset handler dependencies around each test."""
+        yield
+        cost_event_handler.set_handler_dependencies(None, None)
+        cost_event_handler._main_event_loop = None
+
+    def test_responds_success_after_flush(self, cost_repository, budget_monitor, sample_message) -> None:
+        """Test the message is answered with success once its flush is written."""
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            buffer = CostEventBuffer(cost_repository, budget_monitor, max_batch_size=1)
+            cost_event_handler.set_handler_dependencies(cost_repository, budget_monitor, None, buffer)
+            cost_event_handler.set_main_event_loop(loop)
+            subscription = MagicMock()
+            answered = threading.Event()
+
+            cost_event_handler.dispatch_cost_event(subscription, sample_message, answered.set)
+
+            assert answered.wait(timeout=5)
+            subscription.respond.assert_called_once_with(sample_message, TopicEventResponse("success").status)
+            (stored,) = cost_repository.insert_many.call_args.args[0]
+            assert stored.id == cost_event_handler.derive_event_id(sample_message)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            loop.close()
+
+    def test_invalid_payload_dropped(self, cost_repository, budget_monitor) -> None:
+        """Test an invalid payload is answered with drop without reaching the buffer."""
+        buffer = CostEventBuffer(cost_repository, budget_monitor)
+        cost_event_handler.set_handler_dependencies(cost_repository, budget_monitor, None, buffer)
+        cost_event_handler.set_main_event_loop(MagicMock())
+        message = MagicMock()
+        message.data.return_value = {"cost_type": "not-a-type"}
+        subscription = MagicMock()
+        on_done = MagicMock()
+
+        cost_event_handler.dispatch_cost_event(subscription, message, on_done)
+
+        subscription.respond.assert_called_once_with(message, TopicEventResponse("drop").status)
+        on_done.assert_called_once()
+        cost_repository.insert_many.assert_not_called()
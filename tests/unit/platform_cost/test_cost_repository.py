@@ -4,19 +4,23 @@ Story 13.3: Cost Repository and Budget Monitor
 
 Tests:
 - Index creation (AC #1)
-- Event insertion
+- Event insertion (single and idempotent bulk)
 - Summary queries with typed models (AC #2)
 """
 
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
+from unittest.mock import AsyncMock
 
 import pytest
+from bson import Decimal128
 from platform_cost.domain.cost_event import UnifiedCostEvent
 from platform_cost.infrastructure.repositories.cost_repository import (
     COLLECTION_NAME,
+    CostInsertResult,
     UnifiedCostRepository,
 )
+from pymongo.errors import BulkWriteError
 
 
 @pytest.fixture
@@ -92,50 +96,109 @@ class TestInsert:
         assert doc["amount_usd"] == "0.0015"
 
 
+class TestInsertMany:
+    """Tests for insert_many method."""
+
+    @staticmethod
+    def _events(count: int) -> list[UnifiedCostEvent]:
+        return [
+            UnifiedCostEvent(
+                id=f"evt-{i}",
+                cost_type="llm",
+                amount_usd=Decimal("0.01"),
+                quantity=100,
+                unit="tokens",
+                timestamp=datetime.now(UTC),
+                source_service="ai-model",
+                success=True,
+            )
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_inserts_unordered_batch(self, cost_repository) -> None:
+        """Test all events are written in one unordered insert_many."""
+        cost_repository._collection.insert_many = AsyncMock()
+
+        result = await cost_repository.insert_many(self._events(3))
+
+        assert result == CostInsertResult(inserted_ids={"evt-0", "evt-1", "evt-2"})
+        docs = cost_repository._collection.insert_many.call_args.args[0]
+        assert [doc["_id"] for doc in docs] == ["evt-0", "evt-1", "evt-2"]
+        assert cost_repository._collection.insert_many.call_args.kwargs == {"ordered": False}
+
+    @pytest.mark.asyncio
+    async def test_duplicates_are_skipped(self, cost_repository) -> None:
+        """Test redelivered events (duplicate keys) are left out of the inserted IDs."""
+        error = BulkWriteError({"writeErrors": [{"index": 1, "code": 11000, "errmsg": "E11000 duplicate key"}]})
+        cost_repository._collection.insert_many = AsyncMock(side_effect=error)
+
+        result = await cost_repository.insert_many(self._events(3))
+
+        assert result.inserted_ids == {"evt-0", "evt-2"}
+        assert result.write_errors == {}
+
+    @pytest.mark.asyncio
+    async def test_other_write_errors_reported_per_event(self, cost_repository) -> None:
+        """Test a non-duplicate write error is reported for its event without failing the batch."""
+        validation_error = {"index": 1, "code": 121, "errmsg": "Document failed validation"}
+        error = BulkWriteError(
+            {
+                "writeErrors": [
+                    {"index": 0, "code": 11000, "errmsg": "E11000 duplicate key"},
+                    validation_error,
+                ]
+            }
+        )
+        cost_repository._collection.insert_many = AsyncMock(side_effect=error)
+
+        result = await cost_repository.insert_many(self._events(3))
+
+        assert result.inserted_ids == {"evt-2"}
+        assert result.write_errors == {1: validation_error}
+
+    @pytest.mark.asyncio
+    async def test_write_concern_error_raises(self, cost_repository) -> None:
+        """Test a write concern failure fails the batch (the inserts may not be durable)."""
+        error = BulkWriteError({"writeErrors": [], "writeConcernErrors": [{"code": 64, "errmsg": "waiting"}]})
+        cost_repository._collection.insert_many = AsyncMock(side_effect=error)
+
+        with pytest.raises(BulkWriteError):
+            await cost_repository.insert_many(self._events(2))
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_no_write(self, cost_repository) -> None:
+        """Test an empty batch writes nothing."""
+        cost_repository._collection.insert_many = AsyncMock()
+
+        assert await cost_repository.insert_many([]) == CostInsertResult()
+        cost_repository._collection.insert_many.assert_not_called()
+
+
 class TestGetSummaryByType:
     """Tests for get_summary_by_type method."""
 
     @pytest.mark.asyncio
-    async def test_returns_typed_cost_type_summary(self, cost_repository, mock_db) -> None:
-        """Test that get_summary_by_type returns CostTypeSummary models (AC #2)."""
-        # Insert test events
-        collection = mock_db[COLLECTION_NAME]
-        now = datetime.now(UTC)
-
-        await collection.insert_many(
-            [
-                {
-                    "_id": "event-1",
-                    "cost_type": "llm",
-                    "amount_usd": "1.00",
-                    "quantity": 10000,
-                    "timestamp": now,
-                },
-                {
-                    "_id": "event-2",
-                    "cost_type": "llm",
-                    "amount_usd": "2.00",
-                    "quantity": 20000,
-                    "timestamp": now,
-                },
-                {
-                    "_id": "event-3",
-                    "cost_type": "document",
-                    "amount_usd": "0.50",
-                    "quantity": 10,
-                    "timestamp": now,
-                },
+    async def test_returns_typed_cost_type_summary(self, cost_repository) -> None:
+        """Test that get_summary_by_type returns CostTypeSummary models from rollup rows (AC #2)."""
+        cost_repository.rollups.summarize = AsyncMock(
+            return_value=[
+                {"_id": "llm", "cost_usd": Decimal128("3.00"), "quantity": 30000, "request_count": 2},
+                {"_id": "document", "cost_usd": Decimal128("1.00"), "quantity": 10, "request_count": 1},
             ]
         )
 
-        summaries = await cost_repository.get_summary_by_type()
-
-        # Should return CostTypeSummary objects
-        assert len(summaries) > 0
-        for summary in summaries:
-            assert hasattr(summary, "cost_type")
-            assert hasattr(summary, "total_cost_usd")
-            assert hasattr(summary, "percentage")
+        summaries = await cost_repository.get_summary_by_type(factory_id="factory-001")
+
+        assert [s.cost_type for s in summaries] == ["llm", "document"]
+        assert summaries[0].total_cost_usd == Decimal("3.00")
+        assert summaries[0].total_quantity == 30000
+        assert summaries[0].request_count == 2
+        assert summaries[0].percentage == 75.0
+        start_dt, end_dt, group_by, match = cost_repository.rollups.summarize.call_args.args
+        assert group_by == "$cost_type"
+        assert match == {"factory_id": "factory-001"}
+        assert abs((start_dt - cost_repository.data_available_from).total_seconds()) < 1
 
     @pytest.mark.asyncio
     async def test_returns_empty_for_no_data(self, cost_repository) -> None:
@@ -0,0 +1,257 @@
+"""Unit tests for CostRollupRepository and rollup-backed cost queries.
+
+Tests:
+- Splitting a time range into daily and hourly rollup ranges
+- Folding cost events into hourly/daily $inc upserts
+- Rollup summary pipeline (daily range with hourly edges)
+- Rebuilding rollups from raw events (retention guard, day folding)
+- Cost event handler updating rollups without retrying on rollup failure
+"""
+
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from bson import Decimal128
+from platform_cost.domain.cost_event import UnifiedCostEvent
+from platform_cost.handlers import cost_event_handler
+from platform_cost.infrastructure.repositories.cost_repository import UnifiedCostRepository
+from platform_cost.infrastructure.repositories.cost_rollup_repository import (
+    HOURLY_COLLECTION_NAME,
+    CostRollupRepository,
+    rollup_segments,
+)
+
+
+def _event(event_id: str, timestamp: datetime, amount: str, **fields) -> UnifiedCostEvent:
+    return UnifiedCostEvent(
+        id=event_id,
+        cost_type=fields.pop("cost_type", "llm"),
+        amount_usd=Decimal(amount),
+        quantity=fields.pop("quantity", 100),
+        unit="tokens",
+        timestamp=timestamp,
+        source_service="ai-model",
+        success=True,
+        metadata=fields.pop("metadata", {"tokens_in": 60, "tokens_out": 40}),
+        **fields,
+    )
+
+
+@pytest.fixture
+def mock_db() -> MagicMock:
+    """Mock database whose collections accept bulk writes and aggregations."""
+    db = MagicMock()
+    collections: dict[str, MagicMock] = {}
+
+    def _collection(name: str) -> MagicMock:
+        if name not in collections:
+            collection = MagicMock()
+            collection.bulk_write = AsyncMock()
+            collection.delete_many = AsyncMock()
+            collection.create_indexes = AsyncMock()
+            cursor = MagicMock()
+            cursor.to_list = AsyncMock(return_value=[])
+            collection.aggregate = MagicMock(return_value=cursor)
+            collections[name] = collection
+        return collections[name]
+
+    db.__getitem__.side_effect = _collection
+    return db
+
+
+@pytest.fixture
+def rollups(mock_db: MagicMock) -> CostRollupRepository:
+    """Create a CostRollupRepository over the mock database."""
+    return CostRollupRepository(mock_db, retention_days=90)
+
+
+class TestRollupSegments:
+    """Tests for rollup_segments."""
+
+    def test_whole_days_use_daily_rollups_only(self) -> None:
+        """Test a day-aligned range reads no hourly rollups."""
+        start = datetime(2026, 3, 1, tzinfo=UTC)
+        end = datetime(2026, 3, 8, tzinfo=UTC)
+
+        assert rollup_segments(start, end) == ([(start, end)], [])
+
+    def test_partial_edges_use_hourly_rollups(self) -> None:
+        """Test partial first/last days are read hour by hour, widened to whole hours."""
+        start = datetime(2026, 3, 1, 13, 20, tzinfo=UTC)
+        end = datetime(2026, 3, 4, 9, 5, tzinfo=UTC)
+
+        daily, hourly = rollup_segments(start, end)
+
+        assert daily == [(datetime(2026, 3, 2, tzinfo=UTC), datetime(2026, 3, 4, tzinfo=UTC))]
+        assert hourly == [
+            (datetime(2026, 3, 1, 13, tzinfo=UTC), datetime(2026, 3, 2, tzinfo=UTC)),
+            (datetime(2026, 3, 4, tzinfo=UTC), datetime(2026, 3, 4, 10, tzinfo=UTC)),
+        ]
+
+    def test_range_within_one_day(self) -> None:
+        """Test a range inside one day is hourly only, and an empty range yields nothing."""
+        start = datetime(2026, 3, 1, 8, tzinfo=UTC)
+
+        assert rollup_segments(start, start + timedelta(hours=3)) == ([], [(start, start + timedelta(hours=3))])
+        assert rollup_segments(start, start) == ([], [])
+
+
+class TestRecordEvents:
+    """Tests for record_events."""
+
+    @pytest.mark.asyncio
+    async def test_merges_events_into_one_increment_per_bucket(
+        self, rollups: CostRollupRepository, mock_db: MagicMock
+    ) -> None:
+        """Test same-hour events share one hourly $inc and same-day hours share one daily $inc."""
+        base = datetime(2026, 3, 1, 10, 15, tzinfo=UTC)
+        events = [
+            _event("e1", base, "0.10", agent_type="extractor", model="m1", factory_id="f1"),
+            _event("e2", base + timedelta(minutes=20), "0.15", agent_type="extractor", model="m1", factory_id="f1"),
+            _event("e3", base + timedelta(hours=2), "0.05", agent_type="extractor", model="m1", factory_id="f1"),
+        ]
+
+        touched = await rollups.record_events(events)
+
+        assert touched == 2
+        hourly_ops = mock_db["cost_rollups_hourly"].bulk_write.call_args.args[0]
+        daily_ops = mock_db["cost_rollups_daily"].bulk_write.call_args.args[0]
+        assert len(hourly_ops) == 2
+        assert len(daily_ops) == 1
+        first = hourly_ops[0]
+        assert first._filter == {"_id": "2026-03-01T10:00:00+00:00|llm|m1|extractor|f1|"}
+        assert first._doc["$inc"]["cost_usd"] == Decimal128("0.25")
+        assert first._doc["$inc"]["request_count"] == 2
+        assert first._doc["$inc"]["tokens_in"] == 120
+        assert first._doc["$setOnInsert"]["bucket"] == datetime(2026, 3, 1, 10, tzinfo=UTC)
+        assert first._upsert
+        daily = daily_ops[0]._doc
+        assert daily["$inc"]["cost_usd"] == Decimal128("0.30")
+        assert daily["$inc"]["request_count"] == 3
+        assert daily["$setOnInsert"]["bucket"] == datetime(2026, 3, 1, tzinfo=UTC)
+
+    @pytest.mark.asyncio
+    async def test_no_events_no_write(self, rollups: CostRollupRepository, mock_db: MagicMock) -> None:
+        """Test an empty batch writes nothing."""
+        assert await rollups.record_events([]) == 0
+        mock_db["cost_rollups_hourly"].bulk_write.assert_not_called()
+
+
+class TestSummarize:
+    """Tests for summarize."""
+
+    @pytest.mark.asyncio
+    async def test_daily_range_unions_hourly_edges(self, rollups: CostRollupRepository, mock_db: MagicMock) -> None:
+        """Test whole days come from the daily rollups with the hourly edges unioned in."""
+        start = datetime(2026, 3, 1, 13, 20, tzinfo=UTC)
+        end = datetime(2026, 3, 5, tzinfo=UTC)
+
+        await rollups.summarize(start, end, "$model", {"cost_type": "llm"})
+
+        pipeline = mock_db["cost_rollups_daily"].aggregate.call_args.args[0]
+        assert pipeline[0]["$match"]["cost_type"] == "llm"
+        assert pipeline[0]["$match"]["$or"] == [
+            {"bucket": {"$gte": datetime(2026, 3, 2, tzinfo=UTC), "$lt": end}},
+        ]
+        union = pipeline[1]["$unionWith"]
+        assert union["coll"] == HOURLY_COLLECTION_NAME
+        assert union["pipeline"][0]["$match"]["$or"] == [
+            {"bucket": {"$gte": datetime(2026, 3, 1, 13, tzinfo=UTC), "$lt": datetime(2026, 3, 2, tzinfo=UTC)}},
+        ]
+        assert pipeline[2]["$group"]["_id"] == "$model"
+        assert pipeline[2]["$group"]["cost_usd"] == {"$sum": "$cost_usd"}
+
+    @pytest.mark.asyncio
+    async def test_empty_range_skips_query(self, rollups: CostRollupRepository, mock_db: MagicMock) -> None:
+        """Test an empty range returns no rows without querying."""
+        now = datetime(2026, 3, 1, 8, tzinfo=UTC)
+
+        assert await rollups.summarize(now, now, None) == []
+        mock_db["cost_rollups_daily"].aggregate.assert_not_called()
+
+
+class TestRebuildRollups:
+    """Tests for UnifiedCostRepository.rebuild_rollups."""
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_days_and_skips_expired(self, mock_db: MagicMock) -> None:
+        """Test each retained day is re-aggregated and replaced; expired days keep their rollups."""
+        repository = UnifiedCostRepository(db=mock_db, retention_days=90)
+        today = date.today()
+        hour = datetime.combine(today, datetime.min.time()) + timedelta(hours=9)
+        rows = [
+            {
+                "_id": {"bucket": hour + timedelta(hours=offset), "cost_type": "embedding", "knowledge_domain": "tea"},
+                "cost_usd": Decimal128("0.50"),
+                "quantity": 1000,
+                "request_count": 5,
+                "tokens_in": 0,
+                "tokens_out": 0,
+            }
+            for offset in (0, 1)
+        ]
+
+        async def _aggregate(pipeline, **kwargs):
+            for row in rows if pipeline[0]["$match"]["timestamp"]["$gte"].date() == today else []:
+                yield row
+
+        mock_db["cost_events"].aggregate = MagicMock(side_effect=_aggregate)
+        repository.rollups.replace_range = AsyncMock(return_value=3)
+
+        rebuilt = await repository.rebuild_rollups(today - timedelta(days=120), today)
+
+        # Days 120..90 back start before data_available_from (now - 90 days)
+        assert rebuilt == 90
+        calls = repository.rollups.replace_range.call_args_list
+        start_dt, end_dt, day_rows = calls[-1].args
+        assert start_dt == datetime.combine(today, datetime.min.time(), tzinfo=UTC)
+        assert end_dt - start_dt == timedelta(days=1)
+        assert len(day_rows.hourly) == 2
+        (daily,) = day_rows.daily.values()
+        assert daily.cost_usd == Decimal("1.00")
+        assert daily.request_count == 10
+        assert daily.dimensions["knowledge_domain"] == "tea"
+
+
+class TestHandlerRollups:
+    """Tests for rollup updates in the cost event handler."""
+
+    @pytest.fixture(autouse=True)
+    def reset_module_state(self):
+        """Reset handler dependencies around each test."""
+        yield
+        cost_event_handler.set_handler_dependencies(None, None)
+
+    @pytest.mark.asyncio
+    async def test_rollups_updated_and_failures_not_retried(self) -> None:
+        """Test the event is folded into rollups, and a rollup failure still succeeds."""
+        from fp_common.events.cost_recorded import CostRecordedEvent
+
+        event = CostRecordedEvent.model_validate(
+            {
+                "cost_type": "llm",
+                "amount_usd": "0.0015",
+                "quantity": 1500,
+                "unit": "tokens",
+                "timestamp": "2026-01-13T10:00:00Z",
+                "source_service": "ai-model",
+                "success": True,
+                "metadata": {"model": "m1", "agent_type": "extractor"},
+            }
+        )
+        repository = MagicMock()
+        repository.insert = AsyncMock()
+        rollup_repository = MagicMock()
+        rollup_repository.record_events = AsyncMock(side_effect=[1, RuntimeError("mongo down")])
+        monitor = MagicMock()
+        cost_event_handler.set_handler_dependencies(repository, monitor, rollup_repository)
+
+        await cost_event_handler._process_cost_event_async(event)
+        await cost_event_handler._process_cost_event_async(event)
+
+        assert rollup_repository.record_events.await_count == 2
+        (recorded,) = rollup_repository.record_events.call_args_list[0].args[0]
+        assert recorded.model == "m1"
+        assert monitor.record_cost.call_count == 2